@@ -124,6 +124,7 @@ def main(argv: list[str] | None = None) -> int:
         selection_fractions=args.selection_fractions,
         rebalance_interval_sessions=args.rebalance_interval_sessions,
         min_avg_trading_value_mil_jpy=args.min_avg_trading_value_mil_jpy,
+        feature_store_root=args.output_root,
     )
     bundle = write_classical_momentum_research_bundle(
         result,
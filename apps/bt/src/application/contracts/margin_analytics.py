@@ -6,6 +6,8 @@ Margin Analytics Response Schemas
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 from src.application.contracts import analytics as analytics_contracts
@@ -81,3 +83,46 @@ class MarginVolumeRatioResponse(BaseModel):
     diagnostics: analytics_contracts.ResponseDiagnostics = Field(
         default_factory=analytics_contracts.ResponseDiagnostics
     )
+
+
+# --- Cross-sectional Margin Pressure ---
+
+
+MarginPressureSortKey = Literal[
+    "longPressure",
+    "flowPressure",
+    "turnoverDays",
+    "longRatio",
+    "shortRatio",
+]
+
+
+class MarginPressureRankingItem(BaseModel):
+    """全銘柄マージン指標（1 銘柄・1 日分）"""
+
+    code: str
+    date: str
+    longPressure: float | None = None
+    flowPressure: float | None = None
+    turnoverDays: float | None = None
+    longRatio: float | None = None
+    shortRatio: float | None = None
+    longVol: float | None = None
+    shortVol: float | None = None
+    avgVolume: float | None = None
+    weeklyAvgVolume: float | None = None
+
+
+class MarginPressureRankingResponse(BaseModel):
+    """全銘柄マージン指標レスポンス"""
+
+    date: str | None = Field(default=None, description="Resolved margin_data date")
+    averagePeriod: int = Field(gt=0, description="Rolling average period in days")
+    sortBy: MarginPressureSortKey
+    order: Literal["asc", "desc"]
+    items: list[MarginPressureRankingItem]
+    lastUpdated: str
+    provenance: analytics_contracts.DataProvenance
+    diagnostics: analytics_contracts.ResponseDiagnostics = Field(
+        default_factory=analytics_contracts.ResponseDiagnostics
+    )
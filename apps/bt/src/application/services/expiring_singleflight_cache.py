@@ -1,105 +1,466 @@
-"""In-memory expiring cache with singleflight deduplication."""
+"""Byte-bounded expiring cache with singleflight deduplication.
+
+The in-memory tier is an LRU bounded by the encoded size of its values, with
+O(1) eviction and heap-ordered expiry. An optional SQLite tier keeps entries
+across process restarts so a cold start after a deploy does not stampede the
+upstream. Entries past their TTL can still be served for a stale window while
+a single background refresh replaces them.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import heapq
+import json
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Awaitable, Callable, Generic, Literal, TypeVar
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Generic, Literal, Protocol, TypeVar
+
+from loguru import logger
 
 T = TypeVar("T")
-CacheState = Literal["hit", "miss", "wait"]
+CacheState = Literal["hit", "miss", "wait", "stale"]
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _LeaderCancelledError(Exception):
+    """Set on an in-flight future whose leading fetch was cancelled."""
 
 
 @dataclass(slots=True)
 class _CacheEntry(Generic[T]):
     value: T
     expires_at: float
+    stale_until: float
+    size_bytes: int
+
+
+@dataclass(frozen=True, slots=True)
+class PersistedCacheEntry:
+    """Encoded cache entry stored by a disk tier (wall-clock deadlines)."""
+
+    payload: bytes
+    expires_at: float
+    stale_until: float
+
+
+class CacheDiskStore(Protocol):
+    """Persistent second tier used by :class:`ExpiringSingleFlightCache`."""
+
+    def get(self, key: str) -> PersistedCacheEntry | None: ...
+
+    def put(self, key: str, entry: PersistedCacheEntry) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class SqliteCacheDiskStore:
+    """SQLite-backed cache tier bounded by total payload bytes.
+
+    The payload total is kept as a running counter so a put costs one keyed
+    lookup plus the upsert; expired rows are swept every
+    ``sweep_interval_seconds`` or when the total overflows ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_bytes: int = 512 * 1024 * 1024,
+        sweep_interval_seconds: float = 300.0,
+    ) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._sweep_interval_seconds = sweep_interval_seconds
+        self._next_sweep_at = 0.0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                payload BLOB NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                stale_until REAL NOT NULL,
+                stored_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_stale_until ON cache_entries (stale_until)"
+        )
+        self._conn.commit()
+        (self._total_bytes,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM cache_entries"
+        ).fetchone()
+
+    @property
+    def total_bytes(self) -> int:
+        """Payload bytes currently stored (including not yet swept expired rows)."""
+        return self._total_bytes
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get(self, key: str) -> PersistedCacheEntry | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires_at, stale_until FROM cache_entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        payload, expires_at, stale_until = row
+        if stale_until <= time.time():
+            return None
+        return PersistedCacheEntry(payload=bytes(payload), expires_at=expires_at, stale_until=stale_until)
+
+    def put(self, key: str, entry: PersistedCacheEntry) -> None:
+        now = time.time()
+        size_bytes = len(entry.payload)
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size_bytes FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                """
+                INSERT INTO cache_entries (key, payload, size_bytes, expires_at, stale_until, stored_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    payload = excluded.payload,
+                    size_bytes = excluded.size_bytes,
+                    expires_at = excluded.expires_at,
+                    stale_until = excluded.stale_until,
+                    stored_at = excluded.stored_at
+                """,
+                (key, entry.payload, size_bytes, entry.expires_at, entry.stale_until, now),
+            )
+            self._total_bytes += size_bytes - (previous[0] if previous is not None else 0)
+            if now >= self._next_sweep_at or self._total_bytes > self._max_bytes:
+                self._sweep_expired_locked(now)
+            if self._total_bytes > self._max_bytes:
+                self._trim_locked()
+            self._conn.commit()
+
+    def _sweep_expired_locked(self, now: float) -> None:
+        (expired_bytes,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM cache_entries WHERE stale_until <= ?",
+            (now,),
+        ).fetchone()
+        if expired_bytes:
+            self._conn.execute("DELETE FROM cache_entries WHERE stale_until <= ?", (now,))
+            self._total_bytes -= expired_bytes
+        self._next_sweep_at = now + self._sweep_interval_seconds
+
+    def _trim_locked(self) -> None:
+        rows = self._conn.execute(
+            "SELECT key, size_bytes FROM cache_entries ORDER BY stored_at"
+        ).fetchall()
+        doomed: list[tuple[str]] = []
+        for key, size_bytes in rows:
+            if self._total_bytes <= self._max_bytes:
+                break
+            doomed.append((key,))
+            self._total_bytes -= size_bytes
+        self._conn.executemany("DELETE FROM cache_entries WHERE key = ?", doomed)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size_bytes FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return
+            self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            self._total_bytes -= row[0]
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries")
+            self._total_bytes = 0
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _encode_json(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _decode_json(payload: bytes) -> Any:
+    return json.loads(payload)
 
 
 class ExpiringSingleFlightCache(Generic[T]):
-    """Thread-safe async cache with TTL and in-flight request coalescing.
+    """Async LRU cache with TTL, stale-while-revalidate and request coalescing.
 
     - `hit`: cached value returned
     - `miss`: caller fetched value and cached it
     - `wait`: caller waited for another in-flight fetch
+    - `stale`: expired value returned while a background refresh runs
+
+    Values must be encodable by ``encode`` (JSON by default); the encoded
+    length is the size charged against ``max_bytes`` and the disk payload.
     """
 
-    def __init__(self) -> None:
-        self._entries: dict[str, _CacheEntry[T]] = {}
+    def __init__(
+        self,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        disk_store: CacheDiskStore | None = None,
+        encode: Callable[[T], bytes] = _encode_json,
+        decode: Callable[[bytes], T] = _decode_json,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._entries: OrderedDict[str, _CacheEntry[T]] = OrderedDict()
+        self._expiry_heap: list[tuple[float, int, str]] = []
+        self._heap_seq = 0
         self._in_flight: dict[str, asyncio.Future[T]] = {}
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
         self._lock = asyncio.Lock()
+        self._max_bytes = max_bytes
+        self._total_bytes = 0
+        self._disk_store = disk_store
+        self._encode = encode
+        self._decode = decode
+        self._clock = clock
+        self._stats: dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "waits": 0,
+            "staleHits": 0,
+            "diskHits": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "refreshErrors": 0,
+        }
 
-    @staticmethod
-    def _evict_expired_locked(
-        entries: dict[str, _CacheEntry[T]],
-        now: float,
-    ) -> None:
-        """Drop expired entries to keep memory usage bounded."""
-        expired_keys = [key for key, entry in entries.items() if entry.expires_at <= now]
-        for key in expired_keys:
-            entries.pop(key, None)
+    def stats(self) -> dict[str, int]:
+        """Return cumulative counters plus current size."""
+        return {
+            **self._stats,
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "maxBytes": self._max_bytes,
+        }
+
+    def _evict_expired_locked(self, now: float) -> None:
+        """Drop entries whose stale window has passed (heap-ordered, amortized O(log n))."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            deadline, _seq, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            if entry is None or entry.stale_until != deadline:
+                continue
+            self._remove_locked(key)
+            self._stats["expirations"] += 1
+
+    def _remove_locked(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size_bytes
+
+    def _store_locked(self, key: str, entry: _CacheEntry[T]) -> None:
+        self._remove_locked(key)
+        if entry.size_bytes > self._max_bytes:
+            return
+        self._entries[key] = entry
+        self._total_bytes += entry.size_bytes
+        self._heap_seq += 1
+        heapq.heappush(self._expiry_heap, (entry.stale_until, self._heap_seq, key))
+        while self._total_bytes > self._max_bytes:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= evicted.size_bytes
+            self._stats["evictions"] += 1
+            logger.debug(f"cache evicted {evicted_key} ({evicted.size_bytes} bytes)")
+        if len(self._expiry_heap) > 4 * max(len(self._entries), 16):
+            self._expiry_heap = [
+                (item.stale_until, 0, item_key) for item_key, item in self._entries.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    async def _lookup(self, key: str) -> _CacheEntry[T] | None:
+        async with self._lock:
+            self._evict_expired_locked(self._clock())
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self._disk_store is None:
+            return None
+        try:
+            persisted = await asyncio.to_thread(self._disk_store.get, key)
+        except Exception as exc:
+            logger.warning(f"cache disk read failed for {key}: {exc}")
+            return None
+        if persisted is None:
+            return None
+        offset = self._clock() - time.time()
+        entry = _CacheEntry(
+            value=self._decode(persisted.payload),
+            expires_at=persisted.expires_at + offset,
+            stale_until=persisted.stale_until + offset,
+            size_bytes=len(persisted.payload),
+        )
+        async with self._lock:
+            self._stats["diskHits"] += 1
+            self._store_locked(key, entry)
+        return entry
 
     async def get_or_set(
         self,
         key: str,
         ttl_seconds: float,
         fetcher: Callable[[], Awaitable[T]],
+        stale_ttl_seconds: float = 0.0,
     ) -> tuple[T, CacheState]:
         """Get cached value or fetch and set with TTL.
 
-        Exceptions from `fetcher` are propagated and never cached.
+        Within ``stale_ttl_seconds`` after expiry the previous value is returned
+        immediately and refreshed in the background. Exceptions from `fetcher`
+        are propagated and never cached. If the leading fetch is cancelled,
+        its waiters retry and one of them becomes the new leader.
         """
-        now = time.monotonic()
-        should_fetch = False
+        while True:
+            entry = await self._lookup(key)
+            if entry is not None:
+                if entry.expires_at > self._clock():
+                    self._stats["hits"] += 1
+                    return entry.value, "hit"
+                self._stats["staleHits"] += 1
+                await self._schedule_refresh(key, ttl_seconds, stale_ttl_seconds, fetcher)
+                return entry.value, "stale"
 
+            should_fetch = False
+            async with self._lock:
+                in_flight = self._in_flight.get(key)
+                if in_flight is None:
+                    in_flight = asyncio.get_running_loop().create_future()
+                    self._in_flight[key] = in_flight
+                    should_fetch = True
+
+            if not should_fetch:
+                self._stats["waits"] += 1
+                try:
+                    value = await in_flight
+                except _LeaderCancelledError:
+                    # The leader was cancelled; retry so a live waiter takes over.
+                    continue
+                return value, "wait"
+
+            self._stats["misses"] += 1
+            value = await self._fetch_and_store(key, ttl_seconds, stale_ttl_seconds, fetcher)
+            return value, "miss"
+
+    async def _schedule_refresh(
+        self,
+        key: str,
+        ttl_seconds: float,
+        stale_ttl_seconds: float,
+        fetcher: Callable[[], Awaitable[T]],
+    ) -> None:
         async with self._lock:
-            self._evict_expired_locked(self._entries, now)
-            entry = self._entries.get(key)
-            if entry is not None and entry.expires_at > now:
-                return entry.value, "hit"
+            if key in self._in_flight:
+                return
+            self._in_flight[key] = asyncio.get_running_loop().create_future()
 
-            in_flight = self._in_flight.get(key)
-            if in_flight is None:
-                in_flight = asyncio.get_running_loop().create_future()
-                self._in_flight[key] = in_flight
-                should_fetch = True
+        async def refresh() -> None:
+            try:
+                await self._fetch_and_store(key, ttl_seconds, stale_ttl_seconds, fetcher)
+            except Exception as exc:
+                self._stats["refreshErrors"] += 1
+                logger.warning(f"cache background refresh failed for {key}: {exc}")
 
-        if not should_fetch:
-            value = await in_flight
-            return value, "wait"
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
 
+    async def _fetch_and_store(
+        self,
+        key: str,
+        ttl_seconds: float,
+        stale_ttl_seconds: float,
+        fetcher: Callable[[], Awaitable[T]],
+    ) -> T:
         try:
             value = await fetcher()
-        except Exception as exc:
+            payload = self._encode(value)
+        except BaseException as exc:
             async with self._lock:
                 future = self._in_flight.pop(key, None)
             if future is not None and not future.done():
-                future.set_exception(exc)
+                future.set_exception(
+                    exc if isinstance(exc, Exception) else _LeaderCancelledError()
+                )
                 # If there are no waiters, consume the exception to avoid
                 # "Future exception was never retrieved" warnings.
                 future.exception()
             raise
 
-        expires_at = time.monotonic() + max(ttl_seconds, 0.0)
+        ttl = max(ttl_seconds, 0.0)
+        stale_ttl = max(stale_ttl_seconds, 0.0)
+        expires_at = self._clock() + ttl
         async with self._lock:
-            self._entries[key] = _CacheEntry(value=value, expires_at=expires_at)
+            self._store_locked(
+                key,
+                _CacheEntry(
+                    value=value,
+                    expires_at=expires_at,
+                    stale_until=expires_at + stale_ttl,
+                    size_bytes=len(payload),
+                ),
+            )
             future = self._in_flight.pop(key, None)
 
         if future is not None and not future.done():
             future.set_result(value)
 
-        return value, "miss"
+        if self._disk_store is not None:
+            wall_expires_at = time.time() + ttl
+            try:
+                await asyncio.to_thread(
+                    self._disk_store.put,
+                    key,
+                    PersistedCacheEntry(
+                        payload=payload,
+                        expires_at=wall_expires_at,
+                        stale_until=wall_expires_at + stale_ttl,
+                    ),
+                )
+            except Exception as exc:
+                logger.warning(f"cache disk write failed for {key}: {exc}")
+
+        return value
 
     async def clear(self) -> None:
-        """Clear all cache entries.
+        """Clear all cache entries (memory and disk).
 
         In-flight requests are untouched to avoid cancelling active callers.
         """
         async with self._lock:
             self._entries.clear()
+            self._expiry_heap.clear()
+            self._total_bytes = 0
+        if self._disk_store is not None:
+            await asyncio.to_thread(self._disk_store.clear)
 
     async def invalidate(self, key: str) -> None:
         """Invalidate one cache key if present."""
         async with self._lock:
-            self._entries.pop(key, None)
+            self._remove_locked(key)
+        if self._disk_store is not None:
+            await asyncio.to_thread(self._disk_store.delete, key)
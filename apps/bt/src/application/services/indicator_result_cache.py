@@ -0,0 +1,189 @@
+"""Process-wide cache of computed chart indicator records.
+
+Entries are keyed by the request scope (stock, timeframe, range and options)
+and the normalized indicator spec, and remember a fingerprint of the bars they
+were computed from. The fingerprint acts as the data generation: a request on
+identical bars is served from the cache, while published bars change it. When
+only the newest bar changed or a single bar was appended, window-bounded
+indicators are extended by recomputing the trailing window only; any other
+change recomputes the full series.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+
+from src.domains.strategy.indicators.indicator_registry import (
+    ComputeFn,
+    indicator_tail_bars,
+)
+from src.shared.utils.frame_fingerprint import build_frames_fingerprint
+from src.shared.utils.market_frames import format_index_date
+
+DEFAULT_MAX_ENTRIES = 1024
+# 1 レコード (date + 値の dict) は数百バイトになるため、既定では数十 MB 程度に抑える。
+# 全期間 (約 5,000 本) の指標で 40 系列前後に相当する。
+DEFAULT_MAX_RECORDS = 200_000
+
+
+@dataclass(frozen=True, slots=True)
+class IndicatorBarsFingerprint:
+    """Fingerprints of the full bar frame and of the frame without its newest bar."""
+
+    full: str
+    head: str
+    head_last_date: str | None
+
+    @classmethod
+    def from_ohlcv(cls, ohlcv: pd.DataFrame) -> IndicatorBarsFingerprint:
+        head = ohlcv.iloc[:-1]
+        return cls(
+            full=build_frames_fingerprint([ohlcv], start=None, end=None),
+            head=build_frames_fingerprint([head], start=None, end=None),
+            head_last_date=format_index_date(head.index[-1]) if len(head) else None,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedIndicator:
+    key: str
+    records: list[dict[str, Any]]
+    fingerprint: IndicatorBarsFingerprint
+
+
+class IndicatorResultCache:
+    """LRU of indicator records bounded by entry count and total record count.
+
+    Cached record lists are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_records: int = DEFAULT_MAX_RECORDS,
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_records = max_records
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _CachedIndicator] = OrderedDict()
+        self._total_records = 0
+        self._hits = 0
+        self._extensions = 0
+        self._misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "records": self._total_records,
+                "hits": self._hits,
+                "extensions": self._extensions,
+                "misses": self._misses,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_records = 0
+
+    def get_or_compute(
+        self,
+        scope: tuple[Any, ...],
+        indicator_type: str,
+        params: dict[str, Any],
+        ohlcv: pd.DataFrame,
+        fingerprint: IndicatorBarsFingerprint,
+        compute_fn: ComputeFn,
+        nan_handling: str,
+    ) -> tuple[str, list[dict[str, Any]]]:
+        """Return ``(key, records)`` for the indicator, reusing cached results when possible."""
+        cache_key = (
+            scope,
+            indicator_type,
+            json.dumps(params, sort_keys=True, default=str),
+            nan_handling,
+        )
+        with self._lock:
+            cached = self._entries.get(cache_key)
+            if cached is not None:
+                self._entries.move_to_end(cache_key)
+                if cached.fingerprint.full == fingerprint.full:
+                    self._hits += 1
+                    return cached.key, cached.records
+
+        extended = self._extend(cached, indicator_type, params, ohlcv, fingerprint, compute_fn, nan_handling)
+        if extended is not None:
+            key, records = extended
+        else:
+            key, records = compute_fn(ohlcv, params, nan_handling)
+
+        with self._lock:
+            if extended is not None:
+                self._extensions += 1
+            else:
+                self._misses += 1
+            self._store(cache_key, _CachedIndicator(key, records, fingerprint))
+        return key, records
+
+    @staticmethod
+    def _extend(
+        cached: _CachedIndicator | None,
+        indicator_type: str,
+        params: dict[str, Any],
+        ohlcv: pd.DataFrame,
+        fingerprint: IndicatorBarsFingerprint,
+        compute_fn: ComputeFn,
+        nan_handling: str,
+    ) -> tuple[str, list[dict[str, Any]]] | None:
+        """Recompute only the newest bar when every older bar is unchanged."""
+        if cached is None or fingerprint.head_last_date is None:
+            return None
+        # 最新バーの更新 (head 一致) または 1 本追加 (新 head == 旧 full) のみ末尾拡張する
+        if fingerprint.head not in (cached.fingerprint.head, cached.fingerprint.full):
+            return None
+        tail_bars = indicator_tail_bars(indicator_type, params)
+        if tail_bars is None or tail_bars >= len(ohlcv):
+            return None
+
+        key, tail_records = compute_fn(ohlcv.iloc[-tail_bars:], params, nan_handling)
+        if key != cached.key:
+            return None
+        cutoff = fingerprint.head_last_date
+        kept = [record for record in cached.records if record["date"] <= cutoff]
+        appended = [record for record in tail_records if record["date"] > cutoff]
+        return key, kept + appended
+
+    def _store(self, cache_key: Hashable, entry: _CachedIndicator) -> None:
+        previous = self._entries.pop(cache_key, None)
+        if previous is not None:
+            self._total_records -= len(previous.records)
+        if len(entry.records) > self._max_records:
+            return
+        self._entries[cache_key] = entry
+        self._total_records += len(entry.records)
+        while self._entries and (
+            len(self._entries) > self._max_entries or self._total_records > self._max_records
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._total_records -= len(evicted.records)
+
+
+_default_cache: IndicatorResultCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_indicator_result_cache() -> IndicatorResultCache:
+    """Return the process-wide indicator result cache shared by chart requests."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = IndicatorResultCache()
+        return _default_cache
@@ -15,6 +15,11 @@ from loguru import logger
 
 from src.application.services.analytics_data_provider import MarketAnalyticsDataProvider
 from src.application.services.analytics_provenance import build_market_provenance
+from src.application.services.indicator_result_cache import (
+    IndicatorBarsFingerprint,
+    IndicatorResultCache,
+    get_default_indicator_result_cache,
+)
 from src.infrastructure.db.market.market_reader import MarketDbReader
 from src.infrastructure.data_access.clients import get_dataset_client, get_market_client
 from src.application.services.market_data_errors import MarketDataError
@@ -32,12 +37,12 @@ from src.domains.analytics.margin_metrics import (
 from src.domains.strategy.indicators.indicator_registry import (
     INDICATOR_REGISTRY,
     _clean_value,
-    _format_date,
 )
 from src.domains.strategy.indicators.relative_ohlcv import (
     calculate_relative_ohlcv,
 )
 from src.application.contracts.analytics import ResponseDiagnostics
+from src.shared.utils.market_frames import format_index_date
 
 
 MARGIN_REGISTRY: dict[str, Any] = {
@@ -52,9 +57,14 @@ MARGIN_REGISTRY: dict[str, Any] = {
 class IndicatorService:
     """インジケーター計算サービス"""
 
-    def __init__(self, market_reader: MarketDbReader | None = None) -> None:
+    def __init__(
+        self,
+        market_reader: MarketDbReader | None = None,
+        result_cache: IndicatorResultCache | None = None,
+    ) -> None:
         self._market_reader = market_reader
         self._market_client: Any | None = None
+        self._result_cache = result_cache or get_default_indicator_result_cache()
 
     @property
     def market_client(self) -> Any:
@@ -196,7 +206,7 @@ class IndicatorService:
             for idx, row in ohlcv.iterrows():
                 ohlcv_records.append(
                     {
-                        "date": _format_date(idx),
+                        "date": format_index_date(idx),
                         "open": _clean_value(row["Open"]),
                         "high": _clean_value(row["High"]),
                         "low": _clean_value(row["Low"]),
@@ -227,6 +237,16 @@ class IndicatorService:
             }
 
         results: dict[str, list[dict[str, Any]]] = {}
+        fingerprint: IndicatorBarsFingerprint | None = None
+        scope = (
+            stock_code,
+            source,
+            timeframe,
+            start_date.isoformat() if start_date else None,
+            end_date.isoformat() if end_date else None,
+            benchmark_code,
+            (relative_options or {}).get("handle_zero_division", "skip") if benchmark_code else None,
+        )
         for spec in indicators:
             ind_type = spec["type"]
             params = spec.get("params", {})
@@ -234,7 +254,11 @@ class IndicatorService:
             if compute_fn is None:
                 logger.warning(f"未知のインジケータータイプ: {ind_type}")
                 continue
-            key, records = compute_fn(ohlcv, params, nan_handling)
+            if fingerprint is None:
+                fingerprint = IndicatorBarsFingerprint.from_ohlcv(ohlcv)
+            key, records = self._result_cache.get_or_compute(
+                scope, ind_type, params, ohlcv, fingerprint, compute_fn, nan_handling
+            )
             results[key] = records
 
         loaded_domains = ["stock_data"]
@@ -1,49 +1,52 @@
 """Ingestion Pipeline Utilities.
 
 Sync/Data build で共通の `fetch -> normalize -> validate -> publish -> index` ステージを
-明示的に実行するための軽量ランナー。
+明示的に実行するための軽量ランナー。バッチは行 dict のリストでも
+列指向の DataFrame (全銘柄日足など大量行向け) でもよい。
 """
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sized
 from dataclasses import dataclass
-from typing import Any, TypeVar
+from typing import Any, Generic, TypeVar
 
+import pandas as pd
 from loguru import logger
 from src.infrastructure.db.market.market_mutations import SemanticDeltaResult
 
 Row = dict[str, Any]
 TRow = TypeVar("TRow", bound=Row)
+TBatch = TypeVar("TBatch", bound=Sized)
 
 
 @dataclass(frozen=True)
-class IngestionBatchResult:
+class IngestionBatchResult(Generic[TBatch]):
     """単一バッチ実行結果。"""
 
     fetched_count: int
     normalized_count: int
     validated_count: int
     published_count: int
-    rows: list[Row]
+    rows: TBatch
 
 
 async def run_ingestion_batch(
     *,
     stage: str,
-    fetch: Callable[[], Awaitable[list[Row]]],
-    normalize: Callable[[list[Row]], list[Row]],
-    validate: Callable[[list[Row]], list[Row]],
-    publish: Callable[[list[Row]], Awaitable[SemanticDeltaResult]],
-    index: Callable[[list[Row]], Awaitable[None]] | None = None,
-) -> IngestionBatchResult:
+    fetch: Callable[[], Awaitable[TBatch]],
+    normalize: Callable[[TBatch], TBatch],
+    validate: Callable[[TBatch], TBatch],
+    publish: Callable[[TBatch], Awaitable[SemanticDeltaResult]],
+    index: Callable[[TBatch], Awaitable[None]] | None = None,
+) -> IngestionBatchResult[TBatch]:
     """1バッチを5段階で処理する。"""
     fetched_rows = await fetch()
     normalized_rows = normalize(fetched_rows)
     validated_rows = validate(normalized_rows)
 
     mutation = SemanticDeltaResult.empty()
-    if validated_rows:
+    if len(validated_rows) > 0:
         mutation = await publish(validated_rows)
 
     if index is not None and mutation.mutated_rows:
@@ -123,6 +126,49 @@ def validate_rows_required_fields(
     return deduped
 
 
+def validate_frame_required_fields(
+    frame: pd.DataFrame,
+    *,
+    required_fields: tuple[str, ...],
+    dedupe_keys: tuple[str, ...] | None = None,
+    stage: str,
+) -> pd.DataFrame:
+    """``validate_rows_required_fields`` の列単位版 (必須フィールド検証 + キー重複除去)。
+
+    欠損判定は行版と同じく null と空白文字列を欠損とみなし、
+    重複キーは後勝ちで残す。
+    """
+    missing = pd.Series(False, index=frame.index)
+    for field in required_fields:
+        missing |= _missing_mask(frame, field)
+    missing_count = int(missing.sum())
+    if missing_count > 0:
+        logger.warning(
+            "Stage '{}' skipped {} rows with missing required fields {}",
+            stage,
+            missing_count,
+            required_fields,
+        )
+    valid = frame.loc[~missing]
+    if dedupe_keys is None:
+        return valid
+
+    keyless = pd.Series(False, index=valid.index)
+    for key in dedupe_keys:
+        keyless |= _missing_mask(valid, key)
+    keyed = valid.loc[~keyless]
+    duplicated = keyed.duplicated(list(dedupe_keys), keep="last")
+    duplicate_count = int(keyless.sum()) + int(duplicated.sum())
+    if duplicate_count > 0:
+        logger.warning(
+            "Stage '{}' removed {} duplicate rows for keys {}",
+            stage,
+            duplicate_count,
+            dedupe_keys,
+        )
+    return keyed.loc[~duplicated]
+
+
 def passthrough_rows(rows: list[TRow]) -> list[TRow]:
     return rows
 
@@ -137,6 +183,16 @@ def _build_row_key(row: dict[str, Any], keys: tuple[str, ...]) -> tuple[str, ...
     return tuple(values)
 
 
+def _missing_mask(frame: pd.DataFrame, field: str) -> pd.Series:
+    if field not in frame.columns:
+        return pd.Series(True, index=frame.index)
+    values = frame[field]
+    missing = values.isna()
+    if values.dtype == object or pd.api.types.is_string_dtype(values):
+        missing |= values.astype(str).str.strip() == ""
+    return missing
+
+
 def _is_missing(value: Any) -> bool:
     if value is None:
         return True
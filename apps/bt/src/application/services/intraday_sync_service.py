@@ -3,6 +3,7 @@ Intraday Sync Service
 
 J-Quants `/equities/bars/minute` を DuckDB `stock_data_minute_raw` へ取り込む。
 bulk を既定経路にしつつ、コード指定時は REST を使った targeted ingest を許可する。
+分足は行 dict を作らず DataFrame バッチのまま変換・検証・publish する。
 """
 
 from __future__ import annotations
@@ -12,9 +13,11 @@ from collections.abc import Callable
 from datetime import UTC, date, datetime
 from typing import Any, Literal, Protocol
 
+import pandas as pd
+
 from src.application.services.jquants_bulk_service import BulkApiClientLike, JQuantsBulkService
 from src.application.services.stock_minute_data_row_builder import (
-    build_stock_minute_data_row,
+    build_stock_minute_data_frame,
 )
 from src.application.contracts.market_data_plane import IntradaySyncRequest, IntradaySyncResponse
 from src.infrastructure.db.market.market_db import METADATA_KEYS
@@ -30,9 +33,7 @@ class IntradaySyncMarketDbLike(Protocol):
 
 
 class IntradaySyncTimeSeriesStoreLike(Protocol):
-    def publish_stock_minute_data(
-        self, rows: list[dict[str, Any]]
-    ) -> SemanticDeltaResult: ...
+    def publish_stock_minute_frame(self, frame: pd.DataFrame) -> SemanticDeltaResult: ...
     def index_stock_minute_data(self) -> None: ...
 
 
@@ -182,26 +183,22 @@ async def _sync_intraday_via_rest(
         api_calls += 1
         fetched_count += len(raw_rows)
 
-        publish_rows: list[dict[str, Any]] = []
-        for raw_row in raw_rows:
-            row = build_stock_minute_data_row(
-                raw_row,
-                normalized_code=code,
-                created_at=now_iso,
-            )
-            if row is None:
-                skipped_rows += 1
-                continue
-            publish_rows.append(row)
-            dates_seen.add(str(row["date"]))
-            stored_codes.add(str(row["code"]))
-
-        if publish_rows:
-            mutation = await asyncio.to_thread(
-                time_series_store.publish_stock_minute_data,
-                publish_rows,
-            )
-            stored_count += mutation.mutated_rows
+        batch = build_stock_minute_data_frame(
+            pd.DataFrame.from_records(raw_rows),
+            normalized_code=code,
+            created_at=now_iso,
+        )
+        skipped_rows += batch.rejected_count
+        publish_frame = batch.frame
+        if publish_frame.empty:
+            continue
+        dates_seen.update(publish_frame["date"].unique())
+        stored_codes.update(publish_frame["code"].unique())
+        mutation = await asyncio.to_thread(
+            time_series_store.publish_stock_minute_frame,
+            publish_frame,
+        )
+        stored_count += mutation.mutated_rows
 
     if stored_count > 0:
         await asyncio.to_thread(time_series_store.index_stock_minute_data)
@@ -243,44 +240,43 @@ async def _sync_intraday_via_bulk(
         exact_dates=[request.date] if request.date else None,
     )
 
-    async def _on_rows_batch(
-        batch_rows: list[dict[str, Any]],
+    async def _on_frame_batch(
+        batch_frame: pd.DataFrame,
         _file_info: object,
     ) -> None:
         nonlocal fetched_count, stored_count, skipped_rows
 
-        publish_rows: list[dict[str, Any]] = []
-        for raw_row in batch_rows:
-            row = build_stock_minute_data_row(
-                raw_row,
-                created_at=now_iso,
-            )
-            if row is None:
-                skipped_rows += 1
-                continue
-            if target_codes and str(row["code"]) not in target_codes:
-                continue
-            if not _row_within_request_window(
-                str(row["date"]),
+        batch = build_stock_minute_data_frame(batch_frame, created_at=now_iso)
+        skipped_rows += batch.rejected_count
+        publish_frame = batch.frame
+        if target_codes:
+            publish_frame = publish_frame[publish_frame["code"].isin(target_codes)]
+        if publish_frame.empty:
+            return
+        date_in_window = {
+            row_date: _row_within_request_window(
+                str(row_date),
                 min_date=min_date,
                 max_date=max_date,
-            ):
-                continue
-            publish_rows.append(row)
-            fetched_count += 1
-            dates_seen.add(str(row["date"]))
-            stored_codes.add(str(row["code"]))
-
-        if publish_rows:
-            mutation = await asyncio.to_thread(
-                time_series_store.publish_stock_minute_data,
-                publish_rows,
             )
-            stored_count += mutation.mutated_rows
+            for row_date in publish_frame["date"].unique()
+        }
+        publish_frame = publish_frame[publish_frame["date"].map(date_in_window).astype(bool)]
+        if publish_frame.empty:
+            return
+
+        fetched_count += len(publish_frame)
+        dates_seen.update(publish_frame["date"].unique())
+        stored_codes.update(publish_frame["code"].unique())
+        mutation = await asyncio.to_thread(
+            time_series_store.publish_stock_minute_frame,
+            publish_frame,
+        )
+        stored_count += mutation.mutated_rows
 
     result = await bulk_service.fetch_with_plan(
         plan,
-        on_rows_batch=_on_rows_batch,
+        on_frame_batch=_on_frame_batch,
         accumulate_rows=False,
     )
     api_calls = plan.list_api_calls + result.api_calls
@@ -1,7 +1,8 @@
 """J-Quants bulk download service.
 
 This service wraps `/bulk/list` + `/bulk/get` + signed-url download and provides
-CSV(gzip) parsing with local cache.
+CSV(gzip) parsing with local cache. Rows are streamed either as dict batches or,
+for high-volume endpoints, as string-typed DataFrame batches.
 """
 
 from __future__ import annotations
@@ -15,9 +16,10 @@ from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Protocol
+from typing import Any, Awaitable, Callable, Protocol, cast
 
 import httpx
+import pandas as pd
 from loguru import logger
 
 from src.shared.observability.metrics import metrics_recorder
@@ -123,7 +125,13 @@ class JQuantsBulkService:
         *,
         on_rows_batch: Callable[[list[dict[str, Any]], BulkFileInfo], Awaitable[None]] | None = None,
         accumulate_rows: bool = True,
+        on_frame_batch: Callable[[pd.DataFrame, BulkFileInfo], Awaitable[None]] | None = None,
     ) -> BulkFetchResult:
+        """Fetch planned files and stream their rows.
+
+        ``on_frame_batch`` receives columnar batches (all values as stripped
+        strings) instead of dict rows; it takes precedence over ``on_rows_batch``.
+        """
         rows: list[dict[str, Any]] = []
         api_calls = 0
         cache_hits = 0
@@ -149,6 +157,16 @@ class JQuantsBulkService:
                 cache_path.write_bytes(payload)
                 self._write_cache_meta(file_info)
 
+            if on_frame_batch is not None:
+                for batch_frame in self._iter_csv_gzip_frame_batches(
+                    cache_path,
+                    batch_size=self._csv_read_batch_size,
+                ):
+                    await on_frame_batch(batch_frame, file_info)
+                    if accumulate_rows:
+                        rows.extend(cast(list[dict[str, Any]], batch_frame.to_dict("records")))
+                continue
+
             for batch_rows in self._iter_csv_gzip_row_batches(
                 cache_path,
                 batch_size=self._csv_read_batch_size,
@@ -331,6 +349,27 @@ class JQuantsBulkService:
         if batch:
             yield batch
 
+    def _iter_csv_gzip_frame_batches(
+        self,
+        path: Path,
+        *,
+        batch_size: int,
+    ) -> Iterator[pd.DataFrame]:
+        with pd.read_csv(
+            path,
+            compression="gzip",
+            encoding="utf-8-sig",
+            dtype=str,
+            keep_default_na=False,
+            chunksize=batch_size,
+        ) as reader:
+            for chunk in reader:
+                chunk.columns = [str(column).strip() for column in chunk.columns]
+                chunk = chunk.loc[:, [column for column in chunk.columns if column]]
+                if chunk.empty:
+                    continue
+                yield chunk.apply(lambda column: column.str.strip())
+
     def _iter_csv_gzip_rows(self, path: Path) -> Iterator[dict[str, Any]]:
         with gzip.open(path, mode="rt", encoding="utf-8-sig", newline="") as fh:
             reader = csv.DictReader(fh)
@@ -52,6 +52,11 @@ def _now_iso() -> str:
 MARGIN_INTEREST_TTL_SECONDS = 5 * 60
 FINS_SUMMARY_TTL_SECONDS = 15 * 60
 OPTIONS_225_TTL_SECONDS = 5 * 60
+# Upstream data changes at most daily, so expired payloads stay servable while
+# a background refresh runs (stale-while-revalidate).
+MARGIN_INTEREST_STALE_TTL_SECONDS = 6 * 60 * 60
+FINS_SUMMARY_STALE_TTL_SECONDS = 6 * 60 * 60
+OPTIONS_225_STALE_TTL_SECONDS = 30 * 60
 OPTIONS_225_LOOKBACK_DAYS = 14
 TOKYO_TIMEZONE = ZoneInfo("Asia/Tokyo")
 OPTIONS_225_PATH = "/derivatives/bars/daily/options/225"
@@ -70,21 +75,31 @@ def _normalize_jquants_date(value: str) -> str:
 class JQuantsProxyService:
     """JQuants API プロキシサービス"""
 
-    def __init__(self, client: JQuantsAsyncClient) -> None:
+    def __init__(
+        self,
+        client: JQuantsAsyncClient,
+        cache: ExpiringSingleFlightCache[dict[str, Any]] | None = None,
+    ) -> None:
         self._client = client
-        self._cache = ExpiringSingleFlightCache[dict[str, Any]]()
+        self._cache = cache if cache is not None else ExpiringSingleFlightCache[dict[str, Any]]()
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return proxy cache hit / miss / eviction counters."""
+        return self._cache.stats()
 
     async def _get_cached(
         self,
         path: str,
         params: dict[str, Any],
         ttl_seconds: int,
+        stale_ttl_seconds: int = 0,
     ) -> dict[str, Any]:
         key = _build_cache_key(path, params)
         body, state = await self._cache.get_or_set(
             key=key,
             ttl_seconds=ttl_seconds,
             fetcher=lambda: self._client.get(path, params),
+            stale_ttl_seconds=stale_ttl_seconds,
         )
         self._log_cache_state(path, state, key)
         return body
@@ -253,6 +268,7 @@ class JQuantsProxyService:
             "/markets/margin-interest",
             params,
             ttl_seconds=MARGIN_INTEREST_TTL_SECONDS,
+            stale_ttl_seconds=MARGIN_INTEREST_STALE_TTL_SECONDS,
         )
         raw_data = body.get("data", [])
 
@@ -281,6 +297,7 @@ class JQuantsProxyService:
             "/fins/summary",
             {"code": code},
             ttl_seconds=FINS_SUMMARY_TTL_SECONDS,
+            stale_ttl_seconds=FINS_SUMMARY_STALE_TTL_SECONDS,
         )
         raw_data = body.get("data", [])
 
@@ -316,6 +333,7 @@ class JQuantsProxyService:
             "/fins/summary",
             {"code": code},
             ttl_seconds=FINS_SUMMARY_TTL_SECONDS,
+            stale_ttl_seconds=FINS_SUMMARY_STALE_TTL_SECONDS,
         )
         raw_data = body.get("data", [])
 
@@ -423,6 +441,7 @@ class JQuantsProxyService:
             key=key,
             ttl_seconds=OPTIONS_225_TTL_SECONDS,
             fetcher=lambda: self._fetch_options_225_payload(resolved_date),
+            stale_ttl_seconds=OPTIONS_225_STALE_TTL_SECONDS,
         )
         self._log_cache_state(OPTIONS_225_PATH, state, key)
         return payload
@@ -484,6 +503,7 @@ class JQuantsProxyService:
             key=OPTIONS_225_LATEST_CACHE_KEY,
             ttl_seconds=OPTIONS_225_TTL_SECONDS,
             fetcher=fetch_latest_payload,
+            stale_ttl_seconds=OPTIONS_225_STALE_TTL_SECONDS,
         )
         self._log_cache_state(OPTIONS_225_PATH, state, OPTIONS_225_LATEST_CACHE_KEY)
         return N225OptionsExplorerResponse.model_validate(
@@ -631,7 +631,7 @@ class LabService:
         history = evolver.get_evolution_history()
         successful_results = sorted(
             [result for result in all_results if result.success],
-            key=lambda result: result.score,
+            key=lambda result: (result.fidelity, result.score),
             reverse=True,
         )
         best_is_base_strategy = (
@@ -903,7 +903,10 @@ class LabService:
         history = optimizer.get_optimization_history(study)
         sorted_history = sorted(
             history,
-            key=lambda trial_result: float(trial_result.get("score", 0.0)),
+            key=lambda trial_result: (
+                float(trial_result.get("fidelity", 1.0)),
+                float(trial_result.get("score", 0.0)),
+            ),
             reverse=True,
         )
 
@@ -6,7 +6,9 @@ local market.duckdb から信用取引データを取得し、マージン指標
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
+from typing import Any
 
 import pandas as pd
 
@@ -20,6 +22,9 @@ from src.application.contracts.margin_analytics import (
     MarginFlowPressureData,
     MarginLongPressureData,
     MarginPressureIndicatorsResponse,
+    MarginPressureRankingItem,
+    MarginPressureRankingResponse,
+    MarginPressureSortKey,
     MarginTurnoverDaysData,
     MarginVolumeRatioData,
     MarginVolumeRatioResponse,
@@ -30,13 +35,47 @@ from src.domains.analytics.margin_metrics import (
     compute_margin_turnover_days,
     compute_margin_volume_ratio,
 )
+from src.infrastructure.db.market.margin_analytics_queries import (
+    query_margin_analytics_snapshot,
+)
 from src.infrastructure.db.market.market_reader import MarketDbReader
+from src.shared.utils.pandas_type_guards import (
+    finite_float_or_none,
+    records_with_str_keys,
+)
 
 
 def _now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
+def _rounded(value: Any, digits: int) -> float | None:
+    number = finite_float_or_none(value)
+    return round(number, digits) if number is not None else None
+
+
+def _whole(value: Any) -> float | None:
+    number = finite_float_or_none(value)
+    return float(int(number)) if number is not None else None
+
+
+def _ranking_item(row: dict[str, Any]) -> MarginPressureRankingItem:
+    """SQL 集計行を個別銘柄 API と同じ丸めで整形する"""
+    return MarginPressureRankingItem(
+        code=str(row["code"]),
+        date=str(row["date"])[:10],
+        longPressure=_rounded(row["long_pressure"], 4),
+        flowPressure=_rounded(row["flow_pressure"], 4),
+        turnoverDays=_rounded(row["turnover_days"], 4),
+        longRatio=_rounded(row["long_ratio"], 4),
+        shortRatio=_rounded(row["short_ratio"], 4),
+        longVol=_whole(row["long_vol"]),
+        shortVol=_whole(row["short_vol"]),
+        avgVolume=_rounded(row["avg_volume"], 2),
+        weeklyAvgVolume=_rounded(row["weekly_avg_volume"], 2),
+    )
+
+
 class MarginAnalyticsService:
     """マージン分析サービス"""
 
@@ -131,6 +170,65 @@ class MarginAnalyticsService:
             diagnostics=diagnostics,
         )
 
+    async def get_margin_pressure_ranking(
+        self,
+        *,
+        date: str | None = None,
+        period: int = 15,
+        codes: Sequence[str] | None = None,
+        sort_by: MarginPressureSortKey = "longPressure",
+        order: str = "desc",
+        limit: int | None = 100,
+    ) -> MarginPressureRankingResponse:
+        """全銘柄のマージン指標を 1 クエリで計算し、指定指標で並べて返す"""
+        diagnostics = ResponseDiagnostics(
+            missing_required_data=[],
+            used_fields=[
+                "margin_data.long_margin_volume",
+                "margin_data.short_margin_volume",
+                "stock_data.volume",
+            ],
+        )
+        reader = getattr(self._provider, "reader", None)
+        margin_date: str | None = None
+        items: list[MarginPressureRankingItem] = []
+        if reader is None:
+            diagnostics.missing_required_data.append("market_db")
+        else:
+            margin_date, panel = query_margin_analytics_snapshot(
+                reader,
+                period=period,
+                as_of_date=date,
+                codes=codes,
+            )
+            if margin_date is None:
+                diagnostics.missing_required_data.append("margin_data")
+            items = [
+                _ranking_item(row)
+                for row in records_with_str_keys(panel.to_dict(orient="records"))
+            ]
+
+        descending = order != "asc"
+        ranked = [item for item in items if getattr(item, sort_by) is not None]
+        ranked.sort(key=lambda item: getattr(item, sort_by), reverse=descending)
+        ranked.extend(item for item in items if getattr(item, sort_by) is None)
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        return MarginPressureRankingResponse(
+            date=margin_date,
+            averagePeriod=period,
+            sortBy=sort_by,
+            order="desc" if descending else "asc",
+            items=ranked,
+            lastUpdated=_now_iso(),
+            provenance=build_market_provenance(
+                reference_date=margin_date,
+                loaded_domains=("margin_data", "stock_data"),
+            ),
+            diagnostics=diagnostics,
+        )
+
 
 def create_market_margin_analytics_service(reader: MarketDbReader | None) -> MarginAnalyticsService:
     return MarginAnalyticsService(MarketAnalyticsDataProvider(reader=reader))
@@ -5,7 +5,10 @@ from __future__ import annotations
 import asyncio
 from typing import Any
 
-from src.infrastructure.external_api.clients.moomoo_quote_client import MoomooQuoteClient
+from src.infrastructure.external_api.clients.moomoo_quote_client import (
+    MoomooHistoryTimeframe,
+    MoomooQuoteClient,
+)
 
 
 class MoomooMarketDataService:
@@ -26,8 +29,16 @@ class MoomooMarketDataService:
         start: str | None,
         end: str | None,
         max_rows: int | None,
+        timeframe: MoomooHistoryTimeframe = "1d",
     ) -> dict[str, Any]:
-        return await asyncio.to_thread(self._client.get_us_history, symbol, start, end, max_rows)
+        return await asyncio.to_thread(
+            self._client.get_us_history,
+            symbol,
+            start,
+            end,
+            max_rows,
+            timeframe,
+        )
 
     async def get_us_snapshot(self, symbols: list[str]) -> dict[str, Any]:
         return await asyncio.to_thread(self._client.get_us_snapshot, symbols)
@@ -28,8 +28,10 @@ from src.domains.analytics.regression_core import (
     find_best_matches,
     ols_regression,
 )
+from src.infrastructure.db.market.latest_quote_queries import fetch_latest_quotes
 from src.infrastructure.db.market.market_reader import MarketDbReader
 from src.infrastructure.db.market.portfolio_db import PortfolioDb
+from src.infrastructure.db.market.query_helpers import normalize_stock_code
 
 
 class PortfolioFactorRegressionService:
@@ -60,8 +62,10 @@ class PortfolioFactorRegressionService:
         excluded: list[portfolio_factor_contracts.ExcludedStock] = []
         total_value = 0.0
 
+        quotes = fetch_latest_quotes(self._reader, [item.code for item in items])
         for item in items:
-            price = self._reader.get_latest_price(item.code)
+            quote = quotes.get(normalize_stock_code(item.code))
+            price = quote.close if quote is not None else None
             if price is None:
                 excluded.append(
                     portfolio_factor_contracts.ExcludedStock(
@@ -6,16 +6,32 @@ Portfolio Performance Service
 
 from __future__ import annotations
 
-import math
+import threading
+from collections import OrderedDict
 from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
 from sqlalchemy import Row
 
 from src.application.contracts import portfolio_performance as portfolio_performance_contracts
+from src.infrastructure.db.market.latest_quote_queries import fetch_latest_quotes
 from src.infrastructure.db.market.market_reader import MarketDbReader
 from src.infrastructure.db.market.portfolio_db import PortfolioDb
+from src.infrastructure.db.market.market_schema import METADATA_KEYS
+from src.infrastructure.db.market.query_helpers import (
+    normalize_stock_code,
+    stock_code_query_candidates,
+)
+from src.domains.analytics.portfolio_performance_engine import (
+    PortfolioReturnSeries,
+    ReturnPanel,
+    build_log_return_panel,
+    limit_panel_to_lookback,
+    population_correlation,
+    weighted_portfolio_returns,
+)
 from src.domains.analytics.regression_core import (
     DailyReturn,
     align_returns,
@@ -23,6 +39,38 @@ from src.domains.analytics.regression_core import (
     ols_regression,
 )
 
+_TIMESERIES_CACHE_MAX_ENTRIES = 64
+
+
+class _PortfolioTimeseriesCache:
+    """ポートフォリオ revision 単位の時系列キャッシュ（プロセス内 LRU）"""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[Any, ...], PortfolioReturnSeries] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...]) -> PortfolioReturnSeries | None:
+        with self._lock:
+            series = self._entries.get(key)
+            if series is not None:
+                self._entries.move_to_end(key)
+            return series
+
+    def put(self, key: tuple[Any, ...], series: PortfolioReturnSeries) -> None:
+        with self._lock:
+            self._entries[key] = series
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_TIMESERIES_CACHE = _PortfolioTimeseriesCache(_TIMESERIES_CACHE_MAX_ENTRIES)
+
 
 class PortfolioPerformanceService:
     """ポートフォリオパフォーマンス分析"""
@@ -53,8 +101,10 @@ class PortfolioPerformanceService:
         total_cost = 0.0
         current_value = 0.0
 
+        quotes = fetch_latest_quotes(self._reader, [item.code for item in items])
         for item in items:
-            current_price = self._reader.get_latest_price(item.code)
+            quote = quotes.get(normalize_stock_code(item.code))
+            current_price = quote.close if quote is not None else None
             if current_price is None:
                 warnings.append(f"No price data for {item.code}")
                 current_price = item.purchase_price  # fallback
@@ -98,8 +148,14 @@ class PortfolioPerformanceService:
         )
 
         # 時系列リターン計算
+        revision = (
+            portfolio_id,
+            portfolio.updated_at,
+            tuple((item.id, item.updated_at) for item in items),
+            self._market_revision(),
+        )
         time_series, portfolio_daily = self._calculate_portfolio_timeseries(
-            items, holdings, lookback_days
+            items, holdings, lookback_days, revision
         )
 
         # ベンチマーク分析
@@ -160,69 +216,140 @@ class PortfolioPerformanceService:
         items: Sequence[Row[Any]],
         holdings: list[portfolio_performance_contracts.HoldingDetail],
         lookback_days: int,
+        revision: tuple[Any, ...] | None = None,
     ) -> tuple[
         list[portfolio_performance_contracts.TimeSeriesPoint],
         list[tuple[str, float]],
     ]:
-        """ポートフォリオの日次リターン時系列を計算"""
-        # 各銘柄の日次価格データを取得
-        weight_map = {h.code: h.weight for h in holdings}
-        daily_returns_by_code: dict[str, list[tuple[str, float]]] = {}
-
-        for item in items:
-            code4 = item.code
-            prices = self._reader.get_stock_prices_by_date(code4)
-            if len(prices) >= 2:
-                returns = calculate_daily_returns(prices)
-                daily_returns_by_code[code4] = [(dr.date, dr.ret) for dr in returns]
-
-        if not daily_returns_by_code:
-            return [], []
+        """ポートフォリオの日次リターン時系列を計算
 
-        # 全銘柄で共通の日付セットを求める
-        all_dates: set[str] = set()
-        for rets in daily_returns_by_code.values():
-            all_dates.update(d for d, _ in rets)
-        sorted_dates = sorted(all_dates)
-
-        # lookback 制限
-        if len(sorted_dates) > lookback_days:
-            sorted_dates = sorted_dates[-lookback_days:]
-
-        date_set = set(sorted_dates)
-
-        # 各銘柄の return map
-        return_maps: dict[str, dict[str, float]] = {}
-        for code, rets in daily_returns_by_code.items():
-            return_maps[code] = {d: r for d, r in rets if d in date_set}
-
-        # 加重平均ポートフォリオリターン
-        portfolio_daily: list[tuple[str, float]] = []
-        time_series: list[portfolio_performance_contracts.TimeSeriesPoint] = []
-        cumulative = 0.0
-
-        for date in sorted_dates:
-            daily_ret = 0.0
-            total_weight = 0.0
-            for code, w in weight_map.items():
-                r = return_maps.get(code, {}).get(date)
-                if r is not None:
-                    daily_ret += w * r
-                    total_weight += w
-            if total_weight > 0:
-                daily_ret = daily_ret / total_weight * sum(weight_map.values())
-
-            cumulative += daily_ret
-            portfolio_daily.append((date, daily_ret))
-            time_series.append(
-                portfolio_performance_contracts.TimeSeriesPoint(
-                    date=date,
-                    dailyReturn=round(daily_ret, 6),
-                    cumulativeReturn=round(cumulative, 6),
+        全銘柄の価格を1クエリで取得し、日付 x 銘柄のリターン行列から
+        加重平均リターンを numpy で算出する。``revision`` が与えられた場合は
+        ポートフォリオ/市場データの revision 単位で結果をキャッシュする。
+        """
+        weight_map = {h.code: h.weight for h in holdings}
+        cache_key: tuple[Any, ...] | None = None
+        series: PortfolioReturnSeries | None = None
+        if revision is not None:
+            cache_key = (
+                self._reader.db_path,
+                revision,
+                tuple(weight_map.items()),
+                lookback_days,
+            )
+            series = _TIMESERIES_CACHE.get(cache_key)
+
+        if series is None:
+            panel = self._fetch_return_panel([item.code for item in items], lookback_days)
+            series = weighted_portfolio_returns(
+                limit_panel_to_lookback(panel, lookback_days),
+                weight_map,
+                code_key={code: normalize_stock_code(code) for code in weight_map},
+            )
+            if cache_key is not None:
+                _TIMESERIES_CACHE.put(cache_key, series)
+
+        daily_values = series.daily.tolist()
+        cumulative_values = series.cumulative.tolist()
+        time_series = [
+            portfolio_performance_contracts.TimeSeriesPoint(
+                date=date,
+                dailyReturn=round(daily_ret, 6),
+                cumulativeReturn=round(cumulative, 6),
+            )
+            for date, daily_ret, cumulative in zip(
+                series.dates, daily_values, cumulative_values, strict=True
+            )
+        ]
+        return time_series, list(zip(series.dates, daily_values, strict=True))
+
+    def _fetch_return_panel(self, codes: Sequence[str], lookback_days: int) -> ReturnPanel:
+        """保有全銘柄の close / 前日 close を lookback 期間ぶんだけ1クエリで取得"""
+        candidates = stock_code_query_candidates(codes)
+        if not candidates:
+            return build_log_return_panel([], [], [], [])
+        placeholders = ",".join("?" for _ in candidates)
+        window_clause = ""
+        params: tuple[Any, ...] = candidates
+        if lookback_days > 0:
+            # リターンが存在する日付の和集合のうち直近 lookback_days 営業日のみ返す
+            window_clause = """
+            WHERE date >= (
+                SELECT min(date) FROM (
+                    SELECT DISTINCT date FROM returns
+                    ORDER BY date DESC
+                    LIMIT ?
                 )
             )
+            """
+            params = (*candidates, lookback_days)
+        frame = self._reader.query_dataframe(
+            f"""
+            WITH deduped AS (
+                SELECT
+                    CASE
+                        WHEN length(code) IN (5, 6) AND right(code, 1) = '0'
+                        THEN left(code, length(code) - 1)
+                        ELSE code
+                    END AS code,
+                    date,
+                    close
+                FROM stock_data
+                WHERE code IN ({placeholders})
+                QUALIFY ROW_NUMBER() OVER (
+                    PARTITION BY
+                        CASE
+                            WHEN length(code) IN (5, 6) AND right(code, 1) = '0'
+                            THEN left(code, length(code) - 1)
+                            ELSE code
+                        END,
+                        date
+                    ORDER BY CASE WHEN length(code) = 4 THEN 0 ELSE 1 END
+                ) = 1
+            ),
+            returns AS (
+                SELECT *
+                FROM (
+                    SELECT
+                        code,
+                        date,
+                        close,
+                        LAG(close) OVER (PARTITION BY code ORDER BY date) AS prev_close
+                    FROM deduped
+                )
+                WHERE close > 0 AND prev_close > 0
+            )
+            SELECT code, date, close, prev_close
+            FROM returns
+            {window_clause}
+            """,
+            params,
+        )
+        return build_log_return_panel(
+            frame["code"].tolist(),
+            frame["date"].astype(str).tolist(),
+            frame["close"].to_numpy(dtype="float64"),
+            frame["prev_close"].to_numpy(dtype="float64"),
+        )
 
-        return time_series, portfolio_daily
+    def _market_revision(self) -> tuple[str | None, ...]:
+        """市場データの更新を検知するための sync metadata revision"""
+        table_row = self._reader.query_one(
+            """
+            SELECT count(*) AS table_count
+            FROM information_schema.tables
+            WHERE table_name = 'sync_metadata'
+            """
+        )
+        if table_row is None or int(table_row["table_count"]) != 1:
+            return ()
+        keys = (METADATA_KEYS["LAST_SYNC_DATE"], METADATA_KEYS["LAST_STOCKS_REFRESH"])
+        rows = self._reader.query(
+            "SELECT key, value FROM sync_metadata WHERE key IN (?, ?)",
+            keys,
+        )
+        values = {str(row["key"]): row["value"] for row in rows}
+        return tuple(values.get(key) for key in keys)
 
     def _analyze_benchmark(
         self,
@@ -234,12 +361,23 @@ class PortfolioPerformanceService:
         list[portfolio_performance_contracts.BenchmarkTimeSeriesPoint],
     ] | None:
         """ベンチマーク比較分析"""
+        if not portfolio_daily:
+            return None
+        # ポートフォリオ期間の直前営業日以降のみ取得（初日のリターン算出に前日終値が必要）
+        window_start = portfolio_daily[0][0]
         # TOPIX データを取得（benchmark_code == "0000"）
         if benchmark_code == "0000":
             bench_prices = [
                 (r["date"], r["close"])
                 for r in self._reader.query(
-                    "SELECT date, close FROM topix_data ORDER BY date"
+                    """
+                    SELECT date, close FROM topix_data
+                    WHERE date >= COALESCE(
+                        (SELECT max(date) FROM topix_data WHERE date < ?), ?
+                    )
+                    ORDER BY date
+                    """,
+                    (window_start, window_start),
                 )
             ]
             bench_name = "TOPIX"
@@ -247,8 +385,19 @@ class PortfolioPerformanceService:
             bench_prices = [
                 (r["date"], r["close"])
                 for r in self._reader.query(
-                    "SELECT date, close FROM indices_data WHERE code = ? AND close IS NOT NULL ORDER BY date",
-                    (benchmark_code,),
+                    """
+                    SELECT date, close FROM indices_data
+                    WHERE code = ? AND close IS NOT NULL
+                      AND date >= COALESCE(
+                        (
+                            SELECT max(date) FROM indices_data
+                            WHERE code = ? AND close IS NOT NULL AND date < ?
+                        ),
+                        ?
+                      )
+                    ORDER BY date
+                    """,
+                    (benchmark_code, benchmark_code, window_start, window_start),
                 )
             ]
             name_row = self._reader.query_one(
@@ -277,18 +426,15 @@ class PortfolioPerformanceService:
         # OLS 回帰
         reg = ols_regression(aligned_port, aligned_bench)
 
-        # Correlation
-        n = len(aligned_port)
-        mean_p = sum(aligned_port) / n
-        mean_b = sum(aligned_bench) / n
-        cov = sum((aligned_port[i] - mean_p) * (aligned_bench[i] - mean_b) for i in range(n)) / n
-        std_p = math.sqrt(sum((p - mean_p) ** 2 for p in aligned_port) / n)
-        std_b = math.sqrt(sum((b - mean_b) ** 2 for b in aligned_bench) / n)
-        correlation = cov / (std_p * std_b) if std_p > 0 and std_b > 0 else 0.0
+        port_values = np.asarray(aligned_port, dtype=np.float64)
+        bench_values = np.asarray(aligned_bench, dtype=np.float64)
+        correlation = population_correlation(port_values, bench_values)
 
         # 累積リターン
-        bench_cum = sum(aligned_bench)
-        port_cum = sum(aligned_port)
+        port_accum = np.cumsum(port_values)
+        bench_accum = np.cumsum(bench_values)
+        port_cum = float(port_accum[-1])
+        bench_cum = float(bench_accum[-1])
 
         benchmark_result = portfolio_performance_contracts.BenchmarkResult(
             code=benchmark_code,
@@ -303,16 +449,14 @@ class PortfolioPerformanceService:
 
         # ベンチマーク時系列
         benchmark_ts: list[portfolio_performance_contracts.BenchmarkTimeSeriesPoint] = []
-        port_accum = 0.0
-        bench_accum = 0.0
-        for i, date in enumerate(dates):
-            port_accum += aligned_port[i]
-            bench_accum += aligned_bench[i]
+        for date, port_ret, bench_ret in zip(
+            dates, port_accum.tolist(), bench_accum.tolist(), strict=True
+        ):
             benchmark_ts.append(
                 portfolio_performance_contracts.BenchmarkTimeSeriesPoint(
                     date=date,
-                    portfolioReturn=round(port_accum, 6),
-                    benchmarkReturn=round(bench_accum, 6),
+                    portfolioReturn=round(port_ret, 6),
+                    benchmarkReturn=round(bench_ret, 6),
                 )
             )
 
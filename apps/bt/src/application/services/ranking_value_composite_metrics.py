@@ -22,7 +22,7 @@ from src.domains.analytics.value_composite_scoring import (
 )
 from src.domains.fundamentals import (
     FundamentalsCalculator,
-    market_statement_row_to_jquants_statement,
+    market_statement_rows_to_frame,
 )
 from src.application.services.ranking_fundamental_queries import (
     load_adjusted_daily_valuation_frame,
@@ -358,48 +358,49 @@ def build_value_composite_score_frame_from_statement_rows(
         code = str(row["code"])
         raw_statements_by_code.setdefault(code, []).append(row)
 
-    records: list[dict[str, Any]] = []
+    priced_stocks: list[tuple[Mapping[str, Any], float]] = []
     for stock in stock_rows:
-        code = str(stock["code"])
-        raw_statements = raw_statements_by_code.get(code, [])
-        if not raw_statements:
-            continue
         price = to_nullable_float(stock["current_price"])
-        volume = to_nullable_float(stock["volume"])
-        if price is None or price <= 0:
+        if str(stock["code"]) not in raw_statements_by_code or price is None or price <= 0:
             continue
-
-        valuation_rows = (
-            raw_statements
-            if forward_eps_mode == "latest"
-            else [
-                row
-                for row in raw_statements
-                if normalize_period_label(row["type_of_current_period"]) == "FY"
-            ]
-        )
-        valuation_statements = [
-            market_statement_row_to_jquants_statement(row, code_fallback=code)
-            for row in valuation_rows
+        priced_stocks.append((stock, price))
+    if not priced_stocks:
+        return score_value_composite_records([], weights=weights)
+
+    valuation_rows = (
+        statement_rows
+        if forward_eps_mode == "latest"
+        else [
+            row
+            for row in statement_rows
+            if normalize_period_label(row["type_of_current_period"]) == "FY"
         ]
-        valuation = valuation_calculator.calculate_latest_valuation(
-            valuation_statements,
-            close=price,
-            price_date=target_date,
-            prefer_consolidated=True,
-            share_adjustment_events=adjustment_events_by_code.get(code, []),
-            price_basis_date=price_basis_date,
-        )
+    )
+    valuations = valuation_calculator.calculate_latest_valuation_batch(
+        market_statement_rows_to_frame(valuation_rows),
+        pd.DataFrame(
+            {
+                "Code": [str(stock["code"]) for stock, _ in priced_stocks],
+                "Date": target_date,
+                "Close": [price for _, price in priced_stocks],
+            }
+        ),
+        prefer_consolidated=True,
+        share_adjustment_events_by_code=adjustment_events_by_code,
+        price_basis_date=price_basis_date,
+    )
+    valuation_by_code = {str(row["Code"]): row for row in valuations.to_dict("records")}
+
+    records: list[dict[str, Any]] = []
+    for stock, price in priced_stocks:
+        code = str(stock["code"])
+        valuation = valuation_by_code.get(code)
         if valuation is None:
             continue
-
-        pbr = valuation.pbr
-        forward_per = valuation.forwardPer
-        market_cap_bil_jpy = (
-            valuation.marketCap / 1_000_000_000.0
-            if valuation.marketCap is not None
-            else None
-        )
+        volume = to_nullable_float(stock["volume"])
+        pbr = finite_or_none(valuation["pbr"])
+        market_cap = finite_or_none(valuation["marketCap"])
+        market_cap_bil_jpy = market_cap / 1_000_000_000.0 if market_cap is not None else None
         bps = price / pbr if pbr is not None and pbr > 0 else None
 
         records.append(
@@ -412,16 +413,16 @@ def build_value_composite_score_frame_from_statement_rows(
                 "current_price": price,
                 "volume": volume if volume is not None else 0.0,
                 "pbr": pbr,
-                "forward_per": forward_per,
+                "forward_per": finite_or_none(valuation["forwardPer"]),
                 "market_cap_bil_jpy": market_cap_bil_jpy,
                 "bps": bps,
-                "forward_eps": valuation.forwardEps,
+                "forward_eps": finite_or_none(valuation["forwardEps"]),
                 "latest_fy_disclosed_date": latest_actual_fy_disclosed_date(
-                    raw_statements,
+                    raw_statements_by_code[code],
                     as_of_date=target_date,
                 ),
-                "forward_eps_disclosed_date": valuation.forwardEpsDisclosedDate,
-                "forward_eps_source": valuation.forwardEpsSource,
+                "forward_eps_disclosed_date": valuation["forwardEpsDisclosedDate"],
+                "forward_eps_source": valuation["forwardEpsSource"],
             }
         )
 
@@ -22,6 +22,9 @@ from src.application.services.screening_default_markets import (
     validate_selected_screening_strategy_datasets,
 )
 from src.application.services.screening_service import ScreeningService
+from src.application.services.screening_signal_state_store import (
+    get_default_screening_signal_state_store,
+)
 from src.application.services.strategy_dataset_metadata import format_market_scope_label
 from src.application.workers.job_runtime import job_lifecycle_fields, record_elapsed_job_duration
 from src.infrastructure.db.market.market_reader import MarketDbReader
@@ -164,7 +167,10 @@ class ScreeningJobService:
                 message="Screening ジョブを開始しました",
             )
 
-            service = ScreeningService(reader)
+            service = ScreeningService(
+                reader,
+                signal_state_store=get_default_screening_signal_state_store(),
+            )
             effective_markets = self._require_effective_markets(request)
             response = await loop.run_in_executor(
                 self._executor,
@@ -6,7 +6,9 @@ from typing import Any
 
 import pandas as pd
 
+from src.domains.strategy.signals.margin import MARGIN_PRESSURE_COLUMNS
 from src.infrastructure.data_access.loaders.margin_loaders import transform_margin_df
+from src.infrastructure.db.market.margin_analytics_queries import query_margin_analytics_panel
 from src.infrastructure.db.market.market_reader import MarketDbQueryable
 from src.infrastructure.db.market.query_helpers import normalize_stock_code, stock_code_query_candidates
 
@@ -18,6 +20,7 @@ def attach_margin(
     *,
     start_date: str | None,
     end_date: str | None,
+    pressure_period: int | None = None,
 ) -> list[str]:
     warnings: list[str] = []
     codes = list(daily_index_by_code.keys())
@@ -47,9 +50,76 @@ def attach_margin(
         except Exception as e:  # noqa: BLE001 - screening should continue
             warnings.append(f"{code} margin transform failed ({e})")
 
+    if pressure_period is not None:
+        warnings.extend(
+            attach_margin_pressure(
+                reader,
+                result,
+                daily_index_by_code,
+                period=pressure_period,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        )
+
     return warnings
 
 
+# margin_analytics_queries の列 -> margin_daily に追加する列
+MARGIN_PRESSURE_FEATURE_COLUMNS = {
+    **MARGIN_PRESSURE_COLUMNS,
+    "long_ratio": "LongVolumeRatio",
+    "short_ratio": "ShortVolumeRatio",
+}
+
+
+def attach_margin_pressure(
+    reader: MarketDbQueryable,
+    result: dict[str, dict[str, pd.DataFrame]],
+    daily_index_by_code: dict[str, pd.DatetimeIndex],
+    *,
+    period: int,
+    start_date: str | None,
+    end_date: str | None,
+) -> list[str]:
+    """全銘柄のマージン指標を 1 クエリで計算し、margin_daily に列として追加する
+
+    指標は信用残高の公表日にのみ定義されるため、日次 index へは前方補完する。
+    未定義区間は 0 埋めせず NaN のまま残す。
+    """
+    codes = [code for code in daily_index_by_code if "margin_daily" in result.get(code, {})]
+    if not codes:
+        return []
+    try:
+        panel = query_margin_analytics_panel(
+            reader,
+            period=period,
+            codes=codes,
+            start_date=start_date,
+            end_date=end_date,
+        )
+    except Exception as e:  # noqa: BLE001 - keep plain margin columns
+        return [f"market margin pressure load failed ({e})"]
+    if panel.empty:
+        return []
+
+    panel["date"] = pd.to_datetime(panel["date"])
+    feature_columns = list(MARGIN_PRESSURE_FEATURE_COLUMNS)
+    for code, frame in panel.groupby("code", sort=False):
+        code_key = str(code)
+        if code_key not in codes:
+            continue
+        features = (
+            frame.set_index("date")[feature_columns]
+            .astype(float)
+            .rename(columns=MARGIN_PRESSURE_FEATURE_COLUMNS)
+            .reindex(daily_index_by_code[code_key], method="ffill")
+        )
+        margin_daily = result[code_key]["margin_daily"]
+        result[code_key]["margin_daily"] = margin_daily.join(features)
+    return []
+
+
 def _is_missing_table_error(exc: Exception) -> bool:
     message = str(exc).lower()
     return "no such table" in message or ("does not exist" in message and "table" in message)
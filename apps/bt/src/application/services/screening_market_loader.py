@@ -41,8 +41,13 @@ def load_market_multi_data(
     include_statements_data: bool = False,
     period_type: APIPeriodType = "FY",
     include_forecast_revision: bool = False,
+    margin_pressure_period: int | None = None,
 ) -> tuple[dict[str, dict[str, pd.DataFrame]], list[str]]:
-    """DuckDB から複数銘柄の screening 用データを取得"""
+    """DuckDB から複数銘柄の screening 用データを取得
+
+    margin_pressure_period を指定すると、margin_daily に信用圧力・回転日数・
+    週平均出来高比率の列（全銘柄 1 クエリで計算）を追加する。
+    """
     warnings: list[str] = []
     normalized_codes = screening_price_loader.normalize_codes(stock_codes)
     if not normalized_codes:
@@ -77,6 +82,7 @@ def load_market_multi_data(
                 daily_index_by_code,
                 start_date=start_date,
                 end_date=end_date,
+                pressure_period=margin_pressure_period,
             )
             warnings.extend(margin_warnings)
         except Exception as e:  # noqa: BLE001 - degrade to daily/statements without margin
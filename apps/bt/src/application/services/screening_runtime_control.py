@@ -9,6 +9,8 @@ from typing import Any
 
 from loguru import logger
 
+from src.shared.observability.metrics import metrics_recorder
+
 
 def resolve_strategy_workers(strategy_count: int) -> int:
     """戦略並列数を自動決定する。"""
@@ -83,6 +85,7 @@ def log_stage_timing(
     **extra: Any,
 ) -> None:
     duration_ms = round((perf_counter() - started_at) * 1000, 2)
+    metrics_recorder.record_stage("screening", stage, duration_ms)
     logger.bind(
         event="screening_stage_timing",
         stage=stage,
@@ -40,6 +40,7 @@ from src.domains.analytics.screening_evaluator import (
     evaluate_strategy as evaluate_screening_strategy,
     evaluate_strategy_input as evaluate_screening_strategy_input,
 )
+from src.domains.analytics.screening_signal_state import resolve_incremental_warmup_sessions
 from src.domains.analytics.screening_results import (
     ScreeningSortBy,
     SortOrder,
@@ -90,6 +91,7 @@ from src.application.services.screening_evaluation_runner import (
     build_ordered_strategy_results as build_screening_ordered_strategy_results,
     run_stock_major_evaluation,
 )
+from src.application.services.screening_signal_state_store import ScreeningSignalStateStore
 from src.application.services.screening_strategy_runtime import resolve_screening_strategy_runtimes
 from src.application.services.screening_strategy_metrics import (
     load_latest_metric as load_screening_latest_metric,
@@ -149,10 +151,15 @@ class ScreeningService:
     _DEFAULT_BACKTEST_METRIC = "sharpe_ratio"
     _DEFAULT_HISTORY_TRADING_DAYS = 520
 
-    def __init__(self, reader: MarketDbReadable) -> None:
+    def __init__(
+        self,
+        reader: MarketDbReadable,
+        signal_state_store: ScreeningSignalStateStore | None = None,
+    ) -> None:
         self._reader = reader
         self._config_loader = ConfigLoader()
         self._signal_processor = SignalProcessor()
+        self._signal_state_store = signal_state_store
 
     def run_screening(
         self,
@@ -215,6 +222,8 @@ class ScreeningService:
             recent_days=recent_days,
             progress_callback=progress_callback,
         )
+        if self._signal_state_store is not None:
+            self._signal_state_store.flush()
         self._log_stage_timing(
             stage="evaluate",
             started_at=evaluate_stage_started,
@@ -453,6 +462,7 @@ class ScreeningService:
             include_statements_data=key.include_statements_data,
             period_type=key.period_type,
             include_forecast_revision=key.include_forecast_revision,
+            margin_pressure_period=key.margin_pressure_period,
         )
         for warning in warnings:
             logger.warning("screening market loader warning: {}", warning)
@@ -480,13 +490,23 @@ class ScreeningService:
         progress_callback: Callable[[int, int], None] | None,
     ) -> tuple[list[StrategyEvaluationResult], list[str], int]:
         """銘柄主導(stock-major)で戦略評価を実行する。"""
+        evaluate_stock: Callable[..., StockEvaluationOutcome] = self._evaluate_stock
+        if self._signal_state_store is not None:
+            incremental_warmup_sessions = self._resolve_incremental_warmup_sessions(strategy_inputs)
+            evaluate_stock = lambda stock, inputs, days, tokens: self._evaluate_stock(  # noqa: E731
+                stock,
+                inputs,
+                days,
+                tokens,
+                incremental_warmup_sessions=incremental_warmup_sessions,
+            )
         return run_stock_major_evaluation(
             strategy_inputs=strategy_inputs,
             stock_universe=stock_universe,
             recent_days=recent_days,
             progress_callback=progress_callback,
             build_strategy_signal_cache_token=self._build_strategy_signal_cache_token,
-            evaluate_stock=self._evaluate_stock,
+            evaluate_stock=evaluate_stock,
             apply_stock_outcome=self._apply_stock_outcome,
             resolve_stock_workers=self._resolve_stock_workers,
             emit_progress=lambda callback, completed, total: self._emit_progress(
@@ -506,6 +526,20 @@ class ScreeningService:
             accumulators=accumulators,
         )
 
+    def _resolve_incremental_warmup_sessions(
+        self,
+        strategy_inputs: list[StrategyExecutionInput],
+    ) -> dict[str, int | None]:
+        """signal state による増分評価に使う戦略ごとの warmup 営業日数を解決する。"""
+        return {
+            strategy_input.strategy.response_name: resolve_incremental_warmup_sessions(
+                strategy_input.strategy.entry_params,
+                strategy_input.strategy.exit_params,
+                signal_registry=SIGNAL_REGISTRY,
+            )
+            for strategy_input in strategy_inputs
+        }
+
     def _build_strategy_signal_cache_token(self, strategy: StrategyRuntime) -> str:
         return build_screening_strategy_signal_cache_token(strategy)
 
@@ -535,6 +569,7 @@ class ScreeningService:
         strategy_inputs: list[StrategyExecutionInput],
         recent_days: int,
         strategy_cache_tokens: dict[str, str],
+        incremental_warmup_sessions: dict[str, int | None] | None = None,
     ) -> StockEvaluationOutcome:
         return evaluate_screening_stock(
             stock=stock,
@@ -545,6 +580,8 @@ class ScreeningService:
             find_recent_match_date=self._find_recent_match_date,
             build_strategy_signal_cache_token_fn=self._build_strategy_signal_cache_token,
             build_per_stock_signal_cache_key_fn=self._build_per_stock_signal_cache_key,
+            signal_state_store=self._signal_state_store,
+            incremental_warmup_sessions=incremental_warmup_sessions,
         )
 
     def _apply_stock_outcome(
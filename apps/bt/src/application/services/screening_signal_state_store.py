@@ -0,0 +1,150 @@
+"""Disk-backed store of per-strategy, per-stock screening signal state.
+
+States are grouped by strategy state key (strategy parameters + ``recent_days``)
+and persisted as one JSON file per key. Files are loaded lazily on first access
+and written back by :meth:`ScreeningSignalStateStore.flush` at the end of a
+screening run.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from src.domains.analytics.screening_signal_state import (
+    SCREENING_SIGNAL_STATE_SCHEMA_VERSION,
+    ScreeningSignalState,
+)
+from src.shared.paths import get_cache_dir
+
+
+class ScreeningSignalStateStore:
+    """Process-wide cache of screening signal state backed by JSON files."""
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._lock = threading.Lock()
+        self._states: dict[str, dict[str, ScreeningSignalState]] = {}
+        self._dirty_keys: set[str] = set()
+        self._context_fingerprints: dict[Hashable, str] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "cacheDir": str(self._cache_dir),
+                "strategyKeys": len(self._states),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def get(self, state_key: str, stock_code: str) -> ScreeningSignalState | None:
+        states = self._states_for(state_key)
+        with self._lock:
+            state = states.get(stock_code)
+            if state is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return state
+
+    def put(self, state_key: str, stock_code: str, state: ScreeningSignalState) -> None:
+        states = self._states_for(state_key)
+        with self._lock:
+            if states.get(stock_code) == state:
+                return
+            states[stock_code] = state
+            self._dirty_keys.add(state_key)
+
+    def remember_context_fingerprint(
+        self,
+        key: Hashable,
+        build: Callable[[], str],
+    ) -> str:
+        """Memoize a run-wide context fingerprint until the next flush."""
+        with self._lock:
+            cached = self._context_fingerprints.get(key)
+        if cached is not None:
+            return cached
+        fingerprint = build()
+        with self._lock:
+            return self._context_fingerprints.setdefault(key, fingerprint)
+
+    def flush(self) -> None:
+        """Persist changed states and drop run-scoped context fingerprints."""
+        with self._lock:
+            dirty = {key: dict(self._states[key]) for key in self._dirty_keys}
+            self._dirty_keys.clear()
+            self._context_fingerprints.clear()
+        for state_key, states in dirty.items():
+            try:
+                self._write(state_key, states)
+            except Exception as exc:
+                logger.warning(f"screening signal state write failed ({state_key}): {exc}")
+
+    def _states_for(self, state_key: str) -> dict[str, ScreeningSignalState]:
+        with self._lock:
+            states = self._states.get(state_key)
+        if states is not None:
+            return states
+        loaded = self._read(state_key)
+        with self._lock:
+            return self._states.setdefault(state_key, loaded)
+
+    def _path(self, state_key: str) -> Path:
+        return self._cache_dir / f"{state_key}.json"
+
+    def _read(self, state_key: str) -> dict[str, ScreeningSignalState]:
+        path = self._path(state_key)
+        if not path.exists():
+            return {}
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            if payload.get("schemaVersion") != SCREENING_SIGNAL_STATE_SCHEMA_VERSION:
+                return {}
+            return {
+                str(code): ScreeningSignalState.from_payload(item)
+                for code, item in payload.get("stocks", {}).items()
+            }
+        except Exception as exc:
+            logger.warning(f"screening signal state read failed ({state_key}): {exc}")
+            return {}
+
+    def _write(self, state_key: str, states: dict[str, ScreeningSignalState]) -> None:
+        path = self._path(state_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "schemaVersion": SCREENING_SIGNAL_STATE_SCHEMA_VERSION,
+                    "stocks": {code: state.to_payload() for code, state in sorted(states.items())},
+                },
+                separators=(",", ":"),
+            ),
+            encoding="utf-8",
+        )
+        tmp_path.replace(path)
+
+
+_default_store: ScreeningSignalStateStore | None = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_screening_signal_state_store() -> ScreeningSignalStateStore:
+    """Return the process-wide store under ``<cache_dir>/screening-signal-state``."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ScreeningSignalStateStore(get_cache_dir() / "screening-signal-state")
+        return _default_store
@@ -347,6 +347,7 @@ class SignalService:
             include_statements_data=requirements.multi_data_key.include_statements_data,
             period_type=requirements.multi_data_key.period_type,
             include_forecast_revision=requirements.multi_data_key.include_forecast_revision,
+            margin_pressure_period=requirements.multi_data_key.margin_pressure_period,
         )
         warnings.extend(load_warnings)
 
@@ -3,14 +3,24 @@ Stock Data Row Builder
 
 J-Quants の日足レスポンスを DuckDB stock_data_raw 行へ安全に変換する。
 新規上場銘柄などで OHLCV が欠損している行は None を返してスキップする。
+全銘柄の日足バッチは build_stock_data_frame で列単位に変換する。
 """
 
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
+from src.application.services.stock_minute_data_row_builder import (
+    _coerce_float_column,
+    _map_unique,
+    _quote_column,
+)
 from src.infrastructure.db.market.query_helpers import normalize_stock_code
 
 
@@ -165,3 +175,136 @@ def build_stock_data_row(
         "adjusted_volume": adjusted_volume,
         "created_at": created_at or datetime.now(UTC).isoformat(),
     }
+
+
+STOCK_DATA_COLUMNS: tuple[str, ...] = (
+    "code",
+    "date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "turnover_value",
+    "adjustment_factor",
+    "adjusted_open",
+    "adjusted_high",
+    "adjusted_low",
+    "adjusted_close",
+    "adjusted_volume",
+    "created_at",
+)
+
+_PROVIDER_PRICE_KEYS: tuple[str, ...] = (
+    "O",
+    "H",
+    "L",
+    "C",
+    "Vo",
+    "Va",
+    "AdjO",
+    "AdjH",
+    "AdjL",
+    "AdjC",
+    "AdjVo",
+)
+
+
+@dataclass(frozen=True)
+class StockDataFrameBatch:
+    """列指向で変換した日足バッチと、入力行に揃えた除外マスク。
+
+    ``rejected`` は変換できなかった入力行、``incomplete`` はそのうち
+    provider の通常の無売買行ではない (再取得が必要な) 行を示す。
+    """
+
+    frame: pd.DataFrame
+    rejected: pd.Series
+    incomplete: pd.Series
+
+
+def provider_no_trade_mask(quotes: pd.DataFrame) -> pd.Series:
+    """``is_provider_no_trade_row`` の列単位版。"""
+    no_trade = pd.Series(True, index=quotes.index)
+    for key in _PROVIDER_PRICE_KEYS:
+        no_trade &= _quote_column(quotes, key).isna()
+    factor = _quote_column(quotes, "AdjFactor")
+    return no_trade & (factor.isna() | (_coerce_float_column(factor) == 1.0))
+
+
+def build_stock_data_frame(
+    quotes: pd.DataFrame,
+    *,
+    created_at: str | None = None,
+    require_adjusted: bool = True,
+) -> StockDataFrameBatch:
+    """J-Quants 日足レスポンス（API JSON / bulk CSV）を列単位で stock_data_raw 行へ変換する。
+
+    除外条件は ``build_stock_data_row`` と同じ。
+    """
+    codes = _map_unique(
+        _quote_column(quotes, "Code"),
+        lambda value: normalize_stock_code(str(value)) or None,
+    )
+    dates = _map_unique(_quote_column(quotes, "Date"), _coerce_date)
+    values = {
+        column: _coerce_float_column(_quote_column(quotes, key))
+        for column, key in (
+            ("open", "O"),
+            ("high", "H"),
+            ("low", "L"),
+            ("close", "C"),
+            ("volume", "Vo"),
+            ("turnover_value", "Va"),
+            ("adjustment_factor", "AdjFactor"),
+            ("adjusted_open", "AdjO"),
+            ("adjusted_high", "AdjH"),
+            ("adjusted_low", "AdjL"),
+            ("adjusted_close", "AdjC"),
+            ("adjusted_volume", "AdjVo"),
+        )
+    }
+    required = [
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "turnover_value",
+        "adjustment_factor",
+    ]
+    if require_adjusted:
+        required.extend(
+            (
+                "adjusted_open",
+                "adjusted_high",
+                "adjusted_low",
+                "adjusted_close",
+                "adjusted_volume",
+            )
+        )
+
+    valid = codes.notna() & dates.notna()
+    for column in required:
+        valid &= values[column].notna()
+    volume = values["volume"]
+    valid &= volume == np.trunc(volume)
+    valid &= values["adjustment_factor"] > 0
+    valid &= ~(values["adjusted_volume"] < 0)
+
+    frame = pd.DataFrame(
+        {
+            "code": codes[valid],
+            "date": dates[valid],
+            **{column: series[valid] for column, series in values.items()},
+            "created_at": created_at or datetime.now(UTC).isoformat(),
+        },
+        columns=list(STOCK_DATA_COLUMNS),
+    )
+    frame["volume"] = frame["volume"].astype("Int64")
+    rejected = ~valid
+    return StockDataFrameBatch(
+        frame=frame.reset_index(drop=True),
+        rejected=rejected,
+        incomplete=rejected & ~provider_no_trade_mask(quotes),
+    )
@@ -3,14 +3,20 @@ Stock Minute Data Row Builder
 
 J-Quants の分足レスポンスを DuckDB stock_data_minute_raw 行へ安全に変換する。
 OHLCV / 時刻が欠損している行は None を返してスキップする。
+大量の分足は build_stock_minute_data_frame で列単位に変換する。
 """
 
 from __future__ import annotations
 
 import math
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
 from src.infrastructure.db.market.query_helpers import normalize_stock_code
 
 
@@ -104,3 +110,100 @@ def build_stock_minute_data_row(
         "turnover_value": _coerce_float(_pick_first(quote, "Va")),
         "created_at": created_at or datetime.now(UTC).isoformat(),
     }
+
+
+STOCK_MINUTE_DATA_COLUMNS: tuple[str, ...] = (
+    "code",
+    "date",
+    "time",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "turnover_value",
+    "created_at",
+)
+
+
+@dataclass(frozen=True)
+class StockMinuteDataFrameBatch:
+    """列指向で変換した分足バッチと、変換できずに除外した行数。"""
+
+    frame: pd.DataFrame
+    rejected_count: int
+
+
+def _quote_column(quotes: pd.DataFrame, key: str) -> pd.Series:
+    if key in quotes.columns:
+        return quotes[key]
+    return pd.Series(None, index=quotes.index, dtype=object)
+
+
+def _map_unique(values: pd.Series, convert: Callable[[Any], str | None]) -> pd.Series:
+    """コード・日付・時刻のように種類の少ない列をユニーク値単位で変換する。"""
+    mapping = {value: convert(value) for value in values.dropna().unique()}
+    return values.map(mapping).astype(object).where(lambda mapped: mapped.notna(), None)
+
+
+def _coerce_float_column(values: pd.Series) -> pd.Series:
+    if pd.api.types.is_bool_dtype(values):
+        return pd.Series(np.nan, index=values.index, dtype=float)
+    numeric = pd.to_numeric(values, errors="coerce").astype(float)
+    return numeric.where(np.isfinite(numeric))
+
+
+def build_stock_minute_data_frame(
+    quotes: pd.DataFrame,
+    *,
+    normalized_code: str | None = None,
+    created_at: str | None = None,
+) -> StockMinuteDataFrameBatch:
+    """J-Quants 分足レスポンス（API JSON / bulk CSV）を列単位で stock_data_minute_raw 行へ変換する。
+
+    除外条件は ``build_stock_minute_data_row`` と同じで、
+    除外した行数を ``rejected_count`` に返す。
+    """
+    if quotes.empty:
+        return StockMinuteDataFrameBatch(
+            frame=pd.DataFrame(columns=list(STOCK_MINUTE_DATA_COLUMNS)),
+            rejected_count=0,
+        )
+
+    if normalized_code:
+        codes = pd.Series(normalized_code, index=quotes.index, dtype=object)
+    else:
+        codes = _map_unique(
+            _quote_column(quotes, "Code"),
+            lambda value: normalize_stock_code(str(value)) or None,
+        )
+    dates = _map_unique(_quote_column(quotes, "Date"), _coerce_date)
+    times = _map_unique(_quote_column(quotes, "Time"), _coerce_time)
+    prices = {
+        column: _coerce_float_column(_quote_column(quotes, key))
+        for column, key in (("open", "O"), ("high", "H"), ("low", "L"), ("close", "C"))
+    }
+    volume = np.trunc(_coerce_float_column(_quote_column(quotes, "Vo")))
+
+    valid = codes.notna() & dates.notna() & times.notna() & volume.notna()
+    for values in prices.values():
+        valid &= values.notna()
+
+    frame = pd.DataFrame(
+        {
+            "code": codes[valid],
+            "date": dates[valid],
+            "time": times[valid],
+            **{column: values[valid] for column, values in prices.items()},
+            "volume": volume[valid].astype("Int64"),
+            "turnover_value": _coerce_float_column(_quote_column(quotes, "Va"))[valid].astype(
+                "Float64"
+            ),
+            "created_at": created_at or datetime.now(UTC).isoformat(),
+        },
+        columns=list(STOCK_MINUTE_DATA_COLUMNS),
+    ).reset_index(drop=True)
+    return StockMinuteDataFrameBatch(
+        frame=frame,
+        rejected_count=int(len(quotes) - int(valid.sum())),
+    )
@@ -133,6 +133,16 @@ _SHARED_FIELD_OVERRIDES: dict[str, dict[str, Any]] = {
         "label": "Max New Positions / Day",
         "summary": "Cap the number of fresh entries per day.",
     },
+    "position_limit_mode": {
+        "group": "portfolio",
+        "label": "Position Limit Mode",
+        "summary": "Count only fresh entries per day, or open positions as well.",
+    },
+    "entry_priority": {
+        "group": "portfolio",
+        "label": "Entry Priority",
+        "summary": "Which entries survive the position cap.",
+    },
     "max_exposure": {
         "group": "portfolio",
         "label": "Max Exposure",
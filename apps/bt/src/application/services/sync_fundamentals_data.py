@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Callable
+from contextlib import aclosing
 from datetime import UTC, datetime
 from typing import Any, cast
 
@@ -25,6 +26,7 @@ from src.application.services.sync_fins_fetch import (
     _fetch_fins_summary_by_code,
     _fetch_fins_summary_paginated,
 )
+from src.application.services.sync_paginated_fetch import iter_prefetched, prefetch_window
 from src.application.services.sync_row_converters import (
     build_target_date_set as _build_target_date_set,
     latest_date as _latest_date,
@@ -366,44 +368,54 @@ async def sync_fundamentals_initial(
             ),
             fallback=decision.method == "bulk",
         )
-        for idx, code in enumerate(target_codes):
-            if ctx.cancelled.is_set():
-                return _fundamentals_result(
-                    api_calls=api_calls,
-                    updated=updated,
-                    dates_processed=0,
-                    errors=errors,
-                    cancelled=True,
-                )
-            if idx > 0 and idx % 100 == 0:
-                ctx.on_progress(
-                    "fundamentals",
-                    progress_current,
-                    progress_total,
-                    f"Fetching /fins/summary via REST: {idx}/{len(target_codes)} codes...",
-                )
-            try:
-                data, page_calls = await _fetch_fins_summary_by_code(ctx.client, code)
-                api_calls += page_calls
-                stage_api_calls += page_calls
-                if not data:
-                    empty_fetch_codes.add(code)
-                    continue
-                rows = validate_rows_required_fields(
-                    convert_fins_summary_rows(data, default_code=code),
-                    required_fields=("code", "statement_id", "disclosed_date"),
-                    dedupe_keys=("code", "statement_id"),
-                    stage="fundamentals",
-                )
-                rows = [row for row in rows if row.get("code") in allowed_statement_codes]
-                if rows:
-                    mutation = await sync_publish_helpers._publish_statement_rows(ctx, rows)
-                    updated += mutation.mutated_rows
-                else:
-                    empty_fetch_codes.add(code)
-            except Exception as e:
-                failed_codes.append(code)
-                errors.append(f"Fundamentals code {code}: {e}")
+        async with aclosing(
+            iter_prefetched(
+                target_codes,
+                lambda code: _fetch_fins_summary_by_code(ctx.client, code),
+                window=prefetch_window(ctx.client),
+                should_stop=ctx.cancelled.is_set,
+            )
+        ) as fetched:
+            idx = -1
+            async for code, fetch in fetched:
+                idx += 1
+                if ctx.cancelled.is_set():
+                    return _fundamentals_result(
+                        api_calls=api_calls,
+                        updated=updated,
+                        dates_processed=0,
+                        errors=errors,
+                        cancelled=True,
+                    )
+                if idx > 0 and idx % 100 == 0:
+                    ctx.on_progress(
+                        "fundamentals",
+                        progress_current,
+                        progress_total,
+                        f"Fetching /fins/summary via REST: {idx}/{len(target_codes)} codes...",
+                    )
+                try:
+                    data, page_calls = fetch.result()
+                    api_calls += page_calls
+                    stage_api_calls += page_calls
+                    if not data:
+                        empty_fetch_codes.add(code)
+                        continue
+                    rows = validate_rows_required_fields(
+                        convert_fins_summary_rows(data, default_code=code),
+                        required_fields=("code", "statement_id", "disclosed_date"),
+                        dedupe_keys=("code", "statement_id"),
+                        stage="fundamentals",
+                    )
+                    rows = [row for row in rows if row.get("code") in allowed_statement_codes]
+                    if rows:
+                        mutation = await sync_publish_helpers._publish_statement_rows(ctx, rows)
+                        updated += mutation.mutated_rows
+                    else:
+                        empty_fetch_codes.add(code)
+                except Exception as e:
+                    failed_codes.append(code)
+                    errors.append(f"Fundamentals code {code}: {e}")
         sync_fetch_planner._log_sync_fetch_execution(
             stage="fundamentals_initial",
             endpoint="/fins/summary",
@@ -827,51 +839,61 @@ async def _sync_fundamentals_backfill_codes(
             reason_detail=f"count={len(code_targets)}",
         )
 
-    for idx, code in enumerate(code_targets):
-        if ctx.cancelled.is_set():
-            return {
-                "api_calls": api_calls,
-                "updated": updated,
-                "errors": errors,
-                "failed_codes": failed_codes,
-                "empty_fetch_codes": empty_fetch_codes,
-                "cancelled": True,
-            }
-        if idx > 0 and idx % 100 == 0:
-            ctx.on_progress(
-                "fundamentals",
-                progress_current,
-                progress_total,
-                f"Fetching /fins/summary via REST: {idx}/{len(code_targets)} backfill codes...",
-            )
-        try:
-            data, page_calls = await _fetch_fins_summary_by_code(ctx.client, code)
-            api_calls += page_calls
-            if not data:
-                empty_fetch_codes.add(code)
-                continue
-            rows = convert_fins_summary_rows(data, default_code=code)
-            rows = [row for row in rows if row.get("code") in allowed_statement_codes]
-            rows = validate_rows_required_fields(
-                rows,
-                required_fields=("code", "statement_id", "disclosed_date"),
-                dedupe_keys=("code", "statement_id"),
-                stage="fundamentals",
-            )
-            if rows:
-                mutation = await sync_publish_helpers._publish_statement_rows(ctx, rows)
-                updated += mutation.mutated_rows
-            else:
-                empty_fetch_codes.add(code)
-        except Exception as e:
-            if sync_fetch_planner._is_bulk_rate_limited(e):
-                raise RuntimeError(
-                    f"fundamentals {target_unit} REST fetch was rate-limited after retries; "
-                    "refusing remaining requests to avoid request amplification. "
-                    "Retry after the shared J-Quants cooldown."
-                ) from e
-            failed_codes.append(code)
-            errors.append(f"Fundamentals code {code}: {e}")
+    async with aclosing(
+        iter_prefetched(
+            code_targets,
+            lambda code: _fetch_fins_summary_by_code(ctx.client, code),
+            window=prefetch_window(ctx.client),
+            should_stop=ctx.cancelled.is_set,
+        )
+    ) as fetched:
+        idx = -1
+        async for code, fetch in fetched:
+            idx += 1
+            if ctx.cancelled.is_set():
+                return {
+                    "api_calls": api_calls,
+                    "updated": updated,
+                    "errors": errors,
+                    "failed_codes": failed_codes,
+                    "empty_fetch_codes": empty_fetch_codes,
+                    "cancelled": True,
+                }
+            if idx > 0 and idx % 100 == 0:
+                ctx.on_progress(
+                    "fundamentals",
+                    progress_current,
+                    progress_total,
+                    f"Fetching /fins/summary via REST: {idx}/{len(code_targets)} backfill codes...",
+                )
+            try:
+                data, page_calls = fetch.result()
+                api_calls += page_calls
+                if not data:
+                    empty_fetch_codes.add(code)
+                    continue
+                rows = convert_fins_summary_rows(data, default_code=code)
+                rows = [row for row in rows if row.get("code") in allowed_statement_codes]
+                rows = validate_rows_required_fields(
+                    rows,
+                    required_fields=("code", "statement_id", "disclosed_date"),
+                    dedupe_keys=("code", "statement_id"),
+                    stage="fundamentals",
+                )
+                if rows:
+                    mutation = await sync_publish_helpers._publish_statement_rows(ctx, rows)
+                    updated += mutation.mutated_rows
+                else:
+                    empty_fetch_codes.add(code)
+            except Exception as e:
+                if sync_fetch_planner._is_bulk_rate_limited(e):
+                    raise RuntimeError(
+                        f"fundamentals {target_unit} REST fetch was rate-limited after retries; "
+                        "refusing remaining requests to avoid request amplification. "
+                        "Retry after the shared J-Quants cooldown."
+                    ) from e
+                failed_codes.append(code)
+                errors.append(f"Fundamentals code {code}: {e}")
 
     if code_targets:
         sync_fetch_planner._log_sync_fetch_execution(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextlib import aclosing
 from dataclasses import dataclass
 from typing import Any, Iterable
 
@@ -11,7 +12,11 @@ from src.application.services import sync_fetch_planner, sync_publish_helpers
 from src.application.services.ingestion_pipeline import validate_rows_required_fields
 from src.application.services.jquants_bulk_service import BulkFetchResult, BulkFileInfo
 from src.application.services.options_225 import OPTIONS_225_SYNTHETIC_INDEX_CODE
-from src.application.services.sync_paginated_fetch import get_paginated_rows_with_call_count
+from src.application.services.sync_paginated_fetch import (
+    get_paginated_rows_with_call_count,
+    iter_prefetched,
+    prefetch_window,
+)
 from src.application.services.sync_index_master_backfill import (
     upsert_indices_rows_with_master_backfill,
 )
@@ -278,48 +283,64 @@ async def sync_incremental_indices_rest(
 ) -> IndicesSyncStageOutcome:
     api_calls = 0
     errors: list[str] = []
-    for code_idx, code in enumerate(target_codes, start=1):
-        if ctx.cancelled.is_set():
-            return IndicesSyncStageOutcome(api_calls=api_calls, errors=errors, cancelled=True)
-        if code_idx > 1 and code_idx % 50 == 0:
-            ctx.on_progress(
-                "indices",
-                progress_current,
-                progress_total,
-                f"Fetching /indices/bars/daily via REST: {code_idx}/{len(target_codes)} codes...",
-            )
 
+    def _last_index_date(code: str) -> str | None:
+        return latest_index_dates.get(_normalize_index_code(code))
+
+    async def _fetch_code(code: str) -> tuple[list[dict[str, Any]], int]:
         params: dict[str, Any] = {"code": code}
-        normalized_code = _normalize_index_code(code)
-        last_index_date = latest_index_dates.get(normalized_code)
+        last_index_date = _last_index_date(code)
         if last_index_date:
             params["from"] = to_jquants_date_param(last_index_date)
+        return await get_paginated_rows_with_call_count(
+            ctx.client,
+            "/indices/bars/daily",
+            params=params,
+        )
 
-        try:
-            data, page_calls = await get_paginated_rows_with_call_count(
-                ctx.client,
-                "/indices/bars/daily",
-                params=params,
-            )
-            api_calls += page_calls
-            rows = validate_rows_required_fields(
-                convert_indices_data_rows(data, code),
-                required_fields=("code", "date"),
-                dedupe_keys=("code", "date"),
-                stage="indices_data",
-            )
-            if last_index_date:
-                rows = [r for r in rows if _is_date_after(r["date"], last_index_date)]
-            if rows:
-                await upsert_indices_rows_with_master_backfill(
-                    ctx,
-                    rows,
-                    known_master_codes,
-                    discovery_log="Inserted {} discovered index master rows while syncing by code.",
+    async with aclosing(
+        iter_prefetched(
+            target_codes,
+            _fetch_code,
+            window=prefetch_window(ctx.client),
+            should_stop=ctx.cancelled.is_set,
+        )
+    ) as fetched:
+        code_idx = 0
+        async for code, fetch in fetched:
+            code_idx += 1
+            if ctx.cancelled.is_set():
+                return IndicesSyncStageOutcome(api_calls=api_calls, errors=errors, cancelled=True)
+            if code_idx > 1 and code_idx % 50 == 0:
+                ctx.on_progress(
+                    "indices",
+                    progress_current,
+                    progress_total,
+                    f"Fetching /indices/bars/daily via REST: {code_idx}/{len(target_codes)} codes...",
                 )
-        except Exception as e:
-            errors.append(f"Index {code}: {e}")
-            logger.warning(f"Index {code} incremental sync error: {e}")
+
+            last_index_date = _last_index_date(code)
+            try:
+                data, page_calls = fetch.result()
+                api_calls += page_calls
+                rows = validate_rows_required_fields(
+                    convert_indices_data_rows(data, code),
+                    required_fields=("code", "date"),
+                    dedupe_keys=("code", "date"),
+                    stage="indices_data",
+                )
+                if last_index_date:
+                    rows = [r for r in rows if _is_date_after(r["date"], last_index_date)]
+                if rows:
+                    await upsert_indices_rows_with_master_backfill(
+                        ctx,
+                        rows,
+                        known_master_codes,
+                        discovery_log="Inserted {} discovered index master rows while syncing by code.",
+                    )
+            except Exception as e:
+                errors.append(f"Index {code}: {e}")
+                logger.warning(f"Index {code} incremental sync error: {e}")
 
     for date_idx, index_date in enumerate(fallback_dates, start=1):
         if ctx.cancelled.is_set():
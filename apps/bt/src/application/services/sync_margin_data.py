@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import aclosing
 from dataclasses import dataclass, replace
 from typing import Any
 
@@ -20,7 +21,11 @@ from src.application.services.sync_row_converters import (
     convert_margin_rows as _convert_margin_rows,
     to_jquants_date_param as _to_jquants_date_param,
 )
-from src.application.services.sync_paginated_fetch import get_paginated_rows_with_call_count
+from src.application.services.sync_paginated_fetch import (
+    get_paginated_rows_with_call_count,
+    iter_prefetched,
+    prefetch_window,
+)
 from src.infrastructure.db.market.market_db import METADATA_KEYS
 from src.infrastructure.db.market.query_helpers import expand_stock_code, normalize_stock_code, stock_code_candidates
 
@@ -348,31 +353,41 @@ async def _sync_margin_rest_codes(
         fallback=used_rest_fallback,
         fallback_reason=fallback_reason,
     )
-    for idx, code in enumerate(codes, start=1):
-        if ctx.cancelled.is_set():
-            result.cancelled = True
-            return result
-        if idx > 1 and idx % 100 == 0:
-            ctx.on_progress(
-                "margin",
-                progress_current,
-                progress_total,
-                f"Fetching /markets/margin-interest via REST: {idx}/{len(codes)} codes...",
-            )
-        try:
-            data, page_calls = await _fetch_margin_by_code(ctx.client, code, date_from=anchor)
-            result.api_calls += page_calls
-            rows = validate_rows_required_fields(
-                _convert_margin_rows(data, default_code=code, min_date_exclusive=anchor),
-                required_fields=("code", "date"),
-                dedupe_keys=("code", "date"),
-                stage="margin_data",
-            )
-            if rows:
-                mutation = await sync_publish_helpers._publish_margin_rows(ctx, rows)
-                result.updated += mutation.mutated_rows
-        except Exception as e:
-            result.error_list().append(f"Margin code {code}: {e}")
+    async with aclosing(
+        iter_prefetched(
+            codes,
+            lambda code: _fetch_margin_by_code(ctx.client, code, date_from=anchor),
+            window=prefetch_window(ctx.client),
+            should_stop=ctx.cancelled.is_set,
+        )
+    ) as fetched:
+        idx = 0
+        async for code, fetch in fetched:
+            idx += 1
+            if ctx.cancelled.is_set():
+                result.cancelled = True
+                return result
+            if idx > 1 and idx % 100 == 0:
+                ctx.on_progress(
+                    "margin",
+                    progress_current,
+                    progress_total,
+                    f"Fetching /markets/margin-interest via REST: {idx}/{len(codes)} codes...",
+                )
+            try:
+                data, page_calls = fetch.result()
+                result.api_calls += page_calls
+                rows = validate_rows_required_fields(
+                    _convert_margin_rows(data, default_code=code, min_date_exclusive=anchor),
+                    required_fields=("code", "date"),
+                    dedupe_keys=("code", "date"),
+                    stage="margin_data",
+                )
+                if rows:
+                    mutation = await sync_publish_helpers._publish_margin_rows(ctx, rows)
+                    result.updated += mutation.mutated_rows
+            except Exception as e:
+                result.error_list().append(f"Margin code {code}: {e}")
 
     sync_fetch_planner._log_sync_fetch_execution(
         stage=stage_name,
@@ -409,36 +424,46 @@ async def _sync_margin_backfill_codes(
         method="rest",
         target_label=_format_target_label(len(codes), "backfill codes", skipped_empty=len(skipped_empty_codes)),
     )
-    for idx, code in enumerate(codes, start=1):
-        if ctx.cancelled.is_set():
-            result.cancelled = True
-            return result
-        if idx > 1 and idx % 100 == 0:
-            ctx.on_progress(
-                "margin",
-                progress_current,
-                progress_total,
-                f"Fetching /markets/margin-interest via REST: {idx}/{len(codes)} backfill codes...",
-            )
-        try:
-            data, page_calls = await _fetch_margin_by_code(ctx.client, code)
-            result.api_calls += page_calls
-            if not data:
-                result.empty_codes().add(code)
-                continue
-            rows = validate_rows_required_fields(
-                _convert_margin_rows(data, default_code=code),
-                required_fields=("code", "date"),
-                dedupe_keys=("code", "date"),
-                stage="margin_data",
-            )
-            if rows:
-                mutation = await sync_publish_helpers._publish_margin_rows(ctx, rows)
-                result.updated += mutation.mutated_rows
-            else:
-                result.empty_codes().add(code)
-        except Exception as e:
-            result.error_list().append(f"Margin backfill code {code}: {e}")
+    async with aclosing(
+        iter_prefetched(
+            codes,
+            lambda code: _fetch_margin_by_code(ctx.client, code),
+            window=prefetch_window(ctx.client),
+            should_stop=ctx.cancelled.is_set,
+        )
+    ) as fetched:
+        idx = 0
+        async for code, fetch in fetched:
+            idx += 1
+            if ctx.cancelled.is_set():
+                result.cancelled = True
+                return result
+            if idx > 1 and idx % 100 == 0:
+                ctx.on_progress(
+                    "margin",
+                    progress_current,
+                    progress_total,
+                    f"Fetching /markets/margin-interest via REST: {idx}/{len(codes)} backfill codes...",
+                )
+            try:
+                data, page_calls = fetch.result()
+                result.api_calls += page_calls
+                if not data:
+                    result.empty_codes().add(code)
+                    continue
+                rows = validate_rows_required_fields(
+                    _convert_margin_rows(data, default_code=code),
+                    required_fields=("code", "date"),
+                    dedupe_keys=("code", "date"),
+                    stage="margin_data",
+                )
+                if rows:
+                    mutation = await sync_publish_helpers._publish_margin_rows(ctx, rows)
+                    result.updated += mutation.mutated_rows
+                else:
+                    result.empty_codes().add(code)
+            except Exception as e:
+                result.error_list().append(f"Margin backfill code {code}: {e}")
 
     sync_fetch_planner._log_sync_fetch_execution(
         stage=f"{stage_name}_backfill",
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
-from typing import Any, cast
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from typing import Any, TypeVar, cast
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
 
 
 async def get_paginated_rows_with_call_count(
@@ -22,3 +27,56 @@ async def get_paginated_rows_with_call_count(
         return rows, int(calls)
     rows = await client.get_paginated(path, params=params)
     return rows, 1
+
+
+def prefetch_window(client: Any) -> int:
+    """Number of per-target fetches a sync stage may keep in flight for ``client``."""
+    try:
+        return max(int(getattr(client, "max_concurrency", 1)), 1)
+    except (TypeError, ValueError):
+        return 1
+
+
+async def iter_prefetched(
+    items: Iterable[_T],
+    fetch: Callable[[_T], Awaitable[_R]],
+    *,
+    window: int,
+    should_stop: Callable[[], bool] | None = None,
+) -> AsyncGenerator[tuple[_T, asyncio.Future[_R]], None]:
+    """Yield ``(item, finished fetch)`` in item order with up to ``window`` fetches ahead.
+
+    Fetch errors stay on the yielded future so callers keep their per-item error
+    handling (``future.result()`` re-raises). Once ``should_stop`` returns true no
+    new fetch is started: remaining items are yielded with cancelled futures so
+    the caller's own cancellation check still runs. Fetches pending when the
+    iterator is closed are cancelled; wrap it in ``contextlib.aclosing``.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = iter(items)
+    pending: deque[tuple[_T, asyncio.Future[_R]]] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < max(window, 1):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                if should_stop is not None and should_stop():
+                    skipped: asyncio.Future[_R] = loop.create_future()
+                    skipped.cancel()
+                    pending.append((item, skipped))
+                    continue
+                pending.append((item, asyncio.ensure_future(fetch(item))))
+            if not pending:
+                return
+            item, future = pending.popleft()
+            await asyncio.wait([future])
+            yield item, future
+    finally:
+        for _item, future in pending:
+            future.cancel()
+            # Consume late failures so abandoned fetches do not log as unretrieved.
+            future.add_done_callback(lambda done: done.cancelled() or done.exception())
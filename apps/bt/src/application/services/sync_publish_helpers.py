@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, TypeVar
 
+import pandas as pd
+
 from src.application.services.options_225 import (
     OPTIONS_225_SYNTHETIC_INDEX_CATEGORY,
     OPTIONS_225_SYNTHETIC_INDEX_CODE,
@@ -17,6 +20,7 @@ from src.application.services.options_225 import (
 )
 from src.application.services.sync_state_helpers import _require_time_series_store
 from src.infrastructure.db.market.market_mutations import SemanticDeltaResult
+from src.shared.observability.metrics import metrics_recorder
 from src.shared.provider_stock_window import ProviderStockStage
 
 
@@ -38,6 +42,17 @@ async def _to_thread_joined(function: Callable[..., _T], /, *args: Any, **kwargs
     return result
 
 
+def _timed_publish(table: str, function: Callable[..., _T]) -> Callable[..., _T]:
+    """Wrap a store write so its worker-thread duration lands in stage metrics."""
+
+    @functools.wraps(function)
+    def run(*args: Any, **kwargs: Any) -> _T:
+        with metrics_recorder.stage_timer("sync", f"db_publish.{table}"):
+            return function(*args, **kwargs)
+
+    return run
+
+
 @dataclass(frozen=True, slots=True)
 class StockDataStageResult:
     staged_rows: int
@@ -76,7 +91,7 @@ async def _publish_topix_rows(ctx: Any, rows: list[dict[str, Any]]) -> SemanticD
     if not rows:
         return SemanticDeltaResult.empty()
     store = _require_time_series_store(ctx)
-    return await asyncio.to_thread(store.publish_topix_data, rows)
+    return await asyncio.to_thread(_timed_publish("topix_data", store.publish_topix_data), rows)
 
 
 async def _publish_stock_data_rows(
@@ -84,7 +99,7 @@ async def _publish_stock_data_rows(
 ) -> SemanticDeltaResult:
     store = _require_time_series_store(ctx)
     return await asyncio.to_thread(
-        store.publish_stock_data,
+        _timed_publish("stock_data", store.publish_stock_data),
         rows,
         stage=stage,
         **_initial_load_kwargs(ctx),
@@ -105,19 +120,40 @@ async def _stage_stock_data_rows(
         if detect_provider_drift
         else frozenset()
     )
-    await _to_thread_joined(store.stage_stock_data_rows, rows)
+    await _to_thread_joined(_timed_publish("stock_data_stage", store.stage_stock_data_rows), rows)
     return StockDataStageResult(
         staged_rows=len(rows),
         affected_codes=frozenset(affected_codes),
     )
 
 
+async def _stage_stock_data_frame(
+    ctx: Any,
+    frame: pd.DataFrame,
+    *,
+    detect_provider_drift: bool = True,
+) -> StockDataStageResult:
+    if frame.empty:
+        return StockDataStageResult(staged_rows=0, affected_codes=frozenset())
+    store = _require_time_series_store(ctx)
+    affected_codes = (
+        await asyncio.to_thread(store.detect_stock_provider_drift_frame, frame)
+        if detect_provider_drift
+        else frozenset()
+    )
+    await _to_thread_joined(_timed_publish("stock_data_stage", store.stage_stock_data_frame), frame)
+    return StockDataStageResult(
+        staged_rows=len(frame),
+        affected_codes=frozenset(affected_codes),
+    )
+
+
 async def _flush_staged_stock_data_rows(
     ctx: Any, *, stage: ProviderStockStage, exclude_codes: frozenset[str]
 ) -> SemanticDeltaResult:
     store = _require_time_series_store(ctx)
     return await _to_thread_joined(
-        store.flush_staged_stock_data,
+        _timed_publish("stock_data_flush", store.flush_staged_stock_data),
         stage=stage,
         exclude_codes=exclude_codes,
         **_initial_load_kwargs(ctx),
@@ -134,7 +170,7 @@ async def _publish_indices_rows(ctx: Any, rows: list[dict[str, Any]]) -> Semanti
         return SemanticDeltaResult.empty()
     store = _require_time_series_store(ctx)
     return await asyncio.to_thread(
-        store.publish_indices_data,
+        _timed_publish("indices_data", store.publish_indices_data),
         rows,
         **_initial_load_kwargs(ctx),
     )
@@ -145,7 +181,7 @@ async def _publish_options_225_rows(ctx: Any, rows: list[dict[str, Any]]) -> Sem
         return SemanticDeltaResult.empty()
     store = _require_time_series_store(ctx)
     return await asyncio.to_thread(
-        store.publish_options_225_data,
+        _timed_publish("options_225_data", store.publish_options_225_data),
         rows,
         **_initial_load_kwargs(ctx),
     )
@@ -156,7 +192,7 @@ async def _publish_margin_rows(ctx: Any, rows: list[dict[str, Any]]) -> Semantic
         return SemanticDeltaResult.empty()
     store = _require_time_series_store(ctx)
     return await asyncio.to_thread(
-        store.publish_margin_data,
+        _timed_publish("margin_data", store.publish_margin_data),
         rows,
         **_initial_load_kwargs(ctx),
     )
@@ -167,7 +203,7 @@ async def _publish_statement_rows(ctx: Any, rows: list[dict[str, Any]]) -> Seman
         return SemanticDeltaResult.empty()
     store = _require_time_series_store(ctx)
     mutation = await asyncio.to_thread(
-        store.publish_statements,
+        _timed_publish("statements", store.publish_statements),
         rows,
         **_initial_load_kwargs(ctx),
     )
@@ -324,5 +360,6 @@ __all__ = [
     "_publish_stock_data_rows",
     "_publish_synthetic_nikkei_rows",
     "_publish_topix_rows",
+    "_stage_stock_data_frame",
     "_stage_stock_data_rows",
 ]
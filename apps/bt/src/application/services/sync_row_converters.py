@@ -7,13 +7,16 @@ import re
 from datetime import UTC, date, datetime
 from typing import Any
 
+import pandas as pd
 from loguru import logger
 
 from src.application.services.options_225 import normalize_options_225_raw_row
 from src.application.services.stock_data_row_builder import (
+    build_stock_data_frame,
     build_stock_data_row,
     is_provider_no_trade_row,
 )
+from src.application.services.stock_minute_data_row_builder import _map_unique
 from src.infrastructure.db.market.query_helpers import normalize_stock_code
 
 _BULK_STOCK_KEY_ALIASES: dict[str, str] = {
@@ -210,10 +213,41 @@ def _normalize_bulk_row_keys(
     return normalized_rows
 
 
+def _normalize_bulk_frame_columns(
+    frame: pd.DataFrame,
+    aliases: dict[str, str],
+) -> pd.DataFrame:
+    """``_normalize_bulk_row_keys`` の列単位版。"""
+    remap: dict[str, str] = {}
+    for raw_key in frame.columns:
+        target = aliases.get(_canonicalize_key(str(raw_key)))
+        if target and target != raw_key:
+            remap[str(raw_key)] = target
+    if not remap:
+        return frame
+
+    normalized = frame.copy()
+    for raw_key, target in remap.items():
+        raw_values = frame[raw_key]
+        if target not in normalized.columns:
+            normalized[target] = raw_values
+            continue
+        current = normalized[target]
+        keep_current = (
+            current.notna() & (current.astype(str).str.strip() != "")
+        ) | raw_values.isna()
+        normalized[target] = current.where(keep_current, raw_values)
+    return normalized
+
+
 def normalize_bulk_stock_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return _normalize_bulk_row_keys(rows, _BULK_STOCK_KEY_ALIASES)
 
 
+def normalize_bulk_stock_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    return _normalize_bulk_frame_columns(frame, _BULK_STOCK_KEY_ALIASES)
+
+
 def normalize_bulk_indices_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return _normalize_bulk_row_keys(rows, _BULK_INDEX_KEY_ALIASES)
 
@@ -403,6 +437,68 @@ def convert_stock_bulk_rows(
     return rows
 
 
+def _sample_codes(codes: pd.Series) -> list[str]:
+    return [str(code) for code in codes.dropna().unique()[:5]]
+
+
+def convert_stock_bulk_frame(
+    data: pd.DataFrame,
+    *,
+    target_dates: set[str] | None,
+    incomplete_dates: set[str] | None = None,
+    allow_raw_only: bool = False,
+) -> pd.DataFrame:
+    """``convert_stock_bulk_rows`` の列単位版 (bulk CSV の日足バッチ向け)。"""
+    quotes = normalize_bulk_stock_frame(data)
+    if quotes.empty or "Code" not in quotes.columns:
+        return build_stock_data_frame(quotes.iloc[0:0]).frame
+    codes = _map_unique(
+        quotes["Code"],
+        lambda value: normalize_stock_code(str(value)) or None,
+    )
+    quotes = quotes.loc[codes.notna()]
+    codes = codes.loc[quotes.index]
+    date_values = quotes["Date"] if "Date" in quotes.columns else pd.Series(
+        None, index=quotes.index, dtype=object
+    )
+    dates = _map_unique(date_values, _normalize_iso_date_text)
+    invalid_date = dates.isna()
+    in_target = ~invalid_date
+    if target_dates is not None:
+        in_target &= dates.isin(target_dates)
+
+    candidates = quotes.loc[in_target].assign(Date=dates.loc[in_target])
+    batch = build_stock_data_frame(
+        candidates,
+        created_at=datetime.now(UTC).isoformat(),
+        require_adjusted=not allow_raw_only,
+    )
+    incomplete = batch.incomplete
+    if incomplete.any():
+        if incomplete_dates is None:
+            first = incomplete.idxmax()
+            raise ValueError(
+                "incomplete provider daily row requires retry or full refresh: "
+                f"{codes.loc[first]} {dates.loc[first]}"
+            )
+        incomplete_dates.update(dates.loc[incomplete[incomplete].index])
+
+    skipped = invalid_date.copy()
+    skipped.loc[batch.rejected.index] = batch.rejected
+    skipped_count = int(skipped.sum())
+    if skipped_count > 0:
+        sample_codes = _sample_codes(codes.loc[skipped])
+        sample = ", ".join(sample_codes) if sample_codes else "unknown"
+        logger.warning(
+            "Skipped {} daily quotes with incomplete OHLCV data (sample codes: {})",
+            skipped_count,
+            sample,
+        )
+    return batch.frame.drop_duplicates(["code", "date"], keep="first").reset_index(
+        drop=True
+    )
+
+
 def build_target_date_set(dates: list[str]) -> set[str] | None:
     normalized = {
         date_text
@@ -495,37 +591,39 @@ def convert_options_225_rows(data: list[dict[str, Any]]) -> list[dict[str, Any]]
     return [normalize_options_225_raw_row(item, created_at=created_at) for item in data]
 
 
-def convert_stock_data_rows(data: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """JQuants 株価データ -> DB 行"""
-    rows: list[dict[str, Any]] = []
-    skipped = 0
-    sample_codes: list[str] = []
-    created_at = datetime.now(UTC).isoformat()
-
-    for d in data:
-        row = build_stock_data_row(d, created_at=created_at)
-        if row is None:
-            code = normalize_stock_code(d.get("Code", ""))
-            date_text = _normalize_iso_date_text(d.get("Date"))
-            if code and date_text and not is_provider_no_trade_row(d):
-                raise ValueError(
-                    "incomplete provider daily row requires retry or full refresh: "
-                    f"{code} {date_text}"
-                )
-            skipped += 1
-            if code and code not in sample_codes and len(sample_codes) < 5:
-                sample_codes.append(code)
-            continue
-        rows.append(row)
-
-    if skipped > 0:
+def convert_stock_data_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """JQuants 株価データ (日付指定 REST の全銘柄日足) -> DB 行フレーム"""
+    batch = build_stock_data_frame(data, created_at=datetime.now(UTC).isoformat())
+    rejected = batch.rejected
+    if rejected.any():
+        rejected_quotes = data.loc[rejected]
+        codes = _map_unique(
+            rejected_quotes["Code"]
+            if "Code" in rejected_quotes.columns
+            else pd.Series(None, index=rejected_quotes.index, dtype=object),
+            lambda value: normalize_stock_code(str(value)) or None,
+        )
+        dates = _map_unique(
+            rejected_quotes["Date"]
+            if "Date" in rejected_quotes.columns
+            else pd.Series(None, index=rejected_quotes.index, dtype=object),
+            _normalize_iso_date_text,
+        )
+        retry_required = batch.incomplete.loc[rejected] & codes.notna() & dates.notna()
+        if retry_required.any():
+            first = retry_required.idxmax()
+            raise ValueError(
+                "incomplete provider daily row requires retry or full refresh: "
+                f"{codes.loc[first]} {dates.loc[first]}"
+            )
+        sample_codes = _sample_codes(codes)
         sample = ", ".join(sample_codes) if sample_codes else "unknown"
         logger.warning(
             "Skipped {} daily quotes with incomplete OHLCV data (sample codes: {})",
-            skipped,
+            int(rejected.sum()),
             sample,
         )
-    return rows
+    return batch.frame
 
 
 def extract_list_items(
@@ -27,6 +27,7 @@ from src.application.services.market_maintenance_finalizer import (
     MarketMaintenanceFinalizer,
     finalize_market_operation_joined,
 )
+from src.infrastructure.external_api.clients.rate_limiter import request_priority
 from src.infrastructure.db.market.market_db import (
     PROVIDER_STOCK_PRICE_ADJUSTMENT_MODE,
     MARKET_SCHEMA_VERSION,
@@ -58,6 +59,7 @@ class SyncServiceMarketDbLike(SyncMarketDbLike, Protocol):
     def is_legacy_stock_price_snapshot(self) -> bool: ...
     def get_market_schema_version(self) -> int | None: ...
     def is_market_schema_current(self) -> bool: ...
+    def rebuild_stock_latest_quotes_from_stock_data(self) -> Any: ...
     def rebuild_daily_technical_metrics_from_stock_data(self) -> Any: ...
     def materialize_daily_valuation(
         self,
@@ -376,6 +378,24 @@ async def start_sync(
                         ),
                     )
                 if _requires_daily_technical_metrics_rebuild(mode, operation_result):
+                    on_progress(
+                        "stock_latest_quotes",
+                        0,
+                        1,
+                        "Materializing latest quotes from stock_data...",
+                    )
+                    latest_quote_result = await asyncio.to_thread(
+                        current_market_db.rebuild_stock_latest_quotes_from_stock_data
+                    )
+                    on_progress(
+                        "stock_latest_quotes",
+                        1,
+                        1,
+                        (
+                            "Latest quote materialization complete "
+                            f"({latest_quote_result.final_count} rows)."
+                        ),
+                    )
                     on_progress(
                         "daily_technical_metrics",
                         0,
@@ -490,7 +510,9 @@ async def start_sync(
         if propagate_cancel:
             raise asyncio.CancelledError
 
-    task = asyncio.create_task(_run())
+    # 同期の J-Quants 呼び出しはバルク優先度にし、プロキシ等の対話的な呼び出しを先に通す
+    with request_priority("bulk"):
+        task = asyncio.create_task(_run())
     job.task = task
 
     return job
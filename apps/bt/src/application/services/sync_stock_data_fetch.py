@@ -7,10 +7,11 @@ from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field, replace
 from typing import Any, TypeVar, cast
 
+import pandas as pd
 from loguru import logger
 
 from src.application.services import sync_fetch_planner, sync_publish_helpers
-from src.application.services.ingestion_pipeline import run_ingestion_batch, validate_rows_required_fields
+from src.application.services.ingestion_pipeline import run_ingestion_batch, validate_frame_required_fields
 from src.application.services.jquants_bulk_service import BulkFetchResult, BulkFileInfo
 from src.application.services.sync_paginated_fetch import get_paginated_rows_with_call_count
 from src.application.services.sync_row_converters import build_target_date_set
@@ -18,9 +19,9 @@ from src.application.services.stock_refresh_service import refresh_stocks
 from src.infrastructure.db.market.market_mutations import SemanticDeltaResult
 from src.infrastructure.db.market.query_helpers import normalize_stock_code
 from src.shared.provider_stock_window import ProviderStockStage
-from src.application.services.sync_row_converters import convert_stock_data_rows as _convert_stock_data_rows
 from src.application.services.sync_row_converters import (
-    convert_stock_bulk_rows as _convert_stock_bulk_rows,
+    convert_stock_bulk_frame as _convert_stock_bulk_frame,
+    convert_stock_data_frame as _convert_stock_data_frame,
 )
 
 
@@ -102,6 +103,24 @@ class StockDataIngestionSession:
         self.affected_codes.update(result.affected_codes)
         self.staged_rows += result.staged_rows
 
+    async def stage_frame(
+        self,
+        ctx: Any,
+        frame: pd.DataFrame,
+        *,
+        detect_provider_drift: bool = True,
+    ) -> None:
+        """Columnar variant of :meth:`stage` for full-market daily batches."""
+        if self._finalized:
+            raise RuntimeError("Stock data ingestion session is already finalized")
+        result = await sync_publish_helpers._stage_stock_data_frame(
+            ctx,
+            frame,
+            detect_provider_drift=detect_provider_drift,
+        )
+        self.affected_codes.update(result.affected_codes)
+        self.staged_rows += result.staged_rows
+
     async def flush(self, ctx: Any, *, stage: ProviderStockStage) -> None:
         """Commit one initial-sync bulk file while keeping the session open."""
         if self._finalized:
@@ -350,8 +369,8 @@ async def execute_stock_data_bulk_fetch(
         target_date_set = build_target_date_set(target_dates)
         bulk_service = sync_fetch_planner._get_bulk_service(ctx)
 
-        async def _consume_stock_bulk_rows(
-            batch_rows: list[dict[str, Any]],
+        async def _consume_stock_bulk_frame(
+            batch_frame: pd.DataFrame,
             file_info: BulkFileInfo | None,
         ) -> None:
             nonlocal active_file_key, active_file_dates
@@ -364,17 +383,17 @@ async def execute_stock_data_bulk_fetch(
                 await session.flush(ctx, stage=flush_stage)
                 completed_dates.update(active_file_dates)
                 active_file_dates = set()
-            rows = _convert_stock_bulk_rows(
-                batch_rows,
+            frame = _convert_stock_bulk_frame(
+                batch_frame,
                 target_dates=target_date_set,
                 incomplete_dates=set(),
                 allow_raw_only=True,
             )
-            rows = _filter_provider_stock_rows(rows, provider_codes)
-            active_file_dates.update(str(row["date"]) for row in rows)
-            await session.stage(
+            frame = _filter_provider_stock_frame(frame, provider_codes)
+            active_file_dates.update(frame["date"].unique())
+            await session.stage_frame(
                 ctx,
-                rows,
+                frame,
                 detect_provider_drift=(
                     flush_stage is None
                     and not bool(getattr(ctx, "initial_load", False))
@@ -384,7 +403,7 @@ async def execute_stock_data_bulk_fetch(
 
         bulk_result = await bulk_service.fetch_with_plan(
             decision.plan,
-            on_rows_batch=_consume_stock_bulk_rows,
+            on_frame_batch=_consume_stock_bulk_frame,
             accumulate_rows=False,
         )
         if flush_stage is not None and active_file_key is not None:
@@ -442,30 +461,28 @@ async def execute_stock_data_rest_date(
         params={"date": date},
     )
 
-    async def _prefetched_stock_rows() -> list[dict[str, Any]]:
-        return payload
+    async def _prefetched_stock_frame() -> pd.DataFrame:
+        return pd.DataFrame.from_records(payload)
 
-    async def _stage_stock_rows(
-        rows: list[dict[str, Any]],
-    ) -> SemanticDeltaResult:
-        await session.stage(ctx, rows)
-        return SemanticDeltaResult.empty(input_count=len(rows))
+    async def _stage_stock_frame(frame: pd.DataFrame) -> SemanticDeltaResult:
+        await session.stage_frame(ctx, frame)
+        return SemanticDeltaResult.empty(input_count=len(frame))
 
     try:
         batch = await run_ingestion_batch(
             stage="stock_data",
-            fetch=_prefetched_stock_rows,
-            normalize=lambda rows: _filter_provider_stock_rows(
-                _convert_stock_data_rows(rows),
+            fetch=_prefetched_stock_frame,
+            normalize=lambda frame: _filter_provider_stock_frame(
+                _convert_stock_data_frame(frame),
                 provider_codes,
             ),
-            validate=lambda rows: validate_rows_required_fields(
-                rows,
+            validate=lambda frame: validate_frame_required_fields(
+                frame,
                 required_fields=("code", "date", "open", "high", "low", "close", "volume"),
                 dedupe_keys=("code", "date"),
                 stage="stock_data",
             ),
-            publish=_stage_stock_rows,
+            publish=_stage_stock_frame,
         )
     except Exception as exc:
         raise StockDataRestDateIngestionError(exc, api_calls=page_calls) from exc
@@ -476,15 +493,16 @@ async def execute_stock_data_rest_date(
     )
 
 
-def _filter_provider_stock_rows(
-    rows: list[dict[str, Any]],
+def _filter_provider_stock_frame(
+    frame: pd.DataFrame,
     provider_codes: frozenset[str],
-) -> list[dict[str, Any]]:
+) -> pd.DataFrame:
     normalized_provider_codes = {
         normalize_stock_code(code) for code in provider_codes
     }
-    return [
-        row
-        for row in rows
-        if normalize_stock_code(str(row.get("code", ""))) in normalized_provider_codes
-    ]
+    codes = frame["code"].astype(str)
+    in_provider = {
+        code: normalize_stock_code(code) in normalized_provider_codes
+        for code in codes.unique()
+    }
+    return frame.loc[codes.map(in_provider).astype(bool)]
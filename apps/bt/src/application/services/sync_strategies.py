@@ -12,6 +12,7 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Awaitable, Callable, Iterable, Protocol, cast
 
+import pandas as pd
 from loguru import logger
 
 from src.application.services.jquants_bulk_service import (
@@ -208,6 +209,7 @@ class SyncTimeSeriesStoreLike(Protocol):  # pragma: no cover
     def detect_stock_provider_drift(
         self, rows: list[dict[str, Any]]
     ) -> frozenset[str]: ...
+    def detect_stock_provider_drift_frame(self, frame: pd.DataFrame) -> frozenset[str]: ...
     def publish_indices_data(
         self, rows: list[dict[str, Any]], *, initial_load: bool = False
     ) -> SemanticDeltaResult: ...
@@ -221,6 +223,7 @@ class SyncTimeSeriesStoreLike(Protocol):  # pragma: no cover
         self, rows: list[dict[str, Any]], *, initial_load: bool = False
     ) -> SemanticDeltaResult: ...
     def stage_stock_data_rows(self, rows: list[dict[str, Any]]) -> SemanticDeltaResult: ...
+    def stage_stock_data_frame(self, frame: pd.DataFrame) -> SemanticDeltaResult: ...
     def flush_staged_stock_data(
         self,
         *,
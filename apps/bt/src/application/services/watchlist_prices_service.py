@@ -7,9 +7,10 @@ Watchlist Prices Service
 from __future__ import annotations
 
 from src.application.contracts import watchlist_prices as watchlist_prices_contracts
-from src.infrastructure.db.market.query_helpers import stock_code_candidates
+from src.infrastructure.db.market.latest_quote_queries import fetch_latest_quotes
 from src.infrastructure.db.market.market_reader import MarketDbReader
 from src.infrastructure.db.market.portfolio_db import PortfolioDb
+from src.infrastructure.db.market.query_helpers import normalize_stock_code
 
 
 class WatchlistPricesService:
@@ -31,53 +32,27 @@ class WatchlistPricesService:
         if not items:
             return watchlist_prices_contracts.WatchlistPricesResponse(prices=[])
 
+        # 全銘柄の最新2営業日を1クエリで取得（同日の4桁/5桁重複は4桁優先）
+        quotes = fetch_latest_quotes(self._reader, [item.code for item in items])
+
         prices: list[watchlist_prices_contracts.WatchlistStockPrice] = []
         for item in items:
             code4 = item.code
-            candidates = stock_code_candidates(code4)
-            placeholders = ",".join("?" for _ in candidates)
-            rows = self._reader.query(
-                f"""
-                SELECT date, close, volume
-                FROM stock_data
-                WHERE code IN ({placeholders})
-                ORDER BY date DESC, CASE WHEN length(code) = 4 THEN 0 ELSE 1 END
-                """,
-                tuple(candidates),
-            )
-
-            # 同日の4桁/5桁重複がある場合は先頭（4桁優先）を採用
-            entries: list[tuple[str, float, float]] = []
-            seen_dates: set[str] = set()
-            for row in rows:
-                d = row["date"]
-                if d in seen_dates:
-                    continue
-                seen_dates.add(d)
-                entries.append((d, row["close"], row["volume"]))
-                if len(entries) >= 2:
-                    break
-
-            if not entries:
+            quote = quotes.get(normalize_stock_code(code4))
+            if quote is None:
                 continue
-            latest = entries[0]
-            close = latest[1]
-            volume = latest[2]
-            date = latest[0]
-            prev_close: float | None = None
+            prev_close = quote.prev_close
             change_percent: float | None = None
-            if len(entries) >= 2:
-                prev_close = entries[1][1]
-                if prev_close and prev_close > 0:
-                    change_percent = round((close - prev_close) / prev_close * 100, 2)
+            if prev_close and prev_close > 0:
+                change_percent = round((quote.close - prev_close) / prev_close * 100, 2)
             prices.append(
                 watchlist_prices_contracts.WatchlistStockPrice(
                     code=code4,
-                    close=close,
+                    close=quote.close,
                     prevClose=prev_close,
                     changePercent=change_percent,
-                    volume=volume,
-                    date=date,
+                    volume=quote.volume if quote.volume is not None else 0.0,
+                    date=quote.date,
                 )
             )
 
@@ -8,7 +8,7 @@ import os
 from contextlib import suppress
 from datetime import datetime
 from time import perf_counter
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from loguru import logger
 
@@ -30,10 +30,19 @@ from src.application.workers.job_runtime import (
     worker_cancel_reason,
     worker_lease_owner,
 )
-from src.domains.backtest.core.runner import BacktestResult, BacktestRunner
 from src.infrastructure.db.market.portfolio_db import PortfolioDb
 from src.shared.config.settings import get_settings
 
+if TYPE_CHECKING:
+    from src.domains.backtest.core.runner import BacktestResult, BacktestRunner
+
+
+def _create_default_runner() -> BacktestRunner:
+    # vectorbt / numba の読み込みはジョブを確保してハートビートを開始した後まで遅延する
+    from src.domains.backtest.core.runner import BacktestRunner
+
+    return BacktestRunner()
+
 
 def _extract_result_summary(result: BacktestResult) -> BacktestResultSummary:
     summary = resolve_backtest_result_summary(
@@ -138,7 +147,6 @@ async def run_backtest_worker(
         resolved_manager = JobManager()
         resolved_manager.set_portfolio_db(portfolio_db)
         owns_portfolio_db = True
-    resolved_runner = runner or BacktestRunner()
     lease_owner = worker_lease_owner("backtest-worker")
 
     heartbeat_task: asyncio.Task[None] | None = None
@@ -199,6 +207,7 @@ async def run_backtest_worker(
             )
         )
 
+        resolved_runner = runner or await asyncio.to_thread(_create_default_runner)
         result = await asyncio.to_thread(
             resolved_runner.execute,
             strategy=effective_strategy_name,
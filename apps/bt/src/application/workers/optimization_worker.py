@@ -15,7 +15,6 @@ from loguru import logger
 from src.application.services.job_status import TERMINAL_JOB_STATUSES
 from src.application.services.job_manager import JobManager
 from src.application.services.run_contracts import build_canonical_metrics_from_payload
-from src.domains.optimization.engine import ParameterOptimizationEngine
 from src.application.contracts.jobs import JobStatus
 from src.infrastructure.db.market.portfolio_db import PortfolioDb
 from src.application.workers.job_runtime import (
@@ -34,6 +33,9 @@ from src.shared.config.settings import get_settings
 
 
 def _execute_optimization_sync(strategy_name: str) -> dict[str, Any]:
+    # vectorbt / numba の読み込みはジョブを確保した後（ワーカースレッド内）まで遅延する
+    from src.domains.optimization.engine import ParameterOptimizationEngine
+
     engine = ParameterOptimizationEngine(strategy_name=strategy_name)
     opt_result = engine.optimize()
 
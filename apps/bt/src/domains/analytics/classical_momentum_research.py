@@ -18,12 +18,10 @@ from src.domains.analytics.readonly_duckdb_support import (
 )
 from src.domains.analytics.research_core import (
     UNIVERSE_LABELS,
-    build_market_universe_case_sql,
+    FeatureSpec,
+    load_research_feature_panel,
     normalize_positive_int_sequence,
-    research_universe_market_codes,
     sort_research_table,
-    sql_string_list,
-    warmup_start_date,
 )
 from src.domains.analytics.research_bundle import (
     ResearchBundleInfo,
@@ -135,59 +133,39 @@ def _normalize_selection_fractions(
     return tuple(sorted(normalized))
 
 
-def _warmup_start_date(
-    analysis_start_date: str | None,
-    available_start_date: str | None,
-    *,
+def _panel_feature_specs(
     lookback_specs: tuple[tuple[int, int], ...],
-) -> str | None:
-    return warmup_start_date(
-        analysis_start_date,
-        available_start_date,
-        warmup_sessions=max(lookback for lookback, _ in lookback_specs),
-        session_to_calendar_multiplier=2.1,
-    )
+    hold_sessions: tuple[int, ...],
+) -> list[FeatureSpec]:
+    lag_sessions = {lookback for lookback, _ in lookback_specs} | {
+        skip for _, skip in lookback_specs if skip > 0
+    }
+    return [
+        FeatureSpec("avg_trading_value", 60),
+        FeatureSpec("future_date", 1),
+        FeatureSpec("future_open", 1),
+        *(FeatureSpec("close_lag", sessions) for sessions in sorted(lag_sessions)),
+        *(FeatureSpec("future_date", hold) for hold in hold_sessions),
+        *(FeatureSpec("future_close", hold) for hold in hold_sessions),
+    ]
 
 
 def _create_panel_table(
     conn: Any,
+    db_path: str,
     *,
-    raw_start_date: str | None,
     analysis_start_date: str | None,
     analysis_end_date: str | None,
     lookback_specs: tuple[tuple[int, int], ...],
     hold_sessions: tuple[int, ...],
+    feature_store_root: str | Path | None,
 ) -> None:
-    price_code = normalize_code_sql("sd.code")
-    master_code = normalize_code_sql("smd.code")
-    all_market_codes = research_universe_market_codes()
-    raw_date_filter = ""
-    raw_params: list[str] = []
-    if raw_start_date is not None:
-        raw_date_filter = "WHERE sd.date >= ?"
-        raw_params.append(raw_start_date)
-    final_conditions: list[str] = []
-    final_params: list[str] = []
-    if analysis_start_date is not None:
-        final_conditions.append("date >= ?")
-        final_params.append(analysis_start_date)
-    if analysis_end_date is not None:
-        final_conditions.append("date <= ?")
-        final_params.append(analysis_end_date)
-    final_where = "" if not final_conditions else "WHERE " + " AND ".join(final_conditions)
-    lag_close_exprs = ",\n                ".join(
-        [
-            *[
-                f"lag(close, {lookback}) over (partition by code order by date) "
-                f"as close_lag_{lookback}d"
-                for lookback, _ in lookback_specs
-            ],
-            *[
-                f"lag(close, {skip}) over (partition by code order by date) "
-                f"as close_lag_{skip}d"
-                for skip in sorted({skip for _, skip in lookback_specs if skip > 0})
-            ],
-        ]
+    panel = load_research_feature_panel(
+        db_path,
+        _panel_feature_specs(lookback_specs, hold_sessions),
+        start_date=analysis_start_date,
+        end_date=analysis_end_date,
+        output_root=feature_store_root,
     )
     momentum_exprs = ",\n            ".join(
         f"case when close_lag_{lookback}d > 0 then "
@@ -195,86 +173,17 @@ def _create_panel_table(
         f"as momentum_return_{lookback}_{skip}"
         for lookback, skip in lookback_specs
     )
-    future_exprs = ",\n                ".join(
-        [
-            *[
-                f"lead(date, {hold}) over (partition by code order by date) as future_date_{hold}d"
-                for hold in hold_sessions
-            ],
-            *[
-                f"lead(close, {hold}) over (partition by code order by date) "
-                f"as future_close_{hold}d"
-                for hold in hold_sessions
-            ],
-        ]
-    )
     conn.execute(
         f"""
         CREATE OR REPLACE TEMP TABLE classical_momentum_panel AS
-        WITH raw_prices AS (
-            SELECT
-                {price_code} AS code,
-                sd.date,
-                sd.open,
-                sd.high,
-                sd.low,
-                sd.close,
-                sd.volume,
-                row_number() OVER (
-                    PARTITION BY {price_code}, sd.date
-                    ORDER BY CASE WHEN length(sd.code) = 4 THEN 0 ELSE 1 END, sd.code
-                ) AS row_rank
-            FROM stock_data sd
-            {raw_date_filter}
-        ),
-        prices AS (
-            SELECT code, date, open, high, low, close, volume
-            FROM raw_prices
-            WHERE row_rank = 1
-              AND open > 0 AND high > 0 AND low > 0 AND close > 0
-        ),
-        master AS (
-            SELECT
-                {master_code} AS code,
-                smd.date,
-                smd.company_name,
-                smd.market_code,
-                smd.scale_category,
-                {build_market_universe_case_sql(market_code_column="smd.market_code", scale_category_column="smd.scale_category")}
-                    AS universe_key,
-                row_number() OVER (
-                    PARTITION BY {master_code}, smd.date
-                    ORDER BY CASE WHEN length(smd.code) = 4 THEN 0 ELSE 1 END, smd.code
-                ) AS row_rank
-            FROM stock_master_daily smd
-            WHERE smd.market_code IN ({sql_string_list(all_market_codes)})
-        ),
-        scoped AS (
-            SELECT p.*, m.company_name, m.market_code, m.scale_category, m.universe_key
-            FROM prices p
-            JOIN master m ON m.code = p.code AND m.date = p.date AND m.row_rank = 1
-            WHERE m.universe_key IS NOT NULL
-        ),
-        featured AS (
-            SELECT
-                *,
-                lead(date, 1) over (partition by code order by date) as next_date,
-                lead(open, 1) over (partition by code order by date) as next_open,
-                avg(volume * close) over (
-                    partition by code order by date
-                    rows between 60 preceding and 1 preceding
-                ) / 1000000.0 as avg_trading_value_60d_mil_jpy,
-                {lag_close_exprs},
-                {future_exprs}
-            FROM scoped
-        )
         SELECT
-            *,
+            {", ".join(panel.columns)},
+            future_date_1d AS next_date,
+            future_open_1d AS next_open,
             {momentum_exprs}
-        FROM featured
-        {final_where}
+        FROM read_parquet(?)
         """,
-        [*raw_params, *final_params],
+        [str(panel.panel_path)],
     )
 
 
@@ -690,6 +599,7 @@ def run_classical_momentum_research(
     selection_fractions: tuple[float, ...] | list[float] | None = None,
     rebalance_interval_sessions: int = DEFAULT_REBALANCE_INTERVAL_SESSIONS,
     min_avg_trading_value_mil_jpy: float = DEFAULT_MIN_AVG_TRADING_VALUE_MIL_JPY,
+    feature_store_root: str | Path | None = None,
 ) -> ClassicalMomentumResearchResult:
     normalized_specs = _normalize_lookback_specs(lookback_specs)
     normalized_holds = normalize_positive_int_sequence(
@@ -718,18 +628,14 @@ def run_classical_momentum_research(
         )
         analysis_start_date = start_date or default_start_date
         analysis_end_date = end_date or available_end_date
-        raw_start_date = _warmup_start_date(
-            analysis_start_date,
-            available_start_date,
-            lookback_specs=normalized_specs,
-        )
         _create_panel_table(
             conn,
-            raw_start_date=raw_start_date,
+            db_path,
             analysis_start_date=analysis_start_date,
             analysis_end_date=analysis_end_date,
             lookback_specs=normalized_specs,
             hold_sessions=normalized_holds,
+            feature_store_root=feature_store_root,
         )
         universe_summary_df = _build_universe_summary(conn)
         selected_event_df = _build_selected_event_df(
@@ -26,6 +26,7 @@ from src.domains.analytics.daily_ranking_event_time_prices import (
 )
 from src.domains.analytics.readonly_duckdb_support import normalize_code_sql
 from src.domains.analytics.trend_slope_features import rolling_log_slope_features
+from src.domains.strategy.indicators.calculations import compute_moving_average_panel
 
 _NAMESPACE_RE = re.compile(r"^[a-z][a-z0-9_]*$")
 
@@ -858,46 +859,29 @@ def build_rolling_trend_features(
         ORDER BY code, price_basis_id, date
         """
     ).fetchdf()
-    frames: list[pd.DataFrame] = []
-    for _, group in prices.groupby(["code", "price_basis_id"], sort=False):
-        numeric_bars = group[
-            [*DAILY_RANKING_VALID_RAW_BAR_PRICE_COLUMNS, "volume"]
-        ].astype(float)
-        valid_bar = (
-            numeric_bars[list(DAILY_RANKING_VALID_RAW_BAR_PRICE_COLUMNS)] > 0.0
-        ).all(axis=1) & (numeric_bars["volume"] >= 0.0)
-        frame = group.loc[valid_bar].copy()
-        close = frame["close"].astype(float)
-        log_close = np.log(close.to_numpy(dtype=float))
-        for window in request.slope_windows:
-            slope, r2 = rolling_log_slope_features(log_close, window=window)
-            frame[f"price_lr_slope_{window}_pct"] = slope
-            frame[f"price_lr_r2_{window}"] = r2
-            frame[f"sma{window}"] = close.rolling(
-                window,
-                min_periods=window,
-            ).mean()
-            frame[f"ema{window}"] = close.ewm(
-                span=window,
-                adjust=False,
-                min_periods=window,
-            ).mean()
-        for ma_prefix in ("sma20", "sma60", "ema20", "ema60"):
-            for lag in request.ma_slope_lags:
-                frame[f"{ma_prefix}_slope_{lag}d_pct"] = (
-                    frame[ma_prefix] / frame[ma_prefix].shift(lag) - 1.0
-                ) * 100.0
-        frames.append(frame)
-
+    numeric_bars = prices[
+        [*DAILY_RANKING_VALID_RAW_BAR_PRICE_COLUMNS, "volume"]
+    ].astype(float)
+    valid_bar = (
+        numeric_bars[list(DAILY_RANKING_VALID_RAW_BAR_PRICE_COLUMNS)] > 0.0
+    ).all(axis=1) & (numeric_bars["volume"] >= 0.0)
+    computed = prices.loc[valid_bar, ["code", "date", "price_basis_id"]].reset_index(
+        drop=True
+    )
     feature_columns = [column for column, _ in _ROLLING_TREND_SCHEMA]
-    if frames:
-        computed = pd.concat(frames, ignore_index=True)[
-            ["code", "date", "price_basis_id", *feature_columns]
-        ]
-    else:
+    if computed.empty:
         computed = pd.DataFrame(
             columns=["code", "date", "price_basis_id", *feature_columns]
         )
+    else:
+        features = _rolling_trend_feature_columns(
+            computed,
+            numeric_bars.loc[valid_bar, "close"].to_numpy(),
+            request,
+        )
+        computed = pd.concat([computed, features], axis=1)[
+            ["code", "date", "price_basis_id", *feature_columns]
+        ]
     registered_name = f"{source.generation}_{request.namespace}_rolling_trend_frame"
     conn.register(registered_name, computed)
     try:
@@ -922,6 +906,51 @@ def build_rolling_trend_features(
         conn.unregister(registered_name)
 
 
+def _rolling_trend_feature_columns(
+    keys: pd.DataFrame,
+    close: np.ndarray,
+    request: RollingTrendFeaturesRequest,
+) -> pd.DataFrame:
+    """Compute rolling trend features for all (code, price basis) series at once.
+
+    Valid bars are laid out as a (valid session x series) panel so the shared
+    panel indicators see each series with its invalid bars squeezed out, which
+    keeps the per-series warmup and session counting.
+    """
+    series = keys.groupby(["code", "price_basis_id"], sort=False)
+    rows = series.cumcount().to_numpy()
+    cols = series.ngroup().to_numpy()
+    lengths = np.bincount(cols)
+    close_values = np.full((int(lengths.max()), len(lengths)), np.nan)
+    close_values[rows, cols] = close
+    close_panel = pd.DataFrame(close_values)
+    log_close = np.log(close_values)
+
+    panels: dict[str, pd.DataFrame] = {}
+    features: dict[str, np.ndarray] = {}
+    for window in request.slope_windows:
+        slope = np.full_like(close_values, np.nan)
+        r2 = np.full_like(close_values, np.nan)
+        for column, length in enumerate(lengths):
+            slope[:length, column], r2[:length, column] = rolling_log_slope_features(
+                log_close[:length, column],
+                window=window,
+            )
+        features[f"price_lr_slope_{window}_pct"] = slope[rows, cols]
+        features[f"price_lr_r2_{window}"] = r2[rows, cols]
+        panels[f"sma{window}"] = compute_moving_average_panel(close_panel, window, "sma")
+        panels[f"ema{window}"] = compute_moving_average_panel(close_panel, window, "ema")
+    for ma_prefix in ("sma20", "sma60", "ema20", "ema60"):
+        moving_average = panels[ma_prefix]
+        for lag in request.ma_slope_lags:
+            panels[f"{ma_prefix}_slope_{lag}d_pct"] = (
+                moving_average / moving_average.shift(lag) - 1.0
+            ) * 100.0
+    for name, panel in panels.items():
+        features[name] = panel.to_numpy()[rows, cols]
+    return pd.DataFrame(features)
+
+
 @_scoped_feature_builder
 def build_rolling_atr_features(
     conn: Any,
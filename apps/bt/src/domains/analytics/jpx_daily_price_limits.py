@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import math
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, TypeVar
 
+import numpy as np
 import pandas as pd
+from numpy.typing import ArrayLike
 
 JPX_DAILY_PRICE_LIMITS_REFERENCE_LABEL = (
     "JPX Daily Price Limits page (updated Apr. 17, 2026)"
@@ -55,6 +58,193 @@ STANDARD_DAILY_LIMIT_BANDS: tuple[tuple[int | None, int], ...] = (
     (None, 10_000_000),
 )
 
+# TSE tick sizes (呼値の単位). Bounds are inclusive ("price <= bound"); the final
+# ``None`` means "above the previous bound".
+STANDARD_TICK_SIZE_BANDS: tuple[tuple[int | None, float], ...] = (
+    (3_000, 1),
+    (5_000, 5),
+    (30_000, 10),
+    (50_000, 50),
+    (300_000, 100),
+    (500_000, 500),
+    (3_000_000, 1_000),
+    (5_000_000, 5_000),
+    (30_000_000, 10_000),
+    (50_000_000, 50_000),
+    (None, 100_000),
+)
+TOPIX100_TICK_SIZE_BANDS: tuple[tuple[int | None, float], ...] = (
+    (1_000, 0.1),
+    (3_000, 0.5),
+    (10_000, 1),
+    (30_000, 5),
+    (100_000, 10),
+    (300_000, 50),
+    (1_000_000, 100),
+    (3_000_000, 500),
+    (10_000_000, 1_000),
+    (30_000_000, 5_000),
+    (None, 10_000),
+)
+
+DAILY_LIMIT_WIDTH_MACRO_NAME = "jpx_daily_limit_width"
+TICK_SIZE_MACRO_NAME = "jpx_tick_size"
+_PRICE_EPSILON = 1e-6
+
+PanelT = TypeVar("PanelT", pd.DataFrame, pd.Series, np.ndarray)
+
+
+def _band_arrays(
+    bands: tuple[tuple[int | None, float], ...],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Split ``(upper_bound, value)`` bands into sorted breakpoints and values."""
+    breakpoints = np.array(
+        [upper_bound for upper_bound, _ in bands if upper_bound is not None],
+        dtype=np.float64,
+    )
+    values = np.array([value for _, value in bands], dtype=np.float64)
+    return breakpoints, values
+
+
+_LIMIT_BREAKPOINTS, _LIMIT_WIDTHS = _band_arrays(STANDARD_DAILY_LIMIT_BANDS)
+_STANDARD_TICK_BREAKPOINTS, _STANDARD_TICKS = _band_arrays(STANDARD_TICK_SIZE_BANDS)
+_TOPIX100_TICK_BREAKPOINTS, _TOPIX100_TICKS = _band_arrays(TOPIX100_TICK_SIZE_BANDS)
+
+
+def _wrap_like(template: PanelT, values: np.ndarray) -> PanelT:
+    if isinstance(template, pd.DataFrame):
+        return pd.DataFrame(values, index=template.index, columns=template.columns)
+    if isinstance(template, pd.Series):
+        return pd.Series(values, index=template.index, name=template.name)
+    return values
+
+
+def _as_float_array(values: ArrayLike) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def standard_daily_limit_widths(base_prices: ArrayLike) -> np.ndarray:
+    """Vectorized ``resolve_standard_daily_limit_width`` (NaN where undefined)."""
+    base = _as_float_array(base_prices)
+    widths = _LIMIT_WIDTHS[np.searchsorted(_LIMIT_BREAKPOINTS, base, side="right")]
+    return np.where(np.isfinite(base) & (base > 0), widths, np.nan)
+
+
+def tick_sizes(prices: ArrayLike, *, topix100: ArrayLike = False) -> np.ndarray:
+    """Return the TSE tick size for each price (NaN where undefined).
+
+    ``topix100`` may be a scalar or a boolean array broadcastable to ``prices``.
+    """
+    price = _as_float_array(prices)
+    standard = _STANDARD_TICKS[
+        np.searchsorted(_STANDARD_TICK_BREAKPOINTS, price, side="left")
+    ]
+    topix = _TOPIX100_TICKS[
+        np.searchsorted(_TOPIX100_TICK_BREAKPOINTS, price, side="left")
+    ]
+    ticks = np.where(np.asarray(topix100, dtype=bool), topix, standard)
+    return np.where(np.isfinite(price) & (price > 0), ticks, np.nan)
+
+
+@dataclass(frozen=True)
+class DailyLimitPanel:
+    """Standard daily limit band and limit-lock masks for a price panel.
+
+    ``limit_up_lock`` marks single-price sessions that closed at the upper
+    limit (buy orders cannot be filled); ``limit_down_lock`` is the sell-side
+    counterpart. Inputs of shape ``(dates, codes)`` give outputs of the same
+    shape and type.
+    """
+
+    limit_width: Any
+    upper_limit: Any
+    lower_limit: Any
+    limit_up_lock: Any
+    limit_down_lock: Any
+
+    @property
+    def buy_fillable(self) -> Any:
+        return ~self.limit_up_lock
+
+    @property
+    def sell_fillable(self) -> Any:
+        return ~self.limit_down_lock
+
+
+def build_daily_limit_panel(
+    prev_close: PanelT,
+    open_: PanelT,
+    high: PanelT,
+    low: PanelT,
+    close: PanelT,
+    *,
+    tolerance: float = 1.0,
+    epsilon: float = _PRICE_EPSILON,
+) -> DailyLimitPanel:
+    """Classify limit-up/limit-down locks for whole OHLC panels at once.
+
+    ``tolerance`` scales the limit width for the lock test (e.g. ``0.995`` to
+    accept closes within 0.5% of the band, as in the post-earnings study).
+    """
+    prev = _as_float_array(prev_close)
+    open_values = _as_float_array(open_)
+    high_values = _as_float_array(high)
+    low_values = _as_float_array(low)
+    close_values = _as_float_array(close)
+
+    width = standard_daily_limit_widths(prev)
+    upper = prev + width
+    lower = prev - width
+    with np.errstate(invalid="ignore"):
+        single_price = (
+            (np.abs(open_values - high_values) <= epsilon)
+            & (np.abs(high_values - low_values) <= epsilon)
+            & (np.abs(low_values - close_values) <= epsilon)
+        )
+        up_lock = single_price & (close_values >= prev + width * tolerance)
+        down_lock = single_price & (close_values <= prev - width * tolerance)
+
+    return DailyLimitPanel(
+        limit_width=_wrap_like(prev_close, width),
+        upper_limit=_wrap_like(prev_close, upper),
+        lower_limit=_wrap_like(prev_close, lower),
+        limit_up_lock=_wrap_like(prev_close, up_lock),
+        limit_down_lock=_wrap_like(prev_close, down_lock),
+    )
+
+
+def _lookup_case_sql(
+    value_sql: str,
+    bands: tuple[tuple[int | None, float], ...],
+    *,
+    comparison: str,
+) -> str:
+    conditions = [f"WHEN {value_sql} IS NULL OR {value_sql} <= 0 THEN NULL"]
+    for upper_bound, value in bands:
+        if upper_bound is None:
+            conditions.append(f"ELSE {value}")
+        else:
+            conditions.append(f"WHEN {value_sql} {comparison} {upper_bound} THEN {value}")
+    return "CASE " + " ".join(conditions) + " END"
+
+
+def register_price_limit_macros(conn: Any) -> None:
+    """Register ``jpx_daily_limit_width(base)`` / ``jpx_tick_size(price, topix100)``.
+
+    The macros are TEMP objects, so they also work on read-only analysis
+    connections and evaluate as native (vectorized) DuckDB expressions.
+    """
+    conn.execute(
+        f"CREATE OR REPLACE TEMP MACRO {DAILY_LIMIT_WIDTH_MACRO_NAME}(base) AS "
+        + _lookup_case_sql("base", STANDARD_DAILY_LIMIT_BANDS, comparison="<")
+    )
+    standard_sql = _lookup_case_sql("price", STANDARD_TICK_SIZE_BANDS, comparison="<=")
+    topix_sql = _lookup_case_sql("price", TOPIX100_TICK_SIZE_BANDS, comparison="<=")
+    conn.execute(
+        f"CREATE OR REPLACE TEMP MACRO {TICK_SIZE_MACRO_NAME}(price, topix100 := FALSE) AS "
+        f"CAST(CASE WHEN topix100 THEN {topix_sql} ELSE {standard_sql} END AS DOUBLE)"
+    )
+
 
 def build_standard_daily_limit_width_case_sql(base_price_sql: str) -> str:
     conditions: list[str] = [
@@ -75,10 +265,7 @@ def resolve_standard_daily_limit_width(base_price: float | int | None) -> float
     numeric_base = float(base_price)
     if not math.isfinite(numeric_base) or numeric_base <= 0:
         return None
-    for upper_bound, limit_width in STANDARD_DAILY_LIMIT_BANDS:
-        if upper_bound is None or numeric_base < upper_bound:
-            return float(limit_width)
-    return None
+    return float(_LIMIT_WIDTHS[np.searchsorted(_LIMIT_BREAKPOINTS, numeric_base, side="right")])
 
 
 def build_standard_daily_limit_table_df() -> pd.DataFrame:
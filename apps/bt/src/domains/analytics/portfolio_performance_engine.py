@@ -0,0 +1,137 @@
+"""Columnar portfolio performance calculations.
+
+Holding prices arrive as flat ``(code, date, close, prev_close)`` columns from a
+single batched query. They are pivoted into a ``dates x codes`` log-return
+matrix, and the weighted portfolio series and benchmark statistics are
+computed with numpy instead of per-date Python loops. Aggregation follows the
+scalar implementation it replaced (weights renormalized over the codes that
+traded on each date, cumulative log-return sums), so rounded API output is
+unchanged.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ReturnPanel:
+    """Daily log returns pivoted to a ``dates x codes`` matrix (NaN = no return)."""
+
+    dates: tuple[str, ...]
+    codes: tuple[str, ...]
+    returns: np.ndarray
+
+
+@dataclass(frozen=True)
+class PortfolioReturnSeries:
+    """Weighted daily and cumulative portfolio log returns."""
+
+    dates: tuple[str, ...]
+    daily: np.ndarray
+    cumulative: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+
+def build_log_return_panel(
+    codes: Sequence[str],
+    dates: Sequence[str],
+    closes: Sequence[float] | np.ndarray,
+    prev_closes: Sequence[float] | np.ndarray,
+) -> ReturnPanel:
+    """Pivot flat close / previous-close columns into a log-return matrix.
+
+    Rows with a non-positive close on either side carry no return, matching
+    ``regression_core.calculate_daily_returns``.
+    """
+    close_values = np.asarray(closes, dtype=np.float64)
+    prev_values = np.asarray(prev_closes, dtype=np.float64)
+    valid = (close_values > 0) & (prev_values > 0)
+
+    code_values = np.asarray(codes, dtype=object)[valid]
+    date_values = np.asarray(dates, dtype=object)[valid]
+    if len(code_values) == 0:
+        return ReturnPanel(dates=(), codes=(), returns=np.empty((0, 0)))
+
+    unique_dates, date_index = np.unique(date_values.astype(str), return_inverse=True)
+    unique_codes, code_index = np.unique(code_values.astype(str), return_inverse=True)
+    matrix = np.full((len(unique_dates), len(unique_codes)), np.nan)
+    matrix[date_index, code_index] = np.log(close_values[valid] / prev_values[valid])
+    return ReturnPanel(
+        dates=tuple(str(value) for value in unique_dates),
+        codes=tuple(str(value) for value in unique_codes),
+        returns=matrix,
+    )
+
+
+def limit_panel_to_lookback(panel: ReturnPanel, lookback_days: int) -> ReturnPanel:
+    """Keep the trailing ``lookback_days`` dates (list-slice semantics)."""
+    if len(panel.dates) <= lookback_days:
+        return panel
+    start = len(panel.dates) - lookback_days if lookback_days > 0 else -lookback_days
+    return ReturnPanel(
+        dates=panel.dates[start:],
+        codes=panel.codes,
+        returns=panel.returns[start:],
+    )
+
+
+def weighted_portfolio_returns(
+    panel: ReturnPanel,
+    weight_map: Mapping[str, float],
+    code_key: Mapping[str, str] | None = None,
+) -> PortfolioReturnSeries:
+    """Aggregate the return panel into a weighted portfolio series.
+
+    On each date the weighted return over the codes that traded is rescaled
+    by ``sum(weights) / traded_weight`` so a missing quote does not drag the
+    portfolio toward zero. ``code_key`` maps weight codes to panel codes when
+    they are spelled differently (e.g. 5-digit API codes).
+    """
+    n_dates = len(panel.dates)
+    if n_dates == 0:
+        empty = np.zeros(0)
+        return PortfolioReturnSeries(dates=(), daily=empty, cumulative=empty)
+
+    column_by_code = {code: index for index, code in enumerate(panel.codes)}
+    weights = np.asarray(list(weight_map.values()), dtype=np.float64)
+    columns = np.full((n_dates, len(weights)), np.nan)
+    for position, code in enumerate(weight_map):
+        panel_code = code_key.get(code, code) if code_key is not None else code
+        column = column_by_code.get(panel_code)
+        if column is not None:
+            columns[:, position] = panel.returns[:, column]
+
+    traded = ~np.isnan(columns)
+    weighted_sum = np.where(traded, columns * weights, 0.0).sum(axis=1)
+    traded_weight = np.where(traded, weights, 0.0).sum(axis=1)
+    total_weight = float(sum(weight_map.values()))
+    rescaled = np.divide(
+        weighted_sum,
+        traded_weight,
+        out=np.zeros(n_dates),
+        where=traded_weight > 0,
+    ) * total_weight
+    daily = np.where(traded_weight > 0, rescaled, weighted_sum)
+    return PortfolioReturnSeries(
+        dates=panel.dates,
+        daily=daily,
+        cumulative=np.cumsum(daily),
+    )
+
+
+def population_correlation(left: np.ndarray, right: np.ndarray) -> float:
+    """Pearson correlation with population moments; 0.0 for flat series."""
+    left_dev = left - left.mean()
+    right_dev = right - right.mean()
+    std_left = float(np.sqrt(np.mean(left_dev**2)))
+    std_right = float(np.sqrt(np.mean(right_dev**2)))
+    if std_left <= 0 or std_right <= 0:
+        return 0.0
+    covariance = float(np.mean(left_dev * right_dev))
+    return covariance / (std_left * std_right)
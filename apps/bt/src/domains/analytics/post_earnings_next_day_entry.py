@@ -41,7 +41,7 @@ from src.domains.analytics.earnings_holdthrough_expectancy_report import (
 from src.domains.analytics.jpx_daily_price_limits import (
     JPX_DAILY_PRICE_LIMITS_DEFINITION_NOTE,
     JPX_DAILY_PRICE_LIMITS_REFERENCE_LABEL,
-    resolve_standard_daily_limit_width,
+    build_daily_limit_panel,
 )
 from src.domains.analytics.readonly_duckdb_support import (
     SourceMode,
@@ -500,17 +500,22 @@ def _classify_entry_execution(
     values = [pre_close, entry_open, entry_high, entry_low, entry_close]
     if any(not math.isfinite(_float_or_nan(value)) for value in values):
         return "missing_entry_session"
-    limit_width = resolve_standard_daily_limit_width(pre_close)
-    one_price = (
-        abs(entry_open - entry_high) <= _PRICE_EPSILON
-        and abs(entry_high - entry_low) <= _PRICE_EPSILON
-        and abs(entry_low - entry_close) <= _PRICE_EPSILON
+    prev_close, open_, high, low, close = (
+        np.asarray(value, dtype=np.float64) for value in values
     )
-    if one_price and limit_width is not None:
-        if entry_close >= pre_close + limit_width * _LIMIT_TOLERANCE:
-            return "limit_up_no_fill"
-        if entry_close <= pre_close - limit_width * _LIMIT_TOLERANCE:
-            return "limit_down_no_fill"
+    limits = build_daily_limit_panel(
+        prev_close,
+        open_,
+        high,
+        low,
+        close,
+        tolerance=_LIMIT_TOLERANCE,
+        epsilon=_PRICE_EPSILON,
+    )
+    if bool(limits.limit_up_lock):
+        return "limit_up_no_fill"
+    if bool(limits.limit_down_lock):
+        return "limit_down_no_fill"
     gap_pct = abs(_return_pct(entry_open, pre_close))
     if math.isfinite(gap_pct) and gap_pct >= _GAP_EXTREME_THRESHOLD_PCT:
         return "gap_extreme_executable"
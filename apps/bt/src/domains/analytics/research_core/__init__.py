@@ -1,5 +1,12 @@
 """Thin internal primitives for runner-first analytics research."""
 
+from src.domains.analytics.research_core.feature_store import (
+    FeaturePanel,
+    FeatureSpec,
+    get_feature_store_dir,
+    load_research_feature_panel,
+    read_feature_panel,
+)
 from src.domains.analytics.research_core.parameters import (
     normalize_positive_int_sequence,
     warmup_start_date,
@@ -23,6 +30,8 @@ from src.domains.analytics.research_core.universe import (
 )
 
 __all__ = [
+    "FeaturePanel",
+    "FeatureSpec",
     "GROWTH_MARKET_CODES",
     "PRIME_MARKET_CODES",
     "PricePath",
@@ -33,7 +42,10 @@ __all__ = [
     "build_event_portfolio_daily_df",
     "build_market_universe_case_sql",
     "build_price_path_lookup",
+    "get_feature_store_dir",
+    "load_research_feature_panel",
     "normalize_positive_int_sequence",
+    "read_feature_panel",
     "research_universe_market_codes",
     "sort_research_table",
     "sql_string_list",
@@ -0,0 +1,550 @@
+"""Shared research feature store backed by local Parquet panels.
+
+Runner-first studies repeatedly rebuild the same stock-day panels (SMA ratios,
+ATR, trading value, forward returns, TOPIX regime, universe membership) from
+``market.duckdb``. This module materializes those panels once per
+(feature definitions, universe, date range, source DB fingerprint) and serves
+later requests from Parquet. A request whose features are a subset of an
+already materialized panel with the same scope is answered by a column
+projection of that panel instead of a rebuild.
+
+Features are computed over each code's full price history and only then
+restricted to the requested universes, so gaps in ``stock_master_daily`` do
+not shorten rolling windows. Panels are read back through DuckDB, and panels
+built from an older version of the same source DB are evicted on the next
+build.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import cached_property
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal, cast
+
+import pandas as pd
+
+from src.domains.analytics.readonly_duckdb_support import (
+    DuckDbConnectFn,
+    fetch_date_range,
+    normalize_code_sql,
+    open_readonly_analysis_connection,
+)
+from src.domains.analytics.research_bundle import get_research_root_dir
+from src.domains.analytics.research_core.parameters import warmup_start_date
+from src.domains.analytics.research_core.universe import (
+    UNIVERSE_ORDER,
+    build_market_universe_case_sql,
+    research_universe_market_codes,
+    sql_string_list,
+)
+
+FeatureKind = Literal[
+    "sma_ratio",
+    "atr",
+    "avg_trading_value",
+    "forward_return",
+    "close_lag",
+    "future_close",
+    "future_open",
+    "future_date",
+    "topix_sma_ratio",
+]
+
+FEATURE_STORE_SCHEMA_VERSION = 2
+DEFAULT_MAX_PANELS = 16
+FEATURE_STORE_DIRNAME = "_feature_store"
+FEATURE_PANEL_BASE_COLUMNS: tuple[str, ...] = (
+    "code",
+    "date",
+    "universe_key",
+    "market_code",
+    "scale_category",
+    "company_name",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+)
+_WARMUP_CALENDAR_MULTIPLIER = 1.6
+
+
+@dataclass(frozen=True)
+class _FeatureDefinition:
+    version: int
+    column_template: str
+    needs_warmup: bool
+    build_sql: Callable[[int, str], str]
+
+
+def _sma_ratio_sql(window: int, column: str) -> str:
+    frame = f"partition by code order by date rows between {window - 1} preceding and current row"
+    return (
+        f"case when count(close) over ({frame}) >= {window} "
+        f"then close / nullif(avg(close) over ({frame}), 0) end as {column}"
+    )
+
+
+def _atr_sql(window: int, column: str) -> str:
+    frame = f"partition by code order by date rows between {window - 1} preceding and current row"
+    return (
+        f"case when count(true_range) over ({frame}) >= {window} "
+        f"then avg(true_range) over ({frame}) end as {column}"
+    )
+
+
+def _avg_trading_value_sql(window: int, column: str) -> str:
+    frame = f"partition by code order by date rows between {window} preceding and 1 preceding"
+    return (
+        f"case when count(close) over ({frame}) >= {window} "
+        f"then avg(volume * close) over ({frame}) / 1000000.0 end as {column}"
+    )
+
+
+def _forward_return_sql(window: int, column: str) -> str:
+    return (
+        f"lead(close, {window}) over (partition by code order by date) "
+        f"/ nullif(close, 0) - 1 as {column}"
+    )
+
+
+def _lag_sql(source: str) -> Callable[[int, str], str]:
+    def build(window: int, column: str) -> str:
+        return f"lag({source}, {window}) over (partition by code order by date) as {column}"
+
+    return build
+
+
+def _lead_sql(source: str) -> Callable[[int, str], str]:
+    def build(window: int, column: str) -> str:
+        return f"lead({source}, {window}) over (partition by code order by date) as {column}"
+
+    return build
+
+
+def _topix_sma_ratio_sql(window: int, column: str) -> str:
+    frame = f"order by date rows between {window - 1} preceding and current row"
+    return (
+        f"case when count(close) over ({frame}) >= {window} "
+        f"then close / nullif(avg(close) over ({frame}), 0) end as {column}"
+    )
+
+
+_FEATURE_DEFINITIONS: dict[str, _FeatureDefinition] = {
+    "sma_ratio": _FeatureDefinition(1, "sma_ratio_{window}", True, _sma_ratio_sql),
+    "atr": _FeatureDefinition(1, "atr_{window}", True, _atr_sql),
+    "avg_trading_value": _FeatureDefinition(
+        1, "avg_trading_value_{window}d_mil_jpy", True, _avg_trading_value_sql
+    ),
+    "forward_return": _FeatureDefinition(
+        1, "forward_return_{window}d", False, _forward_return_sql
+    ),
+    "close_lag": _FeatureDefinition(1, "close_lag_{window}d", True, _lag_sql("close")),
+    "future_close": _FeatureDefinition(1, "future_close_{window}d", False, _lead_sql("close")),
+    "future_open": _FeatureDefinition(1, "future_open_{window}d", False, _lead_sql("open")),
+    "future_date": _FeatureDefinition(1, "future_date_{window}d", False, _lead_sql("date")),
+    "topix_sma_ratio": _FeatureDefinition(
+        1, "topix_sma_ratio_{window}", True, _topix_sma_ratio_sql
+    ),
+}
+
+
+@dataclass(frozen=True, order=True)
+class FeatureSpec:
+    """One named, windowed feature column (e.g. ``FeatureSpec("sma_ratio", 20)``)."""
+
+    kind: FeatureKind
+    window: int
+
+    def __post_init__(self) -> None:
+        if self.kind not in _FEATURE_DEFINITIONS:
+            raise ValueError(f"unknown feature kind: {self.kind}")
+        if int(self.window) <= 0:
+            raise ValueError("feature window must be positive")
+
+    @property
+    def column(self) -> str:
+        return _FEATURE_DEFINITIONS[self.kind].column_template.format(window=self.window)
+
+    @property
+    def version(self) -> int:
+        return _FEATURE_DEFINITIONS[self.kind].version
+
+    def to_payload(self) -> dict[str, Any]:
+        return {"kind": self.kind, "window": int(self.window), "version": self.version}
+
+
+@dataclass(frozen=True)
+class FeaturePanel:
+    """A materialized panel; ``frame`` reads the requested columns on first access.
+
+    Consumers that stay in DuckDB can query ``panel_path`` with ``read_parquet``
+    and skip the pandas round trip.
+    """
+
+    panel_key: str
+    panel_path: Path
+    columns: tuple[str, ...]
+    cache_hit: bool
+    source_detail: str
+
+    @cached_property
+    def frame(self) -> pd.DataFrame:
+        return read_feature_panel(self.panel_path, self.columns)
+
+
+def get_feature_store_dir(output_root: str | Path | None = None) -> Path:
+    return get_research_root_dir(output_root) / FEATURE_STORE_DIRNAME
+
+
+def read_feature_panel(panel_path: str | Path, columns: Iterable[str]) -> pd.DataFrame:
+    """Read ``columns`` of a stored panel, ordered by code and date."""
+    requested = list(columns)
+    sort_keys = ["code", "date"]
+    frame = pd.read_parquet(
+        panel_path,
+        columns=[*requested, *(key for key in sort_keys if key not in requested)],
+    )
+    frame = frame.sort_values(sort_keys, kind="stable", ignore_index=True)
+    return cast(pd.DataFrame, frame[requested])
+
+
+def source_db_fingerprint(db_path: str | Path) -> dict[str, Any]:
+    """Cheap identity of the source DB (and its WAL) used to invalidate panels."""
+    fingerprint: dict[str, Any] = {}
+    for label, path in (("db", Path(db_path)), ("wal", Path(f"{db_path}.wal"))):
+        if path.exists():
+            stat = path.stat()
+            fingerprint[label] = {"size_bytes": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        else:
+            fingerprint[label] = None
+    return fingerprint
+
+
+def load_research_feature_panel(
+    db_path: str,
+    features: Iterable[FeatureSpec],
+    *,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    universes: Iterable[str] = UNIVERSE_ORDER,
+    output_root: str | Path | None = None,
+    connect_fn: DuckDbConnectFn | None = None,
+    max_panels: int = DEFAULT_MAX_PANELS,
+) -> FeaturePanel:
+    """Return a stock-day feature panel, building it into the store on first use.
+
+    Rows are restricted to ``[start_date, end_date]`` and to the requested
+    research universes. Rolling features use warmup rows before ``start_date``
+    and forward returns look past ``end_date``, so values match a panel built
+    over the full history. Building a panel evicts panels of older versions of
+    the same source DB and keeps at most ``max_panels`` recently used panels.
+    """
+    specs = tuple(sorted(set(features)))
+    if not specs:
+        raise ValueError("at least one feature is required")
+    universe_keys = tuple(sorted(set(universes)))
+    unknown_universes = set(universe_keys) - set(UNIVERSE_ORDER)
+    if unknown_universes:
+        raise ValueError(f"unknown research universes: {sorted(unknown_universes)}")
+
+    store_dir = get_feature_store_dir(output_root)
+    scope = {
+        "schema_version": FEATURE_STORE_SCHEMA_VERSION,
+        "db_fingerprint": source_db_fingerprint(db_path),
+        "universes": list(universe_keys),
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+    columns = (*FEATURE_PANEL_BASE_COLUMNS, *(spec.column for spec in specs))
+
+    reusable = _find_materialized_panel(store_dir, scope, specs)
+    if reusable is not None:
+        panel_key, panel_path = reusable
+        _touch(panel_path.with_suffix(".json"))
+        return FeaturePanel(
+            panel_key=panel_key,
+            panel_path=panel_path,
+            columns=columns,
+            cache_hit=True,
+            source_detail=f"feature store: {panel_path}",
+        )
+
+    panel_key = _panel_key(scope, specs)
+    panel_path = store_dir / f"{panel_key}.parquet"
+    store_dir.mkdir(parents=True, exist_ok=True)
+    with open_readonly_analysis_connection(
+        db_path,
+        snapshot_prefix="research-feature-store-",
+        connect_fn=connect_fn,
+    ) as ctx:
+        row_count = _materialize_panel(
+            ctx.connection,
+            panel_path,
+            specs=specs,
+            universe_keys=universe_keys,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        source_detail = ctx.source_detail
+    source_db = str(Path(db_path).resolve())
+    _write_manifest(
+        store_dir / f"{panel_key}.json",
+        {
+            **scope,
+            "source_db": source_db,
+            "features": [spec.to_payload() for spec in specs],
+            "row_count": row_count,
+        },
+    )
+    _touch(store_dir / f"{panel_key}.json")
+    _evict_panels(
+        store_dir,
+        source_db=source_db,
+        db_fingerprint=scope["db_fingerprint"],
+        keep_key=panel_key,
+        max_panels=max_panels,
+    )
+    return FeaturePanel(
+        panel_key=panel_key,
+        panel_path=panel_path,
+        columns=columns,
+        cache_hit=False,
+        source_detail=source_detail,
+    )
+
+
+def _panel_key(scope: dict[str, Any], specs: tuple[FeatureSpec, ...]) -> str:
+    payload = {**scope, "features": [spec.to_payload() for spec in specs]}
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:24]
+
+
+def _find_materialized_panel(
+    store_dir: Path,
+    scope: dict[str, Any],
+    specs: tuple[FeatureSpec, ...],
+) -> tuple[str, Path] | None:
+    """Return an existing panel with the same scope whose features cover ``specs``."""
+    exact_key = _panel_key(scope, specs)
+    exact_path = store_dir / f"{exact_key}.parquet"
+    if exact_path.exists() and (store_dir / f"{exact_key}.json").exists():
+        return exact_key, exact_path
+    if not store_dir.exists():
+        return None
+    required = {json.dumps(spec.to_payload(), sort_keys=True) for spec in specs}
+    for manifest_path in sorted(store_dir.glob("*.json")):
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if any(manifest.get(name) != value for name, value in scope.items()):
+            continue
+        available = {
+            json.dumps(feature, sort_keys=True) for feature in manifest.get("features", [])
+        }
+        panel_path = manifest_path.with_suffix(".parquet")
+        if required <= available and panel_path.exists():
+            return manifest_path.stem, panel_path
+    return None
+
+
+def _materialize_panel(
+    conn: Any,
+    panel_path: Path,
+    *,
+    specs: tuple[FeatureSpec, ...],
+    universe_keys: tuple[str, ...],
+    start_date: str | None,
+    end_date: str | None,
+) -> int:
+    available_start_date, _ = fetch_date_range(conn, table_name="stock_data")
+    warmup_sessions = max(
+        (spec.window for spec in specs if _FEATURE_DEFINITIONS[spec.kind].needs_warmup),
+        default=0,
+    )
+    raw_start_date = (
+        warmup_start_date(
+            start_date,
+            available_start_date,
+            warmup_sessions=warmup_sessions + 1,
+            session_to_calendar_multiplier=_WARMUP_CALENDAR_MULTIPLIER,
+        )
+        if start_date is not None
+        else None
+    )
+    raw_filter = "" if raw_start_date is None else "WHERE sd.date >= ?"
+    raw_params = [] if raw_start_date is None else [raw_start_date]
+    topix_filter = "" if raw_start_date is None else "WHERE date >= ?"
+    universe_list = sql_string_list(universe_keys)
+    final_conditions = [f"m.universe_key IN ({universe_list})"]
+    final_params: list[str] = []
+    if start_date is not None:
+        final_conditions.append("f.date >= ?")
+        final_params.append(start_date)
+    if end_date is not None:
+        final_conditions.append("f.date <= ?")
+        final_params.append(end_date)
+
+    stock_specs = [spec for spec in specs if spec.kind != "topix_sma_ratio"]
+    topix_specs = [spec for spec in specs if spec.kind == "topix_sma_ratio"]
+    stock_feature_sql = "".join(
+        f",\n                {_FEATURE_DEFINITIONS[spec.kind].build_sql(spec.window, spec.column)}"
+        for spec in stock_specs
+    )
+    stock_columns = "".join(f", f.{spec.column}" for spec in stock_specs)
+    topix_feature_sql = ",\n                ".join(
+        _FEATURE_DEFINITIONS[spec.kind].build_sql(spec.window, spec.column)
+        for spec in topix_specs
+    )
+    topix_cte = ""
+    topix_join = ""
+    topix_columns = ""
+    if topix_specs:
+        topix_cte = f""",
+        topix_features AS (
+            SELECT
+                date,
+                {topix_feature_sql}
+            FROM topix_data
+            {topix_filter}
+        )"""
+        topix_join = "LEFT JOIN topix_features t ON t.date = f.date"
+        topix_columns = "".join(f", t.{spec.column}" for spec in topix_specs)
+    price_code = normalize_code_sql("sd.code")
+    master_code = normalize_code_sql("smd.code")
+    select_sql = f"""
+        WITH master AS (
+            SELECT
+                {master_code} AS code,
+                smd.date,
+                smd.market_code,
+                smd.scale_category,
+                smd.company_name,
+                {build_market_universe_case_sql(market_code_column="smd.market_code", scale_category_column="smd.scale_category")}
+                    AS universe_key,
+                row_number() OVER (
+                    PARTITION BY {master_code}, smd.date
+                    ORDER BY CASE WHEN length(smd.code) = 4 THEN 0 ELSE 1 END, smd.code
+                ) AS row_rank
+            FROM stock_master_daily smd
+            WHERE smd.market_code IN ({sql_string_list(research_universe_market_codes())})
+        ),
+        universe_codes AS (
+            SELECT DISTINCT code
+            FROM master
+            WHERE row_rank = 1 AND universe_key IN ({universe_list})
+        ),
+        raw_prices AS (
+            SELECT
+                {price_code} AS code,
+                sd.date, sd.open, sd.high, sd.low, sd.close, sd.volume,
+                row_number() OVER (
+                    PARTITION BY {price_code}, sd.date
+                    ORDER BY CASE WHEN length(sd.code) = 4 THEN 0 ELSE 1 END, sd.code
+                ) AS row_rank
+            FROM stock_data sd
+            {raw_filter}
+        ),
+        prices AS (
+            SELECT code, date, open, high, low, close, volume
+            FROM raw_prices
+            WHERE row_rank = 1
+              AND open > 0 AND high > 0 AND low > 0 AND close > 0
+              AND code IN (SELECT code FROM universe_codes)
+        ),
+        priced AS (
+            SELECT
+                *,
+                greatest(
+                    high - low,
+                    coalesce(abs(high - lag(close) over (partition by code order by date)), 0),
+                    coalesce(abs(low - lag(close) over (partition by code order by date)), 0)
+                ) AS true_range
+            FROM prices
+        ),
+        featured AS (
+            SELECT
+                code, date, open, high, low, close, volume{stock_feature_sql}
+            FROM priced
+        ){topix_cte}
+        SELECT
+            f.code, f.date, m.universe_key, m.market_code, m.scale_category, m.company_name,
+            f.open, f.high, f.low, f.close, f.volume{stock_columns}{topix_columns}
+        FROM featured f
+        JOIN master m ON m.code = f.code AND m.date = f.date AND m.row_rank = 1
+        {topix_join}
+        WHERE {" AND ".join(final_conditions)}
+        ORDER BY f.code, f.date
+    """
+    params = [*raw_params, *([raw_start_date] if topix_specs and raw_start_date else []), *final_params]
+    tmp_path = panel_path.with_name(f"{panel_path.name}.tmp-{os.getpid()}")
+    escaped_tmp_path = str(tmp_path).replace("'", "''")
+    conn.execute(f"COPY ({select_sql}) TO '{escaped_tmp_path}' (FORMAT PARQUET)", params)
+    os.replace(tmp_path, panel_path)
+    row = conn.execute(
+        "SELECT count(*) FROM read_parquet(?)", [str(panel_path)]
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def _touch(path: Path) -> None:
+    """Mark a panel as recently used (manifest mtime drives LRU eviction)."""
+    now_ns = time.time_ns()
+    try:
+        os.utime(path, ns=(now_ns, now_ns))
+    except OSError:
+        pass
+
+
+def _evict_panels(
+    store_dir: Path,
+    *,
+    source_db: str,
+    db_fingerprint: dict[str, Any],
+    keep_key: str,
+    max_panels: int,
+) -> None:
+    """Drop panels of stale source DB versions or schemas, then trim to ``max_panels``."""
+    live: list[tuple[int, Path]] = []
+    for manifest_path in store_dir.glob("*.json"):
+        if manifest_path.stem == keep_key:
+            continue
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            mtime_ns = manifest_path.stat().st_mtime_ns
+        except (OSError, json.JSONDecodeError):
+            continue
+        stale = manifest.get("schema_version") != FEATURE_STORE_SCHEMA_VERSION or (
+            manifest.get("source_db") == source_db
+            and manifest.get("db_fingerprint") != db_fingerprint
+        )
+        if stale:
+            _remove_panel(manifest_path)
+        else:
+            live.append((mtime_ns, manifest_path))
+    live.sort(reverse=True)
+    for _, manifest_path in live[max(max_panels - 1, 0):]:
+        _remove_panel(manifest_path)
+
+
+def _remove_panel(manifest_path: Path) -> None:
+    for path in (manifest_path.with_suffix(".parquet"), manifest_path):
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _write_manifest(manifest_path: Path, payload: dict[str, Any]) -> None:
+    payload = {**payload, "created_at": datetime.now(UTC).isoformat()}
+    tmp_path = manifest_path.with_name(f"{manifest_path.name}.tmp-{os.getpid()}")
+    tmp_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, manifest_path)
@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import math
-from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
+_ISO_DATE_PATTERN = r"\d{4}-\d{2}-\d{2}"
+
 
 @dataclass(frozen=True)
 class PricePath:
@@ -69,9 +69,12 @@ def build_event_portfolio_daily_df(
 ) -> pd.DataFrame:
     """Build equal-weight daily portfolio curves from selected event windows.
 
-    This helper centralizes a common research-runner fast path: price paths are
-    grouped once by code, then each event window is resolved with binary search
-    instead of repeatedly filtering the full price frame.
+    All price paths are concatenated into one (code, date)-sorted array, so each
+    event window resolves to a row range with a single vectorized
+    ``searchsorted``. Windows are then flattened into one return array and
+    summed per (group, date) with ``np.bincount``. Events are flattened in input
+    order, so every per-key sum accumulates in the same order as a per-event
+    loop and the output is bit-identical to it.
     """
     columns = [
         *group_columns,
@@ -95,68 +98,173 @@ def build_event_portfolio_daily_df(
     if missing_event_columns:
         raise ValueError(f"selected_event_df missing required columns: {sorted(missing_event_columns)}")
 
-    price_paths = build_price_path_lookup(price_df, code_column=code_column)
-    aggregate: dict[tuple[Any, ...], list[float]] = defaultdict(lambda: [0.0, 0.0])
-    for event in selected_event_df.to_dict(orient="records"):
-        price_path = price_paths.get(str(event[code_column]))
-        if price_path is None:
-            continue
-        entry_date = _date_key(event.get(entry_date_column))
-        exit_date = _date_key(event.get(exit_date_column))
-        if entry_date is None or exit_date is None:
-            continue
-        path_dates, closes = price_path.slice_inclusive(entry_date, exit_date)
-        if len(path_dates) == 0:
-            continue
-        entry_open = _finite_float(event.get(entry_open_column))
-        if entry_open is None or entry_open <= 0:
-            continue
-        if not np.isfinite(closes).all():
-            continue
-        previous_close = np.concatenate(([entry_open], closes[:-1]))
-        daily_returns = closes / previous_close - 1.0
-        group_key = tuple(event[column] for column in group_columns)
-        for date_value, daily_return in zip(path_dates, daily_returns, strict=True):
-            key = (*group_key, str(date_value))
-            aggregate[key][0] += float(daily_return)
-            aggregate[key][1] += 1.0
-
-    return _portfolio_daily_frame_from_aggregate(
-        aggregate,
-        group_columns=group_columns,
-        columns=columns,
+    price_index = _build_price_index(price_df, code_column=code_column)
+    if price_index is None:
+        return pd.DataFrame(columns=columns)
+    price_codes, price_date_keys, closes, row_keys = price_index
+    key_stride = len(price_date_keys) + 1
+
+    event_codes = selected_event_df[code_column].astype(str).to_numpy()
+    event_code_idx = np.searchsorted(price_codes, event_codes)
+    event_code_idx = np.minimum(event_code_idx, len(price_codes) - 1)
+    entry_dates = _map_date_keys(selected_event_df[entry_date_column])
+    exit_dates = _map_date_keys(selected_event_df[exit_date_column])
+    entry_open = pd.to_numeric(selected_event_df[entry_open_column], errors="coerce").to_numpy(
+        dtype=float
+    )
+    valid = (
+        (price_codes[event_code_idx] == event_codes)
+        & entry_dates.notna().to_numpy()
+        & exit_dates.notna().to_numpy()
+        & np.isfinite(entry_open)
+        & (entry_open > 0)
+    )
+    event_idx = np.flatnonzero(valid)
+    if len(event_idx) == 0:
+        return pd.DataFrame(columns=columns)
+
+    code_base = event_code_idx[event_idx].astype(np.int64) * key_stride
+    entry_rank = np.searchsorted(
+        price_date_keys, entry_dates.to_numpy(dtype=object)[event_idx].astype(str), side="left"
+    )
+    exit_rank = np.searchsorted(
+        price_date_keys, exit_dates.to_numpy(dtype=object)[event_idx].astype(str), side="right"
     )
+    starts = np.searchsorted(row_keys, code_base + entry_rank, side="left")
+    stops = np.searchsorted(row_keys, code_base + exit_rank, side="left")
+    lengths = np.maximum(stops - starts, 0)
+
+    nonfinite_prefix = np.concatenate(([0], np.cumsum(~np.isfinite(closes))))
+    keep = (lengths > 0) & (nonfinite_prefix[stops] - nonfinite_prefix[starts] == 0)
+    event_idx, starts, lengths = event_idx[keep], starts[keep], lengths[keep]
+    if len(event_idx) == 0:
+        return pd.DataFrame(columns=columns)
 
+    offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    positions = np.repeat(starts, lengths) + (np.arange(int(lengths.sum())) - offsets)
+    is_first = np.zeros(len(positions), dtype=bool)
+    is_first[np.cumsum(lengths) - lengths] = True
+    previous_close = np.where(
+        is_first,
+        np.repeat(entry_open[event_idx], lengths),
+        closes[np.maximum(positions - 1, 0)],
+    )
+    daily_returns = closes[positions] / previous_close - 1.0
 
-def _portfolio_daily_frame_from_aggregate(
-    aggregate: Mapping[tuple[Any, ...], list[float]],
+    if group_columns:
+        group_ids = (
+            selected_event_df[list(group_columns)]
+            .groupby(list(group_columns), sort=False, dropna=False, observed=True)
+            .ngroup()
+            .to_numpy()
+        )
+    else:
+        group_ids = np.zeros(len(selected_event_df), dtype=np.int64)
+    date_ranks = row_keys[positions] % key_stride
+    flat_keys = np.repeat(group_ids[event_idx].astype(np.int64), lengths) * key_stride + date_ranks
+    unique_keys, inverse = np.unique(flat_keys, return_inverse=True)
+    sums = np.bincount(inverse, weights=daily_returns)
+    counts = np.bincount(inverse)
+
+    first_event_by_group = pd.Series(np.arange(len(group_ids))).groupby(group_ids).first()
+    key_groups = unique_keys // key_stride
+    representative_rows = first_event_by_group.reindex(key_groups).to_numpy()
+    data: dict[str, Any] = {
+        column: selected_event_df[column].to_numpy(dtype=object)[representative_rows].tolist()
+        for column in group_columns
+    }
+    data["date"] = price_date_keys[unique_keys % key_stride].tolist()
+    data["active_positions"] = counts.astype(int)
+    data["mean_daily_return"] = sums / counts
+    data["mean_daily_return_pct"] = sums / counts * 100.0
+    return _portfolio_daily_frame(pd.DataFrame(data), group_columns=group_columns, columns=columns)
+
+
+def _build_price_index(
+    price_df: pd.DataFrame,
     *,
-    group_columns: Sequence[str],
-    columns: Sequence[str],
-) -> pd.DataFrame:
-    if not aggregate:
-        return pd.DataFrame(columns=list(columns))
-    records = [
+    code_column: str,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+    """Return (codes, date keys, closes, row keys) sorted by (code, date).
+
+    ``row_keys`` encodes ``code_index * (len(date_keys) + 1) + date_rank`` so a
+    per-code date search becomes one global ``searchsorted``.
+    """
+    required = {code_column, "date", "close"}
+    missing = required.difference(price_df.columns)
+    if missing:
+        raise ValueError(f"price_df missing required columns: {sorted(missing)}")
+    working = pd.DataFrame(
         {
-            **dict(zip(group_columns, key[:-1], strict=True)),
-            "date": key[-1],
-            "active_positions": int(values[1]),
-            "mean_daily_return": float(values[0] / values[1]),
-            "mean_daily_return_pct": float(values[0] / values[1] * 100.0),
+            "code": price_df[code_column],
+            "date": _date_key_series(price_df["date"]),
+            "close": pd.to_numeric(price_df["close"], errors="coerce"),
         }
-        for key, values in aggregate.items()
-    ]
-    daily_df = pd.DataFrame(records).sort_values([*group_columns, "date"], kind="stable").reset_index(
-        drop=True
+    ).dropna(subset=["code", "date", "close"])
+    if working.empty:
+        return None
+    price_codes, code_idx = _sorted_factorize(working["code"].astype(str))
+    price_date_keys, date_rank = _sorted_factorize(working["date"].astype(str))
+    row_keys = code_idx.astype(np.int64) * (len(price_date_keys) + 1) + date_rank
+    order = np.argsort(row_keys, kind="stable")
+    return (
+        price_codes,
+        price_date_keys,
+        working["close"].to_numpy(dtype=float)[order],
+        row_keys[order],
     )
-    daily_df["portfolio_value"] = np.nan
-    daily_df["drawdown_pct"] = np.nan
-    for _, group in daily_df.groupby(list(group_columns), observed=True, sort=False):
-        idx = list(group.index)
-        values = (1.0 + daily_df.loc[idx, "mean_daily_return"]).cumprod()
+
+
+def _sorted_factorize(series: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """``np.unique(..., return_inverse=True)`` that only sorts the distinct values."""
+    inverse, uniques = pd.factorize(series, sort=False)
+    unique_values = np.asarray(uniques, dtype=str)
+    order = np.argsort(unique_values, kind="stable")
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    return unique_values[order], rank[inverse]
+
+
+def _map_date_keys(series: pd.Series) -> pd.Series:
+    """Apply ``_date_key`` per distinct value, parsing ISO dates in one pass."""
+    unique_values = pd.Series(series.drop_duplicates().tolist(), dtype=object)
+    is_iso = unique_values.map(lambda value: isinstance(value, str)) & unique_values.astype(
+        str
+    ).str.fullmatch(_ISO_DATE_PATTERN)
+    mapping: dict[Any, str | None] = {}
+    if is_iso.any():
+        iso_values = unique_values[is_iso]
+        parsed = pd.to_datetime(iso_values, format="%Y-%m-%d", errors="coerce")
+        mapping.update(
+            (value, None if pd.isna(stamp) else stamp.strftime("%Y-%m-%d"))
+            for value, stamp in zip(iso_values.tolist(), parsed.tolist(), strict=True)
+        )
+    mapping.update((value, _date_key(value)) for value in unique_values[~is_iso].tolist())
+    return series.map(mapping)
+
+
+def _portfolio_daily_frame(
+    daily_df: pd.DataFrame,
+    *,
+    group_columns: Sequence[str],
+    columns: Sequence[str],
+) -> pd.DataFrame:
+    sort_columns = [*group_columns, "date"]
+    daily_df = daily_df.sort_values(sort_columns, kind="stable").reset_index(drop=True)
+    growth = 1.0 + daily_df["mean_daily_return"]
+    if group_columns:
+        grouped_growth = growth.groupby(
+            [daily_df[column] for column in group_columns], observed=True, sort=False
+        )
+        values = grouped_growth.cumprod()
+        peaks = values.groupby(
+            [daily_df[column] for column in group_columns], observed=True, sort=False
+        ).cummax()
+    else:
+        values = growth.cumprod()
         peaks = values.cummax()
-        daily_df.loc[idx, "portfolio_value"] = values.to_numpy()
-        daily_df.loc[idx, "drawdown_pct"] = ((values / peaks - 1.0) * 100.0).to_numpy()
+    daily_df["portfolio_value"] = values
+    daily_df["drawdown_pct"] = (values / peaks - 1.0) * 100.0
     return daily_df[list(columns)]
 
 
@@ -177,13 +285,3 @@ def _date_key(value: Any) -> str | None:
     if pd.isna(parsed):
         return None
     return str(parsed.strftime("%Y-%m-%d"))
-
-
-def _finite_float(value: Any) -> float | None:
-    try:
-        result = float(value)
-    except (TypeError, ValueError):
-        return None
-    if not math.isfinite(result):
-        return None
-    return result
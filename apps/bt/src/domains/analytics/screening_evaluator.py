@@ -11,7 +11,14 @@ from typing import TYPE_CHECKING, Any, Protocol
 
 import pandas as pd
 
-from src.shared.models.signals import SignalParams, Signals
+from src.domains.analytics.screening_signal_state import (
+    ScreeningSignalState,
+    ScreeningSignalStateStoreLike,
+    build_context_fingerprint,
+    build_signal_state_key,
+)
+from src.shared.models.signals import SignalParams, Signals, normalize_bool_series
+from src.shared.utils.frame_fingerprint import build_frames_fingerprint
 
 if TYPE_CHECKING:
     from src.domains.strategy.runtime.compiler import CompiledStrategyIR
@@ -163,6 +170,123 @@ def _run_generate_signals(
     )
 
 
+def _candidate_series(signals: Signals) -> pd.Series:
+    return normalize_bool_series(signals.entries) & ~normalize_bool_series(signals.exits)
+
+
+def _format_state_date(value: Any) -> str:
+    return pd.Timestamp(value).strftime("%Y-%m-%d")
+
+
+def _run_generate_signals_with_state(
+    *,
+    generate_signals: GenerateSignalsFn,
+    daily: pd.DataFrame,
+    strategy: StrategyLike,
+    data_bundle: StrategyDataBundleLike,
+    stock_code: str,
+    margin_data: Any,
+    statements_data: Any,
+    recent_days: int,
+    state_store: ScreeningSignalStateStoreLike,
+    state_key: str,
+    warmup_sessions: int,
+) -> Signals:
+    """前回の signal state を再利用し、追加された bar だけを評価する。
+
+    前回 ``last_date`` までの warmup 窓の指紋が一致する場合のみ再利用し、
+    新しい bar は warmup 分を含む末尾スライスで評価する。
+    指紋不一致・状態なし・末尾評価の失敗時は全期間を再計算する。
+    """
+    index = daily.index
+    row_count = len(index)
+    run_kwargs: dict[str, Any] = {
+        "generate_signals": generate_signals,
+        "strategy": strategy,
+        "data_bundle": data_bundle,
+        "stock_code": stock_code,
+        "margin_data": margin_data,
+        "statements_data": statements_data,
+        "recent_days": recent_days,
+    }
+    if (
+        not isinstance(index, pd.DatetimeIndex)
+        or not index.is_monotonic_increasing
+        or row_count < warmup_sessions
+        or recent_days <= 0
+    ):
+        return _run_generate_signals(daily=daily, **run_kwargs)
+
+    sector_name = str(data_bundle.stock_sector_mapping.get(stock_code))
+
+    def _fingerprint(end_pos: int) -> str:
+        start = index[end_pos + 1 - warmup_sessions]
+        end = index[end_pos]
+        context = state_store.remember_context_fingerprint(
+            (id(data_bundle), start, end),
+            lambda: build_context_fingerprint(
+                data_bundle.benchmark_data,
+                data_bundle.sector_data,
+                start=start,
+                end=end,
+            ),
+        )
+        return build_frames_fingerprint(
+            [daily, margin_data, statements_data],
+            start=start,
+            end=end,
+            extra=(sector_name, context),
+        )
+
+    candidates: pd.Series | None = None
+    state = state_store.get(state_key, stock_code)
+    if state is not None:
+        last_pos = int(index.get_indexer(pd.DatetimeIndex([state.last_date]))[0])
+        prior_count = len(state.candidates)
+        if (
+            last_pos >= warmup_sessions - 1
+            and 0 < prior_count <= last_pos + 1
+            and _fingerprint(last_pos) == state.fingerprint
+        ):
+            prior = pd.Series(
+                state.candidates,
+                index=index[last_pos + 1 - prior_count : last_pos + 1],
+                dtype=bool,
+            )
+            if last_pos == row_count - 1:
+                # 前回と同一データ: シグナル計算も状態更新も不要
+                return Signals(entries=prior, exits=pd.Series(False, index=prior.index))
+            try:
+                tail_signals = _run_generate_signals(
+                    daily=daily.iloc[last_pos + 1 - warmup_sessions :],
+                    **run_kwargs,
+                )
+                fresh = _candidate_series(tail_signals).reindex(
+                    index[last_pos + 1 :],
+                    fill_value=False,
+                )
+                candidates = pd.concat([prior, fresh.astype(bool)])
+            except Exception:
+                candidates = None
+
+    if candidates is None:
+        signals = _run_generate_signals(daily=daily, **run_kwargs)
+        candidates = _candidate_series(signals)
+
+    keep_count = min(recent_days, row_count)
+    candidates = candidates.reindex(index[row_count - keep_count :], fill_value=False).astype(bool)
+    state_store.put(
+        state_key,
+        stock_code,
+        ScreeningSignalState(
+            last_date=_format_state_date(index[-1]),
+            fingerprint=_fingerprint(row_count - 1),
+            candidates=tuple(bool(value) for value in candidates.to_numpy()),
+        ),
+    )
+    return Signals(entries=candidates, exits=pd.Series(False, index=candidates.index))
+
+
 def build_strategy_signal_cache_token(strategy: StrategyLike) -> str:
     payload = {
         "entry": strategy.entry_params.model_dump(mode="json"),
@@ -206,6 +330,8 @@ def evaluate_stock(
     find_recent_match_date: FindRecentMatchDateFn,
     build_strategy_signal_cache_token_fn: BuildStrategySignalCacheTokenFn = build_strategy_signal_cache_token,
     build_per_stock_signal_cache_key_fn: BuildPerStockSignalCacheKeyFn = build_per_stock_signal_cache_key,
+    signal_state_store: ScreeningSignalStateStoreLike | None = None,
+    incremental_warmup_sessions: Mapping[str, int | None] | None = None,
 ) -> StockEvaluationOutcome:
     matched_dates_by_strategy: dict[str, str] = {}
     processed_strategy_names: set[str] = set()
@@ -243,17 +369,37 @@ def evaluate_stock(
 
             signals = signal_cache.get(cache_key)
             if signals is None:
+                warmup_sessions = (
+                    incremental_warmup_sessions.get(strategy_name)
+                    if incremental_warmup_sessions is not None
+                    else None
+                )
                 try:
-                    signals = _run_generate_signals(
-                        generate_signals=generate_signals,
-                        daily=daily,
-                        strategy=strategy,
-                        data_bundle=data_bundle,
-                        stock_code=stock.code,
-                        margin_data=margin_data,
-                        statements_data=statements_data,
-                        recent_days=recent_days,
-                    )
+                    if signal_state_store is not None and warmup_sessions is not None:
+                        signals = _run_generate_signals_with_state(
+                            generate_signals=generate_signals,
+                            daily=daily,
+                            strategy=strategy,
+                            data_bundle=data_bundle,
+                            stock_code=stock.code,
+                            margin_data=margin_data,
+                            statements_data=statements_data,
+                            recent_days=recent_days,
+                            state_store=signal_state_store,
+                            state_key=build_signal_state_key(cache_token, recent_days),
+                            warmup_sessions=warmup_sessions,
+                        )
+                    else:
+                        signals = _run_generate_signals(
+                            generate_signals=generate_signals,
+                            daily=daily,
+                            strategy=strategy,
+                            data_bundle=data_bundle,
+                            stock_code=stock.code,
+                            margin_data=margin_data,
+                            statements_data=statements_data,
+                            recent_days=recent_days,
+                        )
                 except Exception as exc:
                     warning_by_strategy.append(
                         (strategy_name, f"{stock.code} signal generation failed ({exc})")
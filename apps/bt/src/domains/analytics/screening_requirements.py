@@ -33,6 +33,7 @@ class MultiDataRequirementKey:
     timeframe: Literal["daily", "weekly"]
     period_type: APIPeriodType
     include_forecast_revision: bool
+    margin_pressure_period: int | None = None
 
 
 @dataclass(frozen=True)
@@ -123,6 +124,21 @@ def should_include_forecast_revision(
     return _enabled(entry_params) or _enabled(exit_params)
 
 
+def resolve_margin_pressure_period(
+    entry_params: SignalParams,
+    exit_params: SignalParams,
+) -> int | None:
+    """Return the volume-average period for margin pressure columns, if the signal is on.
+
+    margin_daily carries a single set of pressure columns, so the entry setting
+    wins when entry and exit enable the signal with different periods.
+    """
+    for params in (entry_params, exit_params):
+        if params.margin_pressure.enabled:
+            return params.margin_pressure.period
+    return None
+
+
 def build_strategy_data_requirements(
     *,
     shared_config: SharedConfig,
@@ -159,6 +175,9 @@ def build_strategy_data_requirements(
         timeframe=shared_config.timeframe,
         period_type=resolve_period_type(entry_params, exit_params),
         include_forecast_revision=include_forecast_revision,
+        margin_pressure_period=(
+            resolve_margin_pressure_period(entry_params, exit_params) if include_margin else None
+        ),
     )
 
     benchmark_data_key = TopixDataRequirementKey(start_date=start_date, end_date=end_date) if needs_benchmark else None
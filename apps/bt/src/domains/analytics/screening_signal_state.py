@@ -0,0 +1,169 @@
+"""
+Screening signal state for incremental daily screening.
+
+Keeps, per ``(strategy, stock)``, the last evaluated date, a fingerprint of the
+warmup window that produced it, and the entry candidates of the recent window.
+The next screening run reuses the state when the inputs are unchanged and only
+evaluates the bars appended since ``last_date`` (plus the indicator warmup).
+Any change in strategy parameters, ``recent_days`` or the fingerprinted data
+falls back to a full recompute.
+
+Incremental evaluation is only sound for signals whose value on a bar is fully
+determined by a bounded number of trailing bars (rolling windows). Signals that
+depend on the whole history (EMA, ATR, cumulative flows, disclosure history,
+cross-sectional data) are not listed in ``WINDOW_BOUNDED_SIGNALS`` and always
+recompute in full.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+import pandas as pd
+
+from src.domains.analytics.window_warmup import sum_indicator_lookbacks
+from src.shared.models.signals import SignalParams
+from src.shared.utils.frame_fingerprint import build_frames_fingerprint
+
+SCREENING_SIGNAL_STATE_SCHEMA_VERSION = 2
+
+
+def _always(_params: Any) -> bool:
+    return True
+
+
+def _ma_type_is(*allowed: str, field_name: str) -> Callable[[Any], bool]:
+    def check(params: Any) -> bool:
+        return getattr(params, field_name, None) in allowed
+
+    return check
+
+
+# 増分評価できるシグナル（param_key → パラメータがローリング窓で完結するか）。
+# 末尾 N 本（lookback 系パラメータの合計 + 1）で最終バーの判定を再現できるものに限る。
+# EMA・ATR・累積系・開示履歴・横断データ依存のシグナルは全履歴に依存するため含めない。
+WINDOW_BOUNDED_SIGNALS: dict[str, Callable[[Any], bool]] = {
+    "volume_ratio_above": _ma_type_is("sma", "median", field_name="ma_type"),
+    "volume_ratio_below": _ma_type_is("sma", "median", field_name="ma_type"),
+    "trading_value": _always,
+    "trading_value_range": _always,
+    "period_extrema_break": _always,
+    "period_extrema_position": _always,
+    "retracement_position": _always,
+    "retracement_cross": _always,
+    "bollinger_position": _always,
+    "bollinger_cross": _always,
+    "volatility_percentile": _always,
+    "rsi_threshold": _always,
+    "rsi_spread": _always,
+    "crossover": _ma_type_is("sma", "rsi", field_name="type"),
+    "baseline_deviation": _ma_type_is("sma", field_name="baseline_type"),
+    "baseline_position": _ma_type_is("sma", field_name="baseline_type"),
+    "baseline_cross": _ma_type_is("sma", field_name="baseline_type"),
+    "risk_adjusted_return": _always,
+}
+
+
+class SignalDefinitionLike(Protocol):
+    data_requirements: list[str]
+    enabled_checker: Callable[[SignalParams], bool]
+    param_key: str
+
+
+@dataclass(frozen=True)
+class ScreeningSignalState:
+    """1戦略 x 1銘柄の前回評価状態。
+
+    ``candidates`` は ``last_date`` で終わる直近 ``recent_days`` 本の
+    entry 候補（entries かつ not exits）。
+    """
+
+    last_date: str
+    fingerprint: str
+    candidates: tuple[bool, ...]
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "lastDate": self.last_date,
+            "fingerprint": self.fingerprint,
+            "candidates": [int(value) for value in self.candidates],
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> ScreeningSignalState:
+        return cls(
+            last_date=str(payload["lastDate"]),
+            fingerprint=str(payload["fingerprint"]),
+            candidates=tuple(bool(value) for value in payload["candidates"]),
+        )
+
+
+class ScreeningSignalStateStoreLike(Protocol):
+    def get(self, state_key: str, stock_code: str) -> ScreeningSignalState | None:
+        ...
+
+    def put(self, state_key: str, stock_code: str, state: ScreeningSignalState) -> None:
+        ...
+
+    def remember_context_fingerprint(
+        self,
+        key: Hashable,
+        build: Callable[[], str],
+    ) -> str:
+        ...
+
+
+def build_signal_state_key(strategy_cache_token: str, recent_days: int) -> str:
+    """戦略キャッシュトークンと recent_days から永続化キーを作る。"""
+    payload = f"v{SCREENING_SIGNAL_STATE_SCHEMA_VERSION}|{recent_days}|{strategy_cache_token}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _resolve_param_section(params: SignalParams, param_key: str) -> Any:
+    section: Any = params
+    for name in param_key.split("."):
+        section = getattr(section, name, None)
+        if section is None:
+            return None
+    return section
+
+
+def resolve_incremental_warmup_sessions(
+    entry_params: SignalParams,
+    exit_params: SignalParams,
+    signal_registry: Sequence[SignalDefinitionLike],
+) -> int | None:
+    """増分評価に必要な warmup 営業日数を返す。増分評価できない戦略は None。
+
+    有効なシグナルがすべて WINDOW_BOUNDED_SIGNALS に該当する場合のみ、
+    各シグナルの lookback 系パラメータ合計 + 1 の最大値を返す。
+    それ以外（EMA 系など全履歴依存のシグナルを含む戦略）は全期間再計算にフォールバックする。
+    """
+    warmup = 0
+    for signal_def in signal_registry:
+        for params in (entry_params, exit_params):
+            if not signal_def.enabled_checker(params):
+                continue
+            section = _resolve_param_section(params, signal_def.param_key)
+            is_window_bounded = WINDOW_BOUNDED_SIGNALS.get(signal_def.param_key)
+            if section is None or is_window_bounded is None or not is_window_bounded(section):
+                return None
+            warmup = max(warmup, sum_indicator_lookbacks(section) + 1)
+    return warmup or None
+
+
+def build_context_fingerprint(
+    benchmark_data: pd.DataFrame | None,
+    sector_data: Mapping[str, pd.DataFrame] | None,
+    *,
+    start: Any,
+    end: Any,
+) -> str:
+    """全銘柄共通のベンチマーク・セクターデータの指紋を返す。"""
+    sector_frames = dict(sector_data or {})
+    sector_names = sorted(sector_frames)
+    frames: list[Any] = [benchmark_data, *(sector_frames[name] for name in sector_names)]
+    return build_frames_fingerprint(frames, start=start, end=end, extra=sector_names)
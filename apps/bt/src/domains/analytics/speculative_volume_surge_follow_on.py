@@ -26,8 +26,9 @@ import pandas as pd
 
 from src.domains.analytics.deterministic_sampling import select_deterministic_samples
 from src.domains.analytics.jpx_daily_price_limits import (
+    DAILY_LIMIT_WIDTH_MACRO_NAME,
     JPX_DAILY_PRICE_LIMITS_REFERENCE_LABEL,
-    build_standard_daily_limit_width_case_sql,
+    register_price_limit_macros,
 )
 from src.domains.analytics.readonly_duckdb_support import (
     SourceMode,
@@ -532,7 +533,7 @@ def _query_candidate_event_rows(
     follow_on_windows: Sequence[int],
 ) -> pd.DataFrame:
     normalized_code_sql = normalize_code_sql("code")
-    limit_width_sql = build_standard_daily_limit_width_case_sql("prev_close")
+    limit_width_sql = f"{DAILY_LIMIT_WIDTH_MACRO_NAME}(prev_close)"
     unique_initial_ends = sorted(set(extension_windows).union(full_extension_windows))
     follow_on_ranges = sorted(
         {
@@ -1358,6 +1359,7 @@ def run_speculative_volume_surge_follow_on_research(
 
     with _open_analysis_connection(db_path) as ctx:
         conn = ctx.connection
+        register_price_limit_macros(conn)
         available_start_date, available_end_date = fetch_date_range(conn, table_name="stock_data")
         default_start_date = _default_start_date(
             available_start_date=available_start_date,
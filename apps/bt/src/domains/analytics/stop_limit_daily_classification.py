@@ -20,9 +20,10 @@ from typing import Any, Literal, cast
 import pandas as pd
 
 from src.domains.analytics.jpx_daily_price_limits import (
+    DAILY_LIMIT_WIDTH_MACRO_NAME,
     JPX_DAILY_PRICE_LIMITS_REFERENCE_LABEL,
     build_standard_daily_limit_table_df,
-    build_standard_daily_limit_width_case_sql,
+    register_price_limit_macros,
 )
 from src.domains.analytics.readonly_duckdb_support import (
     SourceMode,
@@ -162,7 +163,7 @@ def _classified_stock_days_cte(
     end_date: str | None,
 ) -> tuple[str, list[str]]:
     normalized_code_sql = normalize_code_sql("code")
-    limit_width_sql = build_standard_daily_limit_width_case_sql("prev_close")
+    limit_width_sql = f"{DAILY_LIMIT_WIDTH_MACRO_NAME}(prev_close)"
     single_price_day_sql = (
         f"ABS(open - high) <= {_EPSILON}"
         f" AND ABS(high - low) <= {_EPSILON}"
@@ -874,6 +875,7 @@ def run_stop_limit_daily_classification_research(
         db_path,
         snapshot_prefix="stop-limit-daily-classification-",
     ) as ctx:
+        register_price_limit_macros(ctx.connection)
         market_schema_version = require_market_v5_compatibility(
             ctx.connection,
             required_tables=("stock_data", "stock_master_daily"),
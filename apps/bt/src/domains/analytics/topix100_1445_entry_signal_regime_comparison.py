@@ -50,6 +50,10 @@ from src.domains.analytics.topix100_open_relative_intraday_path import (
     _open_analysis_connection,
     _topix100_stocks_cte,
 )
+from src.infrastructure.db.market.intraday_cube_queries import (
+    intraday_cubes_cover_range,
+)
+from src.infrastructure.db.market.market_schema import INTRADAY_SNAPSHOT_TIMES
 from src.shared.utils.pandas_type_guards import required_int, required_str
 
 TOPIX100_1445_ENTRY_SIGNAL_REGIME_COMPARISON_EXPERIMENT_ID = (
@@ -490,14 +494,13 @@ def _subgroup_label_map(
     return mapping
 
 
-def _query_base_session_df_from_connection(
-    conn: Any,
+def _raw_daily_session_cte_sql(
     *,
     start_date: str | None,
     end_date: str | None,
     entry_time: str,
     next_session_exit_time: str,
-) -> pd.DataFrame:
+) -> tuple[str, list[Any]]:
     entry_minute = _parse_time_to_minute(entry_time)
     next_session_exit_minute = _parse_time_to_minute(next_session_exit_time)
     date_filter_sql, date_params = _date_filter_sql(
@@ -505,19 +508,7 @@ def _query_base_session_df_from_connection(
         start_date=start_date,
         end_date=end_date,
     )
-    params: list[Any] = [
-        *date_params,
-        entry_minute,
-        entry_minute,
-        next_session_exit_minute,
-        next_session_exit_minute,
-    ]
-    base_session_df = cast(
-        pd.DataFrame,
-        conn.execute(
-            f"""
-            WITH
-            {_topix100_stocks_cte()},
+    sql = f"""
             minute_rows AS (
                 SELECT
                     m.date,
@@ -558,7 +549,86 @@ def _query_base_session_df_from_connection(
                     arg_max(time, minute_of_day) AS same_day_close_time
                 FROM minute_rows
                 GROUP BY date, code
-            ),
+            ),"""
+    return sql, [
+        *date_params,
+        entry_minute,
+        entry_minute,
+        next_session_exit_minute,
+        next_session_exit_minute,
+    ]
+
+
+def _cube_daily_session_cte_sql(
+    *,
+    start_date: str | None,
+    end_date: str | None,
+    entry_time: str,
+    next_session_exit_time: str,
+) -> tuple[str, list[Any]]:
+    # セッション行と snapshot 行は分足の集計条件が同じなので raw 集計と一致する。
+    date_filter_sql, date_params = _date_filter_sql(
+        column_name="session.date",
+        start_date=start_date,
+        end_date=end_date,
+    )
+    sql = f"""
+            daily AS (
+                SELECT
+                    session.date,
+                    session.code,
+                    session.open AS day_open,
+                    session.open_time AS day_open_time,
+                    entry_snapshot.entry_open AS entry_price,
+                    entry_snapshot.entry_time AS entry_actual_time,
+                    exit_snapshot.exit_close AS exit_1030_price,
+                    exit_snapshot.exit_time AS exit_1030_actual_time,
+                    session.close AS same_day_close_price,
+                    session.close_time AS same_day_close_time
+                FROM stock_intraday_sessions session
+                JOIN topix100_stocks s
+                  ON s.normalized_code = session.code
+                LEFT JOIN stock_intraday_snapshots entry_snapshot
+                  ON entry_snapshot.date = session.date
+                 AND entry_snapshot.code = session.code
+                 AND entry_snapshot.snapshot_time = ?
+                LEFT JOIN stock_intraday_snapshots exit_snapshot
+                  ON exit_snapshot.date = session.date
+                 AND exit_snapshot.code = session.code
+                 AND exit_snapshot.snapshot_time = ?
+                WHERE TRUE {date_filter_sql}
+            ),"""
+    return sql, [entry_time, next_session_exit_time, *date_params]
+
+
+def _query_base_session_df_from_connection(
+    conn: Any,
+    *,
+    start_date: str | None,
+    end_date: str | None,
+    entry_time: str,
+    next_session_exit_time: str,
+) -> pd.DataFrame:
+    use_cube = (
+        entry_time in INTRADAY_SNAPSHOT_TIMES
+        and next_session_exit_time in INTRADAY_SNAPSHOT_TIMES
+        and intraday_cubes_cover_range(conn, start_date=start_date, end_date=end_date)
+    )
+    daily_cte_builder = (
+        _cube_daily_session_cte_sql if use_cube else _raw_daily_session_cte_sql
+    )
+    daily_cte_sql, params = daily_cte_builder(
+        start_date=start_date,
+        end_date=end_date,
+        entry_time=entry_time,
+        next_session_exit_time=next_session_exit_time,
+    )
+    base_session_df = cast(
+        pd.DataFrame,
+        conn.execute(
+            f"""
+            WITH
+            {_topix100_stocks_cte()},{daily_cte_sql}
             ordered AS (
                 SELECT
                     date,
@@ -1,8 +1,9 @@
 """
 TOPIX100 open-relative intraday path research.
 
-This module reads minute bars from stock_data_minute_raw, aggregates them into
-N-minute bars, and summarizes how prices evolve from the session open through
+This module reads N-minute bars from the sync-maintained intraday cube (falling
+back to aggregating stock_data_minute_raw when the cube does not cover the
+range), and summarizes how prices evolve from the session open through
 the close for the current TOPIX100 constituent set.
 """
 
@@ -32,6 +33,11 @@ from src.domains.analytics.research_bundle import (
     write_bundle_artifact,
     write_payload_research_bundle,
 )
+from src.infrastructure.db.market.intraday_cube_queries import (
+    intraday_cubes_cover_range,
+    query_intraday_bars,
+)
+from src.infrastructure.db.market.market_schema import INTRADAY_BAR_INTERVAL_MINUTES
 
 TOPIX100_SCALE_CATEGORIES: tuple[str, ...] = (
     "TOPIX Core30",
@@ -273,6 +279,60 @@ def _query_resampled_topix100_intraday_bars_from_connection(
     if interval_minutes <= 0:
         raise ValueError("interval_minutes must be positive")
 
+    if interval_minutes in INTRADAY_BAR_INTERVAL_MINUTES and intraday_cubes_cover_range(
+        conn, start_date=start_date, end_date=end_date
+    ):
+        bars_df = _query_cube_topix100_intraday_bars(
+            conn,
+            interval_minutes=interval_minutes,
+            start_date=start_date,
+            end_date=end_date,
+        )
+    else:
+        bars_df = _query_raw_topix100_intraday_bars(
+            conn,
+            interval_minutes=interval_minutes,
+            start_date=start_date,
+            end_date=end_date,
+        )
+    if bars_df.empty:
+        return _empty_resampled_bars_df()
+
+    bars_df = bars_df.copy()
+    bars_df["bucket_minute"] = bars_df["bucket_minute"].astype(int)
+    bars_df["bucket_time"] = bars_df["bucket_minute"].map(_format_bucket_time)
+    return bars_df.loc[:, list(_RESAMPLED_BAR_COLUMNS)].copy()
+
+
+def _query_cube_topix100_intraday_bars(
+    conn: Any,
+    *,
+    interval_minutes: int,
+    start_date: str | None,
+    end_date: str | None,
+) -> pd.DataFrame:
+    codes = [
+        str(row[0])
+        for row in conn.execute(
+            f"WITH {_topix100_stocks_cte()} SELECT normalized_code FROM topix100_stocks"
+        ).fetchall()
+    ]
+    return query_intraday_bars(
+        conn,
+        interval_minutes=interval_minutes,
+        start_date=start_date,
+        end_date=end_date,
+        codes=codes,
+    )
+
+
+def _query_raw_topix100_intraday_bars(
+    conn: Any,
+    *,
+    interval_minutes: int,
+    start_date: str | None,
+    end_date: str | None,
+) -> pd.DataFrame:
     date_filter_sql, date_params = _date_filter_sql(
         column_name="m.date",
         start_date=start_date,
@@ -284,7 +344,7 @@ def _query_resampled_topix100_intraday_bars_from_connection(
         interval_minutes,
         interval_minutes,
     ]
-    bars_df = cast(
+    return cast(
         pd.DataFrame,
         conn.execute(
             f"""
@@ -364,13 +424,6 @@ def _query_resampled_topix100_intraday_bars_from_connection(
             params,
         ).fetchdf(),
     )
-    if bars_df.empty:
-        return _empty_resampled_bars_df()
-
-    bars_df = bars_df.copy()
-    bars_df["bucket_minute"] = bars_df["bucket_minute"].astype(int)
-    bars_df["bucket_time"] = bars_df["bucket_minute"].map(_format_bucket_time)
-    return bars_df.loc[:, list(_RESAMPLED_BAR_COLUMNS)].copy()
 
 
 def query_topix100_resampled_intraday_bars(
@@ -29,6 +29,17 @@ def estimate_strategy_indicator_warmup_calendar_days(
     return int(math.ceil(max_period * 1.5)) + 5
 
 
+def sum_indicator_lookbacks(value: Any) -> int:
+    """Return the sum of lookback-like integer parameters found in ``value`` (0 if none).
+
+    Chained rolling windows of sizes ``a`` and ``b`` need ``a + b - 1`` bars, so the
+    sum is a safe upper bound on the history a window-bounded computation reads.
+    """
+    candidates: list[int] = []
+    _collect_indicator_period_candidates(value, candidates)
+    return sum(candidates)
+
+
 def resolve_window_load_start_date(
     *,
     dataset_start_date: str,
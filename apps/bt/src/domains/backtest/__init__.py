@@ -1,20 +1,32 @@
-"""Backtest domain package exports."""
+"""Backtest domain package exports.
 
-from .vectorbt_adapter import (
-    ExecutionAdapterProtocol,
-    ExecutionPortfolioProtocol,
-    ExecutionTradeLedgerProtocol,
-    PERCENT_SIZE_TYPE,
-    ROUND_TRIP_DIRECTION_MAP,
-    VectorbtAdapter,
-    VectorbtPortfolioAdapter,
-    VectorbtTradeLedgerAdapter,
-    _round_trip_order_func_nb,
-    canonical_metrics_from_portfolio,
-    ensure_execution_portfolio,
-)
+Execution-engine exports are resolved on first access so that importing
+lightweight submodules (``contracts``, ``core.manifest`` ...) does not load
+vectorbt/numba.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .vectorbt_adapter import (
+        ALLOCATION_SWEEP_LEVEL,
+        ExecutionAdapterProtocol,
+        ExecutionPortfolioProtocol,
+        ExecutionTradeLedgerProtocol,
+        PERCENT_SIZE_TYPE,
+        ROUND_TRIP_DIRECTION_MAP,
+        VectorbtAdapter,
+        VectorbtPortfolioAdapter,
+        VectorbtTradeLedgerAdapter,
+        _round_trip_order_func_nb,
+        canonical_metrics_from_portfolio,
+        ensure_execution_portfolio,
+        sweep_metrics_frame,
+    )
 
 __all__ = [
+    "ALLOCATION_SWEEP_LEVEL",
     "ExecutionAdapterProtocol",
     "ExecutionPortfolioProtocol",
     "ExecutionTradeLedgerProtocol",
@@ -26,4 +38,13 @@ __all__ = [
     "_round_trip_order_func_nb",
     "canonical_metrics_from_portfolio",
     "ensure_execution_portfolio",
+    "sweep_metrics_frame",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(".vectorbt_adapter", __name__), name)
+    globals()[name] = value
+    return value
@@ -1,12 +1,30 @@
-"""Backtest execution boundary for Phase 4C."""
+"""Backtest execution boundary for Phase 4C.
 
-from src.domains.backtest.core.report_renderer import (
-    BacktestReportPathPlanner,
-    StaticHtmlReportRenderer,
-)
-from src.domains.backtest.core.runner import BacktestResult, BacktestRunner
-from src.domains.backtest.core.signal_attribution import SignalAttributionAnalyzer
-from src.domains.backtest.core.walkforward import WalkForwardSplit, generate_walkforward_splits
+Exports are resolved on first access so that importing a single submodule
+(e.g. ``market_universe`` or ``manifest``) does not load the execution engine.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.domains.backtest.core.report_renderer import (
+        BacktestReportPathPlanner,
+        StaticHtmlReportRenderer,
+    )
+    from src.domains.backtest.core.runner import BacktestResult, BacktestRunner
+    from src.domains.backtest.core.signal_attribution import SignalAttributionAnalyzer
+    from src.domains.backtest.core.walkforward import WalkForwardSplit, generate_walkforward_splits
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "BacktestResult": "src.domains.backtest.core.runner",
+    "BacktestRunner": "src.domains.backtest.core.runner",
+    "BacktestReportPathPlanner": "src.domains.backtest.core.report_renderer",
+    "StaticHtmlReportRenderer": "src.domains.backtest.core.report_renderer",
+    "SignalAttributionAnalyzer": "src.domains.backtest.core.signal_attribution",
+    "WalkForwardSplit": "src.domains.backtest.core.walkforward",
+    "generate_walkforward_splits": "src.domains.backtest.core.walkforward",
+}
 
 __all__ = [
     "BacktestResult",
@@ -17,3 +35,12 @@ __all__ = [
     "WalkForwardSplit",
     "generate_walkforward_splits",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, Literal, Protocol, cast, runtime_checkable
 
@@ -27,6 +28,16 @@ ROUND_TRIP_DIRECTION_MAP = {
     "both": int(Direction.Both),
 }
 PERCENT_SIZE_TYPE = int(SizeType.Percent)
+ALLOCATION_SWEEP_LEVEL = "allocation"
+SWEEP_METRIC_COLUMNS: tuple[str, ...] = (
+    "total_return",
+    "sharpe_ratio",
+    "sortino_ratio",
+    "calmar_ratio",
+    "max_drawdown",
+    "win_rate",
+    "trade_count",
+)
 
 
 def resolve_vectorbt_engine(engine: str | None = None) -> VectorbtEngine:
@@ -177,6 +188,24 @@ class ExecutionAdapterProtocol(Protocol):
     ) -> ExecutionPortfolioProtocol:
         ...
 
+    def create_signal_portfolio_sweep(
+        self,
+        *,
+        close: pd.DataFrame,
+        entries: pd.DataFrame,
+        exits: pd.DataFrame,
+        sizes: Sequence[float],
+        direction: str,
+        init_cash: float,
+        fees: float,
+        slippage: float,
+        size_type: str = "percent",
+        call_seq: str | None = "auto",
+        max_size: float | None = None,
+        freq: str = "D",
+    ) -> ExecutionPortfolioProtocol:
+        ...
+
     def create_round_trip_portfolio(
         self,
         *,
@@ -432,6 +461,54 @@ class VectorbtAdapter:
 
         return ensure_execution_portfolio(vbt.Portfolio.from_signals(**portfolio_kwargs))
 
+    def create_signal_portfolio_sweep(
+        self,
+        *,
+        close: pd.DataFrame,
+        entries: pd.DataFrame,
+        exits: pd.DataFrame,
+        sizes: Sequence[float],
+        direction: str,
+        init_cash: float,
+        fees: float,
+        slippage: float,
+        size_type: str = "percent",
+        call_seq: str | None = "auto",
+        max_size: float | None = None,
+        freq: str = "D",
+    ) -> ExecutionPortfolioProtocol:
+        """Simulate one cash-shared group per size in a single broadcast run.
+
+        Columns are tiled under an ``ALLOCATION_SWEEP_LEVEL`` level so every
+        size gets its own cash pool; grouped metrics are indexed by size.
+        """
+        size_values = list(dict.fromkeys(float(value) for value in sizes))
+        if not size_values:
+            raise ValueError("sizes must not be empty")
+        keys = pd.Index(size_values, name=ALLOCATION_SWEEP_LEVEL)
+        n_tiles = len(size_values)
+        portfolio_kwargs: dict[str, Any] = {
+            "close": close.vbt.tile(n_tiles, keys=keys),
+            "entries": entries.vbt.tile(n_tiles, keys=keys),
+            "exits": exits.vbt.tile(n_tiles, keys=keys),
+            "size": np.repeat(np.asarray(size_values), close.shape[1])[None, :],
+            "size_type": size_type,
+            "direction": direction,
+            "init_cash": init_cash,
+            "fees": fees,
+            "slippage": slippage,
+            "cash_sharing": True,
+            "group_by": ALLOCATION_SWEEP_LEVEL,
+            "freq": freq,
+            "engine": self.engine,
+        }
+        if call_seq is not None:
+            portfolio_kwargs["call_seq"] = call_seq
+        if max_size is not None:
+            portfolio_kwargs["max_size"] = max_size
+
+        return ensure_execution_portfolio(vbt.Portfolio.from_signals(**portfolio_kwargs))
+
     def create_round_trip_portfolio(
         self,
         *,
@@ -500,6 +577,41 @@ def ensure_execution_portfolio(portfolio: Any) -> Any:
     return portfolio
 
 
+def _metric_series(obj: Any, method_name: str, index: pd.Index | None = None) -> pd.Series:
+    try:
+        value = getattr(obj, method_name)()
+    except Exception:
+        value = None
+    if isinstance(value, pd.Series):
+        series = pd.to_numeric(value, errors="coerce").astype(float)
+        return series if index is None else series.reindex(index)
+    return pd.Series(np.nan, index=index, dtype=float)
+
+
+def sweep_metrics_frame(portfolio: Any) -> pd.DataFrame:
+    """Return one row of canonical metrics per group of a sweep portfolio."""
+
+    adapted = ensure_execution_portfolio(portfolio)
+    total_return = _metric_series(adapted, "total_return")
+    index = total_return.index
+    trades = adapted.trades
+    frame = pd.DataFrame(
+        {
+            "total_return": total_return,
+            "sharpe_ratio": _metric_series(adapted, "sharpe_ratio", index),
+            "sortino_ratio": _metric_series(adapted, "sortino_ratio", index),
+            "calmar_ratio": _metric_series(adapted, "calmar_ratio", index),
+            "max_drawdown": _metric_series(adapted, "max_drawdown", index),
+            "win_rate": _metric_series(trades, "win_rate", index),
+            "trade_count": _metric_series(trades, "count", index),
+        },
+        index=index,
+    )
+    frame = frame.replace([np.inf, -np.inf], np.nan)
+    frame["trade_count"] = frame["trade_count"].fillna(0).astype(int)
+    return frame.loc[:, list(SWEEP_METRIC_COLUMNS)]
+
+
 def canonical_metrics_from_portfolio(
     portfolio: Any,
 ) -> CanonicalExecutionMetrics | None:
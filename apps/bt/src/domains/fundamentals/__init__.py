@@ -1,5 +1,11 @@
 """Fundamentals domain package."""
 
+from src.domains.fundamentals.batch_calculator import (
+    calculate_latest_valuation_frame,
+    calculate_statement_metrics_frame,
+    normalize_statement_frame,
+    statement_frame_from_statements,
+)
 from src.domains.fundamentals.calculator import FundamentalsCalculator
 from src.domains.fundamentals.eps_metric_snapshot import (
     EpsMetricSnapshot,
@@ -13,16 +19,22 @@ from src.domains.fundamentals.models import (
 )
 from src.domains.fundamentals.valuation_primitives import (
     market_cap_from_price_and_shares,
+    market_cap_series,
     positive_ratio,
     valuation_ratio,
     valuation_ratio_series,
 )
 from src.domains.fundamentals.statement_adapter import (
     market_statement_row_to_jquants_statement,
+    market_statement_rows_to_frame,
 )
 
 __all__ = [
     "FundamentalsCalculator",
+    "calculate_latest_valuation_frame",
+    "calculate_statement_metrics_frame",
+    "normalize_statement_frame",
+    "statement_frame_from_statements",
     "EpsMetricSnapshot",
     "build_eps_metric_snapshot",
     "FundamentalDataPoint",
@@ -33,5 +45,7 @@ __all__ = [
     "valuation_ratio",
     "valuation_ratio_series",
     "market_cap_from_price_and_shares",
+    "market_cap_series",
     "market_statement_row_to_jquants_statement",
+    "market_statement_rows_to_frame",
 ]
@@ -0,0 +1,815 @@
+"""Columnar batch fundamentals calculations.
+
+``FundamentalsCalculator`` evaluates one statement (or one code) at a time.
+Screening and ranking refreshes need the same metrics for thousands of codes,
+so this module takes flat statement / price frames covering many codes and
+applies the same rules column-wise: consolidated fallbacks, forecast
+selection, payout-ratio normalization, share-count adjustment and as-of price
+lookup. Values are rounded with Python's ``round(value, 2)`` per element so
+the output matches the scalar path exactly.
+
+Statement frames use ``JQuantsStatement`` field names (``Code``, ``DiscDate``,
+``EPS`` ...); price frames carry ``Code``, ``Date`` and ``Close`` columns.
+Output frames use ``FundamentalDataPoint`` / ``DailyValuationDataPoint`` field
+names plus ``Code``, with NaN / None where the scalar path returns ``None``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.infrastructure.external_api.jquants_client import JQuantsStatement
+from src.shared.models.types import normalize_period_type
+from src.shared.utils.share_adjustment import (
+    ShareAdjustmentEvent,
+    adjust_share_count_to_price_basis,
+)
+from src.shared.utils.statement_document import is_actual_fy_financial_statement
+
+from .valuation_primitives import market_cap_series, valuation_ratio_series
+
+STATEMENT_TEXT_COLUMNS: tuple[str, ...] = (
+    "Code",
+    "DiscDate",
+    "DocType",
+    "CurPerType",
+    "CurPerEn",
+)
+STATEMENT_NUMERIC_COLUMNS: tuple[str, ...] = (
+    "Sales",
+    "OP",
+    "NP",
+    "EPS",
+    "DEPS",
+    "TA",
+    "Eq",
+    "BPS",
+    "CFO",
+    "CFI",
+    "CFF",
+    "CashEq",
+    "ShOutFY",
+    "TrShFY",
+    "FEPS",
+    "NxFEPS",
+    "FSales",
+    "NxFSales",
+    "FOP",
+    "NxFOP",
+    "DivFY",
+    "DivAnn",
+    "PayoutRatioAnn",
+    "FDivFY",
+    "FDivAnn",
+    "FPayoutRatioAnn",
+    "NxFDivFY",
+    "NxFDivAnn",
+    "NxFPayoutRatioAnn",
+    "NCSales",
+    "NCOP",
+    "NCNP",
+    "NCEPS",
+    "NCTA",
+    "NCEq",
+    "NCBPS",
+    "FNCEPS",
+    "NxFNCEPS",
+)
+
+_QUARTERLY_PERIOD_TYPES = ("1Q", "2Q", "3Q")
+_QUARTERLY_ANNUALIZATION = {"1Q": 4.0, "2Q": 2.0, "3Q": 4.0 / 3.0}
+
+LATEST_VALUATION_COLUMNS: tuple[str, ...] = (
+    "Code",
+    "date",
+    "close",
+    "eps",
+    "bps",
+    "per",
+    "forwardPer",
+    "sales",
+    "forwardSales",
+    "psr",
+    "forwardPsr",
+    "pOp",
+    "forwardPOp",
+    "pbr",
+    "marketCap",
+    "freeFloatMarketCap",
+    "statementDisclosedDate",
+    "forwardEps",
+    "forwardEpsDisclosedDate",
+    "forwardEpsSource",
+    "forwardSalesDisclosedDate",
+    "forwardSalesSource",
+)
+
+
+# ---------------------------------------------------------------------------
+# Input frames
+# ---------------------------------------------------------------------------
+
+
+def statement_frame_from_statements(statements: Iterable[JQuantsStatement]) -> pd.DataFrame:
+    """Flatten ``JQuantsStatement`` models into a normalized statement frame."""
+    columns = (*STATEMENT_TEXT_COLUMNS, *STATEMENT_NUMERIC_COLUMNS)
+    frame = pd.DataFrame.from_records(
+        [tuple(getattr(stmt, column) for column in columns) for stmt in statements],
+        columns=list(columns),
+    )
+    return normalize_statement_frame(frame)
+
+
+def normalize_statement_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Return a frame holding exactly the statement columns, typed.
+
+    Missing numeric columns become NaN and missing text columns become empty
+    strings, mirroring the ``None`` defaults of ``JQuantsStatement``.
+    """
+    source = frame.reset_index(drop=True)
+    columns: dict[str, Any] = {}
+    for column in STATEMENT_TEXT_COLUMNS:
+        if column not in source.columns:
+            columns[column] = np.full(len(source), "", dtype=object)
+        else:
+            columns[column] = _text_column(source[column]).to_numpy()
+    for column in STATEMENT_NUMERIC_COLUMNS:
+        if column not in source.columns:
+            columns[column] = np.full(len(source), np.nan)
+        else:
+            columns[column] = pd.to_numeric(source[column], errors="coerce").to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(source)))
+
+
+def _text_column(values: pd.Series) -> pd.Series:
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.strftime("%Y-%m-%d").fillna("")
+    if pd.api.types.infer_dtype(values, skipna=True) in {"string", "empty"}:
+        return values.where(values.notna(), "").astype(object)
+    return values.map(_to_text).astype(object)
+
+
+def _to_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, pd.Timestamp):
+        return value.strftime("%Y-%m-%d")
+    if not isinstance(value, str) and pd.isna(value):
+        return ""
+    return str(value)
+
+
+# ---------------------------------------------------------------------------
+# Per-statement metrics (``_calculate_all_metrics`` + share adjustments)
+# ---------------------------------------------------------------------------
+
+
+def calculate_statement_metrics_frame(
+    statements: pd.DataFrame,
+    prices: pd.DataFrame | None = None,
+    *,
+    prefer_consolidated: bool,
+    share_adjustment_events_by_code: Mapping[str, list[ShareAdjustmentEvent]] | None = None,
+    through_date: str | None = None,
+) -> pd.DataFrame:
+    """Compute per-statement fundamentals for many codes at once.
+
+    Each output row matches ``FundamentalsCalculator._calculate_all_metrics``
+    followed by the per-statement share adjustment of
+    ``apply_share_adjustments`` for the same code. ``stockPrice`` is the last
+    close on or before each disclosure date.
+    """
+    frame = normalize_statement_frame(statements)
+    period = _period_types(frame["CurPerType"])
+    is_fy = period == "FY"
+    stock_price = _price_at_disclosure(frame, prices)
+
+    eps = _with_fallback(frame, "EPS", "NCEPS", prefer_consolidated)
+    bps = _with_fallback(frame, "BPS", "NCBPS", prefer_consolidated)
+    net_profit = _with_fallback(frame, "NP", "NCNP", prefer_consolidated)
+    equity = _with_fallback(frame, "Eq", "NCEq", prefer_consolidated)
+    total_assets = _with_fallback(frame, "TA", "NCTA", prefer_consolidated)
+    net_sales = _with_fallback(frame, "Sales", "NCSales", prefer_consolidated)
+    operating_profit = _with_fallback(frame, "OP", "NCOP", prefer_consolidated)
+
+    annualized_profit = net_profit * period.map(_QUARTERLY_ANNUALIZATION).fillna(1.0)
+    annualized_profit = annualized_profit.where(period.isin(_QUARTERLY_PERIOD_TYPES), net_profit)
+    roe = _percent(annualized_profit, equity, equity > 0)
+    roa = _percent(net_profit, total_assets, total_assets > 0)
+    operating_margin = _percent(operating_profit, net_sales, net_sales > 0)
+    net_margin = _percent(net_profit, net_sales, net_sales > 0)
+
+    cfo = frame["CFO"]
+    fcf = (cfo + frame["CFI"]).where(cfo.notna() & frame["CFI"].notna())
+    market_cap = _free_float_market_cap(stock_price, frame["ShOutFY"], frame["TrShFY"])
+    fcf_yield = _percent(fcf, market_cap, market_cap.notna())
+    cfo_yield = _percent(cfo, market_cap, market_cap.notna())
+    fcf_margin = _percent(fcf, net_sales, net_sales > 0)
+    cfo_margin = _percent(cfo, net_sales, net_sales > 0)
+    cfo_to_net_profit = (cfo / net_profit).where(cfo.notna() & (net_profit != 0))
+
+    if prefer_consolidated:
+        forecast_eps = _forecast_pick(is_fy, frame["NxFEPS"], frame["FEPS"])
+        forecast_sales = _forecast_pick(is_fy, frame["NxFSales"], frame["FSales"])
+        forecast_operating_profit = _forecast_pick(is_fy, frame["NxFOP"], frame["FOP"])
+    else:
+        forecast_eps = _forecast_pick(is_fy, frame["NxFNCEPS"], frame["FNCEPS"])
+        forecast_sales = pd.Series(np.nan, index=frame.index)
+        forecast_operating_profit = pd.Series(np.nan, index=frame.index)
+
+    raw_dividend = _coalesce(frame["DivAnn"], frame["DivFY"])
+    dividend = _round2(raw_dividend)
+    forecast_dividend = _round2(
+        _forecast_pick(
+            is_fy,
+            _coalesce(frame["NxFDivAnn"], frame["NxFDivFY"]),
+            _coalesce(frame["FDivAnn"], frame["FDivFY"]),
+        )
+    )
+    payout_ratio = _round2(_normalize_payout_ratio(frame["PayoutRatioAnn"], raw_dividend, eps))
+    forecast_payout_ratio = _round2(
+        _forecast_pick(
+            is_fy,
+            _normalize_payout_ratio(
+                frame["NxFPayoutRatioAnn"],
+                _coalesce(frame["NxFDivAnn"], frame["NxFDivFY"]),
+                frame["NxFEPS"],
+            ),
+            _normalize_payout_ratio(
+                frame["FPayoutRatioAnn"],
+                _coalesce(frame["FDivAnn"], frame["FDivFY"]),
+                frame["FEPS"],
+            ),
+        )
+    )
+
+    rounded_eps = _round2(eps)
+    rounded_bps = _round2(bps)
+    rounded_forecast_eps = _round2(forecast_eps)
+    current_shares = _shares_by_statement_key(frame, period)
+    base_shares = _baseline_shares_by_code(
+        frame,
+        period,
+        share_adjustment_events_by_code or {},
+        through_date=lambda _code: through_date,
+    )
+    adjusted_eps = _adjusted_value(rounded_eps, current_shares, base_shares)
+    adjusted_bps = _adjusted_value(rounded_bps, current_shares, base_shares)
+    adjusted_forecast_eps = _adjusted_value(rounded_forecast_eps, current_shares, base_shares)
+    adjusted_dividend = _adjusted_value(dividend, current_shares, base_shares)
+    adjusted_forecast_dividend = _adjusted_value(forecast_dividend, current_shares, base_shares)
+    display_eps = _coalesce(adjusted_eps, rounded_eps)
+    display_bps = _coalesce(adjusted_bps, rounded_bps)
+
+    return pd.DataFrame(
+        {
+            "Code": frame["Code"],
+            "date": frame["CurPerEn"],
+            "disclosedDate": frame["DiscDate"],
+            "periodType": period.where(period.notna(), frame["CurPerType"]),
+            "isConsolidated": _is_consolidated(frame),
+            "accountingStandard": _map_unique(frame["DocType"], _accounting_standard),
+            "roe": _round2(roe),
+            "eps": rounded_eps,
+            "dilutedEps": _round2(frame["DEPS"]),
+            "bps": rounded_bps,
+            "adjustedEps": adjusted_eps,
+            "adjustedForecastEps": adjusted_forecast_eps,
+            "adjustedBps": adjusted_bps,
+            "dividendFy": dividend,
+            "adjustedDividendFy": adjusted_dividend,
+            "forecastDividendFy": forecast_dividend,
+            "adjustedForecastDividendFy": adjusted_forecast_dividend,
+            "forecastDividendFyChangeRate": _round2(
+                _change_rate(
+                    _coalesce(adjusted_dividend, dividend),
+                    _coalesce(adjusted_forecast_dividend, forecast_dividend),
+                )
+            ),
+            "payoutRatio": payout_ratio,
+            "forecastPayoutRatio": forecast_payout_ratio,
+            "forecastPayoutRatioChangeRate": _round2(
+                _change_rate(payout_ratio, forecast_payout_ratio)
+            ),
+            "per": _round2(valuation_ratio_series(stock_price, display_eps)),
+            "pbr": _round2(valuation_ratio_series(stock_price, display_bps)),
+            "roa": _round2(roa),
+            "operatingMargin": _round2(operating_margin),
+            "netMargin": _round2(net_margin),
+            "stockPrice": stock_price,
+            "netProfit": net_profit / 1_000_000,
+            "equity": equity / 1_000_000,
+            "totalAssets": total_assets / 1_000_000,
+            "netSales": net_sales / 1_000_000,
+            "operatingProfit": operating_profit / 1_000_000,
+            "cashFlowOperating": cfo / 1_000_000,
+            "cashFlowInvesting": frame["CFI"] / 1_000_000,
+            "cashFlowFinancing": frame["CFF"] / 1_000_000,
+            "cashAndEquivalents": frame["CashEq"] / 1_000_000,
+            "fcf": _round2(fcf) / 1_000_000,
+            "fcfYield": _round2(fcf_yield),
+            "fcfMargin": _round2(fcf_margin),
+            "cfoYield": _round2(cfo_yield),
+            "cfoMargin": _round2(cfo_margin),
+            "cfoToNetProfitRatio": _round2(cfo_to_net_profit),
+            "forecastEps": rounded_forecast_eps,
+            "forecastEpsChangeRate": _round2(_change_rate(eps, forecast_eps)),
+            "forecastSales": forecast_sales / 1_000_000,
+            "forecastSalesChangeRate": _round2(_change_rate(net_sales, forecast_sales)),
+            "forecastOperatingProfit": forecast_operating_profit / 1_000_000,
+            "forecastOperatingProfitChangeRate": _round2(
+                _change_rate(operating_profit, forecast_operating_profit)
+            ),
+        }
+    )
+
+
+def _price_at_disclosure(frame: pd.DataFrame, prices: pd.DataFrame | None) -> pd.Series:
+    """Last close on or before each statement's disclosure date (per code)."""
+    result = pd.Series(np.nan, index=frame.index, dtype=np.float64)
+    if prices is None or prices.empty or frame.empty:
+        return result
+    left = pd.DataFrame(
+        {
+            "Code": frame["Code"].astype(str),
+            "_key": pd.to_datetime(frame["DiscDate"], format="%Y-%m-%d", errors="coerce"),
+            "_row": frame.index,
+        }
+    ).dropna(subset=["_key"])
+    right = pd.DataFrame(
+        {
+            "Code": prices["Code"].astype(str),
+            "_key": pd.to_datetime(prices["Date"], format="%Y-%m-%d", errors="coerce"),
+            "Close": pd.to_numeric(prices["Close"], errors="coerce"),
+        }
+    ).dropna(subset=["_key"])
+    if left.empty or right.empty:
+        return result
+    merged = pd.merge_asof(
+        left.sort_values("_key", kind="stable"),
+        right.sort_values("_key", kind="stable"),
+        on="_key",
+        by="Code",
+        direction="backward",
+    )
+    result.loc[merged["_row"].to_numpy()] = merged["Close"].to_numpy(dtype=np.float64)
+    return result
+
+
+def _shares_by_statement_key(frame: pd.DataFrame, period: pd.Series) -> pd.Series:
+    """``ShOutFY`` looked up by (code, period end, disclosure, period) with last-wins."""
+    keys = pd.DataFrame(
+        {
+            "Code": frame["Code"],
+            "CurPerEn": frame["CurPerEn"],
+            "DiscDate": frame["DiscDate"],
+            "_period": period.fillna(""),
+        }
+    )
+    key_columns = ["Code", "CurPerEn", "DiscDate", "_period"]
+    last_shares = (
+        keys.assign(ShOutFY=frame["ShOutFY"])
+        .drop_duplicates(key_columns, keep="last")
+    )
+    merged = keys.merge(last_shares, on=key_columns, how="left", sort=False)
+    return pd.Series(merged["ShOutFY"].to_numpy(dtype=np.float64), index=frame.index)
+
+
+# ---------------------------------------------------------------------------
+# Latest valuation (``calculate_latest_valuation``)
+# ---------------------------------------------------------------------------
+
+
+def calculate_latest_valuation_frame(
+    statements: pd.DataFrame,
+    prices: pd.DataFrame,
+    *,
+    prefer_consolidated: bool,
+    share_adjustment_events_by_code: Mapping[str, list[ShareAdjustmentEvent]] | None = None,
+    price_basis_date: str | None = None,
+) -> pd.DataFrame:
+    """Compute ``calculate_latest_valuation`` for every code in ``prices``.
+
+    ``prices`` holds one ``(Code, Date, Close)`` row per code (the last row
+    wins on duplicates). Codes without an applicable FY statement are omitted,
+    matching the scalar path returning ``None``.
+    """
+    frame = normalize_statement_frame(statements)
+    quotes = pd.DataFrame(
+        {
+            "Code": prices["Code"].astype(str),
+            "Date": prices["Date"].map(_to_text),
+            "Close": pd.to_numeric(prices["Close"], errors="coerce").astype(np.float64),
+        }
+    ).drop_duplicates("Code", keep="last")
+    if frame.empty or quotes.empty:
+        return pd.DataFrame(columns=list(LATEST_VALUATION_COLUMNS))
+
+    frame = frame[frame["Code"].isin(quotes["Code"])].reset_index(drop=True)
+    frame["_order"] = np.arange(len(frame))
+    period = _period_types(frame["CurPerType"])
+    basis_by_code = dict(zip(quotes["Code"].tolist(), quotes["Date"].tolist(), strict=True))
+    events_by_code = share_adjustment_events_by_code or {}
+
+    def through_date(code: str) -> str | None:
+        return price_basis_date or basis_by_code.get(code)
+
+    frame["_period"] = period
+    frame["_base"] = _baseline_shares_by_code(frame, period, events_by_code, through_date=through_date)
+    treasury_by_code = _adjusted_snapshot_by_code(
+        _latest_share_snapshots(frame, period, "TrShFY", allow_zero=True),
+        events_by_code,
+        through_date=through_date,
+        allow_zero=True,
+    )
+
+    fy = _applicable_fy_points(frame, quotes, prefer_consolidated=prefer_consolidated)
+    if fy.empty:
+        return pd.DataFrame(columns=list(LATEST_VALUATION_COLUMNS))
+
+    revisions = frame[period.isin(_QUARTERLY_PERIOD_TYPES)].merge(
+        fy[["Code", "fyDisclosedDate", "Date"]],
+        on="Code",
+        how="inner",
+    )
+    revisions = revisions[
+        (revisions["DiscDate"] > revisions["fyDisclosedDate"])
+        & (revisions["DiscDate"] <= revisions["Date"])
+    ].sort_values(["Code", "DiscDate", "_order"], ascending=[True, False, True])
+
+    revised_eps_raw = revisions["FEPS"] if prefer_consolidated else revisions["FNCEPS"]
+    revised_eps = _first_per_code(revisions, revised_eps_raw)
+    revised_eps["value"] = _coalesce(
+        _adjusted_value(revised_eps["raw"], revised_eps["ShOutFY"], revised_eps["_base"]),
+        _round2(revised_eps["raw"]),
+    )
+    if prefer_consolidated:
+        revised_op = _first_per_code(revisions, revisions["FOP"])
+        revised_sales = _first_per_code(revisions, revisions["FSales"])
+    else:
+        missing = pd.Series(np.nan, index=revisions.index)
+        revised_op = _first_per_code(revisions, missing)
+        revised_sales = _first_per_code(revisions, missing)
+
+    result = fy.merge(
+        revised_eps[["Code", "value", "DiscDate"]].rename(
+            columns={"value": "_revisedEps", "DiscDate": "_revisedEpsDate"}
+        ),
+        on="Code",
+        how="left",
+    )
+    result = result.merge(
+        revised_op[["Code", "raw"]].rename(columns={"raw": "_revisedOp"}),
+        on="Code",
+        how="left",
+    )
+    result = result.merge(
+        revised_sales[["Code", "raw", "DiscDate"]].rename(
+            columns={"raw": "_revisedSales", "DiscDate": "_revisedSalesDate"}
+        ),
+        on="Code",
+        how="left",
+    )
+
+    has_revised_eps = result["_revisedEpsDate"].notna()
+    forward_eps = result["_revisedEps"].where(has_revised_eps, result["fyForwardEps"])
+    forward_eps_date = result["_revisedEpsDate"].where(has_revised_eps, result["fyForwardEpsDate"])
+    forward_eps_source = pd.Series("revised", index=result.index, dtype=object).where(
+        has_revised_eps, result["fyForwardEpsSource"]
+    )
+    forward_operating_profit = result["_revisedOp"].where(
+        result["_revisedOp"].notna(), result["fyForwardOp"]
+    )
+    has_revised_sales = result["_revisedSalesDate"].notna()
+    forward_sales = result["_revisedSales"].where(has_revised_sales, result["fyForwardSales"])
+    forward_sales_date = result["_revisedSalesDate"].where(
+        has_revised_sales, result["fyForwardSalesDate"]
+    )
+    forward_sales_source = pd.Series("revised", index=result.index, dtype=object).where(
+        has_revised_sales, result["fyForwardSalesSource"]
+    )
+
+    close = result["Close"]
+    baseline = result["_base"]
+    market_cap = _round2(market_cap_series(close, baseline))
+    treasury = result["Code"].map(treasury_by_code).astype(np.float64)
+    free_float = _round2(_free_float_market_cap(close, baseline, treasury))
+
+    output = pd.DataFrame(
+        {
+            "Code": result["Code"],
+            "date": result["Date"],
+            "close": close,
+            "eps": result["fyEps"],
+            "bps": result["fyBps"],
+            "per": _round2(valuation_ratio_series(close, result["fyEps"])),
+            "forwardPer": _round2(valuation_ratio_series(close, forward_eps)),
+            "sales": result["fySales"],
+            "forwardSales": forward_sales,
+            "psr": _round2(valuation_ratio_series(market_cap, result["fySales"])),
+            "forwardPsr": _round2(valuation_ratio_series(market_cap, forward_sales)),
+            "pOp": _round2(valuation_ratio_series(market_cap, result["fyOp"])),
+            "forwardPOp": _round2(valuation_ratio_series(market_cap, forward_operating_profit)),
+            "pbr": _round2(valuation_ratio_series(close, result["fyBps"])),
+            "marketCap": market_cap,
+            "freeFloatMarketCap": free_float.where(baseline.notna()),
+            "statementDisclosedDate": result["fyDisclosedDate"],
+            "forwardEps": forward_eps,
+            "forwardEpsDisclosedDate": _optional_text(forward_eps_date),
+            "forwardEpsSource": _optional_text(forward_eps_source),
+            "forwardSalesDisclosedDate": _optional_text(forward_sales_date),
+            "forwardSalesSource": _optional_text(forward_sales_source),
+        }
+    )
+    return output.sort_values("Code", kind="stable").reset_index(drop=True)
+
+
+def _applicable_fy_points(
+    frame: pd.DataFrame,
+    quotes: pd.DataFrame,
+    *,
+    prefer_consolidated: bool,
+) -> pd.DataFrame:
+    """Latest valid actual-FY point disclosed on or before each quote date."""
+    # ``is_actual_fy_financial_statement`` is False unless the period is FY, so
+    # the document check only needs evaluating once per distinct DocType.
+    actual_fy_document = _map_unique(
+        frame["DocType"],
+        lambda doc_type: is_actual_fy_financial_statement(
+            "FY",
+            doc_type,
+            allow_unknown_document=True,
+        ),
+    )
+    actual_fy = (frame["_period"] == "FY") & actual_fy_document.astype(bool)
+    fy = frame[actual_fy.astype(bool)]
+    eps = _with_fallback(fy, "EPS", "NCEPS", prefer_consolidated)
+    bps = _with_fallback(fy, "BPS", "NCBPS", prefer_consolidated)
+    if prefer_consolidated:
+        forecast_eps = _coalesce(fy["NxFEPS"], fy["FEPS"])
+        forecast_op = _coalesce(fy["NxFOP"], fy["FOP"])
+        forward_sales = _coalesce(fy["NxFSales"], fy["FSales"])
+    else:
+        forecast_eps = _coalesce(fy["NxFNCEPS"], fy["FNCEPS"])
+        forecast_op = pd.Series(np.nan, index=fy.index)
+        forward_sales = pd.Series(np.nan, index=fy.index)
+
+    display_eps = _coalesce(_adjusted_value(eps, fy["ShOutFY"], fy["_base"]), eps)
+    display_bps = _coalesce(_adjusted_value(bps, fy["ShOutFY"], fy["_base"]), bps)
+    display_forecast_eps = _coalesce(
+        _adjusted_value(forecast_eps, fy["ShOutFY"], fy["_base"]),
+        _round2(forecast_eps),
+    )
+    points = pd.DataFrame(
+        {
+            "Code": fy["Code"],
+            "_order": fy["_order"],
+            "_base": fy["_base"],
+            "fyDisclosedDate": fy["DiscDate"],
+            "fyEps": display_eps,
+            "fyBps": display_bps,
+            "fyOp": _with_fallback(fy, "OP", "NCOP", prefer_consolidated),
+            "fySales": _with_fallback(fy, "Sales", "NCSales", prefer_consolidated),
+            "fyForwardEps": display_forecast_eps,
+            "fyForwardOp": forecast_op,
+            "fyForwardSales": forward_sales,
+            "fyForwardEpsDate": fy["DiscDate"].where(display_forecast_eps.notna()),
+            "fyForwardEpsSource": pd.Series("fy", index=fy.index, dtype=object).where(
+                display_forecast_eps.notna()
+            ),
+            "fyForwardSalesDate": fy["DiscDate"].where(forward_sales.notna()),
+            "fyForwardSalesSource": pd.Series("fy", index=fy.index, dtype=object).where(
+                forward_sales.notna()
+            ),
+        }
+    )
+    points = points[(display_eps > 0) | (display_bps > 0)]
+    points = points.merge(quotes, on="Code", how="inner")
+    points = points[points["fyDisclosedDate"] <= points["Date"]]
+    points = points.sort_values(["Code", "fyDisclosedDate", "_order"])
+    return points.drop_duplicates("Code", keep="last").reset_index(drop=True)
+
+
+def _first_per_code(revisions: pd.DataFrame, values: pd.Series) -> pd.DataFrame:
+    """First non-null value per code in the (already ordered) revision frame."""
+    candidates = revisions.loc[values.notna(), ["Code", "DiscDate", "ShOutFY", "_base"]].copy()
+    candidates["raw"] = values[values.notna()]
+    return candidates.drop_duplicates("Code", keep="first")
+
+
+# ---------------------------------------------------------------------------
+# Share-count baselines
+# ---------------------------------------------------------------------------
+
+
+def _latest_share_snapshots(
+    frame: pd.DataFrame,
+    period: pd.Series,
+    column: str,
+    *,
+    allow_zero: bool,
+) -> pd.DataFrame:
+    """Latest quarterly (else latest any) share snapshot per code.
+
+    Mirrors ``resolve_latest_quarterly_share_snapshot``: the first statement
+    wins among equal disclosure dates.
+    """
+    values = frame[column]
+    finite = values.notna() & np.isfinite(values)
+    valid = finite & (values >= 0) if allow_zero else finite & (values != 0)
+    candidates = pd.DataFrame(
+        {
+            "Code": frame["Code"],
+            "DiscDate": frame["DiscDate"],
+            "shares": values,
+            "_quarter": period.isin(_QUARTERLY_PERIOD_TYPES),
+            "_order": np.arange(len(frame)),
+        }
+    )[valid]
+    candidates = candidates.sort_values(
+        ["Code", "_quarter", "DiscDate", "_order"],
+        ascending=[True, False, False, True],
+    )
+    return candidates.drop_duplicates("Code", keep="first")
+
+
+def _adjusted_snapshot_by_code(
+    snapshots: pd.DataFrame,
+    events_by_code: Mapping[str, list[ShareAdjustmentEvent]],
+    *,
+    through_date: Callable[[str], str | None],
+    allow_zero: bool = False,
+) -> dict[str, float | None]:
+    return {
+        code: adjust_share_count_to_price_basis(
+            shares,
+            events_by_code.get(code, []),
+            from_date=disclosed_date,
+            through_date=through_date(code),
+            allow_zero=allow_zero,
+        )
+        for code, disclosed_date, shares in zip(
+            snapshots["Code"].tolist(),
+            snapshots["DiscDate"].tolist(),
+            snapshots["shares"].tolist(),
+            strict=True,
+        )
+    }
+
+
+def _baseline_shares_by_code(
+    frame: pd.DataFrame,
+    period: pd.Series,
+    events_by_code: Mapping[str, list[ShareAdjustmentEvent]],
+    *,
+    through_date: Callable[[str], str | None],
+) -> pd.Series:
+    """Baseline ``ShOutFY`` per row, adjusted onto the price basis of its code."""
+    baseline_by_code = _adjusted_snapshot_by_code(
+        _latest_share_snapshots(frame, period, "ShOutFY", allow_zero=False),
+        events_by_code,
+        through_date=through_date,
+    )
+    return frame["Code"].map(baseline_by_code).astype(np.float64)
+
+
+# ---------------------------------------------------------------------------
+# Column-wise scalar rules
+# ---------------------------------------------------------------------------
+
+
+def _period_types(period_types: pd.Series) -> pd.Series:
+    return _map_unique(period_types, normalize_period_type)
+
+
+def _map_unique(values: pd.Series, func: Any) -> pd.Series:
+    mapping = {value: func(value) for value in pd.unique(values)}
+    return values.map(mapping)
+
+
+def _coalesce(primary: pd.Series, fallback: pd.Series) -> pd.Series:
+    return primary.where(primary.notna(), fallback)
+
+
+def _with_fallback(
+    frame: pd.DataFrame,
+    consolidated: str,
+    non_consolidated: str,
+    prefer_consolidated: bool,
+) -> pd.Series:
+    if prefer_consolidated:
+        return _coalesce(frame[consolidated], frame[non_consolidated])
+    return _coalesce(frame[non_consolidated], frame[consolidated])
+
+
+def _forecast_pick(is_fy: pd.Series, next_fy: pd.Series, current_fy: pd.Series) -> pd.Series:
+    """FY statements prefer next-year forecasts; quarters prefer the current year."""
+    return _coalesce(next_fy, current_fy).where(is_fy, _coalesce(current_fy, next_fy))
+
+
+def _round2(values: pd.Series) -> pd.Series:
+    """Python ``round(value, 2)`` per element (numpy rounds halves differently)."""
+    array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.Series(
+        [round(value, 2) if value == value else np.nan for value in array.tolist()],
+        index=values.index,
+        dtype=np.float64,
+    )
+
+
+def _percent(numerator: pd.Series, denominator: pd.Series, valid: pd.Series) -> pd.Series:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = (numerator / denominator) * 100
+    return value.where(valid & numerator.notna() & denominator.notna())
+
+
+def _change_rate(actual: pd.Series, forecast: pd.Series) -> pd.Series:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = ((forecast - actual) / actual.abs()) * 100
+    return rate.where(actual.notna() & forecast.notna() & (actual != 0))
+
+
+def _valid_share_count(values: pd.Series) -> pd.Series:
+    return values.notna() & np.isfinite(values) & (values != 0)
+
+
+def _adjusted_value(
+    value: pd.Series,
+    current_shares: pd.Series,
+    base_shares: pd.Series,
+) -> pd.Series:
+    valid = value.notna() & _valid_share_count(current_shares) & _valid_share_count(base_shares)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        adjusted = value * (current_shares / base_shares)
+    return _round2(adjusted.where(valid))
+
+
+def _free_float_market_cap(
+    price: pd.Series,
+    shares_outstanding: pd.Series,
+    treasury_shares: pd.Series,
+) -> pd.Series:
+    """Column-wise ``calc_market_cap_scalar`` (missing treasury counts as zero)."""
+    actual_shares = shares_outstanding - treasury_shares.fillna(0.0)
+    return (price * actual_shares).where(
+        (price > 0) & shares_outstanding.notna() & (actual_shares > 0)
+    )
+
+
+def _normalize_payout_ratio(
+    payout_ratio: pd.Series,
+    dividend: pd.Series,
+    eps: pd.Series,
+) -> pd.Series:
+    """Column-wise ``FundamentalsCalculator._normalize_payout_ratio``."""
+    valid = payout_ratio.notna() & np.isfinite(payout_ratio)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        reference = (dividend / eps) * 100
+    has_reference = (
+        dividend.notna()
+        & eps.notna()
+        & (eps != 0)
+        & np.isfinite(dividend)
+        & np.isfinite(eps)
+        & np.isfinite(reference)
+    )
+    scaled = payout_ratio * 100
+    direct_error = (payout_ratio - reference).abs()
+    scaled_error = (scaled - reference).abs()
+    with_reference = scaled.where(scaled_error < direct_error, payout_ratio)
+    without_reference = scaled.where(payout_ratio.abs() <= 1, payout_ratio)
+    return with_reference.where(has_reference, without_reference).where(valid)
+
+
+def _is_consolidated(frame: pd.DataFrame) -> pd.Series:
+    by_document = _map_unique(frame["DocType"], _document_consolidation)
+    by_values = frame["NP"].notna() | frame["Eq"].notna()
+    return by_document.where(by_document.notna(), by_values).astype(bool)
+
+
+def _document_consolidation(doc_type: str) -> bool | None:
+    lowered = doc_type.lower()
+    if "非連結" in lowered or "nonconsolidated" in lowered:
+        return False
+    if "連結" in lowered or "consolidated" in lowered:
+        return True
+    return None
+
+
+def _accounting_standard(doc_type: str) -> str:
+    lowered = doc_type.lower()
+    if "ifrs" in lowered:
+        return "IFRS"
+    if "us" in lowered and "gaap" in lowered:
+        return "US GAAP"
+    return "JGAAP"
+
+
+def _optional_text(values: pd.Series) -> pd.Series:
+    return values.astype(object).where(values.notna(), None)
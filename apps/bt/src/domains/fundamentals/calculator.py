@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Mapping
 from datetime import datetime
 
 import pandas as pd
@@ -30,6 +31,7 @@ from .daily_valuation import (
     resolve_forward_eps_for_daily_valuation as _resolve_forward_eps_for_daily_valuation_impl,
     resolve_forward_operating_profit_for_daily_valuation as _resolve_forward_operating_profit_for_daily_valuation_impl,
 )
+from . import batch_calculator as _batch_calculator
 from . import share_adjustments as _share_adjustments
 from . import forecast_eps_comparison as _forecast_eps_comparison
 from .valuation_primitives import valuation_ratio
@@ -191,6 +193,42 @@ class FundamentalsCalculator:
         )
         return values[-1] if values else None
 
+    def calculate_latest_valuation_batch(
+        self,
+        statements: pd.DataFrame,
+        prices: pd.DataFrame,
+        *,
+        prefer_consolidated: bool,
+        share_adjustment_events_by_code: Mapping[str, list[ShareAdjustmentEvent]] | None = None,
+        price_basis_date: str | None = None,
+    ) -> pd.DataFrame:
+        """Columnar ``calculate_latest_valuation`` over many codes (one row per code)."""
+        return _batch_calculator.calculate_latest_valuation_frame(
+            statements,
+            prices,
+            prefer_consolidated=prefer_consolidated,
+            share_adjustment_events_by_code=share_adjustment_events_by_code,
+            price_basis_date=price_basis_date,
+        )
+
+    def calculate_statement_metrics_batch(
+        self,
+        statements: pd.DataFrame,
+        prices: pd.DataFrame | None = None,
+        *,
+        prefer_consolidated: bool,
+        share_adjustment_events_by_code: Mapping[str, list[ShareAdjustmentEvent]] | None = None,
+        through_date: str | None = None,
+    ) -> pd.DataFrame:
+        """Columnar per-statement metrics with share adjustments (one row per statement)."""
+        return _batch_calculator.calculate_statement_metrics_frame(
+            statements,
+            prices,
+            prefer_consolidated=prefer_consolidated,
+            share_adjustment_events_by_code=share_adjustment_events_by_code,
+            through_date=through_date,
+        )
+
     def _get_stock_prices_for_statements(
         self,
         statements: list[JQuantsStatement],
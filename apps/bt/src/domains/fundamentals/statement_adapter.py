@@ -8,6 +8,8 @@ import pandas as pd
 
 from src.infrastructure.external_api.jquants_client import JQuantsStatement
 
+from .batch_calculator import normalize_statement_frame
+
 
 def _get(row: Any, *keys: str) -> Any:
     for key in keys:
@@ -147,3 +149,58 @@ def market_statement_row_to_jquants_statement(
         FNCEPS=None,
         NxFNCEPS=None,
     )
+
+
+# Market DB statement columns -> JQuantsStatement field names (columnar path).
+_MARKET_STATEMENT_COLUMN_MAP: dict[str, tuple[str, ...]] = {
+    "code": ("Code",),
+    "disclosed_date": ("DiscDate",),
+    "type_of_document": ("DocType",),
+    "type_of_current_period": ("CurPerType",),
+    "period_end": ("CurPerEn",),
+    "sales": ("Sales",),
+    "operating_profit": ("OP",),
+    "profit": ("NP",),
+    "earnings_per_share": ("EPS",),
+    "total_assets": ("TA",),
+    "equity": ("Eq",),
+    "bps": ("BPS",),
+    "operating_cash_flow": ("CFO",),
+    "investing_cash_flow": ("CFI",),
+    "financing_cash_flow": ("CFF",),
+    "cash_and_equivalents": ("CashEq",),
+    "shares_outstanding": ("ShOutFY",),
+    "treasury_shares": ("TrShFY",),
+    "forecast_eps": ("FEPS",),
+    "next_year_forecast_earnings_per_share": ("NxFEPS",),
+    "forecast_sales": ("FSales",),
+    "next_year_forecast_sales": ("NxFSales",),
+    "forecast_operating_profit": ("FOP",),
+    "next_year_forecast_operating_profit": ("NxFOP",),
+    "dividend_fy": ("DivFY", "DivAnn"),
+    "payout_ratio": ("PayoutRatioAnn",),
+    "forecast_dividend_fy": ("FDivFY", "FDivAnn"),
+    "forecast_payout_ratio": ("FPayoutRatioAnn",),
+    "next_year_forecast_dividend_fy": ("NxFDivFY", "NxFDivAnn"),
+    "next_year_forecast_payout_ratio": ("NxFPayoutRatioAnn",),
+}
+
+
+def market_statement_rows_to_frame(rows: Any) -> pd.DataFrame:
+    """Columnar counterpart of ``market_statement_row_to_jquants_statement``.
+
+    Accepts a list of snake_case market DB rows (or a DataFrame) and returns a
+    statement frame for ``batch_calculator``. The period end falls back to
+    the disclosure date like the per-row adapter.
+    """
+    source = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame.from_records(list(rows))
+    frame = pd.DataFrame(index=source.index)
+    for market_column, statement_columns in _MARKET_STATEMENT_COLUMN_MAP.items():
+        if market_column not in source.columns:
+            continue
+        for statement_column in statement_columns:
+            frame[statement_column] = source[market_column]
+    normalized = normalize_statement_frame(frame)
+    period_end = normalized["CurPerEn"]
+    normalized["CurPerEn"] = period_end.where(period_end != "", normalized["DiscDate"])
+    return normalized
@@ -44,3 +44,11 @@ def market_cap_from_price_and_shares(
         return None
     value = price * shares
     return value if math.isfinite(value) else None
+
+
+def market_cap_series(
+    price: pd.Series[float],
+    shares: pd.Series[float],
+) -> pd.Series[float]:
+    value = price * shares
+    return value.where((price > 0) & (shares > 0) & np.isfinite(value), np.nan)
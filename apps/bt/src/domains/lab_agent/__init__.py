@@ -32,6 +32,10 @@ CLI使用:
     uv run bt lab improve range_break_v15 --auto-apply
 """
 
+from importlib import import_module
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
+
 from .models import (
     EvaluationResult,
     EvolutionConfig,
@@ -42,11 +46,24 @@ from .models import (
     StrategyCandidate,
     WeaknessReport,
 )
-from .parameter_evolver import ParameterEvolver
-from .strategy_evaluator import StrategyEvaluator
-from .strategy_generator import StrategyGenerator
-from .strategy_improver import StrategyImprover
-from .yaml_updater import YamlUpdater
+
+if TYPE_CHECKING:
+    from .optuna_optimizer import OptunaOptimizer  # noqa: F401
+    from .parameter_evolver import ParameterEvolver
+    from .strategy_evaluator import StrategyEvaluator
+    from .strategy_generator import StrategyGenerator
+    from .strategy_improver import StrategyImprover
+    from .yaml_updater import YamlUpdater
+
+# 実行エンジン（vectorbt / optuna）を読み込むクラスは初回参照時に import する
+_LAZY_EXPORTS: dict[str, str] = {
+    "StrategyGenerator": ".strategy_generator",
+    "StrategyEvaluator": ".strategy_evaluator",
+    "ParameterEvolver": ".parameter_evolver",
+    "StrategyImprover": ".strategy_improver",
+    "YamlUpdater": ".yaml_updater",
+    "OptunaOptimizer": ".optuna_optimizer",
+}
 
 __all__ = [
     "StrategyGenerator",
@@ -64,10 +81,16 @@ __all__ = [
     "Improvement",
 ]
 
-# Optunaは任意依存のため、インポートエラーを許容
-try:
-    from .optuna_optimizer import OptunaOptimizer  # noqa: F401
-except ImportError:
-    pass
-else:
+# Optunaは任意依存のため、インストールされている場合のみ公開
+if find_spec("optuna") is not None:
     __all__.append("OptunaOptimizer")
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    # Optuna 未インストール時の OptunaOptimizer は __all__ に含まれず、未定義として扱う
+    if module_path is None or name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
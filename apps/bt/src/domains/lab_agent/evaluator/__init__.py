@@ -4,32 +4,61 @@
 後方互換性のため、全クラス・関数を再エクスポート
 """
 
-from .batch_executor import (
-    execute_batch_evaluation,
-    execute_parallel,
-    execute_single_process,
-    fetch_benchmark_data,
-    fetch_ohlcv_data,
-    fetch_stock_codes,
-    get_max_workers,
-    handle_future_result,
-    prepare_batch_data,
-)
-from .candidate_processor import evaluate_single_candidate
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .data_preparation import (
     BatchPreparedData,
     convert_dataframes_to_dict,
     convert_dict_to_dataframes,
     load_default_shared_config,
 )
-from .evaluator import StrategyEvaluator
 from .score_normalizer import normalize_scores, normalize_value
 
+if TYPE_CHECKING:
+    from .batch_executor import (
+        execute_batch_evaluation,
+        execute_parallel,
+        execute_single_process,
+        fetch_benchmark_data,
+        fetch_ohlcv_data,
+        fetch_stock_codes,
+        get_max_workers,
+        handle_future_result,
+        prepare_batch_data,
+    )
+    from .candidate_processor import evaluate_single_candidate
+    from .candidate_processor import (
+        evaluate_single_candidate as _evaluate_single_candidate,
+    )
+    from .evaluator import StrategyEvaluator
+
+# バックテスト実行系（vectorbt を読み込む）は初回参照時に import する
+# 公開名 -> (モジュール, 属性名)
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "StrategyEvaluator": (".evaluator", "StrategyEvaluator"),
+    "evaluate_single_candidate": (".candidate_processor", "evaluate_single_candidate"),
+    "_evaluate_single_candidate": (".candidate_processor", "evaluate_single_candidate"),
+    **{
+        name: (".batch_executor", name)
+        for name in (
+            "execute_batch_evaluation",
+            "execute_parallel",
+            "execute_single_process",
+            "fetch_benchmark_data",
+            "fetch_ohlcv_data",
+            "fetch_stock_codes",
+            "get_max_workers",
+            "handle_future_result",
+            "prepare_batch_data",
+        )
+    },
+}
+
 # 後方互換性のためのエイリアス（アンダースコア付き旧名）
 _convert_dataframes_to_dict = convert_dataframes_to_dict
 _convert_dict_to_dataframes = convert_dict_to_dataframes
 _load_default_shared_config = load_default_shared_config
-_evaluate_single_candidate = evaluate_single_candidate
 
 __all__ = [
     # メインクラス
@@ -60,3 +89,13 @@ __all__ = [
     "_load_default_shared_config",
     "_evaluate_single_candidate",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_path, attribute = target
+    value = getattr(import_module(module_path, __name__), attribute)
+    globals()[name] = value
+    return value
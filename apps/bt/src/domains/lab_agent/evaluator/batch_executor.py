@@ -270,6 +270,7 @@ def execute_single_process(
             prepared_data.stock_codes,
             prepared_data.ohlcv_data,
             prepared_data.benchmark_data,
+            prepared_data.evaluation_start,
         )
         results.append(result)
 
@@ -305,6 +306,7 @@ def execute_parallel(
                 prepared_data.stock_codes,
                 prepared_data.ohlcv_data,
                 prepared_data.benchmark_data,
+                prepared_data.evaluation_start,
             ): candidate
             for candidate in candidates
         }
@@ -37,6 +37,7 @@ def evaluate_single_candidate(
     pre_fetched_stock_codes: list[str] | None = None,
     pre_fetched_ohlcv_data: dict[str, dict[str, Any]] | None = None,
     pre_fetched_benchmark_data: dict[str, Any] | None = None,
+    evaluation_start: str | None = None,
 ) -> EvaluationResult:
     """
     単一候補の評価（並列処理用スタンドアロン関数）
@@ -48,6 +49,7 @@ def evaluate_single_candidate(
         pre_fetched_stock_codes: 事前取得済み銘柄リスト（並列実行でのAPI呼び出し削減用）
         pre_fetched_ohlcv_data: 事前取得済みOHLCVデータ（シリアライズ済み辞書形式）
         pre_fetched_benchmark_data: 事前取得済みベンチマークデータ（シリアライズ済み辞書形式）
+        evaluation_start: ポートフォリオ評価の開始日（多段階評価の期間モード用）
 
     Returns:
         評価結果
@@ -97,6 +99,7 @@ def evaluate_single_candidate(
             # 事前取得ベンチマークデータを設定（APIスキップ）
             if restored_benchmark_data is not None:
                 strategy.benchmark_data = restored_benchmark_data
+            strategy.evaluation_start = evaluation_start
 
             # Kelly基準バックテスト実行
             _, portfolio, _, _, _ = strategy.run_optimized_backtest_kelly(
@@ -28,6 +28,8 @@ class BatchPreparedData:
     ohlcv_data: dict[str, dict[str, Any]] | None
     benchmark_data: dict[str, Any] | None
     include_forecast_revision: bool = False
+    # 低忠実度 (window) 段でポートフォリオ評価を始める日付。データ自体は全期間を保持する
+    evaluation_start: str | None = None
 
 
 def convert_dataframes_to_dict(
@@ -60,6 +60,7 @@ def normalize_scores(
                 trade_count=result.trade_count,
                 success=result.success,
                 error_message=result.error_message,
+                fidelity=result.fidelity,
             )
         )
 
@@ -21,6 +21,7 @@ SignalCategory = Literal[
 
 LabStructureMode = Literal["params_only", "random_add"]
 LabTargetScope = Literal["entry_filter_only", "exit_trigger_only", "both"]
+LabFidelityMode = Literal["window", "universe"]
 
 
 class SignalConstraints(BaseModel):
@@ -124,6 +125,18 @@ class EvolutionConfig(BaseModel):
     random_add_entry_signals: int = Field(default=1, ge=0, le=10)
     random_add_exit_signals: int = Field(default=1, ge=0, le=10)
 
+    # 多段階評価（successive halving）: 低忠実度で足切りし、上位のみ高忠実度で再評価
+    multi_fidelity: bool = Field(default=False)
+
+    # 低忠実度の作り方（window=期間末尾の一部 / universe=銘柄の一部）
+    fidelity_mode: LabFidelityMode = Field(default="window")
+
+    # 最初の段で使うデータ割合（以降 reduction_factor 倍ずつ拡大し最後は全データ）
+    min_fidelity: float = Field(default=0.25, gt=0.0, le=1.0)
+
+    # 各段で次段へ昇格させる割合の逆数（上位 1/reduction_factor を昇格）
+    reduction_factor: int = Field(default=3, ge=2, le=10)
+
     # 乱数シード（再現性用、Noneで固定シードを使用）
     seed: int | None = None
 
@@ -181,6 +194,9 @@ class EvaluationResult(BaseModel):
     # エラーメッセージ（失敗時）
     error_message: str | None = None
 
+    # スコア算出に使ったデータ割合（1.0=全期間・全銘柄）
+    fidelity: float = 1.0
+
 
 class WeaknessReport(BaseModel):
     """弱点分析レポート"""
@@ -268,6 +284,18 @@ class OptunaConfig(BaseModel):
     random_add_entry_signals: int = Field(default=1, ge=0, le=10)
     random_add_exit_signals: int = Field(default=1, ge=0, le=10)
 
+    # 多段階評価（successive halving）: 低忠実度で足切りし、上位のみ高忠実度で再評価
+    multi_fidelity: bool = Field(default=False)
+
+    # 低忠実度の作り方（window=期間末尾の一部 / universe=銘柄の一部）
+    fidelity_mode: LabFidelityMode = Field(default="window")
+
+    # 最初の段で使うデータ割合（以降 reduction_factor 倍ずつ拡大し最後は全データ）
+    min_fidelity: float = Field(default=0.25, gt=0.0, le=1.0)
+
+    # 各段で次段へ昇格させる割合の逆数（上位 1/reduction_factor を昇格）
+    reduction_factor: int = Field(default=3, ge=2, le=10)
+
     # 乱数シード（再現性用）
     seed: int | None = None
 
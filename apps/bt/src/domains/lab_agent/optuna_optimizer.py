@@ -36,11 +36,17 @@ from .param_constraints import apply_param_dependency_constraints
 from .signal_filters import is_signal_allowed
 from .signal_augmentation import apply_random_add_structure
 from .signal_search_space import CATEGORICAL_PARAMS, PARAM_RANGES, ParamType
+from .successive_halving import (
+    FULL_FIDELITY,
+    build_fidelity_schedule,
+    fidelity_resource,
+    slice_frames,
+)
 
 # ランタイムではtry-exceptでインポート
 try:
     import optuna as optuna_runtime
-    from optuna.pruners import MedianPruner, NopPruner
+    from optuna.pruners import MedianPruner, NopPruner, SuccessiveHalvingPruner
     from optuna.samplers import CmaEsSampler, RandomSampler, TPESampler
 
     OPTUNA_AVAILABLE = True
@@ -52,6 +58,7 @@ except ImportError:
     CmaEsSampler: Any | None = None
     NopPruner: Any | None = None
     MedianPruner: Any | None = None
+    SuccessiveHalvingPruner: Any | None = None
 
 
 class OptunaOptimizer:
@@ -106,6 +113,7 @@ class OptunaOptimizer:
         self._baseline_total_return: float | None = None
         self._param_specs: dict[str, tuple[float, float, ParamType]] = {}
         self._active_param_overrides: dict[str, tuple[float, float, ParamType]] = {}
+        self._fidelity_schedule: tuple[float, ...] = (FULL_FIDELITY,)
 
     def _is_usage_targeted(self, usage_type: str) -> bool:
         """target_scope に基づき対象サイドか判定する。"""
@@ -228,6 +236,7 @@ class OptunaOptimizer:
         if self.shared_config_dict is None:
             self.shared_config_dict = {}
         self._prepare_prefetched_data()
+        self._fidelity_schedule = self._resolve_fidelity_schedule()
 
         logger.info(
             f"Starting Optuna optimization: n_trials={self.config.n_trials}, "
@@ -694,12 +703,42 @@ class OptunaOptimizer:
         else:
             return cast(Any, TPESampler(seed=seed))
 
+    def _resolve_fidelity_schedule(self) -> tuple[float, ...]:
+        """多段階評価の忠実度列を返す（無効または先読みデータ無しなら全データのみ）。"""
+        if not self.config.multi_fidelity:
+            return (FULL_FIDELITY,)
+        if not self._prefetched_multi_data:
+            logger.warning(
+                "Multi-fidelity evaluation disabled: prefetched OHLCV data is unavailable"
+            )
+            return (FULL_FIDELITY,)
+        schedule = build_fidelity_schedule(
+            self.config.min_fidelity, self.config.reduction_factor
+        )
+        logger.info(
+            "Optuna multi-fidelity (ASHA) enabled: "
+            f"mode={self.config.fidelity_mode}, schedule={schedule}"
+        )
+        return schedule
+
     def _create_pruner(self) -> BasePruner:
         """Pruner を作成する。"""
         if not OPTUNA_AVAILABLE:
             raise ImportError("Optuna is not available")
         if NopPruner is None or MedianPruner is None:
             raise ImportError("Optuna pruners are unavailable")
+        if self.config.multi_fidelity:
+            if SuccessiveHalvingPruner is None:
+                raise ImportError("Optuna pruners are unavailable")
+            # 忠実度 min_fidelity * η^k を step=η^k として報告するので rung と一致する
+            return cast(
+                Any,
+                SuccessiveHalvingPruner(
+                    min_resource=1,
+                    reduction_factor=self.config.reduction_factor,
+                    min_early_stopping_rate=0,
+                ),
+            )
         if not self.config.pruning:
             return cast(Any, NopPruner())
 
@@ -820,7 +859,7 @@ class OptunaOptimizer:
         trial: optuna.Trial,
     ) -> Any:
         """1 trial 分のバックテストを実行し、最終ポートフォリオを返す。"""
-        if not self.config.pruning:
+        if not self.config.pruning or self.config.multi_fidelity:
             _, portfolio, _, _, _ = strategy.run_optimized_backtest_kelly(
                 kelly_fraction=shared_config.kelly_fraction,
                 min_allocation=shared_config.min_allocation,
@@ -879,6 +918,55 @@ class OptunaOptimizer:
         portfolio, _ = run_multi_backtest(allocation_pct=optimized_allocation)
         return portfolio
 
+    def _run_low_fidelity_rungs(
+        self,
+        trial: optuna.Trial,
+        shared_config: SharedConfig,
+        entry_signal_params: SignalParams,
+        exit_signal_params: SignalParams,
+    ) -> None:
+        """低忠実度の各段を評価して ASHA pruner に報告し、足切りなら TrialPruned。"""
+        for fidelity in self._fidelity_schedule[:-1]:
+            multi_data, benchmark_data, evaluation_start = slice_frames(
+                self._prefetched_multi_data or {},
+                self._prefetched_benchmark_data,
+                fidelity=fidelity,
+                mode=self.config.fidelity_mode,
+            )
+            rung_config = shared_config
+            if self.config.fidelity_mode == "universe":
+                rung_config = shared_config.model_copy(
+                    update={"stock_codes": sorted(multi_data)}
+                )
+            strategy = YamlConfigurableStrategy(
+                shared_config=rung_config,
+                entry_filter_params=entry_signal_params,
+                exit_trigger_params=exit_signal_params,
+            )
+            strategy.multi_data_dict = multi_data
+            if benchmark_data is not None:
+                strategy.benchmark_data = benchmark_data
+            strategy.evaluation_start = evaluation_start
+
+            # 最終段と同じ Kelly 配分の目的関数で評価し、段間のスコアを比較可能に保つ
+            _, portfolio, _, _, _ = strategy.run_optimized_backtest_kelly(
+                kelly_fraction=rung_config.kelly_fraction,
+                min_allocation=rung_config.min_allocation,
+                max_allocation=rung_config.max_allocation,
+            )
+            score = self._calculate_weighted_score(*self._extract_metrics(portfolio))
+            trial.report(score, step=fidelity_resource(fidelity, self.config.min_fidelity))
+            trial.set_user_attr("fidelity", fidelity)
+
+            should_prune = trial.should_prune()
+            if isinstance(should_prune, bool) and should_prune:
+                logger.info(
+                    f"Trial {trial.number} pruned at fidelity={fidelity}: "
+                    f"score={score:.4f}"
+                )
+                optuna_rt = cast(Any, optuna_runtime)
+                raise optuna_rt.TrialPruned()
+
     def _objective(self, trial: optuna.Trial) -> float:
         """
         Optuna目的関数
@@ -918,7 +1006,14 @@ class OptunaOptimizer:
                 if self._prefetched_benchmark_data is not None:
                     strategy.benchmark_data = self._prefetched_benchmark_data
 
+                self._run_low_fidelity_rungs(
+                    trial,
+                    shared_config,
+                    entry_signal_params,
+                    exit_signal_params,
+                )
                 portfolio = self._run_backtest_for_trial(strategy, shared_config, trial)
+                trial.set_user_attr("fidelity", FULL_FIDELITY)
 
             # メトリクス抽出
             sharpe, calmar, total_return = self._extract_metrics(portfolio)
@@ -1173,11 +1268,28 @@ class OptunaOptimizer:
         history = []
         optuna_rt = cast(Any, optuna_runtime)
         for trial in study.trials:
-            if trial.state == optuna_rt.trial.TrialState.COMPLETE:
+            if (
+                trial.state == optuna_rt.trial.TrialState.PRUNED
+                and self.config.multi_fidelity
+                and trial.intermediate_values
+            ):
+                # 足切りされた trial は最後に報告した低忠実度スコアを記録する
+                last_step = max(trial.intermediate_values)
+                history.append(
+                    {
+                        "trial": trial.number,
+                        "score": trial.intermediate_values[last_step],
+                        "fidelity": trial.user_attrs.get("fidelity", 0.0),
+                        "pruned": True,
+                        "params": trial.params,
+                    }
+                )
+            elif trial.state == optuna_rt.trial.TrialState.COMPLETE:
                 history.append(
                     {
                         "trial": trial.number,
                         "score": trial.value,
+                        "fidelity": trial.user_attrs.get("fidelity", FULL_FIDELITY),
                         "sharpe_ratio": trial.user_attrs.get("sharpe_ratio", 0),
                         "calmar_ratio": trial.user_attrs.get("calmar_ratio", 0),
                         "total_return": trial.user_attrs.get("total_return", 0),
@@ -21,6 +21,13 @@ from .signal_filters import is_signal_allowed
 from .signal_augmentation import apply_random_add_structure
 from .signal_search_space import CATEGORICAL_PARAMS, PARAM_RANGES, ParamType
 from .strategy_evaluator import StrategyEvaluator
+from .successive_halving import (
+    FULL_FIDELITY,
+    build_fidelity_schedule,
+    fidelity_rank_key,
+    run_successive_halving,
+    slice_prepared_data,
+)
 
 
 class ParameterEvolver:
@@ -67,6 +74,7 @@ class ParameterEvolver:
         self._base_exit_signals: set[str] = set()
         self._baseline_score: float | None = None
         self._baseline_total_return: float | None = None
+        self._fidelity_schedule: tuple[float, ...] | None = None
 
     def evolve(
         self,
@@ -100,6 +108,7 @@ class ParameterEvolver:
         # 初期集団生成
         population = self._initialize_population(base_candidate)
         prepared_data = self.evaluator.prepare_batch_data(population)
+        self._fidelity_schedule = self._resolve_fidelity_schedule(prepared_data)
         self._evaluate_baseline_candidate(base_candidate, prepared_data)
 
         # 最良個体追跡
@@ -116,10 +125,7 @@ class ParameterEvolver:
                 prepared_data = self.evaluator.prepare_batch_data(population)
 
             # 評価
-            results = self.evaluator.evaluate_batch(
-                population,
-                prepared_data=prepared_data,
-            )
+            results = self._evaluate_population(population, prepared_data)
             all_results.extend(results)
 
             # 成功した結果のみ抽出
@@ -131,9 +137,11 @@ class ParameterEvolver:
                 )
                 continue
 
-            # 最良個体更新
-            gen_best = max(successful, key=lambda x: x.score)
-            if best_result is None or gen_best.score > best_result.score:
+            # 最良個体更新（多段階評価時は全データで評価された個体を優先）
+            gen_best = max(successful, key=fidelity_rank_key)
+            if best_result is None or fidelity_rank_key(gen_best) > fidelity_rank_key(
+                best_result
+            ):
                 best_result = gen_best
                 logger.info(
                     f"New best: score={gen_best.score:.4f}, "
@@ -142,14 +150,19 @@ class ParameterEvolver:
                 )
 
             # 履歴記録
-            self.history.append(
-                {
-                    "generation": generation + 1,
-                    "best_score": gen_best.score,
-                    "avg_score": sum(r.score for r in successful) / len(successful),
-                    "population_size": len(successful),
+            full_fidelity = [r for r in successful if r.fidelity >= FULL_FIDELITY] or successful
+            history_item: dict[str, Any] = {
+                "generation": generation + 1,
+                "best_score": gen_best.score,
+                "avg_score": sum(r.score for r in full_fidelity) / len(full_fidelity),
+                "population_size": len(successful),
+            }
+            if self._fidelity_schedule is not None:
+                history_item["fidelity_evaluations"] = {
+                    str(fidelity): sum(1 for r in results if r.fidelity >= fidelity)
+                    for fidelity in self._fidelity_schedule
                 }
-            )
+            self.history.append(history_item)
 
             # 最終世代でなければ次世代を生成
             if generation < self.config.generations - 1:
@@ -167,6 +180,64 @@ class ParameterEvolver:
 
         return best_candidate, all_results
 
+    def _resolve_fidelity_schedule(
+        self,
+        prepared_data: BatchPreparedData,
+    ) -> tuple[float, ...] | None:
+        """多段階評価の忠実度列を返す（無効または切り出し不可なら None）。"""
+        if not self.config.multi_fidelity:
+            return None
+        schedule = build_fidelity_schedule(
+            self.config.min_fidelity, self.config.reduction_factor
+        )
+        if len(schedule) < 2:
+            return None
+        if slice_prepared_data(
+            prepared_data, fidelity=schedule[0], mode=self.config.fidelity_mode
+        ) is None:
+            logger.warning(
+                "Multi-fidelity evaluation disabled: prefetched OHLCV data is unavailable"
+            )
+            return None
+        logger.info(
+            "Multi-fidelity evaluation enabled: "
+            f"mode={self.config.fidelity_mode}, schedule={schedule}, "
+            f"reduction_factor={self.config.reduction_factor}"
+        )
+        return schedule
+
+    def _evaluate_population(
+        self,
+        population: list[StrategyCandidate],
+        prepared_data: BatchPreparedData,
+    ) -> list[EvaluationResult]:
+        """集団を評価する（多段階評価時は successive halving で足切り）。"""
+        schedule = self._fidelity_schedule
+        if schedule is None:
+            return self.evaluator.evaluate_batch(
+                population,
+                prepared_data=prepared_data,
+            )
+
+        def _evaluate_rung(
+            candidates: list[StrategyCandidate],
+            fidelity: float,
+        ) -> list[EvaluationResult]:
+            rung_data = slice_prepared_data(
+                prepared_data, fidelity=fidelity, mode=self.config.fidelity_mode
+            )
+            return self.evaluator.evaluate_batch(
+                candidates,
+                prepared_data=rung_data or prepared_data,
+            )
+
+        return run_successive_halving(
+            population,
+            _evaluate_rung,
+            schedule,
+            self.config.reduction_factor,
+        )
+
     def _is_usage_targeted(self, usage_type: str) -> bool:
         """target_scope に基づき対象サイドか判定する。"""
         if self.config.target_scope == "both":
@@ -394,8 +465,8 @@ class ParameterEvolver:
         """
         next_population: list[StrategyCandidate] = []
 
-        # スコア順にソート
-        sorted_results = sorted(results, key=lambda x: x.score, reverse=True)
+        # スコア順にソート（低忠実度で足切りされた個体は下位）
+        sorted_results = sorted(results, key=fidelity_rank_key, reverse=True)
 
         # エリート保存
         n_elite = max(1, int(len(sorted_results) * self.config.elite_ratio))
@@ -456,7 +527,7 @@ class ParameterEvolver:
         tournament = random.sample(
             results, min(self.config.tournament_size, len(results))
         )
-        return max(tournament, key=lambda x: x.score)
+        return max(tournament, key=fidelity_rank_key)
 
     def _crossover(
         self, parent1: StrategyCandidate, parent2: StrategyCandidate
@@ -0,0 +1,210 @@
+"""
+多段階評価（successive halving）モジュール
+
+候補をまず短い期間・一部銘柄（低忠実度）で評価し、上位 1/η だけを
+より高い忠実度へ昇格させ、最終段のみ全データでバックテストする。
+期間 (window) モードでも指標計算には全履歴を使い、ポートフォリオの
+評価期間だけを末尾に絞る（長い lookback の候補がウォームアップ不足で不利にならない）。
+GA (ParameterEvolver) は同期型の段階評価、Optuna は ASHA pruner と
+同じ忠実度スケジュール・データ切り出しを共有する。
+"""
+
+import math
+import zlib
+from collections.abc import Callable, Iterable, Sequence
+import pandas as pd
+
+from .evaluator.data_preparation import BatchPreparedData
+from .models import EvaluationResult, LabFidelityMode, StrategyCandidate
+
+FULL_FIDELITY = 1.0
+
+
+def build_fidelity_schedule(
+    min_fidelity: float,
+    reduction_factor: int,
+) -> tuple[float, ...]:
+    """min_fidelity から η 倍ずつ拡大し、最後を全データ (1.0) とする忠実度列を返す。"""
+    if not 0.0 < min_fidelity <= FULL_FIDELITY:
+        raise ValueError("min_fidelity must be in (0, 1]")
+    if reduction_factor < 2:
+        raise ValueError("reduction_factor must be >= 2")
+    schedule: list[float] = []
+    fidelity = min_fidelity
+    while fidelity < FULL_FIDELITY - 1e-9:
+        schedule.append(round(fidelity, 6))
+        fidelity *= reduction_factor
+    schedule.append(FULL_FIDELITY)
+    return tuple(schedule)
+
+
+def fidelity_resource(fidelity: float, min_fidelity: float) -> int:
+    """忠実度を pruner の step（最小段 = 1 の資源量）に換算する。"""
+    return max(1, round(fidelity / min_fidelity))
+
+
+def promotion_count(n_candidates: int, reduction_factor: int) -> int:
+    """次段へ昇格させる候補数（上位 1/η、最低 1）。"""
+    return max(1, math.ceil(n_candidates / reduction_factor))
+
+
+def fidelity_rank_key(result: EvaluationResult) -> tuple[float, float]:
+    """高忠実度のスコアを優先する並び替えキー。
+
+    段ごとにスコアのスケール（正規化範囲）が異なるため、昇格できなかった
+    候補は昇格した候補より常に下位として扱う。
+    """
+    return (result.fidelity, result.score)
+
+
+def run_successive_halving(
+    candidates: Sequence[StrategyCandidate],
+    evaluate: Callable[[list[StrategyCandidate], float], list[EvaluationResult]],
+    schedule: Sequence[float],
+    reduction_factor: int,
+) -> list[EvaluationResult]:
+    """
+    同期型 successive halving を 1 ブラケット実行する
+
+    Args:
+        candidates: 評価対象の候補
+        evaluate: (候補リスト, 忠実度) -> 評価結果 を返す評価関数
+        schedule: build_fidelity_schedule の忠実度列
+        reduction_factor: 昇格率の逆数 η
+
+    Returns:
+        候補ごとに到達した最高段の評価結果（fidelity 設定済み）。
+        最終段の結果が先頭に来る。
+    """
+    survivors = list(candidates)
+    settled: list[EvaluationResult] = []
+    final_results: list[EvaluationResult] = []
+    last_rung = len(schedule) - 1
+    for rung, fidelity in enumerate(schedule):
+        if not survivors:
+            break
+        results = evaluate(survivors, fidelity)
+        for result in results:
+            result.fidelity = fidelity
+        if rung == last_rung:
+            final_results = results
+            break
+
+        successful = sorted(
+            (result for result in results if result.success),
+            key=lambda result: result.score,
+            reverse=True,
+        )
+        n_promote = promotion_count(len(survivors), reduction_factor)
+        settled.extend(successful[n_promote:])
+        settled.extend(result for result in results if not result.success)
+        survivors = [result.candidate for result in successful[:n_promote]]
+
+    settled.sort(key=fidelity_rank_key, reverse=True)
+    return [*final_results, *settled]
+
+
+def _universe_subset(codes: Iterable[str], fidelity: float) -> set[str]:
+    """銘柄コードのハッシュ順で安定した部分集合を選ぶ（実行間で再現可能）。"""
+    ordered = sorted(set(codes), key=lambda code: (zlib.crc32(code.encode()), code))
+    keep = max(1, math.ceil(len(ordered) * fidelity))
+    return set(ordered[:keep])
+
+
+def _window_start(dates: Iterable[str], fidelity: float) -> str | None:
+    """全日付のうち末尾 fidelity 割合が始まる日付 (YYYY-MM-DD) を返す。"""
+    unique_dates = sorted({str(value)[:10] for value in dates})
+    if not unique_dates:
+        return None
+    start_index = min(
+        len(unique_dates) - 1,
+        int(len(unique_dates) * (FULL_FIDELITY - fidelity)),
+    )
+    return unique_dates[start_index]
+
+
+def slice_prepared_data(
+    prepared_data: BatchPreparedData,
+    *,
+    fidelity: float,
+    mode: LabFidelityMode,
+) -> BatchPreparedData | None:
+    """
+    GA 用の事前取得データ（シリアライズ済み）を低忠実度に切り出す
+
+    Returns:
+        切り出したデータ。事前取得データが無く切り出せない場合は None
+    """
+    if fidelity >= FULL_FIDELITY:
+        return prepared_data
+    ohlcv_data = prepared_data.ohlcv_data
+    if not ohlcv_data:
+        return None
+
+    if mode == "universe":
+        keep = _universe_subset(ohlcv_data.keys(), fidelity)
+        stock_codes = prepared_data.stock_codes or list(ohlcv_data)
+        return BatchPreparedData(
+            stock_codes=[code for code in stock_codes if code in keep],
+            ohlcv_data={code: frames for code, frames in ohlcv_data.items() if code in keep},
+            benchmark_data=prepared_data.benchmark_data,
+            include_forecast_revision=prepared_data.include_forecast_revision,
+        )
+
+    start = _window_start(
+        (
+            value
+            for frames in ohlcv_data.values()
+            for serialized in frames.values()
+            for value in serialized["index"]
+        ),
+        fidelity,
+    )
+    if start is None:
+        return None
+    # 指標のウォームアップを保つため履歴は切らず、評価期間だけを末尾に絞る
+    return BatchPreparedData(
+        stock_codes=prepared_data.stock_codes,
+        ohlcv_data=ohlcv_data,
+        benchmark_data=prepared_data.benchmark_data,
+        include_forecast_revision=prepared_data.include_forecast_revision,
+        evaluation_start=start,
+    )
+
+
+def slice_frames(
+    multi_data: dict[str, dict[str, pd.DataFrame]],
+    benchmark_data: pd.DataFrame | None,
+    *,
+    fidelity: float,
+    mode: LabFidelityMode,
+) -> tuple[dict[str, dict[str, pd.DataFrame]], pd.DataFrame | None, str | None]:
+    """
+    Optuna 用の事前取得 DataFrame 群を低忠実度に切り出す
+
+    Returns:
+        (銘柄データ, ベンチマーク, 評価開始日)。window モードではデータを切らず、
+        評価開始日（ポートフォリオを絞る日付）だけを返す。
+    """
+    if fidelity >= FULL_FIDELITY or not multi_data:
+        return multi_data, benchmark_data, None
+
+    if mode == "universe":
+        keep = _universe_subset(multi_data.keys(), fidelity)
+        return (
+            {code: frames for code, frames in multi_data.items() if code in keep},
+            benchmark_data,
+            None,
+        )
+
+    start = _window_start(
+        (
+            value
+            for frames in multi_data.values()
+            for frame in frames.values()
+            if isinstance(frame.index, pd.DatetimeIndex)
+            for value in frame.index.unique().strftime("%Y-%m-%d")
+        ),
+        fidelity,
+    )
+    return multi_data, benchmark_data, start
@@ -5,10 +5,30 @@ Strategies Package
 
 全戦略でYamlConfigurableStrategyを直接使用。
 戦略固有ロジックは完全にYAML制御。
+
+サブパッケージ（runtime / signals など）の import で vectorbt を読み込まないよう、
+戦略クラスは初回参照時に import する。
 """
 
-# Core
-from .core.yaml_configurable_strategy import YamlConfigurableStrategy
-from .core.factory import StrategyFactory
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core.factory import StrategyFactory
+    from .core.yaml_configurable_strategy import YamlConfigurableStrategy
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "YamlConfigurableStrategy": ".core.yaml_configurable_strategy",
+    "StrategyFactory": ".core.factory",
+}
 
 __all__ = ["YamlConfigurableStrategy", "StrategyFactory"]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
@@ -2,14 +2,26 @@
 戦略フレームワーク コアモジュール
 
 VectorBTベースの戦略フレームワークの基幹コンポーネントを提供します。
+各コンポーネントは初回参照時に import する（vectorbt の読み込みを遅延）。
 """
 
-from .yaml_configurable_strategy import YamlConfigurableStrategy
-from .mixins import (
-    DataManagerMixin,
-    PortfolioAnalyzerKellyMixin,
-    BacktestExecutorMixin,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .mixins import (
+        BacktestExecutorMixin,
+        DataManagerMixin,
+        PortfolioAnalyzerKellyMixin,
+    )
+    from .yaml_configurable_strategy import YamlConfigurableStrategy
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "YamlConfigurableStrategy": ".yaml_configurable_strategy",
+    "DataManagerMixin": ".mixins",
+    "PortfolioAnalyzerKellyMixin": ".mixins",
+    "BacktestExecutorMixin": ".mixins",
+}
 
 __all__ = [
     "YamlConfigurableStrategy",
@@ -17,3 +29,12 @@ __all__ = [
     "PortfolioAnalyzerKellyMixin",
     "BacktestExecutorMixin",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
@@ -4,18 +4,24 @@
 YamlConfigurableStrategy用のバックテスト実行・結果生成機能を提供します。
 """
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
 
 import pandas as pd
 
 from src.domains.backtest.vectorbt_adapter import (
+    ALLOCATION_SWEEP_LEVEL,
+    SWEEP_METRIC_COLUMNS,
     ExecutionAdapterProtocol,
     ExecutionPortfolioProtocol,
     PERCENT_SIZE_TYPE,
     VectorbtAdapter,
+    canonical_metrics_from_portfolio,
+    sweep_metrics_frame,
 )
 from src.domains.strategy.signals.feature_registry import resolve_feature_requirement_spec
 from src.shared.models.allocation import AllocationInfo
+from src.shared.observability.metrics import metrics_recorder
 from .backtest_execution_helpers import (
     build_empty_exit_frame,
     build_strategy_shared_config_payload,
@@ -24,6 +30,11 @@ from .backtest_execution_helpers import (
     resolve_round_trip_direction,
     resolve_strategy_round_trip_mode_name,
 )
+from .position_limits import (
+    PositionLimitMode,
+    build_entry_priority_panel,
+    limit_entries,
+)
 
 CostParams = Tuple[float, float]
 GroupedPortfolioInputs = tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]
@@ -404,6 +415,66 @@ class BacktestExecutorMixin:
         self.combined_portfolio = portfolio
         return portfolio
 
+    def run_allocation_sweep_from_cached_signals(
+        self: "StrategyProtocol",
+        allocations: Sequence[float],
+    ) -> pd.DataFrame:
+        """保持済みシグナルで複数の配分率を評価し、配分率ごとのメトリクス表を返す。
+
+        マルチアセットのシグナル執行では配分率ごとに独立した共有キャッシュプールを
+        列方向に並べ、1回のブロードキャストシミュレーションで全配分率を評価する。
+        ラウンドトリップ執行（スカラーサイズのカーネル）と単一銘柄では配分率ごとに
+        第2段階を再実行する。
+        """
+        cached = self._get_grouped_portfolio_inputs_cache()
+        if cached is None:
+            raise ValueError("統合ポートフォリオ入力キャッシュが存在しません")
+        allocation_values = list(dict.fromkeys(float(value) for value in allocations))
+        if not allocation_values:
+            raise ValueError("評価する配分率が指定されていません")
+
+        open_data, close_data, all_entries, all_exits = cached
+        if len(self.stock_codes) <= 1 or self._uses_round_trip_execution():
+            rows: dict[float, dict[str, Any]] = {}
+            for allocation in allocation_values:
+                portfolio = self._create_grouped_portfolio(
+                    open_data=open_data,
+                    close_data=close_data,
+                    all_entries=all_entries,
+                    all_exits=all_exits,
+                    allocation_pct=allocation,
+                )
+                metrics = canonical_metrics_from_portfolio(portfolio)
+                rows[allocation] = {
+                    column: getattr(metrics, column, None) for column in SWEEP_METRIC_COLUMNS
+                }
+            table = pd.DataFrame.from_dict(
+                rows, orient="index", columns=list(SWEEP_METRIC_COLUMNS)
+            )
+            table.index.name = ALLOCATION_SWEEP_LEVEL
+            return table
+
+        self._log(
+            f"⚡ キャッシュ済みシグナルで配分率{len(allocation_values)}通りを一括シミュレーション",
+            "info",
+        )
+        effective_fees, effective_slippage = self._calculate_cost_params()
+        portfolio = self._get_execution_adapter().create_signal_portfolio_sweep(
+            close=close_data,
+            entries=all_entries,
+            exits=all_exits,
+            sizes=allocation_values,
+            direction=getattr(self, "direction", "longonly"),
+            init_cash=self.initial_cash,
+            fees=effective_fees,
+            slippage=effective_slippage,
+            size_type="percent",
+            call_seq="auto",
+            max_size=self.max_exposure,
+            freq="D",
+        )
+        return sweep_metrics_frame(portfolio).reindex(allocation_values)
+
     def _log_multi_backtest_start(self: "StrategyProtocol", *, use_group_by: bool) -> None:
         mode_info = []
         if self.relative_mode:
@@ -432,8 +503,12 @@ class BacktestExecutorMixin:
                     load_all_sector_indices,
                 )
 
+                # ベンチマークも同じクエリで読み込み、後続の load_benchmark_data をパネルから返す
                 sector_data = load_all_sector_indices(
-                    self.dataset, self.start_date, self.end_date
+                    self.dataset,
+                    self.start_date,
+                    self.end_date,
+                    include_topix=self._should_load_benchmark(),
                 )
                 stock_sector_mapping = get_stock_sector_mapping(self.dataset)
 
@@ -566,16 +641,43 @@ class BacktestExecutorMixin:
             "info",
         )
 
+    def _apply_position_limit(
+        self: "StrategyProtocol",
+        entries: pd.DataFrame,
+        exits: pd.DataFrame,
+        data_dict: Optional[Dict[str, pd.DataFrame]] = None,
+    ) -> pd.DataFrame:
+        """max_concurrent_positions を優先度・保有状況つきで適用"""
+        if not self.max_concurrent_positions:
+            return entries
+        mode: PositionLimitMode = getattr(self, "position_limit_mode", "daily_entries")
+        if self._uses_round_trip_execution():
+            # ラウンドトリップは同一/翌セッションで決済されるため日次上限と同義
+            mode = "daily_entries"
+        priority = (
+            build_entry_priority_panel(
+                data_dict, getattr(self, "entry_priority", "column_order")
+            )
+            if data_dict
+            else None
+        )
+        return self._limit_entries_per_day(
+            entries,
+            self.max_concurrent_positions,
+            priority=priority,
+            exits=exits,
+            mode=mode,
+        )
+
     def _apply_grouped_position_limit(
         self: "StrategyProtocol",
         all_entries: pd.DataFrame,
         all_exits: pd.DataFrame,
+        data_dict: Optional[Dict[str, pd.DataFrame]] = None,
     ) -> tuple[pd.DataFrame, pd.DataFrame]:
         if not self.max_concurrent_positions:
             return all_entries, all_exits
-        limited_entries = self._limit_entries_per_day(
-            all_entries, self.max_concurrent_positions
-        )
+        limited_entries = self._apply_position_limit(all_entries, all_exits, data_dict)
         if self._uses_round_trip_execution():
             return limited_entries, self._build_empty_exit_frame(limited_entries)
         return limited_entries, all_exits
@@ -598,7 +700,9 @@ class BacktestExecutorMixin:
                 all_entries=all_entries,
                 all_exits=all_exits,
             )
-            all_entries, all_exits = self._apply_grouped_position_limit(all_entries, all_exits)
+            all_entries, all_exits = self._apply_grouped_position_limit(
+                all_entries, all_exits, data_dict
+            )
 
             self._set_grouped_portfolio_inputs_cache(
                 open_data=open_data,
@@ -770,6 +874,25 @@ class BacktestExecutorMixin:
                 "info",
             )
 
+    def _trim_to_evaluation_window(
+        self: "StrategyProtocol",
+        stock_data: pd.DataFrame,
+        entries: pd.Series,
+        exits: pd.Series,
+    ) -> Tuple[pd.DataFrame, pd.Series, pd.Series]:
+        """evaluation_start 以降のみをポートフォリオ入力に残す（シグナルは全期間で計算済み）。"""
+        evaluation_start = getattr(self, "evaluation_start", None)
+        if not evaluation_start or not isinstance(stock_data.index, pd.DatetimeIndex):
+            return stock_data, entries, exits
+        boundary = pd.Timestamp(evaluation_start)
+        if stock_data.index.tz is not None:
+            boundary = boundary.tz_localize(stock_data.index.tz)
+        return (
+            stock_data.loc[stock_data.index >= boundary],
+            entries.loc[entries.index >= boundary],
+            exits.loc[exits.index >= boundary],
+        )
+
     def run_multi_backtest(
         self: "StrategyProtocol",
         allocation_pct: Optional[float] = None,
@@ -793,56 +916,63 @@ class BacktestExecutorMixin:
         use_group_by = self.group_by
 
         self._log_multi_backtest_start(use_group_by=use_group_by)
-        sector_data, stock_sector_mapping = self._load_multi_backtest_signal_dependencies()
-        multi_data_dict, relative_data_dict, execution_data_dict = self._load_multi_backtest_price_data()
-        self._filter_stock_codes_to_loaded_data(
-            multi_data_dict=multi_data_dict,
-            execution_data_dict=execution_data_dict,
-        )
+        with metrics_recorder.stage_timer("backtest", "data_load"):
+            sector_data, stock_sector_mapping = self._load_multi_backtest_signal_dependencies()
+            multi_data_dict, relative_data_dict, execution_data_dict = (
+                self._load_multi_backtest_price_data()
+            )
+            self._filter_stock_codes_to_loaded_data(
+                multi_data_dict=multi_data_dict,
+                execution_data_dict=execution_data_dict,
+            )
 
         # 各銘柄のデータとシグナルを統合
         data_dict = {}
         entries_dict = {}
         exits_dict = {}
 
-        for stock_code in self.stock_codes:
-            stock_signal_result = self._build_stock_signals_for_multi_backtest(
-                stock_code,
-                multi_data_dict=multi_data_dict,
-                relative_data_dict=relative_data_dict,
-                execution_data_dict=execution_data_dict,
-                sector_data=sector_data,
-                stock_sector_mapping=stock_sector_mapping,
-            )
-            if stock_signal_result is None:
-                continue
-            stock_data, entries, exits = stock_signal_result
+        with metrics_recorder.stage_timer("backtest", "signal_generation"):
+            for stock_code in self.stock_codes:
+                stock_signal_result = self._build_stock_signals_for_multi_backtest(
+                    stock_code,
+                    multi_data_dict=multi_data_dict,
+                    relative_data_dict=relative_data_dict,
+                    execution_data_dict=execution_data_dict,
+                    sector_data=sector_data,
+                    stock_sector_mapping=stock_sector_mapping,
+                )
+                if stock_signal_result is None:
+                    continue
+                stock_data, entries, exits = stock_signal_result
+
+                if self._uses_round_trip_execution():
+                    entries, exits = self._prepare_round_trip_signals(
+                        stock_code=stock_code,
+                        entries=entries,
+                        execution_data=stock_data,
+                    )
+                stock_data, entries, exits = self._trim_to_evaluation_window(
+                    stock_data, entries, exits
+                )
 
-            if self._uses_round_trip_execution():
-                entries, exits = self._prepare_round_trip_signals(
-                    stock_code=stock_code,
+                data_dict[stock_code] = stock_data
+                entries_dict[stock_code] = entries
+                exits_dict[stock_code] = exits
+                self._log_stock_signal_summary(
+                    stock_code,
+                    stock_data=stock_data,
                     entries=entries,
-                    execution_data=stock_data,
+                    exits=exits,
                 )
 
-            data_dict[stock_code] = stock_data
-            entries_dict[stock_code] = entries
-            exits_dict[stock_code] = exits
-            self._log_stock_signal_summary(
-                stock_code,
-                stock_data=stock_data,
-                entries=entries,
-                exits=exits,
-            )
-
-        if use_group_by:
-            return self._create_grouped_portfolio_from_signals(
-                data_dict,
-                entries_dict,
-                exits_dict,
-                allocation_pct,
-            )
-        else:
+        with metrics_recorder.stage_timer("backtest", "portfolio_build"):
+            if use_group_by:
+                return self._create_grouped_portfolio_from_signals(
+                    data_dict,
+                    entries_dict,
+                    exits_dict,
+                    allocation_pct,
+                )
             self._clear_grouped_portfolio_inputs_cache()
             # 個別ポートフォリオの場合（ピラミッディングは未実装）
             pyramid_enabled = False
@@ -881,9 +1011,7 @@ class BacktestExecutorMixin:
         entries_data = self._apply_dynamic_universe_entry_gate(entries_data)
 
         if self.max_concurrent_positions:
-            entries_data = self._limit_entries_per_day(
-                entries_data, self.max_concurrent_positions
-            )
+            entries_data = self._apply_position_limit(entries_data, exits_data, data_dict)
             if self._uses_round_trip_execution():
                 exits_data = self._build_empty_exit_frame(entries_data)
 
@@ -920,22 +1048,21 @@ class BacktestExecutorMixin:
 
     @staticmethod
     def _limit_entries_per_day(
-        entries: pd.DataFrame, max_positions: int
+        entries: pd.DataFrame,
+        max_positions: int,
+        *,
+        priority: Optional[pd.DataFrame] = None,
+        exits: Optional[pd.DataFrame] = None,
+        mode: PositionLimitMode = "daily_entries",
     ) -> pd.DataFrame:
-        """日次のエントリー数を上限で制限（簡易版）"""
-        if max_positions <= 0:
-            return entries
-
-        limited = entries.copy()
-        for idx, row in entries.iterrows():
-            if row.sum() <= max_positions:
-                continue
-            true_cols = row[row].index.tolist()
-            drop_cols = true_cols[max_positions:]
-            if drop_cols:
-                for column in drop_cols:
-                    limited.at[cast(Any, idx), cast(Any, column)] = False
-        return limited
+        """エントリー数を上限で制限（position_limits.limit_entries に委譲）"""
+        return limit_entries(
+            entries,
+            max_positions,
+            priority=priority,
+            exits=exits,
+            mode=mode,
+        )
 
     def run_optimized_backtest(
         self, group_by: Optional[bool] = None
@@ -6,11 +6,15 @@ YamlConfigurableStrategy用のケリー基準を用いたポートフォリオ
 """
 
 import math
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
 
 import pandas as pd
 
 from src.domains.backtest.vectorbt_adapter import (
+    ALLOCATION_SWEEP_LEVEL,
+    SWEEP_METRIC_COLUMNS,
     ExecutionPortfolioProtocol,
     canonical_metrics_from_portfolio,
     ensure_execution_portfolio,
@@ -19,6 +23,47 @@ from src.domains.backtest.vectorbt_adapter import (
 if TYPE_CHECKING:
     from .protocols import StrategyProtocol
 
+# 感度分析で評価するケリー係数（Quarter / Half / Three-quarter / Full Kelly）
+DEFAULT_KELLY_SWEEP_FRACTIONS: Tuple[float, ...] = (0.25, 0.5, 0.75, 1.0)
+
+
+def _kelly_allocation(
+    kelly_value: float,
+    kelly_fraction: float,
+    min_allocation: float,
+    max_allocation: float,
+    stock_count: int,
+) -> float:
+    """ケリー値と係数から制約適用済みの配分率を求める。"""
+    if kelly_value > 0:
+        return max(min_allocation, min(max_allocation, kelly_value * kelly_fraction))
+    if kelly_value == 0:
+        # トレード0件などでケリー値が0の場合は均等配分
+        return 1.0 / stock_count
+    # 負のケリー値の場合は最小配分
+    return min_allocation
+
+
+@dataclass(frozen=True)
+class KellyAllocationSweepResult:
+    """ケリー配分率スイープ結果
+
+    Attributes:
+        initial_portfolio: 第1段階（均等配分）のポートフォリオ
+        metrics: 配分率を index とするメトリクス表（kelly_multiplier 列付き）
+        optimal_allocation: objective を最大化した配分率
+        objective: 最適配分率の選択に使ったメトリクス列名
+        stats: 第1段階から計算したケリー統計
+        all_entries: エントリーシグナルDataFrame
+    """
+
+    initial_portfolio: ExecutionPortfolioProtocol
+    metrics: pd.DataFrame
+    optimal_allocation: float
+    objective: str
+    stats: Dict[str, float]
+    all_entries: Optional[pd.DataFrame]
+
 
 class PortfolioAnalyzerKellyMixin:
     """ケリー基準ポートフォリオ最適化ミックスイン"""
@@ -66,23 +111,20 @@ class PortfolioAnalyzerKellyMixin:
             # 統合ポートフォリオ全体のケリー計算
             kelly_value, stats = self._calculate_kelly_for_portfolio(portfolio)
 
-            # ケリー基準適用
-            if kelly_value > 0:
-                optimized_allocation = kelly_value * kelly_fraction
-                # 制約適用
-                optimized_allocation = max(
-                    min_allocation, min(max_allocation, optimized_allocation)
-                )
-            elif kelly_value == 0:
-                # トレード0件などでケリー値が0の場合は均等配分
+            # ケリー基準適用（制約込み）
+            if kelly_value == 0:
                 self._log("ケリー値が0のため均等配分を使用", "warning")
-                optimized_allocation = 1.0 / len(self.stock_codes)
-            else:
-                # 負のケリー値の場合は最小配分
+            elif kelly_value < 0:
                 self._log(
                     f"負のケリー値のため最小配分を使用: {kelly_value:.3f}", "warning"
                 )
-                optimized_allocation = min_allocation
+            optimized_allocation = _kelly_allocation(
+                kelly_value,
+                kelly_fraction,
+                min_allocation,
+                max_allocation,
+                len(self.stock_codes),
+            )
 
             # 結果サマリー
             self._log("✅ ケリー基準配分最適化完了", "info")
@@ -336,3 +378,110 @@ class PortfolioAnalyzerKellyMixin:
         except Exception as e:
             self._log(f"ケリー基準2段階最適化バックテストエラー: {e}", "error")
             raise RuntimeError(f"ケリー基準2段階最適化バックテスト実行失敗: {e}")
+
+    def run_kelly_allocation_sweep(
+        self: "StrategyProtocol",
+        kelly_fractions: Sequence[float] = DEFAULT_KELLY_SWEEP_FRACTIONS,
+        allocations: Optional[Sequence[float]] = None,
+        min_allocation: float = 0.01,
+        max_allocation: float = 0.5,
+        objective: str = "total_return",
+    ) -> KellyAllocationSweepResult:
+        """
+        複数の配分率をまとめて評価するケリー感度分析を実行
+
+        第1段階（均等配分）でシグナルとケリー統計を求めたあと、各ケリー係数
+        （または明示した配分率）をキャッシュ済みシグナル上で一括評価する。
+        グループ実行では第2段階が配分率の数によらず1回のシミュレーションで済む。
+
+        Args:
+            kelly_fractions: 評価するケリー係数（allocations 未指定時に使用）
+            allocations: 直接評価する配分率（指定時は kelly_fractions より優先）
+            min_allocation: 最小配分率
+            max_allocation: 最大配分率
+            objective: 最適配分率の選択基準（メトリクス列名、最大化）
+
+        Returns:
+            KellyAllocationSweepResult: 配分率ごとのメトリクス表と最適配分率
+        """
+        if objective not in SWEEP_METRIC_COLUMNS:
+            raise ValueError(
+                f"objective must be one of {SWEEP_METRIC_COLUMNS}: {objective}"
+            )
+
+        self._log("🚀 ケリー配分率スイープ開始", "info")
+        try:
+            initial_portfolio, all_entries = self.run_multi_backtest()
+            initial_portfolio = ensure_execution_portfolio(initial_portfolio)
+            if self.group_by:
+                self.combined_portfolio = initial_portfolio
+            else:
+                self.portfolio = initial_portfolio
+
+            kelly_value, stats = self._calculate_kelly_for_portfolio(initial_portfolio)
+            if allocations is not None:
+                multipliers: Dict[float, float] = {
+                    float(allocation): math.nan for allocation in allocations
+                }
+            else:
+                multipliers = {}
+                for fraction in kelly_fractions:
+                    allocation = _kelly_allocation(
+                        kelly_value,
+                        fraction,
+                        min_allocation,
+                        max_allocation,
+                        len(self.stock_codes),
+                    )
+                    multipliers.setdefault(allocation, float(fraction))
+            if not multipliers:
+                raise ValueError("評価する配分率が指定されていません")
+
+            candidates = list(multipliers)
+            if self.group_by and self._grouped_portfolio_inputs_cache is not None:
+                metrics = self.run_allocation_sweep_from_cached_signals(candidates)
+            else:
+                rows: Dict[float, Dict[str, Any]] = {}
+                for allocation in candidates:
+                    portfolio, _ = self.run_multi_backtest(allocation_pct=allocation)
+                    canonical = canonical_metrics_from_portfolio(portfolio)
+                    rows[allocation] = {
+                        column: getattr(canonical, column, None)
+                        for column in SWEEP_METRIC_COLUMNS
+                    }
+                metrics = pd.DataFrame.from_dict(
+                    rows, orient="index", columns=list(SWEEP_METRIC_COLUMNS)
+                )
+                metrics.index.name = ALLOCATION_SWEEP_LEVEL
+            metrics = metrics.copy()
+            metrics["kelly_multiplier"] = [multipliers[value] for value in metrics.index]
+
+            objective_values = pd.to_numeric(metrics[objective], errors="coerce")
+            if objective_values.notna().any():
+                optimal_allocation = float(cast(float, objective_values.idxmax()))
+            else:
+                # 全配分率でメトリクスが算出できない場合は最も保守的な配分率
+                optimal_allocation = float(min(candidates))
+                self._log(
+                    f"{objective} が算出できないため最小配分率を使用", "warning"
+                )
+
+            self._log("✅ ケリー配分率スイープ完了", "info")
+            self._log(f"  - Full Kelly: {kelly_value:.1%}", "info")
+            self._log(f"  - 評価配分率数: {len(candidates)}", "info")
+            self._log(
+                f"  - 最適配分率 ({objective}): {optimal_allocation:.1%}", "info"
+            )
+
+            return KellyAllocationSweepResult(
+                initial_portfolio=initial_portfolio,
+                metrics=metrics,
+                optimal_allocation=optimal_allocation,
+                objective=objective,
+                stats=stats,
+                all_entries=all_entries,
+            )
+
+        except Exception as e:
+            self._log(f"ケリー配分率スイープエラー: {e}", "error")
+            raise RuntimeError(f"ケリー配分率スイープ実行失敗: {e}")
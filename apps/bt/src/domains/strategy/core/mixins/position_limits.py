@@ -0,0 +1,179 @@
+"""
+ポジション数上限カーネル
+
+max_concurrent_positions を (日付 x 銘柄) のエントリー行列に一括適用する。
+
+- daily_entries: 日次の新規エントリー数を上限で制限（numpy ベクトル化）
+- open_positions: 前日までに建てて未決済のポジションも数え、
+  保有数 + 新規エントリー数を上限で制限（numba による日付方向の逐次処理）
+
+どちらのモードも優先度パネル（売買代金・シグナルスコア等）が与えられれば
+値の大きい銘柄から残し、同値・未指定時は列順で残す。
+売買代金・出来高の優先度は約定前に確定している前セッションの値を使う。
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+PositionLimitMode = Literal["daily_entries", "open_positions"]
+EntryPriority = Literal["column_order", "trading_value", "volume"]
+
+
+def _priority_order(
+    entries: np.ndarray,
+    priority: np.ndarray | None,
+    rows: np.ndarray | None = None,
+) -> np.ndarray:
+    """行ごとに優先度の高い順の列インデックスを返す（同値は列順、NaN は最後）。
+
+    rows を指定した場合はその行だけ並べ替え、他の行は列順のままにする。
+    """
+    n_rows, n_cols = entries.shape
+    order = np.broadcast_to(np.arange(n_cols), (n_rows, n_cols))
+    if priority is None:
+        return order
+    order = order.copy()
+    target = slice(None) if rows is None else rows
+    score = priority[target]
+    score = np.where(np.isnan(score), -np.inf, score)
+    order[target] = np.argsort(-score, axis=1, kind="stable")
+    return order
+
+
+def _cap_daily_entries(
+    entries: np.ndarray,
+    max_positions: int,
+    priority: np.ndarray | None,
+) -> np.ndarray:
+    if priority is None:
+        return entries & (np.cumsum(entries, axis=1) <= max_positions)
+    # 上限を超える行だけ並べ替える
+    over = np.flatnonzero(entries.sum(axis=1) > max_positions)
+    limited = entries.copy()
+    if over.size == 0:
+        return limited
+    row_entries = entries[over]
+    order = _priority_order(row_entries, priority[over])
+    sorted_entries = np.take_along_axis(row_entries, order, axis=1)
+    keep_sorted = sorted_entries & (np.cumsum(sorted_entries, axis=1) <= max_positions)
+    row_limited = np.zeros_like(row_entries)
+    np.put_along_axis(row_limited, order, keep_sorted, axis=1)
+    limited[over] = row_limited
+    return limited
+
+
+@njit
+def _cap_open_positions_nb(
+    entries: np.ndarray,
+    exits: np.ndarray,
+    order: np.ndarray,
+    max_positions: int,
+) -> np.ndarray:
+    n_rows, n_cols = entries.shape
+    limited = np.zeros((n_rows, n_cols), dtype=np.bool_)
+    is_open = np.zeros(n_cols, dtype=np.bool_)
+    open_count = 0
+    for i in range(n_rows):
+        # 当日のエグジットで決済された枠は同日の新規エントリーに使える
+        for col in range(n_cols):
+            if is_open[col] and exits[i, col]:
+                is_open[col] = False
+                open_count -= 1
+        for rank in range(n_cols):
+            if open_count >= max_positions:
+                break
+            col = order[i, rank]
+            if entries[i, col] and not is_open[col]:
+                limited[i, col] = True
+                is_open[col] = True
+                open_count += 1
+    return limited
+
+
+def limit_entries(
+    entries: pd.DataFrame,
+    max_positions: int,
+    *,
+    priority: pd.DataFrame | None = None,
+    exits: pd.DataFrame | None = None,
+    mode: PositionLimitMode = "daily_entries",
+) -> pd.DataFrame:
+    """
+    エントリー行列にポジション数上限を適用する
+
+    Args:
+        entries: (日付 x 銘柄) のエントリーシグナル
+        max_positions: 上限数（0 以下なら制限しない）
+        priority: entries と同形の優先度パネル（大きいほど優先）
+        exits: open_positions モードで保有解消に使うエグジットシグナル
+        mode: daily_entries / open_positions
+
+    Returns:
+        上限適用後のエントリーシグナル
+    """
+    if max_positions <= 0 or entries.empty:
+        return entries
+
+    entry_values = entries.to_numpy(dtype=bool, na_value=False)
+    priority_values = (
+        priority.reindex(index=entries.index, columns=entries.columns).to_numpy(
+            dtype=float, na_value=np.nan
+        )
+        if priority is not None
+        else None
+    )
+
+    if mode == "open_positions":
+        exit_values = (
+            exits.reindex(index=entries.index, columns=entries.columns).to_numpy(
+                dtype=bool, na_value=False
+            )
+            if exits is not None
+            else np.zeros_like(entry_values)
+        )
+        order = np.ascontiguousarray(
+            _priority_order(
+                entry_values,
+                priority_values,
+                rows=np.flatnonzero(entry_values.any(axis=1)),
+            )
+        )
+        limited_values = _cap_open_positions_nb(
+            entry_values, exit_values, order, int(max_positions)
+        )
+    else:
+        limited_values = _cap_daily_entries(entry_values, int(max_positions), priority_values)
+
+    return pd.DataFrame(limited_values, index=entries.index, columns=entries.columns)
+
+
+def build_entry_priority_panel(
+    data_dict: dict[str, pd.DataFrame],
+    entry_priority: EntryPriority,
+) -> pd.DataFrame | None:
+    """銘柄別 OHLCV から優先度パネルを作る（column_order なら None）。
+
+    約定日（翌セッション執行なら Open）のセッション全体の売買代金は約定時点で
+    未確定なため、各銘柄の 1 セッション前の値で順位付けする（先読み防止）。
+    """
+    if entry_priority == "column_order":
+        return None
+    columns: dict[str, pd.Series] = {}
+    for stock_code, data in data_dict.items():
+        if "Volume" not in data.columns:
+            continue
+        volume = data["Volume"].astype(float)
+        if entry_priority == "trading_value":
+            if "Close" not in data.columns:
+                continue
+            columns[stock_code] = (data["Close"].astype(float) * volume).shift(1)
+        else:
+            columns[stock_code] = volume.shift(1)
+    if not columns:
+        return None
+    return pd.DataFrame(columns)
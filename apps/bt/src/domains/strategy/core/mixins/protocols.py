@@ -4,6 +4,7 @@ Type protocols for mixin classes.
 Defines the expected interfaces that mixin classes assume from their host classes.
 """
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 
 import pandas as pd
@@ -41,6 +42,7 @@ class StrategyProtocol(Protocol):
     dataset: str
     start_date: str | None
     end_date: str | None
+    evaluation_start: str | None
     timeframe: Literal["daily", "weekly"]
     next_session_round_trip: bool
     current_session_round_trip: bool
@@ -132,6 +134,13 @@ class StrategyProtocol(Protocol):
         """Run grouped backtest by reusing cached close/entry/exit matrices."""
         ...
 
+    def run_allocation_sweep_from_cached_signals(
+        self,
+        allocations: Sequence[float],
+    ) -> pd.DataFrame:
+        """Evaluate several allocations over cached matrices in one simulation."""
+        ...
+
 
 class RiskManagementProtocol(Protocol):
     """Protocol for risk management mixin."""
@@ -86,9 +86,13 @@ class YamlConfigurableStrategy(
         self.spread = shared_config.spread
         self.borrow_fee = shared_config.borrow_fee
         self.max_concurrent_positions = shared_config.max_concurrent_positions
+        self.position_limit_mode = shared_config.position_limit_mode
+        self.entry_priority = shared_config.entry_priority
         self.max_exposure = shared_config.max_exposure
         self.start_date = shared_config.start_date
         self.end_date = shared_config.end_date
+        # 多段階評価の低忠実度段: シグナルは全期間で計算し、ポートフォリオのみこの日付以降に絞る
+        self.evaluation_start: str | None = None
         self.printlog = shared_config.printlog
 
         # loguruベースのロガーを初期化
@@ -20,6 +20,26 @@ from src.domains.strategy.indicators.calculations import (
     compute_trading_value_ma,
     compute_volume_mas,
     compute_volume_weighted_ema,
+    BollingerBandsPanelResult,
+    MACDPanelResult,
+    compute_accumulation_distribution_line_panel,
+    compute_atr_panel,
+    compute_atr_support_line_panel,
+    compute_bollinger_bands_panel,
+    compute_chaikin_money_flow_panel,
+    compute_chaikin_oscillator_panel,
+    compute_macd_panel,
+    compute_moving_average_panel,
+    compute_nbar_support_panel,
+    compute_on_balance_volume_panel,
+    compute_on_balance_volume_score_panel,
+    compute_recent_return_panel,
+    compute_risk_adjusted_return_panel,
+    compute_rsi_panel,
+    compute_trading_value_ma_panel,
+    compute_volume_flow_score_panel,
+    compute_volume_mas_panel,
+    compute_volume_weighted_ema_panel,
 )
 
 __all__ = [
@@ -42,4 +62,24 @@ __all__ = [
     "compute_trading_value_ma",
     "compute_volume_mas",
     "compute_volume_weighted_ema",
+    "BollingerBandsPanelResult",
+    "MACDPanelResult",
+    "compute_accumulation_distribution_line_panel",
+    "compute_atr_panel",
+    "compute_atr_support_line_panel",
+    "compute_bollinger_bands_panel",
+    "compute_chaikin_money_flow_panel",
+    "compute_chaikin_oscillator_panel",
+    "compute_macd_panel",
+    "compute_moving_average_panel",
+    "compute_nbar_support_panel",
+    "compute_on_balance_volume_panel",
+    "compute_on_balance_volume_score_panel",
+    "compute_recent_return_panel",
+    "compute_risk_adjusted_return_panel",
+    "compute_rsi_panel",
+    "compute_trading_value_ma_panel",
+    "compute_volume_flow_score_panel",
+    "compute_volume_mas_panel",
+    "compute_volume_weighted_ema_panel",
 ]
@@ -3,18 +3,27 @@
 
 signal関数とindicator serviceの両方から呼ばれる計算ロジック。
 全て pd.Series[float] を返す（NaN/inf除去・丸めは呼び出し側の責務）。
+
+計算本体は (日付 x 銘柄) の DataFrame を受け取る ``*_panel`` 関数で、
+ユニバース全体を列方向に一括計算する。各列は同じ位置に NaN を持つ Series と
+同じウォームアップ・NaN 規則で計算される。Series 版はパネル版をそのまま
+Series に適用する薄いラッパー（複数系列を返す MACD / ボリンジャーバンドは
+共通の内部関数を使い、Series 用・DataFrame 用の結果コンテナを分けて返す）。
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, TypeVar, cast
 
 import numpy as np
 import pandas as pd
 
 MovingAverageType = Literal["sma", "ema"]
 
+# パネル版は (日付 x 銘柄) の DataFrame を想定するが、同じ演算で Series も受け付ける
+FrameT = TypeVar("FrameT", pd.Series, pd.DataFrame)
+
 
 @dataclass(frozen=True, slots=True)
 class MACDResult:
@@ -30,24 +39,41 @@ class BollingerBandsResult:
     lower: pd.Series[float]
 
 
-def compute_moving_average(
-    series: pd.Series[float],
+@dataclass(frozen=True, slots=True)
+class MACDPanelResult:
+    macd: pd.DataFrame
+    signal: pd.DataFrame
+    histogram: pd.DataFrame
+
+
+@dataclass(frozen=True, slots=True)
+class BollingerBandsPanelResult:
+    upper: pd.DataFrame
+    middle: pd.DataFrame
+    lower: pd.DataFrame
+
+
+# ===== パネル版 (日付 x 銘柄) =====
+
+
+def compute_moving_average_panel(
+    panel: FrameT,
     period: int,
     ma_type: MovingAverageType = "sma",
-) -> pd.Series[float]:
-    """単純/指数移動平均を計算する。"""
+) -> FrameT:
+    """全列の単純/指数移動平均を計算する。"""
     if ma_type == "sma":
-        return series.rolling(window=period, min_periods=period).mean()
+        return panel.rolling(window=period, min_periods=period).mean()
     if ma_type == "ema":
-        return series.ewm(span=period, adjust=False, min_periods=period).mean()
+        return panel.ewm(span=period, adjust=False, min_periods=period).mean()
     raise ValueError(f"未対応のma_type: {ma_type} (sma/emaのみ)")
 
 
-def compute_rsi(
-    close: pd.Series[float],
+def compute_rsi_panel(
+    close: FrameT,
     period: int = 14,
-) -> pd.Series[float]:
-    """VectorBT 既定値互換の RSI を計算する。"""
+) -> FrameT:
+    """全列の RSI（VectorBT 既定値互換）を計算する。"""
     delta = close.diff()
     gains = delta.clip(lower=0)
     losses = -delta.clip(upper=0)
@@ -58,11 +84,328 @@ def compute_rsi(
     rs = avg_gain / avg_loss.replace(0, np.nan)
     rsi = 100 - (100 / (1 + rs))
 
-    flat_mask = (avg_gain == 0) & (avg_loss == 0)
+    flat_mask = cast(FrameT, (avg_gain == 0) & (avg_loss == 0))
+    up_only_mask = cast(FrameT, (avg_loss == 0) & (avg_gain > 0))
+    down_only_mask = cast(FrameT, (avg_gain == 0) & (avg_loss > 0))
     rsi = rsi.mask(flat_mask, 50.0)
-    rsi = rsi.mask((avg_loss == 0) & (avg_gain > 0), 100.0)
-    rsi = rsi.mask((avg_gain == 0) & (avg_loss > 0), 0.0)
-    return rsi
+    rsi = rsi.mask(up_only_mask, 100.0)
+    rsi = rsi.mask(down_only_mask, 0.0)
+    return cast(FrameT, rsi)
+
+
+def _compute_macd_components(
+    close: FrameT,
+    fast_period: int,
+    slow_period: int,
+    signal_period: int,
+) -> tuple[FrameT, FrameT, FrameT]:
+    fast_ma = compute_moving_average_panel(close, fast_period, ma_type="sma")
+    slow_ma = compute_moving_average_panel(close, slow_period, ma_type="sma")
+    macd_line = cast(FrameT, fast_ma - slow_ma)
+    signal_line = compute_moving_average_panel(macd_line, signal_period, ma_type="sma")
+    histogram = cast(FrameT, macd_line - signal_line)
+    return macd_line, signal_line, histogram
+
+
+def compute_macd_panel(
+    close: pd.DataFrame,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9,
+) -> MACDPanelResult:
+    """全列の MACD line / signal line / histogram を計算する。"""
+    macd_line, signal_line, histogram = _compute_macd_components(
+        close, fast_period, slow_period, signal_period
+    )
+    return MACDPanelResult(
+        macd=macd_line,
+        signal=signal_line,
+        histogram=histogram,
+    )
+
+
+def _compute_bollinger_components(
+    close: FrameT,
+    window: int,
+    alpha: float,
+) -> tuple[FrameT, FrameT, FrameT]:
+    middle = cast(FrameT, close.rolling(window=window, min_periods=window).mean())
+    std = close.rolling(window=window, min_periods=window).std(ddof=0)
+    band_width = std * alpha
+    return (
+        cast(FrameT, middle + band_width),
+        middle,
+        cast(FrameT, middle - band_width),
+    )
+
+
+def compute_bollinger_bands_panel(
+    close: pd.DataFrame,
+    window: int = 20,
+    alpha: float = 2.0,
+) -> BollingerBandsPanelResult:
+    """全列のボリンジャーバンドを計算する。"""
+    upper, middle, lower = _compute_bollinger_components(close, window, alpha)
+    return BollingerBandsPanelResult(
+        upper=upper,
+        middle=middle,
+        lower=lower,
+    )
+
+
+def _compute_true_range_panel(
+    high: FrameT,
+    low: FrameT,
+    close: FrameT,
+) -> FrameT:
+    previous_close = close.shift(1)
+    tr1 = high - low
+    tr2 = (high - previous_close).abs()
+    tr3 = (low - previous_close).abs()
+    # NaN を無視した最大値（全て NaN なら NaN）
+    return cast(FrameT, np.fmax(np.fmax(tr1, tr2), tr3))
+
+
+def compute_atr_panel(
+    high: FrameT,
+    low: FrameT,
+    close: FrameT,
+    period: int = 14,
+) -> FrameT:
+    """全列の ATR を計算する。"""
+    true_range = _compute_true_range_panel(high, low, close)
+    return compute_moving_average_panel(true_range, period, ma_type="ema")
+
+
+def compute_atr_support_line_panel(
+    high: FrameT,
+    low: FrameT,
+    close: FrameT,
+    lookback_period: int,
+    atr_multiplier: float,
+) -> FrameT:
+    """全列の ATR サポートラインを計算する（compute_atr_support_line 参照）。"""
+    true_range = _compute_true_range_panel(high, low, close)
+    atr_ema = compute_moving_average_panel(
+        true_range,
+        lookback_period,
+        ma_type="ema",
+    )
+    highest_close = close.rolling(window=lookback_period).max()
+    return highest_close - (atr_ema * atr_multiplier)
+
+
+def compute_volume_mas_panel(
+    volume: FrameT,
+    short_period: int,
+    long_period: int,
+    ma_type: str = "sma",
+) -> tuple[FrameT, FrameT]:
+    """全列の出来高の短期/長期MA"""
+    if ma_type == "median":
+        short_ma = volume.rolling(window=short_period, min_periods=short_period).median()
+        long_ma = volume.rolling(window=long_period, min_periods=long_period).median()
+        return short_ma, long_ma
+    if ma_type not in ("sma", "ema"):
+        raise ValueError(f"未対応のma_type: {ma_type} (sma/ema/medianのみ)")
+
+    resolved_ma_type: MovingAverageType = "ema" if ma_type == "ema" else "sma"
+    short_ma = compute_moving_average_panel(volume, short_period, ma_type=resolved_ma_type)
+    long_ma = compute_moving_average_panel(volume, long_period, ma_type=resolved_ma_type)
+    return short_ma, long_ma
+
+
+def compute_trading_value_ma_panel(
+    close: FrameT,
+    volume: FrameT,
+    period: int,
+) -> FrameT:
+    """全列の売買代金MA (億円単位)"""
+    trading_value = close * volume / 1e8
+    return compute_moving_average_panel(trading_value, period)
+
+
+def compute_volume_weighted_ema_panel(
+    close: FrameT,
+    volume: FrameT,
+    period: int,
+) -> FrameT:
+    """全列の出来高加重EMA (VWEMA)"""
+    weighted_price = close * volume
+    weighted_price_ema = compute_moving_average_panel(
+        weighted_price,
+        period,
+        ma_type="ema",
+    )
+    volume_ema = compute_moving_average_panel(volume, period, ma_type="ema")
+    return weighted_price_ema / volume_ema.replace(0, np.nan)
+
+
+def _compute_money_flow_multiplier_panel(
+    high: FrameT,
+    low: FrameT,
+    close: FrameT,
+) -> FrameT:
+    price_range = high - low
+    multiplier = ((close - low) - (high - close)) / price_range.replace(0, np.nan)
+    return multiplier.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+
+def compute_chaikin_money_flow_panel(
+    high: FrameT,
+    low: FrameT,
+    close: FrameT,
+    volume: FrameT,
+    period: int = 20,
+) -> FrameT:
+    """全列の Chaikin Money Flow (CMF) を計算する。"""
+    multiplier = _compute_money_flow_multiplier_panel(high, low, close)
+    money_flow_volume = multiplier * volume
+    volume_sum = volume.rolling(window=period, min_periods=period).sum()
+    mfv_sum = money_flow_volume.rolling(window=period, min_periods=period).sum()
+    return mfv_sum / volume_sum.replace(0, np.nan)
+
+
+def compute_accumulation_distribution_line_panel(
+    high: FrameT,
+    low: FrameT,
+    close: FrameT,
+    volume: FrameT,
+) -> FrameT:
+    """全列の Accumulation/Distribution Line (ADL) を計算する。"""
+    multiplier = _compute_money_flow_multiplier_panel(high, low, close)
+    money_flow_volume = (multiplier * volume).fillna(0.0)
+    return money_flow_volume.cumsum()
+
+
+def compute_on_balance_volume_panel(
+    close: FrameT,
+    volume: FrameT,
+) -> FrameT:
+    """全列の On-Balance Volume (OBV) を計算する。"""
+    direction = np.sign(close.diff()).fillna(0.0)
+    signed_volume = (direction * volume).fillna(0.0)
+    return signed_volume.cumsum()
+
+
+def compute_volume_flow_score_panel(
+    cumulative_flow: FrameT,
+    volume: FrameT,
+    lookback_period: int = 20,
+) -> FrameT:
+    """全列の累積 volume-flow 指標を出来高で正規化する（compute_volume_flow_score 参照）。"""
+    flow_change = cumulative_flow - cumulative_flow.shift(lookback_period)
+    volume_sum = volume.rolling(
+        window=lookback_period,
+        min_periods=lookback_period,
+    ).sum()
+    return flow_change / volume_sum.replace(0, np.nan)
+
+
+def compute_chaikin_oscillator_panel(
+    high: FrameT,
+    low: FrameT,
+    close: FrameT,
+    volume: FrameT,
+    fast_period: int = 3,
+    slow_period: int = 10,
+) -> FrameT:
+    """全列の Chaikin Oscillator = EMA(ADL, fast) - EMA(ADL, slow) を計算する。"""
+    if slow_period <= fast_period:
+        raise ValueError("slow_period must be greater than fast_period")
+    adl = compute_accumulation_distribution_line_panel(high, low, close, volume)
+    fast_ema = compute_moving_average_panel(adl, fast_period, ma_type="ema")
+    slow_ema = compute_moving_average_panel(adl, slow_period, ma_type="ema")
+    return fast_ema - slow_ema
+
+
+def compute_on_balance_volume_score_panel(
+    close: FrameT,
+    volume: FrameT,
+    lookback_period: int = 20,
+) -> FrameT:
+    """全列の OBV lookback 正規化 flow score を計算する。"""
+    obv = compute_on_balance_volume_panel(close, volume)
+    return compute_volume_flow_score_panel(obv, volume, lookback_period)
+
+
+def compute_recent_return_panel(
+    close: FrameT,
+    lookback_period: int = 20,
+) -> FrameT:
+    """全列の lookback 終値リターン（percent 単位）を計算する。"""
+    if lookback_period < 1:
+        raise ValueError("lookback_period must be >= 1")
+
+    close_clean = close.replace([np.inf, -np.inf], np.nan)
+    base_close = close_clean.shift(lookback_period).replace(0, np.nan)
+    return (close_clean / base_close - 1.0) * 100.0
+
+
+def compute_nbar_support_panel(
+    low: FrameT,
+    period: int,
+) -> FrameT:
+    """全列の N日安値サポート"""
+    return low.rolling(period).min()
+
+
+def _compute_rolling_downside_std_panel(
+    returns: FrameT,
+    lookback_period: int,
+) -> FrameT:
+    """Sortino分母: 負リターンのみのローリング標準偏差"""
+    negative_only = returns.where(cast(FrameT, returns < 0))
+    return negative_only.rolling(window=lookback_period, min_periods=2).std()
+
+
+def compute_risk_adjusted_return_panel(
+    close: FrameT,
+    lookback_period: int = 60,
+    ratio_type: Literal["sharpe", "sortino"] = "sortino",
+) -> FrameT:
+    """全列のリスク調整リターン (Sharpe / Sortino) を計算"""
+    if ratio_type not in ("sharpe", "sortino"):
+        raise ValueError(f"不正なratio_type: {ratio_type} (sharpe/sortinoのみ)")
+
+    close_clean = close.replace([np.inf, -np.inf], np.nan)
+    returns = close_clean.pct_change()
+
+    rolling_mean = returns.rolling(
+        window=lookback_period,
+        min_periods=lookback_period,
+    ).mean()
+
+    if ratio_type == "sharpe":
+        rolling_denominator = returns.rolling(
+            window=lookback_period,
+            min_periods=lookback_period,
+        ).std()
+    else:
+        rolling_denominator = _compute_rolling_downside_std_panel(returns, lookback_period)
+
+    ratio = (rolling_mean / rolling_denominator) * np.sqrt(252)
+    return ratio.where(rolling_denominator > 0).astype(float)
+
+
+# ===== Series 版（パネル版の薄いラッパー） =====
+
+
+def compute_moving_average(
+    series: pd.Series[float],
+    period: int,
+    ma_type: MovingAverageType = "sma",
+) -> pd.Series[float]:
+    """単純/指数移動平均を計算する。"""
+    return compute_moving_average_panel(series, period, ma_type)
+
+
+def compute_rsi(
+    close: pd.Series[float],
+    period: int = 14,
+) -> pd.Series[float]:
+    """VectorBT 既定値互換の RSI を計算する。"""
+    return compute_rsi_panel(close, period)
 
 
 def compute_macd(
@@ -72,11 +415,9 @@ def compute_macd(
     signal_period: int = 9,
 ) -> MACDResult:
     """VectorBT 既定値互換の MACD line / signal line / histogram を計算する。"""
-    fast_ma = compute_moving_average(close, fast_period, ma_type="sma")
-    slow_ma = compute_moving_average(close, slow_period, ma_type="sma")
-    macd_line = fast_ma - slow_ma
-    signal_line = compute_moving_average(macd_line, signal_period, ma_type="sma")
-    histogram = macd_line - signal_line
+    macd_line, signal_line, histogram = _compute_macd_components(
+        close, fast_period, slow_period, signal_period
+    )
     return MACDResult(
         macd=macd_line,
         signal=signal_line,
@@ -90,27 +431,14 @@ def compute_bollinger_bands(
     alpha: float = 2.0,
 ) -> BollingerBandsResult:
     """ボリンジャーバンドを計算する。"""
-    middle = close.rolling(window=window, min_periods=window).mean()
-    std = close.rolling(window=window, min_periods=window).std(ddof=0)
-    band_width = std * alpha
+    upper, middle, lower = _compute_bollinger_components(close, window, alpha)
     return BollingerBandsResult(
-        upper=middle + band_width,
+        upper=upper,
         middle=middle,
-        lower=middle - band_width,
+        lower=lower,
     )
 
 
-def _compute_true_range(
-    high: pd.Series[float],
-    low: pd.Series[float],
-    close: pd.Series[float],
-) -> pd.Series[float]:
-    tr1 = high - low
-    tr2 = abs(high - close.shift(1))
-    tr3 = abs(low - close.shift(1))
-    return pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-
 def compute_atr(
     high: pd.Series[float],
     low: pd.Series[float],
@@ -118,8 +446,7 @@ def compute_atr(
     period: int = 14,
 ) -> pd.Series[float]:
     """ATR を計算する。"""
-    true_range = _compute_true_range(high, low, close)
-    return compute_moving_average(true_range, period, ma_type="ema")
+    return compute_atr_panel(high, low, close, period)
 
 
 def compute_atr_support_line(
@@ -136,14 +463,7 @@ def compute_atr_support_line(
       atr_value = ta.ema(trueRange, lookback_period)
       support_line = highest_close - (atr_value * atr_multiplier)
     """
-    true_range = _compute_true_range(high, low, close)
-    atr_ema = compute_moving_average(
-        true_range,
-        lookback_period,
-        ma_type="ema",
-    )
-    highest_close = close.rolling(window=lookback_period).max()
-    return highest_close - (atr_ema * atr_multiplier)
+    return compute_atr_support_line_panel(high, low, close, lookback_period, atr_multiplier)
 
 
 def compute_volume_mas(
@@ -153,17 +473,7 @@ def compute_volume_mas(
     ma_type: str = "sma",
 ) -> tuple[pd.Series[float], pd.Series[float]]:
     """出来高の短期/長期MA"""
-    if ma_type == "median":
-        short_ma = volume.rolling(window=short_period, min_periods=short_period).median()
-        long_ma = volume.rolling(window=long_period, min_periods=long_period).median()
-        return short_ma, long_ma
-    if ma_type not in ("sma", "ema"):
-        raise ValueError(f"未対応のma_type: {ma_type} (sma/ema/medianのみ)")
-
-    resolved_ma_type: MovingAverageType = "ema" if ma_type == "ema" else "sma"
-    short_ma = compute_moving_average(volume, short_period, ma_type=resolved_ma_type)
-    long_ma = compute_moving_average(volume, long_period, ma_type=resolved_ma_type)
-    return short_ma, long_ma
+    return compute_volume_mas_panel(volume, short_period, long_period, ma_type)
 
 
 def compute_trading_value_ma(
@@ -172,8 +482,7 @@ def compute_trading_value_ma(
     period: int,
 ) -> pd.Series[float]:
     """売買代金MA (億円単位)"""
-    trading_value = close * volume / 1e8
-    return compute_moving_average(trading_value, period)
+    return compute_trading_value_ma_panel(close, volume, period)
 
 
 def compute_volume_weighted_ema(
@@ -185,24 +494,7 @@ def compute_volume_weighted_ema(
 
     定義: EMA(close * volume, period) / EMA(volume, period)
     """
-    weighted_price = close * volume
-    weighted_price_ema = compute_moving_average(
-        weighted_price,
-        period,
-        ma_type="ema",
-    )
-    volume_ema = compute_moving_average(volume, period, ma_type="ema")
-    return weighted_price_ema / volume_ema.replace(0, np.nan)
-
-
-def _compute_money_flow_multiplier(
-    high: pd.Series[float],
-    low: pd.Series[float],
-    close: pd.Series[float],
-) -> pd.Series[float]:
-    price_range = high - low
-    multiplier = ((close - low) - (high - close)) / price_range.replace(0, np.nan)
-    return multiplier.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+    return compute_volume_weighted_ema_panel(close, volume, period)
 
 
 def compute_chaikin_money_flow(
@@ -216,11 +508,7 @@ def compute_chaikin_money_flow(
 
     定義: rolling_sum(money_flow_multiplier * volume) / rolling_sum(volume)
     """
-    multiplier = _compute_money_flow_multiplier(high, low, close)
-    money_flow_volume = multiplier * volume
-    volume_sum = volume.rolling(window=period, min_periods=period).sum()
-    mfv_sum = money_flow_volume.rolling(window=period, min_periods=period).sum()
-    return mfv_sum / volume_sum.replace(0, np.nan)
+    return compute_chaikin_money_flow_panel(high, low, close, volume, period)
 
 
 def compute_accumulation_distribution_line(
@@ -230,9 +518,7 @@ def compute_accumulation_distribution_line(
     volume: pd.Series[float],
 ) -> pd.Series[float]:
     """Accumulation/Distribution Line (ADL) を計算する。"""
-    multiplier = _compute_money_flow_multiplier(high, low, close)
-    money_flow_volume = (multiplier * volume).fillna(0.0)
-    return money_flow_volume.cumsum()
+    return compute_accumulation_distribution_line_panel(high, low, close, volume)
 
 
 def compute_on_balance_volume(
@@ -240,9 +526,7 @@ def compute_on_balance_volume(
     volume: pd.Series[float],
 ) -> pd.Series[float]:
     """On-Balance Volume (OBV) を計算する。"""
-    direction = np.sign(close.diff()).fillna(0.0)
-    signed_volume = (direction * volume).fillna(0.0)
-    return signed_volume.cumsum()
+    return compute_on_balance_volume_panel(close, volume)
 
 
 def compute_volume_flow_score(
@@ -256,12 +540,7 @@ def compute_volume_flow_score(
     lookback 期間の変化量を同期間出来高で割った -1..1 近辺の
     score を使う。
     """
-    flow_change = cumulative_flow - cumulative_flow.shift(lookback_period)
-    volume_sum = volume.rolling(
-        window=lookback_period,
-        min_periods=lookback_period,
-    ).sum()
-    return flow_change / volume_sum.replace(0, np.nan)
+    return compute_volume_flow_score_panel(cumulative_flow, volume, lookback_period)
 
 
 def compute_chaikin_oscillator(
@@ -273,12 +552,14 @@ def compute_chaikin_oscillator(
     slow_period: int = 10,
 ) -> pd.Series[float]:
     """Chaikin Oscillator = EMA(ADL, fast) - EMA(ADL, slow) を計算する。"""
-    if slow_period <= fast_period:
-        raise ValueError("slow_period must be greater than fast_period")
-    adl = compute_accumulation_distribution_line(high, low, close, volume)
-    fast_ema = compute_moving_average(adl, fast_period, ma_type="ema")
-    slow_ema = compute_moving_average(adl, slow_period, ma_type="ema")
-    return fast_ema - slow_ema
+    return compute_chaikin_oscillator_panel(
+        high,
+        low,
+        close,
+        volume,
+        fast_period,
+        slow_period,
+    )
 
 
 def compute_on_balance_volume_score(
@@ -287,8 +568,7 @@ def compute_on_balance_volume_score(
     lookback_period: int = 20,
 ) -> pd.Series[float]:
     """OBV の lookback 正規化 flow score を計算する。"""
-    obv = compute_on_balance_volume(close, volume)
-    return compute_volume_flow_score(obv, volume, lookback_period)
+    return compute_on_balance_volume_score_panel(close, volume, lookback_period)
 
 
 def compute_recent_return(
@@ -296,12 +576,7 @@ def compute_recent_return(
     lookback_period: int = 20,
 ) -> pd.Series[float]:
     """指定 lookback の終値リターンを percent 単位で計算する。"""
-    if lookback_period < 1:
-        raise ValueError("lookback_period must be >= 1")
-
-    close_clean = close.replace([np.inf, -np.inf], np.nan)
-    base_close = close_clean.shift(lookback_period).replace(0, np.nan)
-    return (close_clean / base_close - 1.0) * 100.0
+    return compute_recent_return_panel(close, lookback_period)
 
 
 def compute_nbar_support(
@@ -309,17 +584,7 @@ def compute_nbar_support(
     period: int,
 ) -> pd.Series[float]:
     """N日安値サポート"""
-    support: pd.Series[float] = low.rolling(period).min()
-    return support
-
-
-def _compute_rolling_downside_std(
-    returns: pd.Series[float],
-    lookback_period: int,
-) -> pd.Series[float]:
-    """Sortino分母: 負リターンのみのローリング標準偏差"""
-    negative_only = returns.where(returns < 0)
-    return negative_only.rolling(window=lookback_period, min_periods=2).std()
+    return compute_nbar_support_panel(low, period)
 
 
 def compute_risk_adjusted_return(
@@ -328,28 +593,5 @@ def compute_risk_adjusted_return(
     ratio_type: Literal["sharpe", "sortino"] = "sortino",
 ) -> pd.Series[float]:
     """リスク調整リターン (Sharpe / Sortino) を計算"""
-    if ratio_type not in ("sharpe", "sortino"):
-        raise ValueError(f"不正なratio_type: {ratio_type} (sharpe/sortinoのみ)")
-
-    close_clean = close.replace([np.inf, -np.inf], np.nan)
-    returns = close_clean.pct_change()
-
-    rolling_mean = returns.rolling(
-        window=lookback_period,
-        min_periods=lookback_period,
-    ).mean()
-
-    if ratio_type == "sharpe":
-        rolling_denominator = returns.rolling(
-            window=lookback_period,
-            min_periods=lookback_period,
-        ).std()
-    else:
-        rolling_denominator = _compute_rolling_downside_std(returns, lookback_period)
-
-    ratio = pd.Series(np.nan, index=close.index, dtype=float)
-    valid_mask = rolling_denominator > 0
-    ratio[valid_mask] = (
-        rolling_mean[valid_mask] / rolling_denominator[valid_mask]
-    ) * np.sqrt(252)
-    return ratio
+    ratio = compute_risk_adjusted_return_panel(close, lookback_period, ratio_type)
+    return ratio.rename(None)
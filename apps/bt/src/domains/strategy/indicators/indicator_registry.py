@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any, Literal, Protocol
 
 import numpy as np
@@ -26,6 +27,7 @@ from src.domains.strategy.indicators import (
     compute_volume_mas,
     compute_volume_weighted_ema,
 )
+from src.shared.utils.market_frames import format_index_date
 
 
 class ComputeFn(Protocol):
@@ -39,10 +41,6 @@ class ComputeFn(Protocol):
     ) -> tuple[str, list[dict[str, Any]]]: ...
 
 
-def _format_date(idx: Any) -> str:
-    return idx.strftime("%Y-%m-%d") if hasattr(idx, "strftime") else str(idx)
-
-
 def _clean_value(val: Any) -> float | None:
     if isinstance(val, float) and np.isinf(val):
         return None
@@ -63,7 +61,7 @@ def _series_to_records(
             continue
         records.append(
             {
-                "date": _format_date(idx),
+                "date": format_index_date(idx),
                 value_name: cleaned,
             }
         )
@@ -77,7 +75,7 @@ def _multi_series_to_records(
     df = pd.DataFrame(series_dict)
     records: list[dict[str, Any]] = []
     for idx, row in df.iterrows():
-        record: dict[str, Any] = {"date": _format_date(idx)}
+        record: dict[str, Any] = {"date": format_index_date(idx)}
         all_null = True
         for col in series_dict:
             cleaned = _clean_value(row[col])
@@ -425,3 +423,47 @@ INDICATOR_REGISTRY: dict[str, ComputeFn] = {
     "recent_return": _compute_recent_return,
     "risk_adjusted_return": _compute_risk_adjusted_return,
 }
+
+
+def _volume_comparison_tail_bars(params: dict[str, Any]) -> int | None:
+    if params.get("ma_type", "sma") not in ("sma", "median"):
+        return None
+    return max(params.get("short_period", 20), params.get("long_period", 100))
+
+
+# 最終バーの値を再現するのに必要な末尾バー数（ローリング窓で完結するインジケーターのみ）。
+# EMA 系・累積系は全履歴に依存するため含めない。
+INDICATOR_TAIL_BARS: dict[str, Callable[[dict[str, Any]], int | None]] = {
+    "sma": lambda params: params["period"],
+    "rsi": lambda params: params.get("period", 14) + 1,
+    "macd": lambda params: (
+        max(params.get("fast_period", 12), params.get("slow_period", 26))
+        + params.get("signal_period", 9)
+        - 1
+    ),
+    "bollinger": lambda params: params.get("period", 20),
+    "sma_atr_bands": lambda params: max(
+        params.get("sma_period", 5),
+        params.get("atr_period", 20) + 1,
+    ),
+    "nbar_support": lambda params: params.get("period", 20),
+    "volume_comparison": _volume_comparison_tail_bars,
+    "trading_value_ma": lambda params: params.get("period", 20),
+    "cmf": lambda params: params.get("period", 20),
+    "recent_return": lambda params: params.get("lookback_period", 20) + 1,
+    "risk_adjusted_return": lambda params: params.get("lookback_period", 60) + 1,
+}
+
+
+def indicator_tail_bars(indicator_type: str, params: dict[str, Any]) -> int | None:
+    """Return the trailing bars needed to recompute the newest value, or None if unbounded."""
+    resolve = INDICATOR_TAIL_BARS.get(indicator_type)
+    if resolve is None:
+        return None
+    try:
+        bars = resolve(params)
+    except (KeyError, TypeError):
+        return None
+    if bars is None or not isinstance(bars, int) or bars < 1:
+        return None
+    return bars
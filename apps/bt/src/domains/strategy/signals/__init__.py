@@ -42,7 +42,7 @@ from .performance import (
 # Price action signals: baseline/breakout family に統合済み（horizontal_price_action.py削除）
 
 # Margin signals
-from .margin import margin_balance_percentile_signal
+from .margin import margin_balance_percentile_signal, margin_pressure_signal
 
 # Beta signals
 from .beta import beta_range_signal
@@ -121,6 +121,7 @@ __all__ = [
     # Price action
     # Margin
     "margin_balance_percentile_signal",
+    "margin_pressure_signal",
     # Beta
     "beta_range_signal",
     # Buy and Hold
@@ -10,7 +10,7 @@
 
 高速化実装:
 - Pandas rolling.cov/var: 中速（従来比5-10倍高速）
-- Numba最適化: 高速（従来比10-50倍高速）
+- Numba最適化: 高速（逐次和による O(n) 計算、複数銘柄は rolling_beta_panel で一括）
 """
 
 import numpy as np
@@ -212,6 +212,82 @@ def fast_beta_nb(stock_returns: np.ndarray, market_returns: np.ndarray) -> float
     return float(covariance / market_variance)
 
 
+# 分散がこれ以下のウィンドウは逐次和の丸め誤差が支配的になるため、窓を再計算する
+_STREAMING_VARIANCE_TOLERANCE = 1e-12
+
+
+@njit
+def _streaming_beta_nb(
+    stock_returns: np.ndarray,
+    market_returns: np.ndarray,
+    window: int,
+    out: np.ndarray,
+) -> None:
+    """
+    逐次更新（Welford 型の追加・削除）によるローリングβ値計算（O(n)）
+
+    fast_beta_nb をウィンドウごとに呼ぶ場合と同じ規則で計算する:
+    どちらかが NaN の行は除外し、有効行が2未満・市場分散が0以下なら NaN、
+    ±inf を含むウィンドウは NaN。
+    """
+    n = len(stock_returns)
+    if window < 2:
+        return
+
+    count = 0
+    n_inf = 0
+    stock_mean = 0.0
+    market_mean = 0.0
+    co_moment = 0.0
+    market_m2 = 0.0
+
+    for i in range(n):
+        x = stock_returns[i]
+        y = market_returns[i]
+        if not (np.isnan(x) or np.isnan(y)):
+            if np.isinf(x) or np.isinf(y):
+                n_inf += 1
+            else:
+                count += 1
+                dx = x - stock_mean
+                market_prev = market_mean
+                stock_mean += dx / count
+                market_mean += (y - market_prev) / count
+                co_moment += dx * (y - market_mean)
+                market_m2 += (y - market_prev) * (y - market_mean)
+
+        start = i - window + 1
+        if start > 0:
+            x = stock_returns[start - 1]
+            y = market_returns[start - 1]
+            if not (np.isnan(x) or np.isnan(y)):
+                if np.isinf(x) or np.isinf(y):
+                    n_inf -= 1
+                elif count <= 1:
+                    count = 0
+                    stock_mean = 0.0
+                    market_mean = 0.0
+                    co_moment = 0.0
+                    market_m2 = 0.0
+                else:
+                    count -= 1
+                    market_prev = market_mean
+                    stock_mean -= (x - stock_mean) / count
+                    market_mean -= (y - market_mean) / count
+                    co_moment -= (x - stock_mean) * (y - market_prev)
+                    market_m2 -= (y - market_mean) * (y - market_prev)
+
+        if start < 0 or n_inf > 0 or count < 2:
+            continue
+        if market_m2 / count <= _STREAMING_VARIANCE_TOLERANCE:
+            # 定数に近い市場リターン: 丸め誤差で 0 判定がぶれないよう厳密に再計算
+            out[i] = fast_beta_nb(
+                stock_returns[start : i + 1], market_returns[start : i + 1]
+            )
+        else:
+            out[i] = co_moment / market_m2
+
+
 @njit
 def rolling_beta_nb(
     stock_returns: np.ndarray, market_returns: np.ndarray, window: int
@@ -221,21 +297,40 @@ def rolling_beta_nb(
 
     Args:
         stock_returns: 銘柄リターン配列
-        market_returns: 市場リターン配列
+        market_returns: 市場リターン配列（stock_returns 以上の長さ）
         window: ローリングウィンドウサイズ
 
     Returns:
         np.ndarray: ローリングβ値配列
     """
-    n = len(stock_returns)
-    result = np.full(n, np.nan)
+    if len(market_returns) < len(stock_returns):
+        raise ValueError("market_returns must be at least as long as stock_returns")
+    result = np.full(len(stock_returns), np.nan)
+    _streaming_beta_nb(stock_returns, market_returns, window, result)
+    return result
 
-    for i in range(window - 1, n):
-        start_idx = i - window + 1
-        stock_window = stock_returns[start_idx : i + 1]
-        market_window = market_returns[start_idx : i + 1]
-        result[i] = fast_beta_nb(stock_window, market_window)
 
+@njit
+def rolling_beta_panel_nb(
+    stock_returns: np.ndarray, market_returns: np.ndarray, window: int
+) -> np.ndarray:
+    """
+    (日付 x 銘柄) のリターン行列に対するローリングβ値を一括計算
+
+    Args:
+        stock_returns: 銘柄リターン行列（2次元）
+        market_returns: 市場リターン配列（行数と同じ長さ）
+        window: ローリングウィンドウサイズ
+
+    Returns:
+        np.ndarray: stock_returns と同形のローリングβ値行列
+    """
+    n_rows, n_cols = stock_returns.shape
+    if len(market_returns) != n_rows:
+        raise ValueError("market_returns length must match stock_returns rows")
+    result = np.full((n_rows, n_cols), np.nan)
+    for col in range(n_cols):
+        _streaming_beta_nb(stock_returns[:, col], market_returns, window, result[:, col])
     return result
 
 
@@ -296,24 +391,77 @@ def numba_rolling_beta(
     stock_aligned = stock_price.reindex(common_index)
     market_aligned = market_price.reindex(common_index)
 
-    # リターン計算
-    stock_returns = stock_aligned.pct_change().dropna()
-    market_returns = market_aligned.pct_change().dropna()
+    # リターン計算（銘柄・市場の両方が揃う日だけを残し、長さを一致させる）
+    returns = pd.concat(
+        [stock_aligned.pct_change(), market_aligned.pct_change()], axis=1
+    ).dropna()
 
     # Numba最適化計算
     beta_array = rolling_beta_nb(
-        np.asarray(stock_returns.values, dtype=np.float64),
-        np.asarray(market_returns.values, dtype=np.float64),
+        np.asarray(returns.iloc[:, 0].to_numpy(), dtype=np.float64),
+        np.asarray(returns.iloc[:, 1].to_numpy(), dtype=np.float64),
         window,
     )
 
     # Series作成
-    beta_series = pd.Series(beta_array, index=stock_returns.index)
+    beta_series = pd.Series(beta_array, index=returns.index)
 
     # 元インデックスに戻す
     return cast(pd.Series, beta_series.reindex(stock_price.index, fill_value=np.nan))
 
 
+def rolling_beta_panel(
+    stock_prices: pd.DataFrame,
+    market_price: pd.Series,
+    window: int = 200,
+) -> pd.DataFrame:
+    """
+    複数銘柄のローリングβ値を1回のカーネル呼び出しで計算
+
+    Args:
+        stock_prices: (日付 x 銘柄) の価格データ
+        market_price: 市場価格シリーズ
+        window: ローリングウィンドウサイズ
+
+    Returns:
+        pd.DataFrame: stock_prices と同形のローリングβ値
+
+    Note:
+        欠損の無い銘柄だけをパネルカーネルでまとめて計算する。欠損を含む銘柄
+        （または市場側に欠損がある場合の全銘柄）は numba_rolling_beta に委ね、
+        欠損日を詰めたウィンドウで計算するため、結果は常に銘柄単位の計算と一致する。
+    """
+    common_index = stock_prices.index.intersection(market_price.index)
+    stock_returns = stock_prices.reindex(common_index).pct_change().iloc[1:]
+    market_returns = market_price.reindex(common_index).pct_change().iloc[1:]
+
+    if market_returns.isna().any():
+        dense_columns = stock_returns.columns[:0]
+    else:
+        dense_columns = stock_returns.columns[stock_returns.notna().all().to_numpy()]
+
+    beta_frame = pd.DataFrame(
+        np.nan, index=stock_prices.index, columns=stock_prices.columns, dtype=float
+    )
+    if len(dense_columns) > 0:
+        beta_values = rolling_beta_panel_nb(
+            np.asarray(
+                stock_returns[dense_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+            ),
+            np.asarray(market_returns.to_numpy(dtype=np.float64, na_value=np.nan)),
+            window,
+        )
+        dense_frame = pd.DataFrame(
+            beta_values, index=stock_returns.index, columns=dense_columns
+        )
+        beta_frame[dense_columns] = dense_frame.reindex(stock_prices.index)
+    for column in stock_prices.columns.difference(dense_columns, sort=False):
+        beta_frame[column] = numba_rolling_beta(
+            cast(pd.Series, stock_prices[column]), market_price, window
+        )
+    return beta_frame
+
+
 def _rolling_beta_by_method(
     stock_price: pd.Series,
     market_price: pd.Series,
@@ -437,6 +585,12 @@ def rolling_beta_multi_signal(
     Returns:
         pd.DataFrame: 各銘柄のシグナル結果
     """
+    if fast:
+        rolling_beta = rolling_beta_panel(
+            multi_stock_prices, market_price, window=lookback_period
+        )
+        return (rolling_beta >= beta_min) & (rolling_beta <= beta_max)
+
     result_dict = {}
 
     for column in multi_stock_prices.columns:
@@ -63,3 +63,45 @@ def margin_balance_percentile_signal(
     percentile_condition = margin_balance <= rolling_percentile
 
     return normalize_bool_series(percentile_condition)
+
+
+# 信用需給圧力の指標名 -> margin_daily の列名（screening の market ローダーが付与する）
+MARGIN_PRESSURE_COLUMNS: dict[str, str] = {
+    "long_pressure": "LongPressure",
+    "flow_pressure": "FlowPressure",
+    "turnover_days": "TurnoverDays",
+}
+
+
+def margin_pressure_signal(
+    margin_data: pd.DataFrame,
+    metric: str = "long_pressure",
+    threshold: float = 0.0,
+    direction: str = "below",
+) -> pd.Series:
+    """
+    信用需給圧力シグナル（信用買い圧力・フロー圧力・回転日数の閾値判定）
+
+    Args:
+        margin_data: LongPressure / FlowPressure / TurnoverDays 列を持つ日次信用データ
+        metric: 判定指標（long_pressure / flow_pressure / turnover_days）
+        threshold: 判定閾値
+        direction: above=閾値超でTrue、below=閾値以下でTrue
+
+    Returns:
+        pd.Series: 条件を満たす日にTrue（指標が未定義の日はFalse）
+
+    Raises:
+        ValueError: metric / direction が無効な場合
+    """
+    column = MARGIN_PRESSURE_COLUMNS.get(metric)
+    if column is None:
+        raise ValueError(f"Unsupported margin pressure metric: {metric}")
+    values = margin_data[column].astype(float)
+    if direction == "above":
+        condition = values > threshold
+    elif direction == "below":
+        condition = values <= threshold
+    else:
+        raise ValueError(f"direction must be 'above' or 'below', got {direction}")
+    return normalize_bool_series(condition & values.notna())
@@ -20,6 +20,12 @@ from src.shared.models.signals import SignalParams, Signals, normalize_bool_seri
 # データ駆動設計: シグナルレジストリからの動的処理
 from .registry import SIGNAL_REGISTRY
 from .scheduler import SignalDecisionScheduler
+from .sector_strength import (
+    SectorSignalPanel,
+    build_sector_rotation_phase_panel,
+    build_sector_strength_panel,
+    build_sector_volatility_regime_panel,
+)
 from .universe_rank_bucket import build_universe_rank_bucket_feature_panel
 
 if TYPE_CHECKING:
@@ -58,6 +64,13 @@ class SignalProcessor:
 
     _REQUIRES_EXECUTION_DATA = {"β値", "売買代金", "売買代金範囲"}
     _UNIVERSE_BUCKET_CACHE_LIMIT = 16
+    _SECTOR_PANEL_CACHE_LIMIT = 16
+    # 銘柄に依存しないセクター単位のシグナル: 全銘柄で共有するパネルのビルダー
+    _SECTOR_PANEL_BUILDERS: dict[str, Callable[..., SectorSignalPanel]] = {
+        "sector_strength_ranking": build_sector_strength_panel,
+        "sector_rotation_phase": build_sector_rotation_phase_panel,
+        "sector_volatility_regime": build_sector_volatility_regime_panel,
+    }
 
     def __init__(self):
         """
@@ -71,6 +84,12 @@ class SignalProcessor:
             pd.DataFrame,
         ] = OrderedDict()
         self._universe_rank_bucket_cache_lock = Lock()
+        # 値に sector_data / benchmark_data 自体を保持し、id 再利用による誤ヒットを防ぐ
+        self._sector_panel_cache: OrderedDict[
+            tuple[object, ...],
+            tuple[object, object, SectorSignalPanel],
+        ] = OrderedDict()
+        self._sector_panel_cache_lock = Lock()
 
     def apply_entry_signals(
         self,
@@ -591,6 +610,52 @@ class SignalProcessor:
                 self._universe_rank_bucket_cache.popitem(last=False)
             return feature_panel
 
+    def _get_cached_sector_signal_panel(
+        self,
+        *,
+        param_key: str,
+        params: dict,
+        data_sources: dict,
+    ) -> SectorSignalPanel:
+        sector_data = params["sector_data"]
+        benchmark_data = (
+            data_sources.get("benchmark_data") if "benchmark_close" in params else None
+        )
+        panel_params = {
+            key: value
+            for key, value in params.items()
+            if key not in ("sector_data", "stock_sector_name")
+        }
+        cache_key = (
+            param_key,
+            id(sector_data),
+            id(benchmark_data),
+            tuple(
+                sorted(
+                    (key, value)
+                    for key, value in panel_params.items()
+                    if key != "benchmark_close"
+                )
+            ),
+        )
+
+        with self._sector_panel_cache_lock:
+            cached = self._sector_panel_cache.get(cache_key)
+            if (
+                cached is not None
+                and cached[0] is sector_data
+                and cached[1] is benchmark_data
+            ):
+                self._sector_panel_cache.move_to_end(cache_key)
+                return cached[2]
+
+            panel = self._SECTOR_PANEL_BUILDERS[param_key](sector_data, **panel_params)
+            self._sector_panel_cache[cache_key] = (sector_data, benchmark_data, panel)
+            self._sector_panel_cache.move_to_end(cache_key)
+            while len(self._sector_panel_cache) > self._SECTOR_PANEL_CACHE_LIMIT:
+                self._sector_panel_cache.popitem(last=False)
+            return panel
+
     @classmethod
     def _get_compiled_signal_availability(
         cls,
@@ -754,6 +819,17 @@ class SignalProcessor:
                     price_sma_period=params["price_sma_period"],
                 )
 
+            if (
+                signal_def.param_key in self._SECTOR_PANEL_BUILDERS
+                and isinstance(params.get("sector_data"), dict)
+                and params["sector_data"]
+            ):
+                params["sector_signals"] = self._get_cached_sector_signal_panel(
+                    param_key=signal_def.param_key,
+                    params=params,
+                    data_sources=data_sources,
+                )
+
             # 5. シグナル計算
             result = signal_def.signal_func(**params)
 
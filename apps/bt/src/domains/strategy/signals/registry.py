@@ -63,7 +63,11 @@ from .fundamental import (
 from .index_daily_change import index_daily_change_signal
 from .index_macd_histogram import index_macd_histogram_signal
 from .index_open_gap_regime import index_open_gap_regime_signal
-from .margin import margin_balance_percentile_signal
+from .margin import (
+    MARGIN_PRESSURE_COLUMNS,
+    margin_balance_percentile_signal,
+    margin_pressure_signal,
+)
 from .rsi_spread import rsi_spread_signal
 from .risk_adjusted import risk_adjusted_return_signal
 from .rsi_threshold import rsi_threshold_signal
@@ -317,6 +321,17 @@ def _has_margin_data(d: dict[str, Any]) -> bool:
     )
 
 
+def _has_margin_pressure_data(d: dict[str, Any]) -> bool:
+    """信用需給圧力の指標列（market データソースのみ付与）が存在するかチェック"""
+    margin_data = d.get("margin_data")
+    if margin_data is None or margin_data.empty:
+        return False
+    return any(
+        column in margin_data.columns and margin_data[column].notna().any()
+        for column in MARGIN_PRESSURE_COLUMNS.values()
+    )
+
+
 def _has_sector_data(d: dict[str, Any]) -> bool:
     """セクターデータが存在し、銘柄セクター名も設定されているかチェック"""
     if not bool(d.get("sector_data")):
@@ -696,6 +711,25 @@ SIGNAL_REGISTRY: list[SignalDefinition] = [
         data_checker=_has_margin_data,
         data_requirements=["margin"],
     ),
+    # 7b. 信用需給圧力シグナル（market データソースで margin_daily に付与される指標）
+    SignalDefinition(
+        name="信用需給圧力",
+        signal_func=margin_pressure_signal,
+        enabled_checker=lambda p: p.margin_pressure.enabled,
+        param_builder=lambda p, d: {
+            "margin_data": d["margin_data"],
+            "metric": p.margin_pressure.metric,
+            "threshold": p.margin_pressure.threshold,
+            "direction": p.margin_pressure.direction,
+        },
+        entry_purpose="信用需給の逼迫/解消判定",
+        exit_purpose="信用需給悪化警告",
+        category="macro",
+        description="信用買い圧力・フロー圧力・回転日数の閾値判定",
+        param_key="margin_pressure",
+        data_checker=_has_margin_pressure_data,
+        data_requirements=["margin"],
+    ),
     # 8. ATRサポート位置シグナル
     SignalDefinition(
         name="ATRサポート位置",
@@ -5,9 +5,12 @@
 - A. Sector Strength Ranking — 複合スコアで上位Nセクターのみエントリー許可
 - B. Sector Rotation Phase — RRG的4象限分類（Entry + Exit）
 - D. Sector Volatility Regime — 低ボラ環境フィルタ（Entry + Exit）
+
+セクター単位の計算結果は銘柄に依存しないため、build_*_panel で全セクター分を
+1回計算し、select_sector_signal_by_membership で銘柄の所属セクターへ射影できる。
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
 
 import numpy as np
 import pandas as pd
@@ -16,9 +19,12 @@ from loguru import logger
 from src.shared.models.signals import normalize_bool_series
 
 
-def sector_strength_ranking_signal(
+SectorSignalPanel = dict[str, pd.Series]
+"""セクター名 -> そのセクターの boolean シグナル（全銘柄で共通の計算結果）"""
+
+
+def build_sector_strength_panel(
     sector_data: dict[str, pd.DataFrame],
-    stock_sector_name: str | pd.Series,
     benchmark_close: pd.Series,
     momentum_period: int = 20,
     sharpe_period: int = 60,
@@ -27,47 +33,22 @@ def sector_strength_ranking_signal(
     sharpe_weight: float = 0.4,
     relative_weight: float = 0.2,
     selection_mode: str = "top",
-) -> "pd.Series[bool]":
+) -> SectorSignalPanel:
     """
-    セクター強度ランキングシグナル
-
-    全セクターの日次複合スコア（モメンタム + シャープレシオ + TOPIX対比RS）を計算し、
-    銘柄が属するセクターが上位または下位N位以内であればTrueを返す。
+    全セクターの強度ランキング選択パネルを計算する
 
-    Args:
-        sector_data: 全セクターインデックスOHLCデータ {sector_name: DataFrame}
-        stock_sector_name: 当該銘柄のセクター名
-        benchmark_close: ベンチマーク（TOPIX等）終値 pd.Series[float]
-        momentum_period: モメンタム計算期間（日数）
-        sharpe_period: シャープレシオ計算期間（日数）
-        top_n: 選択するセクター数（上位/下位N）
-        momentum_weight: モメンタムスコア重み
-        sharpe_weight: シャープレシオスコア重み
-        relative_weight: 相対強度スコア重み
-        selection_mode: 選択モード（"top"=上位N、"bottom"=下位N）
+    スコア・ランクは銘柄に依存しないため、バックテスト内では1回だけ計算し
+    select_sector_signal_by_membership で銘柄ごとに射影する。
 
     Returns:
-        pd.Series[bool]: 当該銘柄のセクターが選択範囲に入っていればTrue
+        SectorSignalPanel: セクターごとの「選択範囲内」シグナル
+        （benchmark_close のインデックス）。有効データが無ければ空
     """
     if selection_mode not in ("top", "bottom"):
         raise ValueError(
             f"Invalid selection_mode: {selection_mode}. Must be 'top' or 'bottom'"
         )
 
-    logger.debug(
-        f"セクター強度ランキング: sector={stock_sector_name}, "
-        f"momentum_period={momentum_period}, sharpe_period={sharpe_period}, "
-        f"top_n={top_n}, selection_mode={selection_mode}"
-    )
-
-    if not sector_data:
-        logger.warning("セクターデータが空です")
-        return pd.Series(False, index=benchmark_close.index, dtype=bool)
-
-    if isinstance(stock_sector_name, str) and stock_sector_name not in sector_data:
-        logger.warning(f"セクター '{stock_sector_name}' がデータに含まれていません")
-        return pd.Series(False, index=benchmark_close.index, dtype=bool)
-
     # 全セクターの終値を取得
     sector_closes: dict[str, "pd.Series[float]"] = {}
     for name, df in sector_data.items():
@@ -75,8 +56,7 @@ def sector_strength_ranking_signal(
             sector_closes[name] = df["Close"].astype(float)
 
     if not sector_closes:
-        logger.warning("有効なセクター終値データがありません")
-        return pd.Series(False, index=benchmark_close.index, dtype=bool)
+        return {}
 
     # 共通インデックスを構築
     reference_index = benchmark_close.index
@@ -130,11 +110,6 @@ def sector_strength_ranking_signal(
     # na_option="keep" → NaN値はランキングから除外（NaNのまま）
     rank_df = score_df.rank(axis=1, ascending=False, method="min", na_option="keep")
 
-    # 当該銘柄のセクターが選択範囲内かチェック
-    if isinstance(stock_sector_name, str) and stock_sector_name not in rank_df.columns:
-        logger.warning(f"セクター '{stock_sector_name}' のランキングデータがありません")
-        return pd.Series(False, index=reference_index, dtype=bool)
-
     if selection_mode == "top":
         # 上位N位以内: ランクがtop_n以下
         selected = rank_df <= top_n
@@ -146,16 +121,92 @@ def sector_strength_ranking_signal(
         # top_n >= total_sectorsの場合、thresholdは1となり全セクターが選択される
         selected = rank_df.ge(bottom_threshold, axis=0)
 
-    if isinstance(stock_sector_name, pd.Series):
-        membership = stock_sector_name.reindex(reference_index)
-        result = pd.Series(False, index=reference_index, dtype=bool)
-        for sector_name in membership.dropna().astype(str).unique():
-            if sector_name not in selected.columns:
-                continue
-            mask = membership.eq(sector_name)
-            result.loc[mask] = normalize_bool_series(selected[sector_name]).loc[mask]
-    else:
-        result = normalize_bool_series(selected[stock_sector_name])
+    return {name: selected[name] for name in selected.columns}
+
+
+def sector_strength_ranking_signal(
+    sector_data: dict[str, pd.DataFrame],
+    stock_sector_name: str | pd.Series,
+    benchmark_close: pd.Series,
+    momentum_period: int = 20,
+    sharpe_period: int = 60,
+    top_n: int = 10,
+    momentum_weight: float = 0.4,
+    sharpe_weight: float = 0.4,
+    relative_weight: float = 0.2,
+    selection_mode: str = "top",
+    sector_signals: SectorSignalPanel | None = None,
+) -> "pd.Series[bool]":
+    """
+    セクター強度ランキングシグナル
+
+    全セクターの日次複合スコア（モメンタム + シャープレシオ + TOPIX対比RS）を計算し、
+    銘柄が属するセクターが上位または下位N位以内であればTrueを返す。
+
+    Args:
+        sector_data: 全セクターインデックスOHLCデータ {sector_name: DataFrame}
+        stock_sector_name: 当該銘柄のセクター名
+        benchmark_close: ベンチマーク（TOPIX等）終値 pd.Series[float]
+        momentum_period: モメンタム計算期間（日数）
+        sharpe_period: シャープレシオ計算期間（日数）
+        top_n: 選択するセクター数（上位/下位N）
+        momentum_weight: モメンタムスコア重み
+        sharpe_weight: シャープレシオスコア重み
+        relative_weight: 相対強度スコア重み
+        selection_mode: 選択モード（"top"=上位N、"bottom"=下位N）
+        sector_signals: build_sector_strength_panel の計算済みパネル
+            （指定時は再計算せず所属セクターを射影するだけ）
+
+    Returns:
+        pd.Series[bool]: 当該銘柄のセクターが選択範囲に入っていればTrue
+    """
+    if selection_mode not in ("top", "bottom"):
+        raise ValueError(
+            f"Invalid selection_mode: {selection_mode}. Must be 'top' or 'bottom'"
+        )
+
+    logger.debug(
+        f"セクター強度ランキング: sector={stock_sector_name}, "
+        f"momentum_period={momentum_period}, sharpe_period={sharpe_period}, "
+        f"top_n={top_n}, selection_mode={selection_mode}"
+    )
+
+    reference_index = benchmark_close.index
+
+    if sector_signals is None:
+        if not sector_data:
+            logger.warning("セクターデータが空です")
+            return pd.Series(False, index=reference_index, dtype=bool)
+
+        if isinstance(stock_sector_name, str) and stock_sector_name not in sector_data:
+            logger.warning(f"セクター '{stock_sector_name}' がデータに含まれていません")
+            return pd.Series(False, index=reference_index, dtype=bool)
+
+        sector_signals = build_sector_strength_panel(
+            sector_data,
+            benchmark_close,
+            momentum_period=momentum_period,
+            sharpe_period=sharpe_period,
+            top_n=top_n,
+            momentum_weight=momentum_weight,
+            sharpe_weight=sharpe_weight,
+            relative_weight=relative_weight,
+            selection_mode=selection_mode,
+        )
+        if not sector_signals:
+            logger.warning("有効なセクター終値データがありません")
+            return pd.Series(False, index=reference_index, dtype=bool)
+
+    # 当該銘柄のセクターが選択範囲内かチェック
+    if isinstance(stock_sector_name, str) and stock_sector_name not in sector_signals:
+        logger.warning(f"セクター '{stock_sector_name}' のランキングデータがありません")
+        return pd.Series(False, index=reference_index, dtype=bool)
+
+    result = select_sector_signal_by_membership(
+        sector_signals=sector_signals,
+        stock_sector_name=stock_sector_name,
+        reference_index=reference_index,
+    )
 
     logger.debug(
         f"セクター強度ランキング完了: True={result.sum()}/{len(result)} "
@@ -243,50 +294,95 @@ def sector_rotation_phase_signal(
     return result
 
 
-def _select_sector_signal_by_membership(
-    *,
+def _membership_sector_names(stock_sector_name: str | pd.Series) -> list[str]:
+    if isinstance(stock_sector_name, str):
+        return [stock_sector_name]
+    return list(stock_sector_name.dropna().astype(str).unique())
+
+
+def _build_sector_signal_panel(
     sector_data: dict[str, pd.DataFrame],
+    compute_signal: Callable[[pd.Series], pd.Series],
+    sector_names: Iterable[str] | None = None,
+) -> SectorSignalPanel:
+    """各sectorの連続系列でboolean signalを1回ずつ計算する。"""
+    names = sector_data.keys() if sector_names is None else sector_names
+    panel: SectorSignalPanel = {}
+    for sector_name in names:
+        sector_frame = sector_data.get(sector_name)
+        if sector_frame is None or "Close" not in sector_frame.columns:
+            continue
+        panel[sector_name] = compute_signal(sector_frame["Close"].astype(float))
+    return panel
+
+
+def select_sector_signal_by_membership(
+    *,
+    sector_signals: Mapping[str, pd.Series],
     stock_sector_name: str | pd.Series,
     reference_index: pd.Index,
-    compute_signal: Callable[[pd.Series], pd.Series],
 ) -> pd.Series:
-    """各sectorの連続系列で計算したboolean signalをPIT所属日だけ選ぶ。"""
-    membership = (
-        pd.Series(stock_sector_name, index=reference_index, dtype="object")
-        if isinstance(stock_sector_name, str)
-        else stock_sector_name.reindex(reference_index)
-    )
+    """計算済みのsector signalから評価日のPIT所属sectorの値を選ぶ。"""
+    if isinstance(stock_sector_name, str):
+        sector_signal = sector_signals.get(stock_sector_name)
+        if sector_signal is None:
+            return pd.Series(False, index=reference_index, dtype=bool)
+        return normalize_bool_series(sector_signal.reindex(reference_index))
+
+    membership = stock_sector_name.reindex(reference_index)
     result = pd.Series(False, index=reference_index, dtype=bool)
     for sector_name in membership.dropna().astype(str).unique():
-        sector_frame = sector_data.get(sector_name)
-        if sector_frame is None or "Close" not in sector_frame.columns:
+        sector_signal = sector_signals.get(sector_name)
+        if sector_signal is None:
             continue
-        sector_signal = compute_signal(
-            sector_frame["Close"].astype(float)
-        ).reindex(reference_index)
         mask = membership.eq(sector_name)
-        result.loc[mask] = normalize_bool_series(sector_signal).loc[mask]
+        result.loc[mask] = normalize_bool_series(
+            sector_signal.reindex(reference_index)
+        ).loc[mask]
     return result
 
 
+def build_sector_rotation_phase_panel(
+    sector_data: dict[str, pd.DataFrame],
+    benchmark_close: pd.Series,
+    rs_period: int = 20,
+    direction: str = "leading",
+    sector_names: Iterable[str] | None = None,
+) -> SectorSignalPanel:
+    """全sector（または sector_names）のローテーション位相シグナルを計算する。"""
+    return _build_sector_signal_panel(
+        sector_data,
+        lambda close: sector_rotation_phase_signal(
+            close,
+            benchmark_close,
+            rs_period=rs_period,
+            direction=direction,
+        ),
+        sector_names,
+    )
+
+
 def sector_rotation_phase_by_membership_signal(
     sector_data: dict[str, pd.DataFrame],
     stock_sector_name: str | pd.Series,
     benchmark_close: pd.Series,
     rs_period: int = 20,
     direction: str = "leading",
+    sector_signals: SectorSignalPanel | None = None,
 ) -> pd.Series:
     """各sectorの連続RS系列を計算後、評価日のPIT所属sectorを選ぶ。"""
-    return _select_sector_signal_by_membership(
-        sector_data=sector_data,
-        stock_sector_name=stock_sector_name,
-        reference_index=benchmark_close.index,
-        compute_signal=lambda close: sector_rotation_phase_signal(
-            close,
+    if sector_signals is None:
+        sector_signals = build_sector_rotation_phase_panel(
+            sector_data,
             benchmark_close,
             rs_period=rs_period,
             direction=direction,
-        ),
+            sector_names=_membership_sector_names(stock_sector_name),
+        )
+    return select_sector_signal_by_membership(
+        sector_signals=sector_signals,
+        stock_sector_name=stock_sector_name,
+        reference_index=benchmark_close.index,
     )
 
 
@@ -356,6 +452,28 @@ def sector_volatility_regime_signal(
     return result
 
 
+def build_sector_volatility_regime_panel(
+    sector_data: dict[str, pd.DataFrame],
+    vol_period: int = 20,
+    vol_ma_period: int = 60,
+    direction: str = "low_vol",
+    spike_multiplier: float = 1.5,
+    sector_names: Iterable[str] | None = None,
+) -> SectorSignalPanel:
+    """全sector（または sector_names）のボラティリティレジームシグナルを計算する。"""
+    return _build_sector_signal_panel(
+        sector_data,
+        lambda close: sector_volatility_regime_signal(
+            close,
+            vol_period=vol_period,
+            vol_ma_period=vol_ma_period,
+            direction=direction,
+            spike_multiplier=spike_multiplier,
+        ),
+        sector_names,
+    )
+
+
 def sector_volatility_regime_by_membership_signal(
     sector_data: dict[str, pd.DataFrame],
     stock_sector_name: str | pd.Series,
@@ -363,6 +481,7 @@ def sector_volatility_regime_by_membership_signal(
     vol_ma_period: int = 60,
     direction: str = "low_vol",
     spike_multiplier: float = 1.5,
+    sector_signals: SectorSignalPanel | None = None,
 ) -> pd.Series:
     """各sectorの連続return系列を計算後、評価日のPIT所属sectorを選ぶ。"""
     reference_index = (
@@ -370,15 +489,17 @@ def sector_volatility_regime_by_membership_signal(
         if isinstance(stock_sector_name, pd.Series)
         else sector_data.get(stock_sector_name, pd.DataFrame()).index
     )
-    return _select_sector_signal_by_membership(
-        sector_data=sector_data,
-        stock_sector_name=stock_sector_name,
-        reference_index=reference_index,
-        compute_signal=lambda close: sector_volatility_regime_signal(
-            close,
+    if sector_signals is None:
+        sector_signals = build_sector_volatility_regime_panel(
+            sector_data,
             vol_period=vol_period,
             vol_ma_period=vol_ma_period,
             direction=direction,
             spike_multiplier=spike_multiplier,
-        ),
+            sector_names=_membership_sector_names(stock_sector_name),
+        )
+    return select_sector_signal_by_membership(
+        sector_signals=sector_signals,
+        stock_sector_name=stock_sector_name,
+        reference_index=reference_index,
     )
@@ -5,6 +5,7 @@ Unified CLI Interface for Backtesting Tool
 """
 
 from copy import deepcopy
+from importlib import import_module
 import os
 import sys
 from typing import Any
@@ -12,15 +13,57 @@ from typing import Any
 import typer
 from loguru import logger
 from rich.console import Console
+from typer.core import TyperGroup
 
-# サブコマンドの遅延インポート（循環参照回避）
+# サブコマンドの遅延インポート（循環参照回避・起動時間短縮）
 console = Console()
 
+# サブコマンドグループ名 -> (モジュール, Typer属性名, ヘルプ)
+# 実行されるまでモジュールを import しない（lab は vectorbt / optuna を読み込むため）
+_LAZY_SUBCOMMAND_GROUPS: dict[str, tuple[str, str, str]] = {
+    "lab": ("src.entrypoints.cli.lab", "lab_app", "🧪 戦略自動生成・改善ラボ"),
+    "jquants": ("src.entrypoints.cli.jquants", "jquants_app", "JQuants proxy debug commands"),
+}
+
+
+class _LazySubcommandGroup(TyperGroup):
+    """実行時に初めて実体の Typer サブアプリを読み込むプレースホルダー"""
+
+    def __init__(self, name: str, module_path: str, attribute: str, help_text: str) -> None:
+        super().__init__(name=name, help=help_text)
+        self._module_path = module_path
+        self._attribute = attribute
+        self._loaded: TyperGroup | None = None
+
+    def _load(self) -> TyperGroup:
+        if self._loaded is None:
+            sub_app = getattr(import_module(self._module_path), self._attribute)
+            # get_command はルート用の --install-completion 等を付与するため get_group を使う
+            self._loaded = typer.main.get_group(sub_app)
+        return self._loaded
+
+    # 引数・戻り値の型は TyperGroup（typer 同梱の click）から継承する
+    def make_context(self, info_name, args, parent=None, **extra):
+        return self._load().make_context(info_name, args, parent=parent, **extra)
+
+
+class _BtGroup(TyperGroup):
+    """遅延サブコマンドグループをプレースホルダーとして登録するルートグループ"""
+
+    def __init__(self, **attrs: Any) -> None:
+        super().__init__(**attrs)
+        for name, (module_path, attribute, help_text) in _LAZY_SUBCOMMAND_GROUPS.items():
+            self.commands.setdefault(
+                name, _LazySubcommandGroup(name, module_path, attribute, help_text)
+            )
+
+
 app = typer.Typer(
     name="bt",
     help="📊 バックテスト戦略管理ツール",
     rich_markup_mode="rich",
     add_completion=False,
+    cls=_BtGroup,
 )
 
 
@@ -312,13 +355,5 @@ def server_command(
     )
 
 
-# ラボサブコマンド登録
-from src.entrypoints.cli.lab import lab_app  # noqa: E402
-from src.entrypoints.cli.jquants import jquants_app  # noqa: E402
-
-app.add_typer(lab_app, name="lab")
-app.add_typer(jquants_app, name="jquants")
-
-
 if __name__ == "__main__":
     app()
@@ -275,6 +275,26 @@ def evolve_command(
         "-C",
         help="最適化対象カテゴリ（複数指定可）",
     ),
+    multi_fidelity: bool = typer.Option(
+        False,
+        "--multi-fidelity/--full-fidelity",
+        help="低忠実度で足切りしてから上位のみ全データで評価（successive halving）",
+    ),
+    fidelity_mode: str = typer.Option(
+        "window",
+        "--fidelity-mode",
+        help="低忠実度の作り方 (window=期間末尾の一部 / universe=銘柄の一部)",
+    ),
+    min_fidelity: float = typer.Option(
+        0.25,
+        "--min-fidelity",
+        help="最初の段で使うデータ割合 (0-1]",
+    ),
+    reduction_factor: int = typer.Option(
+        3,
+        "--reduction-factor",
+        help="各段で上位 1/N を次段へ昇格",
+    ),
 ):
     """
     遺伝的アルゴリズムでパラメータ最適化
@@ -300,6 +320,12 @@ def evolve_command(
             f"[red]エラー[/red]: --structure-mode は {valid_structure_modes} のいずれか"
         )
         raise typer.Exit(code=1)
+    valid_fidelity_modes = ("window", "universe")
+    if fidelity_mode not in valid_fidelity_modes:
+        console.print(
+            f"[red]エラー[/red]: --fidelity-mode は {valid_fidelity_modes} のいずれか"
+        )
+        raise typer.Exit(code=1)
 
     console.print(
         f"設定: 世代数={generations}, 個体数={population}, "
@@ -323,6 +349,10 @@ def evolve_command(
         random_add_entry_signals=random_add_entry_signals,
         random_add_exit_signals=random_add_exit_signals,
         seed=seed,
+        multi_fidelity=multi_fidelity,
+        fidelity_mode=fidelity_mode,
+        min_fidelity=min_fidelity,
+        reduction_factor=reduction_factor,
     )
 
     # 進化実行
@@ -397,6 +427,26 @@ def optimize_command(
         "-C",
         help="最適化対象カテゴリ（複数指定可）",
     ),
+    multi_fidelity: bool = typer.Option(
+        False,
+        "--multi-fidelity/--full-fidelity",
+        help="低忠実度で足切りしてから上位のみ全データで評価（successive halving）",
+    ),
+    fidelity_mode: str = typer.Option(
+        "window",
+        "--fidelity-mode",
+        help="低忠実度の作り方 (window=期間末尾の一部 / universe=銘柄の一部)",
+    ),
+    min_fidelity: float = typer.Option(
+        0.25,
+        "--min-fidelity",
+        help="最初の段で使うデータ割合 (0-1]",
+    ),
+    reduction_factor: int = typer.Option(
+        3,
+        "--reduction-factor",
+        help="各段で上位 1/N を次段へ昇格",
+    ),
 ):
     """
     Optuna（ベイズ最適化）でパラメータ最適化
@@ -426,6 +476,12 @@ def optimize_command(
             f"[red]エラー[/red]: --structure-mode は {valid_structure_modes} のいずれか"
         )
         raise typer.Exit(code=1)
+    valid_fidelity_modes = ("window", "universe")
+    if fidelity_mode not in valid_fidelity_modes:
+        console.print(
+            f"[red]エラー[/red]: --fidelity-mode は {valid_fidelity_modes} のいずれか"
+        )
+        raise typer.Exit(code=1)
 
     console.print(
         f"設定: 試行回数={trials}, サンプラー={sampler}, "
@@ -449,6 +505,10 @@ def optimize_command(
         seed=seed,
         entry_filter_only=entry_filter_only,
         allowed_categories=allowed_categories,
+        multi_fidelity=multi_fidelity,
+        fidelity_mode=fidelity_mode,
+        min_fidelity=min_fidelity,
+        reduction_factor=reduction_factor,
     )
 
     # 最適化実行
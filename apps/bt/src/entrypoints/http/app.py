@@ -21,6 +21,7 @@ from src.shared.config.settings import get_settings
 from src.infrastructure.external_api.clients.jquants_client import JQuantsAsyncClient
 from src.entrypoints.http.middleware.correlation import CorrelationIdMiddleware
 from src.shared.observability.correlation import get_correlation_id
+from src.shared.observability.metrics import metrics_recorder
 from src.entrypoints.http.middleware.request_logger import RequestLoggerMiddleware
 from src.entrypoints.http.error_utils import extract_http_exception_detail
 from src.entrypoints.http.openapi_config import customize_openapi, get_openapi_config
@@ -64,6 +65,10 @@ from src.application.services.backtest_attribution_service import (
 )
 from src.application.services.backtest_service import backtest_service
 from src.application.services.job_manager import job_manager
+from src.application.services.expiring_singleflight_cache import (
+    ExpiringSingleFlightCache,
+    SqliteCacheDiskStore,
+)
 from src.application.services.jquants_proxy_service import JQuantsProxyService
 from src.application.services.lab_service import lab_service
 from src.application.services.chart_service import ChartService
@@ -144,18 +149,34 @@ async def _lifespan_impl(app: FastAPI) -> AsyncGenerator[None, None]:
         plan=settings.jquants_plan,
     )
     app.state.jquants_client = jquants_client
-    app.state.jquants_proxy_service = JQuantsProxyService(jquants_client)
-    app.state.moomoo_market_data_service = MoomooMarketDataService(
-        MoomooQuoteClient(
-            MoomooOpenDConfig(
-                host=settings.moomoo_opend_host,
-                port=settings.moomoo_opend_port,
-                is_encrypt=settings.moomoo_opend_is_encrypt,
-                enabled=settings.moomoo_opend_enabled,
-                max_history_rows=settings.moomoo_opend_max_history_rows,
-            )
+    jquants_proxy_cache_store: SqliteCacheDiskStore | None = None
+    try:
+        jquants_proxy_cache_store = SqliteCacheDiskStore(settings.jquants_proxy_cache_path)
+    except Exception as e:
+        logger.warning(f"J-Quants proxy cache の永続化を無効化: {e}")
+    app.state.jquants_proxy_service = JQuantsProxyService(
+        jquants_client,
+        cache=ExpiringSingleFlightCache[dict[str, Any]](
+            max_bytes=settings.jquants_proxy_cache_max_bytes,
+            disk_store=jquants_proxy_cache_store,
+        ),
+    )
+    metrics_recorder.register_cache_stats(
+        "jquants_proxy",
+        app.state.jquants_proxy_service.cache_stats,
+    )
+    moomoo_quote_client = MoomooQuoteClient(
+        MoomooOpenDConfig(
+            host=settings.moomoo_opend_host,
+            port=settings.moomoo_opend_port,
+            is_encrypt=settings.moomoo_opend_is_encrypt,
+            enabled=settings.moomoo_opend_enabled,
+            max_history_rows=settings.moomoo_opend_max_history_rows,
+            context_pool_size=settings.moomoo_opend_context_pool_size,
+            history_cache_dir=settings.moomoo_history_cache_dir,
         )
     )
+    app.state.moomoo_market_data_service = MoomooMarketDataService(moomoo_quote_client)
 
     # Market time-series reader (DuckDB SoT)
     market_reader: MarketDbReader | None = None
@@ -272,6 +293,9 @@ async def _lifespan_impl(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # JQuants client shutdown
     await jquants_client.close()
+    if jquants_proxy_cache_store is not None:
+        jquants_proxy_cache_store.close()
+    moomoo_quote_client.close()
 
     # Close the currently installed Market generation, not startup-captured handles.
     current_market_reader = getattr(app.state, "market_reader", None)
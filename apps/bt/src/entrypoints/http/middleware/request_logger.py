@@ -4,6 +4,8 @@ Request Logger Middleware
 FastAPI リクエストロギングを提供する。
 ログフォーマット: {method} {path} {status} {elapsed}ms
 構造化フィールド: correlationId, method, path, status, elapsed
+メトリクスの path ラベルはルートテンプレート（例: /api/jobs/{job_id}）を使い、
+系列数が ID ごとに増えないようにする。
 """
 
 from __future__ import annotations
@@ -23,6 +25,16 @@ from src.shared.observability.correlation import CORRELATION_ID_HEADER, get_corr
 from src.shared.observability.metrics import metrics_recorder
 
 
+_UNMATCHED_ROUTE_LABEL = "<unmatched>"
+
+
+def _route_template(request: Request) -> str:
+    """Return the matched route path template used as the metrics label."""
+    route = request.scope.get("route")
+    template = getattr(route, "path", None)
+    return template if isinstance(template, str) else _UNMATCHED_ROUTE_LABEL
+
+
 def _escape_loguru_message(message: str) -> str:
     """Escape braces so loguru doesn't treat exception text as a format string."""
     return message.replace("{", "{{").replace("}", "}}")
@@ -55,25 +67,28 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):
             return self._build_error_response(
                 method, path, start, status_code,
                 error_text, exc.message, log_level="warning",
+                route_path=_route_template(request),
             )
         except SQLAlchemyError as exc:
             return self._build_error_response(
                 method, path, start, 500,
                 "Internal Server Error", "Database error",
                 log_suffix=f"Database error: {exc}",
+                route_path=_route_template(request),
             )
         except Exception as exc:
             return self._build_error_response(
                 method, path, start, 500,
                 "Internal Server Error", "Internal server error",
                 log_suffix=f"Unhandled exception: {exc}",
+                route_path=_route_template(request),
             )
 
         elapsed_ms = round((time.monotonic() - start) * 1000, 1)
         status = response.status_code
         correlation_id = get_correlation_id()
 
-        metrics_recorder.record_request(method, path, status, elapsed_ms)
+        metrics_recorder.record_request(method, _route_template(request), status, elapsed_ms)
 
         log_kwargs = {
             "event": "request",
@@ -104,6 +119,7 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):
         *,
         log_level: str = "exception",
         log_suffix: str | None = None,
+        route_path: str | None = None,
     ) -> JSONResponse:
         """統一エラーフォーマットの JSONResponse を構築しログ出力する"""
         elapsed_ms = round((time.monotonic() - start) * 1000, 1)
@@ -111,7 +127,7 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):
 
         suffix = f" - {log_suffix}" if log_suffix else f" - {message}"
         log_msg = f"{method} {path} {status_code} {elapsed_ms}ms{suffix}"
-        metrics_recorder.record_request(method, path, status_code, elapsed_ms)
+        metrics_recorder.record_request(method, route_path or path, status_code, elapsed_ms)
 
         log_kwargs = {
             "event": "request_error",
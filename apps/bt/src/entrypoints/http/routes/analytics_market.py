@@ -140,6 +140,32 @@ async def get_margin_ratio(
     return result
 
 
+@router.get(
+    "/margin-pressure",
+    response_model=margin_contracts.MarginPressureRankingResponse,
+    summary="Rank stocks by margin pressure",
+)
+async def get_margin_pressure_ranking(
+    request: Request,
+    date: str | None = Query(None, description="As-of date (YYYY-MM-DD); latest margin date if omitted"),
+    period: int = Query(15, ge=5, le=60, description="Rolling average period in days"),
+    code: str | None = Query(None, description="Stock codes (comma-separated)"),
+    sortBy: margin_contracts.MarginPressureSortKey = Query("longPressure"),
+    order: Literal["asc", "desc"] = Query("desc"),
+    limit: int = Query(100, ge=1, le=5000),
+) -> margin_contracts.MarginPressureRankingResponse:
+    service = _get_margin_service(request)
+    codes = [item.strip() for item in code.split(",") if item.strip()] if code else None
+    return await service.get_margin_pressure_ranking(
+        date=date,
+        period=period,
+        codes=codes,
+        sort_by=sortBy,
+        order=order,
+        limit=limit,
+    )
+
+
 @router.get(
     "/fundamentals/{symbol}",
     response_model=fundamentals_contracts.FundamentalsComputeResponse,
@@ -1,10 +1,13 @@
 """
-Health Check Endpoint
+Health Check / Metrics Endpoint
 """
 
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
+from src.shared.observability.metrics import PROMETHEUS_CONTENT_TYPE, metrics_recorder
+
 router = APIRouter(tags=["Health"])
 
 
@@ -31,3 +34,16 @@ async def health_check() -> HealthResponse:
     サーバーの状態を確認
     """
     return _health_response
+
+
+@router.get("/api/metrics", include_in_schema=False)
+async def prometheus_metrics() -> PlainTextResponse:
+    """
+    メトリクス
+
+    Prometheus text format でプロセス内メトリクスを返す
+    """
+    return PlainTextResponse(
+        metrics_recorder.render_prometheus(),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from fastapi import APIRouter, HTTPException, Query, Request
 
 from src.application.services.moomoo_market_data_service import MoomooMarketDataService
@@ -55,14 +57,15 @@ async def get_us_history(
     date_from: str | None = Query(None, alias="from", description="Start date (YYYY-MM-DD)"),
     date_to: str | None = Query(None, alias="to", description="End date (YYYY-MM-DD)"),
     max_rows: int | None = Query(None, ge=1, le=5000, description="Maximum rows to return"),
+    timeframe: Literal["1d", "1m"] = Query("1d", description="Candlestick timeframe"),
 ) -> MoomooUsHistoryResponse:
-    """Fetch US daily historical candlesticks from moomoo OpenD."""
+    """Fetch US daily or minute historical candlesticks from moomoo OpenD."""
     if date_from and date_to and date_from > date_to:
         raise HTTPException(status_code=422, detail="'from' date must be before or equal to 'to' date")
     service = _get_moomoo_service(request)
     try:
         return MoomooUsHistoryResponse.model_validate(
-            await service.get_us_history(symbol, date_from, date_to, max_rows)
+            await service.get_us_history(symbol, date_from, date_to, max_rows, timeframe)
         )
     except MoomooOpenDError as exc:
         raise _as_http_error(exc) from exc
@@ -27,11 +27,9 @@ from src.entrypoints.http.schemas.indicators import (
     OHLCVResampleResponse,
 )
 from src.application.services.indicator_service import IndicatorService
-from src.domains.strategy.indicators.indicator_registry import (
-    _clean_value,
-    _format_date,
-)
+from src.domains.strategy.indicators.indicator_registry import _clean_value
 from src.domains.strategy.indicators.relative_ohlcv import calculate_relative_ohlcv
+from src.shared.utils.market_frames import format_index_date
 
 router = APIRouter(tags=["OHLCV"])
 
@@ -84,7 +82,7 @@ def _resample_ohlcv(
         records: list[dict[str, Any]] = []
         for idx, row in ohlcv.iterrows():
             records.append({
-                "date": _format_date(idx),
+                "date": format_index_date(idx),
                 "open": _clean_value(row["Open"]),
                 "high": _clean_value(row["High"]),
                 "low": _clean_value(row["Low"]),
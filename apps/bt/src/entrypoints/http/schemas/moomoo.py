@@ -45,7 +45,7 @@ class MoomooUsStockSearchResponse(BaseModel):
 
 
 class MoomooUsKlineItem(BaseModel):
-    """US historical daily candlestick row from moomoo OpenD."""
+    """US historical daily or minute candlestick row from moomoo OpenD."""
 
     code: str
     timeKey: str
@@ -67,7 +67,7 @@ class MoomooUsHistoryResponse(BaseModel):
 
     symbol: str
     code: str
-    timeframe: Literal["1d"]
+    timeframe: Literal["1d", "1m"]
     adjustment: Literal["qfq"]
     rows: list[MoomooUsKlineItem]
     count: int
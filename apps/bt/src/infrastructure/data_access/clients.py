@@ -127,6 +127,32 @@ def _resolve_dataset_artifact(
     raise FileNotFoundError(f"Dataset not found: {dataset_name}")
 
 
+def resolve_dataset_snapshot_identity(dataset_name: str) -> str:
+    """Return a key that changes whenever the data behind ``dataset_name`` changes.
+
+    Direct mode fingerprints the resolved snapshot manifest (or ``market.duckdb``
+    for universe presets) by path, mtime and size. HTTP mode cannot observe the
+    server-side snapshot, so the dataset name itself is returned.
+    """
+    if not should_use_direct_db():
+        return dataset_name
+    try:
+        if dataset_name in UNIVERSE_PRESET_NAMES:
+            market_timeseries_dir = str(
+                getattr(get_settings(), "market_timeseries_dir", "") or ""
+            ).strip()
+            if not market_timeseries_dir:
+                return dataset_name
+            fingerprint_path = (Path(market_timeseries_dir) / "market.duckdb").resolve()
+        else:
+            _backend, snapshot_root, _primary_path = _resolve_dataset_artifact(dataset_name)
+            fingerprint_path = Path(snapshot_root) / "manifest.v2.json"
+        stat = fingerprint_path.stat()
+    except OSError:
+        return dataset_name
+    return f"{dataset_name}@{fingerprint_path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
 def _resolve_dataset_reader(dataset_name: str) -> DatasetSnapshotReader:
     _backend, snapshot_root, primary_path = _resolve_dataset_artifact(dataset_name)
     cache_key = primary_path
@@ -436,6 +462,22 @@ class DirectDatasetClient:
             self._reader.get_index_data(index_code, start=start_date, end=end_date)
         )
 
+    def get_multiple_indices(
+        self,
+        codes: list[str],
+        start_date: str | None = None,
+        end_date: str | None = None,
+        *,
+        topix_key: str | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        batch = self._reader.get_index_data_batch(
+            codes,
+            start=start_date,
+            end=end_date,
+            topix_key=topix_key,
+        )
+        return {code: _to_ohlc_df(rows) for code, rows in batch.items() if rows}
+
     def get_index_list(
         self,
         min_records: int = 100,
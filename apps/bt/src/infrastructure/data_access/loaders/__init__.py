@@ -29,6 +29,8 @@ from .index_loaders import (
     load_topix_data,
     load_topix_data_from_market_db,
     load_index_data,
+    load_index_panel,
+    index_panel_series,
     get_index_list,
     get_available_indices,
 )
@@ -79,6 +81,8 @@ __all__ = [
     "load_topix_data",
     "load_topix_data_from_market_db",
     "load_index_data",
+    "load_index_panel",
+    "index_panel_series",
     "get_index_list",
     "get_available_indices",
     # Margin loaders
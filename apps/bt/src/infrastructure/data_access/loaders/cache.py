@@ -2,17 +2,43 @@
 データキャッシュモジュール
 
 パラメータ最適化時のAPI呼び出し削減のためのインメモリキャッシュ
+
+総バイト数で上限を設けた LRU キャッシュ。pandas の Copy-on-Write により
+get/set は浅いコピーの受け渡しで済み、呼び出し側の変更はキャッシュ側に
+波及しない（書き込み時にのみ実データがコピーされる）。
 """
 
 from __future__ import annotations
 
 import functools
+import inspect
+import os
 import threading
+from collections import OrderedDict
 from typing import Any, Callable, ClassVar
 
 import pandas as pd
 from loguru import logger
 
+DATA_CACHE_MAX_BYTES_ENV = "BT_DATA_CACHE_MAX_BYTES"
+DEFAULT_DATA_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+
+def _resolve_max_bytes(max_bytes: int | None) -> int:
+    if max_bytes is not None:
+        return max(int(max_bytes), 0)
+    raw = os.getenv(DATA_CACHE_MAX_BYTES_ENV)
+    if raw:
+        try:
+            return max(int(raw), 0)
+        except ValueError:
+            logger.warning(f"Invalid {DATA_CACHE_MAX_BYTES_ENV}={raw!r}; using default")
+    return DEFAULT_DATA_CACHE_MAX_BYTES
+
+
+def _frame_nbytes(data: pd.DataFrame) -> int:
+    return int(data.memory_usage(index=True, deep=True).sum())
+
 
 class DataCache:
     """
@@ -20,6 +46,8 @@ class DataCache:
 
     パラメータ最適化時に同一データの再取得を防ぐためのキャッシュ機構。
     明示的に有効化/無効化することで、通常のバックテストには影響しない。
+    保持データの合計バイト数が上限を超えると、最も古く参照されたエントリから
+    破棄する（上限は enable(max_bytes=...) または BT_DATA_CACHE_MAX_BYTES）。
 
     使用例:
         # 最適化開始時
@@ -40,10 +68,20 @@ class DataCache:
 
     def __init__(self) -> None:
         """初期化（直接呼び出し禁止、get_instance()を使用）"""
-        self._cache: dict[str, pd.DataFrame] = {}
+        self._cache: OrderedDict[str, tuple[pd.DataFrame, int]] = OrderedDict()
         self._enabled: bool = False
+        self._max_bytes: int = DEFAULT_DATA_CACHE_MAX_BYTES
+        self._total_bytes: int = 0
         self._hit_count: int = 0
         self._miss_count: int = 0
+        self._eviction_count: int = 0
+
+    def _reset_locked(self) -> None:
+        self._cache.clear()
+        self._total_bytes = 0
+        self._hit_count = 0
+        self._miss_count = 0
+        self._eviction_count = 0
 
     @classmethod
     def get_instance(cls) -> DataCache:
@@ -60,23 +98,26 @@ class DataCache:
         return cls._instance
 
     @classmethod
-    def enable(cls) -> DataCache:
+    def enable(cls, max_bytes: int | None = None) -> DataCache:
         """
         キャッシュを有効化
 
         最適化セッション開始時に呼び出す。
         既にキャッシュが有効な場合は既存キャッシュをクリアして再初期化。
 
+        Args:
+            max_bytes: 保持データの合計バイト上限（None の場合は環境変数/既定値）
+
         Returns:
             DataCacheインスタンス
         """
         instance = cls.get_instance()
+        resolved_max_bytes = _resolve_max_bytes(max_bytes)
         with cls._lock:
-            instance._cache.clear()
+            instance._reset_locked()
+            instance._max_bytes = resolved_max_bytes
             instance._enabled = True
-            instance._hit_count = 0
-            instance._miss_count = 0
-        logger.debug("DataCache enabled")
+        logger.debug(f"DataCache enabled: max_bytes={resolved_max_bytes}")
         return instance
 
     @classmethod
@@ -90,13 +131,16 @@ class DataCache:
         instance = cls.get_instance()
         with cls._lock:
             cache_size = len(instance._cache)
+            total_bytes = instance._total_bytes
             hit_count = instance._hit_count
             miss_count = instance._miss_count
+            eviction_count = instance._eviction_count
             instance._cache.clear()
+            instance._total_bytes = 0
             instance._enabled = False
         logger.debug(
-            f"DataCache disabled: {cache_size} entries cleared, "
-            f"hits={hit_count}, misses={miss_count}"
+            f"DataCache disabled: {cache_size} entries ({total_bytes} bytes) cleared, "
+            f"hits={hit_count}, misses={miss_count}, evictions={eviction_count}"
         )
 
     def is_enabled(self) -> bool:
@@ -116,20 +160,20 @@ class DataCache:
             key: キャッシュキー（例: "dataset:stock_code:start:end:timeframe"）
 
         Returns:
-            キャッシュされたDataFrame、または None（キャッシュミス時）
+            キャッシュされたDataFrame（Copy-on-Write の浅いコピー）、
+            または None（キャッシュミス時）
         """
         if not self._enabled:
             return None
 
         with self._lock:
-            if key in self._cache:
-                self._hit_count += 1
-                logger.trace(f"Cache hit: {key}")
-                return self._cache[key].copy()
-            else:
+            entry = self._cache.get(key)
+            if entry is None:
                 self._miss_count += 1
-                logger.trace(f"Cache miss: {key}")
                 return None
+            self._cache.move_to_end(key)
+            self._hit_count += 1
+            return entry[0].copy(deep=False)
 
     def set(self, key: str, data: pd.DataFrame) -> None:
         """
@@ -142,29 +186,43 @@ class DataCache:
         if not self._enabled:
             return
 
+        nbytes = _frame_nbytes(data)
+        stored = data.copy(deep=False)
         with self._lock:
-            self._cache[key] = data.copy()
-        logger.trace(f"Cache set: {key}")
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous[1]
+            if nbytes > self._max_bytes:
+                logger.trace(f"Cache skip (entry exceeds max_bytes): {key}")
+                return
+            self._cache[key] = (stored, nbytes)
+            self._total_bytes += nbytes
+            while self._total_bytes > self._max_bytes:
+                _, (_, evicted_bytes) = self._cache.popitem(last=False)
+                self._total_bytes -= evicted_bytes
+                self._eviction_count += 1
 
     def get_stats(self) -> dict[str, int]:
         """
         キャッシュ統計を取得
 
         Returns:
-            統計情報の辞書 {size, hits, misses}
+            統計情報の辞書 {size, bytes, max_bytes, hits, misses, evictions}
         """
-        return {
-            "size": len(self._cache),
-            "hits": self._hit_count,
-            "misses": self._miss_count,
-        }
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "bytes": self._total_bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hit_count,
+                "misses": self._miss_count,
+                "evictions": self._eviction_count,
+            }
 
     def clear(self) -> None:
         """キャッシュをクリア（有効状態は維持）"""
         with self._lock:
-            self._cache.clear()
-            self._hit_count = 0
-            self._miss_count = 0
+            self._reset_locked()
         logger.debug("DataCache cleared")
 
 
@@ -188,29 +246,82 @@ def cached_loader(
     """
 
     def decorator(func: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
+        build_key = _key_builder(func, key_template)
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> pd.DataFrame:
-            import inspect
-
-            sig = inspect.signature(func)
-            bound = sig.bind(*args, **kwargs)
-            bound.apply_defaults()
-
             cache = DataCache.get_instance()
-            cache_key = key_template.format(**bound.arguments)
+            if not cache.is_enabled():
+                return func(*args, **kwargs)
 
-            if cache.is_enabled():
-                cached = cache.get(cache_key)
-                if cached is not None:
-                    return cached
+            cache_key = build_key(args, kwargs)
+            if cache_key is None:
+                return func(*args, **kwargs)
 
-            result = func(*args, **kwargs)
-
-            if cache.is_enabled():
-                cache.set(cache_key, result)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
 
+            result = func(*args, **kwargs)
+            cache.set(cache_key, result)
             return result
 
         return wrapper
 
     return decorator
+
+
+def _key_builder(
+    func: Callable[..., Any],
+    key_template: str,
+) -> Callable[[tuple[Any, ...], dict[str, Any]], str | None]:
+    """デコレート時に引数名とデフォルト値を解決したキー生成関数を返す
+
+    呼び出しごとの inspect.signature / bind を避ける。引数が不正な呼び出しでは
+    None を返し、呼び出し元は元関数をそのまま実行して TypeError を送出させる。
+    """
+    signature = inspect.signature(func)
+    parameters = list(signature.parameters.values())
+    if any(
+        parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD)
+        for parameter in parameters
+    ):
+
+        def build_bound_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str | None:
+            try:
+                bound = signature.bind(*args, **kwargs)
+            except TypeError:
+                return None
+            bound.apply_defaults()
+            return key_template.format(**bound.arguments)
+
+        return build_bound_key
+
+    positional_names = tuple(
+        parameter.name
+        for parameter in parameters
+        if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+    )
+    keyword_names = frozenset(
+        parameter.name for parameter in parameters if parameter.kind is not parameter.POSITIONAL_ONLY
+    )
+    defaults = {
+        parameter.name: parameter.default
+        for parameter in parameters
+        if parameter.default is not parameter.empty
+    }
+    parameter_count = len(parameters)
+
+    def build_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str | None:
+        if len(args) > len(positional_names) or not keyword_names.issuperset(kwargs):
+            return None
+        if kwargs and not kwargs.keys().isdisjoint(positional_names[: len(args)]):
+            return None
+        values = dict(defaults)
+        values.update(zip(positional_names, args))
+        values.update(kwargs)
+        if len(values) != parameter_count:
+            return None
+        return key_template.format(**values)
+
+    return build_key
@@ -10,17 +10,167 @@ TOPIXデータの二重ロードパス:
     2. load_topix_data_from_market_db() — DuckDB の topix_data テーブルからロード
        日次更新の直近データを使用する ScreeningService の市場分析・
        portfolio factor regression API向け。
+
+インデックスパネル:
+    load_index_panel() — 複数インデックス（+ TOPIX）を1クエリで読み込み、
+    日付 × 系列に整列したパネルとして (dataset snapshot, 期間) 単位で DataCache に
+    保持する（DataCache 有効時のみ。enable/disable/clear とバイト上限に従う）。
+    同じ期間の load_topix_data() / load_index_data() はパネルから切り出す。
 """
 
-from typing import Optional
+import threading
+from collections.abc import Iterable
+from typing import Optional, cast
 
 import pandas as pd
 from loguru import logger
 
-from src.infrastructure.data_access.clients import get_dataset_client, get_market_client
-from src.infrastructure.data_access.loaders.cache import cached_loader
+from src.infrastructure.data_access.clients import (
+    get_dataset_client,
+    get_market_client,
+    resolve_dataset_snapshot_identity,
+)
+from src.infrastructure.data_access.loaders.cache import DataCache, cached_loader
 from src.infrastructure.data_access.loaders.utils import extract_dataset_name
 
+# パネル内で TOPIX を表す系列キー（インデックスコードと衝突しない名前）
+INDEX_PANEL_TOPIX_KEY = "topix"
+
+# 取得済み系列キー（データなしの系列を含む）を保持するパネルの attrs キー
+_LOADED_KEYS_ATTR = "index_panel_loaded_keys"
+
+# パネルの読み込み・マージを直列化するロック
+_index_panel_lock = threading.Lock()
+
+
+def _build_index_panel(
+    frames: dict[str, pd.DataFrame], loaded_keys: Iterable[str] = ()
+) -> pd.DataFrame:
+    if frames:
+        panel = pd.concat(frames, axis=1, names=["series", "field"]).sort_index()
+    else:
+        panel = pd.DataFrame(columns=pd.MultiIndex.from_tuples([], names=["series", "field"]))
+    panel.attrs[_LOADED_KEYS_ATTR] = sorted(set(loaded_keys) | set(frames))
+    return panel
+
+
+def _panel_cache_key(
+    dataset_name: str, start_date: Optional[str], end_date: Optional[str]
+) -> str:
+    snapshot = resolve_dataset_snapshot_identity(dataset_name)
+    return f"index_panel:{snapshot}:{start_date}:{end_date}"
+
+
+def _loaded_keys(panel: pd.DataFrame) -> frozenset[str]:
+    return frozenset(panel.attrs.get(_LOADED_KEYS_ATTR, ()))
+
+
+def _cached_panel_series(
+    dataset_name: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    key: str,
+) -> Optional[pd.DataFrame]:
+    cache = DataCache.get_instance()
+    if not cache.is_enabled():
+        return None
+    panel = cache.get(_panel_cache_key(dataset_name, start_date, end_date))
+    if panel is None or key not in _loaded_keys(panel):
+        return None
+    return index_panel_series(panel, key)
+
+
+def index_panel_series(panel: pd.DataFrame, key: str) -> pd.DataFrame:
+    """
+    インデックスパネルから1系列のOHLCデータを切り出す
+
+    Args:
+        panel: load_index_panel() の戻り値
+        key: インデックスコードまたは INDEX_PANEL_TOPIX_KEY
+
+    Returns:
+        pandas.DataFrame: 系列のOHLCデータ（他系列との整列で生じた全欠損行は
+            除去済み。一部フィールドのみ欠損した行は保持する）。
+            系列が存在しない場合は空の DataFrame
+    """
+    if key not in panel.columns.get_level_values(0):
+        return pd.DataFrame()
+    return cast(pd.DataFrame, panel[key]).dropna(how="all")
+
+
+def load_index_panel(
+    dataset: str,
+    index_codes: Iterable[str],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    *,
+    include_topix: bool = False,
+) -> pd.DataFrame:
+    """
+    複数インデックス（+ TOPIX）を日付 × 系列のパネルとして一括読み込み
+
+    未取得の系列のみを1回のクライアント呼び出しで取得する。DataCache が有効な場合は
+    (dataset snapshot, 期間) 単位のパネルにマージして保持し、snapshot が更新されると
+    別キーとして読み直す。データが存在しない系列はパネルに含まれない。
+
+    Args:
+        dataset: データセット名
+        index_codes: インデックスコード
+        start_date: 開始日 (YYYY-MM-DD)
+        end_date: 終了日 (YYYY-MM-DD)
+        include_topix: TOPIX を INDEX_PANEL_TOPIX_KEY 系列として含めるか
+
+    Returns:
+        pandas.DataFrame: DatetimeIndex × (series, field) の MultiIndex 列を持つパネル
+    """
+    dataset_name = extract_dataset_name(dataset)
+    requested = list(dict.fromkeys(index_codes))
+    requested_keys = set(requested)
+    if include_topix:
+        requested_keys.add(INDEX_PANEL_TOPIX_KEY)
+
+    cache = DataCache.get_instance()
+    cache_key = (
+        _panel_cache_key(dataset_name, start_date, end_date) if cache.is_enabled() else None
+    )
+    cached_panel = cache.get(cache_key) if cache_key is not None else None
+    panel = cached_panel if cached_panel is not None else _build_index_panel({})
+    loaded_keys = _loaded_keys(panel)
+    missing_codes = [code for code in requested if code not in loaded_keys]
+    missing_topix = include_topix and INDEX_PANEL_TOPIX_KEY not in loaded_keys
+
+    if missing_codes or missing_topix:
+        with get_dataset_client(dataset_name) as client:
+            frames = client.get_multiple_indices(
+                missing_codes,
+                start_date,
+                end_date,
+                topix_key=INDEX_PANEL_TOPIX_KEY if missing_topix else None,
+            )
+        fetched = {key: frame for key, frame in frames.items() if not frame.empty}
+        fetched_keys = set(missing_codes) | ({INDEX_PANEL_TOPIX_KEY} if missing_topix else set())
+        with _index_panel_lock:
+            if cache_key is not None:
+                cached_panel = cache.get(cache_key)
+                if cached_panel is not None:
+                    panel = cached_panel
+            loaded_keys = _loaded_keys(panel)
+            existing = {
+                key: cast(pd.DataFrame, panel[key])
+                for key in panel.columns.get_level_values(0).unique()
+            }
+            new_frames = {key: frame for key, frame in fetched.items() if key not in loaded_keys}
+            panel = _build_index_panel({**existing, **new_frames}, loaded_keys | fetched_keys)
+            if cache_key is not None:
+                cache.set(cache_key, panel)
+        logger.debug(
+            f"インデックスパネル読み込み: {len(fetched)}/{len(fetched_keys)}系列"
+        )
+
+    available = [
+        key for key in panel.columns.get_level_values(0).unique() if key in requested_keys
+    ]
+    return panel.loc[:, available]
 
 
 @cached_loader("topix:{dataset}:{start_date}:{end_date}")
@@ -46,6 +196,11 @@ def load_topix_data(
     """
     dataset_name = extract_dataset_name(dataset)
 
+    cached = _cached_panel_series(dataset_name, start_date, end_date, INDEX_PANEL_TOPIX_KEY)
+    if cached is not None and not cached.empty:
+        logger.debug("TOPIXデータ読み込み成功（インデックスパネル）")
+        return cached
+
     # API呼び出し
     with get_dataset_client(dataset_name) as client:
         df = client.get_topix(start_date, end_date)
@@ -123,6 +278,11 @@ def load_index_data(
     """
     dataset_name = extract_dataset_name(dataset)
 
+    cached = _cached_panel_series(dataset_name, start_date, end_date, index_code)
+    if cached is not None and not cached.empty:
+        logger.debug(f"インデックスデータ読み込み成功（インデックスパネル）: {index_code}")
+        return cached
+
     # API呼び出し
     with get_dataset_client(dataset_name) as client:
         df = client.get_index(index_code, start_date, end_date)
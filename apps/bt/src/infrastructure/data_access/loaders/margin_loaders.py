@@ -82,7 +82,7 @@ def load_margin_data(
 
     # キャッシュに保存（daily_indexなしの場合のみ）
     if cache.is_enabled() and daily_index is None:
-        cache.set(cache_key, df.copy())
+        cache.set(cache_key, df)
 
     # 日次インデックスに合わせて補完（オプション）
     if daily_index is not None:
@@ -11,7 +11,7 @@ from loguru import logger
 from src.infrastructure.data_access.clients import get_dataset_client
 from src.shared.exceptions import IndexDataLoadError, SectorDataLoadError
 
-from .index_loaders import load_index_data
+from .index_loaders import index_panel_series, load_index_data, load_index_panel
 from .utils import extract_dataset_name
 
 
@@ -97,14 +97,20 @@ def load_all_sector_indices(
     dataset: str,
     start_date: str | None = None,
     end_date: str | None = None,
+    *,
+    include_topix: bool = False,
 ) -> dict[str, pd.DataFrame]:
     """
     全33セクターインデックスのOHLCデータを一括取得
 
+    全セクターのインデックスを load_index_panel() で1回のクエリにまとめて読み込む。
+
     Args:
         dataset: データセット名
         start_date: 開始日 (YYYY-MM-DD)
         end_date: 終了日 (YYYY-MM-DD)
+        include_topix: TOPIX も同じクエリで読み込みパネルキャッシュに載せるか
+            （後続の load_topix_data() がパネルから返る）
 
     Returns:
         Dict[str, pd.DataFrame]: セクター名をキーとしたOHLCデータ辞書
@@ -113,6 +119,8 @@ def load_all_sector_indices(
     cache_key = f"{extract_dataset_name(dataset)}_{start_date}_{end_date}"
     if cache_key in _sector_indices_cache:
         logger.debug("セクターインデックスキャッシュヒット")
+        if include_topix:
+            load_index_panel(dataset, [], start_date, end_date, include_topix=True)
         return _sector_indices_cache[cache_key]
 
     logger.info("全セクターインデックスデータ一括ロード開始")
@@ -123,20 +131,28 @@ def load_all_sector_indices(
         logger.warning("セクターマッピングが空です")
         return {}
 
+    try:
+        panel = load_index_panel(
+            dataset,
+            mapping_df["index_code"].tolist(),
+            start_date,
+            end_date,
+            include_topix=include_topix,
+        )
+    except Exception as e:
+        logger.warning(f"セクターインデックスパネルロード失敗: {e}")
+        return {}
+
     sector_data: dict[str, pd.DataFrame] = {}
-    for _, row in mapping_df.iterrows():
-        sector_name = row["sector_name"]
-        index_code = row["index_code"]
-        try:
-            index_data = load_index_data(dataset, index_code, start_date, end_date)
-            if not index_data.empty:
-                sector_data[sector_name] = index_data
-                logger.debug(f"セクター '{sector_name}' ロード完了: {len(index_data)}レコード")
-            else:
-                logger.warning(f"セクター '{sector_name}' データが空です")
-        except Exception as e:
-            logger.warning(f"セクター '{sector_name}' ロード失敗: {e}")
-            continue
+    for sector_name, index_code in zip(
+        mapping_df["sector_name"], mapping_df["index_code"], strict=True
+    ):
+        index_data = index_panel_series(panel, index_code)
+        if not index_data.empty:
+            sector_data[sector_name] = index_data
+            logger.debug(f"セクター '{sector_name}' ロード完了: {len(index_data)}レコード")
+        else:
+            logger.warning(f"セクター '{sector_name}' データが空です")
 
     missing_count = len(mapping_df) - len(sector_data)
     msg = f"全セクターインデックスロード完了: {len(sector_data)}/{len(mapping_df)}セクター"
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, date, datetime
 import hashlib
@@ -13,6 +15,9 @@ import tempfile
 from threading import RLock
 from typing import Any, cast
 
+import numpy as np
+import pandas as pd
+
 from src.infrastructure.db.dataset_io.snapshot_contract import (
     DATASET_FUNDAMENTALS_BASIS_DATE_INFO_KEY,
     DATASET_PROVIDER_AS_OF_INFO_KEY,
@@ -37,6 +42,8 @@ _TEMP_INDEX_CODE_TABLE = "_dataset_copy_target_index_codes"
 _TEMP_STOCK_DATA_TABLE = "_dataset_copy_stock_data"
 _TEMP_STATEMENTS_TABLE = "_dataset_copy_statements"
 _TEMP_MARGIN_TABLE = "_dataset_copy_margin"
+_UPSERT_BATCH_RELATION = "_dataset_upsert_batch"
+_UPSERT_ROW_ORDER_COLUMN = "_dataset_upsert_row_order"
 _PROVIDER_STAGE_TABLES: tuple[tuple[str, str], ...] = (
     ("_dataset_provider_stock_data_raw", "stock_data_raw"),
     ("_dataset_provider_stock_master_daily", "stock_master_daily"),
@@ -53,6 +60,10 @@ _PROVIDER_PRIMARY_KEYS: dict[str, tuple[str, ...]] = {
 }
 
 
+DatasetRows = list[dict[str, Any]] | pd.DataFrame
+"""Upsert batch: row dicts or a DataFrame carrying the destination columns."""
+
+
 @dataclass(frozen=True)
 class StockDataCopyCodeStats:
     total_rows: int = 0
@@ -100,6 +111,32 @@ def parquet_dir_for_path(path: str) -> Path:
 
 
 class _DatasetDuckDbStore:
+    _STOCKS_COLUMNS: tuple[str, ...] = (
+        "code",
+        "company_name",
+        "company_name_english",
+        "market_code",
+        "market_name",
+        "sector_17_code",
+        "sector_17_name",
+        "sector_33_code",
+        "sector_33_name",
+        "scale_category",
+        "listed_date",
+        "created_at",
+        "updated_at",
+    )
+    _STOCK_DATA_COLUMNS: tuple[str, ...] = (
+        "code",
+        "date",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "adjustment_factor",
+        "created_at",
+    )
     _STATEMENT_TEXT_COLUMNS: frozenset[str] = frozenset(
         {
             "disclosure_number",
@@ -216,6 +253,7 @@ class _DatasetDuckDbStore:
         self._conn = cast(Any, duckdb).connect(str(self._duckdb_path))
         self._lock = RLock()
         self._dirty_tables: set[str] = set()
+        self._column_types: dict[str, dict[str, str]] = {}
         self._closed = False
         self._attached_source_path: str | None = None
         self._source_copy_dir: tempfile.TemporaryDirectory[str] | None = None
@@ -300,10 +338,106 @@ class _DatasetDuckDbStore:
         self._conn.execute(f"CREATE TEMP TABLE {table_name} ({ddl})")
 
     def _load_temp_codes(self, table_name: str, codes: list[str]) -> None:
-        self._conn.executemany(
-            f"INSERT INTO {table_name} (code) VALUES (?)",
-            [(code,) for code in codes],
+        self._conn.register(_UPSERT_BATCH_RELATION, pd.DataFrame({"code": codes}, dtype=object))
+        try:
+            self._conn.execute(
+                f"INSERT INTO {table_name} (code) SELECT code FROM {_UPSERT_BATCH_RELATION}"
+            )
+        finally:
+            self._conn.unregister(_UPSERT_BATCH_RELATION)
+
+    def _table_column_types(self, table_name: str) -> dict[str, str]:
+        cached = self._column_types.get(table_name)
+        if cached is None:
+            rows = self._conn.execute(
+                f"SELECT name, type FROM pragma_table_info('{table_name}')"
+            ).fetchall()
+            cached = {str(name): str(column_type) for name, column_type in rows}
+            self._column_types[table_name] = cached
+        return cached
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._conn.execute("BEGIN TRANSACTION")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _upsert_batch(
+        self,
+        table_name: str,
+        rows: DatasetRows,
+        *,
+        columns: tuple[str, ...],
+        conflict_columns: tuple[str, ...],
+        coalesce_updates: bool = False,
+    ) -> int:
+        """Upsert a batch with one set-based statement inside a transaction.
+
+        Duplicate keys within the batch resolve like sequential row upserts:
+        the last row wins, or with ``coalesce_updates`` the last non-NULL value
+        of each column wins and NULLs keep the stored value.
+        """
+        if isinstance(rows, pd.DataFrame):
+            frame = rows.reindex(columns=list(columns))
+        else:
+            frame = pd.DataFrame.from_records(rows, columns=list(columns))
+        if frame.empty:
+            return 0
+        frame = frame.assign(**{_UPSERT_ROW_ORDER_COLUMN: np.arange(len(frame))})
+
+        conflict_sql = ", ".join(conflict_columns)
+        update_columns = [column for column in columns if column not in conflict_columns]
+        # All-NULL DataFrame columns arrive as DOUBLE; bind to the destination types.
+        column_types = self._table_column_types(table_name)
+        casted_sql = ", ".join(
+            f"CAST({column} AS {column_types[column]}) AS {column}" for column in columns
         )
+        if coalesce_updates:
+            select_sql = ", ".join(
+                column
+                if column in conflict_columns
+                else (
+                    f"arg_max({column}, {_UPSERT_ROW_ORDER_COLUMN}) "
+                    f"FILTER (WHERE {column} IS NOT NULL) AS {column}"
+                )
+                for column in columns
+            )
+            source_sql = (
+                f"SELECT {select_sql} FROM ("
+                f"SELECT {casted_sql}, {_UPSERT_ROW_ORDER_COLUMN} FROM {_UPSERT_BATCH_RELATION}"
+                f") GROUP BY {conflict_sql}"
+            )
+            update_sql = ", ".join(
+                f"{column} = COALESCE(excluded.{column}, {table_name}.{column})"
+                for column in update_columns
+            )
+        else:
+            source_sql = (
+                f"SELECT {casted_sql} FROM {_UPSERT_BATCH_RELATION} "
+                f"QUALIFY row_number() OVER (PARTITION BY {conflict_sql} "
+                f"ORDER BY {_UPSERT_ROW_ORDER_COLUMN} DESC) = 1"
+            )
+            update_sql = ", ".join(f"{column} = excluded.{column}" for column in update_columns)
+
+        with self._lock, self._transaction():
+            self._conn.register(_UPSERT_BATCH_RELATION, frame)
+            try:
+                self._conn.execute(
+                    f"""
+                    INSERT INTO {table_name} ({", ".join(columns)})
+                    {source_sql}
+                    ON CONFLICT ({conflict_sql}) DO UPDATE
+                    SET {update_sql}
+                    """
+                )
+            finally:
+                self._conn.unregister(_UPSERT_BATCH_RELATION)
+            self._dirty_tables.add(table_name)
+        return len(frame)
 
     def _copy_count(self, table_name: str, where_sql: str = "") -> int:
         row = self._conn.execute(
@@ -559,100 +693,21 @@ class _DatasetDuckDbStore:
         rows = self._conn.execute(sql, params).fetchall()
         return {str(row[0]) for row in rows if row and row[0] is not None}
 
-    def upsert_stocks(self, rows: list[dict[str, Any]]) -> int:
-        if not rows:
-            return 0
-        values = [
-            (
-                row.get("code"),
-                row.get("company_name"),
-                row.get("company_name_english"),
-                row.get("market_code"),
-                row.get("market_name"),
-                row.get("sector_17_code"),
-                row.get("sector_17_name"),
-                row.get("sector_33_code"),
-                row.get("sector_33_name"),
-                row.get("scale_category"),
-                row.get("listed_date"),
-                row.get("created_at"),
-                row.get("updated_at"),
-            )
-            for row in rows
-        ]
-        with self._lock:
-            self._conn.executemany(
-                """
-                INSERT INTO stocks (
-                    code,
-                    company_name,
-                    company_name_english,
-                    market_code,
-                    market_name,
-                    sector_17_code,
-                    sector_17_name,
-                    sector_33_code,
-                    sector_33_name,
-                    scale_category,
-                    listed_date,
-                    created_at,
-                    updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT (code) DO UPDATE
-                SET company_name = excluded.company_name,
-                    company_name_english = excluded.company_name_english,
-                    market_code = excluded.market_code,
-                    market_name = excluded.market_name,
-                    sector_17_code = excluded.sector_17_code,
-                    sector_17_name = excluded.sector_17_name,
-                    sector_33_code = excluded.sector_33_code,
-                    sector_33_name = excluded.sector_33_name,
-                    scale_category = excluded.scale_category,
-                    listed_date = excluded.listed_date,
-                    created_at = excluded.created_at,
-                    updated_at = excluded.updated_at
-                """,
-                values,
-            )
-            self._dirty_tables.add("stocks")
-        return len(rows)
+    def upsert_stocks(self, rows: DatasetRows) -> int:
+        return self._upsert_batch(
+            "stocks",
+            rows,
+            columns=self._STOCKS_COLUMNS,
+            conflict_columns=("code",),
+        )
 
-    def upsert_stock_data(self, rows: list[dict[str, Any]]) -> int:
-        if not rows:
-            return 0
-        values = [
-            (
-                row.get("code"),
-                row.get("date"),
-                row.get("open"),
-                row.get("high"),
-                row.get("low"),
-                row.get("close"),
-                row.get("volume"),
-                row.get("adjustment_factor"),
-                row.get("created_at"),
-            )
-            for row in rows
-        ]
-        with self._lock:
-            self._conn.executemany(
-                """
-                INSERT INTO stock_data (
-                    code, date, open, high, low, close, volume, adjustment_factor, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT (code, date) DO UPDATE
-                SET open = excluded.open,
-                    high = excluded.high,
-                    low = excluded.low,
-                    close = excluded.close,
-                    volume = excluded.volume,
-                    adjustment_factor = excluded.adjustment_factor,
-                    created_at = excluded.created_at
-                """,
-                values,
-            )
-            self._dirty_tables.add("stock_data")
-        return len(rows)
+    def upsert_stock_data(self, rows: DatasetRows) -> int:
+        return self._upsert_batch(
+            "stock_data",
+            rows,
+            columns=self._STOCK_DATA_COLUMNS,
+            conflict_columns=("code", "date"),
+        )
 
     def copy_stock_data_from_source(
         self,
@@ -798,36 +853,13 @@ class _DatasetDuckDbStore:
                 self._dirty_tables.add("stock_data")
             return StockDataCopyResult(inserted_rows=inserted_rows, code_stats=code_stats)
 
-    def upsert_topix_data(self, rows: list[dict[str, Any]]) -> int:
-        if not rows:
-            return 0
-        values = [
-            (
-                row.get("date"),
-                row.get("open"),
-                row.get("high"),
-                row.get("low"),
-                row.get("close"),
-                row.get("created_at"),
-            )
-            for row in rows
-        ]
-        with self._lock:
-            self._conn.executemany(
-                """
-                INSERT INTO topix_data (date, open, high, low, close, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT (date) DO UPDATE
-                SET open = excluded.open,
-                    high = excluded.high,
-                    low = excluded.low,
-                    close = excluded.close,
-                    created_at = excluded.created_at
-                """,
-                values,
-            )
-            self._dirty_tables.add("topix_data")
-        return len(rows)
+    def upsert_topix_data(self, rows: DatasetRows) -> int:
+        return self._upsert_batch(
+            "topix_data",
+            rows,
+            columns=("date", "open", "high", "low", "close", "created_at"),
+            conflict_columns=("date",),
+        )
 
     def copy_topix_data_from_source(
         self, *, source_duckdb_path: str, date_from: str, date_to: str
@@ -868,40 +900,22 @@ class _DatasetDuckDbStore:
                 self._dirty_tables.add("topix_data")
             return inserted_rows
 
-    def upsert_indices_data(self, rows: list[dict[str, Any]]) -> int:
-        if not rows:
-            return 0
-        values = [
-            (
-                row.get("code"),
-                row.get("date"),
-                row.get("open"),
-                row.get("high"),
-                row.get("low"),
-                row.get("close"),
-                row.get("sector_name"),
-                row.get("created_at"),
-            )
-            for row in rows
-        ]
-        with self._lock:
-            self._conn.executemany(
-                """
-                INSERT INTO indices_data (
-                    code, date, open, high, low, close, sector_name, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT (code, date) DO UPDATE
-                SET open = excluded.open,
-                    high = excluded.high,
-                    low = excluded.low,
-                    close = excluded.close,
-                    sector_name = excluded.sector_name,
-                    created_at = excluded.created_at
-                """,
-                values,
-            )
-            self._dirty_tables.add("indices_data")
-        return len(rows)
+    def upsert_indices_data(self, rows: DatasetRows) -> int:
+        return self._upsert_batch(
+            "indices_data",
+            rows,
+            columns=(
+                "code",
+                "date",
+                "open",
+                "high",
+                "low",
+                "close",
+                "sector_name",
+                "created_at",
+            ),
+            conflict_columns=("code", "date"),
+        )
 
     def copy_indices_data_from_source(
         self,
@@ -973,31 +987,13 @@ class _DatasetDuckDbStore:
                 self._dirty_tables.add("indices_data")
             return inserted_rows
 
-    def upsert_margin_data(self, rows: list[dict[str, Any]]) -> int:
-        if not rows:
-            return 0
-        values = [
-            (
-                row.get("code"),
-                row.get("date"),
-                row.get("long_margin_volume"),
-                row.get("short_margin_volume"),
-            )
-            for row in rows
-        ]
-        with self._lock:
-            self._conn.executemany(
-                """
-                INSERT INTO margin_data (code, date, long_margin_volume, short_margin_volume)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT (code, date) DO UPDATE
-                SET long_margin_volume = excluded.long_margin_volume,
-                    short_margin_volume = excluded.short_margin_volume
-                """,
-                values,
-            )
-            self._dirty_tables.add("margin_data")
-        return len(rows)
+    def upsert_margin_data(self, rows: DatasetRows) -> int:
+        return self._upsert_batch(
+            "margin_data",
+            rows,
+            columns=("code", "date", "long_margin_volume", "short_margin_volume"),
+            conflict_columns=("code", "date"),
+        )
 
     def copy_margin_data_from_source(
         self,
@@ -1071,27 +1067,14 @@ class _DatasetDuckDbStore:
                 self._dirty_tables.add("margin_data")
             return inserted_rows
 
-    def upsert_statements(self, rows: list[dict[str, Any]]) -> int:
-        if not rows:
-            return 0
-
-        placeholders = ", ".join("?" for _ in self._STATEMENT_COLUMNS)
-        update_columns = ", ".join(
-            f"{column} = COALESCE(excluded.{column}, statements.{column})"
-            for column in self._STATEMENT_COLUMNS[2:]
-        )
-        sql = (
-            "INSERT INTO statements "
-            f"({', '.join(self._STATEMENT_COLUMNS)}) "
-            f"VALUES ({placeholders}) "
-            "ON CONFLICT (code, statement_id) DO UPDATE "
-            f"SET {update_columns}"
+    def upsert_statements(self, rows: DatasetRows) -> int:
+        return self._upsert_batch(
+            "statements",
+            rows,
+            columns=self._STATEMENT_COLUMNS,
+            conflict_columns=("code", "statement_id"),
+            coalesce_updates=True,
         )
-        values = [tuple(row.get(column) for column in self._STATEMENT_COLUMNS) for row in rows]
-        with self._lock:
-            self._conn.executemany(sql, values)
-            self._dirty_tables.add("statements")
-        return len(rows)
 
     def copy_statements_from_source(
         self,
@@ -2011,10 +1994,10 @@ class DatasetWriter:
             parquet_dir=str(self.parquet_dir),
         )
 
-    def upsert_stocks(self, rows: list[dict[str, Any]]) -> int:
+    def upsert_stocks(self, rows: DatasetRows) -> int:
         return self._duckdb_store.upsert_stocks(rows)
 
-    def upsert_stock_data(self, rows: list[dict[str, Any]]) -> int:
+    def upsert_stock_data(self, rows: DatasetRows) -> int:
         return self._duckdb_store.upsert_stock_data(rows)
 
     def copy_stock_data_from_source(
@@ -2032,7 +2015,7 @@ class DatasetWriter:
             date_to=date_to,
         )
 
-    def upsert_topix_data(self, rows: list[dict[str, Any]]) -> int:
+    def upsert_topix_data(self, rows: DatasetRows) -> int:
         return self._duckdb_store.upsert_topix_data(rows)
 
     def copy_topix_data_from_source(
@@ -2044,7 +2027,7 @@ class DatasetWriter:
             date_to=date_to,
         )
 
-    def upsert_indices_data(self, rows: list[dict[str, Any]]) -> int:
+    def upsert_indices_data(self, rows: DatasetRows) -> int:
         return self._duckdb_store.upsert_indices_data(rows)
 
     def copy_indices_data_from_source(
@@ -2062,7 +2045,7 @@ class DatasetWriter:
             date_to=date_to,
         )
 
-    def upsert_margin_data(self, rows: list[dict[str, Any]]) -> int:
+    def upsert_margin_data(self, rows: DatasetRows) -> int:
         return self._duckdb_store.upsert_margin_data(rows)
 
     def copy_margin_data_from_source(
@@ -2080,7 +2063,7 @@ class DatasetWriter:
             date_to=date_to,
         )
 
-    def upsert_statements(self, rows: list[dict[str, Any]]) -> int:
+    def upsert_statements(self, rows: DatasetRows) -> int:
         return self._duckdb_store.upsert_statements(rows)
 
     def copy_statements_from_source(
@@ -947,6 +947,61 @@ class DatasetSnapshotReader:
             tuple(params),
         )
 
+    def get_index_data_batch(
+        self,
+        codes: list[str],
+        start: str | None = None,
+        end: str | None = None,
+        *,
+        topix_key: str | None = None,
+    ) -> dict[str, list[_DuckDbRow]]:
+        """Read OHLC rows of several indices in one query.
+
+        With ``topix_key``, ``topix_data`` rows are read in the same query and
+        returned under that key.
+        """
+        if not codes and topix_key is None:
+            return {}
+        date_clauses: list[str] = []
+        date_params: list[Any] = []
+        if start:
+            date_clauses.append("date >= ?")
+            date_params.append(start)
+        if end:
+            date_clauses.append("date <= ?")
+            date_params.append(end)
+
+        selects: list[str] = []
+        params: list[Any] = []
+        if codes:
+            code_placeholders = ",".join("?" for _ in codes)
+            clauses = [f"code IN ({code_placeholders})", *date_clauses]
+            selects.append(
+                "SELECT code AS series_key, date, open, high, low, close "
+                f"FROM indices_data WHERE {' AND '.join(clauses)}"
+            )
+            params.extend(codes)
+            params.extend(date_params)
+        if topix_key is not None:
+            where_sql = f"WHERE {' AND '.join(date_clauses)}" if date_clauses else ""
+            selects.append(
+                "SELECT ? AS series_key, date, open, high, low, close "
+                f"FROM topix_data {where_sql}"
+            )
+            params.append(topix_key)
+            params.extend(date_params)
+
+        rows = self.query(
+            f"{' UNION ALL '.join(selects)} ORDER BY series_key, date",
+            tuple(params),
+        )
+        result: dict[str, list[_DuckDbRow]] = {code: [] for code in codes}
+        if topix_key is not None:
+            result[topix_key] = []
+        for row in rows:
+            result.setdefault(str(row.series_key), []).append(row)
+        return result
+
     def get_margin(
         self,
         code: str | None = None,
@@ -0,0 +1,135 @@
+"""Intraday cube read helpers.
+
+Research modules read pre-aggregated ``stock_intraday_*`` tables through these
+helpers (or join them directly in SQL) instead of resampling
+``stock_data_minute_raw`` themselves. Callers should check
+:func:`intraday_cubes_cover_range` first and fall back to their raw-minute SQL
+when the cube is missing (databases synced before it existed) or does not
+cover the requested dates.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, cast
+
+import pandas as pd
+
+from src.infrastructure.db.market.intraday_cube_writers import (
+    INTRADAY_CUBE_MANIFEST_TABLE,
+    INTRADAY_CUBE_TABLES,
+)
+from src.infrastructure.db.market.market_schema import INTRADAY_BAR_INTERVAL_MINUTES
+
+
+def _date_code_filter_sql(
+    *,
+    alias: str,
+    start_date: str | None,
+    end_date: str | None,
+    codes: Sequence[str] | None,
+) -> tuple[str, list[Any]]:
+    conditions: list[str] = []
+    params: list[Any] = []
+    if start_date:
+        conditions.append(f"{alias}.date >= ?")
+        params.append(start_date)
+    if end_date:
+        conditions.append(f"{alias}.date <= ?")
+        params.append(end_date)
+    if codes is not None:
+        conditions.append(f"list_contains(?, {alias}.code)")
+        params.append(list(dict.fromkeys(str(code) for code in codes)))
+    if not conditions:
+        return "", []
+    return " AND " + " AND ".join(conditions), params
+
+
+def intraday_cubes_cover_range(
+    conn: Any,
+    *,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> bool:
+    """Return whether the cube manifest records built dates in the range.
+
+    The market store rebuilds every published minute date and backfills dates
+    missing from ``stock_intraday_cube_dates`` on its first index pass, so the
+    manifest is checked instead of rescanning ``stock_data_minute_raw``.
+    """
+    tables = (*INTRADAY_CUBE_TABLES, INTRADAY_CUBE_MANIFEST_TABLE)
+    table_row = conn.execute(
+        f"""
+        SELECT count(*)
+        FROM information_schema.tables
+        WHERE table_name IN ({", ".join(f"'{name}'" for name in tables)})
+        """
+    ).fetchone()
+    if table_row is None or int(table_row[0] or 0) != len(tables):
+        return False
+    filter_sql, params = _date_code_filter_sql(
+        alias="c", start_date=start_date, end_date=end_date, codes=None
+    )
+    built_row = conn.execute(
+        f"SELECT count(*) FROM {INTRADAY_CUBE_MANIFEST_TABLE} c WHERE TRUE {filter_sql}",
+        params,
+    ).fetchone()
+    return built_row is not None and int(built_row[0] or 0) > 0
+
+
+def query_intraday_bars(
+    conn: Any,
+    *,
+    interval_minutes: int,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    codes: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """Return N-minute bars with the session open and returns from the open.
+
+    ``day_open`` is the open of the first bar of the same interval, which
+    equals the first minute open among minutes that form bars.
+    """
+    if interval_minutes not in INTRADAY_BAR_INTERVAL_MINUTES:
+        raise ValueError(
+            f"interval_minutes must be one of {INTRADAY_BAR_INTERVAL_MINUTES}"
+        )
+    filter_sql, params = _date_code_filter_sql(
+        alias="b", start_date=start_date, end_date=end_date, codes=codes
+    )
+    return cast(
+        pd.DataFrame,
+        conn.execute(
+            f"""
+            WITH bars AS (
+                SELECT
+                    b.date,
+                    b.code,
+                    b.bucket_minute,
+                    b.bucket_start_time,
+                    b.bucket_end_time,
+                    b.open,
+                    b.high,
+                    b.low,
+                    b.close,
+                    b.volume,
+                    b.turnover_value,
+                    b.source_bar_count,
+                    first_value(b.open) OVER (
+                        PARTITION BY b.date, b.code ORDER BY b.bucket_minute
+                    ) AS day_open
+                FROM stock_intraday_bars b
+                WHERE b.interval_minutes = ?
+                  {filter_sql}
+            )
+            SELECT
+                *,
+                close / NULLIF(day_open, 0) - 1 AS close_return_from_open,
+                low / NULLIF(day_open, 0) - 1 AS low_return_from_open,
+                high / NULLIF(day_open, 0) - 1 AS high_return_from_open
+            FROM bars
+            ORDER BY date, code, bucket_minute
+            """,
+            [interval_minutes, *params],
+        ).fetchdf(),
+    )
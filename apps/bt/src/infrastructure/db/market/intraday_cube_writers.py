@@ -0,0 +1,266 @@
+"""Intraday cube materialization helpers.
+
+``stock_data_minute_raw`` から次の派生テーブルを日付単位で再生成する。
+
+- ``stock_intraday_sessions``: 銘柄×日の寄り付き / 大引け / 高安 / 出来高
+- ``stock_intraday_bars``: ``INTRADAY_BAR_INTERVAL_MINUTES`` ごとの OHLCV バー
+- ``stock_intraday_snapshots``: ``INTRADAY_SNAPSHOT_TIMES`` 時点の
+  エントリー価格 (時刻以降の最初の始値) / エグジット価格 (時刻以前の最後の終値)
+
+再生成した日付は ``stock_intraday_cube_dates`` に記録する (集計対象の分足が
+無く cube 行が 0 件の日も含む)。カバレッジ判定はこの manifest だけを見るため、
+分足テーブルを走査しない。
+コードは 4 桁 (5 桁 API code の末尾 0 を除去) に正規化して集計する。
+分足の publish で変化した日付だけを差し替えるため、再集計コストは
+変更日数に比例する。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from src.infrastructure.db.market.market_schema import (
+    INTRADAY_BAR_INTERVAL_MINUTES,
+    INTRADAY_CUBE_SCHEMA_STATEMENTS,
+    INTRADAY_SNAPSHOT_TIMES,
+)
+
+INTRADAY_CUBE_TABLES: tuple[str, ...] = (
+    "stock_intraday_sessions",
+    "stock_intraday_bars",
+    "stock_intraday_snapshots",
+)
+INTRADAY_CUBE_MANIFEST_TABLE = "stock_intraday_cube_dates"
+
+_DATES_RELATION = "__tmp_intraday_cube_dates"
+_MINUTES_RELATION = "__tmp_intraday_cube_minutes"
+
+
+@dataclass(frozen=True, slots=True)
+class IntradayCubeRebuildResult:
+    """Dates and row counts written by one intraday cube rebuild."""
+
+    dates: tuple[str, ...]
+    session_rows: int
+    bar_rows: int
+    snapshot_rows: int
+
+
+def ensure_intraday_cube_tables(conn: Any) -> None:
+    for statement in INTRADAY_CUBE_SCHEMA_STATEMENTS:
+        conn.execute(statement)
+
+
+def _normalized_code_sql(column_name: str) -> str:
+    return (
+        "CASE "
+        f"WHEN length({column_name}) IN (5, 6) AND right({column_name}, 1) = '0' "
+        f"THEN left({column_name}, length({column_name}) - 1) "
+        f"ELSE {column_name} "
+        "END"
+    )
+
+
+def _minute_of_day_sql(column_name: str) -> str:
+    return (
+        f"CAST(substr({column_name}, 1, 2) AS INTEGER) * 60 "
+        f"+ CAST(substr({column_name}, 4, 2) AS INTEGER)"
+    )
+
+
+def _snapshot_values_sql(snapshot_times: Sequence[str]) -> str:
+    rows = []
+    for value in snapshot_times:
+        hour, minute = value.split(":")
+        rows.append(f"('{value}', {int(hour) * 60 + int(minute)})")
+    return ", ".join(rows)
+
+
+def _count_rows(conn: Any, table_name: str) -> int:
+    row = conn.execute(
+        f"SELECT COUNT(*) FROM {table_name} WHERE date IN (SELECT date FROM {_DATES_RELATION})"
+    ).fetchone()
+    return int(row[0] or 0) if row else 0
+
+
+def list_minute_dates_missing_from_cubes(conn: Any) -> list[str]:
+    """Return minute-data dates that are not recorded in the cube manifest yet.
+
+    分足テーブル全体を走査するため、DB を開いた後の初回 backfill 判定にだけ使う。
+    以降は publish 時の dirty date で manifest を追従させる。
+    """
+    rows = conn.execute(
+        f"""
+        SELECT DISTINCT m.date
+        FROM stock_data_minute_raw m
+        WHERE m.date IS NOT NULL
+          AND NOT EXISTS (
+              SELECT 1 FROM {INTRADAY_CUBE_MANIFEST_TABLE} c WHERE c.date = m.date
+          )
+        ORDER BY m.date
+        """
+    ).fetchall()
+    return [str(row[0]) for row in rows]
+
+
+def rebuild_intraday_cubes_for_dates(
+    conn: Any,
+    dates: Iterable[str],
+) -> IntradayCubeRebuildResult:
+    """Replace cube rows for ``dates`` with aggregates of the current minute rows."""
+    target_dates = tuple(sorted({str(value) for value in dates if value}))
+    if not target_dates:
+        return IntradayCubeRebuildResult((), 0, 0, 0)
+
+    ensure_intraday_cube_tables(conn)
+    intervals_sql = ", ".join(f"({int(value)})" for value in INTRADAY_BAR_INTERVAL_MINUTES)
+    snapshots_sql = _snapshot_values_sql(INTRADAY_SNAPSHOT_TIMES)
+    transaction_started = False
+    try:
+        conn.execute(f"DROP TABLE IF EXISTS {_DATES_RELATION}")
+        conn.execute(f"DROP TABLE IF EXISTS {_MINUTES_RELATION}")
+        conn.execute(f"CREATE TEMP TABLE {_DATES_RELATION} (date TEXT)")
+        conn.executemany(
+            f"INSERT INTO {_DATES_RELATION} VALUES (?)",
+            [[value] for value in target_dates],
+        )
+        conn.execute(
+            f"""
+            CREATE TEMP TABLE {_MINUTES_RELATION} AS
+            SELECT
+                m.date,
+                {_normalized_code_sql('m.code')} AS code,
+                m.time,
+                {_minute_of_day_sql('m.time')} AS minute_of_day,
+                m.open,
+                m.high,
+                m.low,
+                m.close,
+                m.volume,
+                m.turnover_value
+            FROM stock_data_minute_raw m
+            JOIN {_DATES_RELATION} d ON d.date = m.date
+            WHERE m.time IS NOT NULL
+              AND m.open IS NOT NULL
+              AND m.close IS NOT NULL
+              AND m.open > 0
+            """
+        )
+
+        conn.execute("BEGIN TRANSACTION")
+        transaction_started = True
+        for table_name in (*INTRADAY_CUBE_TABLES, INTRADAY_CUBE_MANIFEST_TABLE):
+            conn.execute(
+                f"DELETE FROM {table_name} "
+                f"WHERE date IN (SELECT date FROM {_DATES_RELATION})"
+            )
+        conn.execute(
+            f"""
+            INSERT INTO stock_intraday_sessions (
+                code, date, open, open_time, high, low, close, close_time,
+                volume, turnover_value, bar_count
+            )
+            SELECT
+                code,
+                date,
+                arg_min(open, minute_of_day),
+                arg_min(time, minute_of_day),
+                max(high),
+                min(low),
+                arg_max(close, minute_of_day),
+                arg_max(time, minute_of_day),
+                CAST(sum(volume) AS BIGINT),
+                sum(coalesce(turnover_value, 0.0)),
+                count(*)
+            FROM {_MINUTES_RELATION}
+            GROUP BY date, code
+            """
+        )
+        # バーは OHLCV が揃った分足のみを集計する (研究スクリプトの resample と同じ条件)。
+        conn.execute(
+            f"""
+            INSERT INTO stock_intraday_bars (
+                interval_minutes, code, date, bucket_minute, bucket_start_time,
+                bucket_end_time, open, high, low, close, volume, turnover_value,
+                source_bar_count
+            )
+            SELECT
+                i.interval_minutes,
+                m.code,
+                m.date,
+                CAST(FLOOR(m.minute_of_day / i.interval_minutes) AS INTEGER)
+                    * i.interval_minutes AS bucket_minute,
+                min(m.time),
+                max(m.time),
+                arg_min(m.open, m.minute_of_day),
+                max(m.high),
+                min(m.low),
+                arg_max(m.close, m.minute_of_day),
+                CAST(sum(m.volume) AS BIGINT),
+                sum(coalesce(m.turnover_value, 0.0)),
+                count(*)
+            FROM {_MINUTES_RELATION} m
+            CROSS JOIN (VALUES {intervals_sql}) AS i(interval_minutes)
+            WHERE m.high IS NOT NULL
+              AND m.low IS NOT NULL
+              AND m.volume IS NOT NULL
+            GROUP BY i.interval_minutes, m.date, m.code, bucket_minute
+            """
+        )
+        conn.execute(
+            f"""
+            INSERT INTO stock_intraday_snapshots (
+                snapshot_time, code, date, entry_open, entry_time,
+                exit_close, exit_time, cum_volume
+            )
+            SELECT
+                t.snapshot_time,
+                m.code,
+                m.date,
+                arg_min(m.open, m.minute_of_day)
+                    FILTER (WHERE m.minute_of_day >= t.snapshot_minute),
+                arg_min(m.time, m.minute_of_day)
+                    FILTER (WHERE m.minute_of_day >= t.snapshot_minute),
+                arg_max(m.close, m.minute_of_day)
+                    FILTER (WHERE m.minute_of_day <= t.snapshot_minute),
+                arg_max(m.time, m.minute_of_day)
+                    FILTER (WHERE m.minute_of_day <= t.snapshot_minute),
+                CAST(
+                    sum(m.volume) FILTER (WHERE m.minute_of_day <= t.snapshot_minute)
+                    AS BIGINT
+                )
+            FROM {_MINUTES_RELATION} m
+            CROSS JOIN (VALUES {snapshots_sql}) AS t(snapshot_time, snapshot_minute)
+            GROUP BY t.snapshot_time, m.date, m.code
+            """
+        )
+        # 分足が全て除外された日も 0 件として記録し、毎回の再集計対象から外す。
+        conn.execute(
+            f"""
+            INSERT INTO {INTRADAY_CUBE_MANIFEST_TABLE} (date, session_rows, built_at)
+            SELECT
+                d.date,
+                (SELECT count(*) FROM stock_intraday_sessions s WHERE s.date = d.date),
+                ?
+            FROM {_DATES_RELATION} d
+            """,
+            [datetime.now(UTC).isoformat()],
+        )
+        conn.execute("COMMIT")
+        transaction_started = False
+        return IntradayCubeRebuildResult(
+            dates=target_dates,
+            session_rows=_count_rows(conn, "stock_intraday_sessions"),
+            bar_rows=_count_rows(conn, "stock_intraday_bars"),
+            snapshot_rows=_count_rows(conn, "stock_intraday_snapshots"),
+        )
+    except Exception:
+        if transaction_started:
+            conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.execute(f"DROP TABLE IF EXISTS {_MINUTES_RELATION}")
+        conn.execute(f"DROP TABLE IF EXISTS {_DATES_RELATION}")
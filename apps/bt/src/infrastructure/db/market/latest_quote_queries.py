@@ -0,0 +1,145 @@
+"""Batched latest-quote read helpers.
+
+Reads the sync-materialized ``stock_latest_quotes`` table for many codes in a
+single query. Codes the table does not cover (including databases synced
+before it existed) fall back to one window query over ``stock_data``, so
+callers never issue per-code lookups.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from src.infrastructure.db.market.market_reader import MarketDbReadable
+from src.infrastructure.db.market.query_helpers import (
+    normalize_stock_code,
+    stock_code_query_candidates,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LatestQuote:
+    """Latest and previous session close for one normalized code."""
+
+    code: str
+    date: str
+    close: float
+    volume: float | None
+    prev_date: str | None
+    prev_close: float | None
+
+
+def fetch_latest_quotes(
+    reader: MarketDbReadable,
+    codes: Iterable[str],
+) -> dict[str, LatestQuote]:
+    """Return latest quotes keyed by normalized 4-digit code.
+
+    Codes missing from the materialized table (not yet synced, or codes
+    without any price rows) are resolved from ``stock_data`` in one extra
+    query; codes without price rows are omitted from the result.
+    """
+    normalized_codes = tuple(dict.fromkeys(normalize_stock_code(code) for code in codes))
+    if not normalized_codes:
+        return {}
+    quotes: dict[str, LatestQuote] = {}
+    if _has_latest_quotes_table(reader):
+        quotes = _fetch_materialized(reader, normalized_codes)
+    missing_codes = tuple(code for code in normalized_codes if code not in quotes)
+    if missing_codes:
+        quotes.update(_fetch_from_stock_data(reader, missing_codes))
+    return quotes
+
+
+def _has_latest_quotes_table(reader: MarketDbReadable) -> bool:
+    row = reader.query_one(
+        """
+        SELECT count(*) AS table_count
+        FROM information_schema.tables
+        WHERE table_name = 'stock_latest_quotes'
+        """
+    )
+    return row is not None and int(row["table_count"]) == 1
+
+
+def _fetch_materialized(
+    reader: MarketDbReadable,
+    codes: tuple[str, ...],
+) -> dict[str, LatestQuote]:
+    placeholders = ",".join("?" for _ in codes)
+    rows = reader.query(
+        f"""
+        SELECT code, date, close, volume, prev_date, prev_close
+        FROM stock_latest_quotes
+        WHERE code IN ({placeholders})
+        """,
+        codes,
+    )
+    return {str(row["code"]): _row_to_quote(row) for row in rows}
+
+
+def _fetch_from_stock_data(
+    reader: MarketDbReadable,
+    codes: tuple[str, ...],
+) -> dict[str, LatestQuote]:
+    candidates = stock_code_query_candidates(codes)
+    placeholders = ",".join("?" for _ in candidates)
+    rows = reader.query(
+        f"""
+        WITH deduped AS (
+            SELECT
+                CASE
+                    WHEN length(code) IN (5, 6) AND right(code, 1) = '0'
+                        THEN substr(code, 1, length(code) - 1)
+                    ELSE code
+                END AS code,
+                date,
+                close,
+                volume
+            FROM stock_data
+            WHERE code IN ({placeholders})
+            QUALIFY ROW_NUMBER() OVER (
+                PARTITION BY
+                    CASE
+                        WHEN length(code) IN (5, 6) AND right(code, 1) = '0'
+                            THEN substr(code, 1, length(code) - 1)
+                        ELSE code
+                    END,
+                    date
+                ORDER BY length(code)
+            ) = 1
+        ),
+        ranked AS (
+            SELECT
+                code,
+                date,
+                close,
+                volume,
+                LEAD(date) OVER (PARTITION BY code ORDER BY date DESC) AS prev_date,
+                LEAD(close) OVER (PARTITION BY code ORDER BY date DESC) AS prev_close,
+                ROW_NUMBER() OVER (PARTITION BY code ORDER BY date DESC) AS recency
+            FROM deduped
+        )
+        SELECT code, date, close, volume, prev_date, prev_close
+        FROM ranked
+        WHERE recency = 1
+        """,
+        candidates,
+    )
+    return {str(row["code"]): _row_to_quote(row) for row in rows}
+
+
+def _row_to_quote(row: Any) -> LatestQuote:
+    prev_close = row["prev_close"]
+    volume = row["volume"]
+    prev_date = row["prev_date"]
+    return LatestQuote(
+        code=str(row["code"]),
+        date=str(row["date"]),
+        close=float(row["close"]),
+        volume=float(volume) if volume is not None else None,
+        prev_date=str(prev_date) if prev_date is not None else None,
+        prev_close=float(prev_close) if prev_close is not None else None,
+    )
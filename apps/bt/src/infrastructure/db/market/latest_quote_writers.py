@@ -0,0 +1,209 @@
+"""Latest-quote materialization helpers.
+
+``stock_latest_quotes`` keeps one row per 4-digit code with the last two
+sessions of canonical ``stock_data`` so watchlist, portfolio and ranking
+consumers can read current prices for many codes in one indexed lookup.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from src.infrastructure.db.market.market_mutations import MarketMutationStats
+from src.infrastructure.db.market.market_schema import (
+    STOCK_LATEST_QUOTES_COLUMNS as _STOCK_LATEST_QUOTES_COLUMNS,
+)
+
+
+_DESIRED_RELATION = "desired_stock_latest_quotes"
+_SEMANTIC_COLUMNS = (
+    "date",
+    "close",
+    "volume",
+    "prev_date",
+    "prev_close",
+    "change",
+    "change_percent",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LatestQuoteRebuildResult:
+    """Semantic mutations and final row count for a latest-quote rebuild."""
+
+    stats: MarketMutationStats
+    final_count: int
+
+
+def rebuild_stock_latest_quotes_from_stock_data(
+    conn: Any,
+    lock: Any,
+    table_exists: Any,
+) -> LatestQuoteRebuildResult:
+    """Reconcile ``stock_latest_quotes`` from canonical adjusted stock_data."""
+    if not table_exists("stock_data"):
+        return LatestQuoteRebuildResult(MarketMutationStats.empty(), 0)
+
+    with lock:
+        try:
+            _materialize_desired_relation(conn)
+            stats = _classify_delta(conn)
+            if stats.mutated_rows:
+                _apply_delta(conn)
+            return LatestQuoteRebuildResult(stats, stats.input)
+        finally:
+            conn.execute(f"DROP TABLE IF EXISTS {_DESIRED_RELATION}")
+
+
+def _materialize_desired_relation(conn: Any) -> None:
+    conn.execute(f"DROP TABLE IF EXISTS {_DESIRED_RELATION}")
+    conn.execute(
+        f"""
+        CREATE TEMP TABLE {_DESIRED_RELATION} AS
+        WITH raw_prices AS (
+            SELECT
+                CASE
+                    WHEN length(code) IN (5, 6) AND right(code, 1) = '0'
+                        THEN substr(code, 1, length(code) - 1)
+                    ELSE code
+                END AS code,
+                date,
+                close,
+                volume,
+                ROW_NUMBER() OVER (
+                    PARTITION BY
+                        CASE
+                            WHEN length(code) IN (5, 6) AND right(code, 1) = '0'
+                                THEN substr(code, 1, length(code) - 1)
+                            ELSE code
+                        END,
+                        date
+                    ORDER BY length(code), code
+                ) AS code_rank
+            FROM stock_data
+        ),
+        recent AS (
+            SELECT
+                code,
+                date,
+                close,
+                volume,
+                ROW_NUMBER() OVER (PARTITION BY code ORDER BY date DESC) AS recency
+            FROM raw_prices
+            WHERE code_rank = 1
+            QUALIFY recency <= 2
+        )
+        SELECT
+            latest.code,
+            latest.date,
+            latest.close,
+            latest.volume,
+            previous.date AS prev_date,
+            previous.close AS prev_close,
+            CASE
+                WHEN previous.close IS NOT NULL THEN latest.close - previous.close
+            END AS change,
+            CASE
+                WHEN previous.close > 0
+                THEN (latest.close - previous.close) / previous.close * 100
+            END AS change_percent
+        FROM recent latest
+        LEFT JOIN recent previous
+          ON previous.code = latest.code
+         AND previous.recency = 2
+        WHERE latest.recency = 1
+        """
+    )
+
+
+def _classify_delta(conn: Any) -> MarketMutationStats:
+    distinct = " OR ".join(
+        f"target.{column} IS DISTINCT FROM desired.{column}"
+        for column in _SEMANTIC_COLUMNS
+    )
+    row = conn.execute(
+        f"""
+        SELECT
+            COUNT(*) AS input,
+            COUNT(*) FILTER (WHERE target.code IS NULL) AS inserted,
+            COUNT(*) FILTER (
+                WHERE target.code IS NOT NULL AND ({distinct})
+            ) AS updated,
+            COUNT(*) FILTER (
+                WHERE target.code IS NOT NULL AND NOT ({distinct})
+            ) AS unchanged,
+            (
+                SELECT COUNT(*)
+                FROM stock_latest_quotes stale
+                WHERE NOT EXISTS (
+                    SELECT 1
+                    FROM {_DESIRED_RELATION} desired_stale
+                    WHERE desired_stale.code = stale.code
+                )
+            ) AS deleted
+        FROM {_DESIRED_RELATION} desired
+        LEFT JOIN stock_latest_quotes target USING (code)
+        """
+    ).fetchone()
+    if row is None:
+        return MarketMutationStats.empty()
+    return MarketMutationStats(*(int(value or 0) for value in row))
+
+
+def _apply_delta(conn: Any) -> None:
+    distinct = " OR ".join(
+        f"target.{column} IS DISTINCT FROM desired.{column}"
+        for column in _SEMANTIC_COLUMNS
+    )
+    assignments = ", ".join(
+        [
+            *(f"{column} = desired.{column}" for column in _SEMANTIC_COLUMNS),
+            "created_at = ?",
+        ]
+    )
+    insert_columns = ", ".join(_STOCK_LATEST_QUOTES_COLUMNS)
+    select_columns = ", ".join(
+        [*(f"desired.{column}" for column in ("code", *_SEMANTIC_COLUMNS)), "?"]
+    )
+    created_at = datetime.now(UTC).isoformat()
+    conn.execute("BEGIN")
+    try:
+        conn.execute(
+            f"""
+            DELETE FROM stock_latest_quotes AS target
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM {_DESIRED_RELATION} desired
+                WHERE desired.code = target.code
+            )
+            """
+        )
+        conn.execute(
+            f"""
+            UPDATE stock_latest_quotes AS target
+            SET {assignments}
+            FROM {_DESIRED_RELATION} desired
+            WHERE target.code = desired.code
+              AND ({distinct})
+            """,
+            [created_at],
+        )
+        conn.execute(
+            f"""
+            INSERT INTO stock_latest_quotes ({insert_columns})
+            SELECT {select_columns}
+            FROM {_DESIRED_RELATION} desired
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM stock_latest_quotes target
+                WHERE target.code = desired.code
+            )
+            """,
+            [created_at],
+        )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
@@ -0,0 +1,270 @@
+"""Cross-sectional margin analytics read helpers.
+
+``margin_metrics`` computes long/flow pressure, turnover days and the weekly
+volume ratio for one symbol from pandas frames. These helpers compute the same
+metrics for every requested code in a single DuckDB query so market-wide
+rankings and screening do not need one round trip per symbol.
+
+Semantics mirror ``src.domains.analytics.margin_metrics``:
+
+- the N-day average volume is a row-based window over each code's
+  ``stock_data`` rows and is only defined once the window is full;
+- margin dates must exist in the code's ``stock_data`` dates to get an average;
+- flow pressure uses the previous ``margin_data`` row of the same code;
+- the weekly average uses positive-volume days grouped by ISO year/week.
+
+Values are returned unrounded; callers apply the per-symbol rounding.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import date, timedelta
+from typing import Any
+
+import pandas as pd
+
+from src.infrastructure.db.market.market_reader import MarketDbQueryable
+from src.infrastructure.db.market.query_helpers import normalize_stock_code
+
+# 出力開始日より前に読み込む履歴（暦日）。最大 60 営業日の移動平均と
+# 直前の信用残高行を含めるのに十分な幅を取る
+MARGIN_HISTORY_LOOKBACK_DAYS = 400
+
+MARGIN_ANALYTICS_COLUMNS = (
+    "code",
+    "date",
+    "long_vol",
+    "short_vol",
+    "net_margin",
+    "previous_net_margin",
+    "avg_volume",
+    "weekly_avg_volume",
+    "long_pressure",
+    "flow_pressure",
+    "turnover_days",
+    "long_ratio",
+    "short_ratio",
+)
+
+# API code (末尾 0 付き) を実コードへ寄せる。query_helpers.normalize_stock_code と同じ規則
+_NORMALIZED_CODE_SQL = """
+    CASE
+        WHEN length(code) IN (5, 6) AND right(code, 1) = '0'
+            THEN left(code, length(code) - 1)
+        ELSE code
+    END
+"""
+
+
+def _shift_date(value: str | None, days: int) -> str | None:
+    if not value:
+        return None
+    return (date.fromisoformat(value[:10]) + timedelta(days=days)).isoformat()
+
+
+def _source_filter_sql(
+    *,
+    history_start: str | None,
+    end_date: str | None,
+    codes: Sequence[str] | None,
+) -> tuple[str, list[Any]]:
+    conditions: list[str] = []
+    params: list[Any] = []
+    if history_start:
+        conditions.append("date >= ?")
+        params.append(history_start)
+    if end_date:
+        conditions.append("date <= ?")
+        params.append(end_date)
+    if codes is not None:
+        conditions.append(f"list_contains(?, {_NORMALIZED_CODE_SQL})")
+        params.append(list(dict.fromkeys(normalize_stock_code(str(code)) for code in codes)))
+    if not conditions:
+        return "", []
+    return " WHERE " + " AND ".join(conditions), params
+
+
+def query_margin_analytics_panel(
+    reader: MarketDbQueryable,
+    *,
+    period: int = 15,
+    codes: Sequence[str] | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> pd.DataFrame:
+    """Return one row per code and margin date with all margin metrics.
+
+    Metric columns are NULL (NaN) where the per-symbol calculation would skip
+    the date, e.g. before the average window is full.
+    """
+    if period <= 0:
+        raise ValueError("period must be positive")
+    window = int(period)
+    if codes is not None and not codes:
+        return pd.DataFrame(columns=list(MARGIN_ANALYTICS_COLUMNS))
+
+    history_start = _shift_date(start_date, -MARGIN_HISTORY_LOOKBACK_DAYS)
+    # 週平均出来高は ISO 週全体を使うため、出来高側は終了日を週末まで延ばす
+    stock_filter, stock_params = _source_filter_sql(
+        history_start=history_start,
+        end_date=_shift_date(end_date, 6),
+        codes=codes,
+    )
+    margin_filter, margin_params = _source_filter_sql(
+        history_start=history_start,
+        end_date=end_date,
+        codes=codes,
+    )
+    output_filter = ""
+    output_params: list[Any] = []
+    if start_date:
+        output_filter = " WHERE m.date >= ?"
+        output_params.append(start_date)
+
+    sql = f"""
+        WITH stock_ranked AS (
+            SELECT
+                {_NORMALIZED_CODE_SQL} AS code,
+                date,
+                volume,
+                ROW_NUMBER() OVER (
+                    PARTITION BY {_NORMALIZED_CODE_SQL}, date
+                    ORDER BY length(code)
+                ) AS rn
+            FROM stock_data
+            {stock_filter}
+        ),
+        volume_rows AS (
+            SELECT code, date, volume
+            FROM stock_ranked
+            WHERE rn = 1
+        ),
+        rolling_volume AS (
+            SELECT
+                code,
+                date,
+                CASE
+                    WHEN count(volume) OVER w = {window} THEN avg(volume) OVER w
+                END AS avg_volume
+            FROM volume_rows
+            WINDOW w AS (
+                PARTITION BY code ORDER BY date
+                ROWS BETWEEN {window - 1} PRECEDING AND CURRENT ROW
+            )
+        ),
+        weekly_volume AS (
+            SELECT
+                code,
+                isoyear(CAST(date AS DATE)) AS iso_year,
+                week(CAST(date AS DATE)) AS iso_week,
+                avg(volume) AS weekly_avg_volume
+            FROM volume_rows
+            WHERE volume > 0
+            GROUP BY 1, 2, 3
+        ),
+        margin_ranked AS (
+            SELECT
+                {_NORMALIZED_CODE_SQL} AS code,
+                date,
+                long_margin_volume,
+                short_margin_volume,
+                ROW_NUMBER() OVER (
+                    PARTITION BY {_NORMALIZED_CODE_SQL}, date
+                    ORDER BY length(code)
+                ) AS rn
+            FROM margin_data
+            {margin_filter}
+        ),
+        margin_rows AS (
+            SELECT
+                code,
+                date,
+                long_margin_volume AS long_vol,
+                short_margin_volume AS short_vol,
+                long_margin_volume - short_margin_volume AS net_margin,
+                lag(long_margin_volume - short_margin_volume) OVER (
+                    PARTITION BY code ORDER BY date
+                ) AS previous_net_margin
+            FROM margin_ranked
+            WHERE rn = 1
+        ),
+        joined AS (
+            SELECT
+                m.code,
+                m.date,
+                m.long_vol,
+                m.short_vol,
+                m.net_margin,
+                m.previous_net_margin,
+                NULLIF(r.avg_volume, 0) AS avg_volume,
+                NULLIF(w.weekly_avg_volume, 0) AS weekly_avg_volume
+            FROM margin_rows m
+            LEFT JOIN rolling_volume r
+                ON r.code = m.code AND r.date = m.date
+            LEFT JOIN weekly_volume w
+                ON w.code = m.code
+                AND w.iso_year = isoyear(CAST(m.date AS DATE))
+                AND w.iso_week = week(CAST(m.date AS DATE))
+            {output_filter}
+        )
+        SELECT
+            code,
+            date,
+            long_vol,
+            short_vol,
+            net_margin,
+            previous_net_margin,
+            avg_volume,
+            weekly_avg_volume,
+            net_margin / avg_volume AS long_pressure,
+            (net_margin - previous_net_margin) / avg_volume AS flow_pressure,
+            long_vol / avg_volume AS turnover_days,
+            CASE WHEN short_vol IS NOT NULL THEN long_vol / weekly_avg_volume END AS long_ratio,
+            CASE WHEN long_vol IS NOT NULL THEN short_vol / weekly_avg_volume END AS short_ratio
+        FROM joined
+        ORDER BY code, date
+    """
+    params = (*stock_params, *margin_params, *output_params)
+    rows = reader.query(sql, tuple(params))
+    return pd.DataFrame.from_records(
+        [tuple(row[column] for column in MARGIN_ANALYTICS_COLUMNS) for row in rows],
+        columns=list(MARGIN_ANALYTICS_COLUMNS),
+    )
+
+
+def resolve_margin_analytics_date(
+    reader: MarketDbQueryable,
+    as_of_date: str | None = None,
+) -> str | None:
+    """Return the latest ``margin_data`` date on or before ``as_of_date``."""
+    sql = "SELECT max(date) AS date FROM margin_data"
+    params: tuple[Any, ...] = ()
+    if as_of_date:
+        sql += " WHERE date <= ?"
+        params = (as_of_date,)
+    rows = reader.query(sql, params)
+    if not rows or rows[0]["date"] is None:
+        return None
+    return str(rows[0]["date"])
+
+
+def query_margin_analytics_snapshot(
+    reader: MarketDbQueryable,
+    *,
+    period: int = 15,
+    as_of_date: str | None = None,
+    codes: Sequence[str] | None = None,
+) -> tuple[str | None, pd.DataFrame]:
+    """Return the resolved margin date and every code's metrics on that date."""
+    margin_date = resolve_margin_analytics_date(reader, as_of_date)
+    if margin_date is None:
+        return None, pd.DataFrame(columns=list(MARGIN_ANALYTICS_COLUMNS))
+    panel = query_margin_analytics_panel(
+        reader,
+        period=period,
+        codes=codes,
+        start_date=margin_date,
+        end_date=margin_date,
+    )
+    return margin_date, panel
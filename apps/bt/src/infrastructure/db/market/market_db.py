@@ -15,6 +15,7 @@ from typing import Any, cast
 
 from src.infrastructure.db.market import metadata_writers as _metadata_writers
 from src.infrastructure.db.market import stock_master_writers as _stock_master_writers
+from src.infrastructure.db.market import latest_quote_writers as _latest_quote_writers
 from src.infrastructure.db.market import technical_metric_writers as _technical_metric_writers
 from src.infrastructure.db.market.duckdb_connection import (
     MarketWriterToken,
@@ -818,6 +819,17 @@ class MarketDb:
             self._table_exists,
         )
 
+    def rebuild_stock_latest_quotes_from_stock_data(
+        self,
+    ) -> _latest_quote_writers.LatestQuoteRebuildResult:
+        """銘柄ごとの最新・前日終値 (stock_latest_quotes) を stock_data から再生成する。"""
+        self._assert_writable()
+        return _latest_quote_writers.rebuild_stock_latest_quotes_from_stock_data(
+            self._conn,
+            self._lock,
+            self._table_exists,
+        )
+
     def materialize_daily_valuation(
         self,
         *,
@@ -266,6 +266,18 @@ DAILY_TECHNICAL_METRICS_COLUMNS: tuple[str, ...] = (
     "created_at",
 )
 
+STOCK_LATEST_QUOTES_COLUMNS: tuple[str, ...] = (
+    "code",
+    "date",
+    "close",
+    "volume",
+    "prev_date",
+    "prev_close",
+    "change",
+    "change_percent",
+    "created_at",
+)
+
 DAILY_TECHNICAL_METRICS_ADDITIONAL_COLUMNS: tuple[tuple[str, str], ...] = (
     ("sma5_below_streak", "INTEGER"),
 )
@@ -287,6 +299,66 @@ STOCK_MASTER_DAILY_COLUMNS: tuple[str, ...] = (
 )
 STOCK_MASTER_DAILY_RELATION = "__tmp_stock_master_daily_publish"
 
+INTRADAY_BAR_INTERVAL_MINUTES: tuple[int, ...] = (5, 15, 30)
+INTRADAY_SNAPSHOT_TIMES: tuple[str, ...] = ("09:00", "10:30", "10:45", "13:30", "14:45")
+
+INTRADAY_CUBE_SCHEMA_STATEMENTS: tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS stock_intraday_sessions (
+        code TEXT NOT NULL,
+        date TEXT NOT NULL,
+        open DOUBLE NOT NULL,
+        open_time TEXT NOT NULL,
+        high DOUBLE,
+        low DOUBLE,
+        close DOUBLE NOT NULL,
+        close_time TEXT NOT NULL,
+        volume BIGINT,
+        turnover_value DOUBLE,
+        bar_count INTEGER NOT NULL,
+        PRIMARY KEY (date, code)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS stock_intraday_bars (
+        interval_minutes INTEGER NOT NULL,
+        code TEXT NOT NULL,
+        date TEXT NOT NULL,
+        bucket_minute INTEGER NOT NULL,
+        bucket_start_time TEXT NOT NULL,
+        bucket_end_time TEXT NOT NULL,
+        open DOUBLE NOT NULL,
+        high DOUBLE NOT NULL,
+        low DOUBLE NOT NULL,
+        close DOUBLE NOT NULL,
+        volume BIGINT,
+        turnover_value DOUBLE,
+        source_bar_count INTEGER NOT NULL,
+        PRIMARY KEY (interval_minutes, date, code, bucket_minute)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS stock_intraday_snapshots (
+        snapshot_time TEXT NOT NULL,
+        code TEXT NOT NULL,
+        date TEXT NOT NULL,
+        entry_open DOUBLE,
+        entry_time TEXT,
+        exit_close DOUBLE,
+        exit_time TEXT,
+        cum_volume BIGINT,
+        PRIMARY KEY (snapshot_time, date, code)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS stock_intraday_cube_dates (
+        date TEXT PRIMARY KEY,
+        session_rows BIGINT NOT NULL,
+        built_at TEXT NOT NULL
+    )
+    """,
+)
+
 SCHEMA_STATEMENTS: tuple[str, ...] = (
     """
     CREATE TABLE IF NOT EXISTS market_schema_version (
@@ -764,6 +836,20 @@ SCHEMA_STATEMENTS: tuple[str, ...] = (
     ON daily_technical_metrics(date, code)
     """,
     """
+    CREATE TABLE IF NOT EXISTS stock_latest_quotes (
+        code TEXT PRIMARY KEY,
+        date TEXT NOT NULL,
+        close DOUBLE NOT NULL,
+        volume DOUBLE NOT NULL,
+        prev_date TEXT,
+        prev_close DOUBLE,
+        change DOUBLE,
+        change_percent DOUBLE,
+        created_at TEXT
+    )
+    """,
+    *INTRADAY_CUBE_SCHEMA_STATEMENTS,
+    """
     CREATE TABLE IF NOT EXISTS sync_metadata (
         key TEXT PRIMARY KEY,
         value TEXT NOT NULL,
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import hashlib
-import math
 import json
 import shutil
 from time import perf_counter
@@ -37,6 +36,11 @@ from src.infrastructure.db.market.market_mutations import (
     deterministic_last_wins,
 )
 from src.infrastructure.db.market.query_helpers import normalize_stock_code
+from src.infrastructure.db.market.intraday_cube_writers import (
+    ensure_intraday_cube_tables,
+    list_minute_dates_missing_from_cubes,
+    rebuild_intraday_cubes_for_dates,
+)
 from src.infrastructure.db.market.market_schema import (
     IncompatibleMarketSchemaError,
     MARKET_SCHEMA_VERSION,
@@ -66,6 +70,7 @@ class MarketTimeSeriesStore(Protocol):  # pragma: no cover
     def detect_stock_provider_drift(
         self, rows: list[dict[str, Any]]
     ) -> frozenset[str]: ...
+    def detect_stock_provider_drift_frame(self, frame: pd.DataFrame) -> frozenset[str]: ...
     def replace_stock_provider_window(
         self,
         code: str,
@@ -76,6 +81,7 @@ class MarketTimeSeriesStore(Protocol):  # pragma: no cover
     def publish_stock_minute_data(
         self, rows: list[dict[str, Any]]
     ) -> SemanticDeltaResult: ...
+    def publish_stock_minute_frame(self, frame: pd.DataFrame) -> SemanticDeltaResult: ...
     def publish_indices_data(
         self, rows: list[dict[str, Any]], *, initial_load: bool = False
     ) -> SemanticDeltaResult: ...
@@ -91,6 +97,7 @@ class MarketTimeSeriesStore(Protocol):  # pragma: no cover
     def stage_stock_data_rows(
         self, rows: list[dict[str, Any]]
     ) -> SemanticDeltaResult: ...
+    def stage_stock_data_frame(self, frame: pd.DataFrame) -> SemanticDeltaResult: ...
     def flush_staged_stock_data(
         self,
         *,
@@ -487,6 +494,8 @@ class DuckDbParquetTimeSeriesStore:
         self._lock = RLock()
         self._dirty_tables: set[str] = set()
         self._dirty_stock_minute_dates: set[str] = set()
+        # cube manifest の backfill 判定 (分足テーブル全走査) はプロセスごとに 1 回だけ行う。
+        self._intraday_cube_backfill_checked = False
         self._dirty_partition_dates: dict[str, set[str]] = {}
         if not read_only:
             self._ensure_schema()
@@ -634,6 +643,7 @@ class DuckDbParquetTimeSeriesStore:
                 )
                 """
             )
+            ensure_intraday_cube_tables(self._conn)
             self._conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS sync_metadata (
@@ -918,6 +928,13 @@ class DuckDbParquetTimeSeriesStore:
             ),
             columns=self._STOCK_DATA_RAW_UPSERT_SPEC.columns,
         )
+        return self.detect_stock_provider_drift_frame(dataframe)
+
+    def detect_stock_provider_drift_frame(self, frame: pd.DataFrame) -> frozenset[str]:
+        """Columnar variant of :meth:`detect_stock_provider_drift`."""
+        if frame.empty:
+            return frozenset()
+        dataframe = frame.reindex(columns=list(self._STOCK_DATA_RAW_UPSERT_SPEC.columns))
         drift_predicate = " OR ".join(
             (
                 "(incoming.adjusted_volume IS DISTINCT FROM "
@@ -930,8 +947,26 @@ class DuckDbParquetTimeSeriesStore:
             )
             for column in PROVIDER_DRIFT_COLUMNS
         )
+        # 新規キーは factor=1 なのに raw / adjusted が食い違う行 (値欠損を含む) を drift とみなす。
+        consistency_pairs = (
+            ("open", "adjusted_open"),
+            ("high", "adjusted_high"),
+            ("low", "adjusted_low"),
+            ("close", "adjusted_close"),
+            ("volume", "adjusted_volume"),
+        )
+        missing_predicate = " OR ".join(
+            f"incoming.{column} IS NULL"
+            for column in (
+                "adjustment_factor",
+                *(column for pair in consistency_pairs for column in pair),
+            )
+        )
+        consistent_predicate = " AND ".join(
+            f"abs(incoming.{adjusted} - incoming.{raw}) <= 0.0500001"
+            for raw, adjusted in consistency_pairs
+        )
         relation_name = self._STOCK_ADJUSTMENT_PROBE_RELATION
-        existing_keys: set[tuple[str, str]] = set()
         with self._lock:
             self._conn.register(relation_name, dataframe)
             try:
@@ -948,50 +983,21 @@ class DuckDbParquetTimeSeriesStore:
                             existing.code IS NOT NULL
                             AND ({drift_predicate})
                        )
+                       OR (
+                            existing.code IS NULL
+                            AND (
+                                {missing_predicate}
+                                OR (
+                                    incoming.adjustment_factor = 1.0
+                                    AND NOT ({consistent_predicate})
+                                )
+                            )
+                       )
                     """
                 ).fetchall()
-                existing_keys = {
-                    (str(row[0]), str(row[1]))
-                    for row in self._conn.execute(
-                        f"""
-                        SELECT incoming.code, incoming.date
-                        FROM {relation_name} incoming
-                        JOIN stock_data_raw existing
-                          ON existing.code = incoming.code
-                         AND existing.date = incoming.date
-                        """
-                    ).fetchall()
-                }
             finally:
                 self._conn.unregister(relation_name)
-        drift_codes = {str(row[0]) for row in drift_rows if row and row[0]}
-        for row in rows:
-            key = (str(row.get("code") or ""), str(row.get("date") or ""))
-            if key in existing_keys:
-                continue
-            try:
-                factor = float(row["adjustment_factor"])
-                price_consistent = all(
-                    abs(float(row[adjusted]) - float(row[raw])) <= 0.0500001
-                    for raw, adjusted in (
-                        ("open", "adjusted_open"),
-                        ("high", "adjusted_high"),
-                        ("low", "adjusted_low"),
-                        ("close", "adjusted_close"),
-                    )
-                )
-                volume_consistent = math.isclose(
-                    float(row["adjusted_volume"]),
-                    float(row["volume"]),
-                    rel_tol=0.0,
-                    abs_tol=0.0500001,
-                )
-            except (KeyError, TypeError, ValueError):
-                drift_codes.add(str(row.get("code") or ""))
-                continue
-            if factor == 1.0 and not (price_consistent and volume_consistent):
-                drift_codes.add(str(row.get("code") or ""))
-        return frozenset(code for code in drift_codes if code)
+        return frozenset(str(row[0]) for row in drift_rows if row and row[0])
 
     def _mark_current_basis_recompute_pending_unlocked(
         self,
@@ -1803,6 +1809,14 @@ class DuckDbParquetTimeSeriesStore:
             ],
             columns=self._STOCK_DATA_RAW_UPSERT_SPEC.columns,
         )
+        return self.stage_stock_data_frame(dataframe)
+
+    def stage_stock_data_frame(self, frame: pd.DataFrame) -> SemanticDeltaResult:
+        """Stage a columnar daily batch without materializing row dicts."""
+        self._assert_writable()
+        if frame.empty:
+            return SemanticDeltaResult.empty()
+        dataframe = frame.reindex(columns=list(self._STOCK_DATA_RAW_UPSERT_SPEC.columns))
         with self._lock:
             self._ensure_stock_data_stage_table()
             self._conn.register(
@@ -1819,7 +1833,7 @@ class DuckDbParquetTimeSeriesStore:
                 )
             finally:
                 self._conn.unregister(self._STOCK_DATA_RAW_UPSERT_SPEC.relation_name)
-        return SemanticDeltaResult.empty(input_count=len(rows))
+        return SemanticDeltaResult.empty(input_count=len(frame))
 
     def flush_staged_stock_data(
         self,
@@ -2196,6 +2210,34 @@ class DuckDbParquetTimeSeriesStore:
                 self._dirty_stock_minute_dates.update(result.affected_dates)
             return result
 
+    def publish_stock_minute_frame(self, frame: pd.DataFrame) -> SemanticDeltaResult:
+        """Publish a columnar minute-bar batch without materializing row dicts.
+
+        ``frame`` must carry the ``stock_data_minute_raw`` columns; duplicate
+        keys keep the last row as in :meth:`publish_stock_minute_data`.
+        """
+        self._assert_writable()
+        if frame.empty:
+            return SemanticDeltaResult.empty()
+        spec = self._STOCK_MINUTE_DATA_UPSERT_SPEC
+        dataframe = frame.loc[:, list(spec.columns)].drop_duplicates(
+            subset=list(spec.conflict_columns),
+            keep="last",
+        )
+        with self._lock:
+            result = self._apply_semantic_delta_frame(
+                dataframe,
+                spec=spec,
+                input_count=len(frame),
+            )
+            if result.mutated_rows:
+                self._dirty_tables.add(spec.table_name)
+                self._dirty_partition_dates.setdefault(spec.table_name, set()).update(
+                    result.affected_dates
+                )
+                self._dirty_stock_minute_dates.update(result.affected_dates)
+            return result
+
     def publish_indices_data(
         self, rows: list[dict[str, Any]], *, initial_load: bool = False
     ) -> SemanticDeltaResult:
@@ -2336,6 +2378,23 @@ class DuckDbParquetTimeSeriesStore:
 
     def index_stock_minute_data(self) -> None:
         self._assert_writable()
+        with self._lock:
+            cube_dates = set(self._dirty_stock_minute_dates)
+            if not self._intraday_cube_backfill_checked:
+                cube_dates.update(list_minute_dates_missing_from_cubes(self._conn))
+            if cube_dates:
+                started_at = perf_counter()
+                cube_result = rebuild_intraday_cubes_for_dates(self._conn, cube_dates)
+                logger.info(
+                    "market store phase timing",
+                    event="market_store_phase_timing",
+                    operation="intraday_cube_rebuild",
+                    table="stock_intraday_bars",
+                    rows=cube_result.bar_rows,
+                    partitions=len(cube_result.dates),
+                    elapsedMs=(perf_counter() - started_at) * 1000,
+                )
+            self._intraday_cube_backfill_checked = True
         self._export_if_dirty("stock_data_minute_raw")
 
     def index_indices_data(self) -> None:
@@ -2980,6 +3039,20 @@ class DuckDbParquetTimeSeriesStore:
             ],
             columns=spec.columns,
         )
+        return self._apply_semantic_delta_frame(
+            dataframe,
+            spec=spec,
+            input_count=len(rows),
+        )
+
+    def _apply_semantic_delta_frame(
+        self,
+        dataframe: pd.DataFrame,
+        *,
+        spec: _RelationUpsertSpec,
+        input_count: int,
+    ) -> SemanticDeltaResult:
+        """Apply the semantic delta of a key-deduplicated columnar batch."""
         join_sql = " AND ".join(
             f"target.{column} IS NOT DISTINCT FROM staged.{column}"
             for column in spec.conflict_columns
@@ -3017,8 +3090,8 @@ class DuckDbParquetTimeSeriesStore:
                 )
                 unchanged = (
                     sum(1 for row in classified if row[-1] == "unchanged")
-                    + len(rows)
-                    - len(staged_rows)
+                    + input_count
+                    - len(dataframe)
                 )
                 if inserted_keys or updated_keys:
                     columns_sql = ", ".join(spec.columns)
@@ -3066,7 +3139,7 @@ class DuckDbParquetTimeSeriesStore:
         )
         return SemanticDeltaResult(
             stats=MarketMutationStats(
-                input=len(rows),
+                input=input_count,
                 inserted=len(inserted_keys),
                 updated=len(updated_keys),
                 unchanged=unchanged,
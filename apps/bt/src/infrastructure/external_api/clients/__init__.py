@@ -1,10 +1,21 @@
 """
 JQuants API Client Package
 
-JQuants API v2 への非同期クライアント・レートリミッターを提供する。
+JQuants API v2 への非同期クライアント・レートリミッター・同時実行リミッターを提供する。
 """
 
+from src.infrastructure.external_api.clients.adaptive_concurrency import AdaptiveConcurrencyLimiter
 from src.infrastructure.external_api.clients.jquants_client import JQuantsAsyncClient
-from src.infrastructure.external_api.clients.rate_limiter import RateLimiter
+from src.infrastructure.external_api.clients.rate_limiter import (
+    RateLimiter,
+    RequestPriority,
+    request_priority,
+)
 
-__all__ = ["JQuantsAsyncClient", "RateLimiter"]
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "JQuantsAsyncClient",
+    "RateLimiter",
+    "RequestPriority",
+    "request_priority",
+]
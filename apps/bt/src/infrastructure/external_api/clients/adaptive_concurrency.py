@@ -0,0 +1,106 @@
+"""
+Adaptive (AIMD) Concurrency Limiter
+
+JQuants API への同時リクエスト数を、観測したレイテンシとスロットリング応答から
+加算増加・乗算減少 (AIMD) で調整する。
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from src.infrastructure.external_api.clients.rate_limiter import (
+    RequestPriority,
+    current_request_priority,
+)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 同時実行数リミッター
+
+    - 成功かつレイテンシが目標以下: 1 ウィンドウ（現在の上限件数）ごとに上限 +1
+    - レイテンシが目標超過: 上限を ``latency_backoff`` 倍
+    - 429 / 5xx / タイムアウト: 上限を ``throttle_backoff`` 倍
+
+    ``"interactive"`` 優先度のリクエストは上限に関係なく即座にスロットを得るため、
+    バルク同期で上限が埋まっていても待たされない。
+
+    Args:
+        plan: JQuants プラン名 ("free", "light", "standard", "premium")
+        latency_target: 増加を許すレスポンス時間の上限（秒）
+    """
+
+    PLAN_MAX_CONCURRENCY: dict[str, int] = {
+        "free": 1,
+        "light": 2,
+        "standard": 4,
+        "premium": 8,
+    }
+
+    def __init__(
+        self,
+        plan: str = "free",
+        *,
+        latency_target: float = 2.0,
+        latency_backoff: float = 0.9,
+        throttle_backoff: float = 0.5,
+    ) -> None:
+        self._max_limit = float(self.PLAN_MAX_CONCURRENCY.get(plan, 1))
+        self._limit = 1.0
+        self._latency_target = latency_target
+        self._latency_backoff = latency_backoff
+        self._throttle_backoff = throttle_backoff
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """現在のバルクリクエスト同時実行上限"""
+        return max(int(self._limit), 1)
+
+    @property
+    def max_limit(self) -> int:
+        """プランで許す同時実行上限"""
+        return int(self._max_limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority | None = None) -> AsyncIterator[None]:
+        """同時実行スロットを確保して HTTP 呼び出しを囲む。"""
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: (priority or current_request_priority()) == "interactive"
+                or self._in_flight < self.limit
+            )
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    async def reprioritize(self) -> None:
+        """優先度が引き上げられた待機者に上限の適用を再評価させる。"""
+        async with self._condition:
+            self._condition.notify_all()
+
+    def record_success(self, latency: float) -> None:
+        """成功応答のレイテンシを反映する。"""
+        if latency > self._latency_target:
+            self._decrease(self._latency_backoff)
+            return
+        # 待機者はスロット解放時の notify で新しい上限を再評価する
+        self._limit = min(self._max_limit, self._limit + 1.0 / self.limit)
+
+    def record_throttled(self) -> None:
+        """429 / 5xx / タイムアウトを反映する。"""
+        self._decrease(self._throttle_backoff)
+
+    def _decrease(self, factor: float) -> None:
+        self._limit = max(1.0, self._limit * factor)
@@ -2,25 +2,50 @@
 JQuants Async API Client
 
 JQuants API v2 への非同期 HTTP クライアント。
-レートリミッター、指数バックオフリトライ、ページネーションを内蔵。
+優先度付きレートリミッター、AIMD 同時実行制御、同一リクエストの合流、
+指数バックオフリトライ、ページネーションを内蔵。
 """
 
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
+import copy
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
 import math
-from typing import Any, Protocol
+import time
+from typing import Any, Protocol, TypeVar
 
 import httpx
 from loguru import logger
 
-from src.infrastructure.external_api.clients.rate_limiter import RateLimiter
+from src.infrastructure.external_api.clients.adaptive_concurrency import (
+    AdaptiveConcurrencyLimiter,
+)
+from src.infrastructure.external_api.clients.rate_limiter import (
+    RateLimiter,
+    SharedRequestPriority,
+    current_request_priority,
+    shared_request_priority,
+)
 from src.shared.config.reliability import JQUANTS_RETRY_POLICY
 from src.shared.observability.correlation import get_correlation_id
 from src.shared.observability.metrics import metrics_recorder
 
+_T = TypeVar("_T")
+_RequestKey = tuple[str, str, tuple[tuple[str, str], ...]]
+
+
+@dataclass(slots=True)
+class _InFlightRequest:
+    """合流中のリクエスト（共有フェッチ・最高優先度・呼び出し元数）"""
+
+    future: asyncio.Future[Any]
+    priority: SharedRequestPriority
+    callers: int = 0
+
 
 class JQuantsApiError(Exception):
     """JQuants API 呼び出しエラー（HTTP エラー / タイムアウト / 接続エラー）"""
@@ -53,6 +78,12 @@ class JQuantsAsyncClient:
         api_key: JQuants API キー
         plan: JQuants プラン名 ("free", "light", "standard", "premium")
         timeout: リクエストタイムアウト（秒）
+        transport: HTTP トランスポート（ローカルの fake server を使うテスト向け）
+
+    リクエスト優先度は ``request_priority()`` で設定したコンテキストから決まり、
+    既定は ``"interactive"``。同一パス・同一パラメータの呼び出しが実行中なら
+    新たに発行せず結果を共有する（共有フェッチは待機者のうち最も高い優先度で
+    実行し、結果は呼び出し元ごとに独立したコピーを返す）。
     """
 
     MAX_RETRIES = JQUANTS_RETRY_POLICY.max_retries
@@ -79,6 +110,8 @@ class JQuantsAsyncClient:
         api_key: str,
         plan: str = "free",
         timeout: float = 30.0,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         self._api_key = api_key
         self._plan = plan.strip().lower()
@@ -86,8 +119,11 @@ class JQuantsAsyncClient:
             base_url=self.BASE_URL,
             headers={"x-api-key": api_key},
             timeout=timeout,
+            transport=transport,
         )
         self._rate_limiter = RateLimiter(plan=self._plan)
+        self._concurrency = AdaptiveConcurrencyLimiter(plan=self._plan)
+        self._in_flight_requests: dict[_RequestKey, _InFlightRequest] = {}
 
     @property
     def has_api_key(self) -> bool:
@@ -106,6 +142,47 @@ class JQuantsAsyncClient:
     def plan(self) -> str:
         return self._plan
 
+    @property
+    def max_concurrency(self) -> int:
+        """プランで許す同時リクエスト数（同期処理の先読み幅の目安）"""
+        return self._concurrency.max_limit
+
+    @staticmethod
+    def _request_key(kind: str, path: str, params: dict[str, Any] | None) -> _RequestKey:
+        items = tuple(sorted((str(key), str(value)) for key, value in (params or {}).items()))
+        return kind, path, items
+
+    async def _coalesced(
+        self,
+        key: _RequestKey,
+        factory: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """実行中の同一リクエストがあれば、その結果を待って共有する。
+
+        共有フェッチは最初の呼び出し元のコンテキストで始まるため、より高い優先度の
+        呼び出し元が合流したら共有フェッチの優先度を引き上げる。複数の呼び出し元が
+        合流した結果は、ネストしたリストを共有しないよう呼び出し元ごとに深くコピーする。
+        """
+        priority = current_request_priority()
+        request = self._in_flight_requests.get(key)
+        if request is None:
+            shared = SharedRequestPriority(priority)
+            with shared_request_priority(shared):
+                future = asyncio.ensure_future(factory())
+            request = _InFlightRequest(future=future, priority=shared)
+            self._in_flight_requests[key] = request
+            future.add_done_callback(lambda _done: self._in_flight_requests.pop(key, None))
+        elif request.priority.raise_to(priority):
+            self._rate_limiter.reprioritize()
+            await self._concurrency.reprioritize()
+        request.callers += 1
+        # 1 呼び出し元のキャンセルで他の待機者の結果を失わない
+        result: _T = await asyncio.shield(request.future)
+        # 完了時に登録解除されるため、ここでの呼び出し元数は確定している
+        if request.callers > 1:
+            return copy.deepcopy(result)
+        return result
+
     async def _get_with_retry(
         self, path: str, params: dict[str, Any] | None = None
     ) -> httpx.Response:
@@ -113,6 +190,7 @@ class JQuantsAsyncClient:
         last_exc: Exception | None = None
         for attempt in range(self.MAX_RETRIES + 1):
             try:
+                # 優先度は合流による引き上げを反映するためコンテキストから都度解決する
                 await self._rate_limiter.acquire()
                 metrics_recorder.record_jquants_fetch(path)
                 logger.info(
@@ -123,7 +201,17 @@ class JQuantsAsyncClient:
                     maxRetries=self.MAX_RETRIES,
                     correlationId=get_correlation_id(),
                 )
-                resp = await self._client.get(path, params=params)
+                async with self._concurrency.slot():
+                    started = time.monotonic()
+                    try:
+                        resp = await self._client.get(path, params=params)
+                    except httpx.TimeoutException:
+                        self._concurrency.record_throttled()
+                        raise
+                if resp.status_code in self.RETRY_STATUSES:
+                    self._concurrency.record_throttled()
+                else:
+                    self._concurrency.record_success(time.monotonic() - started)
                 if resp.status_code == 429:
                     wait = self._retry_after_seconds(resp)
                     await self._rate_limiter.defer(
@@ -205,6 +293,13 @@ class JQuantsAsyncClient:
 
     async def get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """単一ページ GET リクエスト"""
+        result = await self._coalesced(
+            self._request_key("get", path, params),
+            lambda: self._get_body(path, params),
+        )
+        return result
+
+    async def _get_body(self, path: str, params: dict[str, Any] | None) -> dict[str, Any]:
         try:
             resp = await self._get_with_retry(path, params)
         except httpx.HTTPStatusError as exc:
@@ -247,6 +342,15 @@ class JQuantsAsyncClient:
 
         JQuants v2 の pagination_key ベースのページネーションを処理する。
         """
+        data, page_count = await self._coalesced(
+            self._request_key(f"paginated:{max_pages}", path, params),
+            lambda: self._get_all_pages(path, params, max_pages),
+        )
+        return data, page_count
+
+    async def _get_all_pages(
+        self, path: str, params: dict[str, Any] | None, max_pages: int
+    ) -> tuple[list[dict[str, Any]], int]:
         all_data: list[dict[str, Any]] = []
         current_params = dict(params) if params else {}
         page_count = 0
@@ -0,0 +1,318 @@
+"""Local columnar cache for moomoo OpenD US candlestick history.
+
+Normalized history rows are stored per ``(code, timeframe)`` as a Parquet file
+(written through DuckDB) with a small JSON sidecar describing the cached
+window. The quote client serves covered ranges from this cache and only asks
+OpenD for the missing tail, starting from the last settled cached session so
+the still-forming bar is replaced. Rows are forward adjusted (QFQ): when the
+re-fetched settled bar no longer matches the cached one, a split or dividend
+has moved the adjustment basis and the whole window is fetched again.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable
+
+import duckdb
+import pandas as pd
+from loguru import logger
+
+HISTORY_CACHE_SCHEMA_VERSION = 2
+
+_PRICE_COLUMNS = ("open", "high", "low", "close")
+_ADJUSTMENT_TOLERANCE = 1e-6
+
+_HISTORY_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("code", "VARCHAR"),
+    ("timeKey", "VARCHAR"),
+    ("name", "VARCHAR"),
+    ("open", "DOUBLE"),
+    ("close", "DOUBLE"),
+    ("high", "DOUBLE"),
+    ("low", "DOUBLE"),
+    ("volume", "DOUBLE"),
+    ("turnover", "DOUBLE"),
+    ("peRatio", "DOUBLE"),
+    ("turnoverRate", "DOUBLE"),
+    ("changeRate", "DOUBLE"),
+    ("lastClose", "DOUBLE"),
+)
+
+
+def _session_date(time_key: str) -> str:
+    return time_key[:10]
+
+
+@dataclass(frozen=True)
+class MoomooHistoryCacheEntry:
+    """Cached history window for one code and timeframe.
+
+    ``rows`` are sorted by ``timeKey`` and contiguous from ``coverage_start``
+    through the last row. ``coverage_end`` is the ``end`` bound of the last
+    fetch (``None`` when it ran to the latest bar). ``truncated`` marks that
+    the last fetch stopped at the row limit, so the tail is known to be
+    incomplete.
+    """
+
+    rows: tuple[dict[str, Any], ...]
+    coverage_start: str
+    refreshed_at: float
+    truncated: bool = False
+    coverage_end: str | None = None
+
+    @property
+    def last_date(self) -> str | None:
+        if not self.rows:
+            return None
+        return _session_date(str(self.rows[-1]["timeKey"]))
+
+    @property
+    def anchor_date(self) -> str | None:
+        """Session of the last settled bar; tail fetches start here to overlap the cache."""
+        if not self.rows:
+            return None
+        anchor = self.rows[-2:][0]
+        return _session_date(str(anchor["timeKey"]))
+
+    def covers(self, start: str | None) -> bool:
+        """Return whether a request starting at ``start`` is inside the cache.
+
+        A request without ``start`` is served from the cached window start.
+        """
+        if not self.rows:
+            return False
+        return start is None or start >= self.coverage_start
+
+    def covers_end(self, end: str | None) -> bool:
+        """Return whether the last fetch reached ``end`` (``None`` = latest bar)."""
+        if self.coverage_end is None:
+            return True
+        return end is not None and end <= self.coverage_end
+
+    def select(self, start: str | None, end: str | None) -> list[dict[str, Any]]:
+        selected: list[dict[str, Any]] = []
+        for row in self.rows:
+            session = _session_date(str(row["timeKey"]))
+            if start is not None and session < start:
+                continue
+            if end is not None and session > end:
+                break
+            selected.append(dict(row))
+        return selected
+
+
+def _prices_match(cached: dict[str, Any], fetched: dict[str, Any]) -> bool:
+    for column in _PRICE_COLUMNS:
+        cached_value, fetched_value = cached.get(column), fetched.get(column)
+        if cached_value is None or fetched_value is None:
+            if cached_value is not fetched_value:
+                return False
+            continue
+        scale = max(abs(float(cached_value)), abs(float(fetched_value)), 1.0)
+        if abs(float(cached_value) - float(fetched_value)) > _ADJUSTMENT_TOLERANCE * scale:
+            return False
+    return True
+
+
+def tail_matches_adjustment_basis(
+    rows: tuple[dict[str, Any], ...] | list[dict[str, Any]],
+    tail_rows: list[dict[str, Any]],
+) -> bool:
+    """Return whether the overlapping settled bar is unchanged in the fresh tail.
+
+    Only rows before the last cached row are compared; the last one may still
+    have been forming when it was cached.
+    """
+    if len(rows) < 2 or not tail_rows:
+        return True
+    settled = {str(row["timeKey"]): row for row in rows[:-1]}
+    overlapping = [row for row in tail_rows if str(row["timeKey"]) in settled]
+    if not overlapping:
+        return False
+    return all(_prices_match(settled[str(row["timeKey"])], row) for row in overlapping)
+
+
+def merge_history_tail(
+    rows: tuple[dict[str, Any], ...] | list[dict[str, Any]],
+    tail_rows: list[dict[str, Any]],
+    tail_start: str,
+) -> list[dict[str, Any]]:
+    """Replace cached rows from ``tail_start`` onward with freshly fetched rows."""
+    if not tail_rows:
+        return list(rows)
+    kept = [row for row in rows if _session_date(str(row["timeKey"])) < tail_start]
+    by_time_key = {str(row["timeKey"]): row for row in tail_rows}
+    return kept + [by_time_key[key] for key in sorted(by_time_key)]
+
+
+class MoomooHistoryCache:
+    """Process-wide, disk-backed cache of normalized OpenD history rows."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        *,
+        tail_refresh_interval_seconds: float = 60.0,
+        max_memory_entries: int = 64,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._tail_refresh_interval_seconds = tail_refresh_interval_seconds
+        self._max_memory_entries = max_memory_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._key_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._memory: OrderedDict[tuple[str, str], MoomooHistoryCacheEntry] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "cacheDir": str(self._cache_dir),
+                "memoryEntries": len(self._memory),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def key_lock(self, code: str, timeframe: str) -> threading.Lock:
+        """Return the lock serializing fetches for one code and timeframe."""
+        with self._lock:
+            return self._key_locks.setdefault((code, timeframe), threading.Lock())
+
+    def is_fresh(self, entry: MoomooHistoryCacheEntry, end: str | None = None) -> bool:
+        """Return whether the tail up to ``end`` was refreshed recently enough to skip OpenD."""
+        if entry.truncated or not entry.covers_end(end):
+            return False
+        return self._clock() - entry.refreshed_at < self._tail_refresh_interval_seconds
+
+    def get(self, code: str, timeframe: str) -> MoomooHistoryCacheEntry | None:
+        key = (code, timeframe)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                return entry
+        entry = self._read(code, timeframe)
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._remember(key, entry)
+        return entry
+
+    def put(
+        self,
+        code: str,
+        timeframe: str,
+        rows: list[dict[str, Any]],
+        *,
+        coverage_start: str,
+        coverage_end: str | None = None,
+        truncated: bool = False,
+    ) -> MoomooHistoryCacheEntry:
+        entry = MoomooHistoryCacheEntry(
+            rows=tuple(rows),
+            coverage_start=coverage_start,
+            refreshed_at=self._clock(),
+            truncated=truncated,
+            coverage_end=coverage_end,
+        )
+        try:
+            self._write(code, timeframe, entry)
+        except Exception as exc:
+            logger.warning(f"moomoo history cache write failed ({code} {timeframe}): {exc}")
+        with self._lock:
+            self._remember((code, timeframe), entry)
+        return entry
+
+    def clear(self) -> None:
+        """Drop the in-memory layer; on-disk files are kept."""
+        with self._lock:
+            self._memory.clear()
+
+    def _remember(self, key: tuple[str, str], entry: MoomooHistoryCacheEntry) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _paths(self, code: str, timeframe: str) -> tuple[Path, Path]:
+        directory = self._cache_dir / timeframe
+        file_stem = code.replace("/", "_").replace("\\", "_")
+        return directory / f"{file_stem}.parquet", directory / f"{file_stem}.json"
+
+    def _read(self, code: str, timeframe: str) -> MoomooHistoryCacheEntry | None:
+        data_path, meta_path = self._paths(code, timeframe)
+        if not data_path.exists() or not meta_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("schemaVersion") != HISTORY_CACHE_SCHEMA_VERSION:
+                return None
+            columns = ", ".join(f'"{name}"' for name, _ in _HISTORY_COLUMNS)
+            with duckdb.connect() as conn:
+                cursor = conn.execute(
+                    f'SELECT {columns} FROM read_parquet(?) ORDER BY "timeKey"',
+                    [str(data_path)],
+                )
+                names = [name for name, _ in _HISTORY_COLUMNS]
+                rows = [dict(zip(names, values, strict=True)) for values in cursor.fetchall()]
+            return MoomooHistoryCacheEntry(
+                rows=tuple(rows),
+                coverage_start=str(meta["coverageStart"]),
+                refreshed_at=float(meta["refreshedAt"]),
+                truncated=bool(meta.get("truncated", False)),
+                coverage_end=meta.get("coverageEnd"),
+            )
+        except Exception as exc:
+            logger.warning(f"moomoo history cache read failed ({code} {timeframe}): {exc}")
+            return None
+
+    def _write(self, code: str, timeframe: str, entry: MoomooHistoryCacheEntry) -> None:
+        data_path, meta_path = self._paths(code, timeframe)
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_data_path = data_path.with_name(f"{data_path.name}.tmp")
+        column_defs = ", ".join(f'"{name}" {sql_type}' for name, sql_type in _HISTORY_COLUMNS)
+        escaped = str(tmp_data_path).replace("'", "''")
+        with duckdb.connect() as conn:
+            conn.execute(f"CREATE TEMP TABLE history ({column_defs})")
+            if entry.rows:
+                names = [name for name, _ in _HISTORY_COLUMNS]
+                frame = pd.DataFrame.from_records(
+                    [[row.get(name) for name in names] for row in entry.rows],
+                    columns=names,
+                )
+                conn.register("incoming_history", frame)
+                conn.execute("INSERT INTO history SELECT * FROM incoming_history")
+            conn.execute(f"COPY (SELECT * FROM history ORDER BY \"timeKey\") TO '{escaped}' (FORMAT PARQUET)")
+        tmp_data_path.replace(data_path)
+        tmp_meta_path = meta_path.with_name(f"{meta_path.name}.tmp")
+        tmp_meta_path.write_text(
+            json.dumps(
+                {
+                    "schemaVersion": HISTORY_CACHE_SCHEMA_VERSION,
+                    "code": code,
+                    "timeframe": timeframe,
+                    "coverageStart": entry.coverage_start,
+                    "coverageEnd": entry.coverage_end,
+                    "refreshedAt": entry.refreshed_at,
+                    "truncated": entry.truncated,
+                    "rowCount": len(entry.rows),
+                }
+            ),
+            encoding="utf-8",
+        )
+        tmp_meta_path.replace(meta_path)
@@ -9,10 +9,19 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import UTC, datetime
 import importlib
-from typing import Any, Callable
+from typing import Any, Callable, Literal
 
 from loguru import logger
 
+from src.infrastructure.external_api.clients.moomoo_history_cache import (
+    MoomooHistoryCache,
+    merge_history_tail,
+    tail_matches_adjustment_basis,
+)
+from src.infrastructure.external_api.clients.moomoo_quote_context_pool import (
+    MoomooQuoteContextPool,
+    MoomooQuoteContextPoolError,
+)
 from src.shared.observability.correlation import get_correlation_id
 from src.shared.utils.pandas_type_guards import records_with_str_keys
 
@@ -35,6 +44,18 @@ class MoomooOpenDConfig:
     is_encrypt: bool
     enabled: bool
     max_history_rows: int
+    context_pool_size: int = 2
+    context_health_check_interval_seconds: float = 30.0
+    history_cache_dir: str | None = None
+    history_tail_refresh_interval_seconds: float = 60.0
+
+
+MoomooHistoryTimeframe = Literal["1d", "1m"]
+
+_KLINE_TYPE_NAMES: dict[str, str] = {
+    "1d": "K_DAY",
+    "1m": "K_1M",
+}
 
 
 def _now_iso() -> str:
@@ -133,10 +154,27 @@ def _dataframe_records(data: Any) -> list[dict[str, Any]]:
 class MoomooQuoteClient:
     """Thin, read-only wrapper around moomoo OpenD quote APIs."""
 
-    def __init__(self, config: MoomooOpenDConfig) -> None:
+    def __init__(
+        self,
+        config: MoomooOpenDConfig,
+        *,
+        history_cache: MoomooHistoryCache | None = None,
+    ) -> None:
         self._config = config
         self._sdk: Any | None = None
         self._sdk_import_error: str | None = None
+        self._context_pool = MoomooQuoteContextPool(
+            self._open_quote_context,
+            health_check=self._quote_context_is_healthy,
+            max_size=config.context_pool_size,
+            health_check_interval_seconds=config.context_health_check_interval_seconds,
+        )
+        if history_cache is None and config.history_cache_dir:
+            history_cache = MoomooHistoryCache(
+                config.history_cache_dir,
+                tail_refresh_interval_seconds=config.history_tail_refresh_interval_seconds,
+            )
+        self._history_cache = history_cache
 
     @property
     def config(self) -> MoomooOpenDConfig:
@@ -170,15 +208,26 @@ class MoomooQuoteClient:
         except Exception as exc:
             raise MoomooOpenDError(503, f"moomoo OpenD is not reachable: {exc}") from exc
 
+    def _quote_context_is_healthy(self, quote_ctx: Any) -> bool:
+        get_global_state = getattr(quote_ctx, "get_global_state", None)
+        if get_global_state is None:
+            return True
+        ret, _data = get_global_state()
+        return ret == getattr(self._load_sdk(), "RET_OK", 0)
+
     def _with_quote_context(self, operation: Callable[[Any, Any], Any]) -> Any:
         sdk = self._load_sdk()
-        quote_ctx = self._open_quote_context()
+        if not self._config.enabled:
+            raise MoomooOpenDError(503, "moomoo OpenD integration is disabled")
         try:
-            return operation(sdk, quote_ctx)
-        finally:
-            close = getattr(quote_ctx, "close", None)
-            if callable(close):
-                close()
+            with self._context_pool.lease() as quote_ctx:
+                return operation(sdk, quote_ctx)
+        except MoomooQuoteContextPoolError as exc:
+            raise MoomooOpenDError(503, str(exc)) from exc
+
+    def close(self) -> None:
+        """Close pooled quote contexts."""
+        self._context_pool.close()
 
     @staticmethod
     def _ensure_ret_ok(sdk: Any, ret: Any, data: Any, operation: str) -> None:
@@ -201,10 +250,7 @@ class MoomooQuoteClient:
 
         if sdk_installed and self._config.enabled:
             try:
-                quote_ctx = self._open_quote_context()
-                close = getattr(quote_ctx, "close", None)
-                if callable(close):
-                    close()
+                self._with_quote_context(lambda _sdk, _quote_ctx: None)
                 open_d_reachable = True
                 quote_context_ready = True
             except MoomooOpenDError as exc:
@@ -276,10 +322,100 @@ class MoomooQuoteClient:
         start: str | None,
         end: str | None,
         max_rows: int | None = None,
+        timeframe: MoomooHistoryTimeframe = "1d",
     ) -> dict[str, Any]:
         code = normalize_us_code(symbol)
+        if timeframe not in _KLINE_TYPE_NAMES:
+            raise MoomooOpenDError(422, f"Unsupported timeframe: {timeframe}")
         row_limit = min(max_rows or self._config.max_history_rows, self._config.max_history_rows)
 
+        if self._history_cache is None:
+            rows, has_more = self._fetch_history_rows(code, timeframe, start, end, row_limit)
+        else:
+            rows, has_more = self._cached_history_rows(code, timeframe, start, end, row_limit)
+        return {
+            "symbol": symbol_from_us_code(code),
+            "code": code,
+            "timeframe": timeframe,
+            "adjustment": "qfq",
+            "rows": rows,
+            "count": len(rows),
+            "hasMore": has_more,
+            "lastUpdated": _now_iso(),
+        }
+
+    def _cached_history_rows(
+        self,
+        code: str,
+        timeframe: MoomooHistoryTimeframe,
+        start: str | None,
+        end: str | None,
+        row_limit: int,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        cache = self._history_cache
+        assert cache is not None
+        with cache.key_lock(code, timeframe):
+            entry = cache.get(code, timeframe)
+            if entry is None or not entry.covers(start):
+                rows, has_more = self._fetch_history_rows(code, timeframe, start, end, row_limit)
+                if rows:
+                    cache.put(
+                        code,
+                        timeframe,
+                        rows,
+                        coverage_start=start or str(rows[0]["timeKey"])[:10],
+                        coverage_end=end,
+                        truncated=has_more,
+                    )
+                return rows, has_more
+
+            tail_has_more = False
+            last_date = entry.last_date
+            anchor_date = entry.anchor_date
+            assert last_date is not None and anchor_date is not None
+            if (end is None or end >= last_date) and not cache.is_fresh(entry, end):
+                tail_rows, tail_has_more = self._fetch_history_rows(
+                    code, timeframe, anchor_date, end, row_limit
+                )
+                if tail_matches_adjustment_basis(entry.rows, tail_rows):
+                    merged_rows = merge_history_tail(entry.rows, tail_rows, anchor_date)
+                else:
+                    # A split or dividend moved the QFQ basis: refetch the cached window.
+                    logger.info(
+                        "moomoo US history adjustment basis changed; refetching cached window",
+                        event="moomoo_history_cache_rebased",
+                        symbol=code,
+                        timeframe=timeframe,
+                    )
+                    merged_rows, tail_has_more = self._fetch_history_rows(
+                        code, timeframe, entry.coverage_start, end, row_limit
+                    )
+                entry = cache.put(
+                    code,
+                    timeframe,
+                    merged_rows,
+                    coverage_start=entry.coverage_start,
+                    coverage_end=end,
+                    truncated=tail_has_more,
+                )
+            else:
+                logger.debug(
+                    "moomoo US history cache hit",
+                    event="moomoo_history_cache_hit",
+                    symbol=code,
+                    timeframe=timeframe,
+                )
+        selected = entry.select(start, end)
+        return selected[:row_limit], tail_has_more or len(selected) > row_limit
+
+    def _fetch_history_rows(
+        self,
+        code: str,
+        timeframe: MoomooHistoryTimeframe,
+        start: str | None,
+        end: str | None,
+        row_limit: int,
+    ) -> tuple[list[dict[str, Any]], bool]:
         def operation(sdk: Any, quote_ctx: Any) -> tuple[list[dict[str, Any]], bool]:
             rows: list[dict[str, Any]] = []
             page_req_key = None
@@ -289,7 +425,7 @@ class MoomooQuoteClient:
                     code,
                     start=start,
                     end=end,
-                    ktype=sdk.KLType.K_DAY,
+                    ktype=getattr(sdk.KLType, _KLINE_TYPE_NAMES[timeframe]),
                     autype=sdk.AuType.QFQ,
                     max_count=min(1000, row_limit - len(rows)),
                     page_req_key=page_req_key,
@@ -309,6 +445,9 @@ class MoomooQuoteClient:
             event="moomoo_opend_fetch",
             endpoint="request_history_kline",
             symbol=code,
+            timeframe=timeframe,
+            start=start,
+            end=end,
             correlationId=get_correlation_id(),
         )
         rows, has_more = self._with_quote_context(operation)
@@ -330,16 +469,7 @@ class MoomooQuoteClient:
             }
             for row in rows
         ]
-        return {
-            "symbol": symbol_from_us_code(code),
-            "code": code,
-            "timeframe": "1d",
-            "adjustment": "qfq",
-            "rows": normalized_rows,
-            "count": len(normalized_rows),
-            "hasMore": has_more,
-            "lastUpdated": _now_iso(),
-        }
+        return normalized_rows, has_more
 
     def get_us_snapshot(self, symbols: list[str]) -> dict[str, Any]:
         codes = [normalize_us_code(symbol) for symbol in symbols]
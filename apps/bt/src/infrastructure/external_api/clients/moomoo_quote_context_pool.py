@@ -0,0 +1,222 @@
+"""Long-lived moomoo OpenD quote context pool.
+
+Opening an ``OpenQuoteContext`` performs a full OpenD handshake, so the quote
+client keeps a small pool of contexts alive across calls. Idle contexts are
+health-checked before reuse, broken contexts are discarded, and reconnect
+attempts after a failed open are gated by exponential backoff so a down OpenD
+does not get hammered by every chart request.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+from loguru import logger
+
+
+class MoomooQuoteContextPoolError(Exception):
+    """Raised when no quote context can be leased from the pool."""
+
+
+@dataclass
+class _IdleContext:
+    context: Any
+    checked_at: float
+
+
+def is_transport_error(exc: BaseException) -> bool:
+    """Return whether ``exc`` indicates a broken OpenD connection.
+
+    Socket/timeout errors and interruptions (which may leave a request half
+    written) break the context; OpenD errors for bad input leave it usable.
+    """
+    return isinstance(exc, (OSError, EOFError)) or not isinstance(exc, Exception)
+
+
+def _close_quietly(context: Any) -> None:
+    close = getattr(context, "close", None)
+    if not callable(close):
+        return
+    try:
+        close()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.debug(f"moomoo quote context close failed: {exc}")
+
+
+class MoomooQuoteContextPool:
+    """Thread-safe pool of reusable OpenD quote contexts.
+
+    ``factory`` opens a new context and may raise; ``health_check`` returns
+    ``False`` when an idle context is no longer usable. Contexts are leased via
+    :meth:`lease`; a context whose operation failed with a transport error
+    (see ``is_broken_error``) is closed instead of being returned, so a
+    half-broken connection is never handed out twice. Other errors return the
+    context to the pool but force a health check before its next lease.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        *,
+        health_check: Callable[[Any], bool] | None = None,
+        is_broken_error: Callable[[BaseException], bool] = is_transport_error,
+        max_size: int = 2,
+        health_check_interval_seconds: float = 30.0,
+        acquire_timeout_seconds: float = 30.0,
+        backoff_initial_seconds: float = 0.5,
+        backoff_max_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self._factory = factory
+        self._health_check = health_check
+        self._is_broken_error = is_broken_error
+        self._max_size = max_size
+        self._health_check_interval_seconds = health_check_interval_seconds
+        self._acquire_timeout_seconds = acquire_timeout_seconds
+        self._backoff_initial_seconds = backoff_initial_seconds
+        self._backoff_max_seconds = backoff_max_seconds
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._idle: list[_IdleContext] = []
+        self._closed = False
+        self._backoff_seconds = 0.0
+        self._next_connect_at = 0.0
+        self._last_connect_error: Exception | None = None
+
+        self._opened = 0
+        self._reused = 0
+        self._discarded = 0
+        self._connect_failures = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool counters for status reporting."""
+        with self._lock:
+            return {
+                "maxSize": self._max_size,
+                "idle": len(self._idle),
+                "opened": self._opened,
+                "reused": self._reused,
+                "discarded": self._discarded,
+                "connectFailures": self._connect_failures,
+                "backoffSeconds": self._backoff_seconds,
+            }
+
+    @contextmanager
+    def lease(self) -> Iterator[Any]:
+        """Lease a healthy quote context for the duration of the block."""
+        if not self._slots.acquire(timeout=self._acquire_timeout_seconds):
+            raise MoomooQuoteContextPoolError("timed out waiting for a moomoo quote context")
+        try:
+            context = self._checkout()
+            try:
+                yield context
+            except BaseException as exc:
+                if self._is_broken_error(exc):
+                    self._discard(context)
+                else:
+                    self._checkin(context, verified=False)
+                raise
+            else:
+                self._checkin(context)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Close every idle context and refuse further leases."""
+        with self._lock:
+            self._closed = True
+            idle = self._idle
+            self._idle = []
+        for entry in idle:
+            _close_quietly(entry.context)
+
+    def invalidate(self) -> None:
+        """Drop idle contexts so the next lease reconnects."""
+        with self._lock:
+            idle = self._idle
+            self._idle = []
+            self._discarded += len(idle)
+        for entry in idle:
+            _close_quietly(entry.context)
+
+    def _checkout(self) -> Any:
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise MoomooQuoteContextPoolError("moomoo quote context pool is closed")
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                return self._connect()
+            if self._is_fresh(entry) or self._passes_health_check(entry.context):
+                with self._lock:
+                    self._reused += 1
+                return entry.context
+            logger.info(
+                "moomoo quote context failed health check; reconnecting",
+                event="moomoo_opend_context_unhealthy",
+            )
+            self._discard(entry.context)
+
+    def _is_fresh(self, entry: _IdleContext) -> bool:
+        return self._clock() - entry.checked_at < self._health_check_interval_seconds
+
+    def _passes_health_check(self, context: Any) -> bool:
+        if self._health_check is None:
+            return True
+        try:
+            return bool(self._health_check(context))
+        except Exception:
+            return False
+
+    def _connect(self) -> Any:
+        with self._lock:
+            now = self._clock()
+            if now < self._next_connect_at and self._last_connect_error is not None:
+                remaining = self._next_connect_at - now
+                raise MoomooQuoteContextPoolError(
+                    f"{self._last_connect_error} (reconnect backoff {remaining:.1f}s)"
+                )
+        try:
+            context = self._factory()
+        except Exception as exc:
+            with self._lock:
+                self._connect_failures += 1
+                self._backoff_seconds = min(
+                    self._backoff_max_seconds,
+                    max(self._backoff_initial_seconds, self._backoff_seconds * 2),
+                )
+                self._next_connect_at = self._clock() + self._backoff_seconds
+                self._last_connect_error = exc
+            raise
+        with self._lock:
+            self._opened += 1
+            self._backoff_seconds = 0.0
+            self._next_connect_at = 0.0
+            self._last_connect_error = None
+        return context
+
+    def _checkin(self, context: Any, *, verified: bool = True) -> None:
+        # Unverified contexts are health-checked on their next lease.
+        checked_at = self._clock() if verified else float("-inf")
+        with self._lock:
+            if not self._closed and len(self._idle) < self._max_size:
+                self._idle.append(_IdleContext(context=context, checked_at=checked_at))
+                return
+        _close_quietly(context)
+
+    def _discard(self, context: Any) -> None:
+        with self._lock:
+            self._discarded += 1
+        _close_quietly(context)
@@ -1,5 +1,5 @@
 """
-Async FIFO Rate Limiter
+Async Priority Token-Bucket Rate Limiter
 
 JQuants API プランベースのレート制限を非同期で制御する。
 """
@@ -7,14 +7,84 @@ JQuants API プランベースのレート制限を非同期で制御する。
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Literal
+
+RequestPriority = Literal["interactive", "bulk"]
+
+# 値が小さいほど先に処理される
+_PRIORITY_RANKS: dict[RequestPriority, int] = {"interactive": 0, "bulk": 1}
+
+# 補充計算の丸め誤差で微小な待機を繰り返さないための許容誤差（トークン）
+_TOKEN_EPSILON = 1e-9
+
+_request_priority: ContextVar[RequestPriority] = ContextVar(
+    "jquants_request_priority", default="interactive"
+)
+
+
+class SharedRequestPriority:
+    """合流した呼び出し元のうち最も高い優先度（共有フェッチの実行中に引き上げ可能）"""
+
+    def __init__(self, priority: RequestPriority) -> None:
+        self.priority: RequestPriority = priority
+
+    def raise_to(self, priority: RequestPriority) -> bool:
+        """``priority`` の方が高ければ引き上げ、引き上げたかを返す。"""
+        if _PRIORITY_RANKS[priority] >= _PRIORITY_RANKS[self.priority]:
+            return False
+        self.priority = priority
+        return True
+
+
+_shared_request_priority: ContextVar[SharedRequestPriority | None] = ContextVar(
+    "jquants_shared_request_priority", default=None
+)
+
+
+def current_request_priority() -> RequestPriority:
+    """現在のコンテキストの JQuants リクエスト優先度を返す。"""
+    shared = _shared_request_priority.get()
+    if shared is not None:
+        return shared.priority
+    return _request_priority.get()
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """ブロック内（および生成したタスク）の JQuants リクエスト優先度を設定する。
+
+    バルク同期は ``"bulk"`` で実行し、プロキシ等の対話的な呼び出しより後に回す。
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+@contextmanager
+def shared_request_priority(shared: SharedRequestPriority) -> Iterator[None]:
+    """ブロック内で生成したタスクの優先度を ``shared`` の現在値に追従させる。"""
+    token = _shared_request_priority.set(shared)
+    try:
+        yield
+    finally:
+        _shared_request_priority.reset(token)
 
 
 class RateLimiter:
-    """非同期 FIFO レートリミッター
+    """非同期優先度付きトークンバケット・レートリミッター
 
-    プランベースの RPM 制限を asyncio.Lock で直列化し、
-    最小インターバルを遵守する。
+    プランベースの RPM（10% safety margin）でトークンを補充し、
+    アイドル後はプランの許容範囲内でバーストを許す。待機中のリクエストは
+    優先度順（同一優先度内は FIFO）にトークンを取得するため、
+    バルク同期が対話的な呼び出しを飢餓させない。
 
     Args:
         plan: JQuants プラン名 ("free", "light", "standard", "premium")
@@ -27,34 +97,92 @@ class RateLimiter:
         "premium": 500,
     }
 
+    # 任意の60秒窓で RPM を超えない最大バースト
+    # (burst + floor(60 / interval) <= RPM, interval = 60 / RPM * 1.1)
+    PLAN_BURSTS: dict[str, int] = {
+        "free": 1,
+        "light": 5,
+        "standard": 10,
+        "premium": 45,
+    }
+
     def __init__(self, plan: str = "free") -> None:
         rpm = self.PLAN_LIMITS.get(plan, 5)
         # 10% safety margin
         self._interval: float = (60.0 / rpm) * 1.1
-        self._lock = asyncio.Lock()
-        self._last_request: float = 0.0
+        self._burst: int = self.PLAN_BURSTS.get(plan, 1)
+        # 初回は1トークンのみ。バーストはアイドル中に補充された分だけ許す
+        self._tokens: float = 1.0
+        self._updated_at: float = time.monotonic()
         self._cooldown_until: float = 0.0
+        self._waiters: list[tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._changed = asyncio.Event()
 
     @property
     def interval(self) -> float:
         """リクエスト間の最小インターバル（秒）"""
         return self._interval
 
-    async def acquire(self) -> None:
+    @property
+    def burst(self) -> int:
+        """アイドル後に連続で取得できる最大トークン数"""
+        return self._burst
+
+    def _refill(self, now: float) -> None:
+        # クールダウン中はトークンを補充しない（解除直後のバーストを防ぐ）
+        elapsed = max(now - max(self._updated_at, self._cooldown_until), 0.0)
+        self._tokens = min(float(self._burst), self._tokens + elapsed / self._interval)
+        self._updated_at = now
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def acquire(self, priority: RequestPriority | None = None) -> None:
         """レートリミットスロットを取得する。
 
-        FIFO 順序を保証し、必要に応じてスリープする。
+        先頭の待機者（最優先・最古）だけがトークン補充を待ってスリープし、
+        それ以外は先頭の交代を待つ。
+
+        Args:
+            priority: リクエスト優先度（省略時はコンテキストの優先度。待機中の
+                引き上げは ``reprioritize()`` の通知で反映する）
         """
-        async with self._lock:
+        rank = _PRIORITY_RANKS[priority or current_request_priority()]
+        ticket = (rank, next(self._sequence))
+        heapq.heappush(self._waiters, ticket)
+        try:
             while True:
+                rank = _PRIORITY_RANKS[priority or current_request_priority()]
+                if rank != ticket[0]:
+                    self._waiters.remove(ticket)
+                    ticket = (rank, ticket[1])
+                    self._waiters.append(ticket)
+                    heapq.heapify(self._waiters)
+                if self._waiters[0] != ticket:
+                    await self._changed.wait()
+                    continue
                 now = time.monotonic()
-                interval_wait = self._interval - (now - self._last_request)
+                self._refill(now)
+                token_wait = max(1.0 - _TOKEN_EPSILON - self._tokens, 0.0) * self._interval
                 cooldown_wait = self._cooldown_until - now
-                wait = max(interval_wait, cooldown_wait)
+                wait = max(token_wait, cooldown_wait)
                 if wait <= 0:
-                    break
+                    self._tokens = max(self._tokens - 1.0, 0.0)
+                    return
                 await asyncio.sleep(wait)
-            self._last_request = time.monotonic()
+        finally:
+            if self._waiters and self._waiters[0] == ticket:
+                heapq.heappop(self._waiters)
+            else:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+            self._notify()
+
+    def reprioritize(self) -> None:
+        """優先度が引き上げられた待機者に順位を再評価させる。"""
+        self._notify()
 
     async def defer(
         self,
@@ -65,12 +193,16 @@ class RateLimiter:
         """Share an upstream-requested cooldown with subsequent callers.
 
         The state update intentionally has no await point: it is atomic within the
-        owning event loop and cannot queue behind an acquire that is sleeping while
-        holding the FIFO lock.
+        owning event loop and cannot queue behind an acquire that is sleeping for
+        the next token. The bucket is drained so the cooldown is not followed by
+        a burst.
         """
+        now = time.monotonic()
+        self._refill(now)
         if minimum_interval is not None:
             self._interval = max(self._interval, minimum_interval)
+        self._tokens = min(self._tokens, 1.0)
         self._cooldown_until = max(
             self._cooldown_until,
-            time.monotonic() + max(seconds, 0.0),
+            now + max(seconds, 0.0),
         )
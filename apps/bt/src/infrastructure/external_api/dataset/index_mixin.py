@@ -87,6 +87,8 @@ class IndexDataMixin:
         codes: list[str],
         start_date: str | None = None,
         end_date: str | None = None,
+        *,
+        topix_key: str | None = None,
     ) -> dict[str, pd.DataFrame]:
         """Get data for multiple indices at once.
 
@@ -94,6 +96,7 @@ class IndexDataMixin:
             codes: List of index codes
             start_date: Start date in YYYY-MM-DD format (optional)
             end_date: End date in YYYY-MM-DD format (optional)
+            topix_key: When set, TOPIX data is included under this key
 
         Returns:
             Dictionary mapping index_code to DataFrame
@@ -103,4 +106,8 @@ class IndexDataMixin:
             df = self.get_index(code, start_date, end_date)
             if not df.empty:
                 result[code] = df
+        if topix_key is not None:
+            topix = self.get_topix(start_date, end_date)
+            if not topix.empty:
+                result[topix_key] = topix
         return result
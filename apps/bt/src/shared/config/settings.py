@@ -44,6 +44,13 @@ class Settings(BaseModel):
     # JQuants API
     jquants_api_key: str = Field(default="", alias="JQUANTS_API_KEY")
     jquants_plan: str = Field(default="free", alias="JQUANTS_PLAN")
+    jquants_proxy_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=0,
+        alias="JQUANTS_PROXY_CACHE_MAX_BYTES",
+    )
+    # SQLite tier of the J-Quants proxy cache (survives restarts).
+    jquants_proxy_cache_path: str = Field(default="", alias="JQUANTS_PROXY_CACHE_PATH")
 
     # moomoo OpenD read-only quote API
     moomoo_opend_enabled: bool = Field(default=True, alias="MOOMOO_OPEND_ENABLED")
@@ -51,6 +58,10 @@ class Settings(BaseModel):
     moomoo_opend_port: int = Field(default=11111, ge=1, le=65535, alias="MOOMOO_OPEND_PORT")
     moomoo_opend_is_encrypt: bool = Field(default=False, alias="MOOMOO_OPEND_IS_ENCRYPT")
     moomoo_opend_max_history_rows: int = Field(default=5000, ge=1, alias="MOOMOO_OPEND_MAX_HISTORY_ROWS")
+    moomoo_opend_context_pool_size: int = Field(default=2, ge=1, le=16, alias="MOOMOO_OPEND_CONTEXT_POOL_SIZE")
+    # US history Parquet cache. Unset defaults to <data dir>/cache/moomoo-history;
+    # an explicit empty string disables the cache.
+    moomoo_history_cache_dir: str = Field(default="", alias="MOOMOO_HISTORY_CACHE_DIR")
 
     # Deprecated alias (legacy name): now points to DuckDB time-series file.
     market_db_path: str = Field(default="", alias="MARKET_DB_PATH")
@@ -79,6 +90,10 @@ class Settings(BaseModel):
             self.portfolio_db_path = str(Path(data_dir) / "portfolio.db")
         if not self.dataset_base_path:
             self.dataset_base_path = str(Path(data_dir) / "datasets")
+        if not self.jquants_proxy_cache_path:
+            self.jquants_proxy_cache_path = str(Path(data_dir) / "cache" / "jquants-proxy.sqlite3")
+        if "moomoo_history_cache_dir" not in self.model_fields_set:
+            self.moomoo_history_cache_dir = str(Path(data_dir) / "cache" / "moomoo-history")
 
 
 @lru_cache
@@ -100,7 +100,22 @@ class SharedConfig(BaseModel):
     spread: float = Field(default=0.0, description="スプレッド（比例コスト）")
     borrow_fee: float = Field(default=0.0, description="借株費用（比例コスト）")
     max_concurrent_positions: int | None = Field(
-        default=None, description="日次新規エントリー数の上限（既存保有ポジションは含まない）"
+        default=None,
+        description=(
+            "ポジション数の上限（position_limit_mode=daily_entries では日次新規エントリー数、"
+            "open_positions では保有中ポジションを含む同時保有数）"
+        ),
+    )
+    position_limit_mode: Literal["daily_entries", "open_positions"] = Field(
+        default="daily_entries",
+        description="max_concurrent_positions の適用方法 ('daily_entries', 'open_positions')",
+    )
+    entry_priority: Literal["column_order", "trading_value", "volume"] = Field(
+        default="column_order",
+        description=(
+            "上限超過時に残すエントリーの優先順位 ('column_order', 'trading_value', 'volume')。"
+            "売買代金・出来高は約定前セッションの値を使う"
+        ),
     )
     max_exposure: float | None = Field(
         default=None, description="1ポジションあたりの最大エクスポージャ（0-1）"
@@ -34,6 +34,7 @@ from .macro import (
     IndexDailyChangeSignalParams,
     IndexOpenGapRegimeSignalParams,
     IndexMACDHistogramSignalParams,
+    MarginPressureSignalParams,
     MarginSignalParams,
     UniverseRankBucketSignalParams,
 )
@@ -99,6 +100,7 @@ __all__ = [
     "IndexDailyChangeSignalParams",
     "IndexMACDHistogramSignalParams",
     "IndexOpenGapRegimeSignalParams",
+    "MarginPressureSignalParams",
     "MarginSignalParams",
     "UniverseRankBucketSignalParams",
     # fundamental
@@ -20,6 +20,7 @@ from .macro import (
     IndexDailyChangeSignalParams,
     IndexOpenGapRegimeSignalParams,
     IndexMACDHistogramSignalParams,
+    MarginPressureSignalParams,
     MarginSignalParams,
     UniverseRankBucketSignalParams,
 )
@@ -118,6 +119,9 @@ class SignalParams(BaseModel):
     margin: MarginSignalParams = Field(
         default_factory=MarginSignalParams, description="信用残高シグナル"
     )
+    margin_pressure: MarginPressureSignalParams = Field(
+        default_factory=MarginPressureSignalParams, description="信用需給圧力シグナル"
+    )
     atr_support_position: ATRSupportPositionParams = Field(
         default_factory=ATRSupportPositionParams,
         description="ATRサポートライン位置シグナル",
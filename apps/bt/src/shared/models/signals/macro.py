@@ -40,6 +40,26 @@ class MarginSignalParams(BaseSignalParams):
     )
 
 
+class MarginPressureSignalParams(BaseSignalParams):
+    """信用需給圧力シグナルパラメータ
+
+    market データソース（screening / signal overlay）で margin_daily に付与される
+    LongPressure / FlowPressure / TurnoverDays を閾値判定する。
+    """
+    metric: Literal["long_pressure", "flow_pressure", "turnover_days"] = Field(
+        default="long_pressure",
+        description="判定指標（信用買い圧力 / 信用フロー圧力 / 信用回転日数）",
+    )
+    period: int = Field(
+        default=15, gt=0, le=200, description="指標の出来高平均期間（営業日）"
+    )
+    threshold: float = Field(default=0.0, description="判定閾値")
+    direction: Literal["above", "below"] = Field(
+        default="below",
+        description="判定方向（above=閾値超でTrue、below=閾値以下でTrue）",
+    )
+
+
 class IndexDailyChangeSignalParams(BaseSignalParams):
     """指数前日比シグナルパラメータ（市場環境フィルター）"""
     max_daily_change_pct: float = Field(
@@ -2,23 +2,108 @@
 
 Phase 5 で必要な latency / error rate / job duration / J-Quants cache hit を
 軽量に採取するための集約器。
+
+Duration 系は固定バケットのヒストグラムで保持し、p50/p95/p99 をバケット内
+線形補間で推定する。バケット境界は全系列で共通なので、別プロセス・別
+シャードのヒストグラムもバケット単位の加算でマージできる。記録パスは
+系列ごとのロックのみを取り、系列間で競合しない。
 """
 
 from __future__ import annotations
 
+import math
+from bisect import bisect_left
 from collections import defaultdict
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from threading import Lock
+from time import perf_counter
+from typing import Any
+
+# 1-1.5-2-3-5-7 系列 (0.25ms 〜 1h)。相対誤差はバケット幅の半分程度に収まる。
+LATENCY_BUCKET_BOUNDS_MS: tuple[float, ...] = (
+    0.25,
+    0.5,
+    *(
+        float(mantissa * 10**exponent)
+        for exponent in range(0, 6)
+        for mantissa in (1, 1.5, 2, 3, 5, 7)
+    ),
+    1_000_000.0,
+    1_800_000.0,
+    3_600_000.0,
+)
+REPORTED_QUANTILES: tuple[float, ...] = (0.5, 0.95, 0.99)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
 
 
 @dataclass
 class DurationMetric:
+    """Fixed-bucket duration histogram (``counts[i]`` = values <= ``bounds[i]``)."""
+
     count: int = 0
     total_ms: float = 0.0
+    max_ms: float = 0.0
+    bounds: tuple[float, ...] = LATENCY_BUCKET_BOUNDS_MS
+    counts: list[int] = field(default_factory=list)
+    _lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
 
     def observe(self, value_ms: float) -> None:
-        self.count += 1
-        self.total_ms += value_ms
+        value = max(float(value_ms), 0.0)
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self.count += 1
+            self.total_ms += value
+            self.counts[index] += 1
+            if value > self.max_ms:
+                self.max_ms = value
+
+    def merge(self, other: DurationMetric) -> None:
+        if other.bounds != self.bounds:
+            raise ValueError("cannot merge histograms with different bucket bounds")
+        other_copy = other.copy()
+        with self._lock:
+            self.count += other_copy.count
+            self.total_ms += other_copy.total_ms
+            self.max_ms = max(self.max_ms, other_copy.max_ms)
+            for index, bucket_count in enumerate(other_copy.counts):
+                self.counts[index] += bucket_count
+
+    def copy(self) -> DurationMetric:
+        with self._lock:
+            return DurationMetric(
+                count=self.count,
+                total_ms=self.total_ms,
+                max_ms=self.max_ms,
+                bounds=self.bounds,
+                counts=list(self.counts),
+            )
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the q-quantile by linear interpolation inside its bucket."""
+        snapshot = self.copy()
+        if snapshot.count == 0:
+            return None
+        rank = min(max(q, 0.0), 1.0) * snapshot.count
+        cumulative = 0
+        for index, bucket_count in enumerate(snapshot.counts):
+            if bucket_count == 0 or cumulative + bucket_count < rank:
+                cumulative += bucket_count
+                continue
+            lower = snapshot.bounds[index - 1] if index > 0 else 0.0
+            upper = (
+                snapshot.bounds[index] if index < len(snapshot.bounds) else snapshot.max_ms
+            )
+            upper = min(upper, snapshot.max_ms)
+            lower = min(lower, upper)
+            fraction = (rank - cumulative) / bucket_count
+            return lower + (upper - lower) * fraction
+        return snapshot.max_ms
 
 
 class MetricsRecorder:
@@ -28,10 +113,23 @@ class MetricsRecorder:
         self._lock = Lock()
         self._request_total = 0
         self._request_errors = 0
-        self._request_latency: dict[tuple[str, str], DurationMetric] = defaultdict(DurationMetric)
-        self._job_duration: dict[tuple[str, str], DurationMetric] = defaultdict(DurationMetric)
+        self._request_latency: dict[tuple[str, str], DurationMetric] = {}
+        self._job_duration: dict[tuple[str, str], DurationMetric] = {}
+        self._stage_duration: dict[tuple[str, str], DurationMetric] = {}
         self._jquants_fetch_total: dict[str, int] = defaultdict(int)
         self._jquants_cache_state_total: dict[tuple[str, str], int] = defaultdict(int)
+        self._cache_stats_sources: dict[str, Callable[[], Mapping[str, int]]] = {}
+
+    def _series(
+        self,
+        table: dict[tuple[str, str], DurationMetric],
+        key: tuple[str, str],
+    ) -> DurationMetric:
+        metric = table.get(key)
+        if metric is None:
+            with self._lock:
+                metric = table.setdefault(key, DurationMetric())
+        return metric
 
     def record_request(self, method: str, path: str, status: int, elapsed_ms: float) -> None:
         key = (method, path)
@@ -39,11 +137,22 @@ class MetricsRecorder:
             self._request_total += 1
             if status >= 400:
                 self._request_errors += 1
-            self._request_latency[key].observe(elapsed_ms)
+        self._series(self._request_latency, key).observe(elapsed_ms)
 
     def record_job_duration(self, job_type: str, status: str, elapsed_ms: float) -> None:
-        with self._lock:
-            self._job_duration[(job_type, status)].observe(elapsed_ms)
+        self._series(self._job_duration, (job_type, status)).observe(elapsed_ms)
+
+    def record_stage(self, component: str, stage: str, elapsed_ms: float) -> None:
+        """Record one named internal stage (e.g. ``backtest`` / ``data_load``)."""
+        self._series(self._stage_duration, (component, stage)).observe(elapsed_ms)
+
+    @contextmanager
+    def stage_timer(self, component: str, stage: str) -> Iterator[None]:
+        started_at = perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(component, stage, (perf_counter() - started_at) * 1000)
 
     def record_jquants_fetch(self, endpoint: str) -> None:
         with self._lock:
@@ -53,12 +162,179 @@ class MetricsRecorder:
         with self._lock:
             self._jquants_cache_state_total[(endpoint, state)] += 1
 
+    def register_cache_stats(self, cache: str, source: Callable[[], Mapping[str, int]]) -> None:
+        """Expose a cache's ``stats()`` counters (read at scrape time) under ``cache``."""
+        with self._lock:
+            self._cache_stats_sources[cache] = source
+
+    def _collect_cache_stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            sources = dict(self._cache_stats_sources)
+        collected: dict[str, dict[str, int]] = {}
+        for cache, source in sorted(sources.items()):
+            try:
+                collected[cache] = {str(k): int(v) for k, v in source().items()}
+            except Exception:
+                continue
+        return collected
+
     def error_rate(self) -> float:
         with self._lock:
             if self._request_total == 0:
                 return 0.0
             return self._request_errors / self._request_total
 
+    def snapshot(self) -> dict[str, Any]:
+        """Return counters and per-series percentiles as plain data."""
+        with self._lock:
+            request_total = self._request_total
+            request_errors = self._request_errors
+            requests = dict(self._request_latency)
+            jobs = dict(self._job_duration)
+            stages = dict(self._stage_duration)
+            jquants_fetch = dict(self._jquants_fetch_total)
+            jquants_cache = dict(self._jquants_cache_state_total)
+        return {
+            "requestTotal": request_total,
+            "requestErrors": request_errors,
+            "requests": _summaries(requests, ("method", "path")),
+            "jobs": _summaries(jobs, ("jobType", "status")),
+            "stages": _summaries(stages, ("component", "stage")),
+            "jquantsFetchTotal": jquants_fetch,
+            "jquantsCacheStateTotal": [
+                {"endpoint": endpoint, "state": state, "count": count}
+                for (endpoint, state), count in sorted(jquants_cache.items())
+            ],
+            "caches": self._collect_cache_stats(),
+        }
 
-metrics_recorder = MetricsRecorder()
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            request_total = self._request_total
+            request_errors = self._request_errors
+            requests = dict(self._request_latency)
+            jobs = dict(self._job_duration)
+            stages = dict(self._stage_duration)
+            jquants_fetch = dict(self._jquants_fetch_total)
+            jquants_cache = dict(self._jquants_cache_state_total)
+
+        lines: list[str] = [
+            "# HELP bt_http_requests_total HTTP requests handled.",
+            "# TYPE bt_http_requests_total counter",
+            f"bt_http_requests_total {request_total}",
+            "# HELP bt_http_request_errors_total HTTP responses with status >= 400.",
+            "# TYPE bt_http_request_errors_total counter",
+            f"bt_http_request_errors_total {request_errors}",
+        ]
+        _render_histogram_family(
+            lines,
+            "bt_http_request_duration_ms",
+            "HTTP request latency in milliseconds.",
+            requests,
+            ("method", "path"),
+        )
+        _render_histogram_family(
+            lines,
+            "bt_job_duration_ms",
+            "Background job duration in milliseconds.",
+            jobs,
+            ("job_type", "status"),
+        )
+        _render_histogram_family(
+            lines,
+            "bt_stage_duration_ms",
+            "Internal stage duration in milliseconds.",
+            stages,
+            ("component", "stage"),
+        )
+        lines.append("# HELP bt_jquants_fetch_total J-Quants upstream fetches.")
+        lines.append("# TYPE bt_jquants_fetch_total counter")
+        for endpoint, count in sorted(jquants_fetch.items()):
+            lines.append(f"bt_jquants_fetch_total{_labels({'endpoint': endpoint})} {count}")
+        lines.append("# HELP bt_jquants_cache_state_total J-Quants proxy cache outcomes.")
+        lines.append("# TYPE bt_jquants_cache_state_total counter")
+        for (endpoint, state), count in sorted(jquants_cache.items()):
+            labels = _labels({"endpoint": endpoint, "state": state})
+            lines.append(f"bt_jquants_cache_state_total{labels} {count}")
+        lines.append("# HELP bt_cache_stat In-process cache counters and sizes.")
+        lines.append("# TYPE bt_cache_stat gauge")
+        for cache, stats in self._collect_cache_stats().items():
+            for stat, value in sorted(stats.items()):
+                lines.append(f"bt_cache_stat{_labels({'cache': cache, 'stat': stat})} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _summaries(
+    table: Mapping[tuple[str, str], DurationMetric],
+    label_names: tuple[str, str],
+) -> list[dict[str, Any]]:
+    items: list[dict[str, Any]] = []
+    for key, metric in sorted(table.items()):
+        snapshot = metric.copy()
+        item: dict[str, Any] = dict(zip(label_names, key, strict=True))
+        item.update(
+            {
+                "count": snapshot.count,
+                "totalMs": round(snapshot.total_ms, 3),
+                "maxMs": round(snapshot.max_ms, 3),
+            }
+        )
+        for q in REPORTED_QUANTILES:
+            value = snapshot.quantile(q)
+            item[f"p{int(q * 100)}Ms"] = round(value, 3) if value is not None else None
+        items.append(item)
+    return items
+
+
+def _render_histogram_family(
+    lines: list[str],
+    name: str,
+    help_text: str,
+    table: Mapping[tuple[str, str], DurationMetric],
+    label_names: tuple[str, str],
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    quantile_lines: list[str] = []
+    for key, metric in sorted(table.items()):
+        snapshot = metric.copy()
+        base_labels = dict(zip(label_names, key, strict=True))
+        cumulative = 0
+        for bound, bucket_count in zip(snapshot.bounds, snapshot.counts, strict=False):
+            cumulative += bucket_count
+            labels = _labels({**base_labels, "le": _format_number(bound)})
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        lines.append(f"{name}_bucket{_labels({**base_labels, 'le': '+Inf'})} {snapshot.count}")
+        lines.append(f"{name}_sum{_labels(base_labels)} {_format_number(snapshot.total_ms)}")
+        lines.append(f"{name}_count{_labels(base_labels)} {snapshot.count}")
+        for q in REPORTED_QUANTILES:
+            value = snapshot.quantile(q)
+            if value is None:
+                continue
+            labels = _labels({**base_labels, "quantile": _format_number(q)})
+            quantile_lines.append(f"{name}_quantile{labels} {_format_number(value)}")
+    if quantile_lines:
+        lines.append(f"# HELP {name}_quantile Bucket-interpolated {name} quantiles.")
+        lines.append(f"# TYPE {name}_quantile gauge")
+        lines.extend(quantile_lines)
 
+
+def _labels(values: Mapping[str, str]) -> str:
+    rendered = ",".join(f'{key}="{_escape_label(str(value))}"' for key, value in values.items())
+    return "{" + rendered + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(round(float(value), 6))
+
+
+metrics_recorder = MetricsRecorder()
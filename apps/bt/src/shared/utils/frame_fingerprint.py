@@ -0,0 +1,47 @@
+"""Content fingerprints of pandas frames for cache invalidation."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+def _hash_frame(digest: Any, frame: Any, start: Any, end: Any) -> None:
+    if not isinstance(frame, pd.DataFrame | pd.Series):
+        digest.update(b"none")
+        return
+    if isinstance(frame.index, pd.DatetimeIndex):
+        window = frame.loc[start:end]
+        digest.update(window.index.asi8.tobytes())
+    else:
+        window = frame
+        digest.update(pd.util.hash_pandas_object(window.index).to_numpy().tobytes())
+    values = window.to_numpy()
+    if values.dtype == object:
+        digest.update(pd.util.hash_pandas_object(window, index=False).to_numpy().tobytes())
+    else:
+        digest.update(str(values.dtype).encode("utf-8"))
+        digest.update(np.ascontiguousarray(values).tobytes())
+    if isinstance(window, pd.DataFrame):
+        digest.update("|".join(map(str, window.columns)).encode("utf-8"))
+
+
+def build_frames_fingerprint(
+    frames: Sequence[Any],
+    *,
+    start: Any,
+    end: Any,
+    extra: Sequence[str] = (),
+) -> str:
+    """[start, end] の行に限定したフレーム群と付帯情報の指紋を返す。"""
+    digest = hashlib.blake2b(digest_size=16)
+    for frame in frames:
+        _hash_frame(digest, frame, start, end)
+    for value in extra:
+        digest.update(b"|")
+        digest.update(value.encode("utf-8"))
+    return digest.hexdigest()
@@ -68,3 +68,8 @@ def rows_to_ohlc_frame(rows: Sequence[RowLike]) -> pd.DataFrame:
         columns=OHLC_COLUMNS,
         source_columns=_SOURCE_COLUMNS_BY_OUTPUT,
     )
+
+
+def format_index_date(idx: Any) -> str:
+    """Format a frame index label as ``YYYY-MM-DD`` (non-dates fall back to ``str``)."""
+    return idx.strftime("%Y-%m-%d") if hasattr(idx, "strftime") else str(idx)
@@ -366,6 +366,7 @@ class TestSignalService:
                 include_statements_data=True,
                 period_type="FY",
                 include_forecast_revision=True,
+                margin_pressure_period=None,
             ),
             needs_benchmark=True,
             benchmark_data_key=SimpleNamespace(start_date="2025-01-01", end_date="2025-01-05"),
@@ -451,6 +452,7 @@ class TestSignalService:
                 include_statements_data=False,
                 period_type="FY",
                 include_forecast_revision=False,
+                margin_pressure_period=None,
             ),
             needs_benchmark=False,
             benchmark_data_key=None,
@@ -503,6 +505,7 @@ class TestSignalService:
                 include_statements_data=False,
                 period_type="FY",
                 include_forecast_revision=False,
+                margin_pressure_period=None,
             ),
             needs_benchmark=False,
             benchmark_data_key=None,
@@ -551,6 +554,7 @@ class TestSignalService:
                 include_statements_data=False,
                 period_type="FY",
                 include_forecast_revision=False,
+                margin_pressure_period=None,
             ),
             needs_benchmark=False,
             benchmark_data_key=None,
@@ -598,6 +602,7 @@ class TestSignalService:
                 include_statements_data=False,
                 period_type="FY",
                 include_forecast_revision=False,
+                margin_pressure_period=None,
             ),
             needs_benchmark=False,
             benchmark_data_key=None,
@@ -144,6 +144,63 @@ class TestCreatePruner:
         pruner = optimizer._create_pruner()
         assert isinstance(pruner, MedianPruner)
 
+    def test_returns_successive_halving_pruner_for_multi_fidelity(self):
+        from optuna.pruners import SuccessiveHalvingPruner
+
+        optimizer = OptunaOptimizer(
+            config=OptunaConfig(pruning=True, multi_fidelity=True, reduction_factor=3),
+            shared_config_dict={"initial_cash": 10000000, "stock_codes": ["7203"]},
+        )
+        pruner = optimizer._create_pruner()
+        assert isinstance(pruner, SuccessiveHalvingPruner)
+
+
+class TestLowFidelityRungs:
+    def test_reports_each_rung_and_prunes(self):
+        optimizer = OptunaOptimizer(
+            config=OptunaConfig(
+                pruning=True,
+                multi_fidelity=True,
+                min_fidelity=0.25,
+                reduction_factor=2,
+            ),
+            shared_config_dict={"initial_cash": 10000000, "stock_codes": ["7203"]},
+        )
+        index = pd.bdate_range("2024-01-01", periods=8)
+        optimizer._prefetched_multi_data = {
+            "7203": {"daily": pd.DataFrame({"Close": range(8)}, index=index, dtype=float)}
+        }
+        optimizer._fidelity_schedule = (0.25, 0.5, 1.0)
+        trial = MagicMock()
+        trial.number = 1
+        trial.should_prune.side_effect = [False, True]
+        strategy = MagicMock()
+        strategy.run_optimized_backtest_kelly.return_value = (
+            None,
+            MagicMock(),
+            None,
+            None,
+            None,
+        )
+
+        with (
+            patch(
+                "src.domains.lab_agent.optuna_optimizer.YamlConfigurableStrategy",
+                return_value=strategy,
+            ),
+            patch.object(optimizer, "_extract_metrics", return_value=(1.0, 1.0, 0.1)),
+            pytest.raises(optuna_optimizer_module.optuna_runtime.TrialPruned),
+        ):
+            optimizer._run_low_fidelity_rungs(trial, MagicMock(), MagicMock(), MagicMock())
+
+        assert [c.kwargs["step"] for c in trial.report.call_args_list] == [1, 2]
+        # 履歴は全期間のまま、ポートフォリオ評価期間のみ末尾に絞る
+        assert len(strategy.multi_data_dict["7203"]["daily"]) == 8
+        assert strategy.evaluation_start == "2024-01-05"
+        # 全段で最終段と同じ Kelly 目的関数を使う
+        assert strategy.run_optimized_backtest_kelly.call_count == 2
+        strategy.run_multi_backtest.assert_not_called()
+
 
 class TestOptimizeFlow:
     def test_optimize_calls_progress_callback(self):
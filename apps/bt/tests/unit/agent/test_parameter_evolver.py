@@ -460,6 +460,57 @@ class TestEvolveFlow:
         assert len(evolver.history) == 2
         assert evolver.history[-1]["best_score"] == 0.8
 
+    def test_evolve_multi_fidelity_halves_population_before_full_evaluation(self):
+        config = EvolutionConfig(
+            population_size=10,
+            generations=1,
+            multi_fidelity=True,
+            min_fidelity=0.25,
+            reduction_factor=3,
+        )
+        evolver = ParameterEvolver(
+            config=config,
+            shared_config_dict={"initial_cash": 10000000, "stock_codes": ["7203"]},
+        )
+        base = _make_candidate("base")
+        population = [_make_candidate(f"p{i}") for i in range(9)]
+        frame = {"index": ["2024-01-04", "2024-01-05"], "columns": ["Close"], "data": [[1.0], [2.0]]}
+        batch_sizes: list[int] = []
+
+        def fake_evaluate_batch(candidates, prepared_data=None):
+            batch_sizes.append(len(candidates))
+            return [
+                _make_result(c, score=float(c.strategy_id[1:])) for c in candidates
+            ]
+
+        with (
+            patch.object(evolver, "_load_base_strategy", return_value=base),
+            patch.object(evolver, "_initialize_population", return_value=population),
+            patch.object(
+                evolver.evaluator,
+                "prepare_batch_data",
+                return_value=BatchPreparedData(
+                    stock_codes=["7203"],
+                    ohlcv_data={"7203": {"daily": frame}},
+                    benchmark_data=None,
+                ),
+            ),
+            patch.object(
+                evolver.evaluator,
+                "evaluate_single",
+                return_value=_make_result(base, score=0.0, total_return=0.0),
+            ),
+            patch.object(evolver.evaluator, "requires_forecast_revision", return_value=False),
+            patch.object(evolver.evaluator, "evaluate_batch", side_effect=fake_evaluate_batch),
+        ):
+            best_candidate, all_results = evolver.evolve("demo_strategy")
+
+        assert batch_sizes == [9, 3, 1]
+        assert best_candidate.strategy_id == "p8"
+        assert len(all_results) == 9
+        assert all_results[0].fidelity == 1.0
+        assert evolver.history[-1]["fidelity_evaluations"] == {"0.25": 9, "0.75": 3, "1.0": 1}
+
     def test_evolve_keeps_best_when_later_generation_is_worse(self):
         evolver = _make_evolver(pop_size=10, generations=2)
         base = _make_candidate("base")
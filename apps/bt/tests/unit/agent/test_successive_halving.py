@@ -0,0 +1,124 @@
+"""successive_halving.py のテスト"""
+
+import pandas as pd
+import pytest
+
+from src.domains.lab_agent.evaluator.data_preparation import (
+    BatchPreparedData,
+    convert_dataframes_to_dict,
+)
+from src.domains.lab_agent.models import EvaluationResult, StrategyCandidate
+from src.domains.lab_agent.successive_halving import (
+    build_fidelity_schedule,
+    fidelity_resource,
+    run_successive_halving,
+    slice_frames,
+    slice_prepared_data,
+)
+
+
+def _candidate(sid: str) -> StrategyCandidate:
+    return StrategyCandidate(strategy_id=sid, entry_filter_params={}, exit_trigger_params={})
+
+
+def _frames(codes: list[str], periods: int = 8) -> dict[str, dict[str, pd.DataFrame]]:
+    index = pd.bdate_range("2024-01-01", periods=periods)
+    return {
+        code: {"daily": pd.DataFrame({"Close": range(periods)}, index=index, dtype=float)}
+        for code in codes
+    }
+
+
+class TestSchedule:
+    def test_geometric_schedule_ends_at_full_fidelity(self):
+        assert build_fidelity_schedule(0.25, 3) == (0.25, 0.75, 1.0)
+        assert build_fidelity_schedule(0.25, 2) == (0.25, 0.5, 1.0)
+        assert build_fidelity_schedule(1.0, 3) == (1.0,)
+
+    def test_resource_matches_asha_rungs(self):
+        assert [fidelity_resource(f, 1 / 9) for f in (1 / 9, 1 / 3, 1.0)] == [1, 3, 9]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            build_fidelity_schedule(0.0, 3)
+        with pytest.raises(ValueError):
+            build_fidelity_schedule(0.5, 1)
+
+
+class TestRunSuccessiveHalving:
+    def test_promotes_top_fraction_and_records_fidelity(self):
+        candidates = [_candidate(f"c{i}") for i in range(9)]
+        calls: list[tuple[float, list[str]]] = []
+
+        def evaluate(batch: list[StrategyCandidate], fidelity: float) -> list[EvaluationResult]:
+            calls.append((fidelity, [c.strategy_id for c in batch]))
+            return [
+                EvaluationResult(
+                    candidate=c,
+                    score=float(c.strategy_id[1:]),
+                    success=c.strategy_id != "c8",
+                )
+                for c in batch
+            ]
+
+        results = run_successive_halving(candidates, evaluate, (1 / 9, 1 / 3, 1.0), 3)
+
+        assert [len(ids) for _, ids in calls] == [9, 3, 1]
+        assert calls[1][1] == ["c7", "c6", "c5"]
+        assert calls[2][1] == ["c7"]
+        assert results[0].candidate.strategy_id == "c7"
+        assert results[0].fidelity == 1.0
+        assert len(results) == 9
+        fidelity_by_id = {r.candidate.strategy_id: r.fidelity for r in results}
+        assert fidelity_by_id["c6"] == pytest.approx(1 / 3)
+        assert fidelity_by_id["c0"] == pytest.approx(1 / 9)
+
+
+class TestSlicing:
+    def test_window_slice_keeps_history_and_sets_evaluation_start(self):
+        frames = _frames(["7203", "6758"])
+        benchmark = convert_dataframes_to_dict({"b": {"d": frames["7203"]["daily"]}})["b"]["d"]
+        prepared = BatchPreparedData(
+            stock_codes=["7203", "6758"],
+            ohlcv_data=convert_dataframes_to_dict(frames),
+            benchmark_data=benchmark,
+        )
+
+        sliced = slice_prepared_data(prepared, fidelity=0.25, mode="window")
+
+        # 指標のウォームアップ用に履歴は全期間を残し、評価開始日だけ末尾 25% に絞る
+        assert sliced is not None
+        assert sliced.ohlcv_data is prepared.ohlcv_data
+        assert sliced.benchmark_data is prepared.benchmark_data
+        assert sliced.evaluation_start == "2024-01-09"
+
+        multi, benchmark, evaluation_start = slice_frames(
+            frames, None, fidelity=0.25, mode="window"
+        )
+        assert multi is frames
+        assert benchmark is None
+        assert evaluation_start == "2024-01-09"
+
+    def test_universe_slice_is_stable_subset(self):
+        codes = [str(1000 + i) for i in range(10)]
+        frames = _frames(codes)
+        prepared = BatchPreparedData(
+            stock_codes=codes,
+            ohlcv_data=convert_dataframes_to_dict(frames),
+            benchmark_data=None,
+        )
+
+        first = slice_prepared_data(prepared, fidelity=0.3, mode="universe")
+        second = slice_prepared_data(prepared, fidelity=0.3, mode="universe")
+        multi, _, evaluation_start = slice_frames(frames, None, fidelity=0.3, mode="universe")
+
+        assert first is not None and second is not None
+        assert first.stock_codes == second.stock_codes
+        assert first.stock_codes is not None and len(first.stock_codes) == 3
+        assert set(multi) == set(first.stock_codes)
+        assert first.evaluation_start is None and evaluation_start is None
+
+    def test_slice_without_prefetched_data_returns_none(self):
+        prepared = BatchPreparedData(stock_codes=None, ohlcv_data=None, benchmark_data=None)
+        assert slice_prepared_data(prepared, fidelity=0.5, mode="window") is None
+        assert slice_prepared_data(prepared, fidelity=1.0, mode="window") is prepared
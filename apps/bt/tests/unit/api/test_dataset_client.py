@@ -392,6 +392,9 @@ class TestDatasetAPIClient:
         assert "I1001" in result
         assert "I1002" in result
 
+        result = client.get_multiple_indices(["I1001"], topix_key="topix")
+        assert sorted(result) == ["I1001", "topix"]
+
     @patch("httpx.Client")
     def test_context_manager(self, mock_client_class: MagicMock) -> None:
         """Test context manager usage."""
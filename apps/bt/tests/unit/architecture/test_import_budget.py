@@ -0,0 +1,99 @@
+"""Import-time guardrails for the bt CLI and subprocess workers.
+
+The CLI entry point and job workers are started as fresh processes, so every
+module they import at load time is paid per invocation. Heavy engines
+(vectorbt / optuna / FastAPI ...) must be imported lazily by the code paths
+that actually run a job or a subcommand.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+ENGINE_MODULES = ("vectorbt", "optuna", "fastapi", "plotly", "sklearn")
+
+# module -> modules that must not be loaded by importing it
+IMPORT_GUARDS: dict[str, tuple[str, ...]] = {
+    "src.entrypoints.cli": (*ENGINE_MODULES, "numba", "duckdb", "pandas", "httpx"),
+    "src.entrypoints.cli.lab": ENGINE_MODULES,
+    "src.application.workers.backtest_worker": ENGINE_MODULES,
+    "src.application.workers.lab_worker": ENGINE_MODULES,
+    "src.application.workers.optimization_worker": ENGINE_MODULES,
+    "src.domains.lab_agent": ENGINE_MODULES,
+    "src.domains.backtest.contracts": ENGINE_MODULES,
+}
+
+# `bt --help` など軽いコマンドの起動予算（秒）。現状 ~0.2s なので十分な余裕を持たせる
+CLI_IMPORT_BUDGET_SECONDS = 1.5
+CLI_IMPORT_BUDGET_ATTEMPTS = 3
+
+_PROBE = """
+import importlib, json, sys, time
+started = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - started
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _probe_import(module: str) -> dict[str, object]:
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE, module],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(("module", "forbidden"), sorted(IMPORT_GUARDS.items()))
+def test_entrypoint_does_not_import_engines_at_load_time(
+    module: str,
+    forbidden: tuple[str, ...],
+) -> None:
+    loaded = set(_probe_import(module)["modules"])  # type: ignore[arg-type]
+
+    leaked = sorted(name for name in forbidden if name in loaded)
+    assert leaked == [], f"{module} imports {leaked} at load time"
+
+
+# 壁時計の計測は並列実行（xdist）の負荷で揺れるため、slow として fast mode から外し
+# 複数回の最小値で判定する
+@pytest.mark.slow
+def test_cli_import_stays_within_budget() -> None:
+    elapsed = min(
+        float(_probe_import("src.entrypoints.cli")["elapsed"])  # type: ignore[arg-type]
+        for _ in range(CLI_IMPORT_BUDGET_ATTEMPTS)
+    )
+
+    assert elapsed < CLI_IMPORT_BUDGET_SECONDS, (
+        f"src.entrypoints.cli took {elapsed:.2f}s to import "
+        f"(budget {CLI_IMPORT_BUDGET_SECONDS}s)"
+    )
+
+
+def test_lazy_export_propagates_import_errors_of_the_target_module(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import src.domains.lab_agent as lab_agent
+
+    def _broken_import(name: str, package: str | None = None) -> object:
+        raise ImportError(f"broken dependency while importing {name}")
+
+    monkeypatch.delitem(vars(lab_agent), "YamlUpdater", raising=False)
+    monkeypatch.setattr(lab_agent, "import_module", _broken_import)
+
+    with pytest.raises(ImportError, match="broken dependency"):
+        _ = lab_agent.YamlUpdater
+    with pytest.raises(AttributeError):
+        _ = lab_agent.NotExported  # type: ignore[attr-defined]
@@ -175,6 +175,7 @@ def test_canonical_market_writer_paths_exist() -> None:
     assert {
         "publish_stock_data",
         "publish_stock_minute_data",
+        "publish_stock_minute_frame",
         "publish_topix_data",
         "publish_indices_data",
         "publish_options_225_data",
@@ -228,6 +229,7 @@ def test_time_series_publish_contracts_do_not_return_legacy_int_counts() -> None
         "publish_topix_data",
         "publish_stock_data",
         "publish_stock_minute_data",
+        "publish_stock_minute_frame",
         "publish_indices_data",
         "publish_options_225_data",
         "publish_margin_data",
@@ -6,12 +6,14 @@ import pandas as pd
 import pytest
 
 from src.domains.backtest.vectorbt_adapter import (
+    ALLOCATION_SWEEP_LEVEL,
     DEFAULT_VECTORBT_ENGINE,
     PERCENT_SIZE_TYPE,
     ROUND_TRIP_DIRECTION_MAP,
     VECTORBT_ENGINE_ENV,
     VectorbtAdapter,
     resolve_vectorbt_engine,
+    sweep_metrics_frame,
 )
 
 
@@ -150,3 +152,75 @@ def test_round_trip_portfolio_rejects_non_numba_engine(engine: str) -> None:
             cash_sharing=False,
             group_by=None,
         )
+
+
+def test_signal_portfolio_sweep_matches_per_allocation_runs() -> None:
+    index = pd.date_range("2024-01-01", periods=6)
+    close = pd.DataFrame(
+        {
+            "7203": [100.0, 102.0, 101.0, 105.0, 104.0, 108.0],
+            "6758": [50.0, 49.0, 51.0, 52.0, 50.0, 53.0],
+        },
+        index=index,
+    )
+    entries = pd.DataFrame(
+        {
+            "7203": [True, False, False, True, False, False],
+            "6758": [True, False, True, False, False, False],
+        },
+        index=index,
+    )
+    exits = pd.DataFrame(
+        {
+            "7203": [False, False, True, False, False, True],
+            "6758": [False, True, False, False, True, False],
+        },
+        index=index,
+    )
+    adapter = VectorbtAdapter(engine="numba")
+    common = {
+        "close": close,
+        "entries": entries,
+        "exits": exits,
+        "direction": "longonly",
+        "init_cash": 1_000_000,
+        "fees": 0.001,
+        "slippage": 0.0,
+        "size_type": "percent",
+        "call_seq": "auto",
+    }
+
+    sweep = adapter.create_signal_portfolio_sweep(sizes=[0.1, 0.4, 0.1], **common)
+    table = sweep_metrics_frame(sweep)
+
+    assert list(table.index) == [0.1, 0.4]
+    assert table.index.name == ALLOCATION_SWEEP_LEVEL
+    for allocation in (0.1, 0.4):
+        single = adapter.create_signal_portfolio(
+            size=allocation,
+            cash_sharing=True,
+            group_by=True,
+            **common,
+        )
+        assert table.loc[allocation, "total_return"] == pytest.approx(
+            float(single.total_return())
+        )
+        assert table.loc[allocation, "trade_count"] == int(single.trades.count())
+
+
+def test_signal_portfolio_sweep_rejects_empty_sizes() -> None:
+    index = pd.date_range("2024-01-01", periods=2)
+    frame = pd.DataFrame({"7203": [100.0, 101.0]}, index=index)
+    signals = pd.DataFrame({"7203": [False, False]}, index=index)
+
+    with pytest.raises(ValueError, match="sizes"):
+        VectorbtAdapter(engine="numba").create_signal_portfolio_sweep(
+            close=frame,
+            entries=signals,
+            exits=signals,
+            sizes=[],
+            direction="longonly",
+            init_cash=1_000_000,
+            fees=0.0,
+            slippage=0.0,
+        )
@@ -32,6 +32,15 @@ def test_market_cutover_command_is_not_registered() -> None:
     assert result.exit_code == 2
 
 
+@pytest.mark.parametrize("group", ["lab", "jquants"])
+def test_lazy_subcommand_group_help_has_no_completion_options(group: str) -> None:
+    result = runner.invoke(app, [group, "--help"])
+
+    assert result.exit_code == 0
+    assert "--install-completion" not in result.stdout
+    assert "--show-completion" not in result.stdout
+
+
 def test_bt_backtest_help():
     """Test 'bt backtest --help' command works correctly"""
     result = runner.invoke(app, ["backtest", "--help"])
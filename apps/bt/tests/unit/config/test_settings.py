@@ -115,3 +115,11 @@ def test_settings_respects_explicit_db_paths(monkeypatch):
     assert settings.market_db_path == "/tmp/market-explicit.db"
     assert settings.portfolio_db_path == "/tmp/portfolio-explicit.db"
     assert settings.dataset_base_path == "/tmp/datasets-explicit"
+
+
+def test_settings_moomoo_history_cache_dir_default_and_disable(monkeypatch):
+    monkeypatch.delenv("MOOMOO_HISTORY_CACHE_DIR", raising=False)
+    assert reload_settings().moomoo_history_cache_dir.endswith("moomoo-history")
+
+    monkeypatch.setenv("MOOMOO_HISTORY_CACHE_DIR", "")
+    assert reload_settings().moomoo_history_cache_dir == ""
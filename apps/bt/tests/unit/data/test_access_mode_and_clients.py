@@ -309,6 +309,15 @@ def test_direct_dataset_client_methods(monkeypatch: pytest.MonkeyPatch) -> None:
                 _ns(date="2024-01-04", open=3000.0, high=3010.0, low=2990.0, close=3005.0)
             ]
 
+        def get_index_data_batch(self, codes, start=None, end=None, *, topix_key=None):  # noqa: ANN001, ANN202
+            assert start == "2024-01-01"
+            assert end == "2024-12-31"
+            batch = {code: [] for code in codes}
+            batch["IDX-1"] = self.get_index_data("IDX-1", start, end)
+            if topix_key is not None:
+                batch[topix_key] = self.get_topix(start, end)
+            return batch
+
         def get_index_list_with_counts(self, min_records: int = 100) -> list[SimpleNamespace]:
             assert min_records == 100
             return [
@@ -472,6 +481,11 @@ def test_direct_dataset_client_methods(monkeypatch: pytest.MonkeyPatch) -> None:
 
     index_df = client.get_index("IDX-1", "2024-01-01", "2024-12-31")
     assert list(index_df.columns) == ["Open", "High", "Low", "Close"]
+    indices = client.get_multiple_indices(
+        ["IDX-1", "IDX-2"], "2024-01-01", "2024-12-31", topix_key="topix"
+    )
+    assert sorted(indices) == ["IDX-1", "topix"]
+    assert indices["topix"]["Close"].tolist() == [2005.0]
     assert len(client.get_index_list(codes=["IDX-1"])) == 1
     assert client.get_index_list(codes=["UNKNOWN"]).empty
 
@@ -2,9 +2,11 @@
 DataCache のユニットテスト
 """
 
+import numpy as np
 import pandas as pd
+import pytest
 
-from src.infrastructure.data_access.loaders.cache import DataCache
+from src.infrastructure.data_access.loaders.cache import DataCache, cached_loader
 
 
 class TestDataCache:
@@ -244,3 +246,84 @@ class TestDataCache:
 
         stats = cache.get_stats()
         assert stats["size"] == 1
+
+    def test_lru_eviction_respects_max_bytes(self) -> None:
+        """合計バイト数が上限を超えると最も古く参照されたエントリから破棄される"""
+        df = pd.DataFrame({"A": list(range(100))})
+        entry_bytes = int(df.memory_usage(index=True, deep=True).sum())
+        cache = DataCache.enable(max_bytes=entry_bytes * 2)
+
+        cache.set("key1", df)
+        cache.set("key2", df)
+        assert cache.get("key1") is not None  # key1 を最新に
+        cache.set("key3", df)
+
+        assert cache.get("key2") is None
+        assert cache.get("key1") is not None
+        assert cache.get("key3") is not None
+        stats = cache.get_stats()
+        assert stats["size"] == 2
+        assert stats["bytes"] == entry_bytes * 2
+        assert stats["evictions"] == 1
+
+    def test_entry_larger_than_budget_is_not_stored(self) -> None:
+        """上限を超える単一エントリは保存されない"""
+        cache = DataCache.enable(max_bytes=1)
+
+        cache.set("key", pd.DataFrame({"A": [1, 2, 3]}))
+
+        assert cache.get("key") is None
+        assert cache.get_stats()["bytes"] == 0
+
+    def test_get_shares_buffers_until_written(self) -> None:
+        """get はデータを複製せず、書き込み時のみコピーされる（Copy-on-Write）"""
+        cache = DataCache.enable()
+        df = pd.DataFrame({"A": [1.0, 2.0, 3.0]})
+        cache.set("key", df)
+
+        result = cache.get("key")
+        assert result is not None
+        assert np.shares_memory(result["A"].to_numpy(), df["A"].to_numpy())
+        result.loc[0, "A"] = 99.0
+
+        cached = cache.get("key")
+        assert cached is not None
+        assert cached["A"].tolist() == [1.0, 2.0, 3.0]
+
+
+class TestCachedLoader:
+    """cached_loader デコレータのテスト"""
+
+    def setup_method(self) -> None:
+        DataCache.disable()
+
+    def teardown_method(self) -> None:
+        DataCache.disable()
+
+    def test_key_uses_defaults_and_keywords(self) -> None:
+        calls: list[tuple[str, str | None]] = []
+
+        @cached_loader("test:{dataset}:{start_date}")
+        def load(dataset: str, start_date: str | None = None) -> pd.DataFrame:
+            calls.append((dataset, start_date))
+            return pd.DataFrame({"A": [1]})
+
+        DataCache.enable()
+        load("ds")
+        load(dataset="ds")
+        load("ds", start_date="2024-01-01")
+        load("ds", "2024-01-01")
+
+        assert calls == [("ds", None), ("ds", "2024-01-01")]
+        assert DataCache.get_instance().get("test:ds:None") is not None
+
+    def test_invalid_call_still_raises(self) -> None:
+        @cached_loader("test:{dataset}")
+        def load(dataset: str) -> pd.DataFrame:
+            return pd.DataFrame({"A": [1]})
+
+        DataCache.enable()
+        with pytest.raises(TypeError):
+            load()
+        with pytest.raises(TypeError):
+            load("ds", dataset="ds")
@@ -164,3 +164,127 @@ class TestGetAvailableIndices:
         result = get_available_indices("testds")
         assert len(result) == 1
         assert "indexCode" in result.columns
+
+
+class TestLoadIndexPanel:
+    @pytest.fixture(autouse=True)
+    def enable_data_cache(self):
+        from src.infrastructure.data_access.loaders.cache import DataCache
+
+        DataCache.enable()
+        with patch(
+            "src.infrastructure.data_access.loaders.index_loaders.resolve_dataset_snapshot_identity",
+            side_effect=lambda name: f"{name}@{self.snapshot}",
+        ):
+            self.snapshot = "v1"
+            yield
+        DataCache.disable()
+
+    @patch("src.infrastructure.data_access.loaders.index_loaders.get_dataset_client")
+    def test_aligns_series_and_fetches_only_missing_keys(self, mock_client_cls):
+        from src.infrastructure.data_access.loaders.index_loaders import (
+            index_panel_series,
+            load_index_data,
+            load_index_panel,
+        )
+
+        client = _mock_api_client()
+        client.get_multiple_indices.side_effect = [
+            {"0040": _index_df(5), "0041": _index_df(3), "topix": _index_df(4)},
+            {"0042": _index_df(2)},
+        ]
+        mock_client_cls.return_value = client
+
+        panel = load_index_panel("testds", ["0040", "0041"], include_topix=True)
+        assert list(panel.columns.get_level_values(0).unique()) == ["0040", "0041", "topix"]
+        assert len(panel) == 5
+        assert len(index_panel_series(panel, "0041")) == 3
+        assert index_panel_series(panel, "missing").empty
+
+        panel = load_index_panel("testds", ["0041", "0042", "0043"])
+        assert list(panel.columns.get_level_values(0).unique()) == ["0041", "0042"]
+        client.get_multiple_indices.assert_called_with(
+            ["0042", "0043"], None, None, topix_key=None
+        )
+
+        # パネルに載った系列（データなしの系列を含む）は再取得しない
+        load_index_panel("testds", ["0043"])
+        assert len(load_index_data("testds", "0040")) == 5
+        client.get_index.assert_not_called()
+        assert client.get_multiple_indices.call_count == 2
+
+    def test_series_keeps_rows_with_partial_missing_fields(self):
+        from src.infrastructure.data_access.loaders.index_loaders import (
+            _build_index_panel,
+            index_panel_series,
+        )
+
+        partial = _index_df(3)
+        partial.loc[partial.index[1], "Volume"] = float("nan")
+        panel = _build_index_panel({"0040": partial, "0041": _index_df(5)})
+
+        series = index_panel_series(panel, "0040")
+
+        assert len(series) == 3
+        assert pd.isna(series["Volume"].iloc[1])
+
+    @patch("src.infrastructure.data_access.loaders.index_loaders.get_dataset_client")
+    def test_panel_follows_snapshot_and_data_cache_lifecycle(self, mock_client_cls):
+        from src.infrastructure.data_access.loaders.cache import DataCache
+        from src.infrastructure.data_access.loaders.index_loaders import load_index_panel
+
+        client = _mock_api_client()
+        client.get_multiple_indices.side_effect = lambda *args, **kwargs: {"0040": _index_df(5)}
+        mock_client_cls.return_value = client
+
+        load_index_panel("testds", ["0040"])
+        load_index_panel("testds", ["0040"])
+        assert client.get_multiple_indices.call_count == 1
+
+        # snapshot が更新されたら別パネルとして読み直す
+        self.snapshot = "v2"
+        load_index_panel("testds", ["0040"])
+        assert client.get_multiple_indices.call_count == 2
+
+        DataCache.get_instance().clear()
+        load_index_panel("testds", ["0040"])
+        assert client.get_multiple_indices.call_count == 3
+
+        # DataCache 無効時はパネルを保持しない
+        DataCache.disable()
+        load_index_panel("testds", ["0040"])
+        load_index_panel("testds", ["0040"])
+        assert client.get_multiple_indices.call_count == 5
+
+
+class TestResolveDatasetSnapshotIdentity:
+    def test_direct_mode_fingerprints_manifest(self, tmp_path, monkeypatch):
+        import os
+        from types import SimpleNamespace
+
+        from src.infrastructure.data_access import clients
+
+        snapshot_root = tmp_path / "sampleA"
+        snapshot_root.mkdir()
+        (snapshot_root / "dataset.duckdb").write_bytes(b"")
+        manifest = snapshot_root / "manifest.v2.json"
+        manifest.write_text("{}")
+        monkeypatch.setattr(clients, "should_use_direct_db", lambda: True)
+        monkeypatch.setattr(
+            clients, "get_settings", lambda: SimpleNamespace(dataset_base_path=str(tmp_path))
+        )
+
+        before = clients.resolve_dataset_snapshot_identity("sampleA")
+        os.utime(manifest, ns=(1, 1))
+        after = clients.resolve_dataset_snapshot_identity("sampleA")
+
+        assert before.startswith("sampleA@") and after.startswith("sampleA@")
+        assert before != after
+        assert clients.resolve_dataset_snapshot_identity("missing") == "missing"
+
+    def test_http_mode_uses_dataset_name(self, monkeypatch):
+        from src.infrastructure.data_access import clients
+
+        monkeypatch.setattr(clients, "should_use_direct_db", lambda: False)
+
+        assert clients.resolve_dataset_snapshot_identity("sampleA") == "sampleA"
@@ -5,7 +5,8 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 import pytest
 
-from src.infrastructure.data_access.loaders import sector_loaders
+from src.infrastructure.data_access.loaders import index_loaders, sector_loaders
+from src.infrastructure.data_access.loaders.cache import DataCache
 from src.infrastructure.data_access.loaders.sector_loaders import (
     get_sector_mapping,
     get_stock_sector_mapping,
@@ -76,44 +77,76 @@ class TestPrepareSectorData:
                 prepare_sector_data("test", "化学")
 
 
+def _mock_indices_client(frames):
+    mock_client = MagicMock()
+    mock_client.get_multiple_indices.return_value = frames
+    mock_client.__enter__ = MagicMock(return_value=mock_client)
+    mock_client.__exit__ = MagicMock(return_value=False)
+    return mock_client
+
+
 class TestLoadAllSectorIndices:
     def test_success(self):
         mapping_df = _make_mapping_df()
-        index_data = pd.DataFrame({"Close": [100]}, index=pd.date_range("2025-01-01", periods=1))
+        index_data = pd.DataFrame({"Close": [100.0]}, index=pd.date_range("2025-01-01", periods=1))
+        mock_client = _mock_indices_client({"I301": index_data, "I302": index_data})
         with (
             patch("src.infrastructure.data_access.loaders.sector_loaders.get_sector_mapping", return_value=mapping_df),
-            patch("src.infrastructure.data_access.loaders.sector_loaders.load_index_data", return_value=index_data),
+            patch("src.infrastructure.data_access.loaders.index_loaders.get_dataset_client", return_value=mock_client),
         ):
             result = load_all_sector_indices("test")
         assert len(result) == 2
         assert "化学" in result
         assert "医薬品" in result
+        mock_client.get_multiple_indices.assert_called_once_with(
+            ["I301", "I302"], None, None, topix_key=None
+        )
 
     def test_cache_hit(self):
         mapping_df = _make_mapping_df()
-        index_data = pd.DataFrame({"Close": [100]}, index=pd.date_range("2025-01-01", periods=1))
+        index_data = pd.DataFrame({"Close": [100.0]}, index=pd.date_range("2025-01-01", periods=1))
+        mock_client = _mock_indices_client({"I301": index_data, "I302": index_data})
         with (
             patch("src.infrastructure.data_access.loaders.sector_loaders.get_sector_mapping", return_value=mapping_df),
-            patch("src.infrastructure.data_access.loaders.sector_loaders.load_index_data", return_value=index_data) as mock_load,
+            patch("src.infrastructure.data_access.loaders.index_loaders.get_dataset_client", return_value=mock_client),
         ):
             result1 = load_all_sector_indices("test")
             result2 = load_all_sector_indices("test")
         assert result1 is result2
-        # load_index_data should only be called for first invocation
-        assert mock_load.call_count == 2  # 2 sectors, first call only
+        # 全セクターを1回のクライアント呼び出しでまとめて取得する
+        assert mock_client.get_multiple_indices.call_count == 1
+
+    def test_include_topix_primes_benchmark(self):
+        # パネルの再利用は DataCache 有効時（最適化セッション等）のみ
+        DataCache.enable()
+        try:
+            self._assert_include_topix_primes_benchmark()
+        finally:
+            DataCache.disable()
+
+    def _assert_include_topix_primes_benchmark(self):
+        mapping_df = _make_mapping_df()
+        index_data = pd.DataFrame({"Close": [100.0]}, index=pd.date_range("2025-01-01", periods=1))
+        topix = pd.DataFrame({"Close": [2000.0]}, index=pd.date_range("2025-01-01", periods=1))
+        mock_client = _mock_indices_client({"I301": index_data, "I302": index_data, "topix": topix})
+        with (
+            patch("src.infrastructure.data_access.loaders.sector_loaders.get_sector_mapping", return_value=mapping_df),
+            patch("src.infrastructure.data_access.loaders.index_loaders.get_dataset_client", return_value=mock_client),
+        ):
+            result = load_all_sector_indices("test", include_topix=True)
+            benchmark = index_loaders.load_topix_data("test")
+        assert set(result) == {"化学", "医薬品"}
+        assert benchmark["Close"].tolist() == [2000.0]
+        assert mock_client.get_multiple_indices.call_count == 1
+        mock_client.get_topix.assert_not_called()
 
     def test_partial_failure(self):
         mapping_df = _make_mapping_df()
-        index_data = pd.DataFrame({"Close": [100]}, index=pd.date_range("2025-01-01", periods=1))
-
-        def side_effect(dataset, index_code, start_date=None, end_date=None):
-            if index_code == "I301":
-                return index_data
-            raise Exception("load error")
-
+        index_data = pd.DataFrame({"Close": [100.0]}, index=pd.date_range("2025-01-01", periods=1))
+        mock_client = _mock_indices_client({"I301": index_data})
         with (
             patch("src.infrastructure.data_access.loaders.sector_loaders.get_sector_mapping", return_value=mapping_df),
-            patch("src.infrastructure.data_access.loaders.sector_loaders.load_index_data", side_effect=side_effect),
+            patch("src.infrastructure.data_access.loaders.index_loaders.get_dataset_client", return_value=mock_client),
         ):
             result = load_all_sector_indices("test_partial")
         assert len(result) == 1
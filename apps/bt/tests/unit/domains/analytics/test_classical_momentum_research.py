@@ -11,6 +11,7 @@ from src.domains.analytics.classical_momentum_research import (
     run_classical_momentum_research,
     write_classical_momentum_research_bundle,
 )
+from src.domains.analytics.research_core import get_feature_store_dir
 
 
 def _write_fixture_db(db_path: Path) -> None:
@@ -120,6 +121,7 @@ def test_classical_momentum_selects_top_cross_section_and_builds_portfolio(
         rebalance_interval_sessions=5,
         selection_fractions=(1 / 3,),
         min_avg_trading_value_mil_jpy=0.0,
+        feature_store_root=tmp_path / "research",
     )
 
     assert set(result.universe_summary_df["universe_key"]) == {"standard"}
@@ -150,6 +152,7 @@ def test_classical_momentum_bundle_roundtrip(tmp_path: Path) -> None:
         rebalance_interval_sessions=5,
         selection_fractions=(1 / 3,),
         min_avg_trading_value_mil_jpy=0.0,
+        feature_store_root=output_root,
     )
 
     bundle = write_classical_momentum_research_bundle(
@@ -162,3 +165,27 @@ def test_classical_momentum_bundle_roundtrip(tmp_path: Path) -> None:
     assert bundle.experiment_id == CLASSICAL_MOMENTUM_RESEARCH_EXPERIMENT_ID
     assert loaded.lookback_specs == ((20, 5),)
     assert loaded.portfolio_summary_df.shape == result.portfolio_summary_df.shape
+
+
+def test_classical_momentum_reuses_the_feature_store_panel(tmp_path: Path) -> None:
+    db_path = tmp_path / "market.duckdb"
+    output_root = tmp_path / "research"
+    _write_fixture_db(db_path)
+    kwargs = {
+        "start_date": "2024-01-02",
+        "end_date": "2024-03-15",
+        "lookback_specs": ((20, 5),),
+        "hold_sessions": (5,),
+        "rebalance_interval_sessions": 5,
+        "selection_fractions": (1 / 3,),
+        "min_avg_trading_value_mil_jpy": 0.0,
+        "feature_store_root": output_root,
+    }
+
+    first = run_classical_momentum_research(str(db_path), **kwargs)
+    panels = sorted(get_feature_store_dir(output_root).glob("*.parquet"))
+    second = run_classical_momentum_research(str(db_path), **kwargs)
+
+    assert len(panels) == 1
+    assert sorted(get_feature_store_dir(output_root).glob("*.parquet")) == panels
+    pd.testing.assert_frame_equal(first.selected_event_df, second.selected_event_df)
@@ -7,6 +7,7 @@ from datetime import date, timedelta
 from typing import Any
 
 import duckdb
+import pandas as pd
 import pytest
 
 import src.domains.analytics.daily_ranking_feature_builders as feature_builders
@@ -36,6 +37,7 @@ from src.domains.analytics.daily_ranking_research_base import (
     _relation_ref as _issue_relation_ref,
     validate_daily_ranking_signal_relation,
 )
+from src.domains.strategy.indicators import compute_moving_average
 
 
 _GENERATION = "feature_contract_g_0123456789abcdef"
@@ -1103,6 +1105,73 @@ def test_rolling_trend_builder_excludes_invalid_bars_before_every_window(
     _assert_golden_rows([next_valid], [expected_next_valid])
 
 
+def test_rolling_trend_builder_matches_per_stock_moving_average_path(
+    feature_connection: Any,
+) -> None:
+    conn = feature_connection
+    source, history = _rolling_source_and_history(conn, first_signal_offset=20)
+    conn.execute(
+        f"UPDATE {history.name} SET close = 0.0 WHERE code = '1111' AND date = ?",
+        [date(2024, 1, 21)],
+    )
+    history = _reissue_relation(conn, history)
+
+    result = build_rolling_trend_features(
+        conn,
+        RollingTrendFeaturesRequest(
+            source=source,
+            price_history=history,
+            namespace="rolling_parity",
+        ),
+    )
+    moving_average_columns = [
+        f"{prefix}{suffix}"
+        for prefix in ("sma20", "sma60", "ema20", "ema60")
+        for suffix in ("", "_slope_5d_pct", "_slope_20d_pct")
+    ]
+    actual = (
+        conn.execute(
+            f"SELECT code, date, {', '.join(moving_average_columns)} "
+            f"FROM {result.name}"
+        )
+        .fetchdf()
+        .set_index(["code", "date"])
+        .sort_index()
+    )
+    bars = conn.execute(
+        f"SELECT code, date, close FROM {history.name} "
+        "WHERE close > 0 ORDER BY code, date"
+    ).fetchdf()
+    expected_frames = []
+    for _, stock in bars.groupby("code", sort=False):
+        close = stock["close"].astype(float).reset_index(drop=True)
+        frame = stock[["code", "date"]].reset_index(drop=True)
+        for window in (20, 60):
+            for ma_type in ("sma", "ema"):
+                moving_average = compute_moving_average(close, window, ma_type)
+                frame[f"{ma_type}{window}"] = moving_average
+                for lag in (5, 20):
+                    frame[f"{ma_type}{window}_slope_{lag}d_pct"] = (
+                        moving_average / moving_average.shift(lag) - 1.0
+                    ) * 100.0
+        expected_frames.append(frame)
+    expected = (
+        pd.concat(expected_frames)
+        .set_index(["code", "date"])
+        .reindex(actual.index)[moving_average_columns]
+    )
+
+    assert result.row_count == source.row_count
+    assert actual.loc[("1111", pd.Timestamp(2024, 1, 21))].isna().all()
+    assert actual.notna().to_numpy().any()
+    pd.testing.assert_frame_equal(
+        actual.astype(float),
+        expected.astype(float),
+        check_exact=False,
+        rtol=1e-12,
+    )
+
+
 @pytest.mark.parametrize(
     ("column", "invalid_value"),
     (
@@ -1,11 +1,35 @@
 from __future__ import annotations
 
+import duckdb
+import numpy as np
+import pandas as pd
+
 from src.domains.analytics.jpx_daily_price_limits import (
     JPX_DAILY_PRICE_LIMITS_REFERENCE_LABEL,
+    build_daily_limit_panel,
     build_standard_daily_limit_table_df,
+    build_standard_daily_limit_width_case_sql,
+    register_price_limit_macros,
     resolve_standard_daily_limit_width,
+    standard_daily_limit_widths,
+    tick_sizes,
 )
 
+_SWEEP_PRICES = [
+    -1.0,
+    0.0,
+    1.0,
+    99.0,
+    99.9,
+    100.0,
+    2_999.0,
+    3_000.0,
+    3_000.5,
+    49_999_999.0,
+    50_000_000.0,
+    1e12,
+]
+
 
 def test_resolve_standard_daily_limit_width_boundary_cases() -> None:
     assert resolve_standard_daily_limit_width(None) is None
@@ -30,3 +54,59 @@ def test_build_standard_daily_limit_table_df_contains_first_and_last_band() -> N
         "base_price_rule": "50,000,000 <= base",
         "daily_limit_width": 10_000_000,
     }
+
+
+def test_vectorized_limit_widths_match_scalar_lookup() -> None:
+    widths = standard_daily_limit_widths([*_SWEEP_PRICES, np.nan, np.inf])
+
+    expected = [resolve_standard_daily_limit_width(price) for price in _SWEEP_PRICES]
+    assert [None if np.isnan(width) else width for width in widths[:-2]] == expected
+    assert np.isnan(widths[-2:]).all()
+
+
+def test_tick_sizes_use_inclusive_bounds_and_topix100_table() -> None:
+    ticks = tick_sizes([3_000, 3_001, 1_000, 1_000.5, 0], topix100=[False, False, True, True, True])
+
+    assert ticks[:4].tolist() == [1.0, 5.0, 0.1, 0.5]
+    assert np.isnan(ticks[4])
+
+
+def test_daily_limit_panel_marks_single_price_limit_locks() -> None:
+    index = pd.date_range("2024-01-04", periods=2)
+    prev_close = pd.DataFrame({"1111": [100.0, 100.0], "2222": [500.0, 500.0]}, index=index)
+    close = pd.DataFrame({"1111": [150.0, 150.0], "2222": [400.0, 450.0]}, index=index)
+    high = close.copy()
+    high.iloc[1, 0] = 151.0
+
+    panel = build_daily_limit_panel(prev_close, close, high, close, close)
+
+    assert panel.upper_limit.loc[index[0]].tolist() == [150.0, 600.0]
+    assert panel.limit_up_lock["1111"].tolist() == [True, False]
+    assert panel.limit_down_lock["2222"].tolist() == [True, False]
+    assert panel.buy_fillable.loc[index[0]].tolist() == [False, True]
+    assert panel.sell_fillable.loc[index[0]].tolist() == [True, False]
+
+
+def test_duckdb_macros_match_case_sql_and_numpy_kernel() -> None:
+    conn = duckdb.connect(":memory:")
+    register_price_limit_macros(conn)
+    conn.execute("CREATE TABLE prices (price DOUBLE)")
+    conn.executemany("INSERT INTO prices VALUES (?)", [(price,) for price in _SWEEP_PRICES])
+
+    rows = conn.execute(
+        f"""
+        SELECT
+            jpx_daily_limit_width(price),
+            {build_standard_daily_limit_width_case_sql("price")},
+            jpx_tick_size(price),
+            jpx_tick_size(price, topix100 := TRUE)
+        FROM prices
+        """
+    ).fetchall()
+    conn.close()
+
+    assert [row[0] for row in rows] == [row[1] for row in rows]
+    macro_ticks = np.array([row[2] for row in rows], dtype=float)
+    topix_ticks = np.array([row[3] for row in rows], dtype=float)
+    np.testing.assert_array_equal(macro_ticks, tick_sizes(_SWEEP_PRICES))
+    np.testing.assert_array_equal(topix_ticks, tick_sizes(_SWEEP_PRICES, topix100=True))
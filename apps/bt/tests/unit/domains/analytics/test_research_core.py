@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import math
+from collections import defaultdict
+
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -7,6 +11,7 @@ from src.domains.analytics.research_core import (
     UNIVERSE_LABELS,
     build_event_portfolio_daily_df,
     build_market_universe_case_sql,
+    build_price_path_lookup,
     normalize_positive_int_sequence,
     research_universe_market_codes,
     sort_research_table,
@@ -169,3 +174,89 @@ def test_build_event_portfolio_daily_df_returns_stable_empty_shape() -> None:
         "drawdown_pct",
     ]
     assert result.empty
+
+
+def _reference_event_portfolio_daily_df(
+    selected_event_df: pd.DataFrame,
+    price_df: pd.DataFrame,
+    group_columns: tuple[str, ...],
+) -> pd.DataFrame:
+    """Per-event loop the vectorized aggregation must reproduce bit-for-bit."""
+    price_paths = build_price_path_lookup(price_df)
+    aggregate: dict[tuple[object, ...], list[float]] = defaultdict(lambda: [0.0, 0.0])
+    for event in selected_event_df.to_dict(orient="records"):
+        price_path = price_paths.get(str(event["code"]))
+        if price_path is None:
+            continue
+        path_dates, closes = price_path.slice_inclusive(event["entry_date"], event["exit_date"])
+        entry_open = float(event["entry_open"])
+        if len(path_dates) == 0 or not math.isfinite(entry_open) or entry_open <= 0:
+            continue
+        if not np.isfinite(closes).all():
+            continue
+        daily_returns = closes / np.concatenate(([entry_open], closes[:-1])) - 1.0
+        for date_value, daily_return in zip(path_dates, daily_returns, strict=True):
+            key = (*(event[column] for column in group_columns), str(date_value))
+            aggregate[key][0] += float(daily_return)
+            aggregate[key][1] += 1.0
+    records = [
+        {
+            **dict(zip(group_columns, key[:-1], strict=True)),
+            "date": key[-1],
+            "active_positions": int(values[1]),
+            "mean_daily_return": values[0] / values[1],
+        }
+        for key, values in aggregate.items()
+    ]
+    return (
+        pd.DataFrame(records)
+        .sort_values([*group_columns, "date"], kind="stable")
+        .reset_index(drop=True)
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_build_event_portfolio_daily_df_matches_per_event_loop(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2023-01-02", periods=80).strftime("%Y-%m-%d").tolist()
+    price_rows = []
+    for code in range(30):
+        for date in dates:
+            if rng.random() < 0.1:
+                continue
+            close = float(rng.uniform(50, 150))
+            if rng.random() < 0.005:
+                close = math.inf
+            price_rows.append({"code": str(1000 + code), "date": date, "close": close})
+    price_df = pd.DataFrame(price_rows)
+    event_rows = []
+    for _ in range(400):
+        entry = int(rng.integers(0, len(dates)))
+        exit_ = min(len(dates) - 1, entry + int(rng.integers(-2, 15)))
+        event_rows.append(
+            {
+                "universe": str(rng.choice(["prime", "standard"])),
+                "horizon": int(rng.choice([5, 20])),
+                "code": str(1000 + int(rng.integers(0, 32))),
+                "entry_date": dates[entry],
+                "exit_date": dates[exit_],
+                "entry_open": float(rng.choice([0.0, math.nan, *rng.uniform(50, 150, 8)])),
+            }
+        )
+    selected_event_df = pd.DataFrame(event_rows)
+
+    result = build_event_portfolio_daily_df(
+        selected_event_df,
+        price_df,
+        group_columns=("universe", "horizon"),
+    )
+    expected = _reference_event_portfolio_daily_df(
+        selected_event_df, price_df, ("universe", "horizon")
+    )
+
+    for column in ("universe", "horizon", "date", "active_positions", "mean_daily_return"):
+        assert result[column].tolist() == expected[column].tolist(), column
+    for _, group in result.groupby(["universe", "horizon"]):
+        values = (1.0 + group["mean_daily_return"]).cumprod()
+        assert group["portfolio_value"].tolist() == values.tolist()
+        assert group["drawdown_pct"].tolist() == ((values / values.cummax() - 1.0) * 100.0).tolist()
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domains.analytics.readonly_duckdb_support import _connect_duckdb
+from src.domains.analytics.research_core import (
+    FeatureSpec,
+    get_feature_store_dir,
+    load_research_feature_panel,
+)
+
+
+def _write_fixture_db(db_path: Path) -> None:
+    dates = pd.bdate_range("2024-01-02", periods=60).strftime("%Y-%m-%d").tolist()
+    stock_rows: list[tuple[Any, ...]] = []
+    master_rows: list[tuple[Any, ...]] = []
+    topix_rows: list[tuple[Any, ...]] = []
+    rng = np.random.default_rng(3)
+    for index, date in enumerate(dates):
+        topix_close = 1000.0 + index * 2 + float(rng.normal())
+        topix_rows.append((date, topix_close, topix_close + 1, topix_close - 1, topix_close))
+        for code, market_code, scale in (
+            ("1000", "0111", "TOPIX Core30"),
+            ("2000", "0112", "TOPIX Small 1"),
+            ("30000", "0113", "-"),
+        ):
+            close = 100.0 + index + float(rng.normal(scale=2.0))
+            stock_rows.append(
+                (code, date, close - 0.5, close + 1.5, close - 1.5, close, 10_000 + index * 10)
+            )
+            # stock_master_daily gaps must not shorten rolling windows
+            if code == "1000" and 30 <= index < 33:
+                continue
+            master_rows.append((date, code, f"Company {code}", market_code, scale))
+    conn = duckdb.connect(str(db_path))
+    conn.execute(
+        "CREATE TABLE stock_data (code VARCHAR, date VARCHAR, open DOUBLE, high DOUBLE, "
+        "low DOUBLE, close DOUBLE, volume BIGINT)"
+    )
+    conn.execute(
+        "CREATE TABLE topix_data (date VARCHAR, open DOUBLE, high DOUBLE, low DOUBLE, close DOUBLE)"
+    )
+    conn.execute(
+        "CREATE TABLE stock_master_daily (date VARCHAR, code VARCHAR, company_name VARCHAR, "
+        "market_code VARCHAR, scale_category VARCHAR)"
+    )
+    conn.executemany("INSERT INTO stock_data VALUES (?, ?, ?, ?, ?, ?, ?)", stock_rows)
+    conn.executemany("INSERT INTO topix_data VALUES (?, ?, ?, ?, ?)", topix_rows)
+    conn.executemany("INSERT INTO stock_master_daily VALUES (?, ?, ?, ?, ?)", master_rows)
+    conn.close()
+
+
+def _counting_connect(calls: list[str]) -> Any:
+    def connect(db_path: str, *, read_only: bool = True) -> Any:
+        calls.append(db_path)
+        return _connect_duckdb(db_path, read_only=read_only)
+
+    return connect
+
+
+def _reference_frame(db_path: Path) -> pd.DataFrame:
+    conn = duckdb.connect(str(db_path), read_only=True)
+    prices = conn.execute("SELECT * FROM stock_data ORDER BY code, date").fetchdf()
+    topix = conn.execute("SELECT date, close FROM topix_data ORDER BY date").fetchdf()
+    conn.close()
+    prices["code"] = prices["code"].str.replace(r"^(\d{4})0$", r"\1", regex=True)
+    grouped = prices.groupby("code")["close"]
+    prices["sma_ratio_5"] = prices["close"] / grouped.transform(
+        lambda s: s.rolling(5, min_periods=5).mean()
+    )
+    prices["forward_return_3d"] = grouped.shift(-3) / prices["close"] - 1
+    previous_close = grouped.shift(1)
+    true_range = np.maximum.reduce(
+        [
+            prices["high"] - prices["low"],
+            (prices["high"] - previous_close).abs().fillna(0),
+            (prices["low"] - previous_close).abs().fillna(0),
+        ]
+    )
+    prices["atr_4"] = (
+        pd.Series(true_range, index=prices.index)
+        .groupby(prices["code"])
+        .transform(lambda s: s.rolling(4, min_periods=4).mean())
+    )
+    topix["topix_sma_ratio_10"] = topix["close"] / topix["close"].rolling(10, min_periods=10).mean()
+    return prices.merge(topix[["date", "topix_sma_ratio_10"]], on="date", how="left")
+
+
+def test_feature_panel_matches_full_history_reference_and_filters_universe(
+    tmp_path: Path,
+) -> None:
+    db_path = tmp_path / "market.duckdb"
+    _write_fixture_db(db_path)
+    specs = [
+        FeatureSpec("sma_ratio", 5),
+        FeatureSpec("forward_return", 3),
+        FeatureSpec("atr", 4),
+        FeatureSpec("topix_sma_ratio", 10),
+    ]
+
+    panel = load_research_feature_panel(
+        str(db_path),
+        specs,
+        start_date="2024-02-01",
+        end_date="2024-03-15",
+        universes=("topix500", "growth"),
+        output_root=tmp_path / "research",
+    )
+
+    frame = panel.frame
+    assert not panel.cache_hit
+    assert set(frame["universe_key"]) == {"topix500", "growth"}
+    assert set(frame["code"]) == {"1000", "3000"}
+    assert frame["date"].min() >= "2024-02-01"
+    assert frame["date"].max() <= "2024-03-15"
+    assert set(frame["company_name"]) == {"Company 1000", "Company 30000"}
+    assert len(frame[frame["code"] == "1000"]) == len(frame[frame["code"] == "3000"]) - 3
+
+    expected = _reference_frame(db_path).set_index(["code", "date"])
+    actual = frame.set_index(["code", "date"])
+    for column in ("sma_ratio_5", "forward_return_3d", "atr_4", "topix_sma_ratio_10"):
+        pd.testing.assert_series_equal(
+            actual[column],
+            expected.loc[actual.index, column],
+            check_names=False,
+            check_dtype=False,
+        )
+    assert actual["sma_ratio_5"].notna().all()
+
+
+def test_repeat_and_subset_requests_read_the_materialized_panel(tmp_path: Path) -> None:
+    db_path = tmp_path / "market.duckdb"
+    _write_fixture_db(db_path)
+    calls: list[str] = []
+    kwargs: dict[str, Any] = {
+        "start_date": "2024-02-01",
+        "end_date": "2024-03-15",
+        "output_root": tmp_path / "research",
+        "connect_fn": _counting_connect(calls),
+    }
+
+    built = load_research_feature_panel(
+        str(db_path),
+        [FeatureSpec("sma_ratio", 5), FeatureSpec("avg_trading_value", 10)],
+        **kwargs,
+    )
+    repeated = load_research_feature_panel(
+        str(db_path),
+        [FeatureSpec("avg_trading_value", 10), FeatureSpec("sma_ratio", 5)],
+        **kwargs,
+    )
+    subset = load_research_feature_panel(str(db_path), [FeatureSpec("sma_ratio", 5)], **kwargs)
+
+    assert len(calls) == 1
+    assert repeated.cache_hit and subset.cache_hit
+    assert subset.panel_key == built.panel_key
+    assert "avg_trading_value_10d_mil_jpy" not in subset.frame.columns
+    pd.testing.assert_frame_equal(repeated.frame, built.frame)
+
+
+def test_source_db_change_invalidates_panel(tmp_path: Path) -> None:
+    db_path = tmp_path / "market.duckdb"
+    _write_fixture_db(db_path)
+    first = load_research_feature_panel(
+        str(db_path),
+        [FeatureSpec("sma_ratio", 5)],
+        output_root=tmp_path / "research",
+    )
+
+    conn = duckdb.connect(str(db_path))
+    conn.execute("DELETE FROM stock_data WHERE code = '2000'")
+    conn.close()
+    second = load_research_feature_panel(
+        str(db_path),
+        [FeatureSpec("sma_ratio", 5)],
+        output_root=tmp_path / "research",
+    )
+
+    assert not second.cache_hit
+    assert second.panel_key != first.panel_key
+    assert "2000" not in set(second.frame["code"])
+    assert not first.panel_path.exists()
+    assert not first.panel_path.with_suffix(".json").exists()
+
+
+def test_store_keeps_at_most_max_panels_recently_used(tmp_path: Path) -> None:
+    db_path = tmp_path / "market.duckdb"
+    _write_fixture_db(db_path)
+    kwargs: dict[str, Any] = {"output_root": tmp_path / "research", "max_panels": 2}
+
+    first = load_research_feature_panel(str(db_path), [FeatureSpec("sma_ratio", 5)], **kwargs)
+    second = load_research_feature_panel(str(db_path), [FeatureSpec("atr", 4)], **kwargs)
+    assert load_research_feature_panel(
+        str(db_path), [FeatureSpec("sma_ratio", 5)], **kwargs
+    ).cache_hit
+    third = load_research_feature_panel(
+        str(db_path), [FeatureSpec("forward_return", 3)], **kwargs
+    )
+
+    remaining = {path.stem for path in get_feature_store_dir(tmp_path / "research").glob("*.json")}
+    assert remaining == {first.panel_key, third.panel_key}
+    assert not second.panel_path.exists()
+
+
+def test_feature_spec_validation() -> None:
+    with pytest.raises(ValueError):
+        FeatureSpec("sma_ratio", 0)
+    with pytest.raises(ValueError):
+        FeatureSpec("unknown", 5)  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        load_research_feature_panel("unused.duckdb", [])
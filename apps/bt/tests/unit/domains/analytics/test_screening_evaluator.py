@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from collections.abc import Callable, Hashable
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from src.domains.analytics.screening_results import find_recent_match_date
+from src.domains.analytics.screening_signal_state import (
+    ScreeningSignalState,
+    resolve_incremental_warmup_sessions,
+)
 from src.domains.analytics.screening_evaluator import (
     StockEvaluationOutcome,
     apply_stock_outcome,
@@ -13,6 +20,7 @@ from src.domains.analytics.screening_evaluator import (
     evaluate_strategy,
     evaluate_strategy_input,
 )
+from src.domains.strategy.signals.registry import SIGNAL_REGISTRY
 from src.domains.strategy.runtime.compiler import (
     CompiledStrategyIR,
     compile_runtime_strategy,
@@ -87,6 +95,134 @@ def _compiled_strategy(
     )
 
 
+class _MemorySignalStateStore:
+    def __init__(self) -> None:
+        self.states: dict[tuple[str, str], ScreeningSignalState] = {}
+        self.context: dict[Hashable, str] = {}
+
+    def get(self, state_key: str, stock_code: str) -> ScreeningSignalState | None:
+        return self.states.get((state_key, stock_code))
+
+    def put(self, state_key: str, stock_code: str, state: ScreeningSignalState) -> None:
+        self.states[(state_key, stock_code)] = state
+
+    def remember_context_fingerprint(self, key: Hashable, build: Callable[[], str]) -> str:
+        return self.context.setdefault(key, build())
+
+
+def _rolling_breakout_signals(calls: list[int]) -> Callable[..., Signals]:
+    def _generate_signals(**kwargs: Any) -> Signals:
+        ohlc_data: pd.DataFrame = kwargs["ohlc_data"]
+        calls.append(len(ohlc_data))
+        close = ohlc_data["Close"]
+        entries = close > close.rolling(3).max().shift(1)
+        return Signals(entries=entries, exits=pd.Series(False, index=ohlc_data.index))
+
+    return _generate_signals
+
+
+def _ema_breakout_signals(calls: list[int]) -> Callable[..., Signals]:
+    def _generate_signals(**kwargs: Any) -> Signals:
+        ohlc_data: pd.DataFrame = kwargs["ohlc_data"]
+        calls.append(len(ohlc_data))
+        close = ohlc_data["Close"]
+        entries = close > close.ewm(span=5, adjust=False).mean() * 1.01
+        return Signals(entries=entries, exits=pd.Series(False, index=ohlc_data.index))
+
+    return _generate_signals
+
+
+def _evaluate_incremental(
+    daily: pd.DataFrame,
+    store: _MemorySignalStateStore,
+    calls: list[int],
+    *,
+    entry_params: SignalParams | None = None,
+    generate_signals: Callable[[list[int]], Callable[..., Signals]] = _rolling_breakout_signals,
+    warmup_sessions: int | None = 5,
+) -> StockEvaluationOutcome:
+    strategy = _Strategy("s1", entry_params or SignalParams(), SignalParams())
+    bundle = _DataBundle(multi_data={"1001": {"daily": daily}})
+    return evaluate_stock(
+        stock=_Stock("1001"),
+        strategy_inputs=[_StrategyInput(strategy=strategy, data_bundle=bundle, load_warnings=[])],
+        recent_days=3,
+        strategy_cache_tokens={"s1": build_strategy_signal_cache_token(strategy)},
+        generate_signals=generate_signals(calls),
+        find_recent_match_date=find_recent_match_date,
+        signal_state_store=store,
+        incremental_warmup_sessions={"s1": warmup_sessions},
+    )
+
+
+def test_evaluate_stock_extends_signal_state_with_new_bars_only() -> None:
+    index = pd.bdate_range("2026-01-05", periods=40)
+    close = np.concatenate([np.linspace(100.0, 80.0, 36), [85.0, 79.0, 90.0, 85.0]])
+    daily = pd.DataFrame({"Close": close}, index=index)
+    store = _MemorySignalStateStore()
+    calls: list[int] = []
+
+    first = _evaluate_incremental(daily.iloc[:38].copy(), store, calls)
+    rerun = _evaluate_incremental(daily.iloc[:38].copy(), store, calls)
+    extended = _evaluate_incremental(daily.copy(), store, calls)
+    full = _evaluate_incremental(daily.copy(), _MemorySignalStateStore(), calls)
+
+    # 初回は全期間、同一データの再実行は計算なし、追加2本は warmup 5本 + 2本だけ評価
+    assert calls == [38, 7, 40]
+    assert first.matched_dates_by_strategy == {"s1": "2026-02-24"}
+    assert rerun.matched_dates_by_strategy == first.matched_dates_by_strategy
+    assert extended.matched_dates_by_strategy == {"s1": "2026-02-26"}
+    assert extended.matched_dates_by_strategy == full.matched_dates_by_strategy
+
+
+def test_evaluate_stock_keeps_ema_strategies_in_parity_with_full_recompute() -> None:
+    entry_params = SignalParams.model_validate(
+        {"baseline_position": {"enabled": True, "baseline_type": "ema", "baseline_period": 5}}
+    )
+    warmup = resolve_incremental_warmup_sessions(entry_params, SignalParams(), SIGNAL_REGISTRY)
+    rng = np.random.default_rng(7)
+    index = pd.bdate_range("2026-01-05", periods=60)
+    daily = pd.DataFrame({"Close": 100.0 + rng.normal(0.0, 2.0, 60).cumsum()}, index=index)
+    options: dict[str, Any] = {
+        "entry_params": entry_params,
+        "generate_signals": _ema_breakout_signals,
+    }
+
+    # EMA は全履歴に依存するため末尾スライスでは値が一致しない
+    close = daily["Close"]
+    tail_ema = close.iloc[-12:].ewm(span=5, adjust=False).mean()
+    full_ema = close.ewm(span=5, adjust=False).mean()
+    assert not np.isclose(tail_ema.iloc[-1], full_ema.iloc[-1])
+
+    store = _MemorySignalStateStore()
+    calls: list[int] = []
+    for end in range(40, 61, 4):
+        incremental = _evaluate_incremental(
+            daily.iloc[:end].copy(), store, calls, warmup_sessions=warmup, **options
+        )
+        full = _evaluate_incremental(
+            daily.iloc[:end].copy(), _MemorySignalStateStore(), [], warmup_sessions=None, **options
+        )
+        assert incremental.matched_dates_by_strategy == full.matched_dates_by_strategy
+
+    assert warmup is None
+    assert calls == list(range(40, 61, 4))
+
+
+def test_evaluate_stock_recomputes_full_history_when_data_fingerprint_changes() -> None:
+    index = pd.bdate_range("2026-01-05", periods=40)
+    daily = pd.DataFrame({"Close": np.linspace(100.0, 120.0, 40)}, index=index)
+    store = _MemorySignalStateStore()
+    calls: list[int] = []
+
+    _evaluate_incremental(daily.iloc[:38].copy(), store, calls)
+    revised = daily.copy()
+    revised.iloc[35, 0] = 50.0
+    _evaluate_incremental(revised, store, calls)
+
+    assert calls == [38, 40]
+
+
 def test_evaluate_stock_reuses_per_stock_signal_cache() -> None:
     index = pd.to_datetime(["2026-01-01", "2026-01-02"])
     daily = pd.DataFrame({"Close": [1.0, 1.1]}, index=index)
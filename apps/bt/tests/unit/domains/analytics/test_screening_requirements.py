@@ -5,6 +5,7 @@ from types import SimpleNamespace
 from src.domains.analytics.screening_requirements import (
     build_strategy_data_requirements,
     needs_data_requirement,
+    resolve_margin_pressure_period,
     resolve_period_type,
     should_include_forecast_revision,
 )
@@ -92,3 +93,42 @@ def test_build_strategy_data_requirements_resolves_keys_and_flags() -> None:
     assert requirements.benchmark_data_key is not None
     assert requirements.sector_data_key is None
     assert requirements.sector_mapping_key is None
+
+
+def test_resolve_margin_pressure_period_prefers_entry_setting() -> None:
+    entry = SignalParams()
+    exit_ = SignalParams()
+    assert resolve_margin_pressure_period(entry, exit_) is None
+
+    exit_.margin_pressure.enabled = True
+    exit_.margin_pressure.period = 20
+    assert resolve_margin_pressure_period(entry, exit_) == 20
+
+    entry.margin_pressure.enabled = True
+    entry.margin_pressure.period = 10
+    assert resolve_margin_pressure_period(entry, exit_) == 10
+
+
+def test_build_strategy_data_requirements_skips_margin_pressure_without_margin_data() -> None:
+    entry = SignalParams()
+    entry.margin_pressure.enabled = True
+    registry = [
+        SimpleNamespace(
+            data_requirements=["margin"],
+            enabled_checker=lambda params: params.margin_pressure.enabled,
+        )
+    ]
+
+    def _build(include_margin_data: bool) -> int | None:
+        return build_strategy_data_requirements(
+            shared_config=_shared_config(include_margin_data=include_margin_data),
+            entry_params=entry,
+            exit_params=SignalParams(),
+            stock_codes=("7203",),
+            start_date=None,
+            end_date=None,
+            signal_registry=registry,
+        ).multi_data_key.margin_pressure_period
+
+    assert _build(True) == 15
+    assert _build(False) is None
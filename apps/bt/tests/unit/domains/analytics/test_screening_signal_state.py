@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from src.domains.analytics.screening_signal_state import (
+    ScreeningSignalState,
+    build_context_fingerprint,
+    build_signal_state_key,
+    resolve_incremental_warmup_sessions,
+)
+from src.domains.strategy.signals.registry import SIGNAL_REGISTRY
+from src.shared.models.signals import SignalParams
+
+
+def test_resolve_incremental_warmup_sessions_uses_enabled_signal_lookbacks() -> None:
+    entry = SignalParams.model_validate({"rsi_threshold": {"enabled": True, "period": 14}})
+
+    assert resolve_incremental_warmup_sessions(entry, SignalParams(), SIGNAL_REGISTRY) == 15
+    assert resolve_incremental_warmup_sessions(SignalParams(), SignalParams(), SIGNAL_REGISTRY) is None
+
+
+def test_resolve_incremental_warmup_sessions_rejects_history_dependent_signals() -> None:
+    rsi = {"rsi_threshold": {"enabled": True, "period": 14}}
+    history_dependent = [
+        {"baseline_position": {"enabled": True, "baseline_type": "ema", "baseline_period": 20}},
+        {"volume_ratio_above": {"enabled": True, "ma_type": "ema"}},
+        {"crossover": {"enabled": True, "type": "macd"}},
+        {"atr_support_position": {"enabled": True}},
+        {"fundamental": {"enabled": True, "per": {"enabled": True}}},
+    ]
+
+    for params in history_dependent:
+        entry = SignalParams.model_validate({**rsi, **params})
+        assert resolve_incremental_warmup_sessions(entry, SignalParams(), SIGNAL_REGISTRY) is None, params
+
+
+def test_resolve_incremental_warmup_sessions_disables_cross_sectional_signals() -> None:
+    entry = SignalParams.model_validate({"rsi_threshold": {"enabled": True, "period": 14}})
+    exit_params = SignalParams.model_validate({"universe_rank_bucket": {"enabled": True}})
+
+    assert resolve_incremental_warmup_sessions(entry, exit_params, SIGNAL_REGISTRY) is None
+
+
+def test_build_signal_state_key_depends_on_token_and_recent_days() -> None:
+    key = build_signal_state_key("token", 10)
+
+    assert key == build_signal_state_key("token", 10)
+    assert key != build_signal_state_key("token", 5)
+    assert key != build_signal_state_key("other", 10)
+
+
+def test_build_context_fingerprint_tracks_sector_frames() -> None:
+    index = pd.bdate_range("2026-01-05", periods=5)
+    benchmark = pd.DataFrame({"Close": [1.0, 2.0, 3.0, 4.0, 5.0]}, index=index)
+    sector = {"銀行業": benchmark * 2}
+
+    fingerprint = build_context_fingerprint(benchmark, sector, start=index[0], end=index[-1])
+
+    assert fingerprint == build_context_fingerprint(benchmark, dict(sector), start=index[0], end=index[-1])
+    assert fingerprint != build_context_fingerprint(benchmark, None, start=index[0], end=index[-1])
+
+
+def test_screening_signal_state_payload_round_trip() -> None:
+    state = ScreeningSignalState(
+        last_date="2026-01-09",
+        fingerprint="abc",
+        candidates=(False, True, False),
+    )
+
+    assert ScreeningSignalState.from_payload(state.to_payload()) == state
@@ -16,6 +16,9 @@ from src.domains.analytics.topix100_1445_entry_signal_regime_comparison import (
     run_topix100_1445_entry_signal_regime_comparison_research,
     write_topix100_1445_entry_signal_regime_comparison_research_bundle,
 )
+from src.infrastructure.db.market.intraday_cube_writers import (
+    rebuild_intraday_cubes_for_dates,
+)
 
 
 def _create_tables(conn: duckdb.DuckDBPyConnection) -> None:
@@ -359,6 +362,33 @@ def test_run_research_builds_signal_regime_and_subgroup_tables(
     }
 
 
+def test_run_research_reads_intraday_cube_with_raw_parity(
+    analytics_db_path: str,
+) -> None:
+    def run() -> pd.DataFrame:
+        return run_topix100_1445_entry_signal_regime_comparison_research(
+            analytics_db_path,
+            interval_minutes_list=[5],
+            entry_time="14:45",
+            next_session_exit_time="10:30",
+        ).base_session_df
+
+    raw_df = run()
+    conn = duckdb.connect(analytics_db_path)
+    dates = [
+        str(row[0])
+        for row in conn.execute(
+            "SELECT DISTINCT date FROM stock_data_minute_raw"
+        ).fetchall()
+    ]
+    rebuild_intraday_cubes_for_dates(conn, dates)
+    # 生の分足価格を潰しても cube の session / snapshot から同じ結果が得られる
+    conn.execute("UPDATE stock_data_minute_raw SET open = 1.0, close = 1.0")
+    conn.close()
+
+    pd.testing.assert_frame_equal(run(), raw_df, check_dtype=False)
+
+
 def test_research_bundle_roundtrip(
     analytics_db_path: str,
     tmp_path: Path,
@@ -16,6 +16,9 @@ from src.domains.analytics.topix100_open_relative_intraday_path import (
     run_topix100_open_relative_intraday_path_research,
     write_topix100_open_relative_intraday_path_research_bundle,
 )
+from src.infrastructure.db.market.intraday_cube_writers import (
+    rebuild_intraday_cubes_for_dates,
+)
 
 
 def _build_market_db(db_path: Path) -> str:
@@ -179,6 +182,31 @@ def test_query_resampled_intraday_bars_aggregates_requested_interval(
     assert first_bar["close_return_from_open"] == pytest.approx(-0.02)
 
 
+@pytest.mark.parametrize("interval_minutes", [5, 15, 30])
+def test_query_resampled_intraday_bars_reads_cube_with_raw_parity(
+    analytics_db_path: str,
+    interval_minutes: int,
+) -> None:
+    raw_df = query_topix100_resampled_intraday_bars(
+        analytics_db_path,
+        interval_minutes=interval_minutes,
+        start_date="2024-01-05",
+    )
+    conn = duckdb.connect(analytics_db_path)
+    rebuild_intraday_cubes_for_dates(conn, ["2024-01-05", "2024-01-08"])
+    # 生の分足を消しても cube から同じ結果が得られる
+    conn.execute("UPDATE stock_data_minute_raw SET open = 1.0, close = 1.0")
+    conn.close()
+
+    cube_df = query_topix100_resampled_intraday_bars(
+        analytics_db_path,
+        interval_minutes=interval_minutes,
+        start_date="2024-01-05",
+    )
+
+    pd.testing.assert_frame_equal(cube_df, raw_df, check_dtype=False)
+
+
 def test_run_research_summarizes_intraday_path_across_intervals(
     analytics_db_path: str,
 ) -> None:
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import math
+import random
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from src.domains.fundamentals import (
+    FundamentalsCalculator,
+    calculate_latest_valuation_frame,
+    calculate_statement_metrics_frame,
+    market_statement_rows_to_frame,
+    statement_frame_from_statements,
+)
+from src.infrastructure.external_api.jquants_client import JQuantsStatement
+from src.shared.utils.share_adjustment import ShareAdjustmentEvent
+
+_DOC_TYPES = (
+    "FYFinancialStatements_Consolidated_JP",
+    "FYFinancialStatements_NonConsolidated_IFRS",
+    "3QFinancialStatements_Consolidated_US",
+    "EarnForecastRevision",
+    "unknown",
+)
+_PERIOD_TYPES = ("FY", "1Q", "2Q", "3Q", "Q2")
+
+
+def _maybe(rng: random.Random, value: float, *, missing: float = 0.25) -> float | None:
+    return None if rng.random() < missing else value
+
+
+def _statement(rng: random.Random, code: str, disclosed_date: str) -> JQuantsStatement:
+    values: dict[str, Any] = {name: None for name in JQuantsStatement.model_fields}
+    period_type = rng.choice(_PERIOD_TYPES)
+    doc_type = rng.choice(_DOC_TYPES)
+    if period_type == "FY" and rng.random() < 0.6:
+        doc_type = "FYFinancialStatements_Consolidated_JP"
+    values.update(
+        {
+            "Code": code,
+            "DiscDate": disclosed_date,
+            "DocType": doc_type,
+            "CurPerType": period_type,
+            "CurPerSt": disclosed_date,
+            "CurPerEn": disclosed_date if rng.random() < 0.8 else "2023-12-31",
+            "CurFYSt": disclosed_date,
+            "CurFYEn": disclosed_date,
+        }
+    )
+    for field, scale in (
+        ("EPS", 150.0),
+        ("NCEPS", 120.0),
+        ("BPS", 2000.0),
+        ("NCBPS", 1800.0),
+        ("FEPS", 160.0),
+        ("NxFEPS", 170.0),
+        ("FNCEPS", 130.0),
+        ("NxFNCEPS", 140.0),
+        ("DEPS", 149.0),
+    ):
+        values[field] = _maybe(rng, round(rng.uniform(-0.3, 1.0) * scale, 3))
+    for field, scale in (
+        ("Sales", 5e11),
+        ("NCSales", 4e11),
+        ("OP", 5e10),
+        ("NCOP", 4e10),
+        ("NP", 3e10),
+        ("NCNP", 2e10),
+        ("Eq", 2e11),
+        ("NCEq", 1.5e11),
+        ("TA", 6e11),
+        ("NCTA", 5e11),
+        ("CFO", 4e10),
+        ("CFI", -2e10),
+        ("CFF", -1e10),
+        ("CashEq", 8e10),
+        ("FSales", 5.5e11),
+        ("NxFSales", 6e11),
+        ("FOP", 5.5e10),
+        ("NxFOP", 6e10),
+    ):
+        values[field] = _maybe(rng, round(rng.uniform(-0.2, 1.0) * scale))
+    values["ShOutFY"] = rng.choice([None, 0.0, 1e8, 1.2e8, 2e8, 5e7])
+    values["TrShFY"] = rng.choice([None, 0.0, 1e6, 3e7])
+    for field, base in (
+        ("DivAnn", 40.0),
+        ("DivFY", 40.0),
+        ("FDivAnn", 45.0),
+        ("FDivFY", 45.0),
+        ("NxFDivAnn", 50.0),
+        ("NxFDivFY", 50.0),
+    ):
+        values[field] = _maybe(rng, round(rng.uniform(0, 1) * base, 1), missing=0.4)
+    for field in ("PayoutRatioAnn", "FPayoutRatioAnn", "NxFPayoutRatioAnn"):
+        values[field] = _maybe(rng, rng.choice([0.3, 0.285, 30.0, 0.995, 45.5]), missing=0.4)
+    return JQuantsStatement(**values)
+
+
+def _universe(seed: int) -> tuple[list[JQuantsStatement], dict[str, list[ShareAdjustmentEvent]]]:
+    rng = random.Random(seed)
+    dates = [f"2023-{month:02d}-{day:02d}" for month in range(1, 13) for day in (10, 20)]
+    statements: list[JQuantsStatement] = []
+    events: dict[str, list[ShareAdjustmentEvent]] = {}
+    for index in range(40):
+        code = f"{1300 + index}"
+        for disclosed_date in rng.sample(dates, rng.randint(1, 10)):
+            statements.append(_statement(rng, code, disclosed_date))
+            if rng.random() < 0.1:
+                # 同日開示の重複（先勝ち/後勝ちの順序差を検証）
+                statements.append(_statement(rng, code, disclosed_date))
+        if rng.random() < 0.3:
+            events[code] = [
+                ShareAdjustmentEvent(date=rng.choice(dates), adjustment_factor=rng.choice([0.5, 0.25, 2.0]))
+            ]
+    return statements, events
+
+
+def _same(actual: Any, expected: Any) -> bool:
+    if expected is None:
+        return actual is None or (isinstance(actual, float) and math.isnan(actual))
+    if isinstance(expected, float):
+        return isinstance(actual, float) and actual == expected
+    return actual == expected
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("prefer_consolidated", [True, False])
+def test_latest_valuation_frame_matches_scalar_path(seed: int, prefer_consolidated: bool) -> None:
+    statements, events = _universe(seed)
+    calculator = FundamentalsCalculator()
+    codes = sorted({stmt.Code for stmt in statements})
+    rng = random.Random(seed)
+    closes = {code: round(rng.uniform(-50, 5000), 1) for code in codes}
+    prices = pd.DataFrame(
+        {"Code": codes, "Date": ["2023-09-30"] * len(codes), "Close": [closes[c] for c in codes]}
+    )
+
+    frame = calculate_latest_valuation_frame(
+        statement_frame_from_statements(statements),
+        prices,
+        prefer_consolidated=prefer_consolidated,
+        share_adjustment_events_by_code=events,
+        price_basis_date="2023-12-31",
+    )
+
+    rows = {row["Code"]: row for row in frame.to_dict("records")}
+    for code in codes:
+        expected = calculator.calculate_latest_valuation(
+            [stmt for stmt in statements if stmt.Code == code],
+            close=closes[code],
+            price_date="2023-09-30",
+            prefer_consolidated=prefer_consolidated,
+            share_adjustment_events=events.get(code, []),
+            price_basis_date="2023-12-31",
+        )
+        if expected is None:
+            assert code not in rows
+            continue
+        row = rows[code]
+        for field, value in expected.model_dump().items():
+            if field in {"fundamentalsAdjustmentBasisDate", "providerAsOf"}:
+                continue
+            assert _same(row[field], value), (code, field, row[field], value)
+
+
+@pytest.mark.parametrize("seed", [4, 5])
+@pytest.mark.parametrize("prefer_consolidated", [True, False])
+def test_statement_metrics_frame_matches_scalar_path(seed: int, prefer_consolidated: bool) -> None:
+    statements, events = _universe(seed)
+    calculator = FundamentalsCalculator()
+    rng = random.Random(seed)
+    price_dates = [f"2023-{month:02d}-15" for month in range(1, 13)]
+    price_rows = [
+        (code, day, round(rng.uniform(100, 3000), 1))
+        for code in sorted({stmt.Code for stmt in statements})
+        for day in price_dates
+    ]
+    prices = pd.DataFrame(price_rows, columns=["Code", "Date", "Close"])
+
+    frame = calculate_statement_metrics_frame(
+        statement_frame_from_statements(statements),
+        prices,
+        prefer_consolidated=prefer_consolidated,
+        share_adjustment_events_by_code=events,
+        through_date="2023-12-31",
+    )
+
+    expected_rows: list[dict[str, Any]] = []
+    for code in sorted({stmt.Code for stmt in statements}):
+        code_statements = [stmt for stmt in statements if stmt.Code == code]
+        price_map = {day: close for c, day, close in price_rows if c == code}
+        stock_prices = calculator._get_stock_prices_for_statements(code_statements, price_map)
+        data = [
+            calculator._calculate_all_metrics(stmt, stock_prices, prefer_consolidated)
+            for stmt in code_statements
+        ]
+        adjusted, _ = calculator._apply_share_adjustments(
+            data,
+            code_statements,
+            None,
+            share_adjustment_events=events.get(code, []),
+            through_date="2023-12-31",
+        )
+        expected_rows.extend({"Code": code, **point.model_dump()} for point in adjusted)
+
+    actual_rows = frame.sort_values("Code", kind="stable").to_dict("records")
+    assert len(actual_rows) == len(expected_rows)
+    for actual, expected in zip(actual_rows, expected_rows, strict=True):
+        for field in frame.columns:
+            assert _same(actual[field], expected[field]), (expected["Code"], field)
+
+
+def test_market_statement_rows_to_frame_matches_row_adapter() -> None:
+    rows = [
+        {
+            "code": "3861",
+            "disclosed_date": "2026-02-06",
+            "type_of_current_period": "3Q",
+            "type_of_document": "3QFinancialStatements_Consolidated_JP",
+            "earnings_per_share": 33.81,
+            "forecast_eps": 54.25,
+            "dividend_fy": 12.0,
+            "bps": 1164.1,
+            "shares_outstanding": 1014381817.0,
+        },
+        {
+            "code": "3861",
+            "disclosed_date": "2025-05-09",
+            "period_end": "2025-03-31",
+            "type_of_current_period": "FY",
+            "type_of_document": "FYFinancialStatements_Consolidated_JP",
+            "earnings_per_share": 40.0,
+            "bps": 1100.0,
+            "shares_outstanding": 1014381817.0,
+        },
+    ]
+
+    frame = market_statement_rows_to_frame(rows)
+
+    assert frame["CurPerEn"].tolist() == ["2026-02-06", "2025-03-31"]
+    assert frame.loc[0, "DivAnn"] == frame.loc[0, "DivFY"] == 12.0
+    assert frame.loc[0, "FEPS"] == 54.25
+    assert math.isnan(frame.loc[1, "FEPS"])
+    assert frame["Code"].tolist() == ["3861", "3861"]
@@ -0,0 +1,62 @@
+"""
+AdaptiveConcurrencyLimiter Unit Tests
+"""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.external_api.clients.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_plan_max_concurrency(self):
+        assert AdaptiveConcurrencyLimiter(plan="free").max_limit == 1
+        assert AdaptiveConcurrencyLimiter(plan="premium").max_limit == 8
+        assert AdaptiveConcurrencyLimiter(plan="unknown").max_limit == 1
+
+    def test_additive_increase_per_window_and_multiplicative_decrease(self):
+        limiter = AdaptiveConcurrencyLimiter(plan="premium", latency_target=1.0)
+        assert limiter.limit == 1
+
+        limiter.record_success(0.1)
+        assert limiter.limit == 2
+        limiter.record_success(0.1)
+        limiter.record_success(0.1)
+        assert limiter.limit == 3
+
+        limiter.record_throttled()
+        assert limiter.limit == 1
+
+    def test_slow_responses_shrink_limit_and_limit_is_capped(self):
+        limiter = AdaptiveConcurrencyLimiter(plan="light", latency_target=1.0)
+        for _ in range(20):
+            limiter.record_success(0.1)
+        assert limiter.limit == 2
+
+        limiter.record_success(5.0)
+        assert limiter.limit == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_slots_wait_but_interactive_slots_do_not(self):
+        limiter = AdaptiveConcurrencyLimiter(plan="premium")
+        release = asyncio.Event()
+        entered: list[str] = []
+
+        async def hold(name: str, priority: str) -> None:
+            async with limiter.slot(priority):  # type: ignore[arg-type]
+                entered.append(name)
+                await release.wait()
+
+        first = asyncio.create_task(hold("bulk-1", "bulk"))
+        second = asyncio.create_task(hold("bulk-2", "bulk"))
+        interactive = asyncio.create_task(hold("interactive", "interactive"))
+        await asyncio.sleep(0.01)
+
+        assert entered == ["bulk-1", "interactive"]
+        assert limiter.in_flight == 2
+
+        release.set()
+        await asyncio.gather(first, second, interactive)
+        assert entered == ["bulk-1", "interactive", "bulk-2"]
+        assert limiter.in_flight == 0
@@ -4,6 +4,8 @@ JQuantsAsyncClient Unit Tests
 respx を使用した HTTP モックテスト。リトライ・ページネーション・タイムアウトを検証。
 """
 
+import asyncio
+
 import pytest
 import httpx
 import respx
@@ -12,6 +14,10 @@ from datetime import UTC, datetime, timedelta
 from email.utils import format_datetime
 
 from src.infrastructure.external_api.clients.jquants_client import JQuantsApiError, JQuantsAsyncClient
+from src.infrastructure.external_api.clients.rate_limiter import (
+    current_request_priority,
+    request_priority,
+)
 from src.shared.config.reliability import RetryPolicy
 
 
@@ -20,7 +26,7 @@ def client(monkeypatch: pytest.MonkeyPatch):
     """テスト用 JQuantsAsyncClient"""
     client = JQuantsAsyncClient(api_key="dummy_token_value_0000", plan="premium", timeout=5.0)
 
-    async def _acquire_immediately() -> None:
+    async def _acquire_immediately(*_args, **_kwargs) -> None:
         return None
 
     monkeypatch.setattr(client._rate_limiter, "acquire", _acquire_immediately)
@@ -354,3 +360,118 @@ class TestDataKeyExtraction:
         body = {"status": "ok", "count": 0}
         key = client._extract_data_key("/unknown/path", body)
         assert key is None
+
+
+class _FakeJQuantsServer:
+    """httpx.MockTransport で動くローカル fake server（同時実行数を計測）"""
+
+    def __init__(self, *, statuses: list[int] | None = None, delay: float = 0.01) -> None:
+        self.requests: list[httpx.Request] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._statuses = list(statuses or [])
+        self._delay = delay
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._delay)
+        finally:
+            self.in_flight -= 1
+        status = self._statuses.pop(0) if self._statuses else 200
+        if status != 200:
+            return httpx.Response(status, headers={"Retry-After": "0"}, json={})
+        return httpx.Response(200, json={"data": [{"Code": request.url.params.get("code")}]})
+
+
+def _fake_server_client(server: _FakeJQuantsServer, monkeypatch: pytest.MonkeyPatch) -> JQuantsAsyncClient:
+    client = JQuantsAsyncClient(
+        api_key="dummy_token_value_0000",
+        plan="premium",
+        transport=httpx.MockTransport(server),
+    )
+
+    async def _acquire_immediately(*_args, **_kwargs) -> None:
+        return None
+
+    monkeypatch.setattr(client._rate_limiter, "acquire", _acquire_immediately)
+    return client
+
+
+class TestAdaptiveFanOut:
+    @pytest.mark.asyncio
+    async def test_identical_in_flight_requests_are_coalesced(self, monkeypatch):
+        server = _FakeJQuantsServer()
+        client = _fake_server_client(server, monkeypatch)
+
+        first, second, other = await asyncio.gather(
+            client.get("/equities/master", {"code": "7203"}),
+            client.get("/equities/master", {"code": "7203"}),
+            client.get("/equities/master", {"code": "6758"}),
+        )
+
+        assert first == second
+        assert first is not second
+        assert other["data"][0]["Code"] == "6758"
+        assert len(server.requests) == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_coalesced_results_do_not_share_nested_lists(self, monkeypatch):
+        server = _FakeJQuantsServer()
+        client = _fake_server_client(server, monkeypatch)
+
+        first, second = await asyncio.gather(
+            client.get("/equities/master", {"code": "7203"}),
+            client.get("/equities/master", {"code": "7203"}),
+        )
+        first["data"].append({"Code": "mutated"})
+
+        assert second["data"] == [{"Code": "7203"}]
+        assert len(server.requests) == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_interactive_joiner_raises_shared_bulk_fetch_priority(self, monkeypatch):
+        server = _FakeJQuantsServer()
+        client = _fake_server_client(server, monkeypatch)
+        seen: list[str] = []
+
+        async def _record_priority(*_args, **_kwargs) -> None:
+            # 合流を待ってからトークン取得時点の優先度を記録する
+            await asyncio.sleep(0)
+            seen.append(current_request_priority())
+
+        monkeypatch.setattr(client._rate_limiter, "acquire", _record_priority)
+
+        with request_priority("bulk"):
+            bulk = asyncio.create_task(client.get("/equities/master", {"code": "7203"}))
+        interactive = asyncio.create_task(client.get("/equities/master", {"code": "7203"}))
+        await asyncio.gather(bulk, interactive)
+
+        assert seen == ["interactive"]
+        assert len(server.requests) == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_concurrency_grows_to_plan_limit_and_backs_off_on_throttling(
+        self, monkeypatch, fast_retry_backoff
+    ):
+        server = _FakeJQuantsServer()
+        client = _fake_server_client(server, monkeypatch)
+
+        with request_priority("bulk"):
+            await asyncio.gather(
+                *(client.get("/equities/master", {"code": str(code)}) for code in range(64))
+            )
+
+        assert 1 < server.max_in_flight <= client.max_concurrency
+        assert client._concurrency.limit == client.max_concurrency
+
+        server._statuses = [503]
+        with request_priority("bulk"):
+            await client.get("/equities/master", {"code": "retry"})
+        assert client._concurrency.limit == client.max_concurrency // 2
+        await client.close()
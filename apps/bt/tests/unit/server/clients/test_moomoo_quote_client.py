@@ -6,6 +6,7 @@ from unittest.mock import patch
 
 import pytest
 
+from src.infrastructure.external_api.clients.moomoo_history_cache import MoomooHistoryCache
 from src.infrastructure.external_api.clients.moomoo_quote_client import (
     MoomooOpenDConfig,
     MoomooOpenDError,
@@ -176,3 +177,183 @@ def test_snapshot_rejects_empty_symbol_list() -> None:
     client = MoomooQuoteClient(_config())
     with pytest.raises(MoomooOpenDError):
         client.get_us_snapshot([])
+
+
+class _CountingSdk:
+    """Fake SDK counting opened contexts and recording history requests."""
+
+    def __init__(self, bars_by_date: dict[str, float]) -> None:
+        self.opened: list[_RecordingQuoteContext] = []
+        self.bars_by_date = bars_by_date
+        self.RET_OK = 0
+        self.Market = SimpleNamespace(US="US")
+        self.SecurityType = SimpleNamespace(STOCK="STOCK")
+        self.KLType = SimpleNamespace(K_DAY="K_DAY", K_1M="K_1M")
+        self.AuType = SimpleNamespace(QFQ="QFQ")
+
+    def OpenQuoteContext(self, *_args: Any, **_kwargs: Any) -> "_RecordingQuoteContext":
+        ctx = _RecordingQuoteContext(self)
+        self.opened.append(ctx)
+        return ctx
+
+
+class _RecordingQuoteContext(_FakeQuoteContext):
+    def __init__(self, sdk: _CountingSdk) -> None:
+        super().__init__()
+        self._sdk = sdk
+        self.history_calls: list[dict[str, Any]] = []
+        self.healthy = True
+
+    def get_global_state(self) -> tuple[int, dict[str, Any]]:
+        return (0 if self.healthy else -1, {})
+
+    def request_history_kline(self, code: str, **kwargs: Any) -> tuple[int, _FakeFrame, None]:
+        self.history_calls.append(kwargs)
+        start = kwargs.get("start")
+        end = kwargs.get("end")
+        rows = [
+            {"code": code, "time_key": f"{day} 00:00:00", "close": close}
+            for day, close in sorted(self._sdk.bars_by_date.items())
+            if (start is None or day >= start) and (end is None or day <= end)
+        ]
+        return 0, _FakeFrame(rows), None
+
+
+def test_quote_contexts_are_pooled_across_calls() -> None:
+    sdk = _CountingSdk({"2025-01-02": 101.0})
+    client = MoomooQuoteClient(_config())
+    with patch("importlib.import_module", return_value=sdk):
+        client.get_us_history("AAPL", start="2025-01-01", end="2025-01-31")
+        client.get_us_snapshot(["AAPL"])
+        client.status()
+
+    assert len(sdk.opened) == 1
+    assert sdk.opened[0].closed is False
+    client.close()
+    assert sdk.opened[0].closed is True
+
+
+def test_failed_operation_rechecks_pooled_context() -> None:
+    sdk = _CountingSdk({})
+    client = MoomooQuoteClient(_config())
+    with patch("importlib.import_module", return_value=sdk):
+        with patch.object(_RecordingQuoteContext, "get_market_snapshot", return_value=(-1, "unknown code")):
+            with pytest.raises(MoomooOpenDError):
+                client.get_us_snapshot(["AAPL"])
+        client.get_us_snapshot(["AAPL"])
+
+        assert len(sdk.opened) == 1
+
+        sdk.opened[0].healthy = False
+        with patch.object(_RecordingQuoteContext, "get_market_snapshot", return_value=(-1, "disconnected")):
+            with pytest.raises(MoomooOpenDError):
+                client.get_us_snapshot(["AAPL"])
+        client.get_us_snapshot(["AAPL"])
+
+    assert len(sdk.opened) == 2
+    assert sdk.opened[0].closed is True
+
+
+def test_history_cache_fetches_only_missing_tail(tmp_path: Any) -> None:
+    now = [1_000.0]
+    sdk = _CountingSdk({"2025-01-02": 101.0, "2025-01-03": 102.0})
+    cache = MoomooHistoryCache(
+        tmp_path,
+        tail_refresh_interval_seconds=60.0,
+        clock=lambda: now[0],
+    )
+    client = MoomooQuoteClient(_config(), history_cache=cache)
+    with patch("importlib.import_module", return_value=sdk):
+        first = client.get_us_history("AAPL", start="2025-01-01", end=None)
+        cached = client.get_us_history("AAPL", start="2025-01-02", end=None)
+
+        sdk.bars_by_date["2025-01-03"] = 102.5
+        sdk.bars_by_date["2025-01-06"] = 103.0
+        now[0] += 120.0
+        extended = client.get_us_history("AAPL", start="2025-01-01", end=None)
+
+    calls = sdk.opened[0].history_calls
+    # 末尾取得は確定済みの 1 本前から重ねて取り、調整基準の変化を検知する
+    assert [call["start"] for call in calls] == ["2025-01-01", "2025-01-02"]
+    assert [row["close"] for row in first["rows"]] == [101.0, 102.0]
+    assert [row["close"] for row in cached["rows"]] == [101.0, 102.0]
+    assert [row["close"] for row in extended["rows"]] == [101.0, 102.5, 103.0]
+
+
+def test_history_cache_refetches_tail_beyond_a_past_end_bound(tmp_path: Any) -> None:
+    sdk = _CountingSdk({"2025-01-02": 101.0, "2025-01-03": 102.0, "2025-01-06": 103.0})
+    cache = MoomooHistoryCache(tmp_path, tail_refresh_interval_seconds=60.0, clock=lambda: 1_000.0)
+    client = MoomooQuoteClient(_config(), history_cache=cache)
+    with patch("importlib.import_module", return_value=sdk):
+        past = client.get_us_history("AAPL", start="2025-01-01", end="2025-01-03")
+        within = client.get_us_history("AAPL", start="2025-01-01", end="2025-01-02")
+        latest = client.get_us_history("AAPL", start="2025-01-01", end=None)
+        repeated = client.get_us_history("AAPL", start="2025-01-01", end=None)
+
+    calls = sdk.opened[0].history_calls
+    assert [(call["start"], call["end"]) for call in calls] == [
+        ("2025-01-01", "2025-01-03"),
+        ("2025-01-02", None),
+    ]
+    assert [row["close"] for row in past["rows"]] == [101.0, 102.0]
+    assert [row["close"] for row in within["rows"]] == [101.0]
+    assert [row["close"] for row in latest["rows"]] == [101.0, 102.0, 103.0]
+    assert repeated["rows"] == latest["rows"]
+
+
+def test_history_cache_refetches_window_when_adjustment_basis_changes(tmp_path: Any) -> None:
+    now = [1_000.0]
+    sdk = _CountingSdk({"2025-01-02": 100.0, "2025-01-03": 102.0, "2025-01-06": 104.0})
+    cache = MoomooHistoryCache(tmp_path, tail_refresh_interval_seconds=60.0, clock=lambda: now[0])
+    client = MoomooQuoteClient(_config(), history_cache=cache)
+    with patch("importlib.import_module", return_value=sdk):
+        client.get_us_history("AAPL", start="2025-01-01", end=None)
+
+        # 2:1 分割で前方調整済みの過去バーがすべて半値になる
+        sdk.bars_by_date = {day: close / 2 for day, close in sdk.bars_by_date.items()}
+        sdk.bars_by_date["2025-01-07"] = 53.0
+        now[0] += 120.0
+        rebased = client.get_us_history("AAPL", start="2025-01-01", end=None)
+
+    calls = sdk.opened[0].history_calls
+    assert [call["start"] for call in calls] == ["2025-01-01", "2025-01-03", "2025-01-01"]
+    assert [row["close"] for row in rebased["rows"]] == [50.0, 51.0, 52.0, 53.0]
+
+
+def test_history_cache_survives_client_restart(tmp_path: Any) -> None:
+    sdk = _CountingSdk({"2025-01-02": 101.0, "2025-01-03": 102.0})
+    with patch("importlib.import_module", return_value=sdk):
+        MoomooQuoteClient(
+            _config(), history_cache=MoomooHistoryCache(tmp_path)
+        ).get_us_history("AAPL", start="2025-01-01", end="2025-01-03")
+        restarted = MoomooQuoteClient(_config(), history_cache=MoomooHistoryCache(tmp_path))
+        history = restarted.get_us_history("AAPL", start="2025-01-03", end="2025-01-03")
+
+    assert sum(len(ctx.history_calls) for ctx in sdk.opened) == 1
+    assert history["rows"] == [
+        {
+            "code": "US.AAPL",
+            "timeKey": "2025-01-03 00:00:00",
+            "name": None,
+            "open": None,
+            "close": 102.0,
+            "high": None,
+            "low": None,
+            "volume": None,
+            "turnover": None,
+            "peRatio": None,
+            "turnoverRate": None,
+            "changeRate": None,
+            "lastClose": None,
+        }
+    ]
+
+
+def test_minute_history_uses_minute_kline_type() -> None:
+    sdk = _CountingSdk({"2025-01-02": 101.0})
+    client = MoomooQuoteClient(_config())
+    with patch("importlib.import_module", return_value=sdk):
+        history = client.get_us_history("AAPL", start=None, end=None, timeframe="1m")
+
+    assert history["timeframe"] == "1m"
+    assert sdk.opened[0].history_calls[0]["ktype"] == "K_1M"
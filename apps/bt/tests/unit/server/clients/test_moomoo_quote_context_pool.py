@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from src.infrastructure.external_api.clients.moomoo_quote_context_pool import (
+    MoomooQuoteContextPool,
+    MoomooQuoteContextPoolError,
+)
+
+
+class _Context:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.healthy = True
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _Factory:
+    def __init__(self) -> None:
+        self.created: list[_Context] = []
+        self.failures_remaining = 0
+
+    def __call__(self) -> _Context:
+        if self.failures_remaining > 0:
+            self.failures_remaining -= 1
+            raise ConnectionError("OpenD down")
+        ctx = _Context(len(self.created))
+        self.created.append(ctx)
+        return ctx
+
+
+def _pool(factory: _Factory, clock: list[float], **kwargs: Any) -> MoomooQuoteContextPool:
+    return MoomooQuoteContextPool(
+        factory,
+        health_check=lambda ctx: ctx.healthy,
+        clock=lambda: clock[0],
+        **kwargs,
+    )
+
+
+def test_lease_reuses_idle_context() -> None:
+    factory = _Factory()
+    pool = _pool(factory, [0.0])
+
+    with pool.lease() as first:
+        pass
+    with pool.lease() as second:
+        pass
+
+    assert first is second
+    assert len(factory.created) == 1
+    assert pool.stats()["reused"] == 1
+
+
+def test_stale_unhealthy_context_is_replaced() -> None:
+    factory = _Factory()
+    clock = [0.0]
+    pool = _pool(factory, clock, health_check_interval_seconds=10.0)
+
+    with pool.lease() as first:
+        first.healthy = False
+    clock[0] = 5.0
+    with pool.lease() as fresh:
+        assert fresh is first
+    clock[0] = 30.0
+    with pool.lease() as replaced:
+        pass
+
+    assert replaced is not first
+    assert first.closed is True
+
+
+def test_context_is_discarded_when_operation_raises_transport_error() -> None:
+    factory = _Factory()
+    pool = _pool(factory, [0.0])
+
+    with pytest.raises(ConnectionError):
+        with pool.lease() as ctx:
+            raise ConnectionError("socket closed")
+
+    assert ctx.closed is True
+    with pool.lease() as replacement:
+        assert replacement is not ctx
+
+
+def test_context_is_kept_but_rechecked_when_operation_raises_non_transport_error() -> None:
+    factory = _Factory()
+    pool = _pool(factory, [0.0], health_check_interval_seconds=10.0)
+
+    with pytest.raises(ValueError):
+        with pool.lease() as ctx:
+            raise ValueError("unknown symbol")
+
+    assert ctx.closed is False
+    with pool.lease() as reused:
+        assert reused is ctx
+
+    with pytest.raises(ValueError):
+        with pool.lease() as ctx:
+            ctx.healthy = False
+            raise ValueError("unknown symbol")
+
+    # health check interval has not elapsed, but the failed lease forces a re-check
+    with pool.lease() as replacement:
+        assert replacement is not ctx
+    assert ctx.closed is True
+    assert len(factory.created) == 2
+
+
+def test_reconnect_is_gated_by_exponential_backoff() -> None:
+    factory = _Factory()
+    factory.failures_remaining = 2
+    clock = [0.0]
+    pool = _pool(factory, clock, backoff_initial_seconds=1.0, backoff_max_seconds=4.0)
+
+    with pytest.raises(ConnectionError):
+        with pool.lease():
+            pass
+    with pytest.raises(MoomooQuoteContextPoolError, match="backoff"):
+        with pool.lease():
+            pass
+    clock[0] = 1.5
+    with pytest.raises(ConnectionError):
+        with pool.lease():
+            pass
+    assert pool.stats()["backoffSeconds"] == 2.0
+    clock[0] = 3.6
+    with pool.lease() as ctx:
+        assert ctx.index == 0
+    assert pool.stats()["backoffSeconds"] == 0.0
+
+
+def test_close_closes_idle_contexts_and_rejects_leases() -> None:
+    factory = _Factory()
+    pool = _pool(factory, [0.0])
+    with pool.lease() as ctx:
+        pass
+
+    pool.close()
+
+    assert ctx.closed is True
+    with pytest.raises(MoomooQuoteContextPoolError):
+        with pool.lease():
+            pass
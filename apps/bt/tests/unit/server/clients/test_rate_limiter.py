@@ -3,11 +3,23 @@ RateLimiter Unit Tests
 """
 
 import asyncio
+import math
 import time
 
 import pytest
 
-from src.infrastructure.external_api.clients.rate_limiter import RateLimiter
+from src.infrastructure.external_api.clients.rate_limiter import (
+    RateLimiter,
+    RequestPriority,
+    SharedRequestPriority,
+    current_request_priority,
+    request_priority,
+    shared_request_priority,
+)
+
+
+async def _priority_in_task() -> str:
+    return current_request_priority()
 
 
 class TestRateLimiter:
@@ -102,13 +114,18 @@ class TestRateLimiter:
     @pytest.mark.asyncio
     async def test_defer_is_not_blocked_by_sleeping_acquire(self):
         limiter = RateLimiter(plan="standard")
-        await limiter._lock.acquire()
+        await limiter.acquire()
+        acquire_task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
         defer_task = asyncio.create_task(limiter.defer(0.0, minimum_interval=1.1))
         await asyncio.sleep(0)
 
+        assert acquire_task.done() is False
         assert defer_task.done() is True
 
-        limiter._lock.release()
+        acquire_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await acquire_task
         await defer_task
         assert limiter.interval == 1.1
 
@@ -135,7 +152,8 @@ class TestRateLimiter:
 
         monkeypatch.setattr("src.infrastructure.external_api.clients.rate_limiter.time.monotonic", monotonic)
         monkeypatch.setattr("src.infrastructure.external_api.clients.rate_limiter.asyncio.sleep", sleep)
-        limiter._last_request = clock
+        limiter._tokens = 0.0
+        limiter._updated_at = clock
 
         acquire_task = asyncio.create_task(limiter.acquire())
         await first_sleep_started.wait()
@@ -144,4 +162,94 @@ class TestRateLimiter:
         await acquire_task
 
         assert waits == pytest.approx([0.132, 0.5])
-        assert limiter._last_request == pytest.approx(100.632)
+        assert limiter._updated_at == pytest.approx(100.632)
+        # クールダウン中は補充されないため、解除直後にバーストしない
+        assert limiter._tokens == pytest.approx(0.0)
+
+    def test_plan_bursts_stay_within_rpm_window(self):
+        """任意の60秒窓でバースト + 補充分がプラン RPM を超えない"""
+        for plan, rpm in RateLimiter.PLAN_LIMITS.items():
+            limiter = RateLimiter(plan=plan)
+            assert limiter.burst + math.floor(60.0 / limiter.interval) <= rpm
+
+    @pytest.mark.asyncio
+    async def test_idle_bucket_allows_burst(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        limiter = RateLimiter(plan="light")
+        clock = 100.0
+        waits: list[float] = []
+
+        async def sleep(seconds: float) -> None:
+            nonlocal clock
+            waits.append(seconds)
+            clock += seconds
+
+        monkeypatch.setattr("src.infrastructure.external_api.clients.rate_limiter.time.monotonic", lambda: clock)
+        monkeypatch.setattr("src.infrastructure.external_api.clients.rate_limiter.asyncio.sleep", sleep)
+        limiter._tokens = 0.0
+        limiter._updated_at = clock - 60.0
+
+        for _ in range(limiter.burst):
+            await limiter.acquire()
+        assert waits == []
+
+        await limiter.acquire()
+        assert waits == pytest.approx([limiter.interval])
+
+    @pytest.mark.asyncio
+    async def test_interactive_requests_overtake_queued_bulk_requests(self):
+        limiter = RateLimiter(plan="premium")
+        await limiter.acquire()
+        order: list[str] = []
+
+        async def acquire_and_record(name: str, priority: RequestPriority) -> None:
+            await limiter.acquire(priority)
+            order.append(name)
+
+        bulk = [
+            asyncio.create_task(acquire_and_record(f"bulk-{i}", "bulk"))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(acquire_and_record("interactive", "interactive"))
+        await asyncio.gather(*bulk, interactive)
+
+        assert order == ["interactive", "bulk-0", "bulk-1", "bulk-2"]
+
+    @pytest.mark.asyncio
+    async def test_raised_shared_priority_overtakes_queued_bulk_requests(self):
+        limiter = RateLimiter(plan="premium")
+        await limiter.acquire()
+        order: list[str] = []
+        shared = SharedRequestPriority("bulk")
+
+        async def acquire_and_record(name: str, priority: RequestPriority | None) -> None:
+            await limiter.acquire(priority)
+            order.append(name)
+
+        bulk = [
+            asyncio.create_task(acquire_and_record(f"bulk-{i}", "bulk"))
+            for i in range(3)
+        ]
+        with shared_request_priority(shared):
+            coalesced = asyncio.create_task(acquire_and_record("coalesced", None))
+        await asyncio.sleep(0)
+        assert shared.raise_to("interactive") is True
+        limiter.reprioritize()
+        await asyncio.gather(*bulk, coalesced)
+
+        assert order == ["coalesced", "bulk-0", "bulk-1", "bulk-2"]
+
+    def test_shared_priority_is_only_raised(self):
+        shared = SharedRequestPriority("interactive")
+
+        assert shared.raise_to("bulk") is False
+        assert shared.priority == "interactive"
+
+    @pytest.mark.asyncio
+    async def test_request_priority_context_sets_default_priority(self):
+        assert current_request_priority() == "interactive"
+        with request_priority("bulk"):
+            assert current_request_priority() == "bulk"
+            task = asyncio.create_task(_priority_in_task())
+        assert await task == "bulk"
+        assert current_request_priority() == "interactive"
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+import duckdb
+import pytest
+
+from src.infrastructure.db.market.intraday_cube_queries import (
+    intraday_cubes_cover_range,
+    query_intraday_bars,
+)
+from src.infrastructure.db.market.intraday_cube_writers import (
+    ensure_intraday_cube_tables,
+    list_minute_dates_missing_from_cubes,
+    rebuild_intraday_cubes_for_dates,
+)
+
+
+def _minute(
+    code: str,
+    date: str,
+    time: str,
+    open_: float,
+    close: float,
+    volume: int | None = 100,
+) -> tuple[Any, ...]:
+    return (
+        code,
+        date,
+        time,
+        open_,
+        max(open_, close) + 1.0,
+        min(open_, close) - 1.0,
+        close,
+        volume,
+        float(close * (volume or 0)),
+        None,
+    )
+
+
+@pytest.fixture()
+def conn() -> Iterator[Any]:
+    connection = duckdb.connect(":memory:")
+    connection.execute(
+        """
+        CREATE TABLE stock_data_minute_raw (
+            code TEXT, date TEXT, time TEXT, open DOUBLE, high DOUBLE, low DOUBLE,
+            close DOUBLE, volume BIGINT, turnover_value DOUBLE, created_at TEXT,
+            PRIMARY KEY (code, date, time)
+        )
+        """
+    )
+    connection.executemany(
+        "INSERT INTO stock_data_minute_raw VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            _minute("72030", "2024-01-05", "09:00", 100.0, 101.0),
+            _minute("72030", "2024-01-05", "09:07", 101.0, 102.0),
+            _minute("72030", "2024-01-05", "10:44", 102.0, 103.0),
+            _minute("72030", "2024-01-05", "10:46", 103.0, 104.0, volume=None),
+            _minute("72030", "2024-01-05", "15:30", 104.0, 105.0),
+            _minute("6758", "2024-01-05", "09:01", 200.0, 199.0),
+            _minute("6758", "2024-01-08", "09:00", 210.0, 211.0),
+        ],
+    )
+    ensure_intraday_cube_tables(connection)
+    yield connection
+    connection.close()
+
+
+def test_rebuild_materializes_sessions_bars_and_snapshots(conn: Any) -> None:
+    result = rebuild_intraday_cubes_for_dates(conn, ["2024-01-05"])
+
+    assert result.dates == ("2024-01-05",)
+    assert result.session_rows == 2
+    assert conn.execute(
+        """
+        SELECT open, open_time, close, close_time, bar_count, volume
+        FROM stock_intraday_sessions
+        WHERE code = '7203'
+        """
+    ).fetchall() == [(100.0, "09:00", 105.0, "15:30", 5, 400)]
+
+    bars = query_intraday_bars(conn, interval_minutes=15, codes=["7203"])
+    assert tuple(bars["bucket_start_time"]) == ("09:00", "10:44", "15:30")
+    first_bar = bars.iloc[0]
+    assert (first_bar["open"], first_bar["close"]) == (100.0, 102.0)
+    assert first_bar["source_bar_count"] == 2
+    assert bars["day_open"].tolist() == [100.0, 100.0, 100.0]
+    assert bars.iloc[-1]["close_return_from_open"] == pytest.approx(0.05)
+
+    assert conn.execute(
+        """
+        SELECT entry_open, entry_time, exit_close, exit_time, cum_volume
+        FROM stock_intraday_snapshots
+        WHERE code = '7203' AND snapshot_time = '10:45'
+        """
+    ).fetchall() == [(103.0, "10:46", 103.0, "10:44", 300)]
+
+
+def test_rebuild_replaces_only_requested_dates(conn: Any) -> None:
+    rebuild_intraday_cubes_for_dates(conn, ["2024-01-05", "2024-01-08"])
+    conn.execute(
+        "UPDATE stock_data_minute_raw SET close = 999.0 WHERE time = '09:00'"
+    )
+
+    rebuild_intraday_cubes_for_dates(conn, ["2024-01-08"])
+
+    assert conn.execute(
+        "SELECT date, code, close FROM stock_intraday_sessions ORDER BY date, code"
+    ).fetchall() == [
+        ("2024-01-05", "6758", 199.0),
+        ("2024-01-05", "7203", 105.0),
+        ("2024-01-08", "6758", 999.0),
+    ]
+
+
+def test_coverage_tracks_built_dates_in_manifest(conn: Any) -> None:
+    assert list_minute_dates_missing_from_cubes(conn) == ["2024-01-05", "2024-01-08"]
+    assert not intraday_cubes_cover_range(conn)
+
+    rebuild_intraday_cubes_for_dates(conn, ["2024-01-05"])
+
+    assert intraday_cubes_cover_range(conn, end_date="2024-01-05")
+    assert not intraday_cubes_cover_range(conn, start_date="2024-01-06")
+    assert list_minute_dates_missing_from_cubes(conn) == ["2024-01-08"]
+
+
+def test_manifest_records_dates_without_usable_minutes(conn: Any) -> None:
+    conn.execute(
+        "UPDATE stock_data_minute_raw SET open = 0.0 WHERE date = '2024-01-08'"
+    )
+
+    result = rebuild_intraday_cubes_for_dates(conn, ["2024-01-05", "2024-01-08"])
+
+    assert result.session_rows == 2
+    assert conn.execute(
+        "SELECT date, session_rows FROM stock_intraday_cube_dates ORDER BY date"
+    ).fetchall() == [("2024-01-05", 2), ("2024-01-08", 0)]
+    assert list_minute_dates_missing_from_cubes(conn) == []
+    assert intraday_cubes_cover_range(conn, start_date="2024-01-08")
+
+
+def test_bar_query_rejects_unmaterialized_intervals(conn: Any) -> None:
+    with pytest.raises(ValueError):
+        query_intraday_bars(conn, interval_minutes=7)
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from threading import RLock
+from typing import Any
+
+import pytest
+
+from src.infrastructure.db.market.latest_quote_queries import fetch_latest_quotes
+from src.infrastructure.db.market.latest_quote_writers import (
+    rebuild_stock_latest_quotes_from_stock_data,
+)
+from src.infrastructure.db.market.market_db import MarketDb
+from src.infrastructure.db.market.market_mutations import MarketMutationStats
+from tests.unit.server.db.market_writer_test_support import open_market_db
+
+
+@pytest.fixture()
+def market_db(tmp_path: Path) -> Iterator[MarketDb]:
+    db = open_market_db(str(tmp_path / "market.duckdb"))
+    yield db
+    db.close()
+
+
+class _DbQueryAdapter:
+    """Expose MarketDb's writer connection through the reader query protocol."""
+
+    def __init__(self, market_db: MarketDb) -> None:
+        self._market_db = market_db
+
+    def query(self, sql: str, params: tuple[Any, ...] = ()) -> list[dict[str, Any]]:
+        cursor = self._market_db._conn.execute(sql, list(params))
+        names = [column[0] for column in cursor.description]
+        return [dict(zip(names, row, strict=True)) for row in cursor.fetchall()]
+
+    def query_one(self, sql: str, params: tuple[Any, ...] = ()) -> dict[str, Any] | None:
+        rows = self.query(sql, params)
+        return rows[0] if rows else None
+
+
+def _seed_prices(
+    market_db: MarketDb,
+    code: str,
+    closes: list[float],
+    *,
+    start_day: int = 1,
+) -> None:
+    for offset, close in enumerate(closes):
+        date = f"2024-01-{start_day + offset:02d}"
+        market_db._execute(
+            """
+            INSERT INTO stock_data (
+                code, date, open, high, low, close, volume,
+                adjustment_factor, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, 1000, 1.0, NULL)
+            """,
+            [code, date, close, close, close, close],
+        )
+
+
+def _rows(market_db: MarketDb) -> list[tuple[Any, ...]]:
+    return market_db._execute(
+        """
+        SELECT code, date, close, prev_date, prev_close, change
+        FROM stock_latest_quotes
+        ORDER BY code
+        """
+    ).fetchall()
+
+
+def _rebuild(market_db: MarketDb) -> Any:
+    return rebuild_stock_latest_quotes_from_stock_data(
+        market_db._conn,
+        RLock(),
+        market_db._table_exists,
+    )
+
+
+def test_first_rebuild_keeps_last_two_sessions_per_code(market_db: MarketDb) -> None:
+    _seed_prices(market_db, "7203", [100, 110, 121])
+    _seed_prices(market_db, "6758", [50])
+
+    result = _rebuild(market_db)
+
+    assert result.stats == MarketMutationStats(
+        input=2, inserted=2, updated=0, unchanged=0, deleted=0
+    )
+    assert result.final_count == 2
+    assert _rows(market_db) == [
+        ("6758", "2024-01-01", 50.0, None, None, None),
+        ("7203", "2024-01-03", 121.0, "2024-01-02", 110.0, 11.0),
+    ]
+
+
+def test_exact_repeat_is_unchanged_and_new_session_updates_row(market_db: MarketDb) -> None:
+    _seed_prices(market_db, "7203", [100, 110])
+    _rebuild(market_db)
+
+    repeat = _rebuild(market_db)
+    assert repeat.stats == MarketMutationStats(
+        input=1, inserted=0, updated=0, unchanged=1, deleted=0
+    )
+
+    _seed_prices(market_db, "7203", [99], start_day=3)
+    updated = _rebuild(market_db)
+
+    assert updated.stats == MarketMutationStats(
+        input=1, inserted=0, updated=1, unchanged=0, deleted=0
+    )
+    assert _rows(market_db) == [("7203", "2024-01-03", 99.0, "2024-01-02", 110.0, -11.0)]
+
+
+def test_four_and_five_digit_duplicates_keep_four_digit_precedence(
+    market_db: MarketDb,
+) -> None:
+    _seed_prices(market_db, "72030", [1, 2])
+    _seed_prices(market_db, "7203", [100, 200])
+
+    _rebuild(market_db)
+
+    assert _rows(market_db) == [("7203", "2024-01-02", 200.0, "2024-01-01", 100.0, 100.0)]
+
+
+def test_removed_code_is_deleted(market_db: MarketDb) -> None:
+    _seed_prices(market_db, "7203", [100, 110])
+    _seed_prices(market_db, "6758", [50, 55])
+    _rebuild(market_db)
+
+    market_db._execute("DELETE FROM stock_data WHERE code = '6758'")
+    result = _rebuild(market_db)
+
+    assert result.stats == MarketMutationStats(
+        input=1, inserted=0, updated=0, unchanged=1, deleted=1
+    )
+    assert [row[0] for row in _rows(market_db)] == ["7203"]
+
+
+def test_fetch_latest_quotes_reads_materialized_and_falls_back_for_unsynced_codes(
+    market_db: MarketDb,
+) -> None:
+    _seed_prices(market_db, "7203", [100, 110])
+    _rebuild(market_db)
+    _seed_prices(market_db, "67580", [50, 55])
+
+    quotes = fetch_latest_quotes(_DbQueryAdapter(market_db), ["72030", "6758", "9999"])
+
+    assert set(quotes) == {"7203", "6758"}
+    assert quotes["7203"].close == 110.0
+    assert quotes["7203"].prev_close == 100.0
+    assert quotes["6758"].date == "2024-01-02"
+    assert quotes["6758"].prev_date == "2024-01-01"
+    assert quotes["6758"].prev_close == 50.0
+
+
+def test_five_and_six_character_duplicates_keep_real_code_precedence(
+    market_db: MarketDb,
+) -> None:
+    _seed_prices(market_db, "285A10", [1, 2])
+    _seed_prices(market_db, "285A1", [100, 200])
+
+    _rebuild(market_db)
+
+    assert _rows(market_db) == [("285A1", "2024-01-02", 200.0, "2024-01-01", 100.0, 100.0)]
+
+
+def test_fetch_latest_quotes_normalizes_six_character_api_codes(
+    market_db: MarketDb,
+) -> None:
+    _seed_prices(market_db, "285A10", [50, 55])
+
+    quotes = fetch_latest_quotes(_DbQueryAdapter(market_db), ["285A1"])
+
+    assert set(quotes) == {"285A1"}
+    assert quotes["285A1"].close == 55.0
+    assert quotes["285A1"].prev_close == 50.0
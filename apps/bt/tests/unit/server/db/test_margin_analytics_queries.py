@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.application.services.screening_margin_loader import attach_margin
+from src.application.services.screening_market_loader import load_market_multi_data
+from src.domains.analytics.screening_requirements import build_strategy_data_requirements
+from src.domains.analytics.margin_metrics import (
+    compute_margin_flow_pressure,
+    compute_margin_long_pressure,
+    compute_margin_turnover_days,
+    compute_margin_volume_ratio,
+)
+from src.infrastructure.db.market.margin_analytics_queries import (
+    query_margin_analytics_panel,
+    query_margin_analytics_snapshot,
+)
+from src.domains.strategy.signals.registry import SIGNAL_REGISTRY
+from src.infrastructure.db.market.market_reader import MarketDbReader
+from src.shared.models.config import SharedConfig
+from src.shared.models.signals import SignalParams
+
+PERIOD = 5
+
+
+def _build_rows() -> tuple[list[tuple[object, ...]], list[tuple[object, ...]]]:
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2024-01-01", periods=60)
+    stock_rows: list[tuple[object, ...]] = []
+    margin_rows: list[tuple[object, ...]] = []
+    # 72030 は API code（5 桁）で格納され、7203 として集計される
+    for db_code in ("72030", "6758", "9984"):
+        for position, day in enumerate(dates):
+            if db_code == "9984" and position in {10, 11}:
+                continue
+            volume = 0.0 if position % 17 == 0 else float(rng.integers(1_000, 50_000))
+            stock_rows.append((db_code, day.strftime("%Y-%m-%d"), 1.0, 1.0, 1.0, 1.0, volume))
+        for day in dates[dates.weekday == 4]:
+            short = None if db_code == "6758" and day == dates[24] else float(rng.integers(0, 20_000))
+            margin_rows.append(
+                (db_code, day.strftime("%Y-%m-%d"), float(rng.integers(0, 80_000)), short)
+            )
+    # 株価の無い日付の信用残高（週平均は算出されるが移動平均は未定義）
+    margin_rows.append(("9984", dates[11].strftime("%Y-%m-%d"), 10_000.0, 5_000.0))
+    return stock_rows, margin_rows
+
+
+@pytest.fixture()
+def reader(tmp_path: Path) -> Iterator[MarketDbReader]:
+    db_path = tmp_path / "market.duckdb"
+    stock_rows, margin_rows = _build_rows()
+    conn = duckdb.connect(str(db_path))
+    conn.execute(
+        """
+        CREATE TABLE stock_data (
+            code TEXT, date TEXT, open DOUBLE, high DOUBLE, low DOUBLE,
+            close DOUBLE, volume DOUBLE
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE margin_data (
+            code TEXT, date TEXT, long_margin_volume DOUBLE, short_margin_volume DOUBLE
+        )
+        """
+    )
+    conn.executemany("INSERT INTO stock_data VALUES (?, ?, ?, ?, ?, ?, ?)", stock_rows)
+    conn.executemany("INSERT INTO margin_data VALUES (?, ?, ?, ?)", margin_rows)
+    conn.close()
+    market_reader = MarketDbReader(str(db_path))
+    yield market_reader
+    market_reader.close()
+
+
+def _per_symbol_frames(
+    reader: MarketDbReader, code: str
+) -> tuple[pd.DataFrame, pd.Series]:
+    db_codes = (code, f"{code}0")
+    margin = reader.query_dataframe(
+        "SELECT date, long_margin_volume AS longMarginVolume, "
+        "short_margin_volume AS shortMarginVolume FROM margin_data "
+        "WHERE code IN (?, ?) ORDER BY date",
+        db_codes,
+    )
+    margin["date"] = pd.to_datetime(margin["date"])
+    quotes = reader.query_dataframe(
+        "SELECT date, volume FROM stock_data WHERE code IN (?, ?) ORDER BY date",
+        db_codes,
+    )
+    quotes["date"] = pd.to_datetime(quotes["date"])
+    return margin.set_index("date"), quotes.set_index("date")["volume"]
+
+
+def _panel_records(panel: pd.DataFrame, code: str, column: str, digits: int = 4) -> dict[str, float]:
+    rows = panel[(panel["code"] == code) & panel[column].notna()]
+    return {str(row["date"]): round(float(row[column]), digits) for _, row in rows.iterrows()}
+
+
+@pytest.mark.parametrize("code", ["7203", "6758", "9984"])
+def test_panel_matches_per_symbol_metrics(reader: MarketDbReader, code: str) -> None:
+    panel = query_margin_analytics_panel(reader, period=PERIOD)
+    margin, volume = _per_symbol_frames(reader, code)
+
+    long_pressure = compute_margin_long_pressure(margin, volume, PERIOD)
+    flow_pressure = compute_margin_flow_pressure(margin, volume, PERIOD)
+    turnover_days = compute_margin_turnover_days(margin, volume, PERIOD)
+    volume_ratio = compute_margin_volume_ratio(margin, volume)
+
+    assert long_pressure and flow_pressure and volume_ratio
+    assert _panel_records(panel, code, "long_pressure") == {
+        r["date"]: r["pressure"] for r in long_pressure
+    }
+    assert _panel_records(panel, code, "flow_pressure") == {
+        r["date"]: r["flowPressure"] for r in flow_pressure
+    }
+    assert _panel_records(panel, code, "turnover_days") == {
+        r["date"]: r["turnoverDays"] for r in turnover_days
+    }
+    assert _panel_records(panel, code, "long_ratio") == {
+        r["date"]: r["longRatio"] for r in volume_ratio
+    }
+    assert _panel_records(panel, code, "short_ratio") == {
+        r["date"]: r["shortRatio"] for r in volume_ratio
+    }
+    weekly = _panel_records(panel, code, "weekly_avg_volume", 2)
+    assert {r["date"]: weekly[r["date"]] for r in volume_ratio} == {
+        r["date"]: r["weeklyAvgVolume"] for r in volume_ratio
+    }
+
+
+def test_snapshot_resolves_latest_margin_date_and_filters_codes(reader: MarketDbReader) -> None:
+    full = query_margin_analytics_panel(reader, period=PERIOD)
+
+    margin_date, snapshot = query_margin_analytics_snapshot(
+        reader, period=PERIOD, as_of_date="2024-03-06", codes=["72030", "9984"]
+    )
+
+    assert margin_date == "2024-03-01"
+    assert sorted(snapshot["code"]) == ["7203", "9984"]
+    expected = full[full["date"] == margin_date].set_index("code")
+    for _, row in snapshot.iterrows():
+        assert row["long_pressure"] == pytest.approx(expected.at[row["code"], "long_pressure"])
+        assert row["flow_pressure"] == pytest.approx(expected.at[row["code"], "flow_pressure"])
+
+
+def test_attach_margin_adds_pressure_features(reader: MarketDbReader) -> None:
+    daily_index = pd.bdate_range("2024-02-01", "2024-03-22")
+    result: dict[str, dict[str, pd.DataFrame]] = {"7203": {"daily": pd.DataFrame(index=daily_index)}}
+
+    warnings = attach_margin(
+        reader,
+        result,
+        {"7203": daily_index},
+        start_date="2024-02-01",
+        end_date="2024-03-22",
+        pressure_period=PERIOD,
+    )
+
+    assert warnings == []
+    margin_daily = result["7203"]["margin_daily"]
+    panel = query_margin_analytics_panel(reader, period=PERIOD, codes=["7203"])
+    friday = panel[panel["date"] == "2024-03-15"].iloc[0]
+    assert margin_daily.at[pd.Timestamp("2024-03-18"), "LongPressure"] == pytest.approx(
+        friday["long_pressure"]
+    )
+    assert {"LongMargin", "FlowPressure", "TurnoverDays", "LongVolumeRatio"} <= set(
+        margin_daily.columns
+    )
+
+
+def test_screen_with_margin_pressure_signal_loads_pressure_columns(reader: MarketDbReader) -> None:
+    shared_config = SharedConfig.model_validate(
+        {"universe_preset": "primeExTopix500", "timeframe": "daily"},
+        context={"resolve_stock_codes": False},
+    )
+    entry_params = SignalParams.model_validate(
+        {
+            "margin_pressure": {
+                "enabled": True,
+                "metric": "long_pressure",
+                "period": PERIOD,
+                "threshold": 0.0,
+                "direction": "above",
+            }
+        }
+    )
+    requirements = build_strategy_data_requirements(
+        shared_config=shared_config,
+        entry_params=entry_params,
+        exit_params=SignalParams(),
+        stock_codes=("7203",),
+        start_date="2024-02-01",
+        end_date="2024-03-22",
+        signal_registry=SIGNAL_REGISTRY,
+    )
+    key = requirements.multi_data_key
+    assert key.include_margin_data is True
+    assert key.margin_pressure_period == PERIOD
+
+    multi_data, warnings = load_market_multi_data(
+        reader,
+        list(key.stock_codes),
+        start_date=key.start_date,
+        end_date=key.end_date,
+        include_margin_data=key.include_margin_data,
+        margin_pressure_period=key.margin_pressure_period,
+    )
+
+    assert warnings == []
+    margin_daily = multi_data["7203"]["margin_daily"]
+    signal_def = next(s for s in SIGNAL_REGISTRY if s.param_key == "margin_pressure")
+    data_sources = {"margin_data": margin_daily}
+    assert signal_def.data_checker is not None and signal_def.data_checker(data_sources)
+    signal = signal_def.signal_func(**signal_def.param_builder(entry_params, data_sources))
+    expected = margin_daily["LongPressure"].gt(0.0)
+    pd.testing.assert_series_equal(signal, expected, check_names=False)
+    assert signal.any()
@@ -17,6 +17,7 @@ RAW_DUCKDB_WRITER_ALLOWLIST = {
     SRC / "domains/analytics/readonly_duckdb_support.py",
     SRC / "domains/analytics/research_bundle.py",
     SRC / "domains/analytics/turtle_like_momentum_research.py",
+    SRC / "infrastructure/external_api/clients/moomoo_history_cache.py",
 }
 
 
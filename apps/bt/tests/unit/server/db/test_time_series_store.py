@@ -10,6 +10,7 @@ from time import sleep
 from typing import Any
 
 import duckdb
+import pandas as pd
 import pytest
 
 from src.infrastructure.db.market.time_series_store import DuckDbParquetTimeSeriesStore
@@ -877,6 +878,107 @@ def test_index_stock_minute_data_exports_partitioned_parquet(tmp_path: Path) ->
     store.close()
 
 
+def test_publish_stock_minute_frame_matches_row_publish_delta(tmp_path: Path) -> None:
+    store = open_time_series_store(
+        duckdb_path=str(tmp_path / "market-timeseries" / "market.duckdb"),
+        parquet_dir=str(tmp_path / "market-timeseries" / "parquet"),
+    )
+    rows = [
+        _stock_minute_row(date="2026-02-10", time="09:00"),
+        _stock_minute_row(date="2026-02-10", time="09:00"),
+        _stock_minute_row(date="2026-02-11", time="15:30"),
+    ]
+    rows[1]["close"] = 3.0
+
+    first = store.publish_stock_minute_frame(pd.DataFrame.from_records(rows))
+    repeated = store.publish_stock_minute_data(rows)
+
+    assert (first.stats.input, first.stats.inserted, first.stats.unchanged) == (3, 2, 1)
+    assert first.affected_dates == {"2026-02-10", "2026-02-11"}
+    assert repeated.mutated_rows == 0
+    assert store._conn.execute(  # noqa: SLF001
+        "SELECT close FROM stock_data_minute_raw WHERE date = '2026-02-10'"
+    ).fetchall() == [(3.0,)]
+    assert store.publish_stock_minute_frame(pd.DataFrame()).mutated_rows == 0
+    assert store.has_pending_index("stock_data_minute_raw")
+    store.close()
+
+
+def test_index_stock_minute_data_rebuilds_intraday_cubes_for_dirty_dates(
+    tmp_path: Path,
+) -> None:
+    store = create_time_series_store_for_test(
+        backend="duckdb-parquet",
+        duckdb_path=str(tmp_path / "market-timeseries" / "market.duckdb"),
+        parquet_dir=str(tmp_path / "market-timeseries" / "parquet"),
+    )
+    assert store is not None
+
+    store.publish_stock_minute_data(
+        [
+            _stock_minute_row(date="2026-02-10", time="09:00"),
+            _stock_minute_row(date="2026-02-10", time="09:01"),
+            _stock_minute_row(date="2026-02-11", time="15:30"),
+        ]
+    )
+    store.index_stock_minute_data()
+
+    conn = store._conn  # noqa: SLF001
+    assert conn.execute(
+        "SELECT date, bar_count FROM stock_intraday_sessions ORDER BY date"
+    ).fetchall() == [("2026-02-10", 2), ("2026-02-11", 1)]
+    assert conn.execute(
+        "SELECT count(*) FROM stock_intraday_bars WHERE interval_minutes = 5"
+    ).fetchone() == (2,)
+
+    store.close()
+
+
+def test_index_stock_minute_data_scans_for_unbuilt_cube_dates_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import src.infrastructure.db.market.time_series_store as store_module
+
+    store = create_time_series_store_for_test(
+        backend="duckdb-parquet",
+        duckdb_path=str(tmp_path / "market-timeseries" / "market.duckdb"),
+        parquet_dir=str(tmp_path / "market-timeseries" / "parquet"),
+    )
+    assert store is not None
+    scans: list[list[str]] = []
+    rebuilt: list[set[str]] = []
+    original_scan = store_module.list_minute_dates_missing_from_cubes
+    original_rebuild = store_module.rebuild_intraday_cubes_for_dates
+
+    def recording_scan(conn: Any) -> list[str]:
+        scans.append(original_scan(conn))
+        return scans[-1]
+
+    def recording_rebuild(conn: Any, dates: Any) -> Any:
+        rebuilt.append(set(dates))
+        return original_rebuild(conn, dates)
+
+    monkeypatch.setattr(store_module, "list_minute_dates_missing_from_cubes", recording_scan)
+    monkeypatch.setattr(store_module, "rebuild_intraday_cubes_for_dates", recording_rebuild)
+
+    unusable_row = {**_stock_minute_row(date="2026-02-09"), "open": 0.0}
+    store.publish_stock_minute_data([unusable_row, _stock_minute_row()])
+    store.index_stock_minute_data()
+    store.index_stock_minute_data()
+    store.publish_stock_minute_data([_stock_minute_row(date="2026-02-11")])
+    store.index_stock_minute_data()
+
+    conn = store._conn  # noqa: SLF001
+    assert scans == [["2026-02-09", "2026-02-10"]]
+    assert rebuilt == [{"2026-02-09", "2026-02-10"}, {"2026-02-11"}]
+    assert conn.execute(
+        "SELECT date, session_rows FROM stock_intraday_cube_dates ORDER BY date"
+    ).fetchall() == [("2026-02-09", 0), ("2026-02-10", 1), ("2026-02-11", 1)]
+
+    store.close()
+
+
 def test_minute_partition_deletion_failure_keeps_dirty_state(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -43,11 +43,12 @@ class _FakeMoomooService:
         start: str | None,
         end: str | None,
         max_rows: int | None,
+        timeframe: str = "1d",
     ) -> dict[str, Any]:
         return {
             "symbol": symbol.upper(),
             "code": "US.AAPL",
-            "timeframe": "1d",
+            "timeframe": timeframe,
             "adjustment": "qfq",
             "rows": [
                 {
@@ -90,6 +91,7 @@ class _FailingMoomooService(_FakeMoomooService):
         start: str | None,
         end: str | None,
         max_rows: int | None,
+        timeframe: str = "1d",
     ) -> dict[str, Any]:
         raise MoomooOpenDError(503, "moomoo OpenD is not reachable")
 
@@ -130,6 +132,16 @@ def test_us_search_history_and_snapshot_routes() -> None:
     assert snapshot_resp.json()["items"][0]["lastPrice"] == 101
 
 
+def test_history_route_passes_minute_timeframe() -> None:
+    client = _client(_FakeMoomooService())
+    resp = client.get("/api/moomoo/us/history?symbol=AAPL&timeframe=1m")
+    assert resp.status_code == 200
+    assert resp.json()["timeframe"] == "1m"
+
+    invalid = client.get("/api/moomoo/us/history?symbol=AAPL&timeframe=5m")
+    assert invalid.status_code == 422
+
+
 def test_history_rejects_reversed_date_range() -> None:
     client = _client(_FakeMoomooService())
     resp = client.get("/api/moomoo/us/history?symbol=AAPL&from=2025-02-01&to=2025-01-01")
@@ -7,7 +7,10 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from src.application.services.expiring_singleflight_cache import ExpiringSingleFlightCache
+from src.application.services.expiring_singleflight_cache import (
+    ExpiringSingleFlightCache,
+    SqliteCacheDiskStore,
+)
 
 
 @pytest.mark.asyncio
@@ -114,3 +117,154 @@ async def test_clear_and_invalidate() -> None:
     assert state_after_invalidate == "miss"
     assert value_after_clear == 3
     assert state_after_clear == "miss"
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_keeps_cache_within_max_bytes() -> None:
+    cache = ExpiringSingleFlightCache[str](max_bytes=25)
+
+    await cache.get_or_set("a", ttl_seconds=60, fetcher=AsyncMock(return_value="x" * 8))
+    await cache.get_or_set("b", ttl_seconds=60, fetcher=AsyncMock(return_value="y" * 8))
+    _, state_a = await cache.get_or_set("a", ttl_seconds=60, fetcher=AsyncMock(return_value="new"))
+    await cache.get_or_set("c", ttl_seconds=60, fetcher=AsyncMock(return_value="z" * 8))
+
+    assert state_a == "hit"
+    assert list(cache._entries) == ["a", "c"]  # noqa: SLF001
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= 25
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+
+
+@pytest.mark.asyncio
+async def test_values_larger_than_max_bytes_are_not_kept_in_memory() -> None:
+    cache = ExpiringSingleFlightCache[str](max_bytes=4)
+
+    value, state = await cache.get_or_set("k", ttl_seconds=60, fetcher=AsyncMock(return_value="too large"))
+
+    assert (value, state) == ("too large", "miss")
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_refreshing_in_background() -> None:
+    now = [0.0]
+    cache = ExpiringSingleFlightCache[int](clock=lambda: now[0])
+    fetcher = AsyncMock(side_effect=[1, 2])
+
+    await cache.get_or_set("k", ttl_seconds=10, fetcher=fetcher, stale_ttl_seconds=60)
+    now[0] = 20.0
+    stale_value, stale_state = await cache.get_or_set("k", ttl_seconds=10, fetcher=fetcher, stale_ttl_seconds=60)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    fresh_value, fresh_state = await cache.get_or_set("k", ttl_seconds=10, fetcher=fetcher, stale_ttl_seconds=60)
+
+    assert (stale_value, stale_state) == (1, "stale")
+    assert (fresh_value, fresh_state) == (2, "hit")
+    assert fetcher.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_window_expiry_forces_synchronous_fetch() -> None:
+    now = [0.0]
+    cache = ExpiringSingleFlightCache[int](clock=lambda: now[0])
+    fetcher = AsyncMock(side_effect=[1, 2])
+
+    await cache.get_or_set("k", ttl_seconds=10, fetcher=fetcher, stale_ttl_seconds=5)
+    now[0] = 16.0
+    value, state = await cache.get_or_set("k", ttl_seconds=10, fetcher=fetcher, stale_ttl_seconds=5)
+
+    assert (value, state) == (2, "miss")
+    assert cache.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_restart(tmp_path) -> None:
+    store_path = tmp_path / "cache.sqlite3"
+    first = ExpiringSingleFlightCache[dict[str, int]](disk_store=SqliteCacheDiskStore(store_path))
+    await first.get_or_set("k", ttl_seconds=60, fetcher=AsyncMock(return_value={"v": 1}))
+
+    restarted = ExpiringSingleFlightCache[dict[str, int]](disk_store=SqliteCacheDiskStore(store_path))
+    fetcher = AsyncMock(return_value={"v": 2})
+    value, state = await restarted.get_or_set("k", ttl_seconds=60, fetcher=fetcher)
+
+    assert (value, state) == ({"v": 1}, "hit")
+    assert fetcher.await_count == 0
+    assert restarted.stats()["diskHits"] == 1
+
+    await restarted.invalidate("k")
+    value_after_invalidate, _ = await restarted.get_or_set("k", ttl_seconds=60, fetcher=fetcher)
+    assert value_after_invalidate == {"v": 2}
+
+
+def test_sqlite_disk_store_trims_oldest_entries_over_max_bytes(tmp_path) -> None:
+    from src.application.services.expiring_singleflight_cache import PersistedCacheEntry
+
+    store = SqliteCacheDiskStore(tmp_path / "cache.sqlite3", max_bytes=10)
+    entry = PersistedCacheEntry(payload=b"123456", expires_at=4_000_000_000.0, stale_until=4_000_000_000.0)
+
+    store.put("old", entry)
+    store.put("new", entry)
+
+    assert store.get("old") is None
+    assert store.get("new") == entry
+
+
+def test_sqlite_disk_store_tracks_total_bytes_and_sweeps_expired_rows(tmp_path) -> None:
+    from src.application.services.expiring_singleflight_cache import PersistedCacheEntry
+
+    path = tmp_path / "cache.sqlite3"
+    store = SqliteCacheDiskStore(path, max_bytes=100, sweep_interval_seconds=3600.0)
+    live = PersistedCacheEntry(payload=b"1234", expires_at=4_000_000_000.0, stale_until=4_000_000_000.0)
+    expired = PersistedCacheEntry(payload=b"12345678", expires_at=1.0, stale_until=1.0)
+
+    store.put("live", live)
+    store.put("expired", expired)
+    # The sweep interval has not elapsed, so the expired row is still counted.
+    assert store.total_bytes == 12
+    store.put("live", PersistedCacheEntry(payload=b"12", expires_at=4e9, stale_until=4e9))
+    assert store.total_bytes == 10
+    store.delete("missing")
+    store.delete("live")
+    assert store.total_bytes == 8
+    store.close()
+
+    reopened = SqliteCacheDiskStore(path, max_bytes=100, sweep_interval_seconds=3600.0)
+    assert reopened.total_bytes == 8
+    reopened.put("live", live)
+    # First put after opening sweeps the expired row.
+    assert reopened.total_bytes == 4
+    assert reopened.get("expired") is None
+    reopened.clear()
+    assert reopened.total_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_hands_the_fetch_to_a_live_waiter() -> None:
+    cache = ExpiringSingleFlightCache[int]()
+    leader_started = asyncio.Event()
+    calls: list[str] = []
+
+    async def blocking_fetcher() -> int:
+        calls.append("leader")
+        leader_started.set()
+        await asyncio.Event().wait()
+        return 0
+
+    async def waiter_fetcher() -> int:
+        calls.append("waiter")
+        return 5
+
+    leader = asyncio.create_task(cache.get_or_set("k", ttl_seconds=60, fetcher=blocking_fetcher))
+    await leader_started.wait()
+    waiter = asyncio.create_task(cache.get_or_set("k", ttl_seconds=60, fetcher=waiter_fetcher))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    assert await asyncio.wait_for(waiter, timeout=1) == (5, "miss")
+    assert calls == ["leader", "waiter"]
+    assert await cache.get_or_set("k", ttl_seconds=60, fetcher=blocking_fetcher) == (5, "hit")
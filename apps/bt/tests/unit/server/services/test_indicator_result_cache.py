@@ -0,0 +1,212 @@
+"""
+Indicator result cache ユニットテスト
+"""
+
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.application.services.indicator_result_cache import (
+    IndicatorBarsFingerprint,
+    IndicatorResultCache,
+)
+from src.application.services.indicator_service import IndicatorService
+from src.domains.strategy.indicators.indicator_registry import (
+    INDICATOR_REGISTRY,
+    INDICATOR_TAIL_BARS,
+    indicator_tail_bars,
+)
+
+
+def _make_ohlcv(n: int = 200, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    base = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame(
+        {
+            "Open": base - 0.5,
+            "High": base + np.abs(rng.normal(0, 1, n)),
+            "Low": base - np.abs(rng.normal(0, 1, n)),
+            "Close": base,
+            "Volume": rng.integers(10_000, 100_000, n).astype(float),
+        },
+        index=pd.bdate_range("2024-01-01", periods=n),
+    )
+
+
+class _CountingCompute:
+    def __init__(self, ind_type: str) -> None:
+        self._fn = INDICATOR_REGISTRY[ind_type]
+        self.bars: list[int] = []
+
+    def __call__(
+        self, ohlcv: pd.DataFrame, params: dict[str, Any], nan_handling: str
+    ) -> tuple[str, list[dict[str, Any]]]:
+        self.bars.append(len(ohlcv))
+        return self._fn(ohlcv, params, nan_handling)
+
+
+def _compute(
+    cache: IndicatorResultCache,
+    ohlcv: pd.DataFrame,
+    ind_type: str,
+    params: dict[str, Any],
+    compute_fn: Any = None,
+    nan_handling: str = "include",
+) -> tuple[str, list[dict[str, Any]]]:
+    return cache.get_or_compute(
+        ("7203", "daily"),
+        ind_type,
+        params,
+        ohlcv,
+        IndicatorBarsFingerprint.from_ohlcv(ohlcv),
+        compute_fn or INDICATOR_REGISTRY[ind_type],
+        nan_handling,
+    )
+
+
+_BOUNDED_SPECS: list[tuple[str, dict[str, Any]]] = [
+    ("sma", {"period": 20}),
+    ("rsi", {"period": 14}),
+    ("macd", {}),
+    ("bollinger", {"period": 20, "std_dev": 2.0}),
+    ("sma_atr_bands", {"sma_period": 5, "atr_period": 20}),
+    ("nbar_support", {"period": 20}),
+    ("volume_comparison", {"ma_type": "median", "short_period": 10, "long_period": 50}),
+    ("trading_value_ma", {"period": 20}),
+    ("cmf", {"period": 20}),
+    ("recent_return", {"lookback_period": 20}),
+    ("risk_adjusted_return", {"lookback_period": 60, "ratio_type": "sortino"}),
+]
+
+
+class TestIndicatorTailBars:
+    def test_bounded_specs_cover_tail_registry(self):
+        assert {ind_type for ind_type, _ in _BOUNDED_SPECS} == set(INDICATOR_TAIL_BARS)
+
+    def test_unbounded_indicators_return_none(self):
+        assert indicator_tail_bars("ema", {"period": 20}) is None
+        assert indicator_tail_bars("obv", {}) is None
+        assert indicator_tail_bars("volume_comparison", {"ma_type": "ema"}) is None
+
+    def test_invalid_params_return_none(self):
+        assert indicator_tail_bars("sma", {}) is None
+
+    @pytest.mark.parametrize(("ind_type", "params"), _BOUNDED_SPECS)
+    def test_tail_window_reproduces_newest_value(self, ind_type: str, params: dict[str, Any]):
+        ohlcv = _make_ohlcv()
+        tail_bars = indicator_tail_bars(ind_type, params)
+        assert tail_bars is not None
+
+        _, full_records = INDICATOR_REGISTRY[ind_type](ohlcv, params, "include")
+        _, tail_records = INDICATOR_REGISTRY[ind_type](ohlcv.iloc[-tail_bars:], params, "include")
+
+        assert tail_records[-1] == full_records[-1]
+
+
+class TestIndicatorResultCache:
+    def test_identical_bars_hit_cache(self):
+        cache = IndicatorResultCache()
+        ohlcv = _make_ohlcv()
+        compute_fn = _CountingCompute("ema")
+
+        first = _compute(cache, ohlcv, "ema", {"period": 20}, compute_fn)
+        second = _compute(cache, ohlcv.copy(), "ema", {"period": 20}, compute_fn)
+
+        assert second == first
+        assert compute_fn.bars == [200]
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.parametrize(("ind_type", "params"), _BOUNDED_SPECS)
+    @pytest.mark.parametrize("nan_handling", ["include", "omit"])
+    def test_appended_bar_extends_tail(
+        self, ind_type: str, params: dict[str, Any], nan_handling: str
+    ):
+        cache = IndicatorResultCache()
+        full = _make_ohlcv(201)
+        compute_fn = _CountingCompute(ind_type)
+
+        _compute(cache, full.iloc[:-1], ind_type, params, compute_fn, nan_handling)
+        result = _compute(cache, full, ind_type, params, compute_fn, nan_handling)
+
+        assert result == INDICATOR_REGISTRY[ind_type](full, params, nan_handling)
+        assert compute_fn.bars == [200, indicator_tail_bars(ind_type, params)]
+        assert cache.stats()["extensions"] == 1
+
+    def test_updated_newest_bar_replaces_last_record(self):
+        cache = IndicatorResultCache()
+        ohlcv = _make_ohlcv()
+        updated = ohlcv.copy()
+        updated.iloc[-1, updated.columns.get_loc("Close")] += 5.0
+        compute_fn = _CountingCompute("sma")
+
+        _compute(cache, ohlcv, "sma", {"period": 20}, compute_fn)
+        key, records = _compute(cache, updated, "sma", {"period": 20}, compute_fn)
+
+        assert (key, records) == INDICATOR_REGISTRY["sma"](updated, {"period": 20}, "include")
+        assert len(records) == 200
+        assert compute_fn.bars == [200, 20]
+
+    def test_changed_older_bar_recomputes_full_series(self):
+        cache = IndicatorResultCache()
+        ohlcv = _make_ohlcv()
+        adjusted = ohlcv.copy()
+        adjusted.iloc[10, adjusted.columns.get_loc("Close")] *= 0.5
+        compute_fn = _CountingCompute("sma")
+
+        _compute(cache, ohlcv, "sma", {"period": 20}, compute_fn)
+        result = _compute(cache, adjusted, "sma", {"period": 20}, compute_fn)
+
+        assert result == INDICATOR_REGISTRY["sma"](adjusted, {"period": 20}, "include")
+        assert compute_fn.bars == [200, 200]
+
+    def test_unbounded_indicator_recomputes_on_new_bar(self):
+        cache = IndicatorResultCache()
+        full = _make_ohlcv(201)
+        compute_fn = _CountingCompute("ema")
+
+        _compute(cache, full.iloc[:-1], "ema", {"period": 20}, compute_fn)
+        _compute(cache, full, "ema", {"period": 20}, compute_fn)
+
+        assert compute_fn.bars == [200, 201]
+
+    def test_evicts_least_recently_used_entries(self):
+        cache = IndicatorResultCache(max_entries=2)
+        ohlcv = _make_ohlcv(50)
+
+        for period in (5, 10, 20):
+            _compute(cache, ohlcv, "sma", {"period": period})
+        _compute(cache, ohlcv, "sma", {"period": 20})
+
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["records"] == 100
+        assert stats["hits"] == 1
+
+
+class TestIndicatorServiceResultCache:
+    def test_compute_indicators_reuses_cache_across_services(self):
+        cache = IndicatorResultCache()
+        ohlcv = _make_ohlcv()
+        spec = [{"type": "sma", "params": {"period": 20}}]
+        results = []
+        for _ in range(2):
+            service = IndicatorService(result_cache=cache)
+            with patch.object(service, "load_ohlcv", return_value=ohlcv):
+                results.append(service.compute_indicators("7203", "market", "daily", spec))
+
+        assert results[0]["indicators"] == results[1]["indicators"]
+        assert cache.stats()["hits"] == 1
+
+    def test_timeframe_is_part_of_cache_scope(self):
+        cache = IndicatorResultCache()
+        service = IndicatorService(result_cache=cache)
+        spec = [{"type": "sma", "params": {"period": 5}}]
+        with patch.object(service, "load_ohlcv", return_value=_make_ohlcv()):
+            daily = service.compute_indicators("7203", "market", "daily", spec)
+            weekly = service.compute_indicators("7203", "market", "weekly", spec)
+
+        assert daily["indicators"] != weekly["indicators"]
+        assert cache.stats()["entries"] == 2
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from typing import cast
+
+import pandas as pd
 import pytest
 
 from src.application.services.ingestion_pipeline import (
     passthrough_rows,
     run_ingestion_batch,
+    validate_frame_required_fields,
     validate_rows_required_fields,
 )
 from src.infrastructure.db.market.market_mutations import MarketMutationStats, SemanticDeltaResult
@@ -105,3 +109,32 @@ def test_validate_rows_dedupes_identical_fallback_identity() -> None:
         dedupe_keys=("code", "statement_id"),
         stage="fundamentals",
     ) == [row]
+
+
+def test_validate_frame_required_fields_matches_row_validation() -> None:
+    rows = [
+        {"code": "7203", "date": "2026-02-10", "value": 1},
+        {"code": "6758", "date": "2026-02-10", "value": 2},
+        {"code": "7203", "date": "2026-02-10", "value": 3},
+        {"code": " ", "date": "2026-02-10", "value": 4},
+        {"code": "9984", "date": None, "value": 5},
+    ]
+
+    expected = validate_rows_required_fields(
+        rows,
+        required_fields=("code", "date"),
+        dedupe_keys=("code", "date"),
+        stage="test",
+    )
+    validated = validate_frame_required_fields(
+        pd.DataFrame.from_records(rows),
+        required_fields=("code", "date"),
+        dedupe_keys=("code", "date"),
+        stage="test",
+    )
+
+    def by_key(records: list[dict[str, object]]) -> list[dict[str, object]]:
+        return sorted(records, key=lambda row: (str(row["code"]), str(row["date"])))
+
+    records = cast(list[dict[str, object]], validated.to_dict("records"))
+    assert by_key(records) == by_key(expected)
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from datetime import date
 from unittest.mock import AsyncMock
 
+import pandas as pd
 import pytest
 
 from src.application.services.intraday_sync_service import sync_intraday_data
@@ -30,8 +31,9 @@ class DummyStore:
         self.published_batches: list[list[dict[str, object]]] = []
         self.index_calls = 0
 
-    def publish_stock_minute_data(self, rows: list[dict[str, object]]) -> SemanticDeltaResult:
-        self.published_batches.append(list(rows))
+    def publish_stock_minute_frame(self, frame: pd.DataFrame) -> SemanticDeltaResult:
+        rows = frame.astype(object).where(frame.notna(), None).to_dict("records")
+        self.published_batches.append(rows)
         return SemanticDeltaResult(
             stats=MarketMutationStats(input=len(rows), inserted=len(rows), updated=0, unchanged=0, deleted=0)
         )
@@ -61,11 +63,11 @@ class DummyBulkService:
         self,
         plan: BulkFetchPlan,
         *,
-        on_rows_batch,
+        on_frame_batch,
         accumulate_rows: bool = True,
     ) -> BulkFetchResult:
         del accumulate_rows
-        await on_rows_batch(self.rows, plan.files[0])
+        await on_frame_batch(pd.DataFrame.from_records(self.rows), plan.files[0])
         return self.result
 
 
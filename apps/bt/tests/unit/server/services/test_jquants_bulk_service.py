@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
 
 from src.application.services import jquants_bulk_service as bulk_module
@@ -222,6 +223,50 @@ async def test_bulk_service_streams_large_csv_in_multiple_batches(tmp_path: Path
     assert result.api_calls == 2
 
 
+@pytest.mark.asyncio
+async def test_bulk_service_streams_csv_as_frame_batches(tmp_path: Path) -> None:
+    key = "equities_bars_minute_20260210.csv.gz"
+    rows = [
+        {"Code": "72030", "Date": "2026-02-10", "Time": "09:00", "C": " 2 ", "Va": ""},
+        {"Code": "67580", "Date": "2026-02-10", "Time": "09:01", "C": "4", "Va": "NA"},
+        {"Code": "99840", "Date": "2026-02-10", "Time": "09:02", "C": "6", "Va": "10"},
+    ]
+    payload = _gzip_csv_bytes(rows)
+    client = _BulkClient(
+        list_payload=[{"Key": key, "LastModified": "2026-02-11T00:00:00Z", "Size": len(payload)}],
+        signed_urls={key: "https://signed.local/equities-minute-20260210.csv.gz"},
+    )
+
+    async def _downloader(_url: str) -> bytes:
+        return payload
+
+    service = JQuantsBulkService(
+        client,
+        cache_dir=tmp_path / "bulk-cache",
+        downloader=_downloader,
+        csv_read_batch_size=2,
+    )
+
+    plan = await service.build_plan(endpoint="/equities/bars/minute")
+    seen_frames: list[pd.DataFrame] = []
+
+    async def _on_frame_batch(batch_frame: pd.DataFrame, _file_info: Any) -> None:
+        seen_frames.append(batch_frame)
+
+    result = await service.fetch_with_plan(
+        plan,
+        on_frame_batch=_on_frame_batch,
+        accumulate_rows=True,
+    )
+
+    assert [len(frame) for frame in seen_frames] == [2, 1]
+    combined = pd.concat(seen_frames, ignore_index=True)
+    assert combined["Code"].tolist() == ["72030", "67580", "99840"]
+    assert combined["C"].tolist() == ["2", "4", "6"]
+    assert combined["Va"].tolist() == ["", "NA", "10"]
+    assert [row["Code"] for row in result.rows] == ["72030", "67580", "99840"]
+
+
 @pytest.mark.asyncio
 async def test_bulk_service_wraps_signed_url_download_error(tmp_path: Path) -> None:
     key = "indices_bars_daily_20260210.csv.gz"
@@ -20,8 +20,15 @@ class _FakeClient:
         start: str | None,
         end: str | None,
         max_rows: int | None,
+        timeframe: str = "1d",
     ) -> dict[str, Any]:
-        return {"symbol": symbol, "start": start, "end": end, "maxRows": max_rows}
+        return {
+            "symbol": symbol,
+            "start": start,
+            "end": end,
+            "maxRows": max_rows,
+            "timeframe": timeframe,
+        }
 
     def get_us_snapshot(self, symbols: list[str]) -> dict[str, Any]:
         return {"symbols": symbols}
@@ -38,5 +45,6 @@ async def test_moomoo_market_data_service_delegates_to_blocking_client() -> None
         "start": "2025-01-01",
         "end": "2025-01-31",
         "maxRows": 10,
+        "timeframe": "1d",
     }
     assert await service.get_us_snapshot(["AAPL"]) == {"symbols": ["AAPL"]}
@@ -0,0 +1,217 @@
+"""Portfolio Performance Service テスト"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Generator
+from datetime import date, timedelta
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from src.application.services import portfolio_performance_service as performance_module
+from src.application.services.portfolio_performance_service import (
+    PortfolioPerformanceService,
+)
+from src.domains.analytics.regression_core import (
+    DailyReturn,
+    align_returns,
+    calculate_daily_returns,
+    ols_regression,
+)
+from src.infrastructure.db.market.market_reader import MarketDbReader
+from src.infrastructure.db.market.portfolio_db import PortfolioDb
+
+
+def _business_days(count: int) -> list[str]:
+    days: list[str] = []
+    current = date(2024, 1, 1)
+    while len(days) < count:
+        if current.weekday() < 5:
+            days.append(current.isoformat())
+        current += timedelta(days=1)
+    return days
+
+
+def _create_market_db(path: str) -> None:
+    rng = random.Random(7)
+    days = _business_days(80)
+    conn = duckdb.connect(path)
+    conn.execute(
+        """
+        CREATE TABLE stock_data (
+            code TEXT NOT NULL, date TEXT NOT NULL,
+            open REAL, high REAL, low REAL,
+            close REAL NOT NULL, volume DOUBLE NOT NULL,
+            adjustment_factor REAL, created_at TEXT,
+            PRIMARY KEY (code, date)
+        );
+        CREATE TABLE topix_data (
+            date TEXT PRIMARY KEY, open REAL, high REAL, low REAL, close REAL
+        );
+        CREATE TABLE sync_metadata (key TEXT PRIMARY KEY, value TEXT, updated_at TEXT);
+        """
+    )
+    conn.execute(
+        "INSERT INTO sync_metadata VALUES ('last_sync_date', '2024-04-19T00:00:00+00:00', NULL)"
+    )
+    for code, start_price in (("72030", 2500.0), ("6758", 1500.0), ("9984", 8000.0)):
+        price = start_price
+        for index, day in enumerate(days):
+            # 9984 は途中から上場、6758 は欠損日あり
+            if code == "9984" and index < 25:
+                continue
+            if code == "6758" and index % 11 == 5:
+                continue
+            price *= 1 + rng.uniform(-0.03, 0.03)
+            conn.execute(
+                "INSERT INTO stock_data VALUES (?, ?, 0, 0, 0, ?, 1000, 1.0, NULL)",
+                [code, day, price],
+            )
+    # 同日の4桁/5桁重複は4桁が優先される
+    conn.execute(
+        "INSERT INTO stock_data VALUES ('7203', ?, 0, 0, 0, 2000, 1000, 1.0, NULL)",
+        [days[40]],
+    )
+    level = 2400.0
+    for day in days:
+        level *= 1 + rng.uniform(-0.02, 0.02)
+        conn.execute("INSERT INTO topix_data VALUES (?, 0, 0, 0, ?)", [day, level])
+    conn.close()
+
+
+@pytest.fixture()
+def service(tmp_path: Path) -> Generator[PortfolioPerformanceService, None, None]:
+    market_path = str(tmp_path / "market.duckdb")
+    _create_market_db(market_path)
+    reader = MarketDbReader(market_path)
+    pdb = PortfolioDb(str(tmp_path / "portfolio.db"))
+    performance_module._TIMESERIES_CACHE.clear()
+    pdb.create_portfolio("Main")
+    pdb.add_item(1, "7203", "トヨタ", 100, 2400.0, "2024-01-01")
+    pdb.add_item(1, "6758", "ソニー", 200, 1500.0, "2024-01-01")
+    pdb.add_item(1, "9984", "ソフトバンクG", 10, 7000.0, "2024-01-01")
+    yield PortfolioPerformanceService(reader, pdb)
+    performance_module._TIMESERIES_CACHE.clear()
+    reader.close()
+    pdb.close()
+
+
+def _reference_timeseries(
+    reader: MarketDbReader, weight_map: dict[str, float], lookback_days: int
+) -> list[tuple[str, float, float]]:
+    """Per-code scalar implementation the vectorized engine must reproduce."""
+    daily_returns_by_code: dict[str, list[tuple[str, float]]] = {}
+    for code in weight_map:
+        prices = reader.get_stock_prices_by_date(code)
+        if len(prices) >= 2:
+            daily_returns_by_code[code] = [
+                (dr.date, dr.ret) for dr in calculate_daily_returns(prices)
+            ]
+    all_dates = sorted({d for rets in daily_returns_by_code.values() for d, _ in rets})
+    if len(all_dates) > lookback_days:
+        all_dates = all_dates[-lookback_days:]
+    return_maps = {code: dict(rets) for code, rets in daily_returns_by_code.items()}
+    result: list[tuple[str, float, float]] = []
+    cumulative = 0.0
+    for day in all_dates:
+        daily_ret = 0.0
+        total_weight = 0.0
+        for code, weight in weight_map.items():
+            ret = return_maps.get(code, {}).get(day)
+            if ret is not None:
+                daily_ret += weight * ret
+                total_weight += weight
+        if total_weight > 0:
+            daily_ret = daily_ret / total_weight * sum(weight_map.values())
+        cumulative += daily_ret
+        result.append((day, round(daily_ret, 6), round(cumulative, 6)))
+    return result
+
+
+class TestPortfolioPerformanceService:
+    @pytest.mark.parametrize("lookback_days", [252, 40])
+    def test_timeseries_matches_scalar_reference(
+        self, service: PortfolioPerformanceService, lookback_days: int
+    ) -> None:
+        result = service.analyze(1, lookback_days=lookback_days)
+
+        weight_map = {h.code: h.weight for h in result.holdings}
+        expected = _reference_timeseries(service._reader, weight_map, lookback_days)
+        actual = [(p.date, p.dailyReturn, p.cumulativeReturn) for p in result.timeSeries]
+        assert actual == expected
+        assert result.dataPoints == len(expected)
+
+    def test_benchmark_matches_scalar_reference(
+        self, service: PortfolioPerformanceService
+    ) -> None:
+        result = service.analyze(1, lookback_days=60)
+        assert result.benchmark is not None
+        assert result.benchmarkTimeSeries is not None
+
+        bench_prices = [
+            (row["date"], row["close"])
+            for row in service._reader.query("SELECT date, close FROM topix_data ORDER BY date")
+        ]
+        port_returns = [DailyReturn(date=p.date, ret=p.dailyReturn) for p in result.timeSeries]
+        dates, _, aligned_bench = align_returns(
+            port_returns, calculate_daily_returns(bench_prices)
+        )
+        assert [p.date for p in result.benchmarkTimeSeries] == dates
+        assert result.benchmark.benchmarkReturn == pytest.approx(
+            round(sum(aligned_bench), 6), abs=1e-6
+        )
+
+        _, raw_port, raw_bench = align_returns(
+            [
+                DailyReturn(date=d, ret=r)
+                for d, r in service._calculate_portfolio_timeseries(
+                    service._pdb.list_items(1), result.holdings, 60
+                )[1]
+            ],
+            calculate_daily_returns(bench_prices),
+        )
+        reg = ols_regression(raw_port, raw_bench)
+        n = len(raw_port)
+        mean_p = sum(raw_port) / n
+        mean_b = sum(raw_bench) / n
+        cov = sum((raw_port[i] - mean_p) * (raw_bench[i] - mean_b) for i in range(n)) / n
+        std_p = math.sqrt(sum((p - mean_p) ** 2 for p in raw_port) / n)
+        std_b = math.sqrt(sum((b - mean_b) ** 2 for b in raw_bench) / n)
+        assert result.benchmark.beta == round(reg.beta, 3)
+        assert result.benchmark.correlation == round(cov / (std_p * std_b), 3)
+
+    def test_timeseries_is_cached_per_portfolio_revision(
+        self, service: PortfolioPerformanceService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[int] = []
+        original = service._fetch_return_panel
+
+        def counting_fetch(codes, lookback_days):  # type: ignore[no-untyped-def]
+            calls.append(lookback_days)
+            return original(codes, lookback_days)
+
+        monkeypatch.setattr(service, "_fetch_return_panel", counting_fetch)
+
+        first = service.analyze(1)
+        second = service.analyze(1)
+        assert len(calls) == 1
+        assert second.timeSeries == first.timeSeries
+
+        sony = next(item for item in service._pdb.list_items(1) if item.code == "6758")
+        service._pdb.update_item(sony.id, quantity=300)
+        service.analyze(1)
+        assert len(calls) == 2
+
+    def test_missing_prices_fall_back_to_purchase_price(
+        self, service: PortfolioPerformanceService
+    ) -> None:
+        service._pdb.add_item(1, "1301", "極洋", 100, 3000.0, "2024-01-01")
+
+        result = service.analyze(1)
+
+        assert "No price data for 1301" in result.warnings
+        holding = next(h for h in result.holdings if h.code == "1301")
+        assert holding.currentPrice == 3000.0
@@ -108,7 +108,7 @@ async def test_run_job_releases_slot_after_success(monkeypatch: pytest.MonkeyPat
             }
 
     class _DummyScreeningService:
-        def __init__(self, reader: object) -> None:
+        def __init__(self, reader: object, signal_state_store: object = None) -> None:
             self._reader = reader
 
         def run_screening(self, **kwargs: object) -> _DummyResponse:
@@ -341,7 +341,7 @@ async def test_run_job_failure_marks_failed_and_releases_slot(monkeypatch: pytes
     manager.release_slot = MagicMock()
 
     class _FailingScreeningService:
-        def __init__(self, reader: object) -> None:
+        def __init__(self, reader: object, signal_state_store: object = None) -> None:
             self._reader = reader
 
         def run_screening(self, **kwargs: object) -> object:
@@ -23,6 +23,7 @@ from src.domains.strategy.runtime.screening_profile import (
 from src.shared.models.config import SharedConfig
 from src.shared.models.signals import SignalParams
 from src.shared.paths.resolver import StrategyMetadata
+from src.application.services.screening_signal_state_store import ScreeningSignalStateStore
 from src.application.services.screening_service import (
     RequestCacheStats,
     ScreeningService,
@@ -1290,3 +1291,63 @@ class TestRequestMemoizationAndParallelization:
         assert all(result.processed_codes == {"1001", "1002", "1003"} for result in results)
         assert progresses[0] == (0, 3)
         assert progresses[-1] == (3, 3)
+
+    def test_evaluate_strategies_passes_incremental_warmup_with_signal_state_store(
+        self,
+        screening_db,
+        tmp_path,
+        monkeypatch,
+    ):
+        reader = MarketDbReader(screening_db)
+        service = ScreeningService(
+            reader,
+            signal_state_store=ScreeningSignalStateStore(tmp_path / "signal-state"),
+        )
+        s1 = replace(
+            _runtime("s1"),
+            entry_params=SignalParams.model_validate(
+                {"rsi_threshold": {"enabled": True, "period": 14}}
+            ),
+        )
+        stock = StockUniverseItem(
+            code="1001",
+            company_name="A",
+            scale_category=None,
+            sector_33_name=None,
+        )
+        strategy_inputs = [
+            StrategyExecutionInput(
+                strategy=s1,
+                data_bundle=StrategyDataBundle(multi_data={}),
+                load_warnings=[],
+            )
+        ]
+        captured: list[dict[str, int | None] | None] = []
+
+        def _evaluate_stock(
+            stock,
+            _strategy_inputs,
+            _recent_days,
+            _strategy_cache_tokens,
+            incremental_warmup_sessions=None,
+        ):
+            captured.append(incremental_warmup_sessions)
+            return StockEvaluationOutcome(
+                stock=stock,
+                matched_dates_by_strategy={},
+                processed_strategy_names={s1.response_name},
+                warning_by_strategy=[],
+            )
+
+        monkeypatch.setattr(service, "_evaluate_stock", _evaluate_stock)
+        try:
+            service._evaluate_strategies(  # noqa: SLF001
+                strategy_inputs=strategy_inputs,
+                stock_universe=[stock],
+                recent_days=10,
+                progress_callback=None,
+            )
+        finally:
+            reader.close()
+
+        assert captured == [{"s1": 15}]
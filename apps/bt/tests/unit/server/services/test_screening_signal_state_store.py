@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from src.application.services.screening_signal_state_store import ScreeningSignalStateStore
+from src.domains.analytics.screening_signal_state import ScreeningSignalState
+
+
+def _state(last_date: str = "2026-01-09") -> ScreeningSignalState:
+    return ScreeningSignalState(last_date=last_date, fingerprint="fp", candidates=(False, True))
+
+
+def test_store_persists_states_on_flush(tmp_path: Path) -> None:
+    store = ScreeningSignalStateStore(tmp_path)
+    store.put("key", "7203", _state())
+
+    assert not (tmp_path / "key.json").exists()
+    store.flush()
+
+    reloaded = ScreeningSignalStateStore(tmp_path)
+    assert reloaded.get("key", "7203") == _state()
+    assert reloaded.get("key", "6758") is None
+    assert reloaded.stats()["hits"] == 1
+    assert reloaded.stats()["misses"] == 1
+
+
+def test_store_ignores_unknown_schema_version(tmp_path: Path) -> None:
+    (tmp_path / "key.json").write_text(
+        json.dumps({"schemaVersion": 0, "stocks": {"7203": _state().to_payload()}}),
+        encoding="utf-8",
+    )
+
+    assert ScreeningSignalStateStore(tmp_path).get("key", "7203") is None
+
+
+def test_store_skips_unchanged_states_and_clears_context_on_flush(tmp_path: Path) -> None:
+    store = ScreeningSignalStateStore(tmp_path)
+    store.put("key", "7203", _state())
+    store.flush()
+    (tmp_path / "key.json").unlink()
+
+    store.put("key", "7203", _state())
+    store.flush()
+    assert not (tmp_path / "key.json").exists()
+
+    calls: list[int] = []
+
+    def _build() -> str:
+        calls.append(1)
+        return "context"
+
+    assert store.remember_context_fingerprint(("bundle", 1), _build) == "context"
+    assert store.remember_context_fingerprint(("bundle", 1), _build) == "context"
+    store.flush()
+    store.remember_context_fingerprint(("bundle", 1), _build)
+    assert len(calls) == 2
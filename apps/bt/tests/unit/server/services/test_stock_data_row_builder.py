@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+from typing import cast
+
+import pandas as pd
 import pytest
 
-from src.application.services.stock_data_row_builder import build_stock_data_row
-from src.application.services.sync_row_converters import convert_stock_bulk_rows
+from src.application.services.stock_data_row_builder import (
+    STOCK_DATA_COLUMNS,
+    build_stock_data_frame,
+    build_stock_data_row,
+)
+from src.application.services.sync_row_converters import (
+    convert_stock_bulk_frame,
+    convert_stock_bulk_rows,
+    convert_stock_data_frame,
+)
 
 
 def test_build_stock_data_row_preserves_provider_raw_and_adjusted_fields() -> None:
@@ -511,3 +522,216 @@ def test_build_stock_data_row_rejects_non_finite_numbers() -> None:
 
     assert inf_row is None
     assert nan_row is None
+
+
+def _frame_records(frame: pd.DataFrame) -> list[dict[str, object]]:
+    return cast(
+        list[dict[str, object]],
+        frame.astype(object).where(frame.notna(), None).to_dict("records"),
+    )
+
+
+_FRAME_PARITY_QUOTES: list[dict[str, object]] = [
+    {
+        "Code": "72030",
+        "Date": "2026-02-10",
+        "O": 100,
+        "H": 110,
+        "L": 90,
+        "C": 105,
+        "Vo": 1000,
+        "Va": 105_500.25,
+        "AdjFactor": 1.0,
+        "AdjO": 100.125,
+        "AdjH": 110.125,
+        "AdjL": 90.125,
+        "AdjC": 105.125,
+        "AdjVo": 87_308.9,
+    },
+    {
+        "Code": "131A0",
+        "Date": "2026-02-10",
+        "O": "100",
+        "H": "110",
+        "L": "90",
+        "C": "105",
+        "Vo": "1000",
+        "Va": "100000",
+        "AdjFactor": "0.5",
+        "AdjO": "201",
+        "AdjH": "211",
+        "AdjL": "191",
+        "AdjC": "205",
+        "AdjVo": "777",
+    },
+    # fractional raw volume / negative adjusted volume / missing adjusted close
+    {
+        "Code": "67580",
+        "Date": "2026-02-10",
+        "O": 1,
+        "H": 1,
+        "L": 1,
+        "C": 1,
+        "Vo": 10.5,
+        "Va": 1,
+        "AdjFactor": 1,
+        "AdjO": 1,
+        "AdjH": 1,
+        "AdjL": 1,
+        "AdjC": 1,
+        "AdjVo": 1,
+    },
+    {
+        "Code": "99840",
+        "Date": "2026-02-10",
+        "O": 1,
+        "H": 1,
+        "L": 1,
+        "C": 1,
+        "Vo": 1,
+        "Va": 1,
+        "AdjFactor": 1,
+        "AdjO": 1,
+        "AdjH": 1,
+        "AdjL": 1,
+        "AdjC": 1,
+        "AdjVo": -0.1,
+    },
+    {
+        "Code": "83060",
+        "Date": "2026-02-10",
+        "O": 1,
+        "H": 1,
+        "L": 1,
+        "C": 1,
+        "Vo": 1,
+        "Va": 1,
+        "AdjFactor": 1,
+        "AdjO": 1,
+        "AdjH": 1,
+        "AdjL": 1,
+        "AdjC": None,
+        "AdjVo": 1,
+    },
+    # legitimate no-trade row
+    {"Code": "94320", "Date": "2026-02-10", "AdjFactor": 1.0},
+]
+
+
+def test_build_stock_data_frame_matches_row_builder() -> None:
+    created_at = "2026-02-12T00:00:00+00:00"
+    expected = [
+        row
+        for quote in _FRAME_PARITY_QUOTES
+        if (row := build_stock_data_row(quote, created_at=created_at)) is not None
+    ]
+
+    batch = build_stock_data_frame(
+        pd.DataFrame.from_records(_FRAME_PARITY_QUOTES),
+        created_at=created_at,
+    )
+
+    assert list(batch.frame.columns) == list(STOCK_DATA_COLUMNS)
+    assert _frame_records(batch.frame) == expected
+    assert batch.rejected.tolist() == [
+        build_stock_data_row(quote) is None for quote in _FRAME_PARITY_QUOTES
+    ]
+    assert batch.rejected.sum() == 4
+    assert batch.incomplete.tolist() == [
+        rejected and quote.get("O") is not None
+        for quote, rejected in zip(_FRAME_PARITY_QUOTES, batch.rejected, strict=True)
+    ]
+
+
+def test_convert_stock_bulk_frame_matches_row_converter() -> None:
+    rows = [
+        {
+            "code": "72030",
+            "date": "20260210",
+            "open": "100",
+            "high": "110",
+            "low": "90",
+            "close": "105",
+            "volume": "1000",
+            "turnover_value": "105500.25",
+            "adjfactor": "0.5",
+            "adjopen": "50",
+            "adjhigh": "55",
+            "adjlow": "45",
+            "adjclose": "52.5",
+            "adjvolume": "2000",
+        },
+        {
+            "code": "72030",
+            "date": "20260209",
+            "open": "1",
+            "high": "1",
+            "low": "1",
+            "close": "1",
+            "volume": "1",
+            "turnover_value": "1",
+            "adjfactor": "1",
+            "adjopen": "1",
+            "adjhigh": "1",
+            "adjlow": "1",
+            "adjclose": "1",
+            "adjvolume": "1",
+        },
+        {"code": "94320", "date": "20260210", "adjfactor": "1"},
+    ]
+
+    expected = convert_stock_bulk_rows(rows, target_dates={"2026-02-10"})
+    frame = convert_stock_bulk_frame(
+        pd.DataFrame.from_records(rows),
+        target_dates={"2026-02-10"},
+    )
+
+    records = _frame_records(frame)
+    assert len(records) == len(expected) == 1
+    for record, row in zip(records, expected, strict=True):
+        assert {k: v for k, v in record.items() if k != "created_at"} == {
+            k: v for k, v in row.items() if k != "created_at"
+        }
+
+
+def test_convert_stock_bulk_frame_rejects_or_collects_incomplete_rows() -> None:
+    frame = pd.DataFrame.from_records(
+        [
+            {
+                "code": "72030",
+                "date": "20260210",
+                "open": 100,
+                "high": 110,
+                "low": 90,
+                "close": 105,
+                "volume": 1000,
+                "turnover_value": 105000,
+                "adjfactor": 1,
+                "adjopen": 100,
+                "adjhigh": 110,
+                "adjlow": 90,
+                "adjclose": None,
+                "adjvolume": 1000,
+            }
+        ]
+    )
+
+    with pytest.raises(ValueError, match="incomplete provider daily row.*7203.*2026-02-10"):
+        convert_stock_bulk_frame(frame, target_dates={"2026-02-10"})
+
+    incomplete_dates: set[str] = set()
+    converted = convert_stock_bulk_frame(
+        frame,
+        target_dates={"2026-02-10"},
+        incomplete_dates=incomplete_dates,
+    )
+    assert converted.empty
+    assert incomplete_dates == {"2026-02-10"}
+
+
+def test_convert_stock_data_frame_rejects_incomplete_rest_row() -> None:
+    quote = dict(_FRAME_PARITY_QUOTES[0])
+    quote["AdjC"] = None
+
+    with pytest.raises(ValueError, match="7203"):
+        convert_stock_data_frame(pd.DataFrame.from_records([quote]))
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import pandas as pd
+
 from src.application.services.stock_minute_data_row_builder import (
     _coerce_date,
     _coerce_float,
     _coerce_int,
     _coerce_time,
     _pick_first,
+    build_stock_minute_data_frame,
     build_stock_minute_data_row,
 )
 
@@ -85,3 +88,45 @@ def test_build_stock_minute_data_row_uses_normalized_code_and_created_at() -> No
         "turnover_value": 100500.0,
         "created_at": "2026-02-10T00:00:00+00:00",
     }
+
+
+def test_build_stock_minute_data_frame_matches_row_builder() -> None:
+    quotes = [
+        {"Code": "72030", "Date": "2026-02-10", "Time": "0900", "O": "100", "H": "101",
+         "L": "99", "C": "100.5", "Vo": "1000.9", "Va": ""},
+        {"Code": "67580", "Date": "20260210", "Time": "09:01", "O": 1.0, "H": 2.0,
+         "L": 1.0, "C": 2.0, "Vo": 5, "Va": 10.0},
+        {"Code": "72030", "Date": "2026-02-10", "Time": "0902", "O": "abc", "H": "1",
+         "L": "1", "C": "1", "Vo": "1", "Va": "1"},
+        {"Code": "", "Date": "2026-02-10", "Time": "0903", "O": "1", "H": "1",
+         "L": "1", "C": "1", "Vo": "1", "Va": "1"},
+        {"Code": "99840", "Date": "2026-02-10", "Time": " ", "O": "1", "H": "1",
+         "L": "1", "C": "1", "Vo": "nan", "Va": "1"},
+    ]
+    created_at = "2026-02-10T00:00:00+00:00"
+
+    batch = build_stock_minute_data_frame(pd.DataFrame.from_records(quotes), created_at=created_at)
+
+    expected = [
+        row
+        for quote in quotes
+        if (row := build_stock_minute_data_row(quote, created_at=created_at)) is not None
+    ]
+    frame = batch.frame
+    assert frame.astype(object).where(frame.notna(), None).to_dict("records") == expected
+    assert batch.rejected_count == 3
+
+
+def test_build_stock_minute_data_frame_handles_empty_and_normalized_code() -> None:
+    empty = build_stock_minute_data_frame(pd.DataFrame())
+    assert empty.frame.empty
+    assert empty.rejected_count == 0
+
+    batch = build_stock_minute_data_frame(
+        pd.DataFrame.from_records(
+            [{"Date": "2026-02-10", "Time": "0900", "O": 1, "H": 1, "L": 1, "C": 1, "Vo": 1}]
+        ),
+        normalized_code="7203",
+    )
+    assert batch.frame["code"].tolist() == ["7203"]
+    assert batch.frame["turnover_value"].isna().all()
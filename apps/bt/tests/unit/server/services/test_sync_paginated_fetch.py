@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import aclosing
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.services.sync_paginated_fetch import iter_prefetched, prefetch_window
+
+
+def test_prefetch_window_uses_client_concurrency() -> None:
+    assert prefetch_window(SimpleNamespace(max_concurrency=4)) == 4
+    assert prefetch_window(SimpleNamespace(max_concurrency=0)) == 1
+    assert prefetch_window(object()) == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_prefetched_keeps_order_and_bounds_fetches_in_flight() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fetch(item: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01 * (5 - item))
+        in_flight -= 1
+        if item == 2:
+            raise RuntimeError("boom")
+        return item * 10
+
+    outcomes: list[tuple[int, object]] = []
+    async with aclosing(iter_prefetched(range(5), fetch, window=3)) as fetched:
+        async for item, future in fetched:
+            error = future.exception()
+            outcomes.append((item, str(error) if error else future.result()))
+
+    assert outcomes == [(0, 0), (1, 10), (2, "boom"), (3, 30), (4, 40)]
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_iter_prefetched_stops_scheduling_and_cancels_pending_on_close() -> None:
+    started: list[int] = []
+    stop = False
+
+    async def fetch(item: int) -> int:
+        started.append(item)
+        await asyncio.sleep(0.01)
+        return item
+
+    async with aclosing(
+        iter_prefetched(range(10), fetch, window=2, should_stop=lambda: stop)
+    ) as fetched:
+        async for item, _future in fetched:
+            if item == 1:
+                stop = True
+            if item == 2:
+                break
+
+    assert started == [0, 1, 2]
@@ -41,6 +41,7 @@ class DummyMarketDb:
         self._legacy_stock_snapshot = legacy_stock_snapshot
         self._schema_version = schema_version
         self.ensure_schema_calls = 0
+        self.latest_quote_rebuild_calls = 0
         self.technical_rebuild_calls = 0
         self.technical_rebuild_error: Exception | None = None
         self.valuation_materialization_calls: list[dict[str, Any]] = []
@@ -70,6 +71,13 @@ class DummyMarketDb:
     def is_market_schema_current(self) -> bool:
         return self._schema_version == MARKET_SCHEMA_VERSION
 
+    def rebuild_stock_latest_quotes_from_stock_data(self) -> MagicMock:
+        self.latest_quote_rebuild_calls += 1
+        self.materialization_order.append("latest_quotes")
+        result = MagicMock()
+        result.final_count = 21
+        return result
+
     def rebuild_daily_technical_metrics_from_stock_data(self) -> MagicMock:
         self.technical_rebuild_calls += 1
         self.materialization_order.append("technical")
@@ -511,6 +519,7 @@ async def test_successful_sync_materializes_daily_technical_metrics_before_compl
     stored = isolated_manager.get_job(job.job_id)
     assert stored is not None
     assert stored.status is JobStatus.COMPLETED
+    assert market_db.latest_quote_rebuild_calls == 1
     assert market_db.technical_rebuild_calls == 1
     assert stored.progress is not None
     assert stored.progress.stage == "daily_technical_metrics"
@@ -555,7 +564,7 @@ async def test_successful_incremental_sync_materializes_daily_valuation_once_bef
             "changed_dates": frozenset({"2026-03-02", "2026-03-03"}),
         }
     ]
-    assert market_db.materialization_order == ["valuation", "technical"]
+    assert market_db.materialization_order == ["valuation", "latest_quotes", "technical"]
 
 
 @pytest.mark.asyncio
@@ -589,7 +598,7 @@ async def test_initial_sync_fully_materializes_daily_valuation(
             "changed_dates": frozenset(),
         }
     ]
-    assert market_db.materialization_order == ["valuation", "technical"]
+    assert market_db.materialization_order == ["valuation", "latest_quotes", "technical"]
 
 
 @pytest.mark.asyncio
@@ -624,6 +633,7 @@ async def test_daily_valuation_materialization_failure_fails_sync(
     stored = isolated_manager.get_job(job.job_id)
     assert stored is not None and stored.status is JobStatus.FAILED
     assert stored.error == "valuation materialization failed"
+    assert market_db.latest_quote_rebuild_calls == 0
     assert market_db.technical_rebuild_calls == 0
 
 
@@ -648,6 +658,7 @@ async def test_successful_sync_skips_technical_materialization_without_price_mut
 
     stored = isolated_manager.get_job(job.job_id)
     assert stored is not None and stored.status is JobStatus.COMPLETED
+    assert market_db.latest_quote_rebuild_calls == 0
     assert market_db.technical_rebuild_calls == 0
     assert market_db.valuation_materialization_calls == []
 
@@ -681,6 +692,7 @@ async def test_technical_materialization_failure_fails_sync(
     assert stored is not None
     assert stored.status is JobStatus.FAILED
     assert stored.error == "technical rebuild failed"
+    assert market_db.latest_quote_rebuild_calls == 1
     assert market_db.technical_rebuild_calls == 1
 
 
@@ -4,10 +4,11 @@ import asyncio
 import json
 import threading
 from datetime import date, datetime, timedelta
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, cast
 from zoneinfo import ZoneInfo
 from unittest.mock import AsyncMock
 
+import pandas as pd
 import pytest
 import httpx
 
@@ -778,6 +779,19 @@ class DummyTimeSeriesStore:
         self._staged_stock_rows.extend(rows)
         return SemanticDeltaResult.empty(input_count=len(rows))
 
+    @staticmethod
+    def _frame_records(frame: pd.DataFrame) -> list[dict[str, Any]]:
+        return cast(
+            list[dict[str, Any]],
+            frame.astype(object).where(frame.notna(), None).to_dict("records"),
+        )
+
+    def detect_stock_provider_drift_frame(self, frame: pd.DataFrame) -> frozenset[str]:
+        return self.detect_stock_provider_drift(self._frame_records(frame))
+
+    def stage_stock_data_frame(self, frame: pd.DataFrame) -> SemanticDeltaResult:
+        return self.stage_stock_data_rows(self._frame_records(frame))
+
     def flush_staged_stock_data(
         self,
         *,
@@ -2447,8 +2461,10 @@ class _FakeBulkService:
         *,
         on_rows_batch: Any | None = None,
         accumulate_rows: bool = True,
+        on_frame_batch: Any | None = None,
     ) -> BulkFetchResult:
         self.fetch_calls.append(plan.endpoint)
+        on_rows_batch = _frame_batch_adapter(on_frame_batch) or on_rows_batch
         if plan.endpoint in self.fail_endpoints:
             raise RuntimeError("bulk failed")
         result = self.results_by_endpoint.get(plan.endpoint)
@@ -2500,6 +2516,17 @@ class _PlanOnlyBulkService:
         return self._plan
 
 
+def _frame_batch_adapter(on_frame_batch: Any | None) -> Any | None:
+    """Feed fake bulk rows to a columnar consumer like the real bulk reader."""
+    if on_frame_batch is None:
+        return None
+
+    async def consume(rows: list[dict[str, Any]], file_info: Any) -> None:
+        await on_frame_batch(pd.DataFrame.from_records(rows), file_info)
+
+    return consume
+
+
 class _PlanAndFetchBulkService:
     def __init__(self, *, plan: BulkFetchPlan, rows: list[dict[str, Any]]) -> None:
         self._plan = plan
@@ -2531,8 +2558,10 @@ class _PlanAndFetchBulkService:
         *,
         on_rows_batch: Any | None = None,
         accumulate_rows: bool = True,
+        on_frame_batch: Any | None = None,
     ) -> BulkFetchResult:
         self.fetch_calls.append(plan.endpoint)
+        on_rows_batch = _frame_batch_adapter(on_frame_batch) or on_rows_batch
         if on_rows_batch is not None:
             await on_rows_batch(self._rows, plan.files[0])
         return BulkFetchResult(
@@ -2555,8 +2584,10 @@ class _ChunkedPlanAndFetchBulkService(_PlanAndFetchBulkService):
         *,
         on_rows_batch: Any | None = None,
         accumulate_rows: bool = True,
+        on_frame_batch: Any | None = None,
     ) -> BulkFetchResult:
         self.fetch_calls.append(plan.endpoint)
+        on_rows_batch = _frame_batch_adapter(on_frame_batch) or on_rows_batch
         if on_rows_batch is not None:
             for index, chunk in enumerate(self._chunks):
                 await on_rows_batch(chunk, plan.files[min(index, len(plan.files) - 1)])
@@ -3938,8 +3969,17 @@ async def test_execute_stock_data_bulk_fetch_discards_partial_file_on_failure()
     )
 
     class _PartialFailureBulkService:
-        async def fetch_with_plan(self, _plan: Any, *, on_rows_batch: Any, accumulate_rows: bool) -> Any:
+        async def fetch_with_plan(
+            self,
+            _plan: Any,
+            *,
+            accumulate_rows: bool,
+            on_rows_batch: Any | None = None,
+            on_frame_batch: Any | None = None,
+        ) -> Any:
             del accumulate_rows
+            on_rows_batch = _frame_batch_adapter(on_frame_batch) or on_rows_batch
+            assert on_rows_batch is not None
             await on_rows_batch(
                 [_provider_daily_quote("7203", "2026-02-10", base=20.0)],
                 file_info,
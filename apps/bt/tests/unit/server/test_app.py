@@ -40,6 +40,18 @@ class TestCreateApp:
         resp = client.get("/api/health")
         assert resp.status_code == 200
 
+    def test_metrics_endpoint_labels_requests_by_route_template(self) -> None:
+        app = create_app()
+        client = TestClient(app)
+        client.get("/api/health")
+
+        resp = client.get("/api/metrics")
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'bt_http_request_duration_ms_count{method="GET",path="/api/health"}' in resp.text
+        assert "/api/metrics" not in app.openapi()["paths"]
+
 class TestPeriodicCleanup:
     @pytest.mark.asyncio
     async def test_cleanup_runs_and_logs(self) -> None:
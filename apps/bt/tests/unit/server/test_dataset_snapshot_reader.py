@@ -621,6 +621,13 @@ def test_dataset_snapshot_reader_reads_provider_current_bundle(tmp_path: Path) -
         assert reader.get_stock_ohlcv("72030")[0].close == 201.0
         assert reader.get_topix()[0].date == "2024-01-04"
         assert reader.get_index_data("0040")[0].sector_name == "Auto"
+        batch = reader.get_index_data_batch(["0040", "9999"], topix_key="topix")
+        assert {key: len(rows) for key, rows in batch.items()} == {
+            "0040": 1,
+            "9999": 0,
+            "topix": 1,
+        }
+        assert batch["0040"][0].close == 1
         assert reader.get_margin("7203")[0].long_margin_volume == 10
         assert reader.get_statements("7203")[0].statement_id == "statement-7203"
         assert reader.get_adjusted_statement_metrics("7203")[0]["adjusted_eps"] == 20
@@ -4,6 +4,7 @@ from collections.abc import Generator
 import importlib
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 import src.infrastructure.db.dataset_io.dataset_writer as dataset_writer_module
@@ -226,6 +227,79 @@ def test_upsert_indices_data(writer: DatasetWriter) -> None:
     assert count == 1
 
 
+def test_upsert_stock_data_accepts_dataframe_with_in_batch_duplicates(
+    writer: DatasetWriter,
+) -> None:
+    frame = pd.DataFrame(
+        {
+            "code": ["7203", "7203", "6758"],
+            "date": ["2024-01-04", "2024-01-04", "2024-01-04"],
+            "open": [100.0, 200.0, 300.0],
+            "high": [110.0, 210.0, 310.0],
+            "low": [90.0, 190.0, 290.0],
+            "close": [105.0, 205.0, 305.0],
+            "volume": [1000, 2000, None],
+        }
+    )
+
+    assert writer.upsert_stock_data(frame) == 3
+
+    conn = _connect_duckdb(writer)
+    try:
+        rows = conn.execute(
+            "SELECT code, close, volume, created_at FROM stock_data ORDER BY code"
+        ).fetchall()
+    finally:
+        conn.close()
+    assert rows == [("6758", 305.0, None, None), ("7203", 205.0, 2000.0, None)]
+
+
+def test_upsert_statements_merges_in_batch_duplicates_like_sequential_upserts(
+    writer: DatasetWriter,
+) -> None:
+    base = {
+        "code": "7203",
+        "statement_id": "statement-7203",
+        "disclosed_date": "2024-03-15",
+        "disclosed_at": "2024-03-15T15:00:00+09:00",
+        "period_start": "2023-01-01",
+        "period_end": "2023-12-31",
+    }
+    writer.upsert_statements([{**base, "profit": 10.0, "sales": 100.0}])
+
+    count = writer.upsert_statements(
+        [
+            {**base, "earnings_per_share": 250.0, "type_of_document": "AnnualReport"},
+            {**base, "earnings_per_share": None, "profit": 20.0},
+        ]
+    )
+
+    conn = _connect_duckdb(writer)
+    try:
+        row = conn.execute(
+            "SELECT earnings_per_share, profit, sales, type_of_document FROM statements"
+        ).fetchone()
+    finally:
+        conn.close()
+    assert count == 2
+    assert row == (250.0, 20.0, 100.0, "AnnualReport")
+
+
+def test_upsert_failure_rolls_back_the_whole_batch(writer: DatasetWriter) -> None:
+    valid = {
+        "code": "7203", "company_name": "Toyota", "market_code": "111", "market_name": "プライム",
+        "sector_17_code": "7", "sector_17_name": "自動車", "sector_33_code": "3700",
+        "sector_33_name": "輸送用機器", "listed_date": "2000-01-01",
+    }
+
+    with pytest.raises(Exception, match="NOT NULL"):
+        writer.upsert_stocks([valid, {**valid, "code": "6758", "company_name": None}])
+
+    assert writer.get_stock_count() == 0
+    assert writer.upsert_stocks([valid]) == 1
+    assert writer.get_stock_count() == 1
+
+
 def test_upsert_empty_rows_return_zero(writer: DatasetWriter) -> None:
     assert writer.upsert_stock_data([]) == 0
     assert writer.upsert_topix_data([]) == 0
@@ -232,7 +232,10 @@ def test_execute_optimization_sync_extracts_payload(monkeypatch: pytest.MonkeyPa
         raise AssertionError("must not rebuild candidate configs")
 
     _FakeEngine.build_config_override = staticmethod(_fail_build_config_override)
-    monkeypatch.setattr(worker_mod, "ParameterOptimizationEngine", _FakeEngine)
+    monkeypatch.setattr(
+        "src.domains.optimization.engine.ParameterOptimizationEngine",
+        _FakeEngine,
+    )
 
     payload = worker_mod._execute_optimization_sync("demo")  # noqa: SLF001
     assert payload["best_score"] == 1.2
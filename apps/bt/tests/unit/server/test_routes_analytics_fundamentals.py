@@ -17,6 +17,8 @@ from src.application.contracts.margin_analytics import (
     MarginFlowPressureData,
     MarginLongPressureData,
     MarginPressureIndicatorsResponse,
+    MarginPressureRankingItem,
+    MarginPressureRankingResponse,
     MarginTurnoverDaysData,
     MarginVolumeRatioData,
     MarginVolumeRatioResponse,
@@ -474,6 +476,44 @@ class TestMarginRoutes:
         resp = client.get("/api/analytics/stocks/7203/margin-ratio")
         assert resp.status_code == 404
 
+    @patch("src.entrypoints.http.routes.analytics_market._get_margin_service")
+    def test_get_margin_pressure_ranking_forwards_filters(
+        self, mock_get_service: MagicMock, client: TestClient
+    ) -> None:
+        service = AsyncMock()
+        service.get_margin_pressure_ranking.return_value = MarginPressureRankingResponse(
+            date="2024-06-07",
+            averagePeriod=20,
+            sortBy="flowPressure",
+            order="asc",
+            items=[MarginPressureRankingItem(code="7203", date="2024-06-07", flowPressure=-0.5)],
+            lastUpdated="2024-06-08T00:00:00+00:00",
+            provenance=DataProvenance(source_kind="market"),
+        )
+        mock_get_service.return_value = service
+
+        resp = client.get(
+            "/api/analytics/margin-pressure",
+            params={
+                "date": "2024-06-10",
+                "period": 20,
+                "code": "7203, 6758",
+                "sortBy": "flowPressure",
+                "order": "asc",
+                "limit": 10,
+            },
+        )
+        assert resp.status_code == 200
+        assert resp.json()["items"][0]["flowPressure"] == -0.5
+        service.get_margin_pressure_ranking.assert_awaited_once_with(
+            date="2024-06-10",
+            period=20,
+            codes=["7203", "6758"],
+            sort_by="flowPressure",
+            order="asc",
+            limit=10,
+        )
+
 
 class TestRankingScopeRoute:
     @patch("src.application.services.ranking_service.RankingService.get_rankings")
@@ -8,6 +8,7 @@ from pathlib import Path
 
 import pytest
 
+from src.infrastructure.db.market.latest_quote_queries import LatestQuote
 from src.infrastructure.db.market.market_reader import MarketDbReader
 from src.infrastructure.db.market.portfolio_db import PortfolioDb
 from src.application.services.watchlist_prices_service import WatchlistPricesService
@@ -98,3 +99,30 @@ class TestWatchlistPricesService:
         assert len(result.prices) == 2
         codes = {p.code for p in result.prices}
         assert codes == {"7203", "6758"}
+
+    def test_missing_volume_is_reported_as_zero(
+        self,
+        service: WatchlistPricesService,
+        pdb: PortfolioDb,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(
+            "src.application.services.watchlist_prices_service.fetch_latest_quotes",
+            lambda _reader, _codes: {
+                "7203": LatestQuote(
+                    code="7203",
+                    date="2024-01-05",
+                    close=2600.0,
+                    volume=None,
+                    prev_date=None,
+                    prev_close=None,
+                )
+            },
+        )
+        pdb.create_watchlist("Tech")
+        pdb.add_watchlist_item(1, "7203", "トヨタ")
+
+        result = service.get_prices(1)
+
+        assert result.prices[0].volume == 0.0
+        assert result.prices[0].changePercent is None
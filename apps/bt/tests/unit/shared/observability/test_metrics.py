@@ -1,4 +1,6 @@
-from src.shared.observability.metrics import MetricsRecorder
+import pytest
+
+from src.shared.observability.metrics import DurationMetric, MetricsRecorder
 
 
 def test_request_error_rate_is_calculated() -> None:
@@ -19,3 +21,84 @@ def test_job_and_jquants_metrics_can_be_recorded() -> None:
 
     # no exception = recorder accepts phase5 metrics dimensions
     assert recorder.error_rate() == 0.0
+
+
+def test_duration_quantiles_are_interpolated_within_buckets() -> None:
+    metric = DurationMetric()
+    for value in range(1, 101):
+        metric.observe(float(value))
+
+    p50 = metric.quantile(0.5)
+    p99 = metric.quantile(0.99)
+    assert p50 is not None and p99 is not None
+    assert 30.0 <= p50 <= 70.0
+    assert 70.0 <= p99 <= 100.0
+    assert metric.quantile(1.0) == 100.0
+    assert DurationMetric().quantile(0.5) is None
+
+
+def test_duration_metric_merge_adds_buckets() -> None:
+    left = DurationMetric()
+    right = DurationMetric()
+    left.observe(2.0)
+    right.observe(2.0)
+    right.observe(900.0)
+
+    left.merge(right)
+
+    assert left.count == 3
+    assert left.total_ms == 904.0
+    assert left.max_ms == 900.0
+    with pytest.raises(ValueError):
+        left.merge(DurationMetric(bounds=(1.0, 10.0)))
+
+
+def test_stage_timer_records_even_when_stage_raises() -> None:
+    recorder = MetricsRecorder()
+
+    with pytest.raises(RuntimeError), recorder.stage_timer("backtest", "data_load"):
+        raise RuntimeError("boom")
+    recorder.record_stage("backtest", "data_load", 5.0)
+
+    stages = recorder.snapshot()["stages"]
+    assert [(s["component"], s["stage"], s["count"]) for s in stages] == [
+        ("backtest", "data_load", 2)
+    ]
+    assert stages[0]["p50Ms"] is not None
+
+
+def test_prometheus_exposition_contains_histogram_and_quantiles() -> None:
+    recorder = MetricsRecorder()
+    recorder.record_request("GET", "/api/jobs/{job_id}", 200, 12.0)
+    recorder.record_request("GET", "/api/jobs/{job_id}", 500, 80.0)
+    recorder.record_jquants_cache_state('/fins/"summary"', "hit")
+
+    text = recorder.render_prometheus()
+
+    assert "bt_http_requests_total 2" in text
+    assert "bt_http_request_errors_total 1" in text
+    assert "# TYPE bt_http_request_duration_ms histogram" in text
+    assert 'bt_http_request_duration_ms_bucket{method="GET",path="/api/jobs/{job_id}",le="15"} 1' in text
+    assert 'bt_http_request_duration_ms_bucket{method="GET",path="/api/jobs/{job_id}",le="+Inf"} 2' in text
+    assert 'bt_http_request_duration_ms_count{method="GET",path="/api/jobs/{job_id}"} 2' in text
+    assert 'bt_http_request_duration_ms_quantile{method="GET",path="/api/jobs/{job_id}",quantile="0.95"}' in text
+    assert 'endpoint="/fins/\\"summary\\"",state="hit"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_registered_cache_stats_are_exposed_at_scrape_time() -> None:
+    recorder = MetricsRecorder()
+    stats = {"hits": 1, "bytes": 128}
+    recorder.register_cache_stats("jquants_proxy", lambda: stats)
+
+    def broken() -> dict[str, int]:
+        raise RuntimeError("boom")
+
+    recorder.register_cache_stats("broken", broken)
+    stats["hits"] = 3
+
+    assert recorder.snapshot()["caches"] == {"jquants_proxy": {"bytes": 128, "hits": 3}}
+    text = recorder.render_prometheus()
+    assert "# TYPE bt_cache_stat gauge" in text
+    assert 'bt_cache_stat{cache="jquants_proxy",stat="hits"} 3' in text
+    assert 'cache="broken"' not in text
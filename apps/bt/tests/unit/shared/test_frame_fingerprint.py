@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from src.shared.utils.frame_fingerprint import build_frames_fingerprint
+from src.shared.utils.market_frames import format_index_date
+
+
+def test_build_frames_fingerprint_only_covers_requested_window() -> None:
+    index = pd.bdate_range("2026-01-05", periods=10)
+    daily = pd.DataFrame({"Close": range(10)}, index=index, dtype=float)
+    revised_outside = daily.copy()
+    revised_outside.iloc[0, 0] = -1.0
+    revised_inside = daily.copy()
+    revised_inside.iloc[8, 0] = -1.0
+
+    fingerprint = build_frames_fingerprint([daily, None], start=index[5], end=index[9])
+
+    assert build_frames_fingerprint([revised_outside, None], start=index[5], end=index[9]) == fingerprint
+    assert build_frames_fingerprint([revised_inside, None], start=index[5], end=index[9]) != fingerprint
+    assert (
+        build_frames_fingerprint([daily, None], start=index[5], end=index[9], extra=("電気機器",))
+        != fingerprint
+    )
+
+
+def test_format_index_date_formats_timestamps_and_falls_back_to_str() -> None:
+    assert format_index_date(pd.Timestamp("2026-01-05 15:30")) == "2026-01-05"
+    assert format_index_date("2026-01-05") == "2026-01-05"
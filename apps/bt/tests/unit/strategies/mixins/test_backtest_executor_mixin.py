@@ -4,6 +4,8 @@ BacktestExecutorMixin ユニットテスト
 β値シグナルのベンチマークデータロード機能のテスト
 """
 
+import pandas as pd
+
 from src.domains.strategy.core.mixins.backtest_executor_mixin import BacktestExecutorMixin
 from src.shared.models.signals import (
     BetaSignalParams,
@@ -134,3 +136,25 @@ class TestBacktestExecutorMixin:
         )
 
         assert strategy._should_load_statements_data() is False
+
+    def test_trim_to_evaluation_window_keeps_signals_computed_on_full_history(self):
+        """評価開始日より前はポートフォリオ入力から除くが、シグナル値は全履歴で計算済みのまま"""
+        strategy = MockStrategy()
+        index = pd.bdate_range("2024-01-01", periods=6)
+        close = pd.Series([1.0, 2.0, 3.0, 4.0, 5.0, 6.0], index=index)
+        stock_data = pd.DataFrame({"Close": close})
+        # ウォームアップ 3 本の SMA を全期間で計算したシグナル
+        entries = close > close.rolling(3).mean().shift(1)
+        exits = pd.Series(False, index=index)
+
+        strategy.evaluation_start = None
+        assert strategy._trim_to_evaluation_window(stock_data, entries, exits)[0] is stock_data
+
+        strategy.evaluation_start = "2024-01-04"
+        trimmed_data, trimmed_entries, trimmed_exits = strategy._trim_to_evaluation_window(
+            stock_data, entries, exits
+        )
+
+        assert trimmed_data.index[0] == pd.Timestamp("2024-01-04")
+        assert len(trimmed_exits) == 3
+        assert trimmed_entries.tolist() == [True, True, True]
@@ -378,6 +378,43 @@ class TestBacktestExecutorMixinPaths:
             assert strategy.combined_portfolio == "cached-pf"
             mocked.assert_called_once()
 
+    def test_run_allocation_sweep_from_cached_signals(self) -> None:
+        strategy = _RuntimeStrategy()
+        with pytest.raises(ValueError):
+            strategy.run_allocation_sweep_from_cached_signals([0.2])
+
+        index = pd.date_range("2024-01-01", periods=4, freq="D")
+        open_ = pd.DataFrame({"1111": [1.0, 1.1, 1.2, 1.3], "2222": [2.0, 2.1, 2.0, 2.2]}, index=index)
+        close = pd.DataFrame({"1111": [1.0, 1.2, 1.1, 1.4], "2222": [2.0, 2.2, 1.9, 2.3]}, index=index)
+        entries = pd.DataFrame({"1111": [True, False, False, False], "2222": [True, False, False, False]}, index=index)
+        exits = pd.DataFrame({"1111": [False, False, False, True], "2222": [False, False, True, False]}, index=index)
+        strategy._set_grouped_portfolio_inputs_cache(open_, close, entries, exits)
+
+        with patch.object(vbt.Portfolio, "from_signals", wraps=vbt.Portfolio.from_signals) as mocked:
+            table = strategy.run_allocation_sweep_from_cached_signals([0.5, 0.2, 0.5])
+            assert mocked.call_count == 1
+
+        assert list(table.index) == [0.5, 0.2]
+        for allocation in (0.5, 0.2):
+            single = strategy._create_grouped_portfolio(open_, close, entries, exits, allocation_pct=allocation)
+            assert table.loc[allocation, "total_return"] == pytest.approx(float(single.total_return()))
+
+    def test_run_allocation_sweep_round_trip_runs_per_allocation(self) -> None:
+        strategy = _RuntimeStrategy()
+        strategy.next_session_round_trip = True
+        frame = pd.DataFrame({"1111": [1.0], "2222": [2.0]})
+        signals = pd.DataFrame({"1111": [True], "2222": [False]})
+        strategy._set_grouped_portfolio_inputs_cache(frame, frame, signals, signals)
+
+        with (
+            patch.object(strategy, "_uses_round_trip_execution", return_value=True),
+            patch.object(strategy, "_create_grouped_portfolio", return_value=MagicMock()) as mocked,
+        ):
+            table = strategy.run_allocation_sweep_from_cached_signals([0.1, 0.3])
+
+        assert mocked.call_count == 2
+        assert list(table.index) == [0.1, 0.3]
+
     def test_run_multi_backtest_grouped_standard_mode(self) -> None:
         strategy = _RuntimeStrategy()
         strategy.max_concurrent_positions = 1
@@ -445,6 +445,60 @@ class TestPortfolioAnalyzerKellyMixin:
             run_multi_backtest_mock.assert_called_once_with()
             cached_run_mock.assert_called_once_with(optimized_allocation)
 
+    def test_run_kelly_allocation_sweep_uses_single_cached_simulation(self):
+        """キャッシュ済みシグナルがあれば配分率スイープは1回の一括評価で済む"""
+        mock_portfolio = MagicMock()
+        mock_entries = MagicMock()
+        self.strategy._grouped_portfolio_inputs_cache = ("open", "close", "entries", "exits")
+        sweep_table = pd.DataFrame(
+            {
+                "total_return": [0.05, 0.12, 0.09],
+                "sharpe_ratio": [1.0, 1.2, 0.8],
+                "sortino_ratio": [1.0, 1.2, 0.8],
+                "calmar_ratio": [1.0, 1.2, 0.8],
+                "max_drawdown": [-0.05, -0.1, -0.2],
+                "win_rate": [0.6, 0.6, 0.6],
+                "trade_count": [10, 10, 10],
+            },
+            index=pd.Index([0.1, 0.2, 0.3], name="allocation"),
+        )
+
+        with (
+            patch.object(
+                self.strategy,
+                "run_multi_backtest",
+                return_value=(mock_portfolio, mock_entries),
+            ) as run_multi_backtest_mock,
+            patch.object(
+                self.strategy,
+                "_calculate_kelly_for_portfolio",
+                return_value=(0.4, {"kelly": 0.4}),
+            ),
+            patch.object(
+                self.strategy,
+                "run_allocation_sweep_from_cached_signals",
+                return_value=sweep_table,
+                create=True,
+            ) as sweep_mock,
+        ):
+            result = self.strategy.run_kelly_allocation_sweep(
+                kelly_fractions=(0.25, 0.5, 0.75, 1.0),
+                max_allocation=0.3,
+            )
+
+        run_multi_backtest_mock.assert_called_once_with()
+        # 0.4 * 0.75 と 0.4 * 1.0 は max_allocation=0.3 で同一配分率に丸まる
+        sweep_mock.assert_called_once_with([0.1, 0.2, 0.3])
+        assert result.optimal_allocation == pytest.approx(0.2)
+        assert result.objective == "total_return"
+        assert result.metrics["kelly_multiplier"].tolist() == [0.25, 0.5, 0.75]
+        assert result.all_entries is mock_entries
+
+    def test_run_kelly_allocation_sweep_rejects_unknown_objective(self):
+        """未知のメトリクス名は ValueError"""
+        with pytest.raises(ValueError):
+            self.strategy.run_kelly_allocation_sweep(objective="profit_factor")
+
     def test_logging_messages(self):
         """ログメッセージ記録テスト"""
         mock_portfolio = MagicMock()
@@ -18,9 +18,22 @@ from src.domains.strategy.signals.beta import (
     rolling_beta_multi_signal,
     rolling_beta_nb,
     rolling_beta_calculation,
+    rolling_beta_panel,
+    rolling_beta_panel_nb,
 )
 
 
+def _windowed_beta_reference(
+    stock_returns: np.ndarray, market_returns: np.ndarray, window: int
+) -> np.ndarray:
+    """ウィンドウごとに fast_beta_nb を呼ぶ O(n·window) の参照実装"""
+    result = np.full(len(stock_returns), np.nan)
+    for i in range(window - 1, len(stock_returns)):
+        start = i - window + 1
+        result[i] = fast_beta_nb(stock_returns[start : i + 1], market_returns[start : i + 1])
+    return result
+
+
 class TestCalculateBeta:
     """calculate_beta() テスト"""
 
@@ -560,3 +573,137 @@ class TestMultiAndScreenSignals:
 
         assert result["1111"] in (True, False)
         assert result["2222"] is False
+
+
+class TestStreamingRollingBeta:
+    @staticmethod
+    def _returns() -> tuple[np.ndarray, np.ndarray]:
+        rng = np.random.default_rng(0)
+        market = rng.normal(0, 0.01, 1500)
+        stock = 1.2 * market + rng.normal(0, 0.01, 1500)
+        stock[rng.random(1500) < 0.05] = np.nan
+        market[rng.random(1500) < 0.02] = np.nan
+        # 市場リターンが一定の区間（分散 0）と inf を含むウィンドウ
+        market[600:700] = 0.0
+        stock[900] = np.inf
+        return stock, market
+
+    @pytest.mark.parametrize("window", [2, 20, 200])
+    def test_matches_windowed_reference(self, window):
+        stock, market = self._returns()
+
+        expected = _windowed_beta_reference(stock, market, window)
+        result = rolling_beta_nb(stock, market, window)
+
+        np.testing.assert_allclose(result, expected, rtol=1e-6, atol=1e-9)
+        assert np.isnan(result[900])
+        if window <= 100:
+            assert np.isnan(result[699])
+
+    def test_panel_matches_per_column(self):
+        stock, market = self._returns()
+        shifted = np.roll(stock, 7)
+        panel = np.column_stack([stock, shifted])
+
+        result = rolling_beta_panel_nb(panel, market, 50)
+
+        np.testing.assert_allclose(result[:, 0], rolling_beta_nb(stock, market, 50))
+        np.testing.assert_allclose(result[:, 1], rolling_beta_nb(shifted, market, 50))
+
+    def test_rolling_beta_panel_matches_numba_rolling_beta(self):
+        dates = pd.date_range("2024-01-01", periods=150)
+        rng = np.random.default_rng(3)
+        market = pd.Series(1000 * np.cumprod(1 + rng.normal(0, 0.01, 150)), index=dates)
+        prices = pd.DataFrame(
+            {
+                code: 100 * np.cumprod(1 + rng.normal(0, 0.02, 150))
+                for code in ("1111", "2222", "3333")
+            },
+            index=dates,
+        )
+
+        result = rolling_beta_panel(prices, market, window=30)
+
+        assert result.shape == prices.shape
+        for code in prices.columns:
+            pd.testing.assert_series_equal(
+                result[code],
+                numba_rolling_beta(prices[code], market, 30),
+                check_names=False,
+            )
+
+    def test_multi_signal_matches_per_stock_signal(self):
+        dates = pd.date_range("2024-01-01", periods=120)
+        rng = np.random.default_rng(5)
+        market = pd.Series(1000 * np.cumprod(1 + rng.normal(0, 0.01, 120)), index=dates)
+        prices = pd.DataFrame(
+            {
+                code: 100 * np.cumprod(1 + rng.normal(0, 0.02, 120))
+                for code in ("1111", "2222")
+            },
+            index=dates,
+        )
+
+        result = rolling_beta_multi_signal(
+            prices, market, beta_min=0.0, beta_max=1.5, lookback_period=20
+        )
+
+        for code in prices.columns:
+            expected = beta_range_signal(
+                prices[code], market, beta_min=0.0, beta_max=1.5, lookback_period=20
+            )
+            assert result[code].tolist() == expected.tolist()
+
+    @staticmethod
+    def _gapped_prices() -> tuple[pd.DataFrame, pd.Series]:
+        dates = pd.date_range("2024-01-01", periods=150)
+        rng = np.random.default_rng(11)
+        market = pd.Series(1000 * np.cumprod(1 + rng.normal(0, 0.01, 150)), index=dates)
+        prices = pd.DataFrame(
+            {
+                code: 100 * np.cumprod(1 + rng.normal(0, 0.02, 150))
+                for code in ("1111", "2222", "3333")
+            },
+            index=dates,
+        )
+        # 2222 は売買停止による欠損、3333 は上場前の欠損
+        prices.iloc[40:45, 1] = np.nan
+        prices.iloc[:25, 2] = np.nan
+        return prices, market
+
+    def test_numba_rolling_beta_drops_missing_days_jointly(self):
+        prices, market = self._gapped_prices()
+        market = market.copy()
+        market.iloc[90:92] = np.nan
+
+        result = numba_rolling_beta(prices["2222"], market, 30)
+
+        assert result.index.equals(prices.index)
+        assert result.iloc[40:46].isna().all()
+        assert result.iloc[90:93].isna().all()
+        assert result.iloc[100:].notna().all()
+
+    def test_rolling_beta_panel_compresses_gaps_per_stock(self):
+        prices, market = self._gapped_prices()
+
+        result = rolling_beta_panel(prices, market, window=30)
+
+        for code in prices.columns:
+            pd.testing.assert_series_equal(
+                result[code],
+                numba_rolling_beta(prices[code], market, 30),
+                check_names=False,
+            )
+
+    def test_multi_signal_matches_per_stock_signal_with_gaps(self):
+        prices, market = self._gapped_prices()
+
+        result = rolling_beta_multi_signal(
+            prices, market, beta_min=0.0, beta_max=1.5, lookback_period=20
+        )
+
+        for code in prices.columns:
+            expected = beta_range_signal(
+                prices[code], market, beta_min=0.0, beta_max=1.5, lookback_period=20
+            )
+            assert result[code].tolist() == expected.tolist()
@@ -10,6 +10,9 @@ import pandas as pd
 import pytest
 
 from src.domains.strategy.signals.sector_strength import (
+    build_sector_rotation_phase_panel,
+    build_sector_strength_panel,
+    build_sector_volatility_regime_panel,
     sector_rotation_phase_signal,
     sector_rotation_phase_by_membership_signal,
     sector_strength_ranking_signal,
@@ -491,6 +494,85 @@ class TestSectorVolatilityRegimeSignal:
         assert len(signal) == 10
 
 
+class TestSectorSignalPanels:
+    """全セクター分のパネルを1回計算して銘柄へ射影しても結果が変わらないこと"""
+
+    def setup_method(self):
+        rng = np.random.default_rng(11)
+        self.dates = pd.date_range("2024-01-01", periods=150)
+        self.benchmark_close = pd.Series(
+            1000 * np.cumprod(1 + rng.normal(0.0005, 0.01, 150)), index=self.dates
+        )
+        self.sector_data = {
+            name: pd.DataFrame(
+                {"Close": 100 * np.cumprod(1 + rng.normal(drift, 0.015, 150))},
+                index=self.dates,
+            )
+            for name, drift in (("A", 0.002), ("B", 0.0), ("C", -0.001), ("D", 0.001))
+        }
+        self.membership = pd.Series(
+            ["A"] * 50 + ["C"] * 50 + ["Z"] * 50, index=self.dates, dtype="object"
+        )
+
+    @pytest.mark.parametrize("selection_mode", ["top", "bottom"])
+    def test_ranking_panel_projection_matches_direct_call(self, selection_mode):
+        kwargs = {
+            "momentum_period": 10,
+            "sharpe_period": 20,
+            "top_n": 2,
+            "selection_mode": selection_mode,
+        }
+        panel = build_sector_strength_panel(self.sector_data, self.benchmark_close, **kwargs)
+
+        for stock_sector_name in ("A", "D", self.membership):
+            expected = sector_strength_ranking_signal(
+                self.sector_data, stock_sector_name, self.benchmark_close, **kwargs
+            )
+            projected = sector_strength_ranking_signal(
+                self.sector_data,
+                stock_sector_name,
+                self.benchmark_close,
+                sector_signals=panel,
+                **kwargs,
+            )
+            pd.testing.assert_series_equal(projected, expected)
+
+    def test_rotation_and_volatility_panel_projection_matches_direct_call(self):
+        rotation_panel = build_sector_rotation_phase_panel(
+            self.sector_data, self.benchmark_close, rs_period=10, direction="leading"
+        )
+        volatility_panel = build_sector_volatility_regime_panel(
+            self.sector_data, vol_period=10, vol_ma_period=30
+        )
+
+        assert set(rotation_panel) == set(volatility_panel) == set(self.sector_data)
+        for stock_sector_name in ("B", self.membership):
+            pd.testing.assert_series_equal(
+                sector_rotation_phase_by_membership_signal(
+                    self.sector_data,
+                    stock_sector_name,
+                    self.benchmark_close,
+                    rs_period=10,
+                    sector_signals=rotation_panel,
+                ),
+                sector_rotation_phase_by_membership_signal(
+                    self.sector_data, stock_sector_name, self.benchmark_close, rs_period=10
+                ),
+            )
+            pd.testing.assert_series_equal(
+                sector_volatility_regime_by_membership_signal(
+                    self.sector_data,
+                    stock_sector_name,
+                    vol_period=10,
+                    vol_ma_period=30,
+                    sector_signals=volatility_panel,
+                ),
+                sector_volatility_regime_by_membership_signal(
+                    self.sector_data, stock_sector_name, vol_period=10, vol_ma_period=30
+                ),
+            )
+
+
 class TestSectorStrengthEdgeCases:
     """セクターシグナル エッジケーステスト"""
 
@@ -2,9 +2,14 @@
 Position limit tests
 """
 
+import numpy as np
 import pandas as pd
 
 from src.domains.strategy.core.mixins.backtest_executor_mixin import BacktestExecutorMixin
+from src.domains.strategy.core.mixins.position_limits import (
+    build_entry_priority_panel,
+    limit_entries,
+)
 
 
 class _DummyStrategy(BacktestExecutorMixin):
@@ -65,3 +70,102 @@ def test_max_exposure_passed(monkeypatch):
 
     assert result == "portfolio"
     assert captured["max_size"] == 0.2
+
+
+def _reference_limit(entries: pd.DataFrame, max_positions: int) -> pd.DataFrame:
+    limited = entries.copy()
+    for idx, row in entries.iterrows():
+        for column in row[row].index.tolist()[max_positions:]:
+            limited.at[idx, column] = False
+    return limited
+
+
+def test_vectorized_daily_cap_matches_column_order_reference():
+    rng = np.random.default_rng(3)
+    entries = pd.DataFrame(
+        rng.random((40, 12)) < 0.4,
+        index=pd.bdate_range("2023-01-02", periods=40),
+        columns=[f"C{i}" for i in range(12)],
+    )
+
+    limited = limit_entries(entries, 3)
+
+    pd.testing.assert_frame_equal(limited, _reference_limit(entries, 3))
+
+
+def test_daily_cap_keeps_highest_priority_and_nan_last():
+    index = pd.date_range("2023-01-01", periods=1)
+    entries = pd.DataFrame({"A": [True], "B": [True], "C": [True], "D": [False]}, index=index)
+    priority = pd.DataFrame({"A": [1.0], "B": [np.nan], "C": [5.0], "D": [9.0]}, index=index)
+
+    assert limit_entries(entries, 1, priority=priority).iloc[0].tolist() == [
+        False,
+        False,
+        True,
+        False,
+    ]
+    assert limit_entries(entries, 3, priority=priority).iloc[0].tolist() == [
+        True,
+        True,
+        True,
+        False,
+    ]
+
+
+def test_open_positions_mode_counts_positions_until_exit():
+    index = pd.date_range("2023-01-01", periods=4)
+    entries = pd.DataFrame(
+        {"A": [True, False, False, False], "B": [False, True, True, True]},
+        index=index,
+    )
+    exits = pd.DataFrame(
+        {"A": [False, False, True, False], "B": [False, False, False, False]},
+        index=index,
+    )
+
+    daily = limit_entries(entries, 1, exits=exits, mode="daily_entries")
+    open_limited = limit_entries(entries, 1, exits=exits, mode="open_positions")
+
+    assert daily["B"].tolist() == [False, True, True, True]
+    assert open_limited["A"].tolist() == [True, False, False, False]
+    # A が 3 日目に決済されるまで B は建てられない
+    assert open_limited["B"].tolist() == [False, False, True, False]
+
+
+def test_apply_position_limit_uses_trading_value_priority():
+    dummy = _DummyStrategy()
+    dummy.entry_priority = "trading_value"
+    dummy._uses_round_trip_execution = lambda: False
+    index = pd.date_range("2023-01-01", periods=2)
+    data_dict = {
+        "A": pd.DataFrame({"Close": [100.0, 100.0], "Volume": [10.0, 10.0]}, index=index),
+        "B": pd.DataFrame({"Close": [50.0, 50.0], "Volume": [100.0, 100.0]}, index=index),
+    }
+    entries = pd.DataFrame({"A": [False, True], "B": [False, True]}, index=index)
+
+    limited = dummy._apply_position_limit(entries, entries & False, data_dict)
+
+    assert limited.iloc[1].tolist() == [False, True]
+
+
+def test_entry_priority_uses_previous_session_turnover():
+    index = pd.date_range("2023-01-01", periods=2)
+    # 前日は A の売買代金が大きいが、約定日（2 日目）は B が急増する
+    data_dict = {
+        "A": pd.DataFrame({"Close": [100.0, 100.0], "Volume": [100.0, 100.0]}, index=index),
+        "B": pd.DataFrame({"Close": [100.0, 100.0], "Volume": [10.0, 10_000.0]}, index=index),
+    }
+    entries = pd.DataFrame({"A": [False, True], "B": [False, True]}, index=index)
+
+    priority = build_entry_priority_panel(data_dict, "trading_value")
+    volume_priority = build_entry_priority_panel(data_dict, "volume")
+
+    assert priority is not None and volume_priority is not None
+    assert priority.iloc[0].isna().all()
+    assert limit_entries(entries, 1, priority=priority).iloc[1].tolist() == [True, False]
+    assert limit_entries(entries, 1, priority=volume_priority).iloc[1].tolist() == [True, False]
+
+    fill_day_priority = pd.DataFrame(
+        {name: data["Close"] * data["Volume"] for name, data in data_dict.items()}
+    )
+    assert limit_entries(entries, 1, priority=fill_day_priority).iloc[1].tolist() == [False, True]
@@ -8,7 +8,7 @@ from collections.abc import Callable
 
 import pytest
 import pandas as pd
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from src.domains.strategy.runtime.compiler import compile_runtime_strategy
 from src.domains.strategy.runtime.compiler import (
@@ -564,6 +564,73 @@ class TestSignalProcessor:
         assert bool(result_1.all()) is True
         assert bool(result_2.any()) is False
 
+    def test_apply_signals_builds_sector_strength_panel_once_per_run(self):
+        index = pd.date_range("2025-01-01", periods=40)
+        ohlc_data = pd.DataFrame(
+            {
+                "Open": 100.0,
+                "High": 101.0,
+                "Low": 99.0,
+                "Close": 100.0,
+                "Volume": 1000.0,
+            },
+            index=index,
+        )
+        sector_data = {
+            name: pd.DataFrame(
+                {"Close": [100.0 * (1 + drift) ** i for i in range(40)]},
+                index=index,
+            )
+            for name, drift in (("Up", 0.01), ("Flat", 0.0), ("Down", -0.01))
+        }
+        benchmark_data = pd.DataFrame({"Close": 100.0}, index=index)
+        params = SignalParams.model_validate(
+            {
+                "sector_strength_ranking": {
+                    "enabled": True,
+                    "momentum_period": 5,
+                    "sharpe_period": 10,
+                    "top_n": 1,
+                }
+            }
+        )
+        compiled_strategy = compile_runtime_strategy(
+            strategy_name="demo",
+            shared_config=SharedConfig.model_validate(
+                {
+                    "universe_preset": "sample",
+                    "stock_codes": ["1111", "2222"],
+                    "execution_policy": {"mode": "standard"},
+                },
+                context={"resolve_stock_codes": False},
+            ),
+            entry_signal_params=params,
+        )
+        builder = self.processor._SECTOR_PANEL_BUILDERS["sector_strength_ranking"]  # noqa: SLF001
+
+        with patch.dict(
+            self.processor._SECTOR_PANEL_BUILDERS,  # noqa: SLF001
+            {"sector_strength_ranking": Mock(wraps=builder)},
+        ) as builders:
+            results = {
+                sector_name: self.processor.apply_signals(
+                    base_signal=pd.Series(True, index=index),
+                    signal_type="entry",
+                    ohlc_data=ohlc_data,
+                    signal_params=params,
+                    benchmark_data=benchmark_data,
+                    sector_data=sector_data,
+                    stock_sector_name=sector_name,
+                    compiled_strategy=compiled_strategy,
+                )
+                for sector_name in ("Up", "Down")
+            }
+            call_count = builders["sector_strength_ranking"].call_count
+
+        assert call_count == 1
+        assert bool(results["Up"].iloc[-1]) is True
+        assert bool(results["Down"].any()) is False
+
     def test_universe_rank_bucket_cache_evicts_oldest_panel(self):
         index = pd.date_range("2025-01-01", periods=3)
         ohlc_data = pd.DataFrame(
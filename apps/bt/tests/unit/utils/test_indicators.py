@@ -9,6 +9,21 @@ import vectorbt as vbt
 
 from src.domains.strategy.indicators.calculations import (
     compute_accumulation_distribution_line,
+    compute_atr,
+    compute_atr_panel,
+    compute_atr_support_line_panel,
+    compute_bollinger_bands,
+    compute_bollinger_bands_panel,
+    compute_chaikin_money_flow_panel,
+    compute_chaikin_oscillator_panel,
+    compute_macd_panel,
+    compute_moving_average_panel,
+    compute_on_balance_volume_score_panel,
+    compute_recent_return_panel,
+    compute_risk_adjusted_return_panel,
+    compute_rsi_panel,
+    compute_volume_mas_panel,
+    compute_volume_weighted_ema_panel,
     compute_chaikin_oscillator,
     compute_atr_support_line,
     compute_chaikin_money_flow,
@@ -365,3 +380,114 @@ class TestComputeRecentReturn:
     def test_invalid_lookback_raises(self):
         with pytest.raises(ValueError, match="lookback_period"):
             compute_recent_return(self.close, lookback_period=0)
+
+
+class TestPanelIndicators:
+    """パネル版の各列が Series 版と一致すること（上場日ずれ・欠損を含む）"""
+
+    def setup_method(self):
+        rng = np.random.default_rng(7)
+        dates = pd.date_range("2024-01-01", periods=180)
+        codes = ["1111", "2222", "3333"]
+        base = pd.DataFrame(
+            100 * np.cumprod(1 + rng.normal(0, 0.02, (180, 3)), axis=0),
+            index=dates,
+            columns=codes,
+        )
+        spread = pd.DataFrame(
+            np.abs(rng.normal(0, 0.01, (180, 3))), index=dates, columns=codes
+        )
+        self.close = base
+        self.high = base * (1 + spread)
+        self.low = base * (1 - spread)
+        self.volume = pd.DataFrame(
+            rng.integers(0, 10_000, (180, 3)).astype(float), index=dates, columns=codes
+        )
+        # 2222 は途中上場、3333 は欠損日と値幅ゼロの日を含む
+        for frame in (self.close, self.high, self.low, self.volume):
+            frame.iloc[:40, 1] = np.nan
+            frame.iloc[[90, 91], 2] = np.nan
+        self.high.iloc[120, 2] = self.low.iloc[120, 2] = self.close.iloc[120, 2]
+
+    def _assert_columns_match(self, panel, series_func):
+        assert list(panel.columns) == list(self.close.columns)
+        for code in self.close.columns:
+            pd.testing.assert_series_equal(
+                panel[code], series_func(code), check_names=False
+            )
+
+    def test_single_input_indicators(self):
+        close = self.close
+        cases = [
+            (compute_rsi_panel(close, 14), lambda c: compute_rsi(close[c], 14)),
+            (
+                compute_moving_average_panel(close, 10, "ema"),
+                lambda c: compute_moving_average(close[c], 10, "ema"),
+            ),
+            (
+                compute_macd_panel(close).histogram,
+                lambda c: compute_macd(close[c]).histogram,
+            ),
+            (
+                compute_bollinger_bands_panel(close).lower,
+                lambda c: compute_bollinger_bands(close[c]).lower,
+            ),
+            (
+                compute_recent_return_panel(close, 20),
+                lambda c: compute_recent_return(close[c], 20),
+            ),
+            (
+                compute_risk_adjusted_return_panel(close, 30, "sortino"),
+                lambda c: compute_risk_adjusted_return(close[c], 30, "sortino"),
+            ),
+            (
+                compute_risk_adjusted_return_panel(close, 30, "sharpe"),
+                lambda c: compute_risk_adjusted_return(close[c], 30, "sharpe"),
+            ),
+        ]
+        for panel, series_func in cases:
+            self._assert_columns_match(panel, series_func)
+
+    def test_ohlcv_indicators(self):
+        high, low, close, volume = self.high, self.low, self.close, self.volume
+        cases = [
+            (
+                compute_atr_panel(high, low, close, 14),
+                lambda c: compute_atr(high[c], low[c], close[c], 14),
+            ),
+            (
+                compute_atr_support_line_panel(high, low, close, 20, 2.0),
+                lambda c: compute_atr_support_line(high[c], low[c], close[c], 20, 2.0),
+            ),
+            (
+                compute_chaikin_money_flow_panel(high, low, close, volume),
+                lambda c: compute_chaikin_money_flow(high[c], low[c], close[c], volume[c]),
+            ),
+            (
+                compute_chaikin_oscillator_panel(high, low, close, volume),
+                lambda c: compute_chaikin_oscillator(high[c], low[c], close[c], volume[c]),
+            ),
+            (
+                compute_on_balance_volume_score_panel(close, volume),
+                lambda c: compute_on_balance_volume_score(close[c], volume[c]),
+            ),
+            (
+                compute_volume_weighted_ema_panel(close, volume, 10),
+                lambda c: compute_volume_weighted_ema(close[c], volume[c], 10),
+            ),
+            (
+                compute_volume_mas_panel(volume, 5, 20, "median")[1],
+                lambda c: compute_volume_mas(volume[c], 5, 20, "median")[1],
+            ),
+        ]
+        for panel, series_func in cases:
+            self._assert_columns_match(panel, series_func)
+
+    def test_series_api_keeps_input_name(self):
+        close = self.close["1111"].rename("Close")
+        volume = self.volume["1111"].rename("Volume")
+
+        assert compute_rsi(close).name == "Close"
+        assert compute_macd(close).signal.name == "Close"
+        assert compute_trading_value_ma(close, volume, 5).name is None
+        assert compute_risk_adjusted_return(close).name is None
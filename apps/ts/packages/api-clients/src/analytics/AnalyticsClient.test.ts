@@ -158,6 +158,11 @@ describe('AnalyticsClient', () => {
       'http://localhost:3002/api/analytics/stocks/7203/margin-pressure?period=15'
     );
 
+    await client.getMarginPressureRanking({ period: 15, code: '7203,6758', sortBy: 'flowPressure', limit: 50 });
+    expect(fetchSpy.mock.calls.at(-1)?.[0]).toBe(
+      'http://localhost:3002/api/analytics/margin-pressure?period=15&code=7203%2C6758&sortBy=flowPressure&limit=50'
+    );
+
     await client.getMarginVolumeRatio({ symbol: '7203' });
     expect(fetchSpy.mock.calls.at(-1)?.[0]).toBe('http://localhost:3002/api/analytics/stocks/7203/margin-ratio');
   });
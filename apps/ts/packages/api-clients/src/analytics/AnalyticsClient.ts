@@ -8,6 +8,8 @@ import type {
   FundamentalsParams,
   MarginPressureIndicatorsParams,
   MarginPressureIndicatorsResponse,
+  MarginPressureRankingParams,
+  MarginPressureRankingResponse,
   MarginVolumeRatioParams,
   MarginVolumeRatioResponse,
   MarketFundamentalRankingResponse,
@@ -156,6 +158,17 @@ export class AnalyticsClient {
     );
   }
 
+  async getMarginPressureRanking(params: MarginPressureRankingParams = {}): Promise<MarginPressureRankingResponse> {
+    return this.request<MarginPressureRankingResponse>('/api/analytics/margin-pressure', undefined, {
+      date: params.date,
+      period: params.period,
+      code: params.code,
+      sortBy: params.sortBy,
+      order: params.order,
+      limit: params.limit,
+    });
+  }
+
   async getMarginVolumeRatio(params: MarginVolumeRatioParams): Promise<MarginVolumeRatioResponse> {
     return this.request<MarginVolumeRatioResponse>(
       `/api/analytics/stocks/${encodeURIComponent(params.symbol)}/margin-ratio`
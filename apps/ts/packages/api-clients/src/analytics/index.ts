@@ -23,6 +23,9 @@ export type {
   MarginPressureIndicatorsPathParams,
   MarginPressureIndicatorsQuery,
   MarginPressureIndicatorsResponse,
+  MarginPressureRankingItem,
+  MarginPressureRankingParams,
+  MarginPressureRankingResponse,
   MarginTurnoverDaysData,
   MarginVolumeRatioData,
   MarginVolumeRatioParams,
@@ -51,6 +51,10 @@ export type MarginLongPressureData = Schemas['MarginLongPressureData'];
 export type MarginFlowPressureData = Schemas['MarginFlowPressureData'];
 export type MarginTurnoverDaysData = Schemas['MarginTurnoverDaysData'];
 
+export type MarginPressureRankingParams = ApiQuery<'/api/analytics/margin-pressure', 'get'>;
+export type MarginPressureRankingResponse = ApiJsonResponse<'/api/analytics/margin-pressure', 'get', 200>;
+export type MarginPressureRankingItem = Schemas['MarginPressureRankingItem'];
+
 export type MarginVolumeRatioParams = ApiPathParams<'/api/analytics/stocks/{symbol}/margin-ratio', 'get'>;
 export type MarginVolumeRatioResponse = ApiJsonResponse<'/api/analytics/stocks/{symbol}/margin-ratio', 'get', 200>;
 export type MarginVolumeRatioData = Schemas['MarginVolumeRatioData'];
@@ -61,6 +61,23 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/analytics/margin-pressure": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /** Rank stocks by margin pressure */
+        get: operations["get_margin_pressure_ranking_api_analytics_margin_pressure_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/analytics/market-bubble-footprint/latest": {
         parameters: {
             query?: never;
@@ -2056,7 +2073,7 @@ export interface paths {
         };
         /**
          * Get Us History
-         * @description Fetch US daily historical candlesticks from moomoo OpenD.
+         * @description Fetch US daily or minute historical candlesticks from moomoo OpenD.
          */
         get: operations["get_us_history_api_moomoo_us_history_get"];
         put?: never;
@@ -6844,6 +6861,66 @@ export interface components {
             /** Turnoverdays */
             turnoverDays: components["schemas"]["MarginTurnoverDaysData"][];
         };
+        /**
+         * MarginPressureRankingItem
+         * @description 全銘柄マージン指標（1 銘柄・1 日分）
+         */
+        MarginPressureRankingItem: {
+            /** Avgvolume */
+            avgVolume?: number | null;
+            /** Code */
+            code: string;
+            /** Date */
+            date: string;
+            /** Flowpressure */
+            flowPressure?: number | null;
+            /** Longpressure */
+            longPressure?: number | null;
+            /** Longratio */
+            longRatio?: number | null;
+            /** Longvol */
+            longVol?: number | null;
+            /** Shortratio */
+            shortRatio?: number | null;
+            /** Shortvol */
+            shortVol?: number | null;
+            /** Turnoverdays */
+            turnoverDays?: number | null;
+            /** Weeklyavgvolume */
+            weeklyAvgVolume?: number | null;
+        };
+        /**
+         * MarginPressureRankingResponse
+         * @description 全銘柄マージン指標レスポンス
+         */
+        MarginPressureRankingResponse: {
+            /**
+             * Averageperiod
+             * @description Rolling average period in days
+             */
+            averagePeriod: number;
+            /**
+             * Date
+             * @description Resolved margin_data date
+             */
+            date?: string | null;
+            diagnostics?: components["schemas"]["ResponseDiagnostics"];
+            /** Items */
+            items: components["schemas"]["MarginPressureRankingItem"][];
+            /** Lastupdated */
+            lastUpdated: string;
+            /**
+             * Order
+             * @enum {string}
+             */
+            order: "asc" | "desc";
+            provenance: components["schemas"]["DataProvenance"];
+            /**
+             * Sortby
+             * @enum {string}
+             */
+            sortBy: "longPressure" | "flowPressure" | "turnoverDays" | "longRatio" | "shortRatio";
+        };
         /** MarginRecord */
         MarginRecord: {
             /** Date */
@@ -7445,13 +7522,13 @@ export interface components {
             symbol: string;
             /**
              * Timeframe
-             * @constant
+             * @enum {string}
              */
-            timeframe: "1d";
+            timeframe: "1d" | "1m";
         };
         /**
          * MoomooUsKlineItem
-         * @description US historical daily candlestick row from moomoo OpenD.
+         * @description US historical daily or minute candlestick row from moomoo OpenD.
          */
         MoomooUsKlineItem: {
             /** Changerate */
@@ -12048,6 +12125,72 @@ export interface operations {
             };
         };
     };
+    get_margin_pressure_ranking_api_analytics_margin_pressure_get: {
+        parameters: {
+            query?: {
+                /** @description As-of date (YYYY-MM-DD); latest margin date if omitted */
+                date?: string | null;
+                /** @description Rolling average period in days */
+                period?: number;
+                /** @description Stock codes (comma-separated) */
+                code?: string | null;
+                sortBy?: "longPressure" | "flowPressure" | "turnoverDays" | "longRatio" | "shortRatio";
+                order?: "asc" | "desc";
+                limit?: number;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["MarginPressureRankingResponse"];
+                };
+            };
+            /** @description Bad Request */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ErrorResponse"];
+                };
+            };
+            /** @description Not Found */
+            404: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ErrorResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+            /** @description Internal Server Error */
+            500: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ErrorResponse"];
+                };
+            };
+        };
+    };
     get_market_bubble_footprint_latest_api_analytics_market_bubble_footprint_latest_get: {
         parameters: {
             query?: {
@@ -18406,6 +18549,8 @@ export interface operations {
                 to?: string | null;
                 /** @description Maximum rows to return */
                 max_rows?: number | null;
+                /** @description Candlestick timeframe */
+                timeframe?: "1d" | "1m";
             };
             header?: never;
             path?: never;